@@ -49,7 +49,7 @@ def create_nodes_environment():
         right_pane2.send_keys('cd ~/quickstart/core && python3 node_odometry.py')
         bottom_left_pane.send_keys('cd ~/quickstart/core && python3 node_pathplanning.py')
         bottom_middle_pane.send_keys('cd ~/quickstart/core && python3 node_rerun.py')
-        bottom_right_pane.send_keys('cd ~/quickstart/core')  # Empty terminal
+        bottom_right_pane.send_keys('cd ~/quickstart/core && python3 node_odrive.py')
 
         print(f"Tmux session '{SESSION_NAME}' created successfully!")
         
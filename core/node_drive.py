@@ -5,12 +5,11 @@ import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-import sys
-import os
 import json
 import time
+import threading
 import paho.mqtt.client as mqtt
-from lib.odrive_uart import ODriveUART
+from lib.odrive_client import ODriveClient
 
 # Constants
 MQTT_BROKER_ADDRESS = "localhost"
@@ -19,43 +18,39 @@ LINEAR_SPEED = 0.2
 ANGULAR_SPEED = 1.2
 WHEEL_BASE = 0.4
 
-# Load motor directions from JSON
-def load_motor_dirs():
-    try:
-        with open(os.path.expanduser('~/quickstart/lib/motor_dir.json'), 'r') as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"Error reading motor_dir.json: {e}")
-        raise
-
-motor_dirs = load_motor_dirs()
-
-# Initialize motor controller
-motor_controller = ODriveUART(
-    port='/dev/ttyAMA1',
-    left_axis=0, right_axis=1,
-    dir_left=motor_dirs['left'], dir_right=motor_dirs['right']
-)
-
-# Start motors and set mode
-motor_controller.start_left()
-motor_controller.start_right()
-motor_controller.enable_velocity_mode_left()
-motor_controller.enable_velocity_mode_right()
-motor_controller.disable_watchdog_left()
-motor_controller.disable_watchdog_right()
-
-# Clear motor errors
-motor_controller.clear_errors_left()
-motor_controller.clear_errors_right()
-
-# Set velocities for the motors
-def set_velocity(linear, angular):
+# Commands are pushed to the ODrive at a fixed rate, newest command wins
+CONTROL_RATE = 20             # Hz
+WHEEL_SPEED_TOLERANCE = 0.005 # m/s, smaller changes are not sent
+REFRESH_INTERVAL = 1.0        # s, resend an unchanged setpoint this often
+STATS_INTERVAL = 10.0         # s
+
+# Streamed velocity commands (JSON, e.g. node_drivepath.py at 10 Hz) must keep
+# arriving or the wheels are stopped. Text commands from teleop are sent once
+# per key press and stay in effect until "stop".
+DEADMAN_TIMEOUT = 0.5         # s
+
+# The ODrive UART is owned by node_odrive.py, which also starts the motors
+motor_controller = ODriveClient()
+
+# Latest command, written by the MQTT thread and read by the control loop
+command_lock = threading.Lock()
+latest_command = None  # (linear, angular, received time, streamed)
+command_pending = False
+stats = {"received": 0, "merged": 0, "sent": 0, "unchanged": 0, "deadman": 0}
+
+def wheel_speeds(linear, angular):
     left = linear - (WHEEL_BASE / 2) * angular
     right = linear + (WHEEL_BASE / 2) * angular
-    motor_controller.set_speed_mps_left(left)
-    motor_controller.set_speed_mps_right(right)
-    print(f"Set speeds: Left={left} m/s, Right={right} m/s")
+    return left, right
+
+def set_command(linear, angular, streamed):
+    global latest_command, command_pending
+    with command_lock:
+        stats["received"] += 1
+        if command_pending:
+            stats["merged"] += 1  # The previous command was never sent
+        latest_command = (linear, angular, time.monotonic(), streamed)
+        command_pending = True
 
 # MQTT Callbacks
 def on_connect(client, userdata, flags, rc):
@@ -64,13 +59,12 @@ def on_connect(client, userdata, flags, rc):
 
 def on_message(client, userdata, msg):
     payload = msg.payload.decode().strip().lower()
-    print(f"Received: {payload}")
 
     try:
         # Handle JSON command
         data = json.loads(payload)
         if 'linear_velocity' in data and 'angular_velocity' in data:
-            set_velocity(data['linear_velocity'], data['angular_velocity'])
+            set_command(data['linear_velocity'], data['angular_velocity'], streamed=True)
     except json.JSONDecodeError:
         # Handle simple text commands
         command_map = {
@@ -81,7 +75,58 @@ def on_message(client, userdata, msg):
             "stop": (0, 0)
         }
         if payload in command_map:
-            set_velocity(*command_map[payload])
+            set_command(*command_map[payload], streamed=False)
+
+def control_loop():
+    global command_pending
+    period = 1.0 / CONTROL_RATE
+    next_tick = time.monotonic()
+    last_sent = None
+    last_sent_time = 0.0
+    last_stats_time = next_tick
+
+    while True:
+        now = time.monotonic()
+        with command_lock:
+            command = latest_command
+            command_pending = False
+
+        left, right = 0.0, 0.0
+        if command is not None:
+            linear, angular, received, streamed = command
+            if streamed and now - received > DEADMAN_TIMEOUT:
+                if last_sent is not None and last_sent != (0.0, 0.0):
+                    stats["deadman"] += 1
+                    print(f"[node_drive.py] No command for {now - received:.2f} s, stopping.")
+            else:
+                left, right = wheel_speeds(linear, angular)
+
+        changed = last_sent is None or \
+            abs(left - last_sent[0]) > WHEEL_SPEED_TOLERANCE or \
+            abs(right - last_sent[1]) > WHEEL_SPEED_TOLERANCE
+        if changed or now - last_sent_time > REFRESH_INTERVAL:
+            motor_controller.set_speed_mps(left, right)
+            if changed:
+                print(f"Set speeds: Left={left} m/s, Right={right} m/s")
+            last_sent = (left, right)
+            last_sent_time = now
+            stats["sent"] += 1
+        else:
+            stats["unchanged"] += 1
+
+        if now - last_stats_time > STATS_INTERVAL:
+            with command_lock:
+                print(f"[node_drive.py] Commands: {stats['received']} received, {stats['merged']} merged, "
+                      f"{stats['sent']} sent, {stats['unchanged']} ticks unchanged, "
+                      f"{stats['deadman']} deadman stops")
+            last_stats_time = now
+
+        next_tick += period
+        delay = next_tick - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            next_tick = time.monotonic()
 
 # Main loop
 def main():
@@ -93,9 +138,8 @@ def main():
         client.connect(MQTT_BROKER_ADDRESS)
         client.loop_start()
         print("Listening for commands... Press Ctrl+C to exit.")
-        
-        while True:
-            time.sleep(1)
+
+        control_loop()
     
     except KeyboardInterrupt:
         print("Exiting...")
@@ -104,12 +148,10 @@ def main():
     
     finally:
         # Stop motors and clean up
-        motor_controller.set_speed_mps_left(0)
-        motor_controller.set_speed_mps_right(0)
+        motor_controller.set_speed_mps(0, 0)
         client.loop_stop()
         client.disconnect()
-        motor_controller.clear_errors_left()
-        motor_controller.clear_errors_right()
+        motor_controller.close()
         print("Shutdown complete.")
 
 if __name__ == "__main__":
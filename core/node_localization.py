@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+
+import csv
+import json
+import time
+import math
+import sys
+import os
+import paho.mqtt.client as mqtt
+
+# Adds the lib directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from lib.odrive_client import ODriveClient
+from lib.imu import FilteredMPU6050, MPU6050Sampler
+from lib.localization import RobotEKF, encoder_velocities
+from lib.odometry_codec import encode_odometry
+
+# ------------------------------------------------------------------------------------
+# Constants
+# ------------------------------------------------------------------------------------
+# Publishes the same topics as node_odometry.py. While this node runs it
+# holds the retained robot/localization_active flag and node_odometry.py
+# stops publishing; the broker clears the flag if this node dies.
+MQTT_BROKER_ADDRESS = "localhost"
+MQTT_TOPIC_ODOMETRY = "robot/odometry"
+MQTT_TOPIC_RESET_ODOMETRY = "robot/reset_odometry"
+MQTT_TOPIC_ODOMETRY_STREAM = "robot/odometry_stream"  # Binary (lib/odometry_codec.py)
+MQTT_TOPIC_LOCALIZATION_ACTIVE = "robot/localization_active"
+
+IMU_RATE = 100          # Hz, MPU6050 FIFO rate, one predict + update per gyro sample
+PUBLISH_RATE = 5        # Hz, JSON on robot/odometry, as node_odometry.py
+STREAM_FULL_RATE = True # Also publish every pose on robot/odometry_stream
+PRINT_INTERVAL = 1.0    # s
+
+# Robot parameters (same as node_odometry.py)
+WHEEL_RADIUS = 0.0825   # meters
+WHEEL_BASE = 0.420      # meters
+
+# Record the raw sensor stream for tests/benchmark_localization.py (None = off)
+LOG_FILE = None  # e.g. os.path.expanduser('~/localization_log.csv')
+LOG_COLUMNS = ["time", "gyro_z", "encoder_time", "left_turns", "right_turns", "left_rpm", "right_rpm"]
+
+# ------------------------------------------------------------------------------------
+# Initialize sensors
+# ------------------------------------------------------------------------------------
+# The ODrive UART is owned by node_odrive.py
+motor_controller = ODriveClient()
+
+imu = FilteredMPU6050()
+imu.calibrate()
+# Gyro samples come from the FIFO in a background thread, so the loop below
+# never waits on an I2C read
+imu_sampler = MPU6050Sampler(imu, sample_rate=IMU_RATE)
+
+# ------------------------------------------------------------------------------------
+# Localization Node
+# ------------------------------------------------------------------------------------
+reset_requested = False
+
+def on_message(client, userdata, msg):
+    """
+    Reset requests are applied in the main loop so they can't race the filter.
+    """
+    global reset_requested
+    if msg.topic == MQTT_TOPIC_RESET_ODOMETRY:
+        payload = json.loads(msg.payload)
+        if payload.get('reset', False):
+            reset_requested = True
+
+def main():
+    global reset_requested
+
+    client = mqtt.Client()
+    client.on_message = on_message
+    client.will_set(MQTT_TOPIC_LOCALIZATION_ACTIVE, json.dumps({'active': False}), retain=True)
+    client.connect(MQTT_BROKER_ADDRESS)
+    client.loop_start()
+    client.subscribe(MQTT_TOPIC_RESET_ODOMETRY)
+    client.publish(MQTT_TOPIC_LOCALIZATION_ACTIVE, json.dumps({'active': True}), retain=True)
+
+    ekf = RobotEKF(dt=1.0 / IMU_RATE)
+    prev_sample_time = None
+    imu_sampler.start()
+    imu_count = imu_sampler.count
+    prev_imu_time = None
+
+    log_file = open(LOG_FILE, 'w', newline='') if LOG_FILE else None
+    log_writer = csv.writer(log_file) if log_file else None
+    if log_writer:
+        log_writer.writerow(LOG_COLUMNS)
+
+    period = 1.0 / IMU_RATE
+    publish_interval = 1.0 / PUBLISH_RATE
+    next_tick = time.monotonic()
+    last_print_time = next_tick
+    last_publish_time = next_tick
+    step_time = 0.0
+    steps = 0
+
+    print(f"[node_localization.py] Fusing encoders and gyro at {IMU_RATE} Hz.")
+
+    try:
+        while True:
+            # Drift-free fixed rate, as in node_odometry.py
+            next_tick += period
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_tick = time.monotonic()  # Overran, don't try to catch up
+
+            # Gyro samples the sampler thread added since the last tick
+            rows, imu_count = imu_sampler.read_since(imu_count)
+            if len(rows) == 0:
+                continue
+            try:
+                state = motor_controller.get_state()
+            except Exception as e:
+                print(f"[node_localization.py] Error reading encoders: {e}")
+                continue
+
+            if reset_requested:
+                ekf.reset()
+                reset_requested = False
+                print("[node_localization.py] Pose reset to zero.")
+
+            # One predict + update per gyro sample; a new encoder sample is
+            # fused with the newest gyro sample of the tick
+            new_encoder_sample = state["time"] != prev_sample_time
+            samples = rows[:, [0, 7]].tolist()  # time, gz (bias removed)
+            if prev_imu_time is None:
+                prev_imu_time = samples[0][0] - 1.0 / IMU_RATE
+            for i, (imu_time, gyro_z) in enumerate(samples):
+                start = time.perf_counter()
+                ekf.predict(imu_time - prev_imu_time)
+                prev_imu_time = imu_time
+                if new_encoder_sample and i == len(samples) - 1:
+                    prev_sample_time = state["time"]
+                    v_encoder, w_encoder = encoder_velocities(state["left_rpm"], state["right_rpm"],
+                                                              WHEEL_RADIUS, WHEEL_BASE)
+                    ekf.update(v_encoder=v_encoder, w_encoder=w_encoder, w_imu=gyro_z)
+                else:
+                    ekf.update(w_imu=gyro_z)
+                step_time += time.perf_counter() - start
+                steps += 1
+
+                if log_writer:
+                    log_writer.writerow([imu_time, gyro_z, state["time"], state["left_turns"],
+                                         state["right_turns"], state["left_rpm"], state["right_rpm"]])
+
+                x, y, theta = ekf.get_pose()
+                linear_velocity, angular_velocity = ekf.get_velocity()
+                if STREAM_FULL_RATE:
+                    client.publish(MQTT_TOPIC_ODOMETRY_STREAM,
+                                   encode_odometry(imu_time, x, y, theta, linear_velocity,
+                                                   angular_velocity, ekf.get_pose_covariance()))
+
+            # Publish odometry data at 5 Hz
+            if imu_time - last_publish_time >= publish_interval:
+                odom_msg = {
+                    'x': x,
+                    'y': y,
+                    'theta': theta,
+                    'linear_velocity': linear_velocity,
+                    'angular_velocity': angular_velocity,
+                }
+                client.publish(MQTT_TOPIC_ODOMETRY, json.dumps(odom_msg))
+                last_publish_time = imu_time
+
+            if imu_time - last_print_time >= PRINT_INTERVAL:
+                print(f"[node_localization.py] x={x:.2f} y={y:.2f} theta={math.degrees(theta):.1f}° "
+                      f"gyro bias={ekf.get_gyro_bias():.4f} rad/s, "
+                      f"slip rejections={ekf.rejected_w_encoder}, "
+                      f"filter {step_time / steps * 1e6:.0f} us/step")
+                last_print_time = imu_time
+                step_time = 0.0
+                steps = 0
+
+    except KeyboardInterrupt:
+        print("\n[node_localization.py] Interrupted by user.")
+    finally:
+        imu_sampler.stop()
+        if log_file:
+            log_file.close()
+        # A clean disconnect doesn't send the will, so hand back explicitly
+        client.publish(MQTT_TOPIC_LOCALIZATION_ACTIVE, json.dumps({'active': False}),
+                       retain=True).wait_for_publish(timeout=1.0)
+        client.loop_stop()
+        client.disconnect()
+        motor_controller.close()
+        print("[node_localization.py] Shutdown complete.")
+
+if __name__ == "__main__":
+    main()
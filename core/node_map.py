@@ -11,18 +11,21 @@ import math
 import json
 import numpy as np
 from typing import List, Dict
-import base64
 
 from RPi import GPIO
 import smbus2
 import paho.mqtt.client as mqtt
 
 # VL53L5CX libraries
-from lib.vl53l5cx_lib.vl53l5cx import VL53L5CX
 from lib.vl53l5cx_lib.api import (
+    VL53L5CX_RANGING_MODE_AUTONOMOUS,
     VL53L5CX_RESOLUTION_4X4,
     VL53L5CX_RESOLUTION_8X8
 )
+from lib import grid_codec
+from lib.occupancy_grid import disk_kernel, LogOddsGrid
+from lib.tof_geometry import build_ray_table, project_targets, valid_target_mask, zone_targets
+from lib.tof_sensors import FrameReadyMonitor, RangingScheduler, SensorBringUp, i2c_bus_hz
 
 # -----------------------------------------------------------------------------
 # MQTT Setup
@@ -30,20 +33,40 @@ from lib.vl53l5cx_lib.api import (
 MQTT_BROKER = "localhost"    # Change if your broker is on a different machine
 MQTT_PORT = 1883
 MQTT_TOPIC = "robot/tof_map"  # Publish the map data here
+MQTT_TOPIC_POINTS = "robot/tof_points"  # Publish the raw ToF points here (for visualisation)
+MQTT_TOPIC_ODOMETRY = "robot/odometry"  # Robot pose used to place readings in the world frame
+MQTT_TOPIC_RESET_ODOMETRY = "robot/reset_odometry"
+
+# Wire format for both topics, see lib/grid_codec.py.
+# Set to grid_codec.ENCODING_JSON to read the messages with mosquitto_sub.
+MAP_ENCODING = grid_codec.ENCODING_AUTO
+
+# Latest robot pose from robot/odometry, with its velocity and arrival time
+robot_pose = {'x': 0.0, 'y': 0.0, 'theta': 0.0,
+              'linear_velocity': 0.0, 'angular_velocity': 0.0, 'time': 0.0}
+map_reset_requested = False
+
+def on_message(client, userdata, msg):
+    global map_reset_requested
+    payload = json.loads(msg.payload)
+    if msg.topic == MQTT_TOPIC_ODOMETRY:
+        robot_pose['x'] = payload.get('x', robot_pose['x'])
+        robot_pose['y'] = payload.get('y', robot_pose['y'])
+        robot_pose['theta'] = payload.get('theta', robot_pose['theta'])
+        robot_pose['linear_velocity'] = payload.get('linear_velocity', 0.0)
+        robot_pose['angular_velocity'] = payload.get('angular_velocity', 0.0)
+        robot_pose['time'] = time.monotonic()
+    elif msg.topic == MQTT_TOPIC_RESET_ODOMETRY and payload.get('reset', False):
+        # The world frame moves with an odometry reset, so the map is no longer valid
+        map_reset_requested = True
 
 client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2)  # Update to use VERSION2 callbacks
+client.on_message = on_message
 client.connect(MQTT_BROKER, MQTT_PORT, keepalive=60)
+client.subscribe(MQTT_TOPIC_ODOMETRY)
+client.subscribe(MQTT_TOPIC_RESET_ODOMETRY)
 client.loop_start()
 
-# -----------------------------------------------------------------------------
-# Sensor Data Cache
-# -----------------------------------------------------------------------------
-sensor_data_cache = {
-    0: None,  # Most recent valid data from sensor 0
-    1: None,  # Most recent valid data from sensor 1
-    2: None,  # Most recent valid data from sensor 2
-}
-
 # -----------------------------------------------------------------------------
 # ToF Sensor Setup
 # -----------------------------------------------------------------------------
@@ -52,6 +75,21 @@ sensor_pins = [17, 22, 27]  # LPn pins for the three sensors
 for pin in sensor_pins:
     GPIO.setup(pin, GPIO.OUT)
 
+# INT pins of the three sensors, None where it isn't wired. Those sensors
+# are polled with check_data_ready() every POLL_INTERVAL instead, or every
+# half frame period once their ranging frequency is known.
+sensor_int_pins = [None, None, None]  # e.g. [5, 6, 13]
+POLL_INTERVAL = 0.05   # s
+FRAME_TIMEOUT = 1.0    # s, longest wait for a frame before the loop runs again
+
+# The ranging frequencies follow the robot's motion within this I2C budget,
+# see RangingScheduler in lib/tof_sensors.py. setup/setup_os.sh leaves the
+# bus at the Pi's default 100 kHz, the device tree says if it was changed.
+ADAPTIVE_RANGING = True  # False keeps the standing-still rates
+I2C_BUS_HZ = i2c_bus_hz(1)
+I2C_BUS_SHARE = 0.5    # Part of the bus for frames and polls, the rest is margin for other devices
+VELOCITY_TIMEOUT = 1.0 # s, odometry older than this counts as standing still
+
 def scan_i2c_bus(bus_number=1):
     bus = smbus2.SMBus(bus_number)
     devices = []
@@ -63,34 +101,42 @@ def scan_i2c_bus(bus_number=1):
             pass
     return devices
 
-def set_sensor_address(sensor, pin, new_address):
-    # Pull down all LPn pins
-    for p in sensor_pins:
-        GPIO.output(p, GPIO.LOW)
-    # Power up the current sensor
-    GPIO.output(pin, GPIO.HIGH)
-    time.sleep(0.1)
-    # Set new I2C address
-    sensor.set_i2c_address(new_address)
-    # Pull up all pins again
-    for p in sensor_pins:
-        GPIO.output(p, GPIO.HIGH)
-
 print("Scanning I2C bus...")
 existing_addresses = scan_i2c_bus()
 print(f"Found devices at: {[hex(a) for a in existing_addresses]}")
 
 # Example addresses for the three sensors
 addresses = [0x52, 0x54, 0x56]
-sensors = []
 
-for i, pin in enumerate(sensor_pins):
-    if addresses[i] not in existing_addresses:
-        sensor = VL53L5CX()
-        set_sensor_address(sensor, pin, addresses[i])
-    else:
-        sensor = VL53L5CX(i2c_address=addresses[i])
-    sensors.append(sensor)
+# Driver outputs left out of every frame. The map only uses distance_mm and
+# target_status, nb_target_detected is kept so zones without a target get
+# status 255. The three sensors share one I2C bus, so frame size is what
+# limits the ranging frequency. Set to {} to transfer every output.
+MAPPING_PROFILE = {
+    "disable_ambient_per_spad": True,
+    "disable_nb_spads_enabled": True,
+    "disable_signal_per_spad": True,
+    "disable_range_sigma_mm": True,
+    "disable_reflectance_percent": True,
+    "disable_motion_indicator": True,
+}
+
+# Targets reported per zone (1 to 4). With more than one, a zone that sees a
+# chair leg in front of a wall returns both and both go into the map. Each
+# extra target adds 2 bytes of distance_mm and 1 of target_status per zone to
+# every frame, see tests/benchmark_tof.py for the cost.
+NB_TARGET_PER_ZONE = 2
+
+SENSOR_YAW_DEG = {
+    0: -60.0,  # Left sensor
+    1: 0.0,    # Forward sensor
+    2: 60.0,   # Right sensor
+}
+
+# Assigns the addresses with the LPn pins and boots the sensors concurrently
+bring_up = SensorBringUp(sensor_pins, addresses,
+                         dict(MAPPING_PROFILE, nb_target_per_zone=NB_TARGET_PER_ZONE))
+sensors = bring_up.assign_addresses(existing_addresses)
 
 # Verify that all sensors are alive
 for sensor in sensors:
@@ -101,14 +147,29 @@ print("Initialising sensors...")
 USE_8X8_MODE = True  # Change to False for 4x4
 
 # Initialize sensors
-for sensor in sensors:
-    sensor.init()
-    if USE_8X8_MODE:
-        sensor.set_resolution(VL53L5CX_RESOLUTION_8X8)
-    else:
-        sensor.set_resolution(VL53L5CX_RESOLUTION_4X4)
+resolution = VL53L5CX_RESOLUTION_8X8 if USE_8X8_MODE else VL53L5CX_RESOLUTION_4X4
+
+# build_ray_table() rotates row vectors, so a sensor looks along minus its yaw
+ranging_scheduler = RangingScheduler(
+    sensors, [-SENSOR_YAW_DEG[s_idx] for s_idx in range(len(sensors))], resolution,
+    polled=[s_idx for s_idx, pin in enumerate(sensor_int_pins) if pin is None],
+    bus_hz=I2C_BUS_HZ, bus_share=I2C_BUS_SHARE, max_hz=15 if USE_8X8_MODE else 60)
+
+def configure_sensor(sensor):
+    sensor.set_resolution(resolution)
+    sensor.set_ranging_mode(VL53L5CX_RANGING_MODE_AUTONOMOUS)  # The integration time only applies here
+    ranging_scheduler.configure(sensor)
     sensor.start_ranging()
 
+bring_up.start(configure_sensor)
+print(bring_up.report())
+for sensor in sensors:
+    full_size = sensor.compute_data_read_size(resolution, all_outputs=True)
+    print(f"Sensor {hex(sensor.i2c_address)}: {sensor.data_read_size} bytes per frame, "
+          f"{full_size - sensor.data_read_size} of {full_size} saved by MAPPING_PROFILE")
+print(f"Ranging at {ranging_scheduler.rates} Hz, I2C at {I2C_BUS_HZ // 1000} kHz, "
+      f"budget {ranging_scheduler.budget:.0f} bytes/s")
+
 print("Sensors initialized.")
 
 # -----------------------------------------------------------------------------
@@ -128,184 +189,158 @@ else:
     cols_deg = np.linspace(-FOV_DEG/2 + OFFSET_4X4, FOV_DEG/2 - OFFSET_4X4, 4)
     NUM_ZONES = 16
 
-def deg2rad(deg: float) -> float:
-    return deg * math.pi / 180.0
+SENSOR_HEIGHT_M = 0.75
+OFFSET_TOWARDS_CENTER = -0.5  # Adjust this value as needed (in meters)
+TILT_ANGLE_DEG = -30.0        # Tilt angle for sensors
 
-def get_3d_points(distances_mm: list[int], sensor_index: int) -> np.ndarray:
+def make_ray_table(sensor_index: int):
     """
-    Convert the distance readings into (x, y, z) points in world coordinates.
-    Applies a fixed offset towards the center of the robot to correct Z-axis discrepancies.
+    Precompute the rays of one sensor, with a fixed offset towards the center
+    of the robot to correct Z-axis discrepancies.
     """
-    sensor_height_m = 0.75
-    OFFSET_TOWARDS_CENTER = -0.5  # Adjust this value as needed (in meters)
-
-    points = []
-    grid_size = int(math.sqrt(NUM_ZONES))  # 8 or 4
-    for i, dist_mm in enumerate(distances_mm):
-        dist_m = dist_mm * 0.001
-        row_idx = i // grid_size
-        col_idx = i % grid_size
-
-        # Angles for this zone
-        vert_rad  = deg2rad(rows_deg[row_idx])
-        horiz_rad = deg2rad(cols_deg[col_idx])
-
-        # Spherical → Cartesian
-        x = dist_m * math.cos(vert_rad) * math.cos(horiz_rad)
-        y = dist_m * math.cos(vert_rad) * math.sin(horiz_rad)
-        z = dist_m * math.sin(vert_rad)
-
-        # Apply fixed offset towards the center of the robot
-        x += OFFSET_TOWARDS_CENTER * math.cos(deg2rad(sensor_index * 60))
-        y += OFFSET_TOWARDS_CENTER * math.sin(deg2rad(sensor_index * 60))
-
-        # Shift for sensor height
-        z += sensor_height_m
-
-        points.append([x, y, z])
-        
-    points_np = np.array(points)
-
-    if points_np.size > 0:
-        # Determine the sensor orientation
-        if sensor_index == 0:
-            z_angle = -60.0   # Left sensor
-        elif sensor_index == 2:
-            z_angle = 60.0    # Right sensor
-        else:
-            z_angle = 0.0     # Forward sensor
-
-        # Tilt angle for sensors
-        tilt_angle = -30.0
-
-        # Rotation matrices
-        rot_y = np.array([
-            [ math.cos(deg2rad(tilt_angle)), 0, math.sin(deg2rad(tilt_angle))],
-            [ 0,                             1, 0                            ],
-            [-math.sin(deg2rad(tilt_angle)), 0, math.cos(deg2rad(tilt_angle))],
-        ])
-
-        rot_z = np.array([
-            [math.cos(deg2rad(z_angle)), -math.sin(deg2rad(z_angle)), 0],
-            [math.sin(deg2rad(z_angle)),  math.cos(deg2rad(z_angle)), 0],
-            [0,                          0,                           1],
-        ])
-
-        # Apply rotations
-        points_np = points_np @ rot_y @ rot_z
-
-    return points_np
+    offset = [
+        OFFSET_TOWARDS_CENTER * math.cos(math.radians(sensor_index * 60)),
+        OFFSET_TOWARDS_CENTER * math.sin(math.radians(sensor_index * 60)),
+        SENSOR_HEIGHT_M,  # Shift for sensor height
+    ]
+    return build_ray_table(rows_deg, cols_deg, TILT_ANGLE_DEG, SENSOR_YAW_DEG[sensor_index], offset)
+
+RAY_TABLES = [make_ray_table(s_idx) for s_idx in range(len(sensors))]
+
+def get_3d_points(distances_mm, sensor_index: int) -> np.ndarray:
+    """Convert (zones, targets) distance readings into (x, y, z) points in robot coordinates."""
+    return project_targets(RAY_TABLES[sensor_index], distances_mm)
 
 # -----------------------------------------------------------------------------
 # Occupancy Grid Parameters
 # -----------------------------------------------------------------------------
-GRID_MIN_X = -2.0  # meters
-GRID_MAX_X = 2.0
-GRID_MIN_Y = -2.0
-GRID_MAX_Y = 2.0
+GRID_SIZE = 6.4  # meters, square window that follows the robot in whole tiles
 GRID_RESOLUTION = 0.05  # 5cm per cell
+TILE_SIZE = 16  # cells per tile side, the unit of delta publishing
+KEYFRAME_INTERVAL = 1.0  # seconds between full grid messages
 OBSTACLE_HEIGHT_THRESHOLD = 0.1  # meters above ground
 ROBOT_RADIUS = 0.2  # 200mm radius
 
-def create_empty_grid() -> np.ndarray:
-    """Create an empty occupancy grid."""
-    grid_size_x = int((GRID_MAX_X - GRID_MIN_X) / GRID_RESOLUTION)
-    grid_size_y = int((GRID_MAX_Y - GRID_MIN_Y) / GRID_RESOLUTION)
-    return np.ones((grid_size_y, grid_size_x), dtype=np.uint8)  # 1 is free space
-
-def world_to_grid(x: float, y: float) -> tuple[int, int]:
-    """Convert world coordinates to grid coordinates."""
-    grid_x = int((x - GRID_MIN_X) / GRID_RESOLUTION)
-    grid_y = int((y - GRID_MIN_Y) / GRID_RESOLUTION)
-    return grid_x, grid_y
-
-def update_occupancy_grid(sensor_data: List[Dict]) -> np.ndarray:
-    """Create occupancy grid from sensor data with robot size consideration."""
-    grid = create_empty_grid()
-    
-    # First pass: Mark direct obstacle detections
+# Structuring element for the obstacle dilation, built once and reused every frame
+ROBOT_KERNEL = disk_kernel(ROBOT_RADIUS, GRID_RESOLUTION)
+
+# Persistent world-frame map, see lib/occupancy_grid.py for the log-odds parameters
+log_odds_map = LogOddsGrid(GRID_SIZE, GRID_RESOLUTION, TILE_SIZE)
+
+# Longest time a pose is moved forward or back to a frame's timestamp
+POSE_EXTRAPOLATION_LIMIT = 0.2  # s
+
+def pose_at(pose: Dict, t: float) -> Dict:
+    """
+    Robot pose when a frame landed, moved from the last odometry message at its
+    constant velocity, so frames read while turning aren't smeared in the map.
+    """
+    dt = min(max(t - pose['time'], -POSE_EXTRAPOLATION_LIMIT), POSE_EXTRAPOLATION_LIMIT)
+    v, w = pose['linear_velocity'], pose['angular_velocity']
+    heading = pose['theta'] + 0.5 * w * dt
+    return {'x': pose['x'] + v * dt * math.cos(heading),
+            'y': pose['y'] + v * dt * math.sin(heading),
+            'theta': pose['theta'] + w * dt}
+
+def robot_to_world(points_xy: np.ndarray, pose: Dict) -> np.ndarray:
+    """Transform (N, 2) points from the robot frame to the world frame."""
+    c, s = math.cos(pose['theta']), math.sin(pose['theta'])
+    rotation = np.array([[c, -s], [s, c]])
+    return points_xy @ rotation.T + [pose['x'], pose['y']]
+
+def fuse_sensor_data(sensor_data: List[Dict], robot_pose: Dict) -> None:
+    """
+    Ray-cast one frame of every sensor into the log-odds map, each from the
+    pose at its own timestamp. Points above the height threshold are
+    obstacles, lower ones are floor and only clear space.
+    """
+    origins, ends, hits = [], [], []
     for sensor in sensor_data:
-        for point in sensor["valid_points"]:
-            x, y, z = point
-            # Skip points outside our grid bounds
-            if (GRID_MIN_X <= x <= GRID_MAX_X and 
-                GRID_MIN_Y <= y <= GRID_MAX_Y):
-                # If point is above our height threshold, mark as occupied
-                if z > OBSTACLE_HEIGHT_THRESHOLD:
-                    grid_x, grid_y = world_to_grid(x, y)
-                    try:
-                        grid[grid_y, grid_x] = 0  # 0 is occupied space
-                    except IndexError:
-                        continue
-    
-    # Second pass: Dilate obstacles by robot radius
-    dilated_grid = grid.copy()
-    robot_cells = int(ROBOT_RADIUS / GRID_RESOLUTION)  # Number of cells for robot radius
-    
-    # Find all obstacle cells
-    obstacle_ys, obstacle_xs = np.where(grid == 0)
-    
-    # For each obstacle cell, mark surrounding cells within robot radius as occupied
-    for obs_y, obs_x in zip(obstacle_ys, obstacle_xs):
-        # Calculate bounds for the square region to check
-        y_min = max(0, obs_y - robot_cells)
-        y_max = min(grid.shape[0], obs_y + robot_cells + 1)
-        x_min = max(0, obs_x - robot_cells)
-        x_max = min(grid.shape[1], obs_x + robot_cells + 1)
-        
-        # Check each cell in the square region
-        for y in range(y_min, y_max):
-            for x in range(x_min, x_max):
-                # Calculate distance to obstacle cell
-                dist = np.sqrt((y - obs_y)**2 + (x - obs_x)**2) * GRID_RESOLUTION
-                # If within robot radius, mark as occupied
-                if dist <= ROBOT_RADIUS:
-                    dilated_grid[y, x] = 0
-
-    return dilated_grid
+        points = sensor["valid_points"]
+        pose = pose_at(robot_pose, sensor["time"])
+        origin = robot_to_world(sensor["origin"][None, :2], pose)
+        origins.append(np.repeat(origin, len(points), axis=0))
+        ends.append(robot_to_world(points[:, :2], pose))
+        hits.append(points[:, 2] > OBSTACLE_HEIGHT_THRESHOLD)
+    log_odds_map.integrate(np.concatenate(origins), np.concatenate(ends), np.concatenate(hits))
+
+# Last published grid, used to only send the tiles that changed
+published_grid = None
+published_origin = None
+last_keyframe_time = 0.0
+
+def publish_map(grid: np.ndarray) -> None:
+    """Publish a full grid every KEYFRAME_INTERVAL (or when the window moves), otherwise changed tiles only."""
+    global published_grid, published_origin, last_keyframe_time
+    now = time.monotonic()
+    origin = (log_odds_map.min_x, log_odds_map.min_y)
+
+    if (MAP_ENCODING == grid_codec.ENCODING_JSON or published_grid is None
+            or origin != published_origin or now - last_keyframe_time >= KEYFRAME_INTERVAL):
+        client.publish(MQTT_TOPIC, grid_codec.encode_grid(
+            grid, GRID_RESOLUTION, origin[0], origin[1], encoding=MAP_ENCODING))
+        last_keyframe_time = now
+    else:
+        tiles = grid_codec.changed_tiles(published_grid, grid, TILE_SIZE)
+        if len(tiles):
+            client.publish(MQTT_TOPIC, grid_codec.encode_tiles(
+                grid, tiles, TILE_SIZE, GRID_RESOLUTION, origin[0], origin[1]))
+
+    published_grid = grid
+    published_origin = origin
 
 # -----------------------------------------------------------------------------
 # Main Loop
 # -----------------------------------------------------------------------------
+# Wakes the loop when a sensor has a frame, see lib/tof_sensors.py
+frame_monitor = FrameReadyMonitor(sensors, sensor_int_pins, poll_interval=POLL_INTERVAL)
+# INT pins without edge detection fall back to polling, which the bus budget has to cover
+ranging_scheduler.set_polled(frame_monitor.polled)
+
+def sync_poll_intervals():
+    for s_idx, rate in enumerate(ranging_scheduler.rates):
+        frame_monitor.set_frame_rate(s_idx, rate)
+
+sync_poll_intervals()
+print(f"Sensors on INT pins: {len(sensors) - len(frame_monitor.polled)}, "
+      f"polled: {len(frame_monitor.polled)}")
+
 print("Starting ToF read + MQTT publish loop...")
 try:
     while True:
         all_sensor_data = []
 
-        for s_idx, sensor in enumerate(sensors):
+        for s_idx, frame_time in frame_monitor.wait(FRAME_TIMEOUT):
+            sensor = sensors[s_idx]
             try:
-                if sensor.check_data_ready():
-                    data = sensor.get_ranging_data()
-
-                    # Ensure we have enough data before slicing
-                    if len(data.distance_mm) >= NUM_ZONES and len(data.target_status) >= NUM_ZONES:
-                        distances_mm = data.distance_mm[:NUM_ZONES]
-                        target_status = data.target_status[:NUM_ZONES]
-
-                        # Convert to 3D points in world coordinates
-                        points_3d = get_3d_points(distances_mm, s_idx)
-
-                        # Build a data structure for this sensor
-                        # We'll also separate valid vs invalid points if you want
-                        valid_points = []
-                        invalid_points = []
-                        for i, (dist_mm, status) in enumerate(zip(distances_mm, target_status)):
-                            # Status code 5 typically means "valid" measurement on VL53L5CX
-                            if status == 5 and dist_mm != 0:
-                                valid_points.append(points_3d[i].tolist())
-                            else:
-                                invalid_points.append(points_3d[i].tolist())
-
-                        sensor_data = {
-                            "sensor_address": hex(sensor.i2c_address),
-                            "sensor_index": s_idx,
-                            "valid_points": valid_points,
-                            "invalid_points": invalid_points,
-                        }
-                        all_sensor_data.append(sensor_data)
-                    else:
-                        print(f"Warning: Sensor {s_idx} returned incomplete data")
-                        continue
+                data = sensor.get_ranging_data()
+
+                # Ensure we have enough data before slicing
+                num_returns = NUM_ZONES * sensor.nb_target_per_zone
+                if len(data.distance_mm) >= num_returns and len(data.target_status) >= num_returns:
+                    # (zones, targets) arrays, every target of a zone lies on the zone's ray
+                    distances_mm = zone_targets(data.distance_mm, NUM_ZONES, sensor.nb_target_per_zone)
+                    target_status = zone_targets(data.target_status, NUM_ZONES, sensor.nb_target_per_zone)
+
+                    # Convert to 3D points in world coordinates
+                    points_3d = get_3d_points(distances_mm, s_idx)
+
+                    # Every valid return is a point, zones without any are invalid
+                    valid = valid_target_mask(distances_mm, target_status, data.nb_target_detected)
+                    invalid_zones = ~valid.any(axis=1)
+
+                    sensor_data = {
+                        "sensor_address": sensor.i2c_address,
+                        "sensor_index": s_idx,
+                        "origin": RAY_TABLES[s_idx][1],
+                        "valid_points": points_3d[valid],
+                        "invalid_points": points_3d[invalid_zones, 0],
+                        "time": frame_time,
+                    }
+                    all_sensor_data.append(sensor_data)
+                else:
+                    print(f"Warning: Sensor {s_idx} returned incomplete data")
+                    continue
 
             except IndexError as e:
                 print(f"Error reading sensor {s_idx}: {e}")
@@ -314,49 +349,38 @@ try:
                 print(f"Unexpected error with sensor {s_idx}: {e}")
                 continue
 
-        # Publish all sensor data to MQTT as one JSON structure
+        # Fuse the new frames into the map and publish it
         if all_sensor_data:
-            # Update cache with new sensor data
-            for sensor_data in all_sensor_data:
-                s_idx = sensor_data["sensor_index"]
-                if sensor_data["valid_points"]:  # Only cache if we have valid points
-                    sensor_data_cache[s_idx] = sensor_data
-
-            # Combine all cached sensor data
-            combined_sensor_data = [
-                data for data in sensor_data_cache.values() 
-                if data is not None
-            ]
-
-            # Create occupancy grid from combined data
-            occupancy_grid = update_occupancy_grid(combined_sensor_data)
-            
-            # Convert numpy array to list for JSON serialization
-            grid_list = occupancy_grid.tolist()
-            
-            # Add grid to payload
-            payload = json.dumps({
-                "sensors": combined_sensor_data,  # Send all cached sensor data
-                "occupancy_grid": {
-                    "data": grid_list,
-                    "height": len(grid_list),      # Add height
-                    "width": len(grid_list[0]),    # Add width
-                    "resolution": GRID_RESOLUTION,
-                    "min_x": GRID_MIN_X,
-                    "max_x": GRID_MAX_X,
-                    "min_y": GRID_MIN_Y,
-                    "max_y": GRID_MAX_Y
-                }
-            })
-            client.publish(MQTT_TOPIC, payload)
-
-        time.sleep(0.05)
+            if map_reset_requested:
+                log_odds_map.clear()
+                map_reset_requested = False
+
+            pose = dict(robot_pose)
+            log_odds_map.recenter(pose['x'], pose['y'])
+            log_odds_map.decay(time.monotonic())
+            fuse_sensor_data(all_sensor_data, pose)
+
+            publish_map(log_odds_map.occupancy_grid(ROBOT_KERNEL))
+            client.publish(MQTT_TOPIC_POINTS, grid_codec.encode_points(
+                all_sensor_data, encoding=MAP_ENCODING))
+
+        # Between frames, move the frame rate to the sensors facing the motion
+        if ADAPTIVE_RANGING:
+            moving = time.monotonic() - robot_pose['time'] < VELOCITY_TIMEOUT
+            try:
+                if ranging_scheduler.update(robot_pose['linear_velocity'] if moving else 0.0,
+                                            robot_pose['angular_velocity'] if moving else 0.0):
+                    print(f"Ranging at {ranging_scheduler.rates} Hz")
+            except Exception as e:
+                print(f"Error changing the ranging frequency: {e}")
+            sync_poll_intervals()
 
 except KeyboardInterrupt:
     print("\nInterrupted by user.")
 
 finally:
     # Clean up
+    frame_monitor.close()
     GPIO.cleanup()
     client.loop_stop()
     client.disconnect()
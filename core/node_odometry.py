@@ -5,12 +5,14 @@ import time
 import math
 import sys
 import os
+import numpy as np
 import paho.mqtt.client as mqtt
 
 # Adds the lib directory to the Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from lib.odrive_uart import ODriveUART
+from lib.odrive_client import ODriveClient
+from lib.odometry_codec import encode_odometry
 
 # ------------------------------------------------------------------------------------
 # Constants
@@ -18,55 +20,56 @@ from lib.odrive_uart import ODriveUART
 MQTT_BROKER_ADDRESS = "localhost"
 MQTT_TOPIC_ODOMETRY = "robot/odometry"
 MQTT_TOPIC_RESET_ODOMETRY = "robot/reset_odometry"  # New topic
+MQTT_TOPIC_ODOMETRY_STREAM = "robot/odometry_stream"  # Every pose, binary (lib/odometry_codec.py)
+# Retained flag set by node_localization.py, whose EKF pose then replaces ours
+MQTT_TOPIC_LOCALIZATION_ACTIVE = "robot/localization_active"
 
-# ODrive UART port
-ODRIVE_UART_PORT = '/dev/ttyAMA1'  # Adjust as necessary
+ODOMETRY_RATE = 100     # Hz, node_odrive.py reads the encoders at 100 Hz
+PUBLISH_RATE = 5        # Hz, JSON on robot/odometry
+STREAM_FULL_RATE = True # Also publish every pose on robot/odometry_stream
 
 # Robot parameters
 WHEEL_RADIUS = 0.0825   # meters (adjust based on your robot's wheel radius)
 WHEEL_BASE = 0.420      # meters (track width is 400mm)
 
+# Variance of each wheel's travelled distance grows by this much per metre
+WHEEL_DISTANCE_VARIANCE = 1e-4  # m^2 / m
+
 # ------------------------------------------------------------------------------------
 # Initialize ODrive
 # ------------------------------------------------------------------------------------
-try:
-    # Load motor directions from JSON file
-    with open(os.path.expanduser('~/quickstart/lib/motor_dir.json'), 'r') as f:
-        motor_dirs = json.load(f)
-        left_dir = motor_dirs['left']
-        right_dir = motor_dirs['right']
-except Exception as e:
-    raise Exception("Error reading motor_dir.json") from e
-
-# Initialize the motor controller
-motor_controller = ODriveUART(
-    port=ODRIVE_UART_PORT,
-    left_axis=0,
-    right_axis=1,
-    dir_left=left_dir,
-    dir_right=right_dir
-)
+# The ODrive UART is owned by node_odrive.py
+motor_controller = ODriveClient()
 
 # ------------------------------------------------------------------------------------
 # Odometry Node
 # ------------------------------------------------------------------------------------
+reset_requested = False
+localization_active = False
+
 def on_reset_odometry(client, userdata, msg):
     """
-    Callback to reset odometry when a reset message is received.
+    Callback to reset odometry when a reset message is received. The reset
+    itself happens in the main loop so it can't race the integration.
     """
-    global x, y, theta
+    global reset_requested
     payload = json.loads(msg.payload)
     if payload.get('reset', False):
-        x = 0.0
-        y = 0.0
-        theta = 0.0
-        print("[node_odometry.py] Odometry reset to zero.")
+        reset_requested = True
 
-        # Reset encoder readings as well
-        global prev_left_turns, prev_right_turns
-        prev_left_turns = motor_controller.get_position_turns_left()
-        prev_right_turns = motor_controller.get_position_turns_right()
-        print("[node_odometry.py] Encoder counts reset.")
+def on_localization_active(client, userdata, msg):
+    """
+    Stop publishing while node_localization.py publishes the same topics.
+    The pose keeps being integrated, so publishing resumes where it is.
+    """
+    global localization_active
+    active = json.loads(msg.payload).get('active', False)
+    if active != localization_active:
+        localization_active = active
+        if active:
+            print("[node_odometry.py] node_localization.py is running, not publishing.")
+        else:
+            print("[node_odometry.py] node_localization.py stopped, publishing again.")
 
 def on_message(client, userdata, msg):
     """
@@ -74,10 +77,45 @@ def on_message(client, userdata, msg):
     """
     if msg.topic == MQTT_TOPIC_RESET_ODOMETRY:
         on_reset_odometry(client, userdata, msg)
+    elif msg.topic == MQTT_TOPIC_LOCALIZATION_ACTIVE:
+        on_localization_active(client, userdata, msg)
+
+def integrate_arc(x, y, theta, delta_dist, delta_theta):
+    """
+    Move the pose along a circular arc. Exact when both wheels turn at a
+    constant rate between samples, unlike the midpoint approximation.
+    """
+    if abs(delta_theta) < 1e-9:
+        return (x + delta_dist * math.cos(theta),
+                y + delta_dist * math.sin(theta),
+                theta)
+    radius = delta_dist / delta_theta
+    new_theta = theta + delta_theta
+    return (x + radius * (math.sin(new_theta) - math.sin(theta)),
+            y - radius * (math.cos(new_theta) - math.cos(theta)),
+            new_theta)
+
+def propagate_covariance(covariance, theta, delta_left_dist, delta_right_dist):
+    """Grow the (x, y, theta) covariance by the wheel distance noise of one step."""
+    delta_dist = (delta_right_dist + delta_left_dist) / 2.0
+    heading = theta + (delta_right_dist - delta_left_dist) / (2.0 * WHEEL_BASE)
+    c = math.cos(heading)
+    s = math.sin(heading)
+    k = delta_dist / (2.0 * WHEEL_BASE)
+
+    # Jacobians with respect to the pose and to the (left, right) wheel distances
+    F = np.array([[1.0, 0.0, -delta_dist * s],
+                  [0.0, 1.0,  delta_dist * c],
+                  [0.0, 0.0,  1.0]])
+    G = np.array([[0.5 * c + k * s, 0.5 * c - k * s],
+                  [0.5 * s - k * c, 0.5 * s + k * c],
+                  [-1.0 / WHEEL_BASE, 1.0 / WHEEL_BASE]])
+    Q = np.diag([WHEEL_DISTANCE_VARIANCE * abs(delta_left_dist),
+                 WHEEL_DISTANCE_VARIANCE * abs(delta_right_dist)])
+    return F @ covariance @ F.T + G @ Q @ G.T
 
 def main():
-    global x, y, theta
-    global prev_left_turns, prev_right_turns
+    global reset_requested
 
     # Initialize MQTT client
     client = mqtt.Client()
@@ -88,81 +126,114 @@ def main():
     # Subscribe to odometry reset topic
     client.subscribe(MQTT_TOPIC_RESET_ODOMETRY)
     print("[node_odometry.py] Subscribed to reset odometry topic.")
+    client.subscribe(MQTT_TOPIC_LOCALIZATION_ACTIVE)
 
     # Initialize robot state
     x = 0.0    # in meters
     y = 0.0    # in meters
     theta = 0.0  # in radians
+    covariance = np.zeros((3, 3))
+    linear_velocity = 0.0
+    angular_velocity = 0.0
 
     # Get initial encoder readings
-    prev_left_turns = motor_controller.get_position_turns_left()
-    prev_right_turns = motor_controller.get_position_turns_right()
+    state = motor_controller.get_state()
+    prev_left_turns, prev_right_turns = state["left_turns"], state["right_turns"]
+    prev_sample_time = state["time"]
 
-    rate = 50  # Compute odometry at 50 Hz
-    publish_rate = 5  # Publish odometry at 5 Hz
-    dt = 1.0 / rate
-    publish_interval = 1.0 / publish_rate  # Time between publishes in seconds
-    last_publish_time = time.time()
+    period = 1.0 / ODOMETRY_RATE
+    publish_interval = 1.0 / PUBLISH_RATE  # Time between publishes in seconds
+    next_tick = time.monotonic()
+    last_publish_time = next_tick
 
     print("[node_odometry.py] Starting odometry node.")
 
     try:
         while True:
-            current_time = time.time()
-
-            # Get current encoder turns
+            # Drift-free fixed rate: ticks are scheduled from the start time,
+            # not from when the previous one finished
+            next_tick += period
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_tick = time.monotonic()  # Overran, don't try to catch up
+
+            # Get current encoder turns (both axes, timestamped by node_odrive.py)
             try:
-                curr_left_turns = motor_controller.get_position_turns_left()
-                curr_right_turns = motor_controller.get_position_turns_right()
+                state = motor_controller.get_state()
             except Exception as e:
                 print(f"[node_odometry.py] Error getting encoder turns: {e}")
                 continue
 
+            if reset_requested:
+                x, y, theta = 0.0, 0.0, 0.0
+                covariance = np.zeros((3, 3))
+                prev_left_turns, prev_right_turns = state["left_turns"], state["right_turns"]
+                reset_requested = False
+                print("[node_odometry.py] Odometry and encoder counts reset to zero.")
+
+            if state["time"] == prev_sample_time:
+                continue  # No new encoder sample since the last tick
+            prev_sample_time = state["time"]
+
             # Compute difference in turns
-            delta_left_turns = curr_left_turns - prev_left_turns
-            delta_right_turns = curr_right_turns - prev_right_turns
+            delta_left_turns = state["left_turns"] - prev_left_turns
+            delta_right_turns = state["right_turns"] - prev_right_turns
 
             # Update previous turns
-            prev_left_turns = curr_left_turns
-            prev_right_turns = curr_right_turns
+            prev_left_turns = state["left_turns"]
+            prev_right_turns = state["right_turns"]
 
             # Convert turns to distances
             delta_left_dist = delta_left_turns * 2.0 * math.pi * WHEEL_RADIUS
             delta_right_dist = delta_right_turns * 2.0 * math.pi * WHEEL_RADIUS
 
-            # Compute average distance
+            # Compute average distance and change in orientation
             delta_dist = (delta_right_dist + delta_left_dist) / 2.0
-
-            # Compute change in orientation
             delta_theta = (delta_right_dist - delta_left_dist) / WHEEL_BASE
 
             # Compute new pose
-            x += delta_dist * math.cos(theta + delta_theta / 2.0)
-            y += delta_dist * math.sin(theta + delta_theta / 2.0)
-            theta += delta_theta
+            covariance = propagate_covariance(covariance, theta, delta_left_dist, delta_right_dist)
+            x, y, theta = integrate_arc(x, y, theta, delta_dist, delta_theta)
 
             # Normalize theta to (-pi, pi]
             theta = (theta + math.pi) % (2 * math.pi) - math.pi
 
+            # Velocities from the ODrive's own encoder estimates
+            left_speed = state["left_rpm"] / 60.0 * 2.0 * math.pi * WHEEL_RADIUS
+            right_speed = state["right_rpm"] / 60.0 * 2.0 * math.pi * WHEEL_RADIUS
+            linear_velocity = (right_speed + left_speed) / 2.0
+            angular_velocity = (right_speed - left_speed) / WHEEL_BASE
+
+            if localization_active:
+                continue
+
+            if STREAM_FULL_RATE:
+                client.publish(MQTT_TOPIC_ODOMETRY_STREAM,
+                               encode_odometry(state["time"], x, y, theta,
+                                               linear_velocity, angular_velocity, covariance))
+
             # Publish odometry data at 5 Hz
+            current_time = time.monotonic()
             if current_time - last_publish_time >= publish_interval:
                 odom_msg = {
                     'x': x,
                     'y': y,
-                    'theta': theta
+                    'theta': theta,
+                    'linear_velocity': linear_velocity,
+                    'angular_velocity': angular_velocity
                 }
                 client.publish(MQTT_TOPIC_ODOMETRY, json.dumps(odom_msg))
                 print(f"Published odometry data: {odom_msg}")
                 last_publish_time = current_time  # Reset last publish time
 
-            # Sleep for the remainder of the loop
-            time.sleep(dt)
-
     except KeyboardInterrupt:
         print("\n[node_odometry.py] Interrupted by user.")
     finally:
         client.loop_stop()
         client.disconnect()
+        motor_controller.close()
         print("[node_odometry.py] Shutdown complete.")
 
 if __name__ == "__main__":
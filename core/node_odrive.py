@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+
+# Adds the lib directory to the Python path
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import json
+import time
+import queue
+import threading
+from multiprocessing.connection import Listener
+
+from lib.odrive_uart import ODriveUART
+from lib.odrive_client import ODRIVE_SOCKET
+
+# ------------------------------------------------------------------------------------
+# Constants
+# ------------------------------------------------------------------------------------
+ODRIVE_UART_PORT = '/dev/ttyAMA1'
+
+# Every tick sends the pending setpoint (if any) and reads both encoders in a
+# single UART write
+CONTROL_RATE = 100  # Hz
+
+# ------------------------------------------------------------------------------------
+# Initialize ODrive (this is the only process that opens the UART)
+# ------------------------------------------------------------------------------------
+try:
+    with open(os.path.expanduser('~/quickstart/lib/motor_dir.json'), 'r') as f:
+        motor_dirs = json.load(f)
+except Exception as e:
+    raise Exception("Error reading motor_dir.json") from e
+
+motor_controller = ODriveUART(
+    port=ODRIVE_UART_PORT,
+    left_axis=0, right_axis=1,
+    dir_left=motor_dirs['left'], dir_right=motor_dirs['right']
+)
+
+# Start motors and set mode
+motor_controller.start_left()
+motor_controller.start_right()
+motor_controller.enable_velocity_mode_left()
+motor_controller.enable_velocity_mode_right()
+motor_controller.disable_watchdog_left()
+motor_controller.disable_watchdog_right()
+
+# Clear motor errors
+motor_controller.clear_errors_left()
+motor_controller.clear_errors_right()
+
+# ------------------------------------------------------------------------------------
+# Shared state
+# ------------------------------------------------------------------------------------
+state_lock = threading.Lock()
+setpoint = None  # (left_mps, right_mps) waiting for the next tick, newest wins
+state = {"left_turns": 0.0, "right_turns": 0.0, "left_rpm": 0.0, "right_rpm": 0.0,
+         "time": None, "latency": None}
+state_ready = threading.Event()
+running = threading.Event()
+
+# Raw command batches from clients: (commands, reply queue)
+command_queue = queue.Queue()
+
+# ------------------------------------------------------------------------------------
+# UART loop
+# ------------------------------------------------------------------------------------
+def control_tick():
+    global setpoint
+    with state_lock:
+        pending, setpoint = setpoint, None
+
+    commands = []
+    if pending is not None:
+        commands.append(motor_controller.speed_mps_command(motor_controller.left_axis, pending[0],
+                                                           motor_controller.dir_left))
+        commands.append(motor_controller.speed_mps_command(motor_controller.right_axis, pending[1],
+                                                           motor_controller.dir_right))
+    commands.append(f'f {motor_controller.left_axis}')
+    commands.append(f'f {motor_controller.right_axis}')
+
+    try:
+        sent_time = time.monotonic()
+        left, right = motor_controller.send_commands(commands)
+        received_time = time.monotonic()
+    except Exception:
+        # Don't lose the setpoint (it may be a stop) unless a newer one arrived
+        with state_lock:
+            if setpoint is None:
+                setpoint = pending
+        raise
+    left_turns, left_rpm = motor_controller.parse_pos_vel(left, motor_controller.dir_left)
+    right_turns, right_rpm = motor_controller.parse_pos_vel(right, motor_controller.dir_right)
+    with state_lock:
+        # The encoders were sampled somewhere during the exchange
+        state.update(left_turns=left_turns, right_turns=right_turns,
+                     left_rpm=left_rpm, right_rpm=right_rpm,
+                     time=(sent_time + received_time) / 2,
+                     latency=received_time - sent_time)
+    state_ready.set()
+
+    # Raw commands from clients go out after the telemetry so they can't delay it
+    while not command_queue.empty():
+        commands, reply = command_queue.get_nowait()
+        try:
+            reply.put(motor_controller.send_commands(commands))
+        except Exception as e:
+            print(f"[node_odrive.py] UART error on {commands}: {e}")
+            reply.put(None)
+
+def uart_loop():
+    period = 1.0 / CONTROL_RATE
+    next_tick = time.monotonic()
+    while running.is_set():
+        try:
+            control_tick()
+        except Exception as e:
+            # Garbled or missing response; the next tick starts from a clean buffer
+            print(f"[node_odrive.py] UART error: {e}")
+
+        next_tick += period
+        delay = next_tick - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            next_tick = time.monotonic()  # Overran, don't try to catch up
+
+# ------------------------------------------------------------------------------------
+# IPC server
+# ------------------------------------------------------------------------------------
+def handle_request(message):
+    global setpoint
+    kind = message[0]
+    if kind == "set_speed_mps":
+        with state_lock:
+            setpoint = (float(message[1]), float(message[2]))
+        return None
+    if kind == "get_state":
+        state_ready.wait(timeout=1.0)
+        with state_lock:
+            return dict(state)
+    if kind == "commands":
+        reply = queue.Queue(maxsize=1)
+        command_queue.put((message[1], reply))
+        return reply.get()
+    raise ValueError(f"Unknown request: {kind}")
+
+def serve_client(conn):
+    try:
+        while True:
+            message = conn.recv()
+            try:
+                conn.send(handle_request(message))
+            except ValueError as e:
+                print(f"[node_odrive.py] {e}")
+                conn.send(None)
+    except (EOFError, OSError):
+        pass
+    finally:
+        conn.close()
+
+def main():
+    if os.path.exists(ODRIVE_SOCKET):
+        os.unlink(ODRIVE_SOCKET)  # Left over from a previous run
+
+    running.set()
+    uart_thread = threading.Thread(target=uart_loop, daemon=True)
+    uart_thread.start()
+    listener = Listener(ODRIVE_SOCKET, family='AF_UNIX')
+    print(f"[node_odrive.py] Serving the ODrive on {ODRIVE_SOCKET} at {CONTROL_RATE} Hz.")
+
+    try:
+        while True:
+            conn = listener.accept()
+            threading.Thread(target=serve_client, args=(conn,), daemon=True).start()
+    except KeyboardInterrupt:
+        print("\n[node_odrive.py] Interrupted by user.")
+    finally:
+        listener.close()
+        running.clear()
+        uart_thread.join(timeout=1.0)
+        # Stop motors and clean up
+        motor_controller.set_speed_mps_left(0)
+        motor_controller.set_speed_mps_right(0)
+        motor_controller.clear_errors_left()
+        motor_controller.clear_errors_right()
+        print("[node_odrive.py] Shutdown complete.")
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,20 @@
 #!/usr/bin/env python3
 
+# Adds the lib directory to the Python path
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
 import json
 import time
 import math
 import random
 import numpy as np
 import paho.mqtt.client as mqtt
-from heapq import heappush, heappop
+
+from lib import grid_codec
+from lib.grid_planning import GridAStar, DStarLite, corridor_mask, shortcut_path
+from lib.occupancy_grid import disk_kernel
 
 # -----------------------------------------------------------------------------
 # MQTT Setup
@@ -24,6 +32,9 @@ client = mqtt.Client()
 client.connect(MQTT_BROKER, MQTT_PORT, keepalive=60)
 client.loop_start()
 
+# Rebuilds the grid from full and tile-delta robot/tof_map messages
+grid_assembler = grid_codec.GridAssembler()
+
 # Global
 occupancy_grid = None
 grid_params    = {}
@@ -33,6 +44,22 @@ robot_x        = 0.0
 robot_y        = 0.0
 robot_th_deg   = 0.0
 
+# Incremental planner for the current goal, kept between grid messages so a
+# blocked path is repaired instead of re-planned from scratch
+planner        = None
+planner_grid   = None
+dstar_lite     = None  # Reused by every new search, see DStarLite.reset()
+planner_params = None
+goal_xy        = None
+
+# Cells swept by the published path, rebuilt when the path or the map window
+# changes. The map is already dilated by the robot radius, and planned paths
+# may run right along that boundary, so the corridor gets no extra margin.
+CORRIDOR_MARGIN = 0.0  # metres
+current_path_xy = None
+path_corridor   = None
+corridor_params = None
+
 # -----------------------------------------------------------------------------
 # MQTT Callbacks
 # -----------------------------------------------------------------------------
@@ -46,24 +73,10 @@ def on_message(client, userdata, message):
 
 def on_occupancy_grid(message):
     global occupancy_grid, grid_params
-    payload = json.loads(message.payload)
-    if "occupancy_grid" not in payload:
+    decoded = grid_assembler.update(message.payload)
+    if decoded is None:
         return
-    grid_info = payload["occupancy_grid"]
-    data_flat = grid_info["data"]
-    h = grid_info["height"]
-    w = grid_info["width"]
-    occupancy_grid = np.array(data_flat, dtype=np.uint8).reshape((h, w))
-
-    grid_params = {
-        "height":     h,
-        "width":      w,
-        "resolution": grid_info["resolution"],
-        "min_x":      grid_info["min_x"],
-        "max_x":      grid_info["max_x"],
-        "min_y":      grid_info["min_y"],
-        "max_y":      grid_info["max_y"]
-    }
+    occupancy_grid, grid_params = decoded
 
 def on_path_completed(message):
     global need_new_path
@@ -95,49 +108,11 @@ def in_bounds(grid, r, c):
 def is_free(grid, r, c):
     return in_bounds(grid, r, c) and grid[r, c] == 1
 
-def heuristic(a, b):
-    return math.hypot(a[0] - b[0], a[1] - b[1])
-
-def neighbors_8(grid, r, c):
-    for dr, dc in [(-1,0),(1,0),(0,-1),(0,1),(-1,-1),(-1,1),(1,-1),(1,1)]:
-        nr = r + dr
-        nc = c + dc
-        if in_bounds(grid, nr, nc) and grid[nr, nc] == 1:
-            yield nr, nc
+# Search buffers are reused across calls
+grid_astar = GridAStar()
 
 def a_star(grid, start_rc, goal_rc):
-    if not is_free(grid, start_rc[0], start_rc[1]):
-        return None
-    if not is_free(grid, goal_rc[0], goal_rc[1]):
-        return None
-
-    frontier = []
-    heappush(frontier, (0, start_rc))
-    came_from = {start_rc: None}
-    cost_so_far = {start_rc: 0}
-
-    while frontier:
-        _, current = heappop(frontier)
-        if current == goal_rc:
-            return reconstruct_path(came_from, start_rc, goal_rc)
-
-        for nxt in neighbors_8(grid, current[0], current[1]):
-            cost = cost_so_far[current] + (math.sqrt(2) if (nxt[0]-current[0]) and (nxt[1]-current[1]) else 1)
-            if nxt not in cost_so_far or cost < cost_so_far[nxt]:
-                cost_so_far[nxt] = cost
-                priority = cost + heuristic(nxt, goal_rc)
-                came_from[nxt] = current
-                heappush(frontier, (priority, nxt))
-    return None
-
-def reconstruct_path(came_from, start, goal):
-    path = []
-    current = goal
-    while current is not None:
-        path.append(current)
-        current = came_from[current]
-    path.reverse()
-    return path
+    return grid_astar.search(grid, start_rc, goal_rc)
 
 # -----------------------------------------------------------------------------
 # Conversions
@@ -159,41 +134,92 @@ def wrap_angle_180(a_deg):
 # Random Target
 # -----------------------------------------------------------------------------
 def pick_random_free_cell_in_front(grid, params, robot_r, robot_c, robot_x, robot_y, robot_th_deg,
-                                   distance_m=1.0, fov_half_deg=90.0, side_margin_deg=5.0, max_tries=30):
+                                   distance_m=1.0, fov_half_deg=90.0, side_margin_deg=5.0, max_tries=30,
+                                   max_detour=2.0):
     # We'll pick angles around robot_th_deg
     min_angle = -(fov_half_deg - side_margin_deg)
     max_angle = +(fov_half_deg - side_margin_deg)
 
-    for _ in range(max_tries):
-        delta_deg = random.uniform(min_angle, max_angle)
-        target_angle_deg = wrap_angle_180(robot_th_deg + delta_deg)
-        theta_rad = math.radians(target_angle_deg)
-        tx = robot_x + distance_m * math.cos(theta_rad)
-        ty = robot_y + distance_m * math.sin(theta_rad)
-
-        tr, tc = world_to_grid(tx, ty, params)
-        if is_free(grid, tr, tc):
-            path = a_star(grid, (robot_r, robot_c), (tr, tc))
-            if path is not None:
-                return path
-    return None
-
-def simplify_path(path_rc, max_waypoints=4):
-    if len(path_rc) <= max_waypoints:
-        return path_rc
-    # Always keep first, last, and 2 mid points
-    start = path_rc[0]
-    end   = path_rc[-1]
-    idx1  = len(path_rc) // 3
-    idx2  = (2 * len(path_rc)) // 3
-    return [start, path_rc[idx1], path_rc[idx2], end]
+    delta_deg = np.array([random.uniform(min_angle, max_angle) for _ in range(max_tries)])
+    theta_rad = np.radians(robot_th_deg + delta_deg)
+    tx = robot_x + distance_m * np.cos(theta_rad)
+    ty = robot_y + distance_m * np.sin(theta_rad)
+    tc = ((tx - params["min_x"]) / params["resolution"]).astype(int)
+    tr = ((ty - params["min_y"]) / params["resolution"]).astype(int)
+    inside = (tr >= 0) & (tr < grid.shape[0]) & (tc >= 0) & (tc < grid.shape[1])
+    goals = list(zip(tr[inside].tolist(), tc[inside].tolist()))
+
+    # One A* search towards all candidates picks the one whose path is the
+    # least longer than on an empty grid, instead of one A* search per
+    # candidate. Free headings tie and the first (random) one wins. Unlike
+    # the per-candidate A*, goals whose path is longer than max_detour times
+    # the goal distance count as unreachable.
+    distance_cells = distance_m / params["resolution"]
+    best = grid_astar.best_goal(grid, (robot_r, robot_c), goals, max_cost=max_detour * distance_cells)
+    if best is None:
+        return None
+    return grid_astar.path_to(goals[best])
+
+def start_planner(grid, params, start_rc, goal_rc):
+    global planner, planner_grid, planner_params, goal_xy, dstar_lite
+    if dstar_lite is None:
+        dstar_lite = DStarLite(grid, start_rc, goal_rc)
+    else:
+        dstar_lite.reset(grid, start_rc, goal_rc)
+    planner = dstar_lite
+    planner_grid = grid
+    planner_params = params
+    goal_xy = grid_to_world(goal_rc[0], goal_rc[1], params)
+
+def sync_planner(grid, params, robot_rc):
+    """Feed the newest grid to the planner, repairing only the cells that changed."""
+    global planner, planner_grid, planner_params
+    if planner is None or grid is planner_grid:
+        return
+    if params != planner_params:
+        # The map window moved, so grid cells no longer line up with the
+        # search tree; restart the search for the same goal in the new window
+        goal_rc = world_to_grid(goal_xy[0], goal_xy[1], params)
+        if not in_bounds(grid, goal_rc[0], goal_rc[1]):
+            planner = None
+            return
+        start_planner(grid, params, robot_rc, goal_rc)
+        return
+    planner.update_grid(grid)
+    planner_grid = grid
+
+def get_path_corridor(grid, params):
+    global path_corridor, corridor_params
+    if params != corridor_params:
+        path_rc = [world_to_grid(x, y, params) for x, y in current_path_xy]
+        kernel = disk_kernel(CORRIDOR_MARGIN, params["resolution"])
+        path_corridor = corridor_mask(grid.shape, path_rc, kernel)
+        corridor_params = params
+    return path_corridor
+
+def publish_path(grid, path_rc, params):
+    global current_path, current_path_xy, corridor_params, need_new_path
+    # Keep only the waypoints where the robot has to turn
+    path_rc = shortcut_path(grid, path_rc)
+    path_xy = [grid_to_world(r, c, params) for r, c in path_rc]
+
+    msg = {
+        "path_rc": path_rc,
+        "path_xy": path_xy
+    }
+    client.publish(MQTT_TOPIC_PATH_PLAN, json.dumps(msg))
+    current_path = path_rc
+    current_path_xy = path_xy
+    corridor_params = None
+    need_new_path = False
+    print(f"[node_pathplanning.py] Published path with {len(path_rc)} waypoints.")
 
 # -----------------------------------------------------------------------------
 # Main Loop
 # -----------------------------------------------------------------------------
 def main():
     global occupancy_grid, grid_params
-    global need_new_path, current_path
+    global need_new_path, current_path, planner
     global robot_x, robot_y, robot_th_deg
 
     plan_rate = 0.2  # 5Hz
@@ -203,28 +229,41 @@ def main():
 
         if occupancy_grid is None:
             continue
+        grid, params = occupancy_grid, grid_params
 
         # Convert robot pose to grid
-        rr, cc = world_to_grid(robot_x, robot_y, grid_params)
-        if not in_bounds(occupancy_grid, rr, cc):
+        rr, cc = world_to_grid(robot_x, robot_y, params)
+        if not in_bounds(grid, rr, cc):
             print("[node_pathplanning.py] Robot out of bounds in grid!")
             continue
 
-        # Check if path is obstructed
+        if need_new_path:
+            planner = None
+        sync_planner(grid, params, (rr, cc))
+
+        # Check if anything is in the way of the segments the robot drives
         if current_path is not None:
-            for i, (r, c) in enumerate(current_path):
-                if not is_free(occupancy_grid, r, c):
-                    print(f"[node_pathplanning.py] Path obstructed at idx={i}, re-planning...")
-                    need_new_path = True
-                    current_path = None
-                    break
+            blocked = get_path_corridor(grid, params) & (grid != 1)
+            if blocked.any():
+                print(f"[node_pathplanning.py] Path obstructed at {int(blocked.sum())} cells, repairing...")
+                current_path = None
+
+            # Repair the path to the same goal; only pick a new goal if it is unreachable
+            if current_path is None and planner is not None:
+                planner.move_start((rr, cc))
+                path_rc = planner.plan()
+                if path_rc is not None:
+                    print(f"[node_pathplanning.py] Repaired path ({planner.expansions} expansions so far)")
+                    publish_path(grid, path_rc, params)
+                else:
+                    planner = None
 
         if need_new_path or current_path is None:
             print("[node_pathplanning.py] Planning a new path...")
 
             # Try a random heading or just use robot heading
             path_rc = pick_random_free_cell_in_front(
-                occupancy_grid, grid_params,
+                grid, params,
                 rr, cc,
                 robot_x, robot_y, robot_th_deg,
                 distance_m=1.0,
@@ -234,17 +273,8 @@ def main():
             )
 
             if path_rc is not None:
-                path_rc = simplify_path(path_rc, 4)
-                path_xy = [grid_to_world(r, c, grid_params) for r, c in path_rc]
-
-                msg = {
-                    "path_rc": path_rc,
-                    "path_xy": path_xy
-                }
-                client.publish(MQTT_TOPIC_PATH_PLAN, json.dumps(msg))
-                current_path = path_rc
-                need_new_path = False
-                print(f"[node_pathplanning.py] Published path with {len(path_rc)} waypoints.")
+                start_planner(grid, params, (rr, cc), path_rc[-1])
+                publish_path(grid, path_rc, params)
             else:
                 print("[node_pathplanning.py] No valid path found in front. Will try again...")
 
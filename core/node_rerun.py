@@ -12,6 +12,8 @@ import paho.mqtt.client as mqtt
 import matplotlib
 import rerun as rr
 
+from lib import grid_codec
+
 # Import math for trigonometric functions
 import math
 
@@ -27,6 +29,7 @@ rr.connect_tcp("192.168.2.24:9876")       # Connect to Rerun Viewer over TCP
 MQTT_BROKER = "localhost"
 MQTT_PORT = 1883
 MQTT_TOPIC = "robot/tof_map"         # Subscribe to the map data topic
+POINTS_TOPIC = "robot/tof_points"     # Subscribe to the raw ToF points
 PATH_PLAN_TOPIC = "robot/local_path"  # Subscribe to the path plan topic
 ODOMETRY_TOPIC = "robot/odometry"     # Subscribe to the odometry data
 
@@ -47,6 +50,7 @@ robot_color     = np.array([[1.0, 0.0, 0.0, 0.4]])# RGBA: red, semi-transparent
 # -----------------------------------------------------------------------------
 robot_path = []  # List to store robot positions over time
 robot_pose = {'x': 0.0, 'y': 0.0, 'theta': 0.0}  # Robot's current pose
+grid_assembler = grid_codec.GridAssembler()  # Rebuilds the grid from tile-delta messages
 
 # -----------------------------------------------------------------------------
 # MQTT Callbacks
@@ -55,23 +59,21 @@ def on_connect(client, userdata, flags, reason_code, properties=None):
     print(f"Connected with reason code: {reason_code}")
     client.subscribe([
         (MQTT_TOPIC, 0),
+        (POINTS_TOPIC, 0),
         (PATH_PLAN_TOPIC, 0),
         (ODOMETRY_TOPIC, 0),  # Subscribe to the odometry topic
     ])
 
 def on_message(client, userdata, msg):
     try:
-        if msg.topic == MQTT_TOPIC:
-            data = json.loads(msg.payload)
-            
+        if msg.topic == POINTS_TOPIC:
             # Process each sensor's data
-            for sensor_data in data["sensors"]:
+            for sensor_data in grid_codec.decode_points(msg.payload):
                 sensor_addr = sensor_data["sensor_address"]
                 
                 # Process valid points
-                valid_points = sensor_data["valid_points"]
-                if valid_points:
-                    points_np = np.array(valid_points)
+                points_np = sensor_data["valid_points"]
+                if len(points_np):
                     d_m = np.linalg.norm(points_np, axis=1)  # distances in meters
                     colors = cmap(norm(d_m))
                     radii = np.full(points_np.shape[0], 0.05)
@@ -84,9 +86,8 @@ def on_message(client, userdata, msg):
                     )
                 
                 # Process invalid points
-                invalid_points = sensor_data["invalid_points"]
-                if invalid_points:
-                    points_np = np.array(invalid_points)
+                points_np = sensor_data["invalid_points"]
+                if len(points_np):
                     colors = np.full((points_np.shape[0], 4), [1.0, 1.0, 0.0, 0.5])  # Yellow, semi-transparent
                     radii = np.full(points_np.shape[0], 0.05)
                     
@@ -97,10 +98,11 @@ def on_message(client, userdata, msg):
                         timeless=False,
                     )
 
+        elif msg.topic == MQTT_TOPIC:
             # Add occupancy grid visualization
-            if "occupancy_grid" in data:
-                grid_info = data["occupancy_grid"]
-                grid = np.array(grid_info["data"])
+            decoded = grid_assembler.update(msg.payload)
+            if decoded is not None:
+                grid, grid_info = decoded
                 resolution = grid_info["resolution"]
                 min_x = grid_info["min_x"]
                 min_y = grid_info["min_y"]
@@ -109,17 +111,14 @@ def on_message(client, userdata, msg):
                 occupied_indices = np.argwhere(grid == 0)
                 
                 if occupied_indices.size > 0:
-                    # Convert grid indices to robot-local coordinates
+                    # Convert grid indices to world coordinates (the map is world-frame)
                     # Grid indices: row (y), col (x)
-                    local_x = occupied_indices[:, 1] * resolution + min_x + (resolution / 2)
-                    local_y = occupied_indices[:, 0] * resolution + min_y + (resolution / 2)
-                    local_z = np.full_like(local_x, 0.1)  # Points at 0.1m height
+                    world_x = occupied_indices[:, 1] * resolution + min_x + (resolution / 2)
+                    world_y = occupied_indices[:, 0] * resolution + min_y + (resolution / 2)
+                    world_z = np.full_like(world_x, 0.1)  # Points at 0.1m height
                     
                     # Stack into Nx3 array
-                    local_points = np.column_stack((local_x, local_y, local_z))
-                    
-                    # Transform points to world coordinates
-                    world_points = transform_robot_to_world(local_points, robot_pose)
+                    world_points = np.column_stack((world_x, world_y, world_z))
                     
                     colors = np.full((len(world_points), 4), [0.2, 0.2, 0.2, 1.0])  # Dark gray, fully opaque
                     radii = np.full(len(world_points), resolution / 2)  # Half the cell size
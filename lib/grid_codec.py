@@ -0,0 +1,293 @@
+"""
+Compact wire format for occupancy grids and ToF point clouds.
+
+node_map.py publishes the occupancy grid on robot/tof_map and the per-sensor
+points on robot/tof_points. Both used to be nested JSON lists; this module
+packs them into small binary messages instead. A JSON encoding is kept for
+debugging (e.g. `mosquitto_sub -t robot/tof_map`), and decode_grid() accepts
+either format so consumers don't need to know which one the mapper uses.
+
+Grid message layout (little endian):
+    header   GRID_HEADER (magic, version, encoding, height, width,
+             resolution, min_x, min_y)
+    body     ENCODING_RAW:  height*width uint8 cells
+             ENCODING_BITS: np.packbits(cells != 0)
+             ENCODING_RLE:  uint32 run count, uint8 run values, uint32 run lengths
+
+Between full grids the mapper only sends the tiles that changed:
+    header   TILES_HEADER (magic, version, tile_size, tile count, height,
+             width, resolution, min_x, min_y)
+    body     uint8 tile rows, uint8 tile cols, np.packbits(cells != 0) per tile
+
+GridAssembler applies both kinds of message to rebuild the full grid.
+"""
+
+import json
+import struct
+import numpy as np
+
+GRID_MAGIC = b"OG"
+TILES_MAGIC = b"OT"
+POINTS_MAGIC = b"TP"
+VERSION = 1
+
+ENCODING_RAW = 0
+ENCODING_RLE = 1
+ENCODING_BITS = 2
+ENCODING_AUTO = "auto"
+ENCODING_JSON = "json"
+
+GRID_HEADER = struct.Struct("<2sBBHHfff")
+TILES_HEADER = struct.Struct("<2sBBHHHfff")
+RUN_COUNT = struct.Struct("<I")
+POINTS_HEADER = struct.Struct("<2sBB")
+SENSOR_HEADER = struct.Struct("<BBHH")
+
+
+def grid_params(height, width, resolution, min_x, min_y):
+    """Build the grid_params dict used by the planner and visualiser."""
+    return {
+        "height":     height,
+        "width":      width,
+        "resolution": resolution,
+        "min_x":      min_x,
+        "max_x":      min_x + width * resolution,
+        "min_y":      min_y,
+        "max_y":      min_y + height * resolution,
+    }
+
+# -----------------------------------------------------------------------------
+# Run-length helpers
+# -----------------------------------------------------------------------------
+def rle_encode(flat):
+    """Return (values, lengths) of the runs in a 1D uint8 array."""
+    if flat.size == 0:
+        return np.zeros(0, dtype=np.uint8), np.zeros(0, dtype=np.uint32)
+    starts = np.flatnonzero(np.diff(flat)) + 1
+    starts = np.concatenate(([0], starts))
+    lengths = np.diff(np.concatenate((starts, [flat.size])))
+    return flat[starts].astype(np.uint8), lengths.astype(np.uint32)
+
+
+def rle_decode(values, lengths):
+    return np.repeat(values, lengths)
+
+# -----------------------------------------------------------------------------
+# Occupancy grid
+# -----------------------------------------------------------------------------
+def encode_grid(grid, resolution, min_x, min_y, encoding=ENCODING_AUTO):
+    """
+    Serialise a 2D uint8 occupancy grid.
+
+    encoding is one of ENCODING_RAW, ENCODING_RLE, ENCODING_BITS,
+    ENCODING_AUTO (smallest of RLE and bit-packing) or ENCODING_JSON.
+    Bit-packing only preserves zero / non-zero, which is all the planner
+    needs (1 free, 0 occupied).
+    """
+    grid = np.ascontiguousarray(grid, dtype=np.uint8)
+    height, width = grid.shape
+
+    if encoding == ENCODING_JSON:
+        params = grid_params(height, width, resolution, min_x, min_y)
+        params["data"] = grid.tolist()
+        return json.dumps({"occupancy_grid": params}).encode()
+
+    flat = grid.ravel()
+    if encoding == ENCODING_AUTO:
+        values, lengths = rle_encode(flat)
+        rle_size = RUN_COUNT.size + values.size * 5
+        bits_size = (flat.size + 7) // 8
+        binary = flat.max(initial=0) <= 1
+        if binary and bits_size < rle_size:
+            encoding = ENCODING_BITS
+        else:
+            encoding = ENCODING_RLE
+
+    if encoding == ENCODING_RAW:
+        body = flat.tobytes()
+    elif encoding == ENCODING_BITS:
+        body = np.packbits(flat != 0).tobytes()
+    elif encoding == ENCODING_RLE:
+        values, lengths = rle_encode(flat)
+        body = RUN_COUNT.pack(values.size) + values.tobytes() + lengths.tobytes()
+    else:
+        raise ValueError(f"Unknown grid encoding: {encoding}")
+
+    header = GRID_HEADER.pack(GRID_MAGIC, VERSION, encoding, height, width,
+                              resolution, min_x, min_y)
+    return header + body
+
+
+def decode_grid(payload):
+    """
+    Parse a robot/tof_map payload (binary or JSON).
+
+    Returns (grid, params) where grid is a (height, width) uint8 array and
+    params is the dict produced by grid_params(), or None if the payload does
+    not contain a grid.
+    """
+    payload = bytes(payload)
+    if payload[:1] == b"{":
+        data = json.loads(payload)
+        if "occupancy_grid" not in data:
+            return None
+        info = data["occupancy_grid"]
+        grid = np.array(info["data"], dtype=np.uint8).reshape((info["height"], info["width"]))
+        return grid, grid_params(info["height"], info["width"], info["resolution"],
+                                 info["min_x"], info["min_y"])
+
+    magic, version, encoding, height, width, resolution, min_x, min_y = \
+        GRID_HEADER.unpack_from(payload)
+    if magic != GRID_MAGIC or version != VERSION:
+        raise ValueError(f"Not an occupancy grid message (magic={magic!r}, version={version})")
+
+    body = memoryview(payload)[GRID_HEADER.size:]
+    n_cells = height * width
+    if encoding == ENCODING_RAW:
+        flat = np.frombuffer(body, dtype=np.uint8, count=n_cells).copy()
+    elif encoding == ENCODING_BITS:
+        flat = np.unpackbits(np.frombuffer(body, dtype=np.uint8), count=n_cells)
+    elif encoding == ENCODING_RLE:
+        (n_runs,) = RUN_COUNT.unpack_from(body)
+        values = np.frombuffer(body, dtype=np.uint8, count=n_runs, offset=RUN_COUNT.size)
+        lengths = np.frombuffer(body, dtype=np.uint32, count=n_runs,
+                                offset=RUN_COUNT.size + n_runs)
+        flat = rle_decode(values, lengths)
+    else:
+        raise ValueError(f"Unknown grid encoding: {encoding}")
+
+    # Round the float32 header fields back to something printable
+    params = grid_params(height, width, round(resolution, 6), round(min_x, 6), round(min_y, 6))
+    return flat.reshape((height, width)), params
+
+# -----------------------------------------------------------------------------
+# Tile deltas
+# -----------------------------------------------------------------------------
+def changed_tiles(old_grid, new_grid, tile_size):
+    """(n, 2) array of the (tile_row, tile_col) whose cells differ."""
+    h, w = new_grid.shape
+    diff = (old_grid != new_grid).reshape(h // tile_size, tile_size, w // tile_size, tile_size)
+    return np.argwhere(diff.any(axis=(1, 3)))
+
+
+def encode_tiles(grid, tiles, tile_size, resolution, min_x, min_y):
+    """Serialise the given (tile_row, tile_col) tiles of grid, bit-packed."""
+    height, width = grid.shape
+    tiles = np.asarray(tiles, dtype=np.uint8).reshape(-1, 2)
+    blocks = grid.reshape(height // tile_size, tile_size, width // tile_size, tile_size)
+    cells = blocks[tiles[:, 0], :, tiles[:, 1], :]  # (n, tile_size, tile_size)
+    header = TILES_HEADER.pack(TILES_MAGIC, VERSION, tile_size, len(tiles), height, width,
+                               resolution, min_x, min_y)
+    return header + tiles[:, 0].tobytes() + tiles[:, 1].tobytes() + np.packbits(cells != 0).tobytes()
+
+
+class GridAssembler:
+    """
+    Rebuilds the occupancy grid from robot/tof_map messages.
+
+    update() takes any payload (full grid, tile delta or JSON) and returns
+    (grid, params), or None until a full grid matching the deltas has been
+    received. Each call returns a new array, so callers can hold on to
+    previous grids.
+    """
+
+    def __init__(self):
+        self.grid = None
+        self.params = None
+
+    def update(self, payload):
+        payload = bytes(payload)
+        if payload[:2] != TILES_MAGIC:
+            decoded = decode_grid(payload)
+            if decoded is not None:
+                self.grid, self.params = decoded
+            return decoded
+
+        (magic, version, tile_size, n_tiles, height, width,
+         resolution, min_x, min_y) = TILES_HEADER.unpack_from(payload)
+        if version != VERSION:
+            raise ValueError(f"Unsupported tile message version {version}")
+        params = grid_params(height, width, round(resolution, 6), round(min_x, 6), round(min_y, 6))
+        if self.params != params:
+            # Deltas for a grid we don't have (e.g. we just subscribed, or the
+            # window moved); wait for the next full grid
+            return None
+
+        offset = TILES_HEADER.size
+        rows = np.frombuffer(payload, dtype=np.uint8, count=n_tiles, offset=offset)
+        cols = np.frombuffer(payload, dtype=np.uint8, count=n_tiles, offset=offset + n_tiles)
+        bits = np.frombuffer(payload, dtype=np.uint8, offset=offset + 2 * n_tiles)
+        cells = np.unpackbits(bits, count=n_tiles * tile_size * tile_size)
+
+        grid = self.grid.copy()
+        blocks = grid.reshape(height // tile_size, tile_size, width // tile_size, tile_size)
+        blocks[rows, :, cols, :] = cells.reshape(n_tiles, tile_size, tile_size)
+        self.grid = grid
+        return grid, self.params
+
+# -----------------------------------------------------------------------------
+# ToF points (for visualisation)
+# -----------------------------------------------------------------------------
+def encode_points(sensors, encoding=None):
+    """
+    Serialise per-sensor point clouds.
+
+    sensors is a list of dicts with "sensor_address" (int), "sensor_index",
+    "valid_points" and "invalid_points" (Nx3 arrays). Points are sent as
+    float32.
+    """
+    if encoding == ENCODING_JSON:
+        return json.dumps({"sensors": [{
+            "sensor_address": hex(s["sensor_address"]),
+            "sensor_index": s["sensor_index"],
+            "valid_points": np.asarray(s["valid_points"]).tolist(),
+            "invalid_points": np.asarray(s["invalid_points"]).tolist(),
+        } for s in sensors]}).encode()
+
+    parts = [POINTS_HEADER.pack(POINTS_MAGIC, VERSION, len(sensors))]
+    for s in sensors:
+        valid = np.asarray(s["valid_points"], dtype=np.float32).reshape(-1, 3)
+        invalid = np.asarray(s["invalid_points"], dtype=np.float32).reshape(-1, 3)
+        parts.append(SENSOR_HEADER.pack(s["sensor_address"], s["sensor_index"],
+                                        len(valid), len(invalid)))
+        parts.append(valid.tobytes())
+        parts.append(invalid.tobytes())
+    return b"".join(parts)
+
+
+def decode_points(payload):
+    """
+    Parse a robot/tof_points payload (binary or JSON).
+
+    Returns a list of dicts with "sensor_address" (hex string, as in the
+    JSON format), "sensor_index", "valid_points" and "invalid_points" (Nx3
+    float arrays).
+    """
+    payload = bytes(payload)
+    if payload[:1] == b"{":
+        sensors = json.loads(payload).get("sensors", [])
+        for s in sensors:
+            s["valid_points"] = np.array(s["valid_points"], dtype=np.float32).reshape(-1, 3)
+            s["invalid_points"] = np.array(s["invalid_points"], dtype=np.float32).reshape(-1, 3)
+        return sensors
+
+    magic, version, n_sensors = POINTS_HEADER.unpack_from(payload)
+    if magic != POINTS_MAGIC or version != VERSION:
+        raise ValueError(f"Not a ToF points message (magic={magic!r}, version={version})")
+
+    sensors = []
+    offset = POINTS_HEADER.size
+    for _ in range(n_sensors):
+        address, index, n_valid, n_invalid = SENSOR_HEADER.unpack_from(payload, offset)
+        offset += SENSOR_HEADER.size
+        valid = np.frombuffer(payload, dtype=np.float32, count=n_valid * 3, offset=offset)
+        offset += valid.nbytes
+        invalid = np.frombuffer(payload, dtype=np.float32, count=n_invalid * 3, offset=offset)
+        offset += invalid.nbytes
+        sensors.append({
+            "sensor_address": hex(address),
+            "sensor_index": index,
+            "valid_points": valid.reshape(-1, 3),
+            "invalid_points": invalid.reshape(-1, 3),
+        })
+    return sensors
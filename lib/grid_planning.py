@@ -0,0 +1,558 @@
+"""
+Path planning on occupancy grids (1 free, 0 occupied), 8-connected with unit
+cost for straight moves and sqrt(2) for diagonal moves.
+
+Cells are addressed by flat indices (row * width + col) internally; the
+public methods take and return (row, col) tuples like node_pathplanning.py.
+
+GridAStar is for one-off searches (is this goal reachable?), DStarLite keeps
+its search between calls and is used to repair the path to a fixed goal as
+the map changes.
+"""
+
+import math
+import numpy as np
+from heapq import heappush, heappop
+
+from lib.occupancy_grid import dilate_mask
+
+INF = float('inf')
+SQRT2 = math.sqrt(2)
+DIAGONAL_SAVING = SQRT2 - 2
+# Added per goal index in GridAStar.best_goal, far below any real difference
+# between two path costs made of 1 and sqrt(2) steps
+GOAL_TIE_STEP = 1e-7
+
+# (d_row, d_col, cost) of the 8 neighbours
+NEIGHBOR_MOVES = [(-1, 0, 1.0), (1, 0, 1.0), (0, -1, 1.0), (0, 1, 1.0),
+                  (-1, -1, SQRT2), (-1, 1, SQRT2), (1, -1, SQRT2), (1, 1, SQRT2)]
+
+
+def line_cells(start_rc, end_rc):
+    """(rows, cols) of the cells on the straight line between two cells, both ends included."""
+    n_steps = max(abs(end_rc[0] - start_rc[0]), abs(end_rc[1] - start_rc[1]))
+    t = np.arange(n_steps + 1)
+    d = max(n_steps, 1)
+    rows = np.rint(start_rc[0] + (end_rc[0] - start_rc[0]) * t / d).astype(np.intp)
+    cols = np.rint(start_rc[1] + (end_rc[1] - start_rc[1]) * t / d).astype(np.intp)
+    return rows, cols
+
+
+def line_of_sight(grid, start_rc, end_rc):
+    """True if every cell on the straight line between two cells is free."""
+    rows, cols = line_cells(start_rc, end_rc)
+    return bool((grid[rows, cols] == 1).all())
+
+
+def visible_from(grid, origin_rc, targets_rc):
+    """
+    line_of_sight() from origin_rc to each of the (n, 2) targets_rc, as an
+    (n,) bool array. All lines are rasterised and checked in one go.
+    """
+    targets = np.asarray(targets_rc, dtype=np.intp).reshape(-1, 2)
+    if len(targets) == 0:
+        return np.zeros(0, dtype=bool)
+    delta = targets - np.asarray(origin_rc, dtype=np.intp)
+    n_steps = np.abs(delta).max(axis=1)
+    n_cells = n_steps + 1
+    starts = np.cumsum(n_cells) - n_cells
+
+    line = np.repeat(np.arange(len(targets)), n_cells)
+    t = np.arange(n_cells.sum()) - starts[line]
+    d = np.maximum(n_steps, 1)[line]
+    rows = np.rint(origin_rc[0] + delta[line, 0] * t / d).astype(np.intp)
+    cols = np.rint(origin_rc[1] + delta[line, 1] * t / d).astype(np.intp)
+    return np.logical_and.reduceat(grid[rows, cols] == 1, starts)
+
+
+def shortcut_path(grid, path_rc):
+    """
+    String-pull a grid path: from each kept waypoint, jump to the furthest
+    later cell of the path that is in straight line of sight, and keep only
+    those. The result starts and ends like path_rc and every segment between
+    consecutive waypoints is free in grid.
+    """
+    if len(path_rc) <= 2:
+        return list(path_rc)
+    path = np.asarray(path_rc, dtype=np.intp)
+    waypoints = [path_rc[0]]
+    i = 0
+    while i < len(path) - 1:
+        visible = np.flatnonzero(visible_from(grid, path[i], path[i + 1:]))
+        # The next path cell is adjacent, so it's visible unless it is blocked
+        i += int(visible[-1]) + 1 if len(visible) else 1
+        waypoints.append(path_rc[i])
+    return waypoints
+
+
+def corridor_mask(shape, path_rc, kernel):
+    """
+    Boolean mask of the cells swept when driving straight between the
+    waypoints of path_rc, widened by kernel. Waypoints may lie outside the
+    grid; those cells are dropped.
+    """
+    h, w = shape
+    mask = np.zeros(shape, dtype=bool)
+    for a, b in zip(path_rc, path_rc[1:] or path_rc):
+        rows, cols = line_cells(a, b)
+        inside = (rows >= 0) & (rows < h) & (cols >= 0) & (cols < w)
+        mask[rows[inside], cols[inside]] = True
+    return dilate_mask(mask, kernel)
+
+
+def _update_free(free, free_mask, new_mask):
+    """
+    Bring the list free, a copy of free_mask, in line with new_mask,
+    touching only the cells that differ.
+    """
+    changed = np.flatnonzero(new_mask.ravel() != free_mask.ravel())
+    if len(changed) > len(free) // 4:
+        free[:] = new_mask.ravel().tolist()  # Mostly new, a full copy is faster
+    else:
+        for v in changed.tolist():
+            free[v] = not free[v]
+
+
+class GridAStar:
+    """
+    A* over flat cell indices, with search buffers reused across calls.
+
+    The grid is copied into a free-cell mask with a one cell blocked border,
+    so neighbours are plain index offsets and never need a bounds check.
+    The search reads a list copy of that mask, which is kept between calls
+    and only updated at the cells that changed since the last grid.
+    g-scores, parents and the open/closed state live in flat buffers that
+    are allocated once per grid shape. Instead of clearing them before every
+    search, each search gets a new id, and a cell's g-score is only trusted
+    when its stamp matches that id.
+
+    The buffers are Python lists rather than NumPy arrays because the search
+    reads them one element at a time, and element access on lists is several
+    times faster than on NumPy arrays.
+
+    cost_field() runs a Dijkstra expansion from one cell using the same
+    buffers, so many candidate goals can be scored with a single search.
+    best_goal() scores a known set of goals with a single A* search that
+    stops as soon as the best of them is certain.
+    """
+
+    def __init__(self):
+        self.shape = None
+        self.field_id = None
+
+    def _allocate(self, shape):
+        height, width = shape
+        self.shape = shape
+        self.stride = width + 2
+        n_cells = (height + 2) * self.stride
+        self.free_mask = np.zeros((height + 2, width + 2), dtype=bool)
+        self.next_mask = np.zeros((height + 2, width + 2), dtype=bool)
+        self.free = [False] * n_cells  # List copy of free_mask
+        self.g = [INF] * n_cells
+        self.parent = [-1] * n_cells
+        self.stamp = [0] * n_cells  # search_id: open, search_id + 1: closed
+        self.search_id = 0
+        self.moves = [(dr * self.stride + dc, cost) for dr, dc, cost in NEIGHBOR_MOVES]
+        self.expansions = 0
+
+    def _prepare(self, grid):
+        """Load grid into the free-cell mask and list and start a new search id."""
+        if grid.shape != self.shape:
+            self._allocate(grid.shape)
+        np.equal(grid, 1, out=self.next_mask[1:-1, 1:-1])
+        _update_free(self.free, self.free_mask, self.next_mask)
+        self.free_mask, self.next_mask = self.next_mask, self.free_mask
+        self.search_id += 2
+        return self.free
+
+    def _index(self, rc):
+        return (rc[0] + 1) * self.stride + rc[1] + 1
+
+    def _path_to(self, goal):
+        path = []
+        u = goal
+        while u != -1:
+            r, c = divmod(u, self.stride)
+            path.append((r - 1, c - 1))
+            u = self.parent[u]
+        path.reverse()
+        return path
+
+    def search(self, grid, start_rc, goal_rc):
+        """Shortest path from start_rc to goal_rc as (row, col) tuples, or None."""
+        free = self._prepare(grid)
+        stride = self.stride
+        start = self._index(start_rc)
+        goal = self._index(goal_rc)
+        if not free[start] or not free[goal]:
+            return None
+
+        opened = self.search_id
+        closed = opened + 1
+        g = self.g
+        parent = self.parent
+        stamp = self.stamp
+        moves = self.moves
+        goal_r, goal_c = divmod(goal, stride)
+
+        g[start] = 0.0
+        parent[start] = -1
+        stamp[start] = opened
+        frontier = [(0.0, start)]
+        expansions = 0
+        while frontier:
+            _, u = heappop(frontier)
+            if stamp[u] == closed:
+                continue
+            if u == goal:
+                break
+            stamp[u] = closed
+            expansions += 1
+
+            g_u = g[u]
+            for offset, cost in moves:
+                v = u + offset
+                if not free[v] or stamp[v] == closed:
+                    continue
+                g_v = g_u + cost
+                if stamp[v] != opened or g_v < g[v]:
+                    g[v] = g_v
+                    parent[v] = u
+                    stamp[v] = opened
+                    # Octile distance: exact on an empty 8-connected grid
+                    r, c = divmod(v, stride)
+                    dr = abs(r - goal_r)
+                    dc = abs(c - goal_c)
+                    h = dr + dc + DIAGONAL_SAVING * (dr if dr < dc else dc)
+                    heappush(frontier, (g_v + h, v))
+        else:
+            self.expansions = expansions
+            return None
+        self.expansions = expansions
+        return self._path_to(goal)
+
+    def cost_field(self, grid, start_rc, max_cost=INF):
+        """
+        Dijkstra expansion from start_rc, stopping at path cost max_cost
+        (in cells). Returns a (height, width) float32 array of path costs
+        from start_rc, inf where a cell is blocked, unreachable or beyond
+        max_cost. path_to() then returns the path to any reached cell.
+        """
+        height, width = grid.shape
+        field = np.full((height + 2) * (width + 2), np.inf, dtype=np.float32)
+        free = self._prepare(grid)
+        start = self._index(start_rc)
+        self.field_id = self.search_id
+        if not free[start]:
+            self.expansions = 0
+            return field.reshape(height + 2, width + 2)[1:-1, 1:-1]
+
+        opened = self.search_id
+        closed = opened + 1
+        g = self.g
+        parent = self.parent
+        stamp = self.stamp
+        moves = self.moves
+
+        g[start] = 0.0
+        parent[start] = -1
+        stamp[start] = opened
+        frontier = [(0.0, start)]
+        reached = []
+        while frontier:
+            g_u, u = heappop(frontier)
+            if stamp[u] == closed:
+                continue
+            if g_u > max_cost:
+                break
+            stamp[u] = closed
+            reached.append(u)
+
+            for offset, cost in moves:
+                v = u + offset
+                if not free[v] or stamp[v] == closed:
+                    continue
+                g_v = g_u + cost
+                if stamp[v] != opened or g_v < g[v]:
+                    g[v] = g_v
+                    parent[v] = u
+                    stamp[v] = opened
+                    heappush(frontier, (g_v, v))
+        self.expansions = len(reached)
+
+        field[reached] = [g[u] for u in reached]
+        return field.reshape(height + 2, width + 2)[1:-1, 1:-1]
+
+    def best_goal(self, grid, start_rc, goals_rc, max_cost=INF):
+        """
+        Index of the goal in goals_rc with the smallest detour, i.e. path
+        cost from start_rc minus the octile distance (the path cost on an
+        empty grid). Equal detours go to the earliest goal. Returns None if
+        no goal is reachable within max_cost. path_to() then returns the
+        path to the chosen goal.
+
+        This is one A* search towards all goals at once: reaching goal i
+        costs its path cost plus a fixed extra, largest octile distance
+        minus its own plus i * GOAL_TIE_STEP, so the cheapest total is the
+        answer. The heuristic is the smallest octile distance plus extra over
+        the goals, and the search stops once nothing left can beat the best
+        total found.
+        """
+        free = self._prepare(grid)
+        stride = self.stride
+        start = self._index(start_rc)
+        self.field_id = self.search_id
+        self.expansions = 0
+        if not free[start]:
+            return None
+
+        start_r, start_c = divmod(start, stride)
+        targets = {}  # cell -> (extra, goal index), the cheapest goal of each cell
+        octiles = []
+        for r, c in goals_rc:
+            dr = abs(r + 1 - start_r)
+            dc = abs(c + 1 - start_c)
+            octiles.append(dr + dc + DIAGONAL_SAVING * (dr if dr < dc else dc))
+        if not octiles:
+            return None
+        longest = max(octiles)
+        for i, (rc, octile) in enumerate(zip(goals_rc, octiles)):
+            goal = self._index(rc)
+            if free[goal] and goal not in targets:
+                targets[goal] = (longest - octile + i * GOAL_TIE_STEP, i)
+        if not targets:
+            return None
+        heuristic_targets = [(*divmod(goal, stride), extra) for goal, (extra, _) in targets.items()]
+
+        # The heuristic over the bounding box of start and goals, where nearly
+        # all expansions happen, in one go; cells outside fall back to a loop
+        goal_r, goal_c, goal_extra = (np.array(column) for column in zip(*heuristic_targets))
+        top = min(start_r, goal_r.min()) - 1
+        left = min(start_c, goal_c.min()) - 1
+        bottom = max(start_r, goal_r.max()) + 1
+        right = max(start_c, goal_c.max()) + 1
+        dr = np.abs(np.arange(top, bottom + 1)[:, None, None] - goal_r)
+        dc = np.abs(np.arange(left, right + 1)[None, :, None] - goal_c)
+        h_box = (dr + dc + DIAGONAL_SAVING * np.minimum(dr, dc) + goal_extra).min(axis=2).tolist()
+
+        def heuristic(v):
+            r, c = divmod(v, stride)
+            if top <= r <= bottom and left <= c <= right:
+                return h_box[r - top][c - left]
+            h = INF
+            for goal_r, goal_c, extra in heuristic_targets:
+                dr = r - goal_r if r > goal_r else goal_r - r
+                dc = c - goal_c if c > goal_c else goal_c - c
+                h_goal = dr + dc + DIAGONAL_SAVING * (dr if dr < dc else dc) + extra
+                if h_goal < h:
+                    h = h_goal
+            return h
+
+        opened = self.search_id
+        closed = opened + 1
+        g = self.g
+        parent = self.parent
+        stamp = self.stamp
+        moves = self.moves
+
+        g[start] = 0.0
+        parent[start] = -1
+        stamp[start] = opened
+        # Ties in f go to the deeper cell, so the search runs straight to a goal
+        frontier = [(heuristic(start), -0.0, start)]
+        best_total = INF
+        best = None
+        expansions = 0
+        while frontier:
+            f, neg_g, u = heappop(frontier)
+            if stamp[u] == closed:
+                continue
+            if f >= best_total:
+                break
+            stamp[u] = closed
+            expansions += 1
+
+            g_u = -neg_g
+            if u in targets:
+                extra, i = targets[u]
+                if g_u + extra < best_total:
+                    best_total = g_u + extra
+                    best = i
+
+            for offset, cost in moves:
+                v = u + offset
+                if not free[v] or stamp[v] == closed:
+                    continue
+                g_v = g_u + cost
+                if g_v <= max_cost and (stamp[v] != opened or g_v < g[v]):
+                    g[v] = g_v
+                    parent[v] = u
+                    stamp[v] = opened
+                    heappush(frontier, (g_v + heuristic(v), -g_v, v))
+        self.expansions = expansions
+        return best
+
+    def path_to(self, goal_rc):
+        """Path from the start of the last cost_field() / best_goal() call to goal_rc, None if not reached."""
+        goal = self._index(goal_rc)
+        if self.search_id != self.field_id or self.stamp[goal] != self.search_id + 1:
+            return None
+        return self._path_to(goal)
+
+
+class DStarLite:
+    """
+    Incremental planner (D* Lite, Koenig & Likhachev 2002).
+
+    The search runs backwards from the goal to the robot and its state (g,
+    rhs and the open list) is kept between calls. When the robot moves
+    (move_start) or cells change (update_grid) only the part of the search
+    tree affected by the change is repaired, instead of searching from
+    scratch.
+    """
+
+    def __init__(self, grid, start_rc, goal_rc):
+        self.height = self.width = None
+        self.reset(grid, start_rc, goal_rc)
+
+    def reset(self, grid, start_rc, goal_rc):
+        """
+        Start a new search, e.g. for a new goal or a moved map window. The
+        free-cell list is kept and only updated where grid differs from the
+        last one.
+        """
+        if grid.shape != (self.height, self.width):
+            self.height, self.width = grid.shape
+            self.free_mask = np.zeros(grid.size, dtype=bool)
+            self.free = [False] * grid.size
+        n_cells = self.height * self.width
+
+        free_mask = grid.ravel() == 1
+        _update_free(self.free, self.free_mask, free_mask)
+        self.free_mask = free_mask
+        self.g = [INF] * n_cells
+        self.rhs = [INF] * n_cells
+        self.open = []       # heap of (key, cell), may hold stale entries
+        self.open_keys = {}  # cell -> current key of the cells in the open list
+        self.km = 0.0
+        self.expansions = 0
+
+        self.start = self.index(start_rc)
+        self.goal = self.index(goal_rc)
+        self.rhs[self.goal] = 0.0
+        self._push(self.goal)
+
+    @property
+    def goal_rc(self):
+        return divmod(self.goal, self.width)
+
+    def index(self, rc):
+        return rc[0] * self.width + rc[1]
+
+    def _neighbors(self, u):
+        r, c = divmod(u, self.width)
+        for dr, dc, cost in NEIGHBOR_MOVES:
+            nr = r + dr
+            nc = c + dc
+            if 0 <= nr < self.height and 0 <= nc < self.width:
+                yield nr * self.width + nc, cost
+
+    def _heuristic(self, u):
+        r0, c0 = divmod(self.start, self.width)
+        r1, c1 = divmod(u, self.width)
+        return math.hypot(r1 - r0, c1 - c0)
+
+    def _key(self, u):
+        m = min(self.g[u], self.rhs[u])
+        # Rounded so that ties are not broken by float error in km
+        return (round(m + self._heuristic(u) + self.km, 9), m)
+
+    def _push(self, u):
+        key = self._key(u)
+        self.open_keys[u] = key
+        heappush(self.open, (key, u))
+
+    def _top(self):
+        # Drop entries that were re-keyed or removed since they were pushed
+        while self.open and self.open_keys.get(self.open[0][1]) != self.open[0][0]:
+            heappop(self.open)
+        return self.open[0] if self.open else None
+
+    def _update_vertex(self, u):
+        if u != self.goal:
+            best = INF
+            if self.free[u]:
+                for v, cost in self._neighbors(u):
+                    if self.free[v] and cost + self.g[v] < best:
+                        best = cost + self.g[v]
+            self.rhs[u] = best
+        self.open_keys.pop(u, None)
+        if self.g[u] != self.rhs[u]:
+            self._push(u)
+
+    def compute_shortest_path(self):
+        start = self.start
+        while True:
+            top = self._top()
+            if top is None:
+                break
+            k_old, u = top
+            if not (k_old < self._key(start) or self.rhs[start] != self.g[start]):
+                break
+
+            heappop(self.open)
+            del self.open_keys[u]
+            self.expansions += 1
+
+            k_new = self._key(u)
+            if k_old < k_new:
+                self._push(u)
+            elif self.g[u] > self.rhs[u]:
+                self.g[u] = self.rhs[u]
+                for v, _ in self._neighbors(u):
+                    self._update_vertex(v)
+            else:
+                self.g[u] = INF
+                self._update_vertex(u)
+                for v, _ in self._neighbors(u):
+                    self._update_vertex(v)
+
+    def move_start(self, start_rc):
+        """Tell the planner the robot is now at start_rc."""
+        new_start = self.index(start_rc)
+        self.km += self._heuristic(new_start)
+        self.start = new_start
+
+    def update_grid(self, grid):
+        """Apply a new grid, repairing only around the cells that changed. Returns the number of changed cells."""
+        free_mask = grid.ravel() == 1
+        changed = np.flatnonzero(free_mask != self.free_mask)
+        self.free_mask = free_mask
+        for v in changed.tolist():
+            self.free[v] = not self.free[v]
+        for v in changed.tolist():
+            self._update_vertex(v)
+            for u, _ in self._neighbors(v):
+                self._update_vertex(u)
+        return len(changed)
+
+    def plan(self):
+        """Return the current shortest path from start to goal as (row, col) tuples, or None."""
+        if not self.free[self.start] or not self.free[self.goal]:
+            return None
+        self.compute_shortest_path()
+        if self.g[self.start] == INF:
+            return None
+
+        path = [self.start]
+        u = self.start
+        while u != self.goal:
+            best, best_cost = None, INF
+            for v, cost in self._neighbors(u):
+                if self.free[v] and cost + self.g[v] < best_cost:
+                    best, best_cost = v, cost + self.g[v]
+            if best is None or len(path) > len(self.g):
+                return None
+            u = best
+            path.append(u)
+        return [divmod(u, self.width) for u in path]
@@ -3,22 +3,79 @@ import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
+import math
+import struct
 import numpy as np
 import matplotlib.pyplot as plt
 from lib.madgwickahrs import MadgwickAHRS, Quaternion
 
 import time
+import threading
 import board
 import adafruit_mpu6050
 
+# Accel, temperature and gyro output registers are contiguous, so one 14-byte
+# burst replaces the separate adafruit property reads (which also re-read the
+# range registers on every call)
+MPU6050_DATA_REGISTER = bytes([0x3B])
+MPU6050_DATA = struct.Struct(">hhhhhhh")  # ax, ay, az, temperature, gx, gy, gz
+ACCEL_LSB_PER_G = [16384, 8192, 4096, 2048]     # by adafruit_mpu6050.Range
+GYRO_LSB_PER_DPS = [131, 65.5, 32.8, 16.4]      # by adafruit_mpu6050.GyroRange
+
+# Register map for the FIFO (MPU-6000/6050 register map rev 4.2)
+MPU6050_SMPLRT_DIV = 0x19
+MPU6050_FIFO_EN = 0x23
+MPU6050_INT_STATUS = 0x3A
+MPU6050_USER_CTRL = 0x6A
+MPU6050_FIFO_COUNT = 0x72
+MPU6050_FIFO_R_W = 0x74
+FIFO_EN_ACCEL_GYRO = 0x78         # XG, YG, ZG and ACCEL into the FIFO
+USER_CTRL_FIFO_EN = 0x40
+USER_CTRL_FIFO_RESET = 0x04
+INT_STATUS_FIFO_OFLOW = 0x10
+FIFO_SIZE = 1024                  # bytes
+FIFO_SAMPLE_SIZE = 12             # ax, ay, az, gx, gy, gz as big endian int16
+FIFO_DTYPE = np.dtype('>i2')
+
+def orientation_from_quaternion(q):
+    """Pitch, roll and yaw in degrees (the robot's axes) from a (w, x, y, z) quaternion."""
+    gx, gy, gz = FilteredMPU6050._gravity(q)
+
+    # Map gravity vector components to new axes
+    gX_new = gy       # gX_new = gy
+    gY_new = -gx      # gY_new = -gx
+    gZ_new = gz       # gZ_new = gz
+
+    # Compute roll and pitch using the standard formulas
+    roll = math.degrees(math.atan2(gY_new, gZ_new))
+    pitch = math.degrees(math.atan2(-gX_new, math.sqrt(gY_new**2 + gZ_new**2)))
+
+    # Compute yaw from the quaternion
+    qw, qx, qy, qz = q
+    yaw = math.degrees(math.atan2(2 * (qw * qz + qx * qy),
+                                  1 - 2 * (qy**2 + qz**2)))
+
+    return pitch, roll, yaw
+
 class FilteredMPU6050():
     
-    def __init__(self):
+    def __init__(self, raw_diagnostics=True):
         self.sensor = adafruit_mpu6050.MPU6050(board.I2C())
         # self.sensor.gyro_range = adafruit_mpu6050.GyroRange.RANGE_500_DPS  # Set gyroscope range to ±1000 dps
         self.ahrs = MadgwickAHRS(beta=0.008, zeta=0.)
         self.alpha = 1  # LPF alpha: x[t] := a*x[t] + (1-a)*x[t-1]
         self.gyro_bias = np.array([0., 0., 0.])
+        # The *_RAW fields (unfiltered orientation from the accelerometer) are
+        # for debugging and cost more than the filter itself; turn them off
+        # for high-rate loops
+        self.raw_diagnostics = raw_diagnostics
+        self._data = bytearray(MPU6050_DATA.size)
+        self.update_scales()
+
+    def update_scales(self):
+        """Cache the LSB scales; call again after changing the sensor's ranges."""
+        self._accel_scale = adafruit_mpu6050.STANDARD_GRAVITY / ACCEL_LSB_PER_G[self.sensor.accelerometer_range]
+        self._gyro_scale = math.radians(1.0) / GYRO_LSB_PER_DPS[self.sensor.gyro_range]
 
     def calibrate(self):
         try:
@@ -34,35 +91,18 @@ class FilteredMPU6050():
             print('Calculated gyro bias:', self.gyro_bias)
             # Save the unmapped bias values
             np.savetxt('gyro_bias.txt', np.array([self.gyro_bias[1], -self.gyro_bias[0], self.gyro_bias[2]]))
+        self._gyro_bias = tuple(float(b) for b in self.gyro_bias)
 
-        self.accel, gyro_raw = self.read_sensor()
-        self.gyro = gyro_raw - self.gyro_bias
+        self._read_filtered()
         self.t = time.monotonic()
 
-        self.quat = self._calculate_initial_q(self.accel)
-        self.grav = self.quat_rotate(self.quat.conj(), [0, 0, 1])
-        self.ahrs.quaternion = self.quat
+        self.ahrs.quaternion = self._calculate_initial_q(self.accel)
+        self._publish_orientation()
 
 
     def get_orientation(self):
         self.update()
-        gx, gy, gz = self.grav
-
-        # Map gravity vector components to new axes
-        gX_new = gy       # gX_new = gy
-        gY_new = -gx      # gY_new = -gx
-        gZ_new = gz       # gZ_new = gz
-
-        # Compute roll and pitch using the standard formulas
-        roll = np.degrees(np.arctan2(gY_new, gZ_new))
-        pitch = np.degrees(np.arctan2(-gX_new, np.sqrt(gY_new**2 + gZ_new**2)))
-
-        # Compute yaw from the quaternion
-        qw, qx, qy, qz = self.quat
-        yaw = np.degrees(np.arctan2(2 * (qw * qz + qx * qy),
-                                    1 - 2 * (qy**2 + qz**2)))
-
-        return pitch, roll, yaw
+        return orientation_from_quaternion(self.ahrs.q)
 
     def _calculate_initial_q(self, accel):
         acc_norm = accel / np.linalg.norm(accel)
@@ -78,36 +118,65 @@ class FilteredMPU6050():
         initial_q = initial_q * Quaternion.from_angle_axis(initial_yaw, 0, 0, 1)
         return initial_q
 
+    def _read_mapped(self):
+        """One burst read, scaled and remapped to the robot axes, as plain floats."""
+        with self.sensor.i2c_device as i2c:
+            i2c.write_then_readinto(MPU6050_DATA_REGISTER, self._data)
+        ax, ay, az, _, gx, gy, gz = MPU6050_DATA.unpack(self._data)
+        a = self._accel_scale
+        g = self._gyro_scale
+        return (-ay * a, ax * a, az * a), (-gy * g, gx * g, gz * g)
+
     def read_sensor(self):
         # Read raw data from sensor
-        accel = np.array(self.sensor.acceleration)
-        gyro = np.array(self.sensor.gyro)
-        accel_mapped = np.array([-accel[1], accel[0], accel[2]])
-        gyro_mapped = np.array([-gyro[1], gyro[0], gyro[2]])
-        return accel_mapped, gyro_mapped
+        accel_mapped, gyro_mapped = self._read_mapped()
+        return np.array(accel_mapped), np.array(gyro_mapped)
+
+    def _read_filtered(self):
+        """
+        Read into self.accel and self.gyro (bias removed) as arrays, and
+        return the same values as float tuples for the filter.
+        """
+        accel, (gx, gy, gz) = self._read_mapped()
+        bx, by, bz = self._gyro_bias
+        gyro = (gx - bx, gy - by, gz - bz)
+        self.accel = np.array(accel)
+        self.gyro = np.array(gyro)
+        return accel, gyro
+
+    def _publish_orientation(self):
+        """Set self.quat and self.grav (arrays) from the filter's float quaternion."""
+        q = self.ahrs.q
+        self.quat = np.array(q)
+        self.grav = np.array(self._gravity(q))
 
+    @staticmethod
+    def _gravity(q):
+        """Gravity direction in the sensor frame, quat_rotate(q.conj(), [0, 0, 1]) for a unit q."""
+        qw, qx, qy, qz = q
+        return (2 * (qx * qz - qw * qy),
+                2 * (qy * qz + qw * qx),
+                1 - 2 * (qx * qx + qy * qy))
 
     def update(self):
         # Read and map sensor readings
-        self.accel, gyro_raw = self.read_sensor()
-        self.gyro = gyro_raw - self.gyro_bias
+        accel, gyro = self._read_filtered()
         t = time.monotonic()
 
         # Store raw data
-        self.accel_RAW = self.accel
-        self.gyro_RAW = self.gyro
-        self.quat_RAW = self._calculate_initial_q(self.accel_RAW)
-        self.grav_RAW = self.quat_rotate(self.quat_RAW.conj(), [0, 0, 1])
+        if self.raw_diagnostics:
+            self.accel_RAW = self.accel
+            self.gyro_RAW = self.gyro
+            self.quat_RAW = self._calculate_initial_q(self.accel_RAW)
+            self.grav_RAW = self.quat_rotate(self.quat_RAW.conj(), [0, 0, 1])
 
         # Filtering
         self.ahrs.samplePeriod = t - self.t
-        self.ahrs.update_imu(self.gyro, self.accel)
+        self.ahrs.update_imu(gyro, accel)
         self.t = t
 
         # Update orientation
-        quat = self.ahrs.quaternion
-        self.quat = quat.q
-        self.grav = self.quat_rotate(quat.conj(), [0, 0, 1])
+        self._publish_orientation()
 
 
     def quat_rotate(self, q, v):
@@ -115,6 +184,187 @@ class FilteredMPU6050():
         qv = np.concatenate(([0], v))
         return (q * Quaternion(qv) * q.conj()).q[1:]
     
+class MPU6050Sampler():
+    """
+    Samples a calibrated FilteredMPU6050 in a background thread.
+
+    The MPU6050 buffers accel + gyro samples in its FIFO at sample_rate. The
+    thread drains it in burst reads every poll_interval and runs every sample
+    through the Madgwick filter with the exact sensor sample period, so the
+    integration no longer depends on how often (or how evenly) anyone polls.
+
+    Don't call imu.update() / imu.get_orientation() while the sampler runs;
+    it owns imu.ahrs. Results go into a ring buffer of RING_COLUMNS rows. The thread fills the
+    rows first and publishes them by bumping self.count afterwards; readers
+    copy a row and retry if the writer may have wrapped around onto it in the
+    meantime, so neither side ever takes a lock.
+    """
+    RING_COLUMNS = ["time", "qw", "qx", "qy", "qz", "gx", "gy", "gz", "ax", "ay", "az"]
+
+    def __init__(self, imu, sample_rate=1000, poll_interval=0.005, buffer_size=4096):
+        self.imu = imu
+        self.sensor = imu.sensor
+        self.sample_rate = sample_rate
+        self.sample_period = 1.0 / sample_rate
+        self.poll_interval = poll_interval
+        self.buffer = np.zeros((buffer_size, len(self.RING_COLUMNS)))
+        self.count = 0              # rows ever written; the newest is count - 1
+        self.overflows = 0          # FIFO overruns (samples were lost)
+        self.reads = 0              # burst reads
+        self._max_batch = FIFO_SIZE // FIFO_SAMPLE_SIZE
+        self._fifo = bytearray(self._max_batch * FIFO_SAMPLE_SIZE)
+        self._status = bytearray(1)
+        self._fifo_count = bytearray(2)
+        self._quats = np.empty((self._max_batch, 4))
+        self._running = threading.Event()
+        self._thread = None
+
+    # ------------------------------------------------------------------------
+    # Registers
+    # ------------------------------------------------------------------------
+    def _write_register(self, register, value):
+        with self.sensor.i2c_device as i2c:
+            i2c.write(bytes([register, value]))
+
+    def _read_register(self, register, buf):
+        with self.sensor.i2c_device as i2c:
+            i2c.write_then_readinto(bytes([register]), buf)
+        return buf
+
+    def _configure_fifo(self):
+        # 184 Hz DLPF puts the gyro on the 1 kHz internal clock like the accel,
+        # so the sample rate is 1 kHz / (1 + SMPLRT_DIV)
+        self.sensor.filter_bandwidth = adafruit_mpu6050.Bandwidth.BAND_184_HZ
+        self._write_register(MPU6050_SMPLRT_DIV, round(1000 / self.sample_rate) - 1)
+        self._write_register(MPU6050_FIFO_EN, FIFO_EN_ACCEL_GYRO)
+        self._reset_fifo()
+
+    def _reset_fifo(self):
+        self._write_register(MPU6050_USER_CTRL, USER_CTRL_FIFO_RESET)
+        self._write_register(MPU6050_USER_CTRL, USER_CTRL_FIFO_EN)
+
+    def _stop_fifo(self):
+        self._write_register(MPU6050_USER_CTRL, 0)
+        self._write_register(MPU6050_FIFO_EN, 0)
+
+    # ------------------------------------------------------------------------
+    # Sampling thread
+    # ------------------------------------------------------------------------
+    def start(self):
+        self._configure_fifo()
+        self._running.set()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running.clear()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        self._stop_fifo()
+
+    def _run(self):
+        next_poll = time.monotonic()
+        while self._running.is_set():
+            try:
+                self.poll()
+            except OSError as e:
+                # I2C glitch; whatever was in the FIFO is no longer aligned
+                print(f"[imu.py] FIFO read failed: {e}")
+                self._reset_fifo()
+
+            next_poll += self.poll_interval
+            delay = next_poll - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_poll = time.monotonic()  # Overran, don't try to catch up
+
+    def poll(self):
+        """Drain the FIFO once and filter what was in it. Returns the number of samples."""
+        if self._read_register(MPU6050_INT_STATUS, self._status)[0] & INT_STATUS_FIFO_OFLOW:
+            # The FIFO wrapped and is no longer aligned to sample boundaries
+            self.overflows += 1
+            self._reset_fifo()
+            return 0
+
+        count = int.from_bytes(self._read_register(MPU6050_FIFO_COUNT, self._fifo_count), 'big')
+        n = min(count // FIFO_SAMPLE_SIZE, self._max_batch)
+        if n == 0:
+            return 0
+        fifo = memoryview(self._fifo)[:n * FIFO_SAMPLE_SIZE]
+        self._read_register(MPU6050_FIFO_R_W, fifo)
+        read_time = time.monotonic()
+        self.reads += 1
+        self._add_samples(np.frombuffer(fifo, dtype=FIFO_DTYPE).reshape(n, 6), read_time)
+        return n
+
+    def _add_samples(self, raw, read_time):
+        """Scale, remap, filter and publish n raw (ax, ay, az, gx, gy, gz) FIFO samples."""
+        n = len(raw)
+        imu = self.imu
+        # Same axis remap as FilteredMPU6050._read_mapped
+        accel = np.empty((n, 3))
+        accel[:, 0] = raw[:, 1] * -imu._accel_scale
+        accel[:, 1] = raw[:, 0] * imu._accel_scale
+        accel[:, 2] = raw[:, 2] * imu._accel_scale
+        gyro = np.empty((n, 3))
+        gyro[:, 0] = raw[:, 4] * -imu._gyro_scale
+        gyro[:, 1] = raw[:, 3] * imu._gyro_scale
+        gyro[:, 2] = raw[:, 5] * imu._gyro_scale
+        gyro -= imu.gyro_bias
+
+        quats = imu.ahrs.update_imu_batch(gyro, accel, self.sample_period, out=self._quats[:n])
+
+        # The newest sample was taken at most one period before the read;
+        # the rest are spaced by the sensor's sample period
+        rows = (self.count + np.arange(n)) % len(self.buffer)
+        block = np.empty((n, len(self.RING_COLUMNS)))
+        block[:, 0] = read_time - self.sample_period * np.arange(n - 1, -1, -1)
+        block[:, 1:5] = quats
+        block[:, 5:8] = gyro
+        block[:, 8:11] = accel
+        self.buffer[rows] = block
+        self.count += n  # publish
+
+    # ------------------------------------------------------------------------
+    # Readers (any thread)
+    # ------------------------------------------------------------------------
+    def latest(self):
+        """Copy of the newest RING_COLUMNS row, or None before the first sample."""
+        size = len(self.buffer)
+        while True:
+            count = self.count
+            if count == 0:
+                return None
+            row = self.buffer[(count - 1) % size].copy()
+            # The writer fills up to _max_batch rows past self.count before
+            # publishing them; only retry if that could have reached our row
+            if self.count + self._max_batch < count - 1 + size:
+                return row
+
+    def read_since(self, count):
+        """
+        Rows published after self.count was count, oldest first, and the
+        count to pass next time. At most the last buffer_size - 2 * _max_batch
+        rows, so a read only has to be retried if the writer published a
+        whole FIFO's worth of samples while it was copying.
+        """
+        size = len(self.buffer)
+        while True:
+            end = self.count
+            start = max(count, end - (size - 2 * self._max_batch))
+            rows = self.buffer[np.arange(start, end) % size]  # fancy indexing copies
+            if self.count + self._max_batch < start + size:
+                return rows, end
+
+    def get_orientation(self):
+        """Pitch, roll, yaw in degrees from the newest sample, as FilteredMPU6050.get_orientation."""
+        row = self.latest()
+        if row is None:
+            return None
+        return orientation_from_quaternion(tuple(row[1:5].tolist()))
+
 if __name__ == '__main__':
     imu = FilteredMPU6050()
     imu.calibrate()
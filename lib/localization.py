@@ -0,0 +1,157 @@
+"""
+Extended Kalman filter for the robot pose, fusing wheel encoders with the IMU gyro.
+
+State (see the STATE_* indices): x, y, theta (m, m, rad), linear and angular
+velocity v, w (m/s, rad/s), and the residual gyro-z bias b (rad/s) that the
+start-up calibration in lib/imu.py leaves behind or that drifts with
+temperature afterwards.
+
+Measurements:
+    v_encoder  = v          wheel speed average
+    w_encoder  = w          wheel speed difference / track width
+    w_imu      = w + b      FilteredMPU6050 gyro z
+
+Encoder w is wrong whenever a wheel slips, and slip lasts long enough that
+the filter would otherwise learn it as gyro bias. While the robot moves, an
+encoder w that disagrees with the filter's w (which follows the gyro) by
+more than gate_sigmas standard deviations is rejected for that step. When
+both encoder velocities are ~0 the robot can't be turning (a slipping wheel
+is turning), so encoder w is trusted tightly and b converges on the gyro's
+standstill reading. Any subset of the measurements can be passed to
+update(), e.g. the gyro alone when no new encoder sample has arrived.
+
+All matrices are preallocated. predict() and update() only run small NumPy
+matrix products, so a step costs a few tens of microseconds (see
+tests/benchmark_localization.py).
+"""
+
+import math
+import numpy as np
+
+STATE_X, STATE_Y, STATE_THETA, STATE_V, STATE_W, STATE_GYRO_BIAS = range(6)
+STATE_SIZE = 6
+
+# Measurement rows, in the order update() stacks them
+MEASUREMENT_H = np.array([
+    [0.0, 0.0, 0.0, 1.0, 0.0, 0.0],  # v_encoder
+    [0.0, 0.0, 0.0, 0.0, 1.0, 0.0],  # w_encoder
+    [0.0, 0.0, 0.0, 0.0, 1.0, 1.0],  # w_imu
+])
+
+
+def encoder_velocities(left_rpm, right_rpm, wheel_radius, wheel_base):
+    """Linear and angular velocity of a differential drive from its wheel speeds."""
+    left_speed = left_rpm / 60.0 * 2.0 * math.pi * wheel_radius
+    right_speed = right_rpm / 60.0 * 2.0 * math.pi * wheel_radius
+    return (right_speed + left_speed) / 2.0, (right_speed - left_speed) / wheel_base
+
+
+class RobotEKF:
+    def __init__(self, dt=0.02,
+                 accel_noise=0.5,          # m/s^2, random walk on v
+                 angular_accel_noise=0.5,  # rad/s^2, random walk on w
+                 gyro_bias_noise=1e-3,     # rad/s / sqrt(s), random walk on b
+                 v_encoder_std=0.02,       # m/s
+                 w_encoder_std=0.05,       # rad/s while moving
+                 w_stationary_std=0.001,   # rad/s when the wheels are stopped
+                 w_imu_std=0.01,           # rad/s
+                 stationary_threshold=0.01,  # m/s and rad/s
+                 gate_sigmas=3.0):
+        self.dt = dt
+        self.stationary_threshold = stationary_threshold
+        self.gate_sigmas = gate_sigmas
+        self.w_encoder_variance = w_encoder_std ** 2
+        self.rejected_w_encoder = 0  # slip detections, for diagnostics
+        self.process_noise = np.array([accel_noise, angular_accel_noise, gyro_bias_noise]) ** 2
+        moving_variance = np.array([v_encoder_std, w_encoder_std, w_imu_std]) ** 2
+        stationary_variance = np.array([v_encoder_std, w_stationary_std, w_imu_std]) ** 2
+
+        self.state = np.zeros(STATE_SIZE)
+        self.P = np.zeros((STATE_SIZE, STATE_SIZE))
+        self._F = np.eye(STATE_SIZE)
+        self._identity = np.eye(STATE_SIZE)
+
+        # H and R for every combination of measurements, so update() never builds them
+        self._models = {}
+        for mask in range(1, 8):
+            rows = [i for i in range(3) if mask & (1 << i)]
+            for stationary, variance in ((False, moving_variance), (True, stationary_variance)):
+                self._models[mask, stationary] = (rows, MEASUREMENT_H[rows], np.diag(variance[rows]))
+        self.reset()
+
+    def reset(self, x=0.0, y=0.0, theta=0.0):
+        """Restart at the given pose, keeping the gyro bias estimate."""
+        bias = self.state[STATE_GYRO_BIAS]
+        bias_variance = self.P[STATE_GYRO_BIAS, STATE_GYRO_BIAS] or 0.01 ** 2
+        self.state[:] = 0.0
+        self.state[[STATE_X, STATE_Y, STATE_THETA]] = x, y, theta
+        self.state[STATE_GYRO_BIAS] = bias
+        self.P[:] = 0.0
+        self.P[STATE_V, STATE_V] = 0.1 ** 2
+        self.P[STATE_W, STATE_W] = 0.1 ** 2
+        self.P[STATE_GYRO_BIAS, STATE_GYRO_BIAS] = bias_variance
+
+    def predict(self, dt=None):
+        """Advance the state by dt (default self.dt) at constant v and w."""
+        dt = self.dt if dt is None else dt
+        s = self.state
+        v, w = s[STATE_V], s[STATE_W]
+        heading = s[STATE_THETA] + 0.5 * w * dt
+        c = math.cos(heading)
+        si = math.sin(heading)
+
+        # Jacobian of the motion model (midpoint heading), only the non-identity entries
+        F = self._F
+        F[STATE_X, STATE_THETA] = -v * dt * si
+        F[STATE_X, STATE_V] = dt * c
+        F[STATE_X, STATE_W] = -0.5 * v * dt * dt * si
+        F[STATE_Y, STATE_THETA] = v * dt * c
+        F[STATE_Y, STATE_V] = dt * si
+        F[STATE_Y, STATE_W] = 0.5 * v * dt * dt * c
+        F[STATE_THETA, STATE_W] = dt
+
+        s[STATE_X] += v * dt * c
+        s[STATE_Y] += v * dt * si
+        s[STATE_THETA] = (s[STATE_THETA] + w * dt + math.pi) % (2 * math.pi) - math.pi
+
+        self.P = F @ self.P @ F.T
+        self.P[(STATE_V, STATE_W, STATE_GYRO_BIAS), (STATE_V, STATE_W, STATE_GYRO_BIAS)] += self.process_noise * dt
+
+    def update(self, v_encoder=None, w_encoder=None, w_imu=None):
+        """Correct the state with whichever measurements are given (None = not measured)."""
+        stationary = (v_encoder is not None and w_encoder is not None
+                      and abs(v_encoder) < self.stationary_threshold
+                      and abs(w_encoder) < self.stationary_threshold)
+        if w_encoder is not None and not stationary:
+            innovation = w_encoder - self.state[STATE_W]
+            if innovation ** 2 > self.gate_sigmas ** 2 * (self.P[STATE_W, STATE_W] + self.w_encoder_variance):
+                w_encoder = None
+                self.rejected_w_encoder += 1
+
+        mask = (v_encoder is not None) | (w_encoder is not None) << 1 | (w_imu is not None) << 2
+        if not mask:
+            return
+        rows, H, R = self._models[mask, stationary]
+        z = np.array((v_encoder, w_encoder, w_imu), dtype=float)[rows]
+
+        PHt = self.P @ H.T
+        S = H @ PHt + R
+        K = np.linalg.solve(S, PHt.T).T   # P H^T S^-1, S is symmetric
+        self.state += K @ (z - H @ self.state)
+        self.state[STATE_THETA] = (self.state[STATE_THETA] + math.pi) % (2 * math.pi) - math.pi
+
+        # Joseph form keeps P symmetric positive definite at float precision
+        A = self._identity - K @ H
+        self.P = A @ self.P @ A.T + K @ R @ K.T
+
+    def get_pose(self):
+        return tuple(self.state[[STATE_X, STATE_Y, STATE_THETA]])
+
+    def get_velocity(self):
+        return self.state[STATE_V], self.state[STATE_W]
+
+    def get_gyro_bias(self):
+        return self.state[STATE_GYRO_BIAS]
+
+    def get_pose_covariance(self):
+        return self.P[:3, :3]
@@ -16,6 +16,7 @@
     along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
+import math
 import warnings
 import numpy as np
 import numbers
@@ -148,9 +149,49 @@ class Quaternion:
     def __array__(self):
         return self._q
 
+def _imu_step(q0, q1, q2, q3, gx, gy, gz, ax, ay, az, beta, dt):
+    """
+    One Madgwick IMU step on plain floats, shared by update_imu() and
+    update_imu_batch(). Returns the new normalised quaternion (w, x, y, z).
+    """
+    # Normalise accelerometer measurement
+    a_norm = math.sqrt(ax*ax + ay*ay + az*az)
+    if a_norm == 0:
+        warnings.warn("accelerometer is zero")
+        return q0, q1, q2, q3
+    ax /= a_norm
+    ay /= a_norm
+    az /= a_norm
+
+    # Gradient descent algorithm corrective step: J^T f
+    f1 = 2*(q1*q3 - q0*q2) - ax
+    f2 = 2*(q0*q1 + q2*q3) - ay
+    f3 = 2*(0.5 - q1*q1 - q2*q2) - az
+    s0 = -2*q2*f1 + 2*q1*f2
+    s1 = 2*q3*f1 + 2*q0*f2 - 4*q1*f3
+    s2 = -2*q0*f1 + 2*q3*f2 - 4*q2*f3
+    s3 = 2*q1*f1 + 2*q2*f2
+    s_norm = math.sqrt(s0*s0 + s1*s1 + s2*s2 + s3*s3)
+    if s_norm > 0:  # zero when already aligned with gravity: no correction
+        s_norm = beta / s_norm  # normalise step magnitude
+
+    # Rate of change of quaternion: q * (0, gyro) / 2 - beta * step
+    qdot0 = 0.5*(-q1*gx - q2*gy - q3*gz) - s_norm*s0
+    qdot1 = 0.5*(q0*gx + q2*gz - q3*gy) - s_norm*s1
+    qdot2 = 0.5*(q0*gy - q1*gz + q3*gx) - s_norm*s2
+    qdot3 = 0.5*(q0*gz + q1*gy - q2*gx) - s_norm*s3
+
+    # Integrate to yield quaternion
+    q0 += qdot0 * dt
+    q1 += qdot1 * dt
+    q2 += qdot2 * dt
+    q3 += qdot3 * dt
+    q_norm = 1.0 / math.sqrt(q0*q0 + q1*q1 + q2*q2 + q3*q3)
+    return q0*q_norm, q1*q_norm, q2*q_norm, q3*q_norm
+
+
 class MadgwickAHRS:
     samplePeriod = 1/256
-    quaternion = Quaternion(1, 0, 0, 0)
     beta = 1
     zeta = 0
 
@@ -163,6 +204,9 @@ class MadgwickAHRS:
         :param beta: Algorithm gain zeta
         :return:
         """
+        # The orientation is kept as four floats (w, x, y, z) so update_imu()
+        # doesn't allocate; the quaternion property wraps them on demand
+        self.q = (1.0, 0.0, 0.0, 0.0)
         if sampleperiod is not None:
             self.samplePeriod = sampleperiod
         if quaternion is not None:
@@ -172,6 +216,15 @@ class MadgwickAHRS:
         if zeta is not None:
             self.zeta = zeta
 
+    @property
+    def quaternion(self):
+        return Quaternion(np.array(self.q))
+
+    @quaternion.setter
+    def quaternion(self, quaternion):
+        q0, q1, q2, q3 = (float(v) for v in Quaternion(quaternion).q)
+        self.q = (q0, q1, q2, q3)
+
     def update(self, gyroscope, accelerometer, magnetometer):
         """
         Perform one update step with data from a AHRS sensor array
@@ -240,34 +293,38 @@ class MadgwickAHRS:
         :param gyroscope: A three-element array containing the gyroscope data in radians per second.
         :param accelerometer: A three-element array containing the accelerometer data. Can be any unit since a normalized value is used.
         """
-        q = self.quaternion
-
-        gyroscope = np.array(gyroscope, dtype=float).flatten()
-        accelerometer = np.array(accelerometer, dtype=float).flatten()
-
-        # Normalise accelerometer measurement
-        if norm(accelerometer) is 0:
-            warnings.warn("accelerometer is zero")
-            return
-        accelerometer /= norm(accelerometer)
+        gx, gy, gz = gyroscope
+        ax, ay, az = accelerometer
+        self.q = _imu_step(*self.q, float(gx), float(gy), float(gz),
+                           float(ax), float(ay), float(az), self.beta, self.samplePeriod)
 
-        # Gradient descent algorithm corrective step
-        f = np.array([
-            2*(q[1]*q[3] - q[0]*q[2]) - accelerometer[0],
-            2*(q[0]*q[1] + q[2]*q[3]) - accelerometer[1],
-            2*(0.5 - q[1]**2 - q[2]**2) - accelerometer[2]
-        ])
-        j = np.array([
-            [-2*q[2], 2*q[3], -2*q[0], 2*q[1]],
-            [2*q[1], 2*q[0], 2*q[3], 2*q[2]],
-            [0, -4*q[1], -4*q[2], 0]
-        ])
-        step = j.T.dot(f)
-        step /= norm(step)  # normalise step magnitude
-
-        # Compute rate of change of quaternion
-        qdot = (q * Quaternion(0, gyroscope[0], gyroscope[1], gyroscope[2])) * 0.5 - self.beta * step.T
-
-        # Integrate to yield quaternion
-        q += qdot * self.samplePeriod
-        self.quaternion = Quaternion(q / norm(q))  # normalise quaternion
\ No newline at end of file
+    def update_imu_batch(self, gyroscope, accelerometer, sample_periods=None, out=None):
+        """
+        Run update_imu over N samples at once
+        :param gyroscope: An (N, 3) array of gyroscope data in radians per second.
+        :param accelerometer: An (N, 3) array of accelerometer data, any unit.
+        :param sample_periods: Scalar or N sample periods; defaults to samplePeriod.
+        :param out: Optional (N, 4) float array to write the quaternions into.
+        :return: (N, 4) array with the quaternion (w, x, y, z) after each sample
+        """
+        gyroscope = np.asarray(gyroscope, dtype=float).reshape(-1, 3)
+        accelerometer = np.asarray(accelerometer, dtype=float).reshape(-1, 3)
+        n = len(gyroscope)
+        if sample_periods is None:
+            sample_periods = self.samplePeriod
+        sample_periods = np.broadcast_to(np.asarray(sample_periods, dtype=float), (n,))
+        if out is None:
+            out = np.empty((n, 4))
+
+        # One conversion to Python floats up front; the loop itself touches no arrays
+        q = self.q
+        beta = self.beta
+        quats = []
+        for (gx, gy, gz), (ax, ay, az), dt in zip(gyroscope.tolist(), accelerometer.tolist(),
+                                                  sample_periods.tolist()):
+            q = _imu_step(*q, gx, gy, gz, ax, ay, az, beta, dt)
+            quats.append(q)
+        self.q = q
+        if n:
+            out[:] = quats
+        return out
@@ -0,0 +1,178 @@
+"""
+Occupancy grid helpers shared by the mapping node and its benchmarks.
+
+Grids are uint8 arrays indexed [row, col] = [y, x] with 1 meaning free
+space and 0 meaning occupied, as published on robot/tof_map.
+"""
+
+import numpy as np
+
+FREE = 1
+OCCUPIED = 0
+
+
+def disk_kernel(radius_m, resolution):
+    """
+    Boolean structuring element covering every cell whose centre is within
+    radius_m of the centre cell. Build it once and reuse it every frame.
+    """
+    r = int(radius_m / resolution)
+    dy, dx = np.mgrid[-r:r + 1, -r:r + 1]
+    return np.sqrt(dy**2 + dx**2) * resolution <= radius_m
+
+
+def dilate_mask(mask, kernel):
+    """
+    Binary dilation of a boolean mask by kernel.
+
+    The dilation is done as one shifted OR per kernel cell over the whole
+    mask, so the cost depends on the kernel size and not on how many cells
+    are set.
+    """
+    r = kernel.shape[0] // 2
+    h, w = mask.shape
+    padded = np.pad(mask, r)
+    dilated = np.zeros_like(mask)
+    for dy, dx in zip(*np.nonzero(kernel)):
+        dilated |= padded[dy:dy + h, dx:dx + w]
+    return dilated
+
+
+def dilate_obstacles(grid, kernel):
+    """Grow every occupied cell of grid by kernel."""
+    obstacles = grid == OCCUPIED
+    if not obstacles.any():
+        return grid.copy()
+
+    out = grid.copy()
+    out[dilate_mask(obstacles, kernel)] = OCCUPIED
+    return out
+
+
+class LogOddsGrid:
+    """
+    Rolling, world-frame log-odds occupancy grid.
+
+    Cells hold the log-odds of being occupied. Every ToF return clears the
+    cells along its ray and, if it hit something above the floor, raises the
+    log-odds of the end cell. All cells decay back towards "unknown" (0) so
+    stale obstacles eventually fade. The window is moved in whole tiles to
+    follow the robot, which keeps tile boundaries stable for delta
+    publishing.
+    """
+
+    def __init__(self, size_m=6.4, resolution=0.05, tile_size=16,
+                 l_hit=0.85, l_miss=-0.4, l_min=-2.0, l_max=3.5,
+                 l_occupied=0.6, decay_tau_s=10.0):
+        cells = int(round(size_m / resolution))
+        if cells % tile_size != 0:
+            raise ValueError(f"Grid size ({cells} cells) must be a multiple of tile_size ({tile_size})")
+
+        self.resolution = resolution
+        self.tile_size = tile_size
+        self.l_hit = l_hit
+        self.l_miss = l_miss
+        self.l_min = l_min
+        self.l_max = l_max
+        self.l_occupied = l_occupied
+        self.decay_tau_s = decay_tau_s
+
+        self.log_odds = np.zeros((cells, cells), dtype=np.float32)
+        # World position of the window, in tiles, relative to a window centred on (0, 0)
+        self.tile_x = 0
+        self.tile_y = 0
+        self.last_decay_time = None
+
+    @property
+    def tile_m(self):
+        return self.tile_size * self.resolution
+
+    @property
+    def min_x(self):
+        return self.tile_x * self.tile_m - self.log_odds.shape[1] * self.resolution / 2
+
+    @property
+    def min_y(self):
+        return self.tile_y * self.tile_m - self.log_odds.shape[0] * self.resolution / 2
+
+    def clear(self):
+        self.log_odds[:] = 0
+
+    def recenter(self, x, y):
+        """
+        Shift the window by whole tiles if (x, y) is more than one tile away
+        from its centre. Returns True if the window moved.
+        """
+        centre_x = self.tile_x * self.tile_m
+        centre_y = self.tile_y * self.tile_m
+        shift_x = int(round((x - centre_x) / self.tile_m)) if abs(x - centre_x) > self.tile_m else 0
+        shift_y = int(round((y - centre_y) / self.tile_m)) if abs(y - centre_y) > self.tile_m else 0
+        if shift_x == 0 and shift_y == 0:
+            return False
+
+        dr = shift_y * self.tile_size
+        dc = shift_x * self.tile_size
+        h, w = self.log_odds.shape
+        shifted = np.zeros_like(self.log_odds)
+        if abs(dr) < h and abs(dc) < w:
+            shifted[max(0, -dr):h - max(0, dr), max(0, -dc):w - max(0, dc)] = \
+                self.log_odds[max(0, dr):h - max(0, -dr), max(0, dc):w - max(0, -dc)]
+        self.log_odds = shifted
+        self.tile_x += shift_x
+        self.tile_y += shift_y
+        return True
+
+    def decay(self, now):
+        """Pull every cell towards unknown with time constant decay_tau_s."""
+        if self.last_decay_time is not None:
+            self.log_odds *= np.float32(np.exp(-(now - self.last_decay_time) / self.decay_tau_s))
+        self.last_decay_time = now
+
+    def flat_indices(self, points_xy):
+        """Flat cell indices of the in-bounds (x, y) points (may repeat)."""
+        h, w = self.log_odds.shape
+        c = np.floor((points_xy[:, 0] - self.min_x) / self.resolution).astype(np.intp)
+        r = np.floor((points_xy[:, 1] - self.min_y) / self.resolution).astype(np.intp)
+        inside = (r >= 0) & (r < h) & (c >= 0) & (c < w)
+        return r[inside] * w + c[inside]
+
+    def integrate(self, origins_xy, ends_xy, hits):
+        """
+        Fuse a batch of rays given in world coordinates.
+
+        origins_xy / ends_xy are (N, 2) ray start and end points, hits is an
+        (N,) bool array telling whether the end point is an obstacle (True)
+        or just the floor / free space (False).
+        """
+        origins_xy = np.asarray(origins_xy, dtype=float).reshape(-1, 2)
+        ends_xy = np.asarray(ends_xy, dtype=float).reshape(-1, 2)
+        hits = np.asarray(hits, dtype=bool)
+        if len(ends_xy) == 0:
+            return
+
+        # Sample every ray at half-cell steps, stopping one cell short of obstacles
+        step = self.resolution / 2
+        delta = ends_xy - origins_xy
+        length = np.hypot(delta[:, 0], delta[:, 1])
+        free_length = np.where(hits, np.maximum(length - self.resolution, 0.0), length)
+        unit = delta / np.maximum(length, 1e-9)[:, None]
+        t = np.arange(int(np.ceil(free_length.max() / step)) + 1) * step
+        samples = origins_xy[:, None, :] + unit[:, None, :] * t[None, :, None]
+        free_cells = self.flat_indices(samples[t[None, :] < free_length[:, None]])
+        hit_cells = self.flat_indices(ends_xy[hits])
+
+        # Each cell is updated at most once per batch, hits take precedence
+        hit = np.zeros(self.log_odds.size, dtype=bool)
+        hit[hit_cells] = True
+        free = np.zeros(self.log_odds.size, dtype=bool)
+        free[free_cells] = True
+        free &= ~hit
+
+        flat = self.log_odds.ravel()
+        flat[free] = np.maximum(flat[free] + self.l_miss, self.l_min)
+        flat[hit] = np.minimum(flat[hit] + self.l_hit, self.l_max)
+
+    def occupancy_grid(self, kernel):
+        """Thresholded grid (1 free / unknown, 0 occupied) dilated by kernel."""
+        grid = np.where(self.log_odds > self.l_occupied, OCCUPIED, FREE).astype(np.uint8)
+        return dilate_obstacles(grid, kernel)
@@ -0,0 +1,56 @@
+"""
+Compact wire format for the full-rate odometry stream (robot/odometry_stream).
+
+node_odometry.py publishes every pose it integrates on robot/odometry_stream
+as one small binary message. The 5 Hz JSON messages on robot/odometry are
+unchanged for existing consumers. decode_odometry() accepts either format
+and returns the same dict.
+
+Message layout (little endian), see ODOMETRY_MESSAGE:
+    magic, version, time (time.monotonic() of the encoder sample, s),
+    x, y, theta (m, m, rad, float64), linear and angular velocity
+    (m/s, rad/s), upper triangle of the 3x3 (x, y, theta) pose covariance
+    (xx, xy, xt, yy, yt, tt)
+"""
+
+import json
+import struct
+import numpy as np
+
+ODOMETRY_MAGIC = b"OD"
+VERSION = 1
+
+ODOMETRY_MESSAGE = struct.Struct("<2sBxdddd2f6f")
+COVARIANCE_TRIU = np.triu_indices(3)
+
+
+def encode_odometry(t, x, y, theta, linear_velocity, angular_velocity, covariance):
+    cov = np.asarray(covariance, dtype=float)[COVARIANCE_TRIU]
+    return ODOMETRY_MESSAGE.pack(ODOMETRY_MAGIC, VERSION, t, x, y, theta,
+                                 linear_velocity, angular_velocity, *cov)
+
+
+def decode_odometry(payload):
+    """
+    Parse a robot/odometry_stream payload, or a robot/odometry JSON payload.
+
+    Returns a dict with x, y and theta, plus time, linear_velocity,
+    angular_velocity and covariance (3x3 array) when the message has them.
+    """
+    payload = bytes(payload)
+    if payload[:1] == b"{":
+        return json.loads(payload)
+
+    fields = ODOMETRY_MESSAGE.unpack(payload)
+    magic, version = fields[:2]
+    if magic != ODOMETRY_MAGIC or version != VERSION:
+        raise ValueError(f"Not an odometry message (magic={magic!r}, version={version})")
+    t, x, y, theta, linear_velocity, angular_velocity = fields[2:8]
+    covariance = np.zeros((3, 3))
+    covariance[COVARIANCE_TRIU] = fields[8:]
+    covariance.T[COVARIANCE_TRIU] = fields[8:]
+    return {
+        "time": t, "x": x, "y": y, "theta": theta,
+        "linear_velocity": linear_velocity, "angular_velocity": angular_velocity,
+        "covariance": covariance,
+    }
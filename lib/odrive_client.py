@@ -0,0 +1,81 @@
+"""
+Client for core/node_odrive.py, the process that owns the ODrive UART.
+
+Only node_odrive.py opens /dev/ttyAMA1. Other nodes talk to it over a local
+Unix socket (multiprocessing.connection, pickled tuples), so they never fight
+over the port or flush each other's responses. Setpoints are stored by the
+server and sent on its next control tick; encoder state is served from the
+server's latest telemetry, so neither call waits on the UART.
+
+Requests and replies:
+    ("set_speed_mps", left, right)  -> None
+    ("get_state",)                  -> dict, see ODriveClient.get_state()
+    ("commands", [str, ...])        -> responses to the read commands, in order
+"""
+
+import time
+import threading
+from multiprocessing.connection import Client
+
+ODRIVE_SOCKET = "/tmp/odrive.sock"
+
+
+class ODriveClient:
+    """Drop-in for the ODriveUART methods the core nodes use, served by node_odrive.py."""
+
+    def __init__(self, address=ODRIVE_SOCKET, connect_timeout=10.0):
+        self.address = address
+        self.connect_timeout = connect_timeout
+        self.lock = threading.Lock()  # one request in flight per connection
+        self.conn = None
+        self._connect()
+
+    def _connect(self):
+        deadline = time.monotonic() + self.connect_timeout
+        while True:
+            try:
+                self.conn = Client(self.address, family='AF_UNIX')
+                return
+            except (FileNotFoundError, ConnectionRefusedError):
+                if time.monotonic() > deadline:
+                    raise ConnectionError(f"node_odrive.py is not running (no server on {self.address})")
+                time.sleep(0.2)
+
+    def _request(self, *message):
+        with self.lock:
+            try:
+                self.conn.send(message)
+                return self.conn.recv()
+            except (EOFError, OSError):
+                # The server restarted; reconnect and retry once
+                self._connect()
+                self.conn.send(message)
+                return self.conn.recv()
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def set_speed_mps(self, left, right):
+        self._request("set_speed_mps", left, right)
+
+    def get_state(self):
+        """
+        Latest telemetry: dict with left_turns, right_turns, left_rpm,
+        right_rpm, time (time.monotonic() half way through the UART exchange
+        that read them) and latency (how long that exchange took, s).
+        """
+        return self._request("get_state")
+
+    def get_position_turns_both(self):
+        state = self.get_state()
+        return state["left_turns"], state["right_turns"]
+
+    def get_pos_vel_both(self):
+        state = self.get_state()
+        return (state["left_turns"], state["left_rpm"]), (state["right_turns"], state["right_rpm"])
+
+    def send_commands(self, commands):
+        """Raw ASCII commands, run on the server's next control tick."""
+        return self._request("commands", list(commands))
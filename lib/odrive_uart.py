@@ -14,14 +14,7 @@ class ODriveUART:
     ERROR_DICT = {k: v for k, v in odrive.enums.__dict__ .items() if k.startswith("AXIS_ERROR_")}
 
     SERIAL_PORT = '/dev/ttyAMA1'
-    _bus = serial.Serial(
-        port=SERIAL_PORT,
-        baudrate=115200,
-        parity=serial.PARITY_NONE,
-        stopbits=serial.STOPBITS_ONE,
-        bytesize=serial.EIGHTBITS,
-        timeout=1
-    )
+    WHEEL_DIAMETER_MM = 165
 
     def __init__(self, port='/dev/ttyAMA1', left_axis=0, right_axis=1, dir_left=1, dir_right=1):
         self.bus = serial.Serial(
@@ -53,6 +46,24 @@ class ODriveUART:
                 print(f"No response received for command: {command}")
             return response
 
+    def send_commands(self, commands):
+        """
+        Send several commands in a single write and return the responses to
+        the read commands ('r' / 'f'), in order. The ODrive answers commands
+        in the order it receives them, so this costs one round trip instead
+        of one per read.
+        """
+        self.bus.reset_input_buffer()
+        self.bus.write("".join(f"{command}\n" for command in commands).encode())
+        responses = []
+        for command in commands:
+            if command.startswith('r') or command.startswith('f'):
+                response = self.bus.readline().decode('ascii').strip()
+                if response == '':
+                    print(f"No response received for command: {command}")
+                responses.append(response)
+        return responses
+
     def get_errors_left(self):
         return self.get_errors(self.left_axis)
 
@@ -164,14 +175,15 @@ class ODriveUART:
         self.send_command(f'w axis{axis}.controller.input_vel {rps * direction:.4f}')
         
     def set_speed_mps_left(self, mps):
-        WHEEL_DIAMETER_MM = 165
-        rps = mps / (WHEEL_DIAMETER_MM * 0.001 * 3.14159)
-        self.send_command(f'w axis{self.left_axis}.controller.input_vel {rps * self.dir_left:.4f}')
+        self.send_command(self.speed_mps_command(self.left_axis, mps, self.dir_left))
         
     def set_speed_mps_right(self, mps):
-        WHEEL_DIAMETER_MM = 165
-        rps = mps / (WHEEL_DIAMETER_MM * 0.001 * 3.14159)
-        self.send_command(f'w axis{self.right_axis}.controller.input_vel {rps * self.dir_right:.4f}')
+        self.send_command(self.speed_mps_command(self.right_axis, mps, self.dir_right))
+
+    def speed_mps_command(self, axis, mps, direction):
+        """The ASCII command setting axis to mps, for batching with send_commands()."""
+        rps = mps / (self.WHEEL_DIAMETER_MM * 0.001 * 3.14159)
+        return f'w axis{axis}.controller.input_vel {rps * direction:.4f}'
 
     def set_torque_nm_left(self, nm):
         self.set_torque_nm(self.left_axis, nm, self.dir_left)
@@ -213,7 +225,21 @@ class ODriveUART:
         return self.get_pos_vel(self.right_axis, self.dir_right)
 
     def get_pos_vel(self, axis, direction):
-        pos, vel = self.send_command(f'f {axis}').split(' ')
+        return self.parse_pos_vel(self.send_command(f'f {axis}'), direction)
+
+    def get_pos_vel_both(self):
+        """((pos_left, rpm_left), (pos_right, rpm_right)) from one UART round trip."""
+        left, right = self.send_commands([f'f {self.left_axis}', f'f {self.right_axis}'])
+        return self.parse_pos_vel(left, self.dir_left), self.parse_pos_vel(right, self.dir_right)
+
+    def get_position_turns_both(self):
+        """(left_turns, right_turns) from one UART round trip."""
+        (pos_left, _), (pos_right, _) = self.get_pos_vel_both()
+        return pos_left, pos_right
+
+    def parse_pos_vel(self, response, direction):
+        """(turns, rpm) from the response to an 'f <axis>' command."""
+        pos, vel = response.split(' ')
         return float(pos) * direction, float(vel) * direction * 60
 
     def stop_left(self):
@@ -0,0 +1,217 @@
+"""
+asyncio version of ODriveUART for event-loop based nodes.
+
+Commands are awaitable and never block the loop. All commands go through one
+writer task, which batches whatever is queued into a single UART write.
+Velocity setpoints are coalesced: if a newer setpoint for an axis is queued
+before the previous one was written, only the newer one is sent.
+
+The ODrive ASCII protocol has no request ids, but it answers read commands
+('r' / 'f') in the order it receives them. The reader task therefore hands
+each response line to the oldest pending read. If a read times out, the
+stream can no longer be trusted to line up. All pending reads are then
+failed, and lines arriving during a short resync window are dropped before
+the writer sends anything new.
+
+The class works on any asyncio (reader, writer) pair. Only open() needs
+pyserial-asyncio (installed by setup/setup_os.sh), so the protocol can be
+exercised without a serial port, see tests/benchmark_odrive_async.py.
+"""
+
+import asyncio
+
+
+class AsyncODriveUART:
+    AXIS_STATE_CLOSED_LOOP_CONTROL = 8
+    WHEEL_DIAMETER_MM = 165
+    RESYNC_S = 0.05
+
+    def __init__(self, reader, writer, left_axis=0, right_axis=1, dir_left=1, dir_right=1,
+                 timeout=0.1):
+        self.reader = reader
+        self.writer = writer
+        self.left_axis = left_axis
+        self.right_axis = right_axis
+        self.dir_left = dir_left
+        self.dir_right = dir_right
+        self.timeout = timeout
+
+        self._queue = []         # (command, future or None) waiting to be written
+        self._setpoints = {}     # axis -> latest input_vel command not written yet
+        self._pending = []       # futures of written read commands, oldest first
+        self._wake = asyncio.Event()
+        self._resync_until = 0.0
+        self.coalesced_setpoints = 0
+        self.timeouts = 0
+
+        self._tasks = [asyncio.ensure_future(self._write_loop()),
+                       asyncio.ensure_future(self._read_loop())]
+
+    @classmethod
+    async def open(cls, port='/dev/ttyAMA1', **kwargs):
+        import serial_asyncio
+        reader, writer = await serial_asyncio.open_serial_connection(url=port, baudrate=115200)
+        return cls(reader, writer, **kwargs)
+
+    async def close(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self.writer.close()
+
+    # ------------------------------------------------------------------------
+    # Transport
+    # ------------------------------------------------------------------------
+    async def _write_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+
+            # Let the reader drop late responses before anything new goes out
+            delay = self._resync_until - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            batch, self._queue = self._queue, []
+            batch += [(command, None) for command in self._setpoints.values()]
+            self._setpoints.clear()
+            if not batch:
+                continue
+
+            for _, future in batch:
+                if future is not None:
+                    self._pending.append(future)
+            self.writer.write("".join(f"{command}\n" for command, _ in batch).encode())
+            await self.writer.drain()
+
+    async def _read_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            line = await self.reader.readline()
+            if loop.time() < self._resync_until or not self._pending:
+                continue
+            future = self._pending.pop(0)
+            if not future.done():
+                future.set_result(line.decode('ascii', errors='replace').strip())
+
+    def _resync(self):
+        self.timeouts += 1
+        for future in self._pending:
+            if not future.done():
+                future.set_exception(asyncio.TimeoutError("ODrive response stream resynchronised"))
+        self._pending.clear()
+        self._resync_until = asyncio.get_running_loop().time() + self.RESYNC_S
+
+    async def send_command(self, command: str, timeout=None):
+        """
+        Queue a command. Returns the response for read commands ('r' / 'f'),
+        raising asyncio.TimeoutError if none arrives within timeout, and None
+        for write commands (once queued, without waiting for the UART).
+        """
+        if not (command.startswith('r') or command.startswith('f')):
+            self._queue.append((command, None))
+            self._wake.set()
+            return None
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.append((command, future))
+        self._wake.set()
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout or self.timeout)
+        except asyncio.TimeoutError:
+            if not future.done():
+                future.cancel()
+                self._resync()
+            raise
+
+    def set_setpoint(self, axis, command):
+        """Queue an input_vel command for axis, replacing any not yet written."""
+        if axis in self._setpoints:
+            self.coalesced_setpoints += 1
+        self._setpoints[axis] = command
+        self._wake.set()
+
+    # ------------------------------------------------------------------------
+    # Commands (same names as ODriveUART)
+    # ------------------------------------------------------------------------
+    async def start(self, axis):
+        await self.send_command(f'w axis{axis}.requested_state {self.AXIS_STATE_CLOSED_LOOP_CONTROL}')
+
+    async def enable_velocity_mode(self, axis):
+        await self.send_command(f'w axis{axis}.controller.config.control_mode 2')
+        await self.send_command(f'w axis{axis}.controller.config.input_mode 1')
+
+    async def disable_watchdog(self, axis):
+        await self.send_command(f'w axis{axis}.config.enable_watchdog 0')
+
+    async def clear_errors(self, axis):
+        await self.send_command(f'w axis{axis}.error 0')
+        await self.send_command(f'w axis{axis}.requested_state {self.AXIS_STATE_CLOSED_LOOP_CONTROL}')
+
+    async def check_errors(self, axis):
+        response = await self.send_command(f'r axis{axis}.error')
+        try:
+            return int(''.join(c for c in response if c.isdigit())) != 0
+        except ValueError:
+            print(f"Unexpected response format: {response}")
+            return True
+
+    def set_speed_mps(self, axis, mps, direction):
+        rps = mps / (self.WHEEL_DIAMETER_MM * 0.001 * 3.14159)
+        self.set_setpoint(axis, f'w axis{axis}.controller.input_vel {rps * direction:.4f}')
+
+    def set_speed_mps_left(self, mps):
+        self.set_speed_mps(self.left_axis, mps, self.dir_left)
+
+    def set_speed_mps_right(self, mps):
+        self.set_speed_mps(self.right_axis, mps, self.dir_right)
+
+    async def get_pos_vel(self, axis, direction):
+        pos, vel = (await self.send_command(f'f {axis}')).split(' ')
+        return float(pos) * direction, float(vel) * direction * 60
+
+    async def get_pos_vel_both(self):
+        # Both queries are queued before the writer runs, so they share one write
+        return await asyncio.gather(self.get_pos_vel(self.left_axis, self.dir_left),
+                                    self.get_pos_vel(self.right_axis, self.dir_right))
+
+    async def get_position_turns_both(self):
+        (pos_left, _), (pos_right, _) = await self.get_pos_vel_both()
+        return pos_left, pos_right
+
+    async def stop(self):
+        self.set_speed_mps_left(0)
+        self.set_speed_mps_right(0)
+
+
+if __name__ == '__main__':
+    import os
+    import json
+
+    async def main():
+        with open(os.path.expanduser('~/quickstart/lib/motor_dir.json'), 'r') as f:
+            motor_dirs = json.load(f)
+        motor = await AsyncODriveUART.open('/dev/ttyAMA1', left_axis=0, right_axis=1,
+                                           dir_left=motor_dirs['left'], dir_right=motor_dirs['right'])
+        for axis in (motor.left_axis, motor.right_axis):
+            await motor.start(axis)
+            await motor.enable_velocity_mode(axis)
+            await motor.disable_watchdog(axis)
+            await motor.clear_errors(axis)
+
+        try:
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            while loop.time() - start < 2.0:
+                motor.set_speed_mps_left(0.1)
+                motor.set_speed_mps_right(0.1)
+                print(await motor.get_pos_vel_both())
+                await asyncio.sleep(0.02)
+        finally:
+            await motor.stop()
+            await asyncio.sleep(0.05)
+            print(f"Coalesced setpoints: {motor.coalesced_setpoints}, timeouts: {motor.timeouts}")
+            await motor.close()
+
+    asyncio.run(main())
@@ -0,0 +1,97 @@
+"""
+Zone geometry for the VL53L5CX ToF sensors.
+
+Each sensor zone looks along a fixed ray, so the trigonometry and the
+sensor mounting rotation only need to be computed once per sensor. A frame
+is then projected with a single broadcast multiply:
+
+    points = distances_m[:, None] * rays + offset
+
+With several targets per zone, the driver outputs are reshaped to
+(zones, targets) and every target of a zone is projected along its ray.
+"""
+
+import math
+import numpy as np
+
+# Status code 5 typically means "valid" measurement on VL53L5CX
+VALID_TARGET_STATUS = 5
+
+
+def rotation_y(deg):
+    a = math.radians(deg)
+    return np.array([
+        [ math.cos(a), 0, math.sin(a)],
+        [ 0,           1, 0          ],
+        [-math.sin(a), 0, math.cos(a)],
+    ])
+
+
+def rotation_z(deg):
+    a = math.radians(deg)
+    return np.array([
+        [math.cos(a), -math.sin(a), 0],
+        [math.sin(a),  math.cos(a), 0],
+        [0,            0,           1],
+    ])
+
+
+def build_ray_table(rows_deg, cols_deg, tilt_deg, yaw_deg, offset_xyz):
+    """
+    Precompute the rays of one sensor.
+
+    rows_deg / cols_deg are the zone centre angles (vertical / horizontal),
+    zones are numbered row-major like the driver output. offset_xyz is added
+    in the sensor frame before the tilt and yaw rotations are applied.
+
+    Returns (rays, offset): a (zones, 3) matrix of unit rays and a (3,)
+    offset, both already rotated into the robot frame.
+    """
+    vert = np.radians(np.repeat(rows_deg, len(cols_deg)))
+    horiz = np.radians(np.tile(cols_deg, len(rows_deg)))
+    rays = np.column_stack((
+        np.cos(vert) * np.cos(horiz),
+        np.cos(vert) * np.sin(horiz),
+        np.sin(vert),
+    ))
+
+    # Points are row vectors, so the rotation is applied on the right
+    rotation = rotation_y(tilt_deg) @ rotation_z(yaw_deg)
+    return rays @ rotation, np.asarray(offset_xyz, dtype=float) @ rotation
+
+
+def project_zones(ray_table, distances_mm):
+    """Convert one frame of zone distances (mm) into (zones, 3) points in meters."""
+    rays, offset = ray_table
+    return (np.asarray(distances_mm, dtype=float) * 0.001)[:, None] * rays + offset
+
+
+def valid_zone_mask(distances_mm, target_status):
+    """Boolean mask of the zones holding a usable measurement."""
+    distances_mm = np.asarray(distances_mm)
+    return (np.asarray(target_status) == VALID_TARGET_STATUS) & (distances_mm != 0)
+
+
+def zone_targets(values, num_zones, nb_target_per_zone):
+    """
+    The per-target driver output values as a (zones, targets) view. The
+    driver stores the targets of a zone next to each other.
+    """
+    return np.asarray(values)[:num_zones * nb_target_per_zone].reshape(num_zones, nb_target_per_zone)
+
+
+def project_targets(ray_table, distances_mm):
+    """Convert (zones, targets) distances (mm) into (zones, targets, 3) points in meters."""
+    rays, offset = ray_table
+    return (np.asarray(distances_mm, dtype=float) * 0.001)[:, :, None] * rays[:, None, :] + offset
+
+
+def valid_target_mask(distances_mm, target_status, nb_target_detected=None):
+    """
+    (zones, targets) boolean mask of the usable returns. Targets past
+    nb_target_detected of their zone hold stale values and are left out.
+    """
+    valid = valid_zone_mask(distances_mm, target_status)
+    if nb_target_detected is not None:
+        valid &= np.arange(valid.shape[1]) < np.asarray(nb_target_detected)[:valid.shape[0], None]
+    return valid
@@ -0,0 +1,392 @@
+"""
+Helpers for running several VL53L5CX sensors on one I2C bus.
+
+SensorBringUp gives each sensor its own I2C address with the LPn pins, then
+boots the sensors concurrently. Only one firmware download uses the bus at a
+time, since the bus is the limit there, but the fixed waits and boot polling
+of the other sensors overlap with it. Each phase is timed per sensor.
+
+FrameReadyMonitor handles data-ready detection. While ranging, the sensor
+pulls its INT pin low for a short pulse whenever a new frame is ready
+(start_ranging() enables interrupt mode). The monitor turns those falling
+edges into timestamped events. The main loop can then sleep until a frame
+lands and read each sensor once per frame, without polling
+check_data_ready() over I2C.
+
+Sensors without an INT pin (None), or whose pin can't get edge detection, are
+polled with check_data_ready() every poll_interval instead, or every half
+frame period once set_frame_rate() tells the monitor the sensor's rate, but
+never more often than every poll_interval. An INT sensor that has been quiet for longer than int_timeout (above the slowest 1 Hz ranging
+period) is polled as well, in case an edge was missed.
+
+RangingScheduler sets each sensor's ranging frequency from the robot's
+motion. Driving straight, the forward sensor runs at max_hz and the side
+sensors slow down. Turning, the sensor on the inside of the turn speeds up.
+Standing still, all of them range at idle_share of max_hz. When the frames
+don't fit in the I2C byte budget, the rates are scaled down together. The
+budget counts the frame reads and the check_data_ready() polls of the
+sensors without INT. i2c_bus_hz() reads the bus speed from the device tree.
+Each sensor's integration time grows with its frame
+period, so a slower sensor gets a longer range and less noise.
+"""
+
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from lib.vl53l5cx_lib.vl53l5cx import VL53L5CX
+
+I2C_BITS_PER_BYTE = 9   # 8 data bits + ACK
+I2C_DEFAULT_HZ = 100_000  # Raspberry Pi, unless config.txt sets dtparam=i2c_arm_baudrate
+# Bytes on the bus besides the frame data: the address bytes and 2-byte
+# register index of each read, and the 4-byte status of check_data_ready()
+READ_OVERHEAD_BYTES = 4
+CHECK_DATA_READY_BYTES = READ_OVERHEAD_BYTES + 4
+POLLS_PER_FRAME = 2       # FrameReadyMonitor polls at most twice per frame period
+
+
+def i2c_bus_hz(bus_number=1, default=I2C_DEFAULT_HZ):
+    """Clock frequency of an I2C bus from the device tree, default where it isn't exposed."""
+    path = f"/sys/class/i2c-adapter/i2c-{bus_number}/of_node/clock-frequency"
+    try:
+        with open(path, 'rb') as f:
+            value = f.read()
+    except OSError:
+        return default
+    return int.from_bytes(value[:4], 'big') if len(value) >= 4 else default
+
+
+class SensorBringUp:
+    PHASES = ("power_on", "firmware_queue", "firmware", "boot", "configure")
+
+    def __init__(self, lpn_pins, addresses, sensor_kwargs=None, settle_time=0.1):
+        self.lpn_pins = lpn_pins
+        self.addresses = addresses
+        self.sensor_kwargs = sensor_kwargs or {}
+        self.settle_time = settle_time   # s after raising LPn before the sensor answers
+        self.sensors = []
+        self.timings = []                # Per sensor, seconds spent in each of PHASES
+        self.address_time = 0.0
+        self.start_time = 0.0
+        self._firmware_lock = threading.Lock()
+
+    def assign_addresses(self, existing_addresses=()):
+        """
+        Create the sensors, moving each one not yet found at its address
+        away from the default address. Returns the sensors in LPn pin order.
+        """
+        from RPi import GPIO
+
+        start = time.monotonic()
+        self.sensors = []
+        missing = [address not in existing_addresses for address in self.addresses]
+        if any(missing):
+            # Only the sensor with LPn high answers on the default address
+            for pin in self.lpn_pins:
+                GPIO.output(pin, GPIO.LOW)
+        for pin, address, readdress in zip(self.lpn_pins, self.addresses, missing):
+            if readdress:
+                GPIO.output(pin, GPIO.HIGH)
+                time.sleep(self.settle_time)
+                sensor = VL53L5CX(**self.sensor_kwargs)
+                sensor.set_i2c_address(address)
+            else:
+                sensor = VL53L5CX(i2c_address=address, **self.sensor_kwargs)
+            self.sensors.append(sensor)
+        for pin in self.lpn_pins:
+            GPIO.output(pin, GPIO.HIGH)
+        self.address_time = time.monotonic() - start
+        return self.sensors
+
+    def _bring_up(self, index, configure):
+        sensor = self.sensors[index]
+        timing = self.timings[index]
+
+        def timed(phase, step):
+            start = time.monotonic()
+            step()
+            timing[phase] = time.monotonic() - start
+
+        timed("power_on", sensor.init_power_on)
+        timed("firmware_queue", self._firmware_lock.acquire)
+        try:
+            timed("firmware", sensor.init_download_firmware)
+        finally:
+            self._firmware_lock.release()
+        timed("boot", sensor.init_boot)
+        if configure is not None:
+            timed("configure", lambda: configure(sensor))
+
+    def start(self, configure=None, parallel=True):
+        """
+        init() every sensor, then call configure(sensor), e.g. to set the
+        resolution and start ranging. With parallel=False the sensors are
+        brought up one after the other, as a reference for the timings.
+        """
+        self.timings = [dict.fromkeys(self.PHASES, 0.0) for _ in self.sensors]
+        start = time.monotonic()
+        if parallel:
+            with ThreadPoolExecutor(max_workers=len(self.sensors)) as executor:
+                futures = [executor.submit(self._bring_up, index, configure)
+                           for index in range(len(self.sensors))]
+                for future in futures:
+                    future.result()  # Re-raises a sensor's exception here
+        else:
+            for index in range(len(self.sensors)):
+                self._bring_up(index, configure)
+        self.start_time = time.monotonic() - start
+
+    def report(self):
+        """Per-sensor phase timings and the total, as printable lines."""
+        lines = []
+        for sensor, timing in zip(self.sensors, self.timings):
+            phases = ", ".join(f"{phase} {seconds:.2f} s" for phase, seconds in timing.items())
+            lines.append(f"Sensor {hex(sensor.i2c_address)}: {phases}")
+        one_by_one = sum(seconds for timing in self.timings for phase, seconds in timing.items()
+                         if phase != "firmware_queue")
+        lines.append(f"Addresses {self.address_time:.2f} s, bring-up {self.start_time:.2f} s "
+                     f"(phases add up to {one_by_one:.2f} s)")
+        return "\n".join(lines)
+
+
+class FrameReadyMonitor:
+    def __init__(self, sensors, int_pins=None, poll_interval=0.05, int_timeout=2.0):
+        self.sensors = sensors
+        self.poll_interval = poll_interval                    # s, the shortest poll interval
+        self.poll_intervals = [poll_interval] * len(sensors)  # s, per sensor
+        self.int_timeout = int_timeout
+        self.polled = []            # Indices of the sensors without a working INT pin
+        self._next_poll = [0.0] * len(sensors)
+        self._int_sensors = {}      # INT pin -> sensor index
+        self._pending = {}          # Sensor index -> time of its last INT edge
+        self._lock = threading.Lock()
+        self._edge = threading.Event()
+        self._last_frame = [time.monotonic()] * len(sensors)
+        self._gpio = None
+
+        if int_pins is None:
+            int_pins = [None] * len(sensors)
+        for index, pin in enumerate(int_pins):
+            if pin is None:
+                self.polled.append(index)
+                continue
+            if self._gpio is None:
+                from RPi import GPIO
+                self._gpio = GPIO
+            try:
+                # INT is open drain, active low
+                self._gpio.setup(pin, self._gpio.IN, pull_up_down=self._gpio.PUD_UP)
+                self._gpio.add_event_detect(pin, self._gpio.FALLING, callback=self._on_edge)
+                self._int_sensors[pin] = index
+            except RuntimeError as e:
+                print(f"[tof_sensors.py] No edge detection on GPIO {pin} ({e}), polling sensor {index}.")
+                self.polled.append(index)
+
+    def _on_edge(self, pin):
+        """RPi.GPIO callback, runs on its event thread."""
+        now = time.monotonic()
+        with self._lock:
+            self._pending[self._int_sensors[pin]] = now
+            self._edge.set()
+
+    def _take_pending(self):
+        with self._lock:
+            frames = list(self._pending.items())
+            self._pending.clear()
+            self._edge.clear()
+        return frames
+
+    def set_frame_rate(self, index, rate_hz):
+        """
+        Poll a sensor twice per frame period, so a frame waits at most half a
+        period, but no faster than poll_interval.
+        """
+        self.poll_intervals[index] = max(self.poll_interval, 1.0 / (POLLS_PER_FRAME * rate_hz))
+
+    def _poll(self, index):
+        try:
+            return self.sensors[index].check_data_ready()
+        except Exception as e:
+            print(f"[tof_sensors.py] Error polling sensor {index}: {e}")
+            return False
+
+    def wait(self, timeout):
+        """
+        Block until at least one sensor has a new frame, or timeout seconds.
+
+        Returns a list of (sensor index, time.monotonic() the frame was
+        detected), empty on timeout. For INT sensors the time is the edge, for
+        polled ones it is up to one poll interval late. The frames still have to be
+        read with get_ranging_data(), check_data_ready() was already called
+        where it was needed.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            frames = self._take_pending()
+            now = time.monotonic()
+            for index in self.polled:
+                if now >= self._next_poll[index]:
+                    self._next_poll[index] = now + self.poll_intervals[index]
+                    if self._poll(index):
+                        frames.append((index, now))
+            signalled = {index for index, _ in frames}
+            for index in self._int_sensors.values():
+                if (index not in signalled and now - self._last_frame[index] > self.int_timeout
+                        and self._poll(index)):
+                    frames.append((index, now))
+
+            if frames:
+                for index, frame_time in frames:
+                    self._last_frame[index] = max(self._last_frame[index], frame_time)
+                return frames
+
+            remaining = deadline - now
+            if remaining <= 0:
+                return []
+            next_poll = min((self._next_poll[index] for index in self.polled), default=now + self.int_timeout)
+            self._edge.wait(min(remaining, max(next_poll - now, 0.0), self.int_timeout))
+
+    def close(self):
+        for pin in self._int_sensors:
+            self._gpio.remove_event_detect(pin)
+
+
+class RangingScheduler:
+    def __init__(self, sensors, yaw_deg, resolution, polled=(), bus_hz=I2C_DEFAULT_HZ, bus_share=0.5,
+                 min_hz=1, max_hz=15, idle_share=0.25, full_speed=0.2, full_turn_rate=1.2, focus=3.0,
+                 integration_fraction=0.25, max_integration_ms=50, min_change_hz=2, hold_time=1.0):
+        self.sensors = sensors
+        self.yaw = [math.radians(yaw) for yaw in yaw_deg]  # Per sensor, 0 = forward, positive = left
+        self.read_bytes = [sensor.compute_data_read_size(resolution) + READ_OVERHEAD_BYTES for sensor in sensors]
+        self.set_polled(polled)
+        self.bus_hz = bus_hz
+        self.bus_share = bus_share            # Part of the bus for frames and polls, the rest is margin
+        self.idle_share = idle_share          # Part of max_hz used while standing still
+        self.min_hz = min_hz
+        self.max_hz = max_hz                  # 15 Hz at 8x8, 60 Hz at 4x4
+        self.full_speed = full_speed          # m/s at which the forward sensor gets its full weight
+        self.full_turn_rate = full_turn_rate  # rad/s, the same for the sensors on the inside of a turn
+        self.focus = focus                    # Weight of the sensor facing the motion, the others have 1
+        self.integration_fraction = integration_fraction
+        self.max_integration_ms = max_integration_ms
+        self.min_change_hz = min_change_hz    # Smaller changes aren't worth a ranging restart
+        self.hold_time = hold_time            # s between two reconfigurations
+        self.rates = [None] * len(sensors)    # Applied ranging frequency per sensor
+        self.restarts = 0
+        self._last_change = -math.inf
+
+    def set_polled(self, polled):
+        """
+        Sensors polled with check_data_ready(), their polls count against the
+        budget. Above 1 / (POLLS_PER_FRAME * poll_interval) the monitor polls
+        less than twice per frame, so the budget errs on the safe side there.
+        """
+        self.frame_bytes = [size + (POLLS_PER_FRAME * CHECK_DATA_READY_BYTES if index in polled else 0)
+                            for index, size in enumerate(self.read_bytes)]
+
+    @property
+    def budget(self):
+        """Bytes per second the frames and polls of all sensors may take on the bus."""
+        return self.bus_hz / I2C_BITS_PER_BYTE * self.bus_share
+
+    def activity(self, linear_velocity, angular_velocity):
+        """0 standing still to 1 at full_speed or full_turn_rate."""
+        speed = min(abs(linear_velocity) / self.full_speed, 1.0)
+        turn = min(abs(angular_velocity) / self.full_turn_rate, 1.0)
+        return max(speed, turn)
+
+    def weights(self, linear_velocity, angular_velocity):
+        """
+        Relative frame rate each sensor deserves for this motion. The fourth
+        power narrows the bonus to the sensors actually facing the motion:
+        a sensor 60 degrees off gets 1/16 of it.
+        """
+        speed = min(max(linear_velocity, 0.0) / self.full_speed, 1.0)  # No sensor looks back
+        turn = min(abs(angular_velocity) / self.full_turn_rate, 1.0)
+        side = math.copysign(1.0, angular_velocity)
+        return [1.0 + self.focus * (speed * max(math.cos(yaw), 0.0) ** 4
+                                    + turn * max(side * math.sin(yaw), 0.0) ** 4)
+                for yaw in self.yaw]
+
+    def target_rates(self, linear_velocity, angular_velocity):
+        """
+        Whole-Hz ranging frequencies, proportional to weights() and between
+        min_hz and max_hz, whose frames fit in the bus budget together
+        (unless min_hz alone doesn't).
+        """
+        weights = self.weights(linear_velocity, angular_velocity)
+        share = self.idle_share + (1.0 - self.idle_share) * self.activity(linear_velocity, angular_velocity)
+        top = max(weights)
+        rates = [max(self.max_hz * share * weight / top, self.min_hz) for weight in weights]
+
+        # Over budget, scale the part above min_hz down to fit
+        frame_bytes = self.frame_bytes
+        used = sum(rate * size for rate, size in zip(rates, frame_bytes))
+        if used > self.budget:
+            floor = self.min_hz * sum(frame_bytes)
+            scale = max(self.budget - floor, 0.0) / (used - floor)
+            rates = [self.min_hz + (rate - self.min_hz) * scale for rate in rates]
+
+        # Round down, then up where the budget allows, largest remainders first
+        whole = [int(rate) for rate in rates]
+        budget = self.budget - sum(rate * size for rate, size in zip(whole, frame_bytes))
+        for i in sorted(range(len(rates)), key=lambda i: whole[i] - rates[i]):
+            if whole[i] < rates[i] and frame_bytes[i] <= budget:
+                whole[i] += 1
+                budget -= frame_bytes[i]
+        return whole
+
+    def integration_time_ms(self, rate_hz):
+        """Longest integration time the frame period comfortably allows, in ms."""
+        return int(min(max(self.integration_fraction * 1000 / rate_hz, 2), self.max_integration_ms))
+
+    def configure(self, sensor):
+        """
+        Set the standing-still rate and integration time of a sensor before
+        its first start_ranging(). Integration time needs autonomous mode.
+        """
+        index = self.sensors.index(sensor)
+        rate = self.target_rates(0.0, 0.0)[index]
+        self.configure_rate(sensor, rate)
+        self.rates[index] = rate
+
+    def configure_rate(self, sensor, rate_hz):
+        sensor.set_ranging_frequency_hz(rate_hz)
+        sensor.set_integration_time_ms(self.integration_time_ms(rate_hz))
+
+    def apply(self, index, rate_hz):
+        """Restart one sensor's ranging at rate_hz, settings only take while it's stopped."""
+        sensor = self.sensors[index]
+        sensor.stop_ranging()
+        try:
+            self.configure_rate(sensor, rate_hz)
+            self.rates[index] = rate_hz
+        finally:
+            sensor.start_ranging()  # Keep it ranging at the old rate if the settings failed
+        self.restarts += 1
+
+    def update(self, linear_velocity, angular_velocity, now=None):
+        """
+        Reconfigure the sensors whose rate is off by min_change_hz or more,
+        at most once per hold_time. Call it between frames, from the thread
+        that reads the sensors. Returns True if a sensor was restarted.
+        """
+        now = time.monotonic() if now is None else now
+        if now - self._last_change < self.hold_time:
+            return False
+
+        targets = self.target_rates(linear_velocity, angular_velocity)
+        plan = [target if current is None or abs(target - current) >= self.min_change_hz
+                or (target != current and target in (self.min_hz, self.max_hz)) else current
+                for target, current in zip(targets, self.rates)]
+        if sum(rate * size for rate, size in zip(plan, self.frame_bytes)) > self.budget:
+            # The small decreases skipped above are needed to make room
+            plan = [min(rate, target) for rate, target in zip(plan, targets)]
+
+        changed = [index for index, rate in enumerate(plan) if rate != self.rates[index]]
+        if changed:
+            self._last_change = now  # Also holds off retries if a sensor fails below
+        for index in changed:
+            self.apply(index, plan[index])
+        return bool(changed)
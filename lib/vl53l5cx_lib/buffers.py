@@ -1,3 +1,34 @@
+"""
+Firmware, default configuration and default Xtalk of the VL53L5CX.
+
+The data are the byte arrays of ST's vl53l5cx_buffers.h, stored as binary
+files next to this module. Each file is read once per process, on first use,
+and the same bytes object is shared by every sensor instance. Only the default
+configuration depends on the number of targets per zone, one patched copy is
+kept per value.
+"""
+
+import os
+from functools import lru_cache
+
+_DATA_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+# Byte of the default configuration holding VL53L5CX_FW_NBTAR_RANGING
+_FW_NBTAR_RANGING_OFFSET = 107
+
+
+@lru_cache(maxsize=None)
+def load_blob(name: str) -> bytes:
+    with open(os.path.join(_DATA_DIRECTORY, name), 'rb') as f:
+        return f.read()
+
+
+@lru_cache(maxsize=None)
+def _default_configuration(fw_nbtar_ranging: int) -> bytes:
+    configuration = bytearray(load_blob('default_configuration.bin'))
+    configuration[_FW_NBTAR_RANGING_OFFSET] = fw_nbtar_ranging
+    return bytes(configuration)
+
 
 class Buffers:
     def __init__(self, vl53_l5_cx_nb_target_per_zone: int = 1) -> None:
@@ -13,21956 +44,9 @@ class Buffers:
         else:
             self.VL53L5CX_FW_NBTAR_RANGING = vl53_l5_cx_nb_target_per_zone
 
-        self.VL53L5CX_FIRMWARE = [
-             0xe0, 0x04, 0x07, 0x68,
-             0xe0, 0x04, 0x0f, 0x28,
-             0xe0, 0x04, 0x09, 0x68,
-             0xe0, 0x64, 0x17, 0x68,
-             0xe0, 0x04, 0x0e, 0xe8,
-             0xe0, 0x04, 0x0e, 0xe8,
-             0xe0, 0x04, 0x0e, 0xe8,
-             0xe0, 0x04, 0x0e, 0xe8,
-             0xe0, 0x64, 0x39, 0xa8,
-             0xe0, 0x64, 0x3d, 0x68,
-             0xe0, 0x68, 0x00, 0x68,
-             0xe0, 0x68, 0x06, 0xa8,
-             0xe0, 0x68, 0x0f, 0x88,
-             0xe0, 0x68, 0x22, 0x88,
-             0xe0, 0x68, 0x26, 0x68,
-             0xe0, 0x68, 0x29, 0xe8,
-             0xe0, 0x68, 0x30, 0xc8,
-             0xe0, 0x68, 0x33, 0xe8,
-             0xe0, 0x04, 0x0e, 0x48,
-             0xe0, 0x04, 0x0e, 0x28,
-             0xe0, 0x04, 0x0e, 0x08,
-             0xe0, 0x04, 0x0d, 0xe8,
-             0xe0, 0x04, 0x0d, 0xc8,
-             0xe0, 0x04, 0x0d, 0xa8,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0xc1, 0xc3, 0x00, 0x00,
-             0xf8, 0x02, 0x00, 0x06,
-             0xc1, 0xc3, 0x81, 0x01,
-             0x1e, 0x06, 0xa1, 0x0b,
-             0x1a, 0x06, 0x81, 0x00,
-             0x99, 0x23, 0xe1, 0x00,
-             0x97, 0xb3, 0x97, 0xe3,
-             0x06, 0x2c, 0x97, 0x73,
-             0x06, 0x34, 0xe2, 0xc0,
-             0x06, 0x2c, 0xfc, 0x80,
-             0xc1, 0x83, 0xe3, 0x40,
-             0xe2, 0xc0, 0x06, 0x1c,
-             0xfc, 0x98, 0x06, 0x34,
-             0xfc, 0x9c, 0x06, 0x34,
-             0xe3, 0x40, 0x06, 0x1c,
-             0x69, 0x38, 0xc1, 0x83,
-             0xc1, 0x43, 0xe8, 0x00,
-             0xc1, 0xc3, 0x81, 0x05,
-             0xe1, 0x00, 0x00, 0x0c,
-             0xfa, 0x04, 0x5e, 0x65,
-             0xec, 0x10, 0x0c, 0xf0,
-             0xf4, 0x1c, 0x5e, 0x60,
-             0xbc, 0x6e, 0x88, 0x61,
-             0xff, 0x84, 0x07, 0xfc,
-             0x9a, 0x14, 0xd8, 0x04,
-             0xe4, 0x30, 0x04, 0x60,
-             0xfc, 0x12, 0x4c, 0x06,
-             0xe0, 0xd0, 0x4c, 0x4a,
-             0xc1, 0xc3, 0x82, 0x15,
-             0xc1, 0xc3, 0xc1, 0xc3,
-             0xf8, 0x04, 0x17, 0x0c,
-             0x81, 0x93, 0x81, 0x83,
-             0xe2, 0xc0, 0x0c, 0x2c,
-             0x1c, 0x8c, 0xd1, 0x67,
-             0xe3, 0x6b, 0xe4, 0x04,
-             0xe5, 0x6b, 0x8e, 0x05,
-             0x80, 0x60, 0x0e, 0x48,
-             0x0f, 0x98, 0xe7, 0x6b,
-             0xe9, 0x6b, 0x80, 0x60,
-             0xeb, 0x6b, 0x8a, 0xc5,
-             0x80, 0x60, 0x10, 0xc8,
-             0x15, 0x18, 0xed, 0x6b,
-             0xf1, 0x6b, 0x80, 0x60,
-             0x80, 0x60, 0x11, 0xe8,
-             0x13, 0x38, 0xf3, 0x6b,
-             0xf5, 0x6b, 0x80, 0x60,
-             0xf7, 0x6b, 0x8a, 0xc5,
-             0xf9, 0x6b, 0x8c, 0x05,
-             0xfb, 0x6b, 0x8c, 0x45,
-             0x0c, 0x0a, 0x8a, 0x45,
-             0x8a, 0x65, 0xe4, 0xb4,
-             0xe4, 0xb8, 0x0c, 0x0a,
-             0x15, 0x38, 0x84, 0x45,
-             0x40, 0x06, 0xe0, 0x60,
-             0x40, 0x4a, 0xfc, 0x12,
-             0x80, 0xd5, 0xe0, 0xd0,
-             0xc1, 0xc3, 0xc1, 0xc3,
-             0x1f, 0x0c, 0xc1, 0xc3,
-             0x0f, 0xfc, 0xf0, 0x04,
-             0xbc, 0xf4, 0xf7, 0x84,
-             0xc1, 0x53, 0xfd, 0x64,
-             0xe0, 0x80, 0x00, 0x0c,
-             0xe0, 0x80, 0x00, 0x0c,
-             0xe0, 0x80, 0x00, 0x0c,
-             0xe0, 0x80, 0x00, 0x0c,
-             0xe0, 0x80, 0x00, 0x0c,
-             0xe0, 0x80, 0x00, 0x0c,
-             0xe0, 0x80, 0x00, 0x0c,
-             0xe0, 0x80, 0x00, 0x0c,
-             0xe0, 0x80, 0x00, 0x0c,
-             0xe0, 0x80, 0x00, 0x0c,
-             0xe0, 0x80, 0x00, 0x0c,
-             0xe0, 0x80, 0x00, 0x0c,
-             0xc1, 0xc3, 0xc1, 0x43,
-             0xc1, 0xc3, 0xc1, 0x53,
-             0xfa, 0xfc, 0x04, 0x0c,
-             0x60, 0x00, 0x06, 0xda,
-             0x0a, 0x20, 0xa1, 0x0b,
-             0x18, 0x30, 0x64, 0x00,
-             0x0e, 0x24, 0xe4, 0x00,
-             0x02, 0x0a, 0x37, 0x80,
-             0x0c, 0x06, 0x80, 0x00,
-             0x08, 0x34, 0x20, 0x00,
-             0x0a, 0x70, 0xb7, 0x80,
-             0x58, 0x42, 0xa4, 0x04,
-             0x81, 0x61, 0x32, 0x98,
-             0x21, 0x2b, 0xaa, 0x45,
-             0x06, 0x0a, 0x8c, 0xbb,
-             0x0c, 0x10, 0x00, 0x00,
-             0x04, 0x00, 0xe4, 0x00,
-             0x18, 0x1a, 0x64, 0x00,
-             0xa8, 0x25, 0xe0, 0x00,
-             0x08, 0x04, 0xa1, 0x1d,
-             0x0e, 0x14, 0x57, 0x80,
-             0x10, 0x06, 0xd7, 0x80,
-             0x04, 0x40, 0x40, 0x00,
-             0x08, 0x54, 0xc4, 0x04,
-             0x4c, 0x72, 0x76, 0x80,
-             0x10, 0xc4, 0xd2, 0xa0,
-             0x14, 0x40, 0x76, 0x80,
-             0x0e, 0x64, 0xa4, 0x80,
-             0x12, 0x24, 0xf6, 0x80,
-             0xa1, 0x6b, 0x76, 0x80,
-             0x3c, 0x01, 0x54, 0x80,
-             0x8c, 0x8b, 0x40, 0x00,
-             0x04, 0x80, 0x08, 0x90,
-             0xdc, 0x00, 0x48, 0x70,
-             0x84, 0x9b, 0x28, 0xa3,
-             0xec, 0x04, 0x0e, 0xa0,
-             0x9e, 0xe5, 0xa0, 0x7d,
-             0x96, 0x4b, 0x21, 0x7b,
-             0x0e, 0x8a, 0x86, 0x45,
-             0x0e, 0x9a, 0xe5, 0x00,
-             0x00, 0x06, 0x44, 0x80,
-             0x16, 0xa0, 0x80, 0x00,
-             0x08, 0x54, 0x2c, 0x84,
-             0xc0, 0x00, 0x28, 0x9c,
-             0x20, 0x01, 0x0e, 0x4a,
-             0x00, 0x54, 0x40, 0x00,
-             0x00, 0xc4, 0xa8, 0xac,
-             0xc0, 0x00, 0x28, 0x9d,
-             0x0f, 0x9c, 0x14, 0x54,
-             0x40, 0x02, 0x88, 0x5b,
-             0x80, 0xcb, 0x99, 0xa8,
-             0x61, 0x84, 0x00, 0x84,
-             0xe1, 0x84, 0x08, 0x94,
-             0x12, 0x84, 0x01, 0xcb,
-             0x32, 0x4f, 0xe0, 0xfc,
-             0xe4, 0x04, 0x1c, 0x70,
-             0x4b, 0x0a, 0x01, 0xa1,
-             0x58, 0xda, 0x84, 0x10,
-             0x94, 0xbb, 0x64, 0x00,
-             0x6d, 0x84, 0x40, 0x1a,
-             0x1c, 0x70, 0xc6, 0x1f,
-             0x00, 0xc4, 0x24, 0x08,
-             0x0e, 0x54, 0xa0, 0x84,
-             0x08, 0x54, 0x21, 0xfc,
-             0x40, 0x02, 0xa0, 0x84,
-             0xa1, 0xeb, 0x39, 0x9c,
-             0x3c, 0x00, 0x58, 0x00,
-             0xbc, 0x00, 0x4a, 0x40,
-             0x1d, 0x5a, 0x08, 0xc5,
-             0x0e, 0xe0, 0xe0, 0x04,
-             0x0d, 0xcb, 0xec, 0x04,
-             0xe1, 0xfc, 0x00, 0xa4,
-             0x4b, 0x0a, 0x42, 0xb7,
-             0x58, 0xfa, 0x84, 0x08,
-             0x08, 0xc4, 0x64, 0x18,
-             0x10, 0xa4, 0xe0, 0xfc,
-             0x40, 0x0a, 0x60, 0x84,
-             0x20, 0xbf, 0xed, 0x8c,
-             0x00, 0x54, 0x90, 0xab,
-             0x14, 0x84, 0x61, 0x84,
-             0x28, 0x0f, 0x9c, 0x80,
-             0x91, 0x94, 0x48, 0x22,
-             0x13, 0xb0, 0x4a, 0x62,
-             0x4c, 0x50, 0xc3, 0xc7,
-             0x80, 0x5b, 0x1c, 0x00,
-             0x27, 0xf0, 0x4e, 0xd8,
-             0x9c, 0x00, 0x44, 0x40,
-             0x96, 0x0b, 0x21, 0x1d,
-             0x57, 0x80, 0x04, 0xa4,
-             0xd7, 0x80, 0x02, 0xb4,
-             0x40, 0x00, 0x06, 0x06,
-             0xc4, 0x04, 0x04, 0x20,
-             0x52, 0x8c, 0x42, 0x12,
-             0x40, 0x10, 0x94, 0x6b,
-             0x4c, 0x20, 0x5c, 0x00,
-             0x80, 0x1b, 0xdc, 0x00,
-             0x0c, 0x0c, 0x8c, 0x0b,
-             0xdd, 0x93, 0xf2, 0xfc,
-             0x8c, 0x1b, 0x7f, 0xc5,
-             0x80, 0x6b, 0x7f, 0xa5,
-             0x96, 0x7b, 0x73, 0xe5,
-             0xfa, 0x3c, 0x04, 0x0c,
-             0x81, 0xc1, 0x21, 0x0b,
-             0x00, 0x00, 0x02, 0x0a,
-             0xa0, 0x85, 0x98, 0x6b,
-             0x76, 0x80, 0x0a, 0x14,
-             0x08, 0x24, 0xa1, 0x2b,
-             0x06, 0x0a, 0x76, 0x80,
-             0x0c, 0x04, 0x80, 0x00,
-             0x98, 0x8b, 0x76, 0x80,
-             0x06, 0x1a, 0x1e, 0xc5,
-             0x18, 0x34, 0xe0, 0x00,
-             0xa1, 0x1b, 0x76, 0x80,
-             0xa4, 0x80, 0x0e, 0x40,
-             0x3c, 0x01, 0x4e, 0xc0,
-             0x08, 0x60, 0xc0, 0x00,
-             0x48, 0x50, 0x04, 0x80,
-             0xa8, 0x73, 0xdc, 0x00,
-             0xec, 0x04, 0x0a, 0x70,
-             0x9a, 0xc5, 0xa0, 0x5d,
-             0x90, 0xcb, 0x21, 0x5b,
-             0x0a, 0x8a, 0x86, 0x45,
-             0x0a, 0x9a, 0xe5, 0x00,
-             0x08, 0x06, 0x44, 0x80,
-             0x10, 0x70, 0x80, 0x00,
-             0x0a, 0x4a, 0x2c, 0x84,
-             0xc0, 0x00, 0x20, 0x00,
-             0x28, 0x95, 0x08, 0x34,
-             0x0c, 0x24, 0x40, 0x00,
-             0x08, 0x24, 0x8f, 0x94,
-             0x18, 0x24, 0x28, 0xa0,
-             0xc0, 0x00, 0x28, 0x94,
-             0x19, 0x98, 0x48, 0x42,
-             0x88, 0x3b, 0x98, 0x2b,
-             0x61, 0x84, 0x08, 0x14,
-             0xe0, 0xfc, 0x0c, 0x14,
-             0x61, 0x84, 0x18, 0x04,
-             0x2c, 0xcf, 0x89, 0x3b,
-             0xe4, 0x10, 0x46, 0xda,
-             0x04, 0x30, 0x45, 0x0a,
-             0xe4, 0x04, 0x12, 0x50,
-             0x6d, 0x84, 0x40, 0x1a,
-             0x12, 0x50, 0x81, 0xc1,
-             0x0c, 0x24, 0x24, 0x08,
-             0x08, 0x34, 0xa1, 0xfc,
-             0x0a, 0x24, 0x20, 0x84,
-             0x48, 0x42, 0xa0, 0x84,
-             0xa1, 0x9b, 0x39, 0x98,
-             0x3c, 0x00, 0x46, 0x40,
-             0xbc, 0x00, 0x44, 0x50,
-             0x13, 0x5a, 0x18, 0x6b,
-             0x88, 0xc5, 0xe0, 0x04,
-             0xec, 0x04, 0x0e, 0x90,
-             0x46, 0xfa, 0x03, 0x3b,
-             0x45, 0x0a, 0xe4, 0x04,
-             0x0a, 0x24, 0x04, 0x00,
-             0x10, 0x34, 0xe1, 0x84,
-             0xc2, 0x67, 0x60, 0xfc,
-             0x60, 0x84, 0x1c, 0xc4,
-             0xed, 0x8c, 0x40, 0x0a,
-             0x61, 0x84, 0x08, 0x34,
-             0x10, 0xc4, 0xb0, 0x5f,
-             0x9c, 0xcb, 0x61, 0xfc,
-             0x50, 0x02, 0x30, 0x6f,
-             0x44, 0x12, 0x91, 0x88,
-             0x88, 0x3b, 0x13, 0x8c,
-             0x1c, 0x00, 0x42, 0x20,
-             0x40, 0x80, 0x8a, 0x2b,
-             0x18, 0xe4, 0x1c, 0x00,
-             0x4f, 0xd8, 0x9c, 0x80,
-             0x18, 0x0b, 0xa7, 0xec,
-             0x0c, 0x0c, 0x8c, 0x1b,
-             0xdd, 0x93, 0xf2, 0x3c,
-             0x82, 0x6b, 0x00, 0xcb,
-             0x75, 0xf5, 0xff, 0x95,
-             0xc1, 0xc3, 0x90, 0x5b,
-             0xfa, 0xfc, 0x04, 0x0c,
-             0x80, 0x8b, 0x21, 0x0b,
-             0x00, 0x00, 0x02, 0x0a,
-             0x04, 0x6b, 0x82, 0x9b,
-             0x80, 0xe5, 0x86, 0x7b,
-             0x06, 0x0a, 0xa1, 0x2b,
-             0x40, 0x0a, 0x80, 0x00,
-             0x80, 0xe5, 0xe5, 0x9c,
-             0x84, 0x1b, 0x81, 0x21,
-             0x0c, 0x0c, 0x84, 0x0b,
-             0xdd, 0x93, 0xf2, 0xfc,
-             0x68, 0x00, 0x41, 0x88,
-             0x00, 0xbb, 0x84, 0x1b,
-             0x02, 0xab, 0x90, 0x0b,
-             0x41, 0x18, 0x8e, 0x1b,
-             0x00, 0x7b, 0xe8, 0x00,
-             0x40, 0xd8, 0x92, 0x0b,
-             0x8c, 0x1b, 0x68, 0x00,
-             0x44, 0xb2, 0x81, 0x31,
-             0x42, 0xa2, 0xf0, 0x8c,
-             0x86, 0x23, 0xf2, 0x9c,
-             0x42, 0x12, 0x7d, 0x85,
-             0xc1, 0xc3, 0xf2, 0x80,
-             0xe6, 0x86, 0x4a, 0x0e,
-             0xe7, 0x06, 0x58, 0x0e,
-             0x66, 0x06, 0x46, 0x0e,
-             0xe1, 0xc0, 0x08, 0x54,
-             0x67, 0x86, 0x44, 0x0e,
-             0xe0, 0xc0, 0x00, 0xc4,
-             0x02, 0xc4, 0x60, 0x57,
-             0x8a, 0x03, 0xe1, 0xc0,
-             0xf2, 0x90, 0x42, 0x12,
-             0x5d, 0x93, 0x86, 0x03,
-             0xf2, 0x88, 0x42, 0x12,
-             0xe5, 0x00, 0x04, 0xca,
-             0xc1, 0x7c, 0x02, 0x14,
-             0xdc, 0x00, 0x40, 0x10,
-             0x84, 0x80, 0x04, 0xca,
-             0xcc, 0x80, 0x04, 0x20,
-             0xc9, 0x08, 0x00, 0x14,
-             0xc1, 0x7c, 0x02, 0x14,
-             0x80, 0x00, 0x04, 0x5a,
-             0xad, 0x88, 0x06, 0x14,
-             0x20, 0x01, 0x06, 0x06,
-             0x00, 0x04, 0xc0, 0x00,
-             0x02, 0x14, 0x89, 0x88,
-             0x40, 0x02, 0x89, 0x08,
-             0xdd, 0x93, 0x99, 0x8c,
-             0xe5, 0x00, 0x04, 0xca,
-             0xc0, 0x00, 0x02, 0x06,
-             0xc0, 0x00, 0x00, 0x06,
-             0x84, 0x80, 0x04, 0xca,
-             0xcc, 0x80, 0x04, 0x20,
-             0xc9, 0x88, 0x00, 0x14,
-             0xc0, 0x00, 0x02, 0x06,
-             0x80, 0x00, 0x04, 0x5a,
-             0xad, 0x88, 0x06, 0x14,
-             0x20, 0x01, 0x06, 0x06,
-             0x00, 0x04, 0xc0, 0x00,
-             0x02, 0x14, 0x89, 0x88,
-             0x40, 0x02, 0x89, 0x88,
-             0xdd, 0x93, 0x99, 0x8c,
-             0x81, 0x41, 0x61, 0x0b,
-             0x06, 0x14, 0x8a, 0x25,
-             0xe1, 0x1b, 0x76, 0x80,
-             0x76, 0x80, 0x04, 0x04,
-             0x08, 0x85, 0x81, 0x41,
-             0x06, 0x30, 0xa4, 0x33,
-             0x04, 0x04, 0x6c, 0x04,
-             0xa0, 0x3d, 0xe1, 0x84,
-             0xa1, 0x3b, 0x86, 0xe5,
-             0xc8, 0x8c, 0x02, 0x14,
-             0x64, 0x04, 0x18, 0x30,
-             0xe4, 0x08, 0x43, 0x1a,
-             0x24, 0x08, 0x18, 0x30,
-             0xa0, 0x84, 0x02, 0x14,
-             0x0a, 0xc0, 0x21, 0xcb,
-             0x19, 0x5a, 0xec, 0x04,
-             0x82, 0x45, 0xe0, 0x04,
-             0xc2, 0x47, 0x40, 0x1d,
-             0x1c, 0x80, 0x08, 0x44,
-             0x91, 0x84, 0x40, 0x02,
-             0x27, 0xfc, 0x4a, 0x98,
-             0x5d, 0x93, 0xc3, 0x17,
-             0x7f, 0xe5, 0x88, 0x0b,
-             0x7d, 0x55, 0x80, 0x4b,
-             0xc1, 0xc3, 0x88, 0x3b,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x81, 0x11, 0x00, 0x6b,
-             0xe8, 0x04, 0x50, 0x68,
-             0xe1, 0x98, 0x41, 0xc6,
-             0x00, 0x15, 0x80, 0x04,
-             0xa1, 0x1b, 0xe0, 0x3c,
-             0xdc, 0x38, 0x42, 0x08,
-             0x68, 0x04, 0x57, 0xe8,
-             0xc1, 0xc3, 0x8c, 0x0b,
-             0xfa, 0x04, 0x04, 0x7c,
-             0x74, 0x39, 0x07, 0x0e,
-             0x09, 0xce, 0xc0, 0x10,
-             0xc0, 0x10, 0x74, 0x39,
-             0x88, 0x25, 0x89, 0x3d,
-             0xcd, 0x14, 0xcd, 0x04,
-             0x05, 0x0a, 0xcd, 0x24,
-             0x4a, 0x00, 0xe0, 0x80,
-             0x84, 0x25, 0xf0, 0x0c,
-             0xe4, 0x00, 0x0a, 0x3a,
-             0x60, 0x01, 0x00, 0x98,
-             0x04, 0x20, 0x80, 0x00,
-             0xc1, 0x16, 0xec, 0x04,
-             0xf8, 0x0c, 0x00, 0x4a,
-             0x04, 0x20, 0xfe, 0x65,
-             0xe9, 0x2d, 0xec, 0x10,
-             0xfe, 0x85, 0xc1, 0x1e,
-             0xe0, 0x04, 0x04, 0xca,
-             0x80, 0x00, 0x45, 0x48,
-             0x45, 0xc8, 0xc1, 0x16,
-             0xfb, 0xf5, 0x87, 0xfc,
-             0xe1, 0x94, 0x00, 0x86,
-             0x61, 0x91, 0x02, 0x86,
-             0x80, 0x1e, 0xc0, 0x00,
-             0x81, 0x11, 0x9b, 0x01,
-             0x81, 0x31, 0x81, 0x21,
-             0xe8, 0x04, 0x4a, 0xa8,
-             0x8c, 0x45, 0xa1, 0x0b,
-             0x74, 0x35, 0x47, 0x8e,
-             0x09, 0x0e, 0xc0, 0x10,
-             0xc0, 0x10, 0x74, 0x39,
-             0x8a, 0x45, 0x89, 0x3d,
-             0xcd, 0x14, 0xcd, 0x04,
-             0x05, 0x0a, 0xcd, 0x24,
-             0x4a, 0x00, 0xe0, 0x80,
-             0x86, 0x25, 0xf0, 0x0c,
-             0xf0, 0x0c, 0x4c, 0x10,
-             0xe4, 0x18, 0x4a, 0x5a,
-             0xe4, 0x00, 0x0a, 0x3a,
-             0xa0, 0x00, 0x01, 0x28,
-             0x60, 0x01, 0x00, 0xa8,
-             0xc5, 0x50, 0x80, 0x00,
-             0xec, 0x04, 0x04, 0x20,
-             0x00, 0x4a, 0xc1, 0x56,
-             0xfe, 0x45, 0xf8, 0x0c,
-             0x04, 0x20, 0xc5, 0x54,
-             0xe9, 0x2d, 0xec, 0x10,
-             0xfe, 0x65, 0xc1, 0x5e,
-             0xe0, 0x04, 0x04, 0xca,
-             0x80, 0x00, 0x45, 0x88,
-             0xc1, 0x56, 0xc5, 0x50,
-             0x87, 0xfc, 0x45, 0x88,
-             0x07, 0x06, 0xfb, 0x65,
-             0x08, 0xf0, 0xe1, 0x90,
-             0x8c, 0x4e, 0xe4, 0x30,
-             0xe1, 0x9c, 0x0d, 0x86,
-             0xe1, 0x9c, 0x0f, 0x86,
-             0x82, 0x45, 0x8f, 0x6d,
-             0x02, 0x3a, 0xd9, 0x14,
-             0x00, 0x68, 0xe4, 0x00,
-             0x80, 0x00, 0x60, 0x01,
-             0xfc, 0x38, 0x42, 0x08,
-             0x81, 0x61, 0xff, 0x65,
-             0x01, 0x86, 0xe1, 0x6b,
-             0x4c, 0x08, 0xe1, 0x9c,
-             0x8b, 0x04, 0xdc, 0x38,
-             0xfe, 0x24, 0x89, 0x14,
-             0xe8, 0x68, 0x6c, 0xa8,
-             0xe1, 0x9c, 0x0d, 0x86,
-             0xe1, 0x9c, 0x0f, 0x86,
-             0x82, 0x45, 0x8f, 0x6d,
-             0x02, 0x3a, 0xd9, 0x14,
-             0x00, 0x68, 0xe4, 0x00,
-             0x80, 0x00, 0x60, 0x01,
-             0xfc, 0x38, 0x42, 0x08,
-             0x75, 0x78, 0xff, 0x65,
-             0x0c, 0x7c, 0xef, 0xfc,
-             0xdd, 0x93, 0xf2, 0x04,
-             0x80, 0x55, 0xa1, 0x1b,
-             0x0a, 0x00, 0x83, 0x11,
-             0x40, 0x06, 0xe5, 0x50,
-             0x40, 0x4a, 0xfc, 0x12,
-             0xd7, 0xf4, 0xe0, 0xd0,
-             0xc1, 0xc3, 0x82, 0xb5,
-             0xc1, 0xc3, 0xc1, 0xc3,
-             0xf4, 0x04, 0x0b, 0x3f,
-             0xf4, 0x04, 0x0b, 0x2f,
-             0xf4, 0x04, 0x0b, 0x1f,
-             0xf4, 0x04, 0x0b, 0x0f,
-             0x0a, 0x50, 0x81, 0x35,
-             0x40, 0x5a, 0xec, 0x40,
-             0x44, 0x06, 0xe0, 0xbc,
-             0x44, 0x6a, 0xbc, 0x22,
-             0x40, 0x4a, 0xa0, 0x90,
-             0xc0, 0x00, 0x20, 0x89,
-             0xed, 0x88, 0x40, 0x1a,
-             0x20, 0x01, 0x01, 0x98,
-             0x0a, 0xff, 0xc0, 0x00,
-             0xc1, 0xc3, 0xf4, 0x04,
-             0xc1, 0xc3, 0xc1, 0xc3,
-             0xf4, 0x04, 0x0b, 0xf5,
-             0xf4, 0x04, 0x0b, 0xe5,
-             0xf4, 0x04, 0x0b, 0xd5,
-             0xf4, 0x04, 0x0b, 0xc5,
-             0xf4, 0x04, 0x0b, 0xb5,
-             0xf4, 0x04, 0x0b, 0xa5,
-             0xf4, 0x04, 0x0b, 0x95,
-             0xf4, 0x04, 0x0b, 0x85,
-             0x0a, 0xff, 0x81, 0x55,
-             0x0a, 0x50, 0xf4, 0x04,
-             0xd7, 0xe4, 0xec, 0x80,
-             0xd7, 0xb4, 0xd7, 0xd4,
-             0xd7, 0x94, 0xd7, 0xa4,
-             0xd7, 0x74, 0xd7, 0x84,
-             0x82, 0x0b, 0x94, 0x64,
-             0xfa, 0x00, 0x5c, 0x08,
-             0xe1, 0x00, 0x00, 0x0c,
-             0xf8, 0x3c, 0x04, 0x4c,
-             0xe4, 0x40, 0x04, 0x8a,
-             0x21, 0x2b, 0x80, 0xa5,
-             0x82, 0x15, 0x80, 0x3b,
-             0x46, 0x12, 0x81, 0xf5,
-             0x06, 0x4a, 0xf9, 0x80,
-             0x82, 0xb5, 0xf8, 0x0c,
-             0x04, 0x20, 0x80, 0x3b,
-             0x04, 0x4a, 0xec, 0x04,
-             0xc5, 0x48, 0xe4, 0x00,
-             0x45, 0x88, 0xcd, 0x46,
-             0x0c, 0x4c, 0x87, 0xfc,
-             0xdd, 0x93, 0xf0, 0x3c,
-             0x6c, 0x40, 0x0a, 0x20,
-             0x49, 0x27, 0xe1, 0xc1,
-             0x04, 0x20, 0x8a, 0xcf,
-             0x06, 0xc0, 0x6c, 0x04,
-             0x04, 0x4a, 0xe4, 0x40,
-             0x48, 0x12, 0x64, 0x00,
-             0x00, 0x33, 0xf0, 0x8c,
-             0x02, 0x75, 0x80, 0x6b,
-             0x02, 0x85, 0xf0, 0x10,
-             0x02, 0x95, 0xf8, 0x0c,
-             0x02, 0xa5, 0xf8, 0x08,
-             0x4c, 0x75, 0xf8, 0x04,
-             0x4c, 0x85, 0xf0, 0x10,
-             0x4c, 0x95, 0xf8, 0x0c,
-             0x4c, 0xa5, 0xf8, 0x08,
-             0x44, 0x08, 0xf8, 0x04,
-             0x44, 0x52, 0x87, 0xf8,
-             0xe9, 0x2d, 0xf1, 0xb0,
-             0x0a, 0x20, 0x86, 0x95,
-             0xc5, 0x27, 0x6c, 0x10,
-             0x61, 0x88, 0x0e, 0x54,
-             0xec, 0x04, 0x0c, 0x20,
-             0x64, 0x04, 0x18, 0x70,
-             0xe4, 0x00, 0x0c, 0x4a,
-             0x04, 0x74, 0x44, 0xc7,
-             0x42, 0x42, 0xe0, 0x88,
-             0x86, 0x7b, 0x70, 0xb0,
-             0xdd, 0x8e, 0xd1, 0x84,
-             0x87, 0xfc, 0x4d, 0x88,
-             0x71, 0x88, 0x44, 0x52,
-             0xa1, 0x2b, 0x98, 0x33,
-             0xf7, 0xe5, 0xec, 0xf5,
-             0x88, 0x1b, 0x21, 0x2b,
-             0xf7, 0xa5, 0xec, 0x75,
-             0xe1, 0x00, 0x00, 0x0c,
-             0xf8, 0x04, 0x04, 0x0c,
-             0x78, 0x0c, 0x00, 0x0a,
-             0x82, 0x25, 0x80, 0x3b,
-             0x94, 0xa5, 0xa1, 0x2b,
-             0x04, 0x20, 0x4d, 0x16,
-             0x06, 0x4a, 0xec, 0x04,
-             0xfe, 0x25, 0xf8, 0x0c,
-             0x90, 0x95, 0xe9, 0x2d,
-             0x7a, 0x80, 0x08, 0x14,
-             0xe4, 0x40, 0x04, 0x8a,
-             0xe0, 0xa0, 0x0a, 0x44,
-             0x08, 0x54, 0xa8, 0x5f,
-             0x06, 0xf5, 0xe0, 0xc0,
-             0x0c, 0x24, 0xaa, 0x4f,
-             0x0a, 0x20, 0x61, 0x90,
-             0x61, 0xc1, 0xec, 0x40,
-             0xec, 0x04, 0x0c, 0x60,
-             0x0c, 0x4a, 0x0a, 0xcf,
-             0x4e, 0x32, 0xe4, 0x00,
-             0x86, 0x2b, 0x70, 0xb0,
-             0xe4, 0x40, 0x06, 0x70,
-             0xf0, 0x10, 0x44, 0x45,
-             0xf8, 0x0c, 0x44, 0x45,
-             0xf8, 0x08, 0x44, 0x45,
-             0xf8, 0x04, 0x44, 0x45,
-             0x87, 0xfc, 0x4c, 0x08,
-             0xf1, 0xb0, 0x44, 0x52,
-             0x86, 0x95, 0xe9, 0x2d,
-             0xf9, 0xc1, 0x07, 0x51,
-             0x4a, 0x52, 0xa4, 0x53,
-             0x04, 0x53, 0xfa, 0xb0,
-             0xec, 0x10, 0x04, 0x20,
-             0x0e, 0x24, 0x08, 0x51,
-             0x45, 0x57, 0xe1, 0x88,
-             0xe4, 0x04, 0x18, 0x70,
-             0x6c, 0x04, 0x0c, 0x50,
-             0xe0, 0x88, 0x0a, 0x74,
-             0x64, 0x00, 0x0c, 0x4a,
-             0xdd, 0x4e, 0x86, 0x7b,
-             0x87, 0xfc, 0x4d, 0xc8,
-             0xaa, 0x23, 0x44, 0xc7,
-             0xa1, 0x2b, 0x98, 0x33,
-             0x04, 0x20, 0x82, 0x05,
-             0x04, 0x4a, 0xec, 0x04,
-             0xcd, 0x16, 0xe4, 0x00,
-             0x87, 0xfc, 0x45, 0xc8,
-             0xf0, 0x04, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfe, 0x7c, 0x04, 0x0c,
-             0x04, 0x4a, 0x00, 0x7b,
-             0x40, 0x72, 0xe0, 0x10,
-             0x1e, 0xf0, 0x79, 0x88,
-             0x00, 0x0c, 0xed, 0x20,
-             0x00, 0x1a, 0x62, 0x00,
-             0x11, 0x0e, 0xf8, 0x0c,
-             0x1b, 0x0e, 0x82, 0x8b,
-             0x20, 0x01, 0x00, 0x26,
-             0x5e, 0x05, 0xc0, 0x00,
-             0x40, 0x00, 0x20, 0x35,
-             0x23, 0x3e, 0xef, 0x8d,
-             0x5e, 0x17, 0xa4, 0x0b,
-             0x9d, 0x2e, 0xe0, 0xfc,
-             0x23, 0x88, 0xa1, 0x0e,
-             0x00, 0x24, 0xc0, 0x00,
-             0xc4, 0x1b, 0x61, 0x88,
-             0xc0, 0x3b, 0x7d, 0x41,
-             0x7a, 0x10, 0x42, 0x12,
-             0xfa, 0x10, 0x46, 0x32,
-             0x84, 0x13, 0x00, 0x33,
-             0x82, 0x11, 0x3e, 0x1e,
-             0x82, 0x31, 0x7c, 0x3e,
-             0x00, 0x20, 0x19, 0x1e,
-             0x97, 0x3e, 0xec, 0x04,
-             0x00, 0x84, 0xfe, 0x0e,
-             0xaf, 0x8b, 0x61, 0x84,
-             0x54, 0x0a, 0x15, 0x8e,
-             0x2e, 0xa5, 0xe6, 0x8a,
-             0x00, 0x80, 0x8e, 0xa3,
-             0x10, 0x8a, 0x6c, 0x04,
-             0x40, 0x0a, 0xe4, 0xa4,
-             0x56, 0x72, 0xe6, 0x8a,
-             0x40, 0x70, 0x70, 0x80,
-             0xa2, 0xb5, 0xdc, 0x00,
-             0x00, 0x84, 0x0f, 0xbe,
-             0x23, 0xb4, 0xe1, 0x8c,
-             0xe6, 0x8a, 0x4c, 0x0a,
-             0x60, 0x84, 0x00, 0x64,
-             0xf0, 0x98, 0x50, 0x72,
-             0x8e, 0x03, 0x0d, 0x0e,
-             0x8e, 0x0b, 0x0b, 0x0e,
-             0x56, 0x08, 0x90, 0x1b,
-             0x13, 0x8e, 0xfc, 0x38,
-             0x0b, 0x84, 0x80, 0x9b,
-             0x90, 0x1b, 0x90, 0x0b,
-             0xfc, 0x38, 0x56, 0x08,
-             0x82, 0x9d, 0xff, 0x11,
-             0xa0, 0x0d, 0x82, 0x85,
-             0x0e, 0x0b, 0x84, 0xd5,
-             0xa3, 0x24, 0x90, 0x1b,
-             0xfc, 0x38, 0x44, 0x08,
-             0x8e, 0x0b, 0x21, 0x0d,
-             0x81, 0xc5, 0x82, 0x85,
-             0x82, 0x75, 0xa1, 0x0d,
-             0x90, 0x1b, 0x0e, 0x0b,
-             0x44, 0x08, 0xa3, 0x24,
-             0x21, 0x0d, 0xfc, 0x38,
-             0x80, 0x45, 0x8e, 0x0b,
-             0x93, 0x0e, 0x90, 0x0b,
-             0x50, 0xa2, 0x2c, 0x0b,
-             0x23, 0x64, 0xf1, 0x98,
-             0xf0, 0x98, 0x56, 0xa2,
-             0x90, 0x0b, 0x0b, 0x0e,
-             0x4c, 0x08, 0x94, 0x1b,
-             0x00, 0x9b, 0xfc, 0x38,
-             0x09, 0xbe, 0x94, 0x0b,
-             0x4c, 0x08, 0x96, 0x1b,
-             0xff, 0x11, 0xfc, 0x38,
-             0x82, 0xa5, 0x82, 0x9d,
-             0x84, 0xd5, 0xa0, 0x0d,
-             0x90, 0x0b, 0x09, 0x64,
-             0x8c, 0x1b, 0xa3, 0x24,
-             0xfc, 0x38, 0x44, 0x08,
-             0x01, 0xd5, 0xa1, 0x0d,
-             0x9c, 0x00, 0x50, 0x60,
-             0x82, 0x55, 0xa1, 0x0d,
-             0x90, 0x0b, 0x09, 0xa4,
-             0x94, 0x1b, 0xa3, 0x24,
-             0xfc, 0x38, 0x44, 0x08,
-             0x80, 0x55, 0xa1, 0x0d,
-             0x8f, 0xb4, 0x90, 0xab,
-             0x8d, 0x14, 0x8b, 0x94,
-             0x96, 0x93, 0xa3, 0x64,
-             0x71, 0x84, 0x40, 0xb2,
-             0x8d, 0x0e, 0x92, 0x1b,
-             0xfc, 0x38, 0x4c, 0x08,
-             0x92, 0x0b, 0x00, 0x8b,
-             0x4c, 0x08, 0x96, 0x1b,
-             0xff, 0x11, 0xfc, 0x38,
-             0x82, 0xc5, 0x82, 0x8d,
-             0xa0, 0x0d, 0x15, 0x84,
-             0x0d, 0x64, 0x86, 0x15,
-             0xa3, 0x24, 0x96, 0x1b,
-             0x44, 0x08, 0x8c, 0x0b,
-             0xa1, 0x0d, 0xfc, 0x38,
-             0x4c, 0xb0, 0x01, 0xe5,
-             0x15, 0x84, 0x9c, 0x00,
-             0x82, 0x75, 0xa1, 0x0d,
-             0x96, 0x1b, 0x0d, 0x64,
-             0x8c, 0x0b, 0xa3, 0x24,
-             0xfc, 0x38, 0x44, 0x08,
-             0x80, 0x95, 0xa1, 0x0d,
-             0x8c, 0xbb, 0x01, 0x35,
-             0x93, 0x04, 0x92, 0xbb,
-             0x94, 0x1b, 0x23, 0x64,
-             0x4c, 0x08, 0x93, 0x0e,
-             0x00, 0x9b, 0xfc, 0x38,
-             0x96, 0x1b, 0x94, 0x0b,
-             0xfc, 0x38, 0x4c, 0x08,
-             0x82, 0x9d, 0xff, 0x11,
-             0xa0, 0x0d, 0x82, 0x85,
-             0x13, 0xa4, 0x84, 0xd5,
-             0xa3, 0x24, 0x96, 0x1b,
-             0x44, 0x08, 0x94, 0x0b,
-             0xa1, 0x0d, 0xfc, 0x38,
-             0x81, 0xd5, 0x82, 0xa5,
-             0x82, 0x75, 0xa1, 0x0d,
-             0x96, 0x1b, 0x13, 0x64,
-             0x8c, 0x0b, 0xa3, 0x24,
-             0xfc, 0x38, 0x44, 0x08,
-             0x56, 0x60, 0xa1, 0x0d,
-             0x96, 0xab, 0x9c, 0x00,
-             0x00, 0x2a, 0x9b, 0x04,
-             0x01, 0x18, 0xe0, 0x00,
-             0x80, 0x00, 0x40, 0x01,
-             0xe0, 0xfc, 0x1e, 0x07,
-             0x17, 0x14, 0x84, 0x35,
-             0x02, 0x4a, 0x8e, 0x0b,
-             0x80, 0x24, 0xe4, 0x00,
-             0xc1, 0x3e, 0xa8, 0x34,
-             0x43, 0x08, 0xe9, 0x2e,
-             0x83, 0x05, 0x87, 0xfc,
-             0xa8, 0x14, 0x9c, 0x04,
-             0xa8, 0x0e, 0x9c, 0x1e,
-             0x19, 0x14, 0x81, 0xb5,
-             0x02, 0x4a, 0x8e, 0x0b,
-             0x80, 0x28, 0xe4, 0x00,
-             0xc1, 0x36, 0xa8, 0x38,
-             0x43, 0x08, 0xe9, 0x26,
-             0x1d, 0x14, 0x87, 0xfc,
-             0xec, 0x04, 0x00, 0x80,
-             0x50, 0x0a, 0x81, 0x61,
-             0x40, 0x72, 0x66, 0x86,
-             0x1b, 0x0e, 0xf0, 0x84,
-             0x0e, 0x83, 0x80, 0xab,
-             0x90, 0xbb, 0x80, 0x9b,
-             0x8c, 0xd5, 0xd6, 0xad,
-             0x8e, 0x1b, 0x14, 0x0b,
-             0x44, 0x08, 0xa3, 0x24,
-             0xa0, 0x0d, 0xfc, 0x38,
-             0xa1, 0x0b, 0x8a, 0xf5,
-             0x9d, 0x04, 0x92, 0x05,
-             0xa1, 0x0b, 0x8d, 0xb5,
-             0xc0, 0x40, 0x1e, 0x05,
-             0x01, 0x28, 0x88, 0xd5,
-             0x80, 0x00, 0x40, 0x01,
-             0xe0, 0xfc, 0x1e, 0x07,
-             0x17, 0x24, 0x84, 0x55,
-             0x96, 0x1b, 0x90, 0x0b,
-             0xe4, 0x00, 0x04, 0x4a,
-             0x80, 0x44, 0x84, 0x34,
-             0xc1, 0x3e, 0xc5, 0x4e,
-             0x87, 0xfc, 0x45, 0x08,
-             0xac, 0x04, 0x83, 0x15,
-             0xac, 0x1e, 0xa0, 0x14,
-             0x81, 0xc5, 0xa0, 0x0e,
-             0x96, 0x0b, 0x19, 0x24,
-             0x04, 0x4a, 0x90, 0x1b,
-             0x80, 0x38, 0xe4, 0x00,
-             0xc1, 0x46, 0x84, 0x48,
-             0x45, 0x08, 0xc5, 0x36,
-             0x21, 0x04, 0x87, 0xfc,
-             0x80, 0x83, 0x83, 0x61,
-             0xd6, 0xad, 0x80, 0xb3,
-             0x16, 0x0b, 0x94, 0xf5,
-             0xa3, 0x24, 0x8e, 0x1b,
-             0xfc, 0x38, 0x44, 0x08,
-             0xf2, 0xc5, 0xa1, 0x0d,
-             0x40, 0x01, 0x03, 0x98,
-             0x1e, 0x07, 0x80, 0x00,
-             0x8e, 0x35, 0xe0, 0xfc,
-             0x96, 0x0b, 0x17, 0x24,
-             0x04, 0x4a, 0x94, 0x1b,
-             0x84, 0x34, 0xe4, 0x00,
-             0xc5, 0x4e, 0x80, 0x44,
-             0x45, 0x08, 0xc1, 0x3e,
-             0x87, 0x85, 0x87, 0xfc,
-             0x40, 0x01, 0x01, 0x28,
-             0x1e, 0x07, 0x80, 0x00,
-             0x84, 0x55, 0xe0, 0xfc,
-             0x94, 0x0b, 0x17, 0x24,
-             0x04, 0x4a, 0x92, 0x1b,
-             0x84, 0x34, 0xe4, 0x00,
-             0xc5, 0x4e, 0x80, 0x44,
-             0x45, 0x08, 0xc1, 0x3e,
-             0x83, 0x15, 0x87, 0xfc,
-             0xa8, 0x14, 0xa4, 0x04,
-             0xa8, 0x0e, 0xa4, 0x1e,
-             0x19, 0x24, 0x81, 0xc5,
-             0x94, 0x1b, 0x92, 0x0b,
-             0xe4, 0x00, 0x04, 0x4a,
-             0x84, 0x48, 0x80, 0x38,
-             0xc5, 0x36, 0xc1, 0x46,
-             0x87, 0xfc, 0x45, 0x08,
-             0x83, 0x61, 0x1d, 0x04,
-             0x71, 0x95, 0x80, 0x93,
-             0xa8, 0x04, 0x80, 0xa3,
-             0xa8, 0x1e, 0xac, 0x14,
-             0x81, 0xc5, 0xac, 0x0e,
-             0x94, 0x0b, 0x19, 0x24,
-             0x04, 0x4a, 0x96, 0x1b,
-             0x80, 0x38, 0xe4, 0x00,
-             0xc1, 0x46, 0x84, 0x48,
-             0x45, 0x08, 0xc5, 0x36,
-             0x1d, 0x04, 0x87, 0xfc,
-             0x21, 0x04, 0x83, 0x61,
-             0x6f, 0x35, 0x80, 0xa3,
-             0x1d, 0x14, 0x80, 0xb3,
-             0x95, 0x04, 0xa1, 0x6b,
-             0xe6, 0x86, 0x40, 0x0a,
-             0x00, 0x00, 0x0e, 0x88,
-             0xf0, 0x80, 0x58, 0x72,
-             0x71, 0x9c, 0x42, 0x92,
-             0xf1, 0xa4, 0x40, 0xa2,
-             0x92, 0x2b, 0x01, 0x1d,
-             0x44, 0xa0, 0x0e, 0x3b,
-             0x46, 0x90, 0x9c, 0x00,
-             0x48, 0x22, 0x9c, 0x00,
-             0xa1, 0x4b, 0xf1, 0x8c,
-             0x1e, 0x07, 0x8a, 0x25,
-             0x42, 0xa2, 0x60, 0xfc,
-             0x84, 0x55, 0xf1, 0x90,
-             0xfd, 0x31, 0x45, 0x47,
-             0x44, 0x22, 0xc8, 0x2b,
-             0x8e, 0x3b, 0x7a, 0x0c,
-             0x82, 0x21, 0x88, 0x23,
-             0xe4, 0x00, 0x04, 0x4a,
-             0x84, 0x54, 0x8c, 0x44,
-             0xc5, 0x4e, 0xcd, 0x5e,
-             0x87, 0xfc, 0x45, 0x08,
-             0x08, 0x30, 0x83, 0x35,
-             0xfd, 0x51, 0x6c, 0x04,
-             0x82, 0x21, 0x24, 0x43,
-             0xfa, 0x14, 0x48, 0x42,
-             0x26, 0x23, 0x88, 0x23,
-             0x04, 0x4a, 0x8e, 0x3b,
-             0x8c, 0x48, 0xe4, 0x00,
-             0xcd, 0x56, 0x84, 0x58,
-             0x45, 0x08, 0xc5, 0x46,
-             0x1d, 0x24, 0x87, 0xfc,
-             0xf1, 0xa0, 0x42, 0xc2,
-             0xf1, 0xac, 0x52, 0x82,
-             0x44, 0x92, 0xa4, 0x13,
-             0xa1, 0x2b, 0xfb, 0x84,
-             0x1e, 0x07, 0x8c, 0x45,
-             0x84, 0xb5, 0xe0, 0xfc,
-             0x61, 0x88, 0x02, 0x24,
-             0x42, 0x3b, 0xfd, 0x41,
-             0xf1, 0x88, 0x44, 0xc2,
-             0xfa, 0x10, 0x46, 0x32,
-             0x02, 0x30, 0x82, 0x33,
-             0x02, 0x4a, 0xe4, 0x04,
-             0xa8, 0x34, 0xe4, 0x00,
-             0xe9, 0x4e, 0x88, 0x44,
-             0x43, 0x08, 0xc9, 0x3e,
-             0x83, 0xb5, 0x87, 0xfc,
-             0x06, 0xb0, 0x7e, 0x14,
-             0x30, 0x33, 0xec, 0x04,
-             0x90, 0x13, 0x82, 0x21,
-             0x42, 0x12, 0xb8, 0x13,
-             0xfd, 0x31, 0x7a, 0x8c,
-             0xfa, 0x0c, 0x46, 0x12,
-             0xf1, 0x84, 0x42, 0x32,
-             0xe4, 0x00, 0x02, 0x4a,
-             0x46, 0xc2, 0x28, 0x58,
-             0x0e, 0x48, 0xf1, 0x88,
-             0xec, 0x04, 0x04, 0x20,
-             0x8e, 0x56, 0xe9, 0x46,
-             0x87, 0xfc, 0x42, 0x08,
-             0x98, 0x6b, 0x1d, 0x14,
-             0x82, 0x45, 0xc2, 0x0d,
-             0xef, 0xf8, 0x7d, 0xe8,
-             0x8e, 0x0b, 0x00, 0x1b,
-             0xa3, 0x34, 0x9d, 0x24,
-             0xef, 0xfc, 0x5c, 0x68,
-             0xc2, 0x9d, 0x9d, 0x14,
-             0x7d, 0x38, 0xa8, 0x05,
-             0x92, 0x0b, 0x6f, 0xf8,
-             0xf1, 0xa4, 0x4e, 0x62,
-             0x80, 0x8b, 0x1d, 0x24,
-             0xf9, 0x88, 0x40, 0x72,
-             0x00, 0x0a, 0x11, 0x04,
-             0x5e, 0x07, 0xf8, 0x0c,
-             0x1b, 0x0e, 0xe0, 0xfc,
-             0xc0, 0x00, 0x00, 0x26,
-             0x40, 0x34, 0x5e, 0x05,
-             0x1e, 0x08, 0xef, 0x8d,
-             0x40, 0x8a, 0x9f, 0xfc,
-             0x84, 0x0d, 0xe6, 0x8a,
-             0x0e, 0x03, 0xa0, 0xc5,
-             0xf0, 0x88, 0x50, 0x72,
-             0x00, 0x24, 0x19, 0x0e,
-             0x44, 0x1b, 0xe1, 0x88,
-             0x40, 0x3b, 0xfd, 0x21,
-             0xfa, 0x08, 0x42, 0x12,
-             0x44, 0x32, 0x1d, 0x34,
-             0x80, 0x23, 0xfa, 0x08,
-             0xe4, 0x04, 0x16, 0x20,
-             0x0c, 0x10, 0x86, 0x13,
-             0xce, 0x8d, 0xe4, 0x04,
-             0x90, 0x9b, 0x8a, 0xc5,
-             0x92, 0xab, 0x21, 0x94,
-             0x94, 0x1b, 0x23, 0x24,
-             0x92, 0x0b, 0x94, 0x93,
-             0xfc, 0x38, 0x44, 0x08,
-             0x88, 0x75, 0xa3, 0x0d,
-             0xa1, 0x0b, 0x9b, 0x04,
-             0x1e, 0x07, 0x82, 0xe5,
-             0x84, 0x35, 0xe0, 0xfc,
-             0x64, 0x00, 0x16, 0x4a,
-             0x96, 0x1b, 0x92, 0x0b,
-             0x80, 0x34, 0xa8, 0x24,
-             0xc1, 0x2e, 0xe9, 0x3e,
-             0x87, 0xfc, 0x43, 0x08,
-             0xa8, 0x04, 0x83, 0x05,
-             0xa8, 0x1e, 0xa4, 0x14,
-             0x81, 0xb5, 0xa4, 0x0e,
-             0x64, 0x00, 0x0c, 0x4a,
-             0x8c, 0x1b, 0x92, 0x0b,
-             0x80, 0x38, 0xa8, 0x28,
-             0xc1, 0x26, 0xe9, 0x36,
-             0x87, 0xfc, 0x43, 0x08,
-             0xf4, 0xb5, 0xce, 0x9d,
-             0x19, 0x04, 0x9d, 0x04,
-             0xc1, 0x8d, 0x80, 0x83,
-             0x87, 0xd5, 0xf2, 0xb5,
-             0x82, 0x0d, 0x1b, 0xb4,
-             0x8e, 0x25, 0x99, 0xce,
-             0xfc, 0x84, 0xbe, 0x64,
-             0x82, 0x81, 0x82, 0x61,
-             0x8a, 0xc5, 0xce, 0xbd,
-             0x21, 0x94, 0x96, 0x9b,
-             0x23, 0x24, 0x92, 0xab,
-             0x94, 0x93, 0x94, 0x1b,
-             0x44, 0x08, 0x92, 0x0b,
-             0xa3, 0x0d, 0xfc, 0x38,
-             0x01, 0x18, 0x88, 0x75,
-             0x80, 0x00, 0x40, 0x01,
-             0xe0, 0xfc, 0x1e, 0x07,
-             0x10, 0x4a, 0x84, 0x35,
-             0x92, 0x0b, 0x64, 0x00,
-             0xa8, 0x24, 0x90, 0x1b,
-             0xe9, 0x3e, 0x80, 0x34,
-             0x43, 0x08, 0xc1, 0x2e,
-             0x83, 0x05, 0x87, 0xfc,
-             0xa4, 0x14, 0xa8, 0x04,
-             0xa4, 0x0e, 0xa8, 0x1e,
-             0x0c, 0x4a, 0x81, 0xb5,
-             0x92, 0x0b, 0x64, 0x00,
-             0xa8, 0x28, 0x8c, 0x1b,
-             0xe9, 0x36, 0x80, 0x38,
-             0x43, 0x08, 0xc1, 0x26,
-             0xce, 0x9d, 0x87, 0xfc,
-             0x9d, 0x04, 0xf4, 0xb5,
-             0x80, 0xb3, 0x19, 0x04,
-             0xf2, 0xb5, 0xc1, 0xbd,
-             0xe5, 0x20, 0x1e, 0xf0,
-             0xf6, 0x7c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x04, 0xfc, 0x80, 0x5b,
-             0x40, 0x06, 0xe2, 0xc0,
-             0xd5, 0x6e, 0xfc, 0x12,
-             0xd5, 0x8e, 0xd5, 0x7e,
-             0x40, 0x5a, 0xd5, 0x9e,
-             0x42, 0x06, 0xe0, 0xbc,
-             0xd5, 0xae, 0xbc, 0x22,
-             0xd5, 0xde, 0xd5, 0xbe,
-             0x42, 0x6a, 0xd5, 0xee,
-             0x40, 0x4a, 0xa0, 0x90,
-             0xc0, 0x00, 0x20, 0x89,
-             0xed, 0x88, 0x40, 0x1a,
-             0x20, 0x01, 0x01, 0x78,
-             0xc1, 0xc3, 0xc0, 0x00,
-             0xc1, 0xc3, 0xc1, 0xc3,
-             0xf0, 0x04, 0x4b, 0x85,
-             0xf0, 0x04, 0x4b, 0x95,
-             0xf0, 0x04, 0x4b, 0xa5,
-             0xf0, 0x04, 0x4b, 0xb5,
-             0xf0, 0x04, 0x4b, 0xc5,
-             0xf0, 0x04, 0x4b, 0xd5,
-             0xf0, 0x04, 0x4b, 0xe5,
-             0xf0, 0x04, 0x4b, 0xf5,
-             0xc2, 0x1f, 0x81, 0xa5,
-             0xd5, 0x1e, 0xd5, 0x1e,
-             0xd5, 0x1e, 0xd5, 0x1e,
-             0xd5, 0x1e, 0xd5, 0x1e,
-             0xd5, 0x1e, 0xd5, 0x1e,
-             0xe0, 0xd0, 0x40, 0x4a,
-             0x82, 0xb5, 0xd5, 0x2e,
-             0xc1, 0xc3, 0xc1, 0xc3,
-             0x4b, 0x0f, 0xc1, 0xc3,
-             0x4b, 0x1f, 0xf0, 0x04,
-             0x4b, 0x2f, 0xf0, 0x04,
-             0x4b, 0x3f, 0xf0, 0x04,
-             0x81, 0x65, 0xf0, 0x04,
-             0xd5, 0x1e, 0xc2, 0x1f,
-             0xd5, 0x1e, 0xd5, 0x1e,
-             0x94, 0xfe, 0xd5, 0x1e,
-             0xdd, 0x93, 0x81, 0x01,
-             0xe0, 0x04, 0x19, 0x86,
-             0xa3, 0xcd, 0xc1, 0xc3,
-             0x18, 0x4a, 0x82, 0xa5,
-             0x02, 0x86, 0xe0, 0x00,
-             0x02, 0x15, 0xe1, 0x94,
-             0x42, 0x05, 0x80, 0x00,
-             0x41, 0xfe, 0x80, 0x00,
-             0xbf, 0xff, 0x1f, 0xfd,
-             0x02, 0x86, 0xdd, 0x93,
-             0x84, 0x14, 0xe1, 0x94,
-             0x41, 0xfe, 0x84, 0xce,
-             0xff, 0xff, 0x7f, 0xfd,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfe, 0x7c, 0x04, 0x0c,
-             0x6c, 0x40, 0x1e, 0xf0,
-             0x7c, 0x0e, 0x82, 0x6b,
-             0xe1, 0x98, 0x41, 0xc6,
-             0x02, 0x05, 0x80, 0x14,
-             0xa1, 0x0b, 0xe1, 0x48,
-             0x02, 0x10, 0x9a, 0xe5,
-             0xc0, 0x01, 0x65, 0x21,
-             0xbe, 0x14, 0xbe, 0x1e,
-             0x80, 0x8b, 0xfe, 0x1e,
-             0xa3, 0x0d, 0xa2, 0x04,
-             0x40, 0x1b, 0x92, 0x55,
-             0x14, 0x00, 0xfd, 0x21,
-             0x4e, 0x12, 0x64, 0x04,
-             0x44, 0x07, 0xfa, 0x08,
-             0x10, 0x03, 0x94, 0x73,
-             0xe4, 0x00, 0x0e, 0x6a,
-             0xe6, 0x10, 0x16, 0x00,
-             0xa1, 0x6b, 0x14, 0x0b,
-             0x14, 0x00, 0x00, 0xe5,
-             0x16, 0x15, 0xec, 0x04,
-             0x8d, 0x1b, 0xe0, 0x80,
-             0x22, 0x14, 0x8a, 0xf5,
-             0xec, 0x08, 0x00, 0x00,
-             0xf8, 0x80, 0x16, 0x25,
-             0x50, 0x05, 0x83, 0xab,
-             0x02, 0x06, 0x00, 0x04,
-             0x56, 0x15, 0xc0, 0x00,
-             0xa1, 0x2b, 0x58, 0x80,
-             0x10, 0x15, 0x88, 0x25,
-             0x83, 0x31, 0x61, 0x88,
-             0x00, 0x34, 0x22, 0x94,
-             0x80, 0x1f, 0xe8, 0x80,
-             0x82, 0x65, 0xa1, 0x1b,
-             0xe1, 0x8c, 0x10, 0x15,
-             0x2c, 0x14, 0x80, 0x1f,
-             0x82, 0x05, 0xa1, 0x1b,
-             0x44, 0x08, 0x82, 0x0b,
-             0x81, 0x75, 0xfc, 0x38,
-             0xfc, 0x38, 0x44, 0x08,
-             0xfc, 0x04, 0x81, 0x45,
-             0xfc, 0x38, 0x44, 0x08,
-             0x81, 0x9b, 0xa2, 0x04,
-             0xfe, 0x04, 0x88, 0x35,
-             0x91, 0x0b, 0x80, 0x04,
-             0x4e, 0x68, 0x86, 0xb5,
-             0x3f, 0xff, 0x47, 0xe5,
-             0xec, 0x10, 0x16, 0xb0,
-             0xa1, 0x0b, 0x81, 0x01,
-             0xa2, 0x04, 0x86, 0x25,
-             0xa1, 0x0b, 0x20, 0x04,
-             0xa1, 0x0b, 0x82, 0xb5,
-             0xfe, 0x74, 0x84, 0x65,
-             0x90, 0x0b, 0x1c, 0x0e,
-             0x68, 0x01, 0x40, 0x08,
-             0x9c, 0x84, 0xc0, 0x00,
-             0xe8, 0x75, 0xa1, 0x8b,
-             0x7e, 0x8e, 0x81, 0x95,
-             0xe6, 0xd5, 0xa1, 0x0b,
-             0xbe, 0x04, 0x81, 0x55,
-             0xa1, 0x0b, 0x80, 0x04,
-             0xa0, 0xf1, 0xe4, 0xf5,
-             0xf6, 0x7c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xe1, 0x00, 0x00, 0x0c,
-             0xfa, 0x00, 0x00, 0x4c,
-             0x83, 0x01, 0x00, 0x1b,
-             0xef, 0xfc, 0x76, 0x08,
-             0x81, 0x05, 0xc1, 0x43,
-             0xfa, 0x80, 0x02, 0x14,
-             0x00, 0x06, 0xe1, 0x1b,
-             0x00, 0x06, 0x94, 0x22,
-             0xdd, 0x93, 0xd4, 0x62,
-             0xf8, 0x00, 0x04, 0x0c,
-             0x6c, 0x50, 0x1e, 0xf0,
-             0xe4, 0x7c, 0x03, 0x4a,
-             0x82, 0x6b, 0x3c, 0x5e,
-             0xfc, 0x1e, 0xbe, 0x5e,
-             0x42, 0x66, 0x8e, 0x05,
-             0x0c, 0x4a, 0xf0, 0x02,
-             0x06, 0x34, 0x64, 0x7c,
-             0x5e, 0x15, 0xfa, 0x80,
-             0x4a, 0x0e, 0x00, 0x04,
-             0x5e, 0x25, 0x9f, 0xfc,
-             0x06, 0x1a, 0x00, 0x08,
-             0x1e, 0x25, 0xe4, 0x00,
-             0x44, 0x22, 0x80, 0x04,
-             0x5e, 0x25, 0x98, 0x14,
-             0x1e, 0x25, 0x80, 0x00,
-             0x1e, 0x55, 0x80, 0x00,
-             0x4a, 0x50, 0x80, 0x08,
-             0x44, 0x22, 0x90, 0x7c,
-             0x5e, 0x25, 0x99, 0x94,
-             0x1e, 0x25, 0x80, 0x04,
-             0x42, 0x20, 0x80, 0x04,
-             0x18, 0x14, 0x9c, 0x00,
-             0x40, 0x00, 0x3c, 0xb5,
-             0xbc, 0x34, 0x18, 0x14,
-             0x02, 0x44, 0x00, 0xd5,
-             0xe1, 0x1b, 0xfa, 0x80,
-             0xdc, 0x3c, 0x18, 0xc4,
-             0xe2, 0x32, 0x00, 0x66,
-             0x42, 0x0e, 0x28, 0xf1,
-             0xc0, 0x10, 0x60, 0x01,
-             0x0c, 0x0c, 0x8c, 0x2b,
-             0x87, 0x75, 0xf0, 0x00,
-             0x01, 0x7e, 0x28, 0xf1,
-             0x0c, 0x0c, 0xff, 0xf8,
-             0xdd, 0x93, 0xf0, 0x00,
-             0x6c, 0x40, 0x1e, 0xf0,
-             0xe4, 0x7c, 0x01, 0x4a,
-             0xbe, 0x2e, 0xbc, 0x2e,
-             0x86, 0x85, 0xfc, 0x2e,
-             0xe4, 0x7c, 0x00, 0x0a,
-             0x44, 0x06, 0x84, 0x45,
-             0x3e, 0x2e, 0xf0, 0x02,
-             0xfc, 0x1e, 0xc1, 0x21,
-             0x84, 0x1f, 0xbe, 0x14,
-             0xbc, 0x14, 0xbc, 0x1e,
-             0xbe, 0x29, 0xfc, 0x24,
-             0xbe, 0x1e, 0xa4, 0x1f,
-             0x00, 0x06, 0xbe, 0x14,
-             0x81, 0x55, 0xe2, 0x06,
-             0xf8, 0x7e, 0x40, 0x06,
-             0xf0, 0xfe, 0x00, 0x06,
-             0x5d, 0x93, 0x81, 0x01,
-             0x7f, 0xe5, 0xa0, 0xf1,
-             0xff, 0xf8, 0x01, 0xae,
-             0xe2, 0xc0, 0x04, 0x1c,
-             0x04, 0x1f, 0xc1, 0x11,
-             0xf0, 0x7c, 0x44, 0x00,
-             0x02, 0x1c, 0xa4, 0x1f,
-             0xdd, 0x93, 0xe3, 0x40,
-             0xe4, 0x7c, 0x04, 0x0a,
-             0x40, 0x88, 0x04, 0x24,
-             0x00, 0x00, 0x06, 0x0e,
-             0x08, 0x30, 0x80, 0x10,
-             0x48, 0x12, 0x04, 0x10,
-             0x58, 0x02, 0xd0, 0x88,
-             0x02, 0x06, 0x71, 0x90,
-             0xff, 0xfc, 0x60, 0x00,
-             0x00, 0xc4, 0x83, 0xc7,
-             0x02, 0x0f, 0xf0, 0x80,
-             0x70, 0x01, 0x42, 0xc0,
-             0x61, 0x0b, 0xdf, 0xfc,
-             0x73, 0xfd, 0x40, 0xc0,
-             0x48, 0x07, 0xc0, 0x03,
-             0x00, 0xa5, 0xd0, 0x17,
-             0x5d, 0x93, 0xa2, 0x0f,
-             0xff, 0xf8, 0x01, 0x8e,
-             0x60, 0x01, 0x02, 0x86,
-             0xa2, 0x0f, 0xf8, 0x00,
-             0x40, 0x06, 0x90, 0x0e,
-             0xa1, 0x0d, 0xfc, 0x12,
-             0x40, 0x06, 0x82, 0xc5,
-             0xa1, 0x0d, 0xfc, 0x1a,
-             0x40, 0x06, 0x82, 0x15,
-             0x02, 0x06, 0xfc, 0x0a,
-             0xc0, 0x20, 0x60, 0x01,
-             0x80, 0x75, 0x83, 0x0d,
-             0xf3, 0x72, 0x00, 0x46,
-             0x81, 0x01, 0x5d, 0x93,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x30, 0x1e, 0xf0,
-             0x86, 0x4b, 0x08, 0x8b,
-             0x81, 0x71, 0x3e, 0x2e,
-             0x40, 0x5a, 0x00, 0x6b,
-             0x7c, 0x7e, 0xe5, 0x06,
-             0x42, 0x5a, 0x81, 0x31,
-             0x88, 0x2b, 0x65, 0x86,
-             0xef, 0xf8, 0x4f, 0x48,
-             0x67, 0xd1, 0x00, 0x00,
-             0x44, 0x86, 0x40, 0x01,
-             0x42, 0x12, 0xe0, 0x3c,
-             0x81, 0x31, 0x72, 0x9c,
-             0xef, 0xf8, 0x45, 0x48,
-             0x00, 0x00, 0x17, 0xa4,
-             0xc0, 0x04, 0x64, 0x01,
-             0x72, 0x9c, 0x42, 0x12,
-             0x19, 0x74, 0xd7, 0x07,
-             0xe0, 0xd4, 0x16, 0x14,
-             0xff, 0x01, 0x20, 0xbf,
-             0x00, 0x14, 0x01, 0xbb,
-             0x57, 0xfe, 0xe1, 0xac,
-             0xa1, 0x0b, 0x1f, 0xfc,
-             0x60, 0x38, 0x14, 0x09,
-             0xdf, 0xfc, 0x57, 0xfe,
-             0x81, 0x11, 0x1b, 0x94,
-             0x0a, 0xf0, 0x1c, 0x24,
-             0x15, 0x04, 0xe4, 0x20,
-             0xbe, 0x44, 0xa1, 0x0b,
-             0x80, 0x08, 0x00, 0x1b,
-             0x06, 0x14, 0x80, 0x04,
-             0x90, 0x1b, 0x7b, 0x00,
-             0xe8, 0x00, 0x43, 0xc8,
-             0xfc, 0x04, 0xbc, 0x0e,
-             0xe0, 0x18, 0x0e, 0x49,
-             0x68, 0x34, 0xaa, 0x24,
-             0x50, 0x82, 0xa0, 0x1b,
-             0x8e, 0x0b, 0x7b, 0x90,
-             0x68, 0x34, 0x52, 0xc8,
-             0x3e, 0x0e, 0x8c, 0x4b,
-             0x85, 0x05, 0x81, 0xa1,
-             0x0e, 0x29, 0xd9, 0x0a,
-             0x42, 0xba, 0xe0, 0x1c,
-             0x48, 0xba, 0xe5, 0x02,
-             0x06, 0x20, 0x65, 0x82,
-             0x83, 0x01, 0xe4, 0x1c,
-             0x02, 0x03, 0xa7, 0x0f,
-             0x42, 0x42, 0x81, 0x11,
-             0x90, 0x21, 0x72, 0x84,
-             0xef, 0xf8, 0x50, 0x28,
-             0x7f, 0xfd, 0x45, 0xfe,
-             0x82, 0xa1, 0x40, 0x3f,
-             0x41, 0xfe, 0xc5, 0x0d,
-             0x00, 0x3f, 0x1f, 0xfd,
-             0x41, 0xfe, 0xa1, 0x1b,
-             0xc0, 0x3f, 0x1f, 0xfd,
-             0x91, 0xad, 0xe5, 0x0e,
-             0xbe, 0x04, 0xf8, 0x15,
-             0x1e, 0x05, 0xa1, 0x0b,
-             0x98, 0xf1, 0x00, 0x00,
-             0xf2, 0x7c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x58, 0x96, 0x21, 0x1b,
-             0x02, 0x14, 0xe0, 0x08,
-             0x18, 0x06, 0x40, 0xac,
-             0x44, 0x2a, 0xc0, 0x00,
-             0xa1, 0x4b, 0x41, 0x06,
-             0x00, 0x00, 0x02, 0x06,
-             0x80, 0x08, 0x58, 0x96,
-             0xff, 0x11, 0x82, 0x65,
-             0x02, 0x44, 0x02, 0x3d,
-             0x60, 0x37, 0xe1, 0x04,
-             0x91, 0x80, 0x02, 0x14,
-             0x42, 0x1a, 0x86, 0x13,
-             0x20, 0x23, 0xe0, 0x92,
-             0x82, 0x23, 0x98, 0x0b,
-             0xdd, 0x93, 0x94, 0x2e,
-             0xfa, 0x04, 0x04, 0x4c,
-             0x81, 0x11, 0x02, 0x6b,
-             0x60, 0x00, 0x45, 0x06,
-             0x66, 0xd8, 0x8c, 0x0b,
-             0x81, 0x71, 0x6f, 0xf8,
-             0x66, 0x00, 0x00, 0x60,
-             0xe4, 0xc0, 0x02, 0x60,
-             0x91, 0x21, 0x01, 0xa5,
-             0x04, 0x20, 0x06, 0x7e,
-             0x40, 0x73, 0xec, 0x04,
-             0x42, 0x75, 0xf8, 0x20,
-             0xc1, 0x7c, 0xf0, 0x08,
-             0xfc, 0xf5, 0xa1, 0x2b,
-             0x7f, 0xf4, 0x41, 0x0e,
-             0xe0, 0x38, 0x03, 0x06,
-             0x60, 0x28, 0x05, 0x06,
-             0xff, 0xd4, 0x47, 0x0e,
-             0x48, 0x62, 0x81, 0xf5,
-             0x00, 0x00, 0x71, 0x80,
-             0x92, 0x7e, 0xec, 0x20,
-             0x48, 0x62, 0x10, 0x7e,
-             0x10, 0x7e, 0xf0, 0x88,
-             0xf0, 0x84, 0x48, 0x62,
-             0x82, 0x11, 0x10, 0x76,
-             0x87, 0x0b, 0x88, 0x21,
-             0x41, 0xf6, 0xfc, 0x35,
-             0x81, 0x11, 0x60, 0x0c,
-             0x6f, 0x40, 0x4c, 0x01,
-             0x67, 0x44, 0x00, 0x60,
-             0x63, 0x98, 0xc0, 0x03,
-             0x8f, 0x21, 0x6f, 0xf8,
-             0x65, 0x61, 0x00, 0x60,
-             0x02, 0x60, 0x40, 0x08,
-             0xc0, 0x03, 0x67, 0x61,
-             0x05, 0x06, 0x01, 0x95,
-             0x06, 0x7e, 0xe0, 0x08,
-             0xec, 0x04, 0x04, 0x20,
-             0xf0, 0x08, 0x42, 0x75,
-             0xa1, 0x2b, 0xc1, 0x7c,
-             0x0c, 0x4c, 0xfe, 0x35,
-             0xdd, 0x93, 0xf2, 0x04,
-             0x6f, 0xd1, 0x00, 0x19,
-             0xa1, 0x1b, 0xc0, 0x05,
-             0x00, 0x09, 0x82, 0x45,
-             0xc0, 0x06, 0x60, 0x2d,
-             0xf3, 0xf0, 0x40, 0x00,
-             0x00, 0x0c, 0xa9, 0x0b,
-             0xdd, 0x93, 0xe2, 0x00,
-             0x81, 0x01, 0x5d, 0x93,
-             0xf0, 0x80, 0x44, 0x12,
-             0xec, 0x70, 0x04, 0x29,
-             0x84, 0x05, 0xa1, 0x2b,
-             0xe0, 0x3c, 0x02, 0x29,
-             0xe6, 0x82, 0x40, 0x2a,
-             0x02, 0x09, 0x80, 0x13,
-             0xc0, 0x05, 0x6b, 0x71,
-             0xec, 0x14, 0x00, 0x00,
-             0xe4, 0x08, 0x00, 0xca,
-             0xe2, 0x00, 0x00, 0x0c,
-             0x5d, 0x93, 0xdd, 0x93,
-             0xc1, 0xc3, 0x81, 0x01,
-             0xf8, 0x04, 0x04, 0x0c,
-             0x60, 0x3c, 0x02, 0x39,
-             0x67, 0x70, 0x02, 0x10,
-             0x0a, 0x04, 0xc0, 0x03,
-             0x04, 0x20, 0x60, 0x8c,
-             0x04, 0x55, 0xe6, 0x40,
-             0x58, 0x22, 0x7c, 0x14,
-             0x46, 0x3a, 0xf0, 0x94,
-             0x81, 0x71, 0x66, 0x82,
-             0x08, 0x34, 0xb2, 0x64,
-             0xc2, 0x37, 0x60, 0x88,
-             0xfc, 0x10, 0x02, 0x45,
-             0x48, 0x62, 0x88, 0x53,
-             0x86, 0x13, 0x72, 0x9c,
-             0x08, 0x04, 0x32, 0x4e,
-             0x30, 0x5e, 0xe0, 0x88,
-             0x02, 0x13, 0x84, 0x43,
-             0x40, 0x01, 0x6c, 0x01,
-             0x08, 0x35, 0x80, 0x23,
-             0x82, 0x33, 0xe2, 0x00,
-             0xe2, 0x00, 0x48, 0x35,
-             0xec, 0x00, 0x04, 0x09,
-             0x44, 0x01, 0x82, 0x01,
-             0x0c, 0x0c, 0xec, 0x00,
-             0xdd, 0x93, 0xf0, 0x04,
-             0xfe, 0x04, 0x04, 0x0c,
-             0x48, 0x22, 0x08, 0x6b,
-             0x21, 0x4b, 0xf9, 0x8c,
-             0x08, 0x65, 0x8a, 0x7b,
-             0xe0, 0x08, 0x48, 0x96,
-             0x61, 0x84, 0x08, 0x24,
-             0xe0, 0xfc, 0x0a, 0x34,
-             0x0a, 0x34, 0x2a, 0x4f,
-             0x88, 0x03, 0xe1, 0x84,
-             0x6f, 0xf4, 0x71, 0x68,
-             0xf2, 0x84, 0x42, 0x52,
-             0x64, 0x1c, 0x43, 0x4a,
-             0x42, 0x1a, 0x81, 0x41,
-             0x41, 0x6a, 0xe0, 0x1c,
-             0x42, 0x0a, 0xe4, 0x18,
-             0x42, 0x1a, 0xe5, 0x80,
-             0x42, 0x0a, 0xe1, 0x88,
-             0x09, 0x04, 0xed, 0x80,
-             0xdc, 0x00, 0x4c, 0x00,
-             0xdc, 0x00, 0x4e, 0x10,
-             0x80, 0x6e, 0x82, 0x7e,
-             0x0c, 0x0c, 0x88, 0x0b,
-             0xdd, 0x93, 0xf6, 0x04,
-             0xf8, 0x00, 0x04, 0x4c,
-             0x67, 0xfd, 0x00, 0x25,
-             0x81, 0x51, 0x40, 0x01,
-             0x86, 0x44, 0x84, 0x34,
-             0xe0, 0x18, 0x02, 0xc5,
-             0x6f, 0xc9, 0x00, 0x21,
-             0x84, 0x33, 0x40, 0x05,
-             0x60, 0x50, 0x02, 0x6b,
-             0xf2, 0x94, 0x48, 0x42,
-             0x6f, 0xcd, 0x00, 0x01,
-             0x02, 0x55, 0xc0, 0x05,
-             0x84, 0xc3, 0x60, 0x1c,
-             0x82, 0x61, 0x06, 0x4e,
-             0x42, 0xc5, 0x84, 0x3e,
-             0x80, 0x53, 0x60, 0x18,
-             0xe0, 0x1c, 0x42, 0x55,
-             0xe0, 0x50, 0x42, 0x63,
-             0xf0, 0x00, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x60, 0x3c, 0x02, 0x39,
-             0xc8, 0x44, 0x81, 0xc1,
-             0x46, 0x3a, 0xca, 0x54,
-             0xc4, 0x37, 0xe6, 0x82,
-             0x06, 0x35, 0x82, 0x33,
-             0x86, 0x43, 0xe7, 0xdc,
-             0x72, 0xb0, 0x46, 0x52,
-             0xca, 0x3e, 0x80, 0x13,
-             0x02, 0x01, 0xc8, 0x4e,
-             0x04, 0x35, 0xea, 0x70,
-             0x80, 0x33, 0xe0, 0x20,
-             0xe0, 0x20, 0x44, 0x35,
-             0xe0, 0x54, 0x04, 0x3b,
-             0xeb, 0x70, 0x02, 0x01,
-             0xe0, 0x24, 0x04, 0x15,
-             0x44, 0x33, 0x82, 0x31,
-             0x80, 0x13, 0xe0, 0x54,
-             0xe0, 0x24, 0x44, 0x15,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xe0, 0x3c, 0x02, 0x39,
-             0xe0, 0x58, 0x04, 0x4b,
-             0xe6, 0x82, 0x40, 0x3a,
-             0xe0, 0x14, 0x04, 0x35,
-             0x80, 0x13, 0xc4, 0x07,
-             0xe7, 0xdc, 0x02, 0x05,
-             0xe0, 0x10, 0x04, 0x15,
-             0x81, 0x01, 0x00, 0x13,
-             0x72, 0x80, 0x40, 0x32,
-             0x44, 0x05, 0x82, 0x41,
-             0x44, 0x15, 0xe0, 0x14,
-             0x44, 0x43, 0xe0, 0x10,
-             0xdd, 0x93, 0xe0, 0x58,
-             0x60, 0x58, 0x00, 0x29,
-             0x0a, 0x39, 0x84, 0x5b,
-             0x0a, 0x49, 0xef, 0x40,
-             0x02, 0x39, 0xef, 0x44,
-             0x40, 0x01, 0x60, 0x51,
-             0x4a, 0x21, 0xc7, 0x2d,
-             0xc8, 0x2d, 0x4f, 0x40,
-             0x6f, 0x48, 0x4a, 0x21,
-             0xe4, 0xa0, 0x08, 0x00,
-             0x4f, 0x44, 0x4a, 0x21,
-             0x00, 0x35, 0xc2, 0x37,
-             0x86, 0x13, 0x60, 0x20,
-             0x60, 0x30, 0x02, 0xc3,
-             0x67, 0x60, 0x0a, 0x50,
-             0x02, 0x13, 0xc0, 0x03,
-             0x98, 0x0b, 0xe0, 0xc0,
-             0xe0, 0x00, 0x35, 0x08,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x90, 0x1e, 0xf0,
-             0x88, 0x9b, 0x23, 0x04,
-             0x02, 0x06, 0x09, 0x1e,
-             0x0a, 0xcb, 0xe0, 0x04,
-             0xfc, 0x0e, 0x81, 0x61,
-             0xfe, 0x0e, 0xa1, 0x04,
-             0xe0, 0x38, 0x04, 0x09,
-             0x51, 0x6e, 0x81, 0x55,
-             0xec, 0x04, 0x02, 0x10,
-             0xa1, 0x1b, 0xf1, 0x6c,
-             0x7e, 0x44, 0xfe, 0x75,
-             0x03, 0xc1, 0x81, 0x61,
-             0xe0, 0x08, 0x02, 0x06,
-             0x16, 0x30, 0x20, 0x0b,
-             0x10, 0x6e, 0xe6, 0x40,
-             0x92, 0xce, 0x81, 0x71,
-             0xd0, 0x6e, 0xd2, 0x6e,
-             0x10, 0x1e, 0xfc, 0x44,
-             0x92, 0xce, 0x81, 0x11,
-             0xbe, 0x1e, 0xd2, 0x6e,
-             0x0c, 0x30, 0x50, 0x6e,
-             0xc0, 0x02, 0x66, 0x41,
-             0x00, 0x20, 0x0f, 0x0e,
-             0xc0, 0x03, 0x65, 0x71,
-             0x00, 0x30, 0x0b, 0x0e,
-             0xc0, 0x03, 0x66, 0x41,
-             0x8b, 0x35, 0x8d, 0x0e,
-             0xae, 0x03, 0x8d, 0x04,
-             0xa1, 0xab, 0x80, 0xa8,
-             0x89, 0x04, 0x8e, 0x85,
-             0x00, 0x09, 0x91, 0x5e,
-             0xc1, 0xad, 0xe0, 0x10,
-             0x7c, 0x14, 0x82, 0xa5,
-             0xe0, 0x08, 0x00, 0x46,
-             0x83, 0x01, 0x04, 0x0e,
-             0x8b, 0x04, 0x86, 0x0e,
-             0x80, 0x08, 0xae, 0x03,
-             0x81, 0x01, 0x46, 0x0e,
-             0x2c, 0x04, 0xc4, 0x0e,
-             0xe1, 0x84, 0x10, 0xa4,
-             0x81, 0x21, 0x2e, 0x14,
-             0x90, 0x03, 0x81, 0x31,
-             0x72, 0x88, 0x42, 0x12,
-             0x61, 0x98, 0x94, 0x2b,
-             0x45, 0xfe, 0xef, 0xf4,
-             0xcf, 0xff, 0x7f, 0xfd,
-             0xff, 0x21, 0x45, 0x0d,
-             0x1f, 0xfd, 0x41, 0xfe,
-             0xa1, 0x1b, 0x0f, 0xff,
-             0x1f, 0xfd, 0x41, 0xfe,
-             0xa4, 0x0e, 0xcf, 0xff,
-             0x91, 0x54, 0x98, 0x04,
-             0x04, 0x0e, 0x04, 0x0d,
-             0x10, 0x84, 0xf8, 0x00,
-             0x80, 0x83, 0x91, 0x80,
-             0xe0, 0xaa, 0x40, 0x8a,
-             0xfa, 0x08, 0x40, 0x02,
-             0x00, 0x02, 0x03, 0x05,
-             0xc0, 0x7f, 0x6b, 0xfd,
-             0x83, 0x31, 0x7e, 0x24,
-             0x8a, 0x3e, 0x88, 0x3e,
-             0xae, 0x03, 0x8b, 0x04,
-             0x4a, 0x0e, 0x80, 0x08,
-             0x48, 0x0e, 0x81, 0x01,
-             0xa4, 0x3e, 0x81, 0x01,
-             0x0e, 0x70, 0x55, 0x0c,
-             0x08, 0x61, 0xec, 0x04,
-             0x90, 0xb1, 0x88, 0x91,
-             0x8f, 0x0b, 0x8f, 0x04,
-             0xfe, 0x04, 0xea, 0x95,
-             0xa1, 0x0b, 0x80, 0x04,
-             0xc0, 0x08, 0x40, 0x96,
-             0xc0, 0x04, 0x5e, 0x05,
-             0xc8, 0xf1, 0x3e, 0x04,
-             0xf2, 0x7c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x3c, 0x04, 0x0c,
-             0x84, 0x6b, 0x02, 0x7b,
-             0x60, 0x50, 0x0e, 0x2b,
-             0x0e, 0xab, 0x81, 0x81,
-             0x0e, 0x9b, 0xe0, 0x54,
-             0x18, 0x8e, 0xe0, 0x58,
-             0x9a, 0x8e, 0xa1, 0x2b,
-             0x4c, 0x23, 0xd8, 0x8e,
-             0x4c, 0xa3, 0xe0, 0x18,
-             0x4c, 0x93, 0xe0, 0x1c,
-             0x84, 0xc5, 0xe0, 0x20,
-             0x06, 0x24, 0x1c, 0x04,
-             0x9e, 0x14, 0xe1, 0x84,
-             0x81, 0x31, 0x06, 0x03,
-             0x6f, 0xf4, 0x5b, 0xc8,
-             0xf2, 0xa0, 0x42, 0x12,
-             0x67, 0xfd, 0x00, 0x8a,
-             0x41, 0xfe, 0xc7, 0xff,
-             0x00, 0x01, 0x1f, 0xfd,
-             0x41, 0xfe, 0xa1, 0x1b,
-             0xc0, 0x01, 0x1f, 0xfd,
-             0x14, 0x0a, 0x98, 0x0e,
-             0x04, 0xa4, 0x68, 0x00,
-             0x84, 0xc5, 0xfb, 0x80,
-             0x06, 0x24, 0x5c, 0x04,
-             0xde, 0x14, 0xe1, 0x84,
-             0x81, 0x31, 0x06, 0x03,
-             0x6f, 0xf4, 0x5a, 0x28,
-             0xf2, 0xa0, 0x42, 0x12,
-             0x67, 0xfd, 0x00, 0x8a,
-             0x41, 0xfe, 0xc7, 0xff,
-             0x00, 0x01, 0x1f, 0xfd,
-             0x41, 0xfe, 0xa1, 0x1b,
-             0xc0, 0x01, 0x1f, 0xfd,
-             0x12, 0x0a, 0x9a, 0x0e,
-             0x04, 0x94, 0x68, 0x00,
-             0x86, 0x05, 0xfb, 0x80,
-             0x60, 0x10, 0x0e, 0x05,
-             0xe1, 0x84, 0x06, 0x24,
-             0xe0, 0x14, 0x0e, 0x15,
-             0x81, 0x31, 0x06, 0x03,
-             0x6f, 0xf4, 0x58, 0x68,
-             0xf2, 0xa0, 0x42, 0x12,
-             0x67, 0xfd, 0x00, 0x8a,
-             0x41, 0xfe, 0xc7, 0xff,
-             0x00, 0x01, 0x1f, 0xfd,
-             0x41, 0xfe, 0xa1, 0x1b,
-             0xc0, 0x01, 0x1f, 0xfd,
-             0x0c, 0x0c, 0xd8, 0x0e,
-             0xdd, 0x93, 0xf2, 0x3c,
-             0xf8, 0x04, 0x04, 0x0c,
-             0x84, 0x3b, 0x01, 0x01,
-             0x46, 0x01, 0x8a, 0x06,
-             0x8e, 0x06, 0xf0, 0x08,
-             0x02, 0x0b, 0x8c, 0x06,
-             0xa1, 0x0b, 0xe0, 0x50,
-             0x02, 0xc5, 0x88, 0x45,
-             0x06, 0x04, 0x60, 0x18,
-             0x7f, 0x51, 0xe1, 0x84,
-             0x86, 0x6b, 0xa6, 0x4b,
-             0x4c, 0x40, 0x8a, 0xcd,
-             0x18, 0x63, 0x9c, 0x00,
-             0xff, 0xf8, 0x18, 0x0e,
-             0xe0, 0x82, 0x4e, 0x6a,
-             0xe0, 0x1c, 0x02, 0x65,
-             0x4a, 0x72, 0x0a, 0x6d,
-             0x46, 0x40, 0xfa, 0x30,
-             0x0a, 0x52, 0x1c, 0x00,
-             0x08, 0x56, 0xe9, 0xfc,
-             0x40, 0x3a, 0x8c, 0x33,
-             0x40, 0x02, 0xe0, 0x82,
-             0x00, 0x02, 0xfa, 0x30,
-             0x8a, 0x06, 0xe9, 0xfc,
-             0xe0, 0x54, 0x02, 0x0b,
-             0x88, 0x45, 0xa1, 0x0b,
-             0x60, 0x20, 0x02, 0xc5,
-             0xe1, 0x84, 0x06, 0x04,
-             0xa6, 0x4b, 0x7f, 0x51,
-             0x8a, 0xcd, 0x86, 0x6b,
-             0x9c, 0x00, 0x4c, 0x40,
-             0x60, 0x24, 0x02, 0xc5,
-             0x4c, 0x6a, 0x98, 0x63,
-             0x02, 0x0e, 0x60, 0x82,
-             0x8a, 0xcd, 0xff, 0xf8,
-             0x1c, 0x00, 0x46, 0x40,
-             0xfa, 0x04, 0x4c, 0x62,
-             0x0a, 0x62, 0x18, 0x33,
-             0x40, 0x3a, 0xe9, 0xfc,
-             0xc8, 0x56, 0xe0, 0x82,
-             0xfa, 0x04, 0x40, 0x02,
-             0xe9, 0xfc, 0x00, 0x02,
-             0x0c, 0x0c, 0xca, 0x06,
-             0xdd, 0x93, 0xf0, 0x04,
-             0xf8, 0x0c, 0x04, 0x4c,
-             0x60, 0x38, 0x04, 0x09,
-             0x66, 0x40, 0x04, 0x30,
-             0x18, 0x41, 0xc0, 0x03,
-             0x05, 0x15, 0xff, 0x31,
-             0xf8, 0x00, 0x18, 0x0e,
-             0xa1, 0x6b, 0x88, 0x68,
-             0x90, 0x6a, 0x84, 0xe5,
-             0x84, 0x82, 0x94, 0x72,
-             0x04, 0x25, 0xa1, 0x6b,
-             0xf1, 0x9c, 0x4e, 0x82,
-             0x10, 0x64, 0x06, 0x7d,
-             0x58, 0x77, 0xe1, 0x84,
-             0x91, 0x80, 0x10, 0x84,
-             0x4c, 0x8a, 0x8e, 0x83,
-             0x4c, 0x62, 0xe0, 0x9a,
-             0x0e, 0x62, 0xfa, 0x30,
-             0xc0, 0x7f, 0x6b, 0xfd,
-             0x00, 0x00, 0x94, 0x7c,
-             0x84, 0x41, 0x6c, 0x04,
-             0x82, 0x21, 0x04, 0x51,
-             0xf8, 0x35, 0xa1, 0x0b,
-             0xf0, 0x0c, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xf8, 0x1c, 0x04, 0x0c,
-             0x89, 0x04, 0x84, 0x7a,
-             0x04, 0x89, 0x86, 0x1a,
-             0xd6, 0x58, 0xe0, 0x10,
-             0x80, 0x7c, 0x88, 0x98,
-             0xc8, 0xc8, 0x8a, 0x78,
-             0x04, 0x29, 0xca, 0x68,
-             0x02, 0x1c, 0xe0, 0x14,
-             0xe1, 0x84, 0x02, 0x84,
-             0x60, 0x10, 0x40, 0x51,
-             0x0a, 0x24, 0x98, 0x13,
-             0xc2, 0x17, 0x61, 0x84,
-             0x02, 0x10, 0x0c, 0x53,
-             0x40, 0x11, 0xec, 0x04,
-             0xc2, 0x57, 0x60, 0x1c,
-             0x6c, 0x04, 0x02, 0x50,
-             0x40, 0x11, 0xc2, 0x87,
-             0xc2, 0x27, 0x60, 0x20,
-             0x60, 0x28, 0x40, 0x21,
-             0x66, 0x40, 0x04, 0x40,
-             0x06, 0x19, 0xc0, 0x03,
-             0x81, 0x31, 0x60, 0x38,
-             0xe0, 0x14, 0x40, 0x91,
-             0xe0, 0x18, 0x40, 0x71,
-             0xe0, 0x24, 0x40, 0x81,
-             0x49, 0x48, 0x81, 0x95,
-             0xec, 0x04, 0x0a, 0x30,
-             0xec, 0x04, 0x02, 0x10,
-             0x46, 0x40, 0xc9, 0x5d,
-             0xa1, 0x1b, 0x9c, 0x00,
-             0x40, 0x31, 0xfc, 0xf5,
-             0x81, 0x01, 0x60, 0x2c,
-             0xf0, 0x1c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x50, 0x1e, 0xf0,
-             0x88, 0x6b, 0x19, 0x84,
-             0x82, 0x9b, 0x06, 0x7b,
-             0x84, 0xab, 0x09, 0x5e,
-             0x64, 0x91, 0x16, 0x80,
-             0x02, 0x80, 0x40, 0x01,
-             0xc0, 0x01, 0x66, 0xd1,
-             0x00, 0x80, 0x3e, 0x1e,
-             0xc0, 0x01, 0x66, 0x91,
-             0x08, 0x80, 0x3c, 0x0e,
-             0x12, 0x1b, 0xe4, 0x90,
-             0x0c, 0x3b, 0x8e, 0x2b,
-             0x61, 0xd8, 0x96, 0x5b,
-             0xa1, 0x0b, 0xef, 0xfc,
-             0x04, 0x80, 0x86, 0xb5,
-             0x8c, 0x1b, 0x64, 0x30,
-             0xef, 0xfc, 0x6b, 0x08,
-             0x14, 0x80, 0x7e, 0xae,
-             0x0c, 0x1b, 0xe4, 0x80,
-             0x70, 0xd8, 0x94, 0x2b,
-             0x12, 0x1b, 0xef, 0xfc,
-             0x09, 0x44, 0x8e, 0x2b,
-             0x75, 0xd8, 0x8c, 0x3b,
-             0x96, 0x5b, 0x6f, 0xfc,
-             0x92, 0x1b, 0x3c, 0x8e,
-             0x8e, 0x3b, 0x7e, 0x24,
-             0x94, 0x5b, 0x0c, 0x4b,
-             0xef, 0xfc, 0x78, 0x48,
-             0xa8, 0xf1, 0x81, 0x01,
-             0xf2, 0x7c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xf0, 0x80, 0x46, 0x22,
-             0xec, 0x70, 0x06, 0x39,
-             0x86, 0xa5, 0xa1, 0x3b,
-             0xe0, 0x3c, 0x04, 0x39,
-             0xe6, 0x82, 0x40, 0x3a,
-             0xf0, 0x80, 0x46, 0x22,
-             0x6b, 0x71, 0x06, 0x39,
-             0x06, 0x30, 0xc0, 0x05,
-             0xe2, 0x3d, 0xec, 0x14,
-             0xc2, 0x07, 0x84, 0x15,
-             0x04, 0x03, 0x80, 0x23,
-             0xc0, 0x02, 0x63, 0xb9,
-             0x86, 0x12, 0x84, 0x22,
-             0x41, 0x1a, 0x85, 0x0d,
-             0x40, 0x0a, 0xe0, 0x04,
-             0x00, 0x0c, 0xe1, 0x84,
-             0xdd, 0x93, 0xe2, 0x00,
-             0x81, 0x01, 0x5d, 0x93,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x70, 0x1e, 0xf0,
-             0x81, 0x61, 0x1d, 0x04,
-             0x88, 0x8b, 0x7c, 0x5e,
-             0x90, 0x1b, 0x7e, 0x1e,
-             0x00, 0x06, 0x3e, 0x0e,
-             0x8b, 0x6e, 0xe0, 0x04,
-             0xe0, 0x38, 0x04, 0xb9,
-             0x81, 0x45, 0x89, 0x6e,
-             0x00, 0x00, 0x45, 0x6e,
-             0xa1, 0x0b, 0xec, 0x04,
-             0x7c, 0x04, 0xfe, 0x95,
-             0x12, 0x20, 0x87, 0x41,
-             0x40, 0x03, 0x65, 0x71,
-             0xe6, 0x40, 0x14, 0x30,
-             0x66, 0x41, 0x0e, 0x30,
-             0x80, 0x6e, 0xc0, 0x03,
-             0xc2, 0x6e, 0x82, 0x4e,
-             0x00, 0x06, 0x40, 0x6e,
-             0xbe, 0x14, 0xe0, 0x08,
-             0x86, 0x4e, 0x84, 0x0e,
-             0xc4, 0x6e, 0xc6, 0x6e,
-             0x9c, 0x28, 0x85, 0xe5,
-             0x86, 0xa5, 0xa1, 0x2b,
-             0x00, 0x09, 0xfe, 0x04,
-             0xc1, 0x2d, 0xe0, 0x10,
-             0x3e, 0x14, 0x82, 0x45,
-             0xe0, 0x08, 0x00, 0x46,
-             0x87, 0x01, 0x04, 0x0e,
-             0xa4, 0x08, 0x86, 0x0e,
-             0xc6, 0x0e, 0xc4, 0x6e,
-             0x06, 0xf0, 0x2a, 0x14,
-             0x28, 0x04, 0xe4, 0x40,
-             0x7f, 0xfd, 0x49, 0xfe,
-             0x3c, 0x3e, 0xcf, 0xff,
-             0x4d, 0x78, 0x81, 0x31,
-             0x81, 0x51, 0x6f, 0xfc,
-             0x81, 0x95, 0x89, 0x04,
-             0x83, 0x01, 0x7c, 0x24,
-             0x88, 0x0e, 0x87, 0x11,
-             0xa4, 0x18, 0x8a, 0x1e,
-             0xca, 0x1e, 0xc8, 0x6e,
-             0x16, 0xb0, 0x61, 0x0e,
-             0x02, 0x91, 0xec, 0x04,
-             0x82, 0x71, 0x90, 0xa1,
-             0xf4, 0x55, 0xa1, 0xbb,
-             0xb8, 0xf1, 0x7c, 0x04,
-             0xa1, 0x0b, 0x80, 0x04,
-             0xc0, 0x08, 0x4c, 0x96,
-             0x0c, 0x0c, 0x8c, 0x0b,
-             0xdd, 0x93, 0xf2, 0x7c,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x30, 0x1e, 0xf0,
-             0x88, 0x6b, 0x0a, 0x9b,
-             0x80, 0xbb, 0x06, 0x7b,
-             0x64, 0xd1, 0x00, 0x90,
-             0x84, 0x8b, 0x40, 0x01,
-             0x08, 0x90, 0x02, 0xab,
-             0x3c, 0x0e, 0xe4, 0x90,
-             0x64, 0x91, 0x0a, 0x90,
-             0x0e, 0x2b, 0xc0, 0x01,
-             0x78, 0x58, 0x8c, 0x3b,
-             0xa1, 0x0b, 0xef, 0xfc,
-             0x98, 0xf1, 0x80, 0xa5,
-             0xf2, 0x7c, 0x0c, 0x0c,
-             0x04, 0x90, 0xdd, 0x93,
-             0x96, 0x0b, 0x64, 0x30,
-             0x6f, 0xfc, 0x5e, 0x88,
-             0x7c, 0x8e, 0x8c, 0x1b,
-             0xe4, 0x80, 0x10, 0x90,
-             0x8c, 0x1b, 0x16, 0x0b,
-             0x6f, 0xfc, 0x64, 0x48,
-             0x3c, 0x9e, 0x90, 0x2b,
-             0x7c, 0x24, 0x96, 0x0b,
-             0x0e, 0x3b, 0x94, 0x1b,
-             0x6c, 0x18, 0x8c, 0x4b,
-             0x90, 0x5b, 0x6f, 0xfc,
-             0x0c, 0x0c, 0x98, 0xf1,
-             0xdd, 0x93, 0xf2, 0x7c,
-             0xfa, 0x1c, 0x04, 0x4c,
-             0x82, 0x9b, 0x04, 0x8b,
-             0x86, 0x7b, 0x08, 0x6b,
-             0x6f, 0x48, 0x10, 0x19,
-             0x67, 0x60, 0x04, 0x80,
-             0x12, 0x09, 0xc0, 0x03,
-             0x8c, 0x3b, 0x60, 0x10,
-             0xe8, 0x04, 0x59, 0x48,
-             0xe0, 0x10, 0x0e, 0x05,
-             0xe0, 0x34, 0x0e, 0x1b,
-             0xef, 0x48, 0x10, 0x29,
-             0xe0, 0x10, 0x12, 0x39,
-             0xe0, 0x8c, 0x0e, 0x49,
-             0x81, 0x01, 0x18, 0x0e,
-             0x4c, 0x21, 0xd8, 0x1c,
-             0x4c, 0x31, 0xe0, 0x18,
-             0x4c, 0x41, 0xe0, 0x1c,
-             0x0c, 0x4c, 0xe0, 0x20,
-             0xdd, 0x93, 0xf2, 0x1c,
-             0xfa, 0x7c, 0x04, 0x4c,
-             0x81, 0xb1, 0x13, 0xa4,
-             0x6e, 0x40, 0x02, 0x22,
-             0x11, 0x74, 0x88, 0x8b,
-             0x28, 0x5e, 0x86, 0x6b,
-             0x0f, 0xbe, 0x81, 0x91,
-             0x81, 0x55, 0x81, 0x21,
-             0x82, 0x21, 0x41, 0x34,
-             0xfa, 0x24, 0x52, 0x32,
-             0xfe, 0x75, 0xc3, 0x2d,
-             0x41, 0xfe, 0xa0, 0x9d,
-             0x80, 0x3f, 0x1f, 0xfd,
-             0x80, 0x00, 0x54, 0x05,
-             0x06, 0xf0, 0x90, 0x05,
-             0x92, 0x0b, 0x64, 0x70,
-             0x90, 0x2b, 0x0a, 0x1b,
-             0xe8, 0x30, 0x56, 0x08,
-             0x8e, 0x15, 0xa1, 0x0b,
-             0x90, 0x1b, 0x12, 0x0b,
-             0x68, 0x30, 0x59, 0x08,
-             0xa1, 0x0b, 0x8e, 0x2b,
-             0x8f, 0x84, 0x8c, 0x35,
-             0x54, 0xb5, 0xa1, 0x8b,
-             0x40, 0x96, 0x00, 0x00,
-             0x8a, 0x45, 0x80, 0x08,
-             0x98, 0x1a, 0x9c, 0x04,
-             0xc7, 0x07, 0x9a, 0x2a,
-             0x80, 0x95, 0xc3, 0x0d,
-             0x81, 0x01, 0x44, 0x0d,
-             0x40, 0x12, 0x88, 0x25,
-             0x04, 0x06, 0x70, 0x88,
-             0x42, 0xb2, 0xff, 0x40,
-             0x81, 0x31, 0x72, 0xac,
-             0xef, 0xf0, 0x7d, 0x68,
-             0x60, 0xfc, 0x04, 0x14,
-             0x24, 0x0f, 0xc3, 0x07,
-             0x01, 0x31, 0xc3, 0x17,
-             0x73, 0x78, 0x90, 0x2b,
-             0x04, 0x04, 0xef, 0xf0,
-             0xff, 0x31, 0x60, 0xa0,
-             0xd0, 0x17, 0x71, 0x07,
-             0xa2, 0x0f, 0x07, 0x2b,
-             0x1f, 0xfc, 0x45, 0xfe,
-             0x45, 0xfe, 0xa1, 0x0b,
-             0xa8, 0x2e, 0xdf, 0xfc,
-             0x0c, 0x4c, 0x81, 0x01,
-             0xdd, 0x93, 0xf2, 0x7c,
-             0xf8, 0x1c, 0x04, 0x0c,
-             0x84, 0x03, 0x04, 0x13,
-             0x61, 0x8a, 0x40, 0x0a,
-             0x42, 0x1a, 0x82, 0x11,
-             0x04, 0x20, 0x61, 0x8a,
-             0x18, 0x04, 0xec, 0x04,
-             0x0c, 0x04, 0x60, 0x88,
-             0x08, 0xc5, 0xe0, 0x8c,
-             0x4e, 0x52, 0x7c, 0x30,
-             0x0a, 0x65, 0xf0, 0x98,
-             0x85, 0x0d, 0x7c, 0x18,
-             0xca, 0xc7, 0x9e, 0x84,
-             0x12, 0xc4, 0xa6, 0xc3,
-             0x8c, 0xc3, 0x61, 0x7c,
-             0xf2, 0xa0, 0x4c, 0x92,
-             0x0c, 0x04, 0x1e, 0x6e,
-             0x1c, 0xce, 0xe0, 0x84,
-             0x0c, 0xcb, 0x8a, 0x63,
-             0x00, 0x06, 0x69, 0x00,
-             0x00, 0x00, 0x80, 0x00,
-             0x83, 0x0b, 0xc4, 0x04,
-             0x4c, 0xc3, 0x82, 0xc1,
-             0xf6, 0xd5, 0xe9, 0x00,
-             0xf0, 0x1c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xf8, 0x1c, 0x04, 0x0c,
-             0x61, 0xfc, 0x18, 0x24,
-             0x04, 0xc3, 0xa2, 0x03,
-             0x03, 0xc7, 0x86, 0x03,
-             0x0b, 0xc4, 0x81, 0x81,
-             0x4c, 0x0a, 0xb8, 0x03,
-             0x00, 0x34, 0x61, 0x8e,
-             0x09, 0x04, 0xe0, 0x88,
-             0xf0, 0x80, 0x4e, 0x42,
-             0x0c, 0x13, 0x94, 0x8e,
-             0x42, 0x1a, 0xc4, 0x67,
-             0x88, 0x63, 0x61, 0x8e,
-             0xb0, 0x8e, 0x80, 0x8e,
-             0xc4, 0x17, 0x02, 0x23,
-             0x61, 0x8e, 0x46, 0x2a,
-             0xf0, 0x84, 0x44, 0x42,
-             0x42, 0x42, 0xc4, 0x37,
-             0x06, 0x70, 0x70, 0x8c,
-             0x82, 0x7b, 0xec, 0x10,
-             0x14, 0x94, 0xd9, 0x84,
-             0x10, 0x93, 0xc6, 0x6d,
-             0xdc, 0x00, 0x4c, 0x40,
-             0xdd, 0x84, 0x94, 0x9e,
-             0xc6, 0x7d, 0x30, 0x94,
-             0x4e, 0x40, 0x10, 0x93,
-             0x30, 0x9e, 0xdc, 0x00,
-             0xfc, 0x35, 0x85, 0x6b,
-             0xc9, 0xc4, 0x80, 0x54,
-             0x98, 0x53, 0xc6, 0x2d,
-             0x44, 0x40, 0x00, 0x5e,
-             0x83, 0x2b, 0xdc, 0x00,
-             0x0c, 0x0c, 0xfe, 0x35,
-             0xdd, 0x93, 0xf0, 0x1c,
-             0xfe, 0x7c, 0x04, 0x0c,
-             0xec, 0x40, 0x1e, 0xf0,
-             0x4c, 0x42, 0x08, 0x13,
-             0x4c, 0x6a, 0xf0, 0x80,
-             0x82, 0x11, 0x61, 0x92,
-             0x61, 0x92, 0x42, 0x1a,
-             0xe0, 0x88, 0x18, 0x44,
-             0xd6, 0x07, 0x7e, 0x3e,
-             0xc4, 0x67, 0x19, 0x34,
-             0x4f, 0xfe, 0x44, 0x17,
-             0xc0, 0x01, 0x7f, 0xfd,
-             0x52, 0x52, 0x0a, 0xc3,
-             0x3e, 0x3e, 0xf0, 0x84,
-             0xf0, 0x98, 0x54, 0x52,
-             0x06, 0xc0, 0x0c, 0x7e,
-             0x7c, 0x5e, 0xec, 0x10,
-             0xfc, 0xa8, 0x16, 0x04,
-             0x81, 0xc1, 0x01, 0x41,
-             0x81, 0x11, 0x01, 0x81,
-             0xe9, 0x64, 0x83, 0xf5,
-             0xc6, 0xad, 0x7e, 0x04,
-             0x1e, 0xa5, 0xca, 0x67,
-             0x4e, 0x62, 0x40, 0x08,
-             0x21, 0x7d, 0xf1, 0x80,
-             0x0c, 0x06, 0x8e, 0x6b,
-             0xa0, 0x2d, 0x40, 0x00,
-             0x9c, 0x00, 0x4c, 0x70,
-             0x61, 0x7c, 0x0e, 0x64,
-             0x40, 0x6a, 0x8c, 0x43,
-             0x58, 0x72, 0x64, 0x2e,
-             0x4c, 0x6a, 0xf2, 0xb0,
-             0x80, 0x83, 0xe4, 0xae,
-             0x72, 0x84, 0x42, 0x62,
-             0x64, 0x00, 0x16, 0xb0,
-             0x93, 0xab, 0xc0, 0x08,
-             0x18, 0xca, 0xf8, 0x35,
-             0x18, 0x1a, 0xe0, 0x00,
-             0x08, 0x2a, 0xe0, 0x00,
-             0x42, 0x0a, 0xe0, 0x00,
-             0x42, 0x1a, 0xe5, 0x80,
-             0x42, 0x0a, 0xe1, 0x88,
-             0x08, 0x45, 0xed, 0x80,
-             0x80, 0x08, 0x40, 0x96,
-             0x61, 0x84, 0x00, 0x44,
-             0xe0, 0xfc, 0x04, 0xc4,
-             0x04, 0xc4, 0x24, 0x0f,
-             0x10, 0x03, 0xe1, 0x84,
-             0x42, 0x12, 0x98, 0x3b,
-             0x88, 0x2b, 0x72, 0x88,
-             0xef, 0xf0, 0x58, 0x88,
-             0xe0, 0x00, 0x03, 0x4a,
-             0x02, 0x1a, 0x3e, 0x14,
-             0x00, 0x6a, 0xe0, 0x00,
-             0x42, 0x0a, 0xe0, 0x00,
-             0x42, 0x1a, 0xe5, 0x80,
-             0x42, 0x0a, 0xe1, 0x88,
-             0x00, 0x06, 0xed, 0x80,
-             0x04, 0x0e, 0xc0, 0x00,
-             0xa0, 0xf1, 0x81, 0x01,
-             0xf6, 0x7c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xf8, 0x7c, 0x04, 0x0c,
-             0x4c, 0x52, 0x0d, 0x04,
-             0x0c, 0x23, 0xf0, 0x80,
-             0xf0, 0x94, 0x4e, 0x12,
-             0x61, 0x96, 0x58, 0x2a,
-             0xec, 0x04, 0x10, 0x50,
-             0xc4, 0x87, 0x02, 0x71,
-             0x18, 0x33, 0x8f, 0x24,
-             0x46, 0x3a, 0xc4, 0xc7,
-             0x42, 0x02, 0x61, 0x96,
-             0x4c, 0x6a, 0xf0, 0xb0,
-             0x82, 0x9b, 0x61, 0x96,
-             0x61, 0x96, 0x4e, 0x7a,
-             0xc4, 0x37, 0x81, 0x51,
-             0x70, 0x8c, 0x58, 0x02,
-             0xf0, 0xa0, 0x46, 0x02,
-             0xe5, 0xa4, 0x81, 0x65,
-             0x94, 0x53, 0xc6, 0x9d,
-             0xdc, 0x00, 0x52, 0x00,
-             0xfe, 0x55, 0x99, 0x9b,
-             0xa3, 0x4d, 0x44, 0x67,
-             0xc4, 0x77, 0x04, 0x63,
-             0x80, 0x00, 0x0c, 0x95,
-             0x52, 0x92, 0x02, 0x65,
-             0xff, 0x91, 0x90, 0x94,
-             0x60, 0x24, 0x49, 0x1a,
-             0x0c, 0x95, 0x8a, 0x9b,
-             0x52, 0x92, 0xa0, 0x00,
-             0x18, 0x9e, 0xb1, 0x94,
-             0x04, 0x83, 0x84, 0x73,
-             0x83, 0xd5, 0xff, 0x91,
-             0xc5, 0xb4, 0xf1, 0xa4,
-             0x4a, 0xa2, 0x8a, 0xa3,
-             0x0c, 0xa5, 0xf1, 0xac,
-             0x02, 0x45, 0x80, 0x00,
-             0x90, 0x94, 0x54, 0xa2,
-             0x60, 0x24, 0x49, 0x1a,
-             0x0c, 0xa5, 0x8a, 0xab,
-             0x54, 0xa2, 0xa0, 0x00,
-             0x18, 0xae, 0xb1, 0x94,
-             0xe4, 0x0c, 0x59, 0x1a,
-             0x3c, 0x01, 0x58, 0x00,
-             0x43, 0x1a, 0x40, 0x00,
-             0x42, 0x00, 0xe4, 0x0c,
-             0xc0, 0x00, 0x3c, 0x01,
-             0x64, 0x10, 0x14, 0x60,
-             0x55, 0x1a, 0x84, 0x6b,
-             0x4c, 0xa0, 0xe4, 0x20,
-             0x4c, 0x1a, 0xbc, 0x00,
-             0x3d, 0xb8, 0xe0, 0x1c,
-             0xc3, 0xff, 0x3f, 0xfd,
-             0x0c, 0x0c, 0x81, 0x01,
-             0xdd, 0x93, 0xf0, 0x7c,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x30, 0x1e, 0xf0,
-             0xca, 0x37, 0x00, 0x8b,
-             0xe1, 0xfc, 0x14, 0x84,
-             0x00, 0xa4, 0x90, 0xa3,
-             0x80, 0x33, 0xe1, 0x04,
-             0x60, 0xa2, 0x40, 0x3a,
-             0xe1, 0x7c, 0x06, 0x54,
-             0x61, 0x7c, 0x18, 0x04,
-             0x56, 0xc2, 0xaa, 0x03,
-             0x46, 0x02, 0xf3, 0x8c,
-             0x17, 0x34, 0xf9, 0xac,
-             0x41, 0xfe, 0xa1, 0x3b,
-             0x00, 0x01, 0x1f, 0xfd,
-             0x80, 0x08, 0x4e, 0x96,
-             0x0a, 0x44, 0x90, 0x05,
-             0xa4, 0x43, 0x61, 0x7c,
-             0x61, 0x7c, 0x18, 0x24,
-             0x4a, 0x52, 0xff, 0x21,
-             0x81, 0x71, 0x73, 0xb0,
-             0x44, 0x72, 0x04, 0x5d,
-             0x3e, 0x1e, 0xf1, 0x80,
-             0x12, 0x44, 0x80, 0xcb,
-             0xe0, 0x57, 0x61, 0xc0,
-             0x1c, 0x00, 0x58, 0x20,
-             0xf3, 0xac, 0x42, 0x72,
-             0xe0, 0x47, 0x7c, 0x3e,
-             0x60, 0x84, 0x06, 0xb4,
-             0xe1, 0xfc, 0x0c, 0x04,
-             0x60, 0x84, 0x04, 0x04,
-             0x56, 0x10, 0xb2, 0x5f,
-             0x40, 0xc2, 0x1c, 0x00,
-             0x42, 0xb2, 0xf0, 0x90,
-             0xac, 0x3f, 0x72, 0x94,
-             0xef, 0xf0, 0x4c, 0x28,
-             0x02, 0xa4, 0x95, 0xb4,
-             0xd6, 0xb7, 0x7c, 0x00,
-             0xa2, 0x83, 0x3e, 0x14,
-             0xa3, 0x8b, 0x7c, 0x34,
-             0x04, 0x01, 0x00, 0x00,
-             0xd6, 0x17, 0x80, 0x04,
-             0x02, 0x04, 0x82, 0x03,
-             0x96, 0x1f, 0xe1, 0x7c,
-             0x40, 0x1a, 0x80, 0x13,
-             0x00, 0x02, 0xe1, 0xae,
-             0x00, 0x02, 0xe0, 0x00,
-             0xc7, 0xff, 0x6b, 0xfd,
-             0x8e, 0x0b, 0x0c, 0x0e,
-             0x0c, 0x0c, 0x98, 0xf1,
-             0xdd, 0x93, 0xf2, 0x7c,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x50, 0x1e, 0xf0,
-             0xa4, 0x13, 0x1b, 0x74,
-             0xa4, 0x03, 0x09, 0x3e,
-             0x8a, 0x9b, 0x1f, 0x64,
-             0x46, 0x72, 0x1d, 0x84,
-             0x56, 0x3a, 0xf0, 0x88,
-             0x88, 0x2b, 0x61, 0x9e,
-             0x7c, 0x4e, 0x99, 0xa4,
-             0x16, 0x13, 0x8e, 0x4b,
-             0x7e, 0x1e, 0x96, 0x03,
-             0x21, 0xb4, 0xa0, 0x13,
-             0x3c, 0x6e, 0x93, 0x1d,
-             0xc4, 0x04, 0x12, 0x10,
-             0x70, 0xa4, 0x42, 0x02,
-             0x02, 0x10, 0x94, 0x3b,
-             0x90, 0x5b, 0x6c, 0x04,
-             0xef, 0xfc, 0x69, 0x68,
-             0x86, 0x15, 0xa1, 0x0b,
-             0x94, 0x3b, 0x7e, 0x14,
-             0x8e, 0x4b, 0x3c, 0xbe,
-             0x90, 0x5b, 0x7c, 0x24,
-             0xe4, 0x04, 0x00, 0x10,
-             0x6f, 0xfc, 0x68, 0xa8,
-             0xa1, 0x0b, 0xb2, 0x03,
-             0x18, 0x04, 0x82, 0x75,
-             0x40, 0x0a, 0xd6, 0x77,
-             0x98, 0x0e, 0xe1, 0x1e,
-             0x40, 0x0a, 0xac, 0x04,
-             0x2c, 0x0e, 0xe1, 0x1e,
-             0x98, 0x24, 0x81, 0x01,
-             0xc2, 0x2d, 0xac, 0x14,
-             0x40, 0x00, 0x4c, 0x15,
-             0xdc, 0x00, 0x42, 0x20,
-             0xc0, 0x00, 0x56, 0x25,
-             0xc0, 0x00, 0x0c, 0x35,
-             0x44, 0x30, 0x09, 0x34,
-             0xa8, 0xf1, 0xdc, 0x00,
-             0x4c, 0x35, 0xc6, 0x2d,
-             0x16, 0x15, 0xc0, 0x00,
-             0xc7, 0x1d, 0xc0, 0x00,
-             0xc0, 0x00, 0x56, 0x35,
-             0xf2, 0x7c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0xf0, 0x1e, 0xf0,
-             0x84, 0x9b, 0x11, 0x1e,
-             0x93, 0x4e, 0x95, 0x5e,
-             0x97, 0x3e, 0x8f, 0x0e,
-             0xb3, 0x14, 0x8c, 0x08,
-             0x19, 0x1e, 0xa1, 0x0b,
-             0x9d, 0x1e, 0x81, 0x11,
-             0x84, 0x45, 0x9b, 0x1e,
-             0xe0, 0x04, 0x00, 0x02,
-             0x85, 0xb3, 0x81, 0x13,
-             0x8b, 0xf3, 0x99, 0x04,
-             0xe5, 0x80, 0x00, 0x00,
-             0xf8, 0x60, 0x40, 0x15,
-             0xf8, 0x30, 0x40, 0x15,
-             0x40, 0x15, 0xc1, 0x1e,
-             0x40, 0x15, 0xe0, 0x2c,
-             0x97, 0x04, 0xe0, 0x5c,
-             0xa1, 0x0b, 0x82, 0x08,
-             0x31, 0xb4, 0xa2, 0x25,
-             0xaf, 0x84, 0x81, 0x71,
-             0x13, 0x24, 0xad, 0xa4,
-             0xe0, 0x84, 0x00, 0x74,
-             0x7c, 0x00, 0x04, 0x43,
-             0xf0, 0x80, 0x42, 0x22,
-             0xe0, 0x90, 0x02, 0x23,
-             0x82, 0x45, 0x84, 0x4d,
-             0x06, 0x74, 0x19, 0x04,
-             0x80, 0x33, 0xe0, 0x88,
-             0x02, 0x55, 0x86, 0x1b,
-             0x84, 0x04, 0xf0, 0x30,
-             0x19, 0x04, 0x85, 0xf5,
-             0xe0, 0x88, 0x06, 0x74,
-             0x44, 0x42, 0x09, 0x2e,
-             0x0d, 0x7e, 0xfa, 0x08,
-             0x00, 0x33, 0x82, 0x21,
-             0x06, 0x1b, 0xa8, 0x23,
-             0xe6, 0x40, 0x0c, 0x30,
-             0xf0, 0x30, 0x02, 0x55,
-             0x02, 0xc5, 0x84, 0x04,
-             0x05, 0x13, 0xe0, 0x60,
-             0xec, 0x04, 0x04, 0x40,
-             0x8b, 0x4e, 0x85, 0x33,
-             0xe8, 0x00, 0x31, 0x3c,
-             0x70, 0x88, 0x4e, 0xa2,
-             0x82, 0x71, 0x82, 0x21,
-             0xe1, 0xaa, 0x4e, 0x7a,
-             0x10, 0x45, 0xc4, 0x77,
-             0x88, 0x03, 0xfc, 0x1c,
-             0xe4, 0x44, 0x84, 0x0e,
-             0x8c, 0x5e, 0x88, 0x53,
-             0xfc, 0x1c, 0x16, 0x45,
-             0x98, 0xce, 0x88, 0xc3,
-             0x8b, 0x44, 0x8d, 0x74,
-             0x20, 0x51, 0x89, 0x24,
-             0xe0, 0x88, 0x0c, 0x74,
-             0x08, 0x44, 0x4b, 0x57,
-             0x0c, 0x5e, 0xfb, 0x80,
-             0x1e, 0x55, 0xca, 0x0d,
-             0x40, 0x02, 0x40, 0x30,
-             0x06, 0x74, 0xd1, 0x94,
-             0x82, 0x21, 0x40, 0x88,
-             0xfa, 0x80, 0x18, 0xa4,
-             0xd0, 0x94, 0x46, 0x32,
-             0x40, 0x60, 0x46, 0x05,
-             0xf1, 0x90, 0x46, 0x22,
-             0x06, 0x34, 0x0f, 0x04,
-             0x00, 0x09, 0xfb, 0x00,
-             0x19, 0x04, 0xe0, 0x30,
-             0x80, 0x63, 0xa1, 0x0b,
-             0xe6, 0x40, 0x00, 0x60,
-             0xc0, 0x00, 0x00, 0x25,
-             0x80, 0x00, 0x04, 0x06,
-             0x00, 0x00, 0x40, 0x25,
-             0x80, 0x00, 0x04, 0x06,
-             0xa6, 0x04, 0x91, 0x44,
-             0x50, 0x58, 0x84, 0x14,
-             0xe4, 0xd0, 0x08, 0xf0,
-             0x08, 0xf0, 0x7c, 0x4e,
-             0xbe, 0x4e, 0xe4, 0xe0,
-             0x95, 0x44, 0xbc, 0xce,
-             0xe8, 0x00, 0x62, 0x08,
-             0x82, 0x71, 0x21, 0x0b,
-             0x80, 0x34, 0x1e, 0x15,
-             0x80, 0xc0, 0x4c, 0x15,
-             0x86, 0x18, 0x97, 0x14,
-             0xde, 0xd5, 0x83, 0x7d,
-             0x02, 0x0b, 0x80, 0x1b,
-             0x0c, 0x0c, 0xf8, 0xf1,
-             0xdd, 0x93, 0xf2, 0x7c,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xed, 0xf0, 0x1e, 0xf0,
-             0x1e, 0x05, 0xa9, 0x0e,
-             0x97, 0x2e, 0xe0, 0xac,
-             0xe0, 0xb4, 0x1e, 0x25,
-             0x1e, 0x05, 0x9d, 0x0e,
-             0x19, 0x5e, 0xe0, 0xa0,
-             0xe6, 0x40, 0x18, 0x20,
-             0x99, 0x51, 0x15, 0x1e,
-             0x1e, 0x05, 0xa3, 0x0e,
-             0x1e, 0x15, 0xe0, 0x9c,
-             0x1e, 0x65, 0xe0, 0xb0,
-             0x13, 0x0e, 0xe0, 0xa8,
-             0x1e, 0xb5, 0x81, 0x01,
-             0x1e, 0x75, 0xe0, 0xa4,
-             0xbd, 0x0e, 0xe0, 0x98,
-             0xb9, 0x0e, 0xbb, 0x0e,
-             0xb5, 0x0e, 0xb7, 0x0e,
-             0xb1, 0x0e, 0xb3, 0x0e,
-             0x81, 0x45, 0xaf, 0x0e,
-             0x0a, 0x50, 0x71, 0x0c,
-             0xa1, 0x5b, 0xec, 0x04,
-             0x29, 0x54, 0xfe, 0x95,
-             0xe6, 0x40, 0x14, 0x20,
-             0x12, 0x10, 0x1b, 0x7e,
-             0x25, 0x6e, 0xe4, 0xc0,
-             0xe5, 0x80, 0x0c, 0x40,
-             0x65, 0x01, 0x18, 0x50,
-             0x0a, 0x50, 0x40, 0x02,
-             0xc0, 0x04, 0x66, 0x01,
-             0x10, 0x10, 0x21, 0xce,
-             0x1f, 0x5e, 0xe6, 0x40,
-             0xe0, 0x08, 0x44, 0x96,
-             0x81, 0x71, 0x27, 0x3e,
-             0x93, 0x95, 0xab, 0xbe,
-             0x02, 0x0a, 0xa4, 0x14,
-             0xc7, 0xff, 0x63, 0xfd,
-             0xa1, 0x0b, 0x8a, 0x05,
-             0x25, 0xb4, 0x86, 0xd5,
-             0xad, 0x2e, 0x96, 0x3b,
-             0xf8, 0xc0, 0x0c, 0x03,
-             0x78, 0x30, 0x0c, 0x13,
-             0xa3, 0x24, 0x96, 0x4b,
-             0x6b, 0x58, 0xa9, 0x54,
-             0xa1, 0x0b, 0xe8, 0x00,
-             0x0c, 0x03, 0x82, 0xb5,
-             0x81, 0x21, 0x78, 0xc0,
-             0x78, 0x30, 0x0c, 0x13,
-             0xab, 0x34, 0x96, 0x4b,
-             0x6a, 0x98, 0xa1, 0x54,
-             0xa1, 0x0b, 0xe8, 0x00,
-             0xa7, 0x34, 0x84, 0x45,
-             0xad, 0x24, 0xab, 0xb4,
-             0xe2, 0xa4, 0x04, 0x0a,
-             0x0f, 0xfc, 0x43, 0xf6,
-             0x80, 0x08, 0x44, 0x96,
-             0x80, 0x00, 0x54, 0x13,
-             0x88, 0x91, 0x02, 0x71,
-             0x84, 0x61, 0x04, 0xa1,
-             0x84, 0x81, 0x0d, 0x85,
-             0x81, 0x21, 0x2b, 0xb4,
-             0xf8, 0xc0, 0x0c, 0x03,
-             0xf8, 0x30, 0x0c, 0x13,
-             0x96, 0x3b, 0x1d, 0x44,
-             0x68, 0xb8, 0x9f, 0x54,
-             0x27, 0x34, 0xe8, 0x00,
-             0xad, 0x24, 0xa1, 0x0b,
-             0x20, 0x02, 0xf8, 0x95,
-             0xe5, 0xa0, 0x04, 0xf0,
-             0x06, 0xf0, 0x18, 0x12,
-             0x3e, 0x2e, 0xe5, 0xd0,
-             0xe5, 0xb0, 0x0a, 0xf0,
-             0x96, 0x03, 0x11, 0x3e,
-             0xe1, 0xae, 0x40, 0x0a,
-             0xbc, 0x3e, 0x9b, 0xb4,
-             0x2b, 0x34, 0xad, 0x0e,
-             0xa1, 0x44, 0x96, 0x2b,
-             0xef, 0xfc, 0x4d, 0x08,
-             0x00, 0xf0, 0x18, 0x12,
-             0x3e, 0x0e, 0xe5, 0xc0,
-             0xe5, 0xe0, 0x0a, 0xf0,
-             0x96, 0x2b, 0x11, 0x04,
-             0xa9, 0x44, 0xab, 0x34,
-             0x2d, 0x04, 0xbc, 0x0e,
-             0x4c, 0x18, 0x86, 0xbb,
-             0x97, 0x04, 0xef, 0xfc,
-             0xe0, 0x30, 0x00, 0x09,
-             0x84, 0x05, 0xa1, 0x0b,
-             0x65, 0x70, 0x00, 0xf0,
-             0xe5, 0x80, 0x04, 0xf0,
-             0x0a, 0xf0, 0x18, 0x12,
-             0x3e, 0x0e, 0xe5, 0x90,
-             0xbc, 0x2e, 0x96, 0x3b,
-             0x9b, 0x24, 0xad, 0x04,
-             0x4a, 0xd8, 0x9f, 0x44,
-             0xbd, 0x04, 0xef, 0xfc,
-             0x99, 0x24, 0x95, 0x14,
-             0xbb, 0x04, 0xad, 0x0e,
-             0xb5, 0x34, 0xb3, 0xb4,
-             0x84, 0x1a, 0x91, 0x0e,
-             0x8b, 0x2e, 0x8d, 0xae,
-             0xaf, 0x04, 0x93, 0x24,
-             0x89, 0x2e, 0xb1, 0xc4,
-             0xfc, 0xbe, 0xfe, 0x0e,
-             0xbe, 0xce, 0xab, 0xb4,
-             0xb9, 0x44, 0xbc, 0x3e,
-             0x9b, 0x04, 0xb7, 0x54,
-             0x91, 0x34, 0xad, 0x24,
-             0xe8, 0x14, 0x7a, 0x08,
-             0x81, 0x01, 0x00, 0x2b,
-             0xf1, 0xd5, 0xa7, 0x34,
-             0x83, 0x7d, 0x8e, 0x18,
-             0x1e, 0xf0, 0xd8, 0xd5,
-             0x0c, 0x0c, 0xe5, 0xf0,
-             0xdd, 0x93, 0xf2, 0x7c,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x50, 0x1e, 0xf0,
-             0x82, 0x8b, 0x3e, 0x2e,
-             0x00, 0x50, 0x00, 0x9b,
-             0x19, 0x11, 0xe7, 0x60,
-             0x81, 0x85, 0x81, 0x21,
-             0x78, 0x60, 0x40, 0x23,
-             0xec, 0x04, 0x02, 0x10,
-             0xf8, 0x30, 0x40, 0x23,
-             0xa1, 0x1b, 0xc1, 0x2c,
-             0x0c, 0x50, 0xfe, 0x15,
-             0x0e, 0x40, 0x67, 0x60,
-             0x7c, 0x3e, 0xe4, 0xc0,
-             0xbe, 0xb4, 0x81, 0xa1,
-             0x9c, 0x04, 0x85, 0xd5,
-             0x63, 0xfd, 0x00, 0x0a,
-             0x88, 0xa5, 0xc7, 0xff,
-             0x78, 0x30, 0x0e, 0x15,
-             0xa0, 0x24, 0x96, 0x0b,
-             0xe0, 0x42, 0xa4, 0x3a,
-             0x42, 0x98, 0xe4, 0x58,
-             0x09, 0x0e, 0xe8, 0x00,
-             0x9c, 0x14, 0x96, 0x0b,
-             0xa4, 0x3a, 0xa0, 0x24,
-             0xe4, 0x58, 0xe0, 0x42,
-             0xe8, 0x00, 0x42, 0x08,
-             0x96, 0x0b, 0x7e, 0x0e,
-             0xe0, 0x30, 0x0e, 0x15,
-             0xa4, 0x3a, 0xa0, 0x24,
-             0xe4, 0x58, 0xe0, 0x42,
-             0xe8, 0x00, 0x41, 0x68,
-             0xfc, 0x34, 0xfe, 0x14,
-             0xf8, 0x60, 0x4c, 0x13,
-             0x98, 0x0c, 0x89, 0x14,
-             0xf8, 0x30, 0x4c, 0x13,
-             0x84, 0x61, 0x02, 0xa1,
-             0x8e, 0x08, 0x88, 0x71,
-             0xf4, 0x55, 0x81, 0xad,
-             0xa8, 0xf1, 0x01, 0x01,
-             0xf2, 0x7c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x18, 0x0e, 0x24, 0x13,
-             0x44, 0x1a, 0xf0, 0x00,
-             0x40, 0x1a, 0xe4, 0x82,
-             0x02, 0x24, 0xe4, 0x02,
-             0x82, 0xcf, 0xe1, 0x7c,
-             0x81, 0x01, 0x00, 0xc3,
-             0xf2, 0x84, 0x42, 0x22,
-             0x64, 0x01, 0x04, 0xc0,
-             0x42, 0x12, 0xc0, 0x80,
-             0x18, 0x14, 0xf2, 0x80,
-             0xe1, 0xc7, 0xe1, 0x7c,
-             0x42, 0x12, 0x98, 0x23,
-             0xe1, 0x27, 0x72, 0x80,
-             0xa2, 0x2f, 0xe0, 0x17,
-             0x08, 0x0e, 0x08, 0x23,
-             0x42, 0x2a, 0xff, 0x00,
-             0x44, 0x2a, 0xe4, 0x8e,
-             0x06, 0x14, 0xe4, 0x0e,
-             0x86, 0x4f, 0xe1, 0x7c,
-             0x42, 0x12, 0x88, 0x23,
-             0x04, 0x20, 0xf2, 0x8c,
-             0xc0, 0x08, 0x64, 0x01,
-             0xf2, 0x80, 0x42, 0x12,
-             0xe1, 0x7c, 0x06, 0x14,
-             0x86, 0x23, 0xe9, 0x37,
-             0x72, 0x80, 0x42, 0x12,
-             0xe8, 0x17, 0xd9, 0x27,
-             0x02, 0x0e, 0x22, 0x2f,
-             0x42, 0x22, 0xf8, 0x00,
-             0x02, 0x12, 0xfa, 0x04,
-             0xc0, 0x7f, 0x6b, 0xfd,
-             0x40, 0x10, 0xa1, 0x1d,
-             0xa0, 0x5d, 0x1c, 0x00,
-             0x40, 0x10, 0x5d, 0x93,
-             0xc1, 0xc3, 0x9c, 0x00,
-             0xfa, 0x3c, 0x04, 0xcc,
-             0x88, 0x6b, 0x00, 0x8b,
-             0x60, 0x2c, 0x10, 0x09,
-             0x01, 0xa1, 0x83, 0x41,
-             0x20, 0x34, 0xc8, 0x27,
-             0x21, 0x4f, 0x86, 0x7b,
-             0x0f, 0xae, 0x82, 0x0b,
-             0x0d, 0xae, 0x84, 0x1b,
-             0x4a, 0x78, 0x88, 0x2b,
-             0x58, 0xae, 0xe8, 0x2c,
-             0x1a, 0xae, 0x80, 0x9b,
-             0xe4, 0x70, 0x04, 0xf0,
-             0x92, 0x1b, 0x0e, 0x0b,
-             0xe8, 0x2c, 0x4f, 0x88,
-             0x84, 0x35, 0xa1, 0x0b,
-             0x06, 0xf0, 0x0f, 0x04,
-             0x22, 0x14, 0xe4, 0x60,
-             0x58, 0x0e, 0x92, 0x2b,
-             0x4b, 0x78, 0x8e, 0x0b,
-             0xa1, 0x0b, 0xe8, 0x2c,
-             0x80, 0x18, 0x1e, 0x05,
-             0x00, 0x04, 0x4c, 0x05,
-             0x80, 0x00, 0x00, 0x06,
-             0xf2, 0x3c, 0x0c, 0xcc,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x30, 0x1e, 0xf0,
-             0x88, 0x9b, 0x00, 0x7b,
-             0x60, 0x2c, 0x0e, 0x09,
-             0x0e, 0x29, 0x84, 0x6b,
-             0x83, 0x51, 0x60, 0x30,
-             0x60, 0x10, 0x0e, 0x4b,
-             0x21, 0x5f, 0x81, 0xb1,
-             0x1c, 0x34, 0x86, 0xab,
-             0x7c, 0xbe, 0x82, 0x0b,
-             0xe8, 0x88, 0x04, 0x54,
-             0x88, 0x1b, 0x3e, 0xbe,
-             0xe8, 0x2c, 0x46, 0xe8,
-             0x00, 0x90, 0x00, 0x8b,
-             0x01, 0x95, 0xe4, 0xc0,
-             0x41, 0xbe, 0x99, 0x11,
-             0xec, 0x04, 0x02, 0x10,
-             0xf8, 0x34, 0x40, 0xb5,
-             0xe0, 0x2c, 0x40, 0xb5,
-             0xfe, 0x15, 0xa1, 0x1b,
-             0x65, 0x80, 0x14, 0xa0,
-             0x05, 0xc5, 0xe0, 0x91,
-             0xa1, 0x0b, 0x81, 0x01,
-             0x28, 0x04, 0x88, 0xd5,
-             0xe4, 0x20, 0x04, 0xf0,
-             0x68, 0x2c, 0x4a, 0xe8,
-             0xa1, 0x0b, 0x90, 0x1b,
-             0x7c, 0x04, 0x86, 0xd5,
-             0xe4, 0x10, 0x06, 0xf0,
-             0xa4, 0x0e, 0x90, 0x2b,
-             0x9e, 0x14, 0xa8, 0x04,
-             0xe8, 0x2c, 0x46, 0xc8,
-             0x84, 0x75, 0xa1, 0x0b,
-             0x06, 0xf0, 0x3e, 0x04,
-             0x90, 0x2b, 0xe4, 0x10,
-             0xf8, 0x30, 0x52, 0x05,
-             0xe0, 0x60, 0x14, 0x05,
-             0x45, 0xf8, 0x9e, 0x14,
-             0xa1, 0x0b, 0xe8, 0x2c,
-             0x80, 0x04, 0x1e, 0x05,
-             0x00, 0x30, 0x52, 0x05,
-             0x80, 0x00, 0x00, 0x06,
-             0x88, 0xa1, 0x02, 0xb1,
-             0x9a, 0x18, 0x88, 0x91,
-             0xf4, 0x95, 0x83, 0xbd,
-             0x0c, 0x0c, 0x98, 0xf1,
-             0xdd, 0x93, 0xf2, 0x7c,
-             0xfa, 0x7c, 0x04, 0x4c,
-             0x84, 0x7b, 0x11, 0x24,
-             0x88, 0x9b, 0x15, 0xa4,
-             0xff, 0x81, 0x13, 0xb4,
-             0x41, 0xf6, 0xa1, 0x2b,
-             0x4c, 0x96, 0x0f, 0xfc,
-             0x8a, 0x05, 0x80, 0x08,
-             0x44, 0x2a, 0x2b, 0x3f,
-             0x46, 0x3a, 0xe6, 0x8a,
-             0x81, 0x61, 0x66, 0x8e,
-             0x42, 0x3a, 0x8f, 0x1e,
-             0x46, 0x3a, 0xe5, 0x02,
-             0x00, 0x24, 0x65, 0x82,
-             0x82, 0x03, 0xe1, 0x84,
-             0x72, 0x98, 0x42, 0x32,
-             0x62, 0xf8, 0x81, 0x31,
-             0x0f, 0x24, 0xef, 0xec,
-             0x41, 0xfe, 0x91, 0x0b,
-             0xa1, 0x1b, 0x1f, 0xfc,
-             0x5f, 0xfc, 0x41, 0xfe,
-             0x02, 0x94, 0xa1, 0x9b,
-             0x81, 0x81, 0x41, 0x84,
-             0x50, 0x9c, 0x42, 0x12,
-             0x50, 0x1a, 0x84, 0x73,
-             0x80, 0x73, 0x40, 0x26,
-             0x40, 0x8a, 0x8e, 0x83,
-             0xac, 0x8e, 0xf0, 0x0a,
-             0x8c, 0x0b, 0x28, 0x0e,
-             0xf2, 0x7c, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xe6, 0x82, 0x40, 0x1a,
-             0x64, 0x01, 0x00, 0x00,
-             0xdf, 0x07, 0xc0, 0x40,
-             0x6f, 0xfd, 0x00, 0x02,
-             0x5d, 0x93, 0xc0, 0x3f,
-             0xfb, 0x80, 0x00, 0x04,
-             0xfe, 0x7c, 0x04, 0x0c,
-             0xec, 0x60, 0x1e, 0xf0,
-             0x82, 0x7b, 0x04, 0x9b,
-             0x81, 0x61, 0x00, 0x5b,
-             0x81, 0x11, 0x12, 0x0b,
-             0x81, 0xb1, 0x01, 0xa1,
-             0x03, 0x0a, 0x81, 0xc5,
-             0x82, 0x75, 0xe2, 0x3c,
-             0xf0, 0x08, 0x00, 0x25,
-             0xf8, 0x04, 0x00, 0x45,
-             0x56, 0x42, 0x84, 0xa3,
-             0x82, 0x11, 0x72, 0xac,
-             0xfc, 0x95, 0x8f, 0x1d,
-             0x60, 0x00, 0x17, 0x4a,
-             0xe1, 0x84, 0x00, 0xa4,
-             0x60, 0x00, 0x16, 0x1a,
-             0xe0, 0xfc, 0x02, 0xb4,
-             0x60, 0x00, 0x14, 0x6a,
-             0x7e, 0x0e, 0xa2, 0x0f,
-             0xe5, 0x80, 0x42, 0x0a,
-             0x61, 0x88, 0x42, 0x1a,
-             0xe1, 0x84, 0x00, 0xb4,
-             0x42, 0x2a, 0x7c, 0x0e,
-             0x3e, 0x3e, 0xed, 0x80,
-             0xe4, 0x30, 0x10, 0x30,
-             0x5e, 0x27, 0x89, 0x5e,
-             0x89, 0xa5, 0xe0, 0x5c,
-             0x60, 0x1c, 0x4c, 0xca,
-             0x44, 0x0a, 0x81, 0x01,
-             0x40, 0x0a, 0xe1, 0x80,
-             0x8e, 0xe5, 0xe9, 0x9c,
-             0x81, 0x01, 0x26, 0x24,
-             0x04, 0xca, 0xa4, 0x14,
-             0x04, 0x1a, 0xe0, 0x00,
-             0x02, 0x2a, 0xe0, 0x00,
-             0x42, 0x0a, 0xe0, 0x00,
-             0x42, 0x1a, 0xe5, 0x80,
-             0x1e, 0x27, 0xe1, 0x88,
-             0x42, 0x0a, 0xe0, 0x5c,
-             0x8a, 0xa5, 0xed, 0x80,
-             0x64, 0x7c, 0x0b, 0x0a,
-             0x00, 0x50, 0x82, 0x3b,
-             0x46, 0x20, 0x6c, 0x80,
-             0x44, 0x52, 0x9c, 0x00,
-             0x02, 0x06, 0x7b, 0x80,
-             0x00, 0x22, 0xc0, 0x00,
-             0x20, 0x23, 0xec, 0x7c,
-             0xef, 0x80, 0x08, 0x14,
-             0x6c, 0x00, 0x0a, 0x04,
-             0x7e, 0x04, 0xa1, 0x3f,
-             0x48, 0x52, 0xa1, 0x1f,
-             0x04, 0x22, 0x78, 0x90,
-             0xa8, 0x3f, 0xec, 0x04,
-             0x82, 0x03, 0x7c, 0x14,
-             0x94, 0x2b, 0x25, 0x3f,
-             0x72, 0x84, 0x42, 0x32,
-             0x59, 0x58, 0x96, 0x3b,
-             0x09, 0x54, 0xef, 0xec,
-             0x67, 0xfd, 0x00, 0x8a,
-             0x41, 0xf6, 0xc0, 0xff,
-             0xa1, 0x1b, 0x0f, 0xfc,
-             0xcf, 0xfc, 0x41, 0xf6,
-             0x82, 0x61, 0x61, 0x0c,
-             0x0c, 0x0a, 0x90, 0x91,
-             0xec, 0xb5, 0xe2, 0x40,
-             0xb0, 0xf1, 0x3e, 0x04,
-             0xe0, 0x18, 0x40, 0x71,
-             0xe0, 0x1c, 0x40, 0x51,
-             0xf6, 0x7c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xf8, 0x00, 0x04, 0x4c,
-             0x02, 0x10, 0x0a, 0x28,
-             0x08, 0x14, 0xec, 0x04,
-             0xe0, 0x31, 0x61, 0xfc,
-             0x83, 0x41, 0x08, 0x13,
-             0x83, 0x17, 0x03, 0xa5,
-             0x78, 0x30, 0x06, 0x5b,
-             0xec, 0x04, 0x04, 0x20,
-             0x82, 0x60, 0x80, 0xc0,
-             0x46, 0xc3, 0x8a, 0xc3,
-             0xcd, 0x5a, 0xf8, 0x60,
-             0x0a, 0xc4, 0x0a, 0x63,
-             0x18, 0x64, 0xfb, 0x00,
-             0x4a, 0x42, 0x7b, 0x00,
-             0x46, 0x63, 0xf1, 0x94,
-             0x98, 0x53, 0x60, 0x2c,
-             0xfb, 0x14, 0x4a, 0x12,
-             0xe0, 0x5c, 0x46, 0x53,
-             0xf8, 0xf5, 0xa1, 0x2b,
-             0x0c, 0x4c, 0x81, 0x01,
-             0xdd, 0x93, 0xf0, 0x00,
-             0xf8, 0x04, 0x04, 0x0c,
-             0x60, 0x88, 0x0c, 0x34,
-             0x01, 0x45, 0x8a, 0x7b,
-             0xf0, 0x98, 0x58, 0x52,
-             0xd9, 0x7d, 0xdd, 0x2e,
-             0x06, 0x13, 0xfe, 0xd5,
-             0x44, 0x0a, 0x86, 0x03,
-             0x82, 0x11, 0x61, 0x8e,
-             0x61, 0x8e, 0x46, 0x1a,
-             0xf0, 0x98, 0x40, 0x42,
-             0x0c, 0x34, 0xc4, 0x27,
-             0x42, 0x42, 0x60, 0x88,
-             0x46, 0x52, 0xf0, 0x88,
-             0x44, 0x42, 0x70, 0x88,
-             0x81, 0x95, 0xf0, 0x98,
-             0xc1, 0x1d, 0xc5, 0x64,
-             0x42, 0x40, 0xcd, 0x6e,
-             0xd9, 0x3d, 0x1c, 0x00,
-             0x9c, 0x00, 0x46, 0x50,
-             0xfc, 0xf5, 0x85, 0x1b,
-             0x0c, 0x0c, 0x81, 0x01,
-             0xdd, 0x93, 0xf0, 0x04,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x70, 0x1e, 0xf0,
-             0x00, 0x34, 0x00, 0x8b,
-             0x06, 0x03, 0xe1, 0xfc,
-             0x1f, 0x14, 0x82, 0xbb,
-             0x0d, 0x3e, 0x83, 0x07,
-             0x1d, 0x34, 0x8a, 0x6b,
-             0x23, 0x74, 0x84, 0x5b,
-             0x21, 0xa4, 0xa0, 0x2b,
-             0x3e, 0x1e, 0x82, 0x9b,
-             0x0b, 0x4e, 0x90, 0x0b,
-             0x7e, 0x2e, 0x81, 0x41,
-             0x09, 0x3e, 0xaa, 0x23,
-             0x3c, 0x3e, 0x96, 0x1b,
-             0x7c, 0x5e, 0x8a, 0x3b,
-             0x6c, 0xf8, 0x8c, 0x5b,
-             0xa1, 0x0b, 0xef, 0xf8,
-             0x09, 0x04, 0x86, 0x75,
-             0x3e, 0xae, 0x81, 0x41,
-             0x7e, 0x24, 0x96, 0x1b,
-             0x3c, 0x0e, 0x8c, 0x5b,
-             0x8d, 0x34, 0x90, 0x0b,
-             0xef, 0xf8, 0x6c, 0x28,
-             0x82, 0xd5, 0xa1, 0x0b,
-             0x81, 0x41, 0x0d, 0x24,
-             0x96, 0x1b, 0x7e, 0x04,
-             0x8c, 0x5b, 0x3e, 0x7e,
-             0x09, 0x04, 0xfc, 0x34,
-             0x3c, 0x0e, 0x80, 0x23,
-             0x6b, 0x38, 0x90, 0x0b,
-             0x16, 0x1b, 0xef, 0xf8,
-             0x0b, 0x64, 0x96, 0x8d,
-             0x09, 0x0e, 0x8c, 0xbb,
-             0x0a, 0x55, 0x94, 0x4b,
-             0x25, 0x94, 0x92, 0x0b,
-             0xfa, 0x20, 0x42, 0x12,
-             0xb0, 0x13, 0x82, 0x11,
-             0xa7, 0x14, 0x83, 0x13,
-             0x83, 0xb3, 0x8d, 0x1e,
-             0xe8, 0x00, 0x31, 0xec,
-             0x70, 0xa0, 0x46, 0xb2,
-             0x46, 0x3a, 0x80, 0x1b,
-             0x82, 0x81, 0x61, 0xae,
-             0x00, 0xa5, 0xc4, 0x37,
-             0x88, 0x0b, 0x7c, 0x0c,
-             0x7c, 0x0c, 0x08, 0x55,
-             0xf0, 0x8c, 0x44, 0x92,
-             0xfc, 0x0c, 0x0e, 0xc5,
-             0x71, 0x98, 0x48, 0xa2,
-             0x0a, 0x43, 0x8c, 0xa3,
-             0x38, 0x43, 0xb4, 0x53,
-             0x08, 0x4e, 0x98, 0x53,
-             0x0d, 0x14, 0x80, 0x4b,
-             0x82, 0x33, 0x82, 0x0b,
-             0x09, 0x04, 0x8c, 0x5e,
-             0x0c, 0x0c, 0xb8, 0xf1,
-             0xdd, 0x93, 0xf2, 0x7c,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0xd0, 0x1e, 0xf0,
-             0x80, 0xbb, 0x29, 0x04,
-             0x82, 0x8b, 0x2f, 0x74,
-             0x43, 0xfe, 0x13, 0x4e,
-             0xc0, 0x01, 0x7f, 0xfd,
-             0x8a, 0x6b, 0x0f, 0x2e,
-             0xb1, 0x44, 0xb3, 0x24,
-             0x81, 0x01, 0x7e, 0x0e,
-             0x9c, 0x0e, 0x91, 0x3e,
-             0x97, 0x0e, 0x99, 0x0e,
-             0x41, 0xf6, 0x15, 0x0e,
-             0x8b, 0x4e, 0xe0, 0x0c,
-             0x8d, 0x2e, 0x90, 0x0c,
-             0xad, 0x94, 0x88, 0x1e,
-             0x91, 0xa4, 0xab, 0x54,
-             0x40, 0x62, 0x89, 0x7e,
-             0x42, 0x0a, 0xf0, 0xac,
-             0xc4, 0x17, 0xe1, 0x9a,
-             0xfc, 0x04, 0x0a, 0x25,
-             0x84, 0xa5, 0xa1, 0x2b,
-             0x84, 0xe5, 0xa1, 0x2d,
-             0xfc, 0x04, 0x12, 0x15,
-             0x8e, 0x95, 0xa1, 0x1d,
-             0x40, 0x0a, 0x82, 0x01,
-             0xc4, 0x07, 0xe1, 0x9a,
-             0xfc, 0x00, 0x0a, 0x15,
-             0x8c, 0x95, 0xa1, 0x1d,
-             0x7c, 0x00, 0x12, 0x05,
-             0x82, 0x0d, 0xff, 0x11,
-             0x81, 0xa5, 0x8a, 0xf5,
-             0xfc, 0x04, 0x12, 0x05,
-             0x8a, 0x45, 0xa1, 0x0b,
-             0x7c, 0x04, 0x12, 0x05,
-             0x82, 0x0d, 0xff, 0x11,
-             0x03, 0x01, 0x88, 0xa5,
-             0xe4, 0xb0, 0x02, 0xf0,
-             0x8a, 0x7b, 0x1c, 0x0e,
-             0x0a, 0xf0, 0x0b, 0x04,
-             0x14, 0x2b, 0xe4, 0xc0,
-             0x00, 0xbc, 0x8c, 0x3b,
-             0xe4, 0xa0, 0x00, 0xf0,
-             0x96, 0x0b, 0x3e, 0x0e,
-             0x8f, 0x14, 0xbc, 0x1e,
-             0x56, 0x78, 0xfe, 0x44,
-             0x0d, 0x04, 0xef, 0xf8,
-             0x99, 0x24, 0x96, 0x1b,
-             0x3e, 0x0e, 0x97, 0x34,
-             0x95, 0x44, 0x94, 0x0b,
-             0x93, 0x54, 0xbc, 0x6e,
-             0xef, 0xf8, 0x68, 0x28,
-             0x8e, 0x5b, 0x09, 0x74,
-             0xe2, 0xa4, 0x00, 0x0a,
-             0x81, 0x01, 0x80, 0x75,
-             0x82, 0xb1, 0x9c, 0x0e,
-             0x80, 0x85, 0x91, 0xbd,
-             0xa1, 0x0b, 0x9c, 0x04,
-             0x01, 0x01, 0xea, 0xe5,
-             0x0c, 0x0c, 0xe8, 0xf1,
-             0xdd, 0x93, 0xf2, 0x7c,
-             0xfa, 0x7c, 0x04, 0x4c,
-             0x82, 0x7b, 0x00, 0x6b,
-             0x60, 0x14, 0x0c, 0x19,
-             0xe0, 0x00, 0x40, 0xc6,
-             0x94, 0x75, 0xf4, 0x1d,
-             0xe0, 0x18, 0x0c, 0x29,
-             0x92, 0xf5, 0xf0, 0x2d,
-             0xe6, 0x86, 0x50, 0x2a,
-             0xe5, 0x00, 0x11, 0x0a,
-             0x19, 0x21, 0x92, 0x55,
-             0x66, 0x58, 0x8e, 0x0b,
-             0x8c, 0x1b, 0x6f, 0xec,
-             0x64, 0x30, 0x00, 0x70,
-             0xe0, 0x04, 0x02, 0x06,
-             0x81, 0x91, 0x01, 0x55,
-             0x02, 0x10, 0x41, 0x9c,
-             0xa1, 0x1b, 0xec, 0x04,
-             0x00, 0x60, 0xfe, 0x95,
-             0x81, 0xb1, 0x64, 0x90,
-             0x81, 0x11, 0x01, 0x95,
-             0xe5, 0x00, 0x02, 0x8a,
-             0x41, 0x24, 0x80, 0xe5,
-             0x56, 0x22, 0x82, 0x11,
-             0xd1, 0x1d, 0xfa, 0xac,
-             0x00, 0xb4, 0xfe, 0x15,
-             0xd8, 0xb7, 0x61, 0xd0,
-             0x98, 0x71, 0x0f, 0x0e,
-             0x81, 0xa1, 0x48, 0x61,
-             0x81, 0x01, 0x03, 0xd5,
-             0x40, 0x96, 0x18, 0x24,
-             0xa1, 0x2b, 0xe0, 0x08,
-             0x0f, 0x14, 0x84, 0x85,
-             0xe1, 0x84, 0x00, 0x24,
-             0x81, 0x31, 0x16, 0x03,
-             0x6f, 0xe8, 0x7f, 0x68,
-             0xf2, 0xa4, 0x42, 0x12,
-             0x67, 0xfd, 0x00, 0x8a,
-             0x41, 0xf6, 0xc0, 0xff,
-             0xa1, 0x1b, 0x0f, 0xfc,
-             0xcf, 0xfc, 0x41, 0xf6,
-             0x81, 0x01, 0x1c, 0x0c,
-             0x84, 0x71, 0x02, 0xa1,
-             0xd1, 0xad, 0x88, 0x61,
-             0x15, 0x0a, 0x80, 0xc5,
-             0x80, 0x75, 0xe4, 0xfc,
-             0xf6, 0xe5, 0xa1, 0x0b,
-             0xf2, 0x7c, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x64, 0x40, 0x00, 0x8a,
-             0xe0, 0x0c, 0x41, 0xf6,
-             0x00, 0x36, 0x82, 0x95,
-             0x05, 0xb6, 0x60, 0xfc,
-             0x04, 0x0c, 0xe0, 0xf0,
-             0xe0, 0xe8, 0x00, 0x66,
-             0x81, 0x01, 0x46, 0x0c,
-             0xc4, 0x2c, 0x86, 0x2c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x64, 0x40, 0x00, 0x8a,
-             0xe0, 0x0c, 0x41, 0xf6,
-             0x41, 0x16, 0x8c, 0x15,
-             0x04, 0x36, 0x60, 0xfc,
-             0x04, 0x0c, 0xe0, 0xfc,
-             0xe0, 0xf4, 0x40, 0xb6,
-             0x47, 0x26, 0x06, 0x2c,
-             0x42, 0x23, 0xe0, 0xec,
-             0x05, 0x66, 0x60, 0x10,
-             0x44, 0x0c, 0xe0, 0xf8,
-             0xe0, 0xec, 0x08, 0xc6,
-             0x60, 0x20, 0x42, 0x03,
-             0xe0, 0xe8, 0x00, 0x46,
-             0x60, 0x14, 0x42, 0x23,
-             0xe0, 0xf4, 0x04, 0x26,
-             0xe0, 0x2c, 0x42, 0x03,
-             0x60, 0x38, 0x42, 0x03,
-             0xe0, 0xe0, 0x01, 0xe6,
-             0x60, 0x3c, 0x42, 0x03,
-             0xc6, 0x3c, 0x81, 0x01,
-             0xe0, 0x18, 0x42, 0x23,
-             0xe0, 0x1c, 0x42, 0x43,
-             0xe0, 0x24, 0x42, 0x23,
-             0xe0, 0x28, 0x42, 0x33,
-             0xe0, 0x30, 0x42, 0x33,
-             0xe0, 0x34, 0x42, 0x43,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x30, 0x1e, 0xf0,
-             0x80, 0x6b, 0x44, 0x08,
-             0x84, 0x7b, 0x04, 0x98,
-             0xbe, 0x0e, 0x86, 0x88,
-             0xa9, 0x9b, 0x46, 0x08,
-             0x02, 0xb9, 0xfc, 0x0e,
-             0x02, 0xa9, 0xe0, 0x10,
-             0x82, 0x15, 0xe0, 0x14,
-             0x80, 0xd5, 0xa9, 0x8b,
-             0x8c, 0x1b, 0x21, 0x01,
-             0xef, 0xfc, 0x7a, 0x28,
-             0x31, 0x9b, 0x81, 0xb5,
-             0xe0, 0x00, 0x40, 0xc6,
-             0xb1, 0x8b, 0x9c, 0x95,
-             0x21, 0x01, 0x9c, 0x55,
-             0x7a, 0x98, 0x8c, 0x1b,
-             0xa1, 0x0b, 0xef, 0xfc,
-             0x4e, 0x91, 0x9a, 0x95,
-             0x00, 0xb4, 0x60, 0x14,
-             0x4e, 0x81, 0xe1, 0x84,
-             0xc2, 0xb7, 0x60, 0x18,
-             0xfc, 0x24, 0xbe, 0x14,
-             0xe0, 0x24, 0x4e, 0xb1,
-             0x02, 0xa4, 0x02, 0x03,
-             0x04, 0x13, 0xe1, 0x84,
-             0x00, 0x00, 0xc2, 0x07,
-             0xc2, 0x17, 0x6c, 0x04,
-             0x60, 0x1c, 0x4e, 0x01,
-             0xec, 0x04, 0x00, 0x10,
-             0x60, 0x20, 0x4e, 0x01,
-             0x4e, 0x01, 0xaf, 0x01,
-             0xc2, 0xa7, 0x60, 0x10,
-             0x60, 0x28, 0x4e, 0xa1,
-             0x4e, 0x01, 0x83, 0x01,
-             0x00, 0x70, 0x60, 0x2c,
-             0x02, 0x06, 0xe4, 0x30,
-             0x81, 0x21, 0x60, 0x04,
-             0x41, 0x2c, 0x81, 0x45,
-             0xec, 0x04, 0x02, 0x10,
-             0xfe, 0x95, 0xa1, 0x1b,
-             0x61, 0x84, 0x00, 0x94,
-             0xe4, 0x30, 0x02, 0x70,
-             0x00, 0x84, 0x7c, 0x0e,
-             0x3e, 0x0e, 0xe0, 0x84,
-             0xec, 0x04, 0x00, 0x90,
-             0xb2, 0x4b, 0x3c, 0x0e,
-             0x81, 0xc1, 0x7d, 0x51,
-             0x0e, 0xc4, 0x85, 0xd5,
-             0x88, 0xab, 0x60, 0x84,
-             0xb0, 0x73, 0x3c, 0x24,
-             0x90, 0x3b, 0x0a, 0x7d,
-             0x97, 0x80, 0x0e, 0x74,
-             0xc4, 0x04, 0x0e, 0x70,
-             0xe1, 0xfc, 0x00, 0x74,
-             0x80, 0x73, 0x7c, 0x04,
-             0x52, 0x7a, 0x83, 0x77,
-             0x82, 0x7b, 0x66, 0x82,
-             0x04, 0x0b, 0x83, 0x35,
-             0x00, 0xa0, 0x8a, 0xad,
-             0x10, 0x80, 0x44, 0x04,
-             0x16, 0x04, 0xec, 0x04,
-             0x04, 0x20, 0x61, 0xfc,
-             0x16, 0x03, 0xec, 0x08,
-             0xc3, 0x07, 0x84, 0xa1,
-             0xc2, 0x07, 0x92, 0x03,
-             0xfc, 0x00, 0x0c, 0x0b,
-             0xa1, 0x8b, 0xdd, 0x0c,
-             0x3e, 0x04, 0xfa, 0xb5,
-             0x86, 0x8b, 0x82, 0xc1,
-             0x91, 0xcb, 0x80, 0x13,
-             0x81, 0x01, 0xf4, 0x75,
-             0x0c, 0x0c, 0x98, 0xf1,
-             0xdd, 0x93, 0xf2, 0x7c,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x50, 0x1e, 0xf0,
-             0x86, 0x7b, 0x09, 0x0e,
-             0x61, 0x84, 0x00, 0x14,
-             0xe0, 0xac, 0x06, 0x74,
-             0x88, 0x6b, 0x20, 0x23,
-             0x84, 0x13, 0x86, 0x23,
-             0xe1, 0x0e, 0x40, 0x1a,
-             0xe1, 0x0e, 0x42, 0x2a,
-             0xe1, 0xac, 0x04, 0x04,
-             0x61, 0x1e, 0x56, 0x2a,
-             0xe1, 0xac, 0x04, 0x14,
-             0xe1, 0x1e, 0x50, 0x2a,
-             0xe4, 0x04, 0x04, 0xb0,
-             0x61, 0x1e, 0x54, 0x2a,
-             0xe0, 0x80, 0x04, 0x06,
-             0x06, 0x84, 0x22, 0x23,
-             0x06, 0x23, 0xe0, 0xac,
-             0xf1, 0x84, 0x42, 0x02,
-             0x04, 0xb4, 0x7c, 0x2e,
-             0x7e, 0x1e, 0xe0, 0xac,
-             0x3e, 0x0e, 0xa4, 0x03,
-             0x85, 0xb5, 0x90, 0x9b,
-             0x82, 0x35, 0x91, 0x9b,
-             0xe0, 0x2c, 0x52, 0x1a,
-             0xa0, 0x10, 0x1e, 0x05,
-             0xa0, 0x0c, 0x1e, 0x15,
-             0xa0, 0x00, 0x01, 0x68,
-             0xe0, 0x20, 0x52, 0x1a,
-             0xa0, 0x00, 0x00, 0x88,
-             0x52, 0x1a, 0x09, 0x04,
-             0x00, 0xf8, 0xe0, 0x2c,
-             0xc0, 0x00, 0x20, 0x01,
-             0x80, 0x10, 0x1e, 0x05,
-             0x80, 0x08, 0x1e, 0x15,
-             0x17, 0x9b, 0x80, 0xc5,
-             0x80, 0xb5, 0x81, 0x01,
-             0xbe, 0x14, 0x89, 0x04,
-             0xe8, 0x00, 0x4b, 0x08,
-             0x60, 0x88, 0x02, 0x94,
-             0x0c, 0x25, 0x82, 0x91,
-             0x8c, 0x13, 0x7c, 0x04,
-             0xe1, 0x1e, 0x52, 0x9a,
-             0x84, 0x2e, 0x80, 0x23,
-             0xf4, 0xb5, 0x95, 0x9b,
-             0xa8, 0xf1, 0x01, 0x01,
-             0xf2, 0x7c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x1c, 0x04, 0x4c,
-             0x84, 0x7b, 0x02, 0x8b,
-             0x86, 0x6b, 0x00, 0x9b,
-             0x00, 0x06, 0x1c, 0x14,
-             0xe0, 0x24, 0xe0, 0x80,
-             0x43, 0x38, 0xa4, 0x34,
-             0xa0, 0x44, 0xe8, 0x00,
-             0x9e, 0x14, 0x98, 0x0e,
-             0x88, 0x0b, 0x60, 0x24,
-             0x42, 0xb8, 0xa4, 0x34,
-             0x9a, 0x0e, 0xe8, 0x00,
-             0xf2, 0x1c, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x3c, 0x04, 0x0c,
-             0x82, 0x8b, 0x04, 0x7b,
-             0x60, 0x24, 0x0e, 0x19,
-             0x10, 0x49, 0x83, 0x21,
-             0x86, 0x6b, 0x60, 0x24,
-             0x60, 0x28, 0x0e, 0x59,
-             0x1c, 0x04, 0x80, 0x9b,
-             0x22, 0x34, 0xa3, 0x2f,
-             0xe0, 0x90, 0x02, 0x44,
-             0x68, 0x28, 0x44, 0xc8,
-             0xe8, 0x94, 0x14, 0x24,
-             0x9c, 0x24, 0xa4, 0x14,
-             0x22, 0x34, 0x98, 0x0e,
-             0x04, 0x0b, 0xcf, 0x17,
-             0x44, 0x18, 0x94, 0x2b,
-             0x1a, 0x0e, 0xe8, 0x28,
-             0x0c, 0x0c, 0x81, 0x01,
-             0xdd, 0x93, 0xf2, 0x3c,
-             0xfa, 0x0c, 0x04, 0x0c,
-             0x40, 0x3a, 0x00, 0x6b,
-             0x02, 0x7b, 0xe5, 0x0a,
-             0xe5, 0x8a, 0x42, 0x3a,
-             0x00, 0x00, 0x01, 0x81,
-             0xc0, 0x01, 0x67, 0xd1,
-             0x72, 0xa0, 0x42, 0x12,
-             0xe0, 0x3c, 0x44, 0x86,
-             0x6f, 0xe8, 0x65, 0x08,
-             0x7f, 0x21, 0x81, 0x31,
-             0x85, 0x0b, 0x81, 0x31,
-             0x1f, 0xfc, 0x41, 0xfe,
-             0x41, 0xfe, 0xa1, 0x1b,
-             0x42, 0x7a, 0xdf, 0xfc,
-             0x44, 0x7a, 0xe5, 0x02,
-             0x00, 0x64, 0x65, 0x82,
-             0x82, 0x03, 0xe0, 0x9c,
-             0x72, 0xa0, 0x42, 0x22,
-             0xe0, 0xa0, 0x04, 0x64,
-             0xef, 0xe8, 0x63, 0xa8,
-             0x7f, 0xfd, 0x45, 0xfe,
-             0xc5, 0x0d, 0xc0, 0x3f,
-             0x1f, 0xfd, 0x41, 0xfe,
-             0xa1, 0x1b, 0x00, 0x3f,
-             0x1f, 0xfd, 0x41, 0xfe,
-             0x0c, 0x0c, 0xc0, 0x3f,
-             0xdd, 0x93, 0xf2, 0x0c,
-             0xa1, 0x1b, 0x00, 0x5b,
-             0x60, 0x08, 0x40, 0x96,
-             0x64, 0x00, 0x18, 0x50,
-             0x00, 0x06, 0xc0, 0x80,
-             0x07, 0x0a, 0x40, 0x00,
-             0x40, 0xc6, 0xe6, 0x40,
-             0x19, 0x0a, 0x40, 0x00,
-             0xc0, 0xff, 0x67, 0xfc,
-             0xc0, 0x00, 0x40, 0xc6,
-             0x5c, 0x08, 0xa1, 0x0b,
-             0x18, 0x14, 0xda, 0x00,
-             0xa1, 0x5d, 0x61, 0xfc,
-             0xe0, 0x57, 0x02, 0xc3,
-             0xd6, 0x37, 0x03, 0xc7,
-             0xd1, 0x80, 0x18, 0xc4,
-             0x42, 0xca, 0x8a, 0xc3,
-             0x84, 0x13, 0xe0, 0x86,
-             0xe0, 0x00, 0x02, 0x12,
-             0xe1, 0x0e, 0x42, 0x1a,
-             0xdd, 0x93, 0x90, 0x1e,
-             0x65, 0x06, 0x44, 0x0a,
-             0x42, 0x0a, 0x81, 0x31,
-             0x00, 0x20, 0xe5, 0x86,
-             0xc0, 0x04, 0x64, 0x01,
-             0xf2, 0x8c, 0x42, 0x12,
-             0x5c, 0x08, 0xee, 0x1d,
-             0x41, 0xfe, 0x5a, 0x00,
-             0xc0, 0x3f, 0x1f, 0xfc,
-             0xd7, 0x07, 0x6a, 0x17,
-             0xa2, 0x0f, 0x5d, 0x93,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x70, 0x1e, 0xf0,
-             0x81, 0x61, 0x7e, 0x3e,
-             0x88, 0xbb, 0x09, 0x2e,
-             0xe0, 0x34, 0x04, 0x09,
-             0x8d, 0x6e, 0xfc, 0x1e,
-             0xe8, 0x0d, 0x3e, 0x0e,
-             0x60, 0x24, 0x02, 0xa9,
-             0xe0, 0x00, 0x40, 0xc6,
-             0x15, 0x0a, 0x98, 0x15,
-             0x96, 0xb5, 0xe6, 0x40,
-             0x89, 0x04, 0xfc, 0x14,
-             0x75, 0x18, 0xfe, 0x34,
-             0x04, 0x10, 0x6f, 0xfc,
-             0xa1, 0x0b, 0xe4, 0x30,
-             0x7c, 0x04, 0x94, 0x95,
-             0x89, 0x14, 0x96, 0x3b,
-             0x72, 0xd8, 0xfe, 0x24,
-             0x00, 0xb0, 0xef, 0xfc,
-             0x81, 0x11, 0x64, 0x20,
-             0x55, 0x1d, 0x81, 0x75,
-             0x16, 0x25, 0x81, 0x21,
-             0x82, 0x11, 0x40, 0x04,
-             0x02, 0x0a, 0xc1, 0x2e,
-             0xfe, 0x15, 0xe2, 0x40,
-             0x89, 0x11, 0x7e, 0x04,
-             0xb0, 0x01, 0x01, 0x75,
-             0x78, 0x10, 0x40, 0x65,
-             0xec, 0x04, 0x02, 0x10,
-             0xa1, 0x1b, 0xc1, 0x6e,
-             0x09, 0x74, 0xfe, 0x55,
-             0x7e, 0x84, 0x90, 0xb1,
-             0xbc, 0xbe, 0x81, 0x01,
-             0xc0, 0x71, 0x7c, 0x94,
-             0xb0, 0x81, 0x05, 0xb5,
-             0x8a, 0x75, 0xa1, 0x0b,
-             0x90, 0x6b, 0x0b, 0x6e,
-             0x89, 0x84, 0xfe, 0x14,
-             0xf8, 0x10, 0x0e, 0x25,
-             0xa0, 0x04, 0x86, 0x14,
-             0x73, 0xd8, 0xa4, 0x34,
-             0x22, 0x24, 0xef, 0xfc,
-             0x1c, 0x04, 0x80, 0xbb,
-             0xe4, 0x60, 0x08, 0xf0,
-             0x60, 0x10, 0x12, 0x15,
-             0x76, 0x98, 0x94, 0x3b,
-             0x8c, 0x8b, 0x6f, 0xfc,
-             0x82, 0x95, 0xa1, 0x0b,
-             0x78, 0x10, 0x50, 0xb5,
-             0x8d, 0x24, 0x94, 0x3b,
-             0x89, 0x04, 0xa0, 0x2e,
-             0x00, 0x14, 0xbc, 0x44,
-             0x68, 0x78, 0x96, 0x0b,
-             0x0b, 0x64, 0xef, 0xfc,
-             0x88, 0x81, 0x88, 0x71,
-             0xbe, 0x14, 0x82, 0x61,
-             0xf4, 0xb5, 0xc3, 0x6d,
-             0x0c, 0x0c, 0xb8, 0xf1,
-             0xdd, 0x93, 0xf2, 0x7c,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x30, 0x1e, 0xf0,
-             0x80, 0x6b, 0x06, 0x4a,
-             0x04, 0xc9, 0x84, 0x0a,
-             0x4c, 0x45, 0xe0, 0xc0,
-             0x02, 0x49, 0xed, 0xac,
-             0x4c, 0x05, 0xe0, 0x20,
-             0xc4, 0x0a, 0xed, 0xa8,
-             0xee, 0x24, 0x4c, 0x45,
-             0xe0, 0xcc, 0x04, 0x49,
-             0xed, 0xb0, 0x4c, 0x05,
-             0xe0, 0xc8, 0x04, 0x09,
-             0xe0, 0xc4, 0x04, 0x79,
-             0xed, 0xc0, 0x4c, 0x45,
-             0xe0, 0xd0, 0x04, 0x41,
-             0xed, 0xbc, 0x4c, 0x05,
-             0xe0, 0x2c, 0x04, 0x05,
-             0xed, 0xb4, 0x4c, 0xc5,
-             0xed, 0xb8, 0x4c, 0x75,
-             0xe0, 0xd4, 0x04, 0xc1,
-             0xe0, 0xd8, 0x04, 0x71,
-             0xed, 0xc4, 0x4c, 0x45,
-             0xe0, 0xe0, 0x04, 0x49,
-             0xee, 0x28, 0x4c, 0x05,
-             0xe0, 0xdc, 0x04, 0x01,
-             0xed, 0xc8, 0x4c, 0xc5,
-             0xed, 0xcc, 0x4c, 0x75,
-             0xed, 0xd4, 0x4c, 0x45,
-             0xe0, 0xf0, 0x04, 0x49,
-             0xe0, 0xe4, 0x04, 0xc9,
-             0xe0, 0xec, 0x04, 0x79,
-             0xed, 0xd0, 0x4c, 0x05,
-             0xe0, 0xe8, 0x04, 0x09,
-             0xed, 0xe4, 0x4c, 0x45,
-             0xed, 0xd8, 0x4c, 0xc5,
-             0xed, 0xe0, 0x4c, 0x75,
-             0x8a, 0xc4, 0x88, 0x44,
-             0xca, 0x84, 0xc8, 0x74,
-             0xe0, 0xf8, 0x04, 0x91,
-             0xe0, 0xfc, 0x04, 0xa1,
-             0x6d, 0xdc, 0x4c, 0x05,
-             0x4c, 0xc5, 0x81, 0x01,
-             0x4c, 0x75, 0xed, 0xf0,
-             0x4c, 0x85, 0xed, 0xf4,
-             0x4c, 0x95, 0xed, 0xf8,
-             0x4c, 0xa5, 0xee, 0x48,
-             0x4c, 0x05, 0xee, 0x4c,
-             0x4c, 0x45, 0xed, 0xe8,
-             0x06, 0x45, 0xed, 0xec,
-             0x04, 0xc5, 0xe0, 0x34,
-             0x04, 0x75, 0xe0, 0x10,
-             0x4c, 0x45, 0xe0, 0x14,
-             0x06, 0x45, 0xee, 0x50,
-             0x04, 0x85, 0xe0, 0x38,
-             0x04, 0x95, 0xe0, 0x18,
-             0x04, 0xa5, 0xe0, 0x1c,
-             0x4c, 0xc5, 0xe0, 0x20,
-             0x4c, 0x75, 0xee, 0x70,
-             0x4c, 0x95, 0xee, 0x74,
-             0x4c, 0xa5, 0xee, 0x7c,
-             0x83, 0xa1, 0x6e, 0x80,
-             0xee, 0x54, 0x4c, 0x45,
-             0xee, 0x78, 0x4c, 0x85,
-             0x04, 0xc5, 0x8c, 0x44,
-             0xa1, 0x94, 0xe0, 0x24,
-             0xee, 0x84, 0x4c, 0x45,
-             0xa4, 0x88, 0x8e, 0x44,
-             0x4c, 0x45, 0x9b, 0x74,
-             0xcc, 0x44, 0xee, 0x88,
-             0x4c, 0x45, 0xa7, 0xb4,
-             0xce, 0x44, 0xee, 0x8c,
-             0xee, 0x90, 0x4c, 0x45,
-             0xe0, 0x10, 0x06, 0x45,
-             0xee, 0x94, 0x4c, 0x45,
-             0xe0, 0x14, 0x06, 0x45,
-             0xee, 0x98, 0x4c, 0x45,
-             0xe0, 0x18, 0x06, 0x45,
-             0xee, 0x9c, 0x4c, 0x45,
-             0xe0, 0x1c, 0x06, 0x45,
-             0xee, 0xa0, 0x4c, 0x45,
-             0xe0, 0x20, 0x06, 0x45,
-             0xee, 0xa4, 0x4c, 0x45,
-             0xe0, 0x24, 0x06, 0x45,
-             0xee, 0xa8, 0x4c, 0x45,
-             0xe0, 0x28, 0x06, 0x45,
-             0xee, 0xac, 0x4c, 0x45,
-             0xe0, 0x2c, 0x06, 0x45,
-             0xee, 0xb0, 0x4c, 0x45,
-             0xe0, 0x30, 0x06, 0x35,
-             0xee, 0xb8, 0x4c, 0xc5,
-             0x4c, 0x35, 0x99, 0xc4,
-             0x97, 0x34, 0xee, 0xb4,
-             0x6d, 0x88, 0x4c, 0xc5,
-             0x7f, 0xfc, 0x59, 0xe6,
-             0x9f, 0x44, 0xc0, 0x20,
-             0xed, 0x84, 0x4c, 0x35,
-             0x4c, 0x85, 0xc8, 0x34,
-             0x9d, 0x84, 0xed, 0x80,
-             0x6d, 0x8c, 0x4c, 0x45,
-             0x67, 0xfc, 0x04, 0x30,
-             0x58, 0x2d, 0xc0, 0xff,
-             0xe0, 0x08, 0x18, 0x06,
-             0x01, 0x7c, 0x18, 0x34,
-             0x23, 0x44, 0xff, 0x21,
-             0x81, 0xc0, 0x18, 0xc4,
-             0x6d, 0x94, 0x4c, 0x75,
-             0x90, 0xb0, 0x46, 0x32,
-             0x18, 0x34, 0x25, 0x34,
-             0x4c, 0x85, 0x81, 0x40,
-             0x0e, 0x60, 0x6d, 0x90,
-             0xc0, 0x0d, 0x66, 0x00,
-             0xee, 0x34, 0x4c, 0x55,
-             0xee, 0x04, 0x4c, 0x25,
-             0x95, 0x34, 0xfc, 0x3e,
-             0x6d, 0xa4, 0x4c, 0xc5,
-             0xff, 0xf4, 0x59, 0xce,
-             0x6d, 0x9c, 0x4c, 0x45,
-             0xff, 0xf8, 0x08, 0x8e,
-             0x0c, 0x85, 0x99, 0x4b,
-             0x50, 0x82, 0xcd, 0x9c,
-             0x08, 0x40, 0x51, 0x90,
-             0x50, 0xa1, 0xcc, 0x04,
-             0xfc, 0xf5, 0xc0, 0x00,
-             0x6e, 0x3c, 0x4c, 0x05,
-             0x67, 0x00, 0x00, 0x60,
-             0x4c, 0x05, 0xc0, 0x06,
-             0x00, 0x60, 0x6d, 0x98,
-             0xc0, 0x02, 0x65, 0x00,
-             0x6e, 0x20, 0x4c, 0x35,
-             0xe0, 0x80, 0x06, 0x8a,
-             0x66, 0x01, 0x06, 0x60,
-             0x50, 0xc6, 0x40, 0x04,
-             0x4c, 0x65, 0xe0, 0x00,
-             0x4c, 0x05, 0xed, 0xa0,
-             0x4c, 0x35, 0xee, 0x2c,
-             0x4c, 0x25, 0xee, 0x30,
-             0x88, 0x75, 0xee, 0x14,
-             0xed, 0xf8, 0x0c, 0x35,
-             0xee, 0x28, 0x0c, 0x45,
-             0x86, 0xb5, 0x87, 0x4d,
-             0xed, 0xb4, 0x0c, 0x25,
-             0xe4, 0x08, 0x00, 0x20,
-             0xe1, 0x7c, 0x18, 0x04,
-             0x98, 0x03, 0xfd, 0xc7,
-             0x61, 0x08, 0x18, 0x04,
-             0x58, 0x02, 0xa1, 0x01,
-             0xa9, 0xcd, 0xf1, 0xb0,
-             0xbe, 0xbe, 0x82, 0xd5,
-             0xed, 0xc4, 0x0c, 0xc5,
-             0xed, 0xc8, 0x0c, 0xb5,
-             0x80, 0xf5, 0x96, 0xcd,
-             0xee, 0x7c, 0x0c, 0xc5,
-             0xee, 0x80, 0x0c, 0xb5,
-             0x80, 0xc5, 0x96, 0xcd,
-             0x98, 0xf1, 0x10, 0x0b,
-             0xf2, 0x7c, 0x0c, 0x0c,
-             0x0c, 0xc5, 0xdd, 0x93,
-             0xaa, 0xcd, 0xed, 0xcc,
-             0x20, 0x41, 0xfe, 0x15,
-             0xa6, 0x43, 0x98, 0x33,
-             0xfc, 0x75, 0xa9, 0x4d,
-             0xed, 0xd0, 0x0c, 0x35,
-             0xfa, 0xf5, 0xac, 0x3d,
-             0xe4, 0x04, 0x06, 0x20,
-             0xe1, 0xfc, 0x08, 0x34,
-             0x46, 0x02, 0x06, 0x43,
-             0x83, 0x47, 0xf1, 0xb0,
-             0xf8, 0xb5, 0x89, 0x3d,
-             0xed, 0xb8, 0x0c, 0x45,
-             0xee, 0x24, 0x0c, 0xc5,
-             0x98, 0x43, 0x86, 0x43,
-             0xf6, 0xb5, 0x85, 0x4d,
-             0x6d, 0xd8, 0x0c, 0x45,
-             0x51, 0xf6, 0x91, 0x31,
-             0xa2, 0x4d, 0xe0, 0x0c,
-             0x3e, 0xb4, 0x82, 0xf5,
-             0x09, 0x06, 0xa1, 0x4b,
-             0x18, 0x86, 0x00, 0x00,
-             0x86, 0x05, 0x80, 0x00,
-             0x49, 0xf6, 0x23, 0x4b,
-             0x11, 0xc1, 0xe0, 0x0c,
-             0x84, 0x65, 0x89, 0x21,
-             0x3e, 0xb4, 0x83, 0x85,
-             0x49, 0xf6, 0xa5, 0x4b,
-             0x59, 0xf6, 0x00, 0x0c,
-             0x82, 0x45, 0x80, 0x0c,
-             0x82, 0xf5, 0xa7, 0x4b,
-             0x60, 0x0c, 0x49, 0xf6,
-             0xe0, 0x0c, 0x59, 0xf6,
-             0x45, 0xf6, 0x01, 0x45,
-             0x89, 0x21, 0xe0, 0x0c,
-             0xee, 0x58, 0x4c, 0x45,
-             0xee, 0x5c, 0x4c, 0xc5,
-             0xee, 0x60, 0x4c, 0x25,
-             0xed, 0xe0, 0x0c, 0x45,
-             0x82, 0x35, 0xa2, 0x4d,
-             0x84, 0xc5, 0xa1, 0x4b,
-             0x41, 0xf6, 0x23, 0x4b,
-             0x04, 0x65, 0xe0, 0x0c,
-             0x83, 0x75, 0x89, 0x21,
-             0x41, 0xf6, 0xa5, 0x4b,
-             0x47, 0xf6, 0x00, 0x0c,
-             0x82, 0x45, 0x80, 0x0c,
-             0x82, 0xf5, 0xa7, 0x4b,
-             0x60, 0x0c, 0x41, 0xf6,
-             0xe0, 0x0c, 0x47, 0xf6,
-             0x45, 0xf6, 0x01, 0x45,
-             0x89, 0x21, 0xe0, 0x0c,
-             0xee, 0x64, 0x4c, 0x05,
-             0xee, 0x68, 0x4c, 0x35,
-             0xee, 0x6c, 0x4c, 0x25,
-             0x4c, 0x55, 0xc6, 0x0a,
-             0x40, 0x02, 0xee, 0x34,
-             0x4c, 0x05, 0xfa, 0x14,
-             0x8e, 0x0b, 0x6e, 0x34,
-             0xe8, 0x0c, 0x54, 0x68,
-             0x68, 0x0c, 0x47, 0x08,
-             0x53, 0xb8, 0x8e, 0x0b,
-             0x8e, 0x0b, 0x68, 0x04,
-             0x68, 0x08, 0x72, 0x28,
-             0x0c, 0x05, 0x8e, 0x0b,
-             0x0c, 0x15, 0xee, 0x38,
-             0x4c, 0xa5, 0xee, 0x20,
-             0x4c, 0x05, 0xee, 0x18,
-             0xbe, 0x0d, 0x6e, 0x3c,
-             0x6e, 0x1c, 0x4c, 0xa5,
-             0x90, 0x84, 0x40, 0x02,
-             0x0e, 0x3c, 0x4c, 0x05,
-             0x00, 0x00, 0x82, 0x03,
-             0x81, 0x11, 0x6c, 0x04,
-             0xee, 0x40, 0x4c, 0x05,
-             0x6e, 0x44, 0x4c, 0x05,
-             0xbe, 0x1e, 0x81, 0x01,
-             0xbe, 0x04, 0x8f, 0x55,
-             0xe3, 0x1c, 0x01, 0x0a,
-             0xa1, 0xab, 0xd6, 0xd5,
-             0x0c, 0x05, 0x84, 0xd5,
-             0xa7, 0x0b, 0xee, 0x1c,
-             0xa5, 0x0b, 0x82, 0x25,
-             0xa3, 0x0b, 0x82, 0x65,
-             0x4a, 0xf8, 0x82, 0x95,
-             0x8e, 0x0b, 0x68, 0x00,
-             0x6c, 0x18, 0x81, 0x85,
-             0x8e, 0x0b, 0x68, 0x00,
-             0x55, 0x18, 0x81, 0x45,
-             0x8e, 0x0b, 0x68, 0x00,
-             0xee, 0x18, 0x0c, 0xa5,
-             0x80, 0xf5, 0xa3, 0xab,
-             0x8e, 0x0b, 0x7c, 0x14,
-             0xfc, 0x38, 0x42, 0x08,
-             0xee, 0x18, 0x0c, 0xa5,
-             0x8a, 0x35, 0xa5, 0xab,
-             0x6e, 0x08, 0x0c, 0x15,
-             0x0c, 0x05, 0x87, 0x21,
-             0x84, 0x11, 0xee, 0x40,
-             0x4c, 0x15, 0x83, 0x0d,
-             0x40, 0x10, 0x4e, 0x40,
-             0x0c, 0x15, 0xdc, 0x00,
-             0x01, 0x0a, 0x6e, 0x28,
-             0x01, 0x16, 0xe0, 0x40,
-             0x4c, 0x05, 0x80, 0x00,
-             0x0c, 0x05, 0x8e, 0x40,
-             0x82, 0x0d, 0x6e, 0x20,
-             0x84, 0x04, 0x02, 0x10,
-             0x8e, 0x40, 0x4c, 0x15,
-             0xe6, 0x8a, 0x40, 0x0a,
-             0xee, 0x3c, 0x0c, 0x15,
-             0xec, 0x38, 0x00, 0x00,
-             0x4c, 0x05, 0x80, 0x1d,
-             0x8e, 0x0b, 0x4e, 0x3c,
-             0xfc, 0x38, 0x56, 0x08,
-             0xee, 0x18, 0x0c, 0xa5,
-             0x88, 0x15, 0xa7, 0xab,
-             0x6e, 0x40, 0x0c, 0x05,
-             0x0c, 0x15, 0x87, 0x21,
-             0x01, 0x0a, 0xee, 0x08,
-             0x01, 0x16, 0xe0, 0x40,
-             0x84, 0x11, 0x00, 0x00,
-             0x0e, 0x40, 0x4c, 0x05,
-             0x0c, 0x05, 0x83, 0x0d,
-             0x4c, 0x15, 0xee, 0x20,
-             0x0c, 0x15, 0xce, 0x40,
-             0x40, 0x0a, 0xee, 0x3c,
-             0x00, 0x00, 0xe6, 0x8a,
-             0x80, 0x1d, 0xec, 0x18,
-             0x4e, 0x3c, 0x4c, 0x05,
-             0x50, 0x38, 0x8e, 0x0b,
-             0x0c, 0xa5, 0xe8, 0x08,
-             0x3e, 0x04, 0xee, 0x18,
-             0x82, 0x01, 0xaf, 0xab,
-             0x00, 0x0c, 0xbe, 0x0e,
-             0xa1, 0x0b, 0xe2, 0x00,
-             0x0c, 0x05, 0xe2, 0x65,
-             0x81, 0x11, 0x6e, 0x04,
-             0x26, 0x06, 0x82, 0x01,
-             0xfa, 0x80, 0x00, 0x04,
-             0x0c, 0x25, 0x83, 0x95,
-             0x00, 0x00, 0x6d, 0x9c,
-             0x0c, 0x45, 0xec, 0x04,
-             0x02, 0x23, 0xee, 0x20,
-             0x04, 0x33, 0x84, 0x11,
-             0x04, 0x53, 0xe0, 0x30,
-             0x58, 0x3a, 0xe0, 0x60,
-             0x46, 0x5a, 0xe1, 0x92,
-             0x44, 0xc3, 0xe1, 0x92,
-             0x46, 0x8a, 0xe0, 0x30,
-             0x46, 0x32, 0xe8, 0x30,
-             0x44, 0x33, 0xd0, 0x90,
-             0xa1, 0x0b, 0xe0, 0x60,
-             0x59, 0x95, 0xf8, 0xf5,
-             0xc1, 0xc3, 0x81, 0x81,
-             0xfa, 0x3c, 0x04, 0x0c,
-             0xec, 0xa0, 0x1e, 0xf0,
-             0x55, 0xce, 0x2d, 0x84,
-             0xc0, 0x10, 0x64, 0xb1,
-             0x13, 0xae, 0xaf, 0x94,
-             0x64, 0x71, 0x15, 0x8e,
-             0x91, 0xae, 0xc0, 0x10,
-             0x8d, 0x8e, 0x8f, 0x9e,
-             0xa1, 0xc4, 0xab, 0xa4,
-             0xa9, 0x74, 0xa5, 0x64,
-             0xa3, 0x84, 0xa7, 0x94,
-             0x89, 0x7e, 0x8b, 0xae,
-             0xfc, 0x6e, 0xfe, 0x9e,
-             0xbc, 0xce, 0xbe, 0x8e,
-             0xef, 0xfc, 0x57, 0x68,
-             0x0c, 0x0c, 0xd0, 0xf1,
-             0xdd, 0x93, 0xf2, 0x3c,
-             0xfa, 0x1c, 0x04, 0x4c,
-             0x0c, 0x05, 0x80, 0x6b,
-             0xa1, 0x0d, 0xe0, 0x88,
-             0x0c, 0x15, 0x80, 0xb5,
-             0x83, 0x0d, 0xe0, 0xbc,
-             0x8f, 0x01, 0x80, 0xa5,
-             0xe0, 0x98, 0x4c, 0x05,
-             0x0c, 0x15, 0x8b, 0xc5,
-             0x0c, 0x25, 0xe1, 0x40,
-             0x0c, 0x75, 0xe0, 0xa8,
-             0x46, 0x22, 0xe0, 0x18,
-             0x87, 0x0b, 0xf0, 0x84,
-             0x0c, 0x35, 0x82, 0x55,
-             0xa1, 0x3b, 0xe0, 0x7c,
-             0x0c, 0x35, 0x80, 0xd5,
-             0x46, 0x0a, 0xe0, 0x74,
-             0x92, 0x95, 0xe0, 0x80,
-             0xe1, 0xd0, 0x0c, 0x19,
-             0xe0, 0x88, 0x42, 0x0a,
-             0x03, 0x21, 0x82, 0x25,
-             0x63, 0x38, 0x8c, 0x1b,
-             0x0c, 0x25, 0xe8, 0x08,
-             0x4c, 0x05, 0xe0, 0xa8,
-             0x0c, 0x15, 0xe0, 0x88,
-             0x87, 0x51, 0x60, 0xc4,
-             0xe0, 0x34, 0x0c, 0x35,
-             0xe0, 0xa0, 0x0c, 0x45,
-             0xe0, 0xbc, 0x4c, 0x15,
-             0x48, 0x4a, 0x82, 0x33,
-             0x4a, 0x32, 0x66, 0x96,
-             0x09, 0x5d, 0xf1, 0x88,
-             0x4c, 0x55, 0x85, 0x51,
-             0x48, 0x42, 0x60, 0x98,
-             0x4c, 0x55, 0x90, 0x88,
-             0x06, 0x40, 0x60, 0x9c,
-             0x48, 0x32, 0x8c, 0x04,
-             0xc4, 0x2b, 0x71, 0x88,
-             0x18, 0x24, 0x44, 0x47,
-             0x0e, 0x55, 0xe0, 0x88,
-             0x98, 0x73, 0x7c, 0x10,
-             0xe0, 0xac, 0x0c, 0x45,
-             0x08, 0x25, 0xc4, 0x57,
-             0x0a, 0x34, 0xfc, 0x14,
-             0x8e, 0x53, 0xe0, 0x88,
-             0x00, 0x00, 0x82, 0x3d,
-             0x4c, 0x05, 0x84, 0x08,
-             0x82, 0xa5, 0x80, 0xc0,
-             0x06, 0x30, 0x57, 0xc4,
-             0xc4, 0xc7, 0xec, 0x04,
-             0xfc, 0x30, 0x08, 0xc5,
-             0xfc, 0x75, 0x84, 0xcd,
-             0x60, 0xbc, 0x4c, 0x35,
-             0xfd, 0xc5, 0x98, 0x2b,
-             0xf2, 0x1c, 0x0c, 0x4c,
-             0x0c, 0x25, 0xdd, 0x93,
-             0x06, 0x14, 0x60, 0x84,
-             0x0c, 0x45, 0xe0, 0x88,
-             0x86, 0x73, 0x60, 0x78,
-             0x82, 0x3b, 0x01, 0x51,
-             0x4c, 0x25, 0x82, 0x21,
-             0x82, 0x43, 0x60, 0x84,
-             0x0e, 0xc5, 0x83, 0x45,
-             0xdd, 0x84, 0xf8, 0x10,
-             0xe0, 0x20, 0x0c, 0x95,
-             0xc4, 0x87, 0xc4, 0xc7,
-             0xfc, 0x30, 0x12, 0xc5,
-             0xfc, 0x20, 0x12, 0x85,
-             0xf1, 0xb0, 0x58, 0x82,
-             0x4a, 0xc2, 0x0a, 0xcd,
-             0x46, 0x10, 0xfa, 0x14,
-             0x82, 0x11, 0x5c, 0x00,
-             0xfa, 0x85, 0x88, 0x1d,
-             0x0c, 0x55, 0x98, 0x14,
-             0x0c, 0x45, 0xe0, 0x3c,
-             0x02, 0x10, 0xe0, 0x1c,
-             0x03, 0x2d, 0xec, 0x04,
-             0x04, 0x43, 0xc2, 0x27,
-             0x48, 0x33, 0x86, 0x53,
-             0x48, 0x53, 0xe0, 0x30,
-             0xda, 0x85, 0xe0, 0x60,
-             0x82, 0x01, 0x03, 0x11,
-             0xe0, 0x98, 0x4c, 0x15,
-             0xe0, 0x9c, 0x4c, 0x15,
-             0xe0, 0xbc, 0x4c, 0x05,
-             0xc1, 0xc3, 0xf9, 0x25,
-             0xfa, 0xfc, 0x04, 0x0c,
-             0x0c, 0x15, 0x80, 0x6b,
-             0xa1, 0x1d, 0xe0, 0x8c,
-             0x0c, 0x05, 0x82, 0x35,
-             0x80, 0x1d, 0xe0, 0x88,
-             0x0c, 0x05, 0x80, 0xa5,
-             0x83, 0x0d, 0xe0, 0xbc,
-             0x8f, 0x01, 0x80, 0xe5,
-             0xe0, 0x98, 0x4c, 0x05,
-             0xf2, 0xfc, 0x0c, 0x0c,
-             0x0c, 0x55, 0xdd, 0x93,
-             0x0c, 0x25, 0xe1, 0x44,
-             0x0c, 0xc5, 0xe0, 0xa8,
-             0x0c, 0x35, 0xe0, 0x18,
-             0x0c, 0x4b, 0xe0, 0xb4,
-             0x44, 0x52, 0x60, 0x48,
-             0x0c, 0x2b, 0xf1, 0x88,
-             0x85, 0x1b, 0x60, 0x50,
-             0xe0, 0xc8, 0x0c, 0x85,
-             0xe0, 0xcc, 0x0c, 0x75,
-             0x0c, 0x95, 0x82, 0x75,
-             0xa1, 0x9b, 0xe0, 0x80,
-             0x0c, 0x95, 0x80, 0xf5,
-             0x52, 0x0a, 0xe0, 0x74,
-             0x0f, 0xb8, 0xe0, 0x80,
-             0x0c, 0x55, 0xc0, 0x00,
-             0x54, 0x86, 0x60, 0x70,
-             0x52, 0x02, 0xe0, 0x3c,
-             0xaa, 0xa3, 0xf1, 0x84,
-             0x96, 0x45, 0x94, 0x9d,
-             0x60, 0x94, 0x0c, 0x55,
-             0x95, 0x5b, 0xfd, 0xa1,
-             0x0c, 0x55, 0x94, 0xa5,
-             0x14, 0x50, 0xe0, 0x34,
-             0x16, 0xa4, 0xe4, 0x04,
-             0x96, 0xa3, 0xe1, 0xfc,
-             0x8a, 0xa3, 0x83, 0xa7,
-             0x92, 0x45, 0x95, 0x9d,
-             0x70, 0x84, 0x52, 0x02,
-             0x02, 0x91, 0xc6, 0x37,
-             0x14, 0x94, 0xa0, 0x31,
-             0xcb, 0x37, 0x61, 0xfc,
-             0xf9, 0xa1, 0x14, 0x93,
-             0x0c, 0xa5, 0xc2, 0x97,
-             0x94, 0x9f, 0x60, 0x10,
-             0x18, 0x95, 0x92, 0xc3,
-             0xb2, 0xc4, 0xf8, 0x0c,
-             0x14, 0xa5, 0xc4, 0x97,
-             0xc4, 0xc7, 0x7c, 0x24,
-             0x64, 0x10, 0x16, 0xa0,
-             0xc7, 0xb7, 0x86, 0xa3,
-             0x66, 0x92, 0x48, 0xba,
-             0x7f, 0xfc, 0x57, 0x8e,
-             0x08, 0x40, 0xc3, 0xff,
-             0xc9, 0x47, 0xe5, 0x00,
-             0x60, 0x20, 0x0c, 0xb5,
-             0x88, 0xa3, 0x96, 0x4f,
-             0xf0, 0x0a, 0x48, 0xaa,
-             0xfc, 0x24, 0x16, 0x95,
-             0xfc, 0x30, 0x16, 0xc5,
-             0xe6, 0x8a, 0x44, 0x4a,
-             0x04, 0x20, 0xa6, 0x93,
-             0x98, 0x93, 0x66, 0x00,
-             0x84, 0x9d, 0xd1, 0x27,
-             0x0c, 0x25, 0x84, 0xa5,
-             0x98, 0x34, 0xe0, 0x84,
-             0xe0, 0x1c, 0x0c, 0x45,
-             0x4c, 0x25, 0x82, 0x21,
-             0x06, 0x30, 0x60, 0x84,
-             0x07, 0x2d, 0xec, 0x04,
-             0x04, 0x43, 0xc2, 0x27,
-             0xf1, 0x94, 0x46, 0x02,
-             0xe0, 0x30, 0x48, 0x33,
-             0xe0, 0x60, 0x48, 0x03,
-             0x0c, 0x05, 0xde, 0x65,
-             0xff, 0x91, 0x61, 0x34,
-             0x60, 0x94, 0x4c, 0x95,
-             0x73, 0x78, 0x8c, 0x2b,
-             0x0c, 0x35, 0xe8, 0x08,
-             0x0c, 0x25, 0xe0, 0x8c,
-             0x48, 0x32, 0xe0, 0x88,
-             0x86, 0x1b, 0x71, 0x80,
-             0x61, 0x3c, 0x4c, 0x45,
-             0x42, 0x40, 0x85, 0x4d,
-             0xab, 0x0d, 0x1c, 0x00,
-             0xe1, 0x3c, 0x4c, 0x15,
-             0x0c, 0x09, 0x82, 0xd5,
-             0x40, 0x0a, 0xe1, 0xd0,
-             0x00, 0x26, 0xe0, 0x90,
-             0x4c, 0x05, 0xc0, 0x00,
-             0x4c, 0x05, 0xc0, 0x98,
-             0x00, 0x30, 0x40, 0x9c,
-             0x94, 0x35, 0xcc, 0x10,
-             0x60, 0x34, 0x0c, 0x05,
-             0xf1, 0x88, 0x48, 0x32,
-             0x86, 0xe5, 0x88, 0x0d,
-             0xe4, 0x04, 0x02, 0x00,
-             0x06, 0x14, 0xa8, 0x13,
-             0x0c, 0x35, 0xe1, 0xfc,
-             0x86, 0x13, 0x60, 0x84,
-             0x0c, 0x15, 0x83, 0x17,
-             0xa2, 0x23, 0x60, 0x1c,
-             0x84, 0x03, 0x02, 0x31,
-             0x60, 0x84, 0x4c, 0x35,
-             0x4c, 0x25, 0xc2, 0x37,
-             0x86, 0x13, 0x60, 0x88,
-             0x60, 0x30, 0x42, 0x23,
-             0x4c, 0x05, 0x8f, 0x21,
-             0x42, 0x03, 0xe0, 0x8c,
-             0x4c, 0x25, 0xe0, 0x60,
-             0xe7, 0x55, 0xe0, 0x98,
-             0x60, 0x38, 0x0c, 0x05,
-             0xf1, 0x88, 0x4a, 0x12,
-             0xe0, 0xa4, 0x0c, 0x45,
-             0x89, 0x5d, 0x80, 0x43,
-             0x30, 0x23, 0x8a, 0x45,
-             0xf0, 0x9c, 0x40, 0x32,
-             0x60, 0x88, 0x4c, 0x25,
-             0x4c, 0x05, 0x8c, 0x1b,
-             0x68, 0xd8, 0xe0, 0x8c,
-             0x0c, 0x15, 0xe8, 0x08,
-             0x0c, 0x25, 0xe0, 0x84,
-             0x0c, 0x35, 0xe0, 0x1c,
-             0x4c, 0x05, 0xe0, 0x88,
-             0x82, 0x11, 0x60, 0x8c,
-             0x60, 0x84, 0x4c, 0x15,
-             0x02, 0x23, 0xc2, 0x17,
-             0x44, 0x03, 0x8f, 0x11,
-             0x8c, 0x0b, 0x60, 0x60,
-             0xe0, 0x30, 0x44, 0x33,
-             0xe0, 0x98, 0x4c, 0x15,
-             0xf2, 0xfc, 0x0c, 0x0c,
-             0xe0, 0x08, 0x10, 0xa8,
-             0x60, 0xbc, 0x4c, 0x05,
-             0x4c, 0x15, 0xfd, 0x11,
-             0xe1, 0x35, 0xe0, 0x94,
-             0x60, 0xa0, 0x0c, 0x05,
-             0x0c, 0x35, 0x87, 0x21,
-             0x0c, 0x45, 0xe0, 0x44,
-             0x40, 0x0a, 0xe0, 0x48,
-             0x4c, 0x25, 0xe6, 0x8a,
-             0x46, 0x12, 0x60, 0x98,
-             0x00, 0x00, 0xf1, 0x8c,
-             0xa8, 0x13, 0x6c, 0x18,
-             0x60, 0xbc, 0x4c, 0x35,
-             0x4c, 0x25, 0x80, 0x3d,
-             0x4c, 0x95, 0xe0, 0x9c,
-             0x4c, 0x15, 0xe0, 0x94,
-             0x4c, 0x05, 0xe0, 0xc0,
-             0xdd, 0x75, 0xc0, 0xbc,
-             0x60, 0x78, 0x0c, 0x05,
-             0x44, 0x52, 0x81, 0x31,
-             0x00, 0x54, 0x71, 0x80,
-             0x00, 0xc3, 0xe0, 0x88,
-             0x83, 0x55, 0x8a, 0x0b,
-             0x18, 0x75, 0xf3, 0x44,
-             0x0c, 0x85, 0xf8, 0x0c,
-             0xc4, 0x47, 0xe0, 0x20,
-             0x10, 0x45, 0xc4, 0x77,
-             0x10, 0x75, 0xfc, 0x10,
-             0x48, 0x72, 0xfc, 0x1c,
-             0x06, 0x4d, 0xf1, 0x90,
-             0xfa, 0x0c, 0x46, 0x42,
-             0x5c, 0x00, 0x40, 0x50,
-             0xec, 0x04, 0x0a, 0x50,
-             0xfa, 0x65, 0x85, 0x5d,
-             0xe0, 0x84, 0x0c, 0x25,
-             0x0c, 0x45, 0x98, 0x34,
-             0x0c, 0x55, 0xe0, 0x3c,
-             0x82, 0x21, 0x60, 0x1c,
-             0x60, 0x84, 0x4c, 0x25,
-             0xec, 0x04, 0x06, 0x30,
-             0xc2, 0x27, 0x07, 0x2d,
-             0x46, 0x02, 0x04, 0x53,
-             0x4a, 0x33, 0xf1, 0x90,
-             0x4a, 0x03, 0xe0, 0x30,
-             0x2a, 0xe8, 0xe0, 0x60,
-             0x85, 0x01, 0x9f, 0xfc,
-             0xe0, 0x98, 0x4c, 0x05,
-             0x60, 0x9c, 0x4c, 0x05,
-             0xec, 0x04, 0x00, 0x10,
-             0xc1, 0xc3, 0xf5, 0x05,
-             0xfa, 0xfc, 0x04, 0x0c,
-             0x87, 0x81, 0x00, 0x6b,
-             0xe0, 0x90, 0x0c, 0x05,
-             0xe0, 0x18, 0x0c, 0x15,
-             0xe0, 0x84, 0x0c, 0x75,
-             0x60, 0x98, 0x4c, 0x85,
-             0xac, 0xd5, 0xa1, 0x0d,
-             0xe0, 0x8c, 0x0c, 0x25,
-             0xac, 0x45, 0x85, 0x0d,
-             0x60, 0x20, 0x0c, 0x55,
-             0xe0, 0x88, 0x04, 0x04,
-             0x7c, 0x08, 0x02, 0x25,
-             0xf0, 0x88, 0x46, 0x12,
-             0xf8, 0x10, 0x06, 0x45,
-             0xf8, 0x08, 0x06, 0xc5,
-             0x78, 0x18, 0x06, 0x35,
-             0x0a, 0x25, 0xc4, 0x27,
-             0xc4, 0x47, 0x7c, 0x08,
-             0x7c, 0x10, 0x0a, 0x45,
-             0x0a, 0xc5, 0xc4, 0xc7,
-             0xc4, 0x37, 0x7c, 0x30,
-             0xfc, 0x0c, 0x0a, 0x35,
-             0xa6, 0xc3, 0xa8, 0x23,
-             0x90, 0x65, 0x84, 0xcd,
-             0xe0, 0x34, 0x0c, 0x25,
-             0x06, 0x24, 0x84, 0x21,
-             0xfd, 0x37, 0xe1, 0x7c,
-             0x85, 0x27, 0x86, 0x23,
-             0x4c, 0x05, 0xa4, 0x03,
-             0x04, 0x04, 0x60, 0x90,
-             0x02, 0x45, 0xe0, 0x88,
-             0x46, 0x12, 0x7c, 0x08,
-             0x8e, 0x34, 0xf0, 0x88,
-             0xc4, 0x47, 0x9a, 0x24,
-             0x04, 0x35, 0xc4, 0x37,
-             0x04, 0x45, 0xfc, 0x0c,
-             0x48, 0x32, 0xfc, 0x10,
-             0x89, 0x31, 0x71, 0x90,
-             0x0a, 0x00, 0x85, 0x45,
-             0x18, 0x04, 0x6c, 0x04,
-             0x02, 0xc5, 0xe0, 0x88,
-             0x12, 0x54, 0x7c, 0x30,
-             0x02, 0x95, 0xe0, 0x88,
-             0xc4, 0xc7, 0xfc, 0x24,
-             0x7c, 0x30, 0x04, 0xc5,
-             0x04, 0x95, 0xc4, 0x97,
-             0xb2, 0xc3, 0xfc, 0x24,
-             0x82, 0xf5, 0xa3, 0xcd,
-             0xe4, 0x08, 0x12, 0x40,
-             0xe1, 0x7c, 0x14, 0x94,
-             0x94, 0x93, 0xfd, 0xa7,
-             0x93, 0xcd, 0x85, 0x97,
-             0x00, 0x90, 0x4c, 0x55,
-             0x9c, 0x00, 0x40, 0x50,
-             0x9c, 0x00, 0x48, 0xc0,
-             0xec, 0x04, 0x06, 0x30,
-             0xf6, 0x95, 0xa1, 0x3b,
-             0x8c, 0x1b, 0x03, 0x21,
-             0xe8, 0x04, 0x7d, 0x28,
-             0x61, 0x3c, 0x0c, 0x45,
-             0x0c, 0x35, 0xff, 0xc1,
-             0x12, 0x60, 0x60, 0x34,
-             0x0c, 0x15, 0xe6, 0x20,
-             0x0c, 0x25, 0xe0, 0x94,
-             0x4a, 0x42, 0xe0, 0x88,
-             0x40, 0x52, 0xf1, 0x8c,
-             0x99, 0x1b, 0x7b, 0x00,
-             0xfa, 0x00, 0x44, 0x22,
-             0xe0, 0x90, 0x4c, 0x25,
-             0x0c, 0x15, 0xb0, 0x45,
-             0x98, 0x1d, 0xe0, 0x84,
-             0x0c, 0x05, 0xae, 0x05,
-             0x14, 0x14, 0x60, 0x1c,
-             0x0c, 0xc5, 0xe0, 0x84,
-             0x80, 0xa3, 0xe0, 0xa4,
-             0xe0, 0x30, 0x14, 0x53,
-             0xf1, 0xb0, 0x56, 0x52,
-             0x0f, 0x38, 0x97, 0x2d,
-             0x02, 0x11, 0x80, 0x00,
-             0x4c, 0x15, 0x84, 0x33,
-             0x08, 0x14, 0x60, 0x84,
-             0x08, 0x03, 0xe0, 0x84,
-             0x0c, 0xa5, 0x91, 0x11,
-             0x4c, 0x15, 0xe0, 0x50,
-             0x8c, 0x1b, 0x60, 0x50,
-             0xe0, 0x30, 0x40, 0x23,
-             0x60, 0x60, 0x40, 0x33,
-             0xfb, 0x00, 0x00, 0x34,
-             0xe8, 0x08, 0x56, 0x08,
-             0x0c, 0x15, 0x98, 0x24,
-             0x0c, 0x35, 0xe0, 0x84,
-             0x4c, 0xa5, 0xe0, 0x1c,
-             0x04, 0x20, 0x60, 0x50,
-             0x05, 0x1d, 0xec, 0x04,
-             0xe0, 0x84, 0x04, 0x14,
-             0x46, 0x03, 0x84, 0x33,
-             0xa0, 0xa5, 0xe0, 0x60,
-             0x0c, 0x25, 0xa5, 0x35,
-             0xff, 0x11, 0x60, 0x94,
-             0x86, 0xb5, 0x83, 0x2b,
-             0x61, 0x3c, 0x0c, 0x25,
-             0x0c, 0x05, 0x82, 0x71,
-             0x0a, 0x74, 0x60, 0x34,
-             0x98, 0x44, 0xe0, 0x84,
-             0xe0, 0x1c, 0x0c, 0x35,
-             0x60, 0x8c, 0x0c, 0x05,
-             0x4c, 0x25, 0xa0, 0x23,
-             0x08, 0x40, 0x60, 0x90,
-             0x0a, 0x33, 0xec, 0x04,
-             0x4c, 0x25, 0x89, 0x7d,
-             0x4c, 0x75, 0xe0, 0x94,
-             0x46, 0x23, 0xe0, 0x84,
-             0x46, 0x03, 0xe0, 0x30,
-             0x98, 0x65, 0xe0, 0x60,
-             0xe0, 0x88, 0x0c, 0x05,
-             0xe0, 0xa4, 0x0c, 0x35,
-             0xe0, 0x90, 0x4c, 0x25,
-             0xf1, 0x80, 0x48, 0x22,
-             0x8e, 0x25, 0x86, 0x4d,
-             0x60, 0x34, 0x0c, 0x35,
-             0xec, 0x04, 0x04, 0x20,
-             0x60, 0xbc, 0x4c, 0x25,
-             0x4c, 0x45, 0x85, 0x41,
-             0x4c, 0x45, 0xe0, 0x98,
-             0x80, 0x33, 0x60, 0x9c,
-             0x60, 0x94, 0x4c, 0x15,
-             0xec, 0x0c, 0x06, 0x30,
-             0x60, 0xc0, 0x4c, 0x35,
-             0x92, 0x15, 0x86, 0x2d,
-             0x60, 0x3c, 0x0c, 0x15,
-             0x0c, 0x25, 0x82, 0x71,
-             0x06, 0x74, 0x60, 0x1c,
-             0x4c, 0x75, 0xe0, 0x84,
-             0x80, 0x13, 0xe0, 0x84,
-             0x60, 0x8c, 0x4c, 0x15,
-             0x44, 0x03, 0x86, 0x23,
-             0x44, 0x13, 0xe0, 0x30,
-             0x0c, 0x09, 0xe0, 0x60,
-             0x40, 0x0a, 0xe1, 0xd0,
-             0x8a, 0xe5, 0xe0, 0x84,
-             0x7b, 0x00, 0x00, 0x14,
-             0x4f, 0x58, 0x8c, 0x1b,
-             0x0c, 0x15, 0xe8, 0x08,
-             0x0c, 0x25, 0xe0, 0x84,
-             0xc2, 0x17, 0xe0, 0x1c,
-             0x44, 0x03, 0x82, 0x23,
-             0x85, 0x15, 0xe0, 0x60,
-             0x86, 0xf5, 0xa1, 0x7d,
-             0x60, 0x1c, 0x0c, 0x15,
-             0xe0, 0x84, 0x04, 0x74,
-             0xe0, 0x40, 0x0c, 0x35,
-             0x04, 0x23, 0x82, 0x23,
-             0x46, 0x3a, 0xe0, 0x30,
-             0xa0, 0x23, 0xe0, 0xa2,
-             0x82, 0xa5, 0x86, 0x2d,
-             0x02, 0x09, 0x8e, 0x13,
-             0x82, 0x01, 0xe1, 0xe0,
-             0xe1, 0xe0, 0x42, 0x01,
-             0xe0, 0x88, 0x0c, 0x05,
-             0xe0, 0x1c, 0x0c, 0x15,
-             0xe0, 0x84, 0x0c, 0x75,
-             0x8e, 0x13, 0xc2, 0x77,
-             0xe0, 0x30, 0x42, 0x03,
-             0x4c, 0x05, 0x8f, 0x01,
-             0x0c, 0x0c, 0xe0, 0x98,
-             0xdd, 0x93, 0xf2, 0xfc,
-             0xe0, 0xa4, 0x0c, 0x05,
-             0xe0, 0x84, 0x0c, 0x15,
-             0xf1, 0x80, 0x40, 0x52,
-             0x81, 0x2d, 0x02, 0x11,
-             0xe0, 0x84, 0x4c, 0x15,
-             0x98, 0x44, 0x94, 0x25,
-             0xe0, 0x1c, 0x0c, 0x35,
-             0xe0, 0x8c, 0x0c, 0x05,
-             0xec, 0x04, 0x18, 0x40,
-             0x18, 0x14, 0x19, 0x1d,
-             0x86, 0xc3, 0xe0, 0x84,
-             0xe0, 0x30, 0x58, 0x53,
-             0xe0, 0x60, 0x58, 0x03,
-             0x0c, 0x09, 0xf8, 0x05,
-             0x0c, 0x55, 0xe1, 0xd0,
-             0x40, 0x0a, 0xe0, 0x3c,
-             0x02, 0xa5, 0xe0, 0x84,
-             0xf0, 0x88, 0x40, 0x52,
-             0x68, 0x08, 0x4a, 0x08,
-             0x0c, 0x15, 0x8c, 0x1b,
-             0x0c, 0x25, 0xe0, 0x84,
-             0x0c, 0x35, 0xe0, 0x90,
-             0x98, 0x44, 0xe0, 0x1c,
-             0x08, 0x40, 0x02, 0x11,
-             0x0a, 0x14, 0xec, 0x04,
-             0x89, 0x1d, 0x60, 0x84,
-             0x60, 0x84, 0x4c, 0x15,
-             0x46, 0x03, 0x8a, 0x33,
-             0x87, 0x01, 0x60, 0x60,
-             0x60, 0x30, 0x46, 0x23,
-             0x80, 0x00, 0x00, 0x76,
-             0xe0, 0x98, 0x4c, 0x05,
-             0x8b, 0xa5, 0xee, 0xa5,
-             0x60, 0x60, 0x14, 0xa3,
-             0x48, 0xa2, 0x86, 0xc3,
-             0xa4, 0x43, 0xfb, 0x10,
-             0x8e, 0x05, 0x98, 0x4d,
-             0x82, 0x11, 0x18, 0x44,
-             0x60, 0x84, 0x4c, 0x15,
-             0x08, 0x40, 0x84, 0x33,
-             0x09, 0x1d, 0xec, 0x04,
-             0xe0, 0x84, 0x08, 0x14,
-             0x40, 0x23, 0x88, 0x03,
-             0x40, 0x33, 0xe0, 0x30,
-             0xe8, 0x25, 0xe0, 0x60,
-             0x0c, 0x35, 0x87, 0xf5,
-             0x08, 0x14, 0x60, 0x1c,
-             0x0c, 0x05, 0xe0, 0x84,
-             0x88, 0x33, 0xe0, 0x8c,
-             0xe0, 0x30, 0x46, 0x23,
-             0xe0, 0x60, 0x46, 0x03,
-             0xe1, 0xd0, 0x0c, 0x29,
-             0xe0, 0x84, 0x44, 0x0a,
-             0x00, 0x04, 0x82, 0xe5,
-             0x8c, 0x1b, 0x7b, 0x00,
-             0xe8, 0x08, 0x45, 0x68,
-             0xe0, 0x84, 0x0c, 0x15,
-             0xe0, 0x1c, 0x0c, 0x25,
-             0xe0, 0x84, 0x06, 0x14,
-             0x44, 0x03, 0x86, 0x23,
-             0x98, 0x04, 0xe0, 0x60,
-             0xe0, 0x98, 0x4c, 0x85,
-             0xec, 0x04, 0x00, 0x00,
-             0xde, 0x65, 0x81, 0x1d,
-             0x0c, 0x35, 0x83, 0xb5,
-             0xa4, 0x53, 0x60, 0x40,
-             0xe0, 0xa2, 0x46, 0x3a,
-             0x82, 0xa5, 0x86, 0x5d,
-             0x00, 0x19, 0x82, 0x03,
-             0x82, 0x11, 0xe1, 0xe0,
-             0xe1, 0xe0, 0x40, 0x11,
-             0xe0, 0x90, 0x0c, 0x25,
-             0xe0, 0x1c, 0x0c, 0x05,
-             0xe0, 0x84, 0x0c, 0x15,
-             0xe0, 0x84, 0x06, 0x14,
-             0x40, 0x23, 0x86, 0x03,
-             0x4c, 0x85, 0xe0, 0x30,
-             0xa4, 0x04, 0xe0, 0x98,
-             0xe0, 0xa4, 0x0c, 0x35,
-             0xe0, 0x90, 0x0c, 0x25,
-             0x86, 0x2d, 0x80, 0x33,
-             0x0c, 0x35, 0x86, 0xc5,
-             0x80, 0x33, 0xe0, 0x34,
-             0x90, 0xa5, 0x87, 0x2d,
-             0x60, 0x1c, 0x0c, 0x25,
-             0xe4, 0x04, 0x08, 0x10,
-             0x60, 0x3c, 0x0c, 0x35,
-             0xe0, 0x84, 0x02, 0x44,
-             0xe0, 0x84, 0x4c, 0x45,
-             0x44, 0x03, 0x82, 0x23,
-             0x42, 0x32, 0x60, 0x30,
-             0x44, 0x13, 0xf0, 0x80,
-             0x0c, 0x09, 0xe0, 0x60,
-             0x40, 0x0a, 0xe1, 0xd0,
-             0x30, 0xf8, 0xe0, 0x84,
-             0xe7, 0xb5, 0xdf, 0xfc,
-             0x86, 0xf5, 0xa1, 0x1d,
-             0x60, 0x1c, 0x0c, 0x25,
-             0xe0, 0x84, 0x06, 0x14,
-             0xe0, 0x40, 0x0c, 0x45,
-             0x06, 0x33, 0x84, 0x33,
-             0x48, 0x4a, 0xe0, 0x30,
-             0xa0, 0x33, 0xe0, 0xa2,
-             0x82, 0x85, 0x88, 0x3d,
-             0x04, 0x09, 0x82, 0x23,
-             0x82, 0x01, 0xe1, 0xe0,
-             0xe1, 0xe0, 0x44, 0x01,
-             0x0c, 0x25, 0xa4, 0x04,
-             0x0c, 0x15, 0xe0, 0x1c,
-             0x06, 0x14, 0xe0, 0x84,
-             0x86, 0x23, 0xe0, 0x84,
-             0xe0, 0x30, 0x44, 0x03,
-             0x8f, 0x01, 0x02, 0x71,
-             0x60, 0x98, 0x4c, 0x05,
-             0x31, 0x88, 0x8f, 0x1b,
-             0x8c, 0x0b, 0xdf, 0xfc,
-             0xf2, 0xfc, 0x0c, 0x0c,
-             0xe0, 0x04, 0x27, 0x08,
-             0xe0, 0xfc, 0x0c, 0x05,
-             0xe1, 0x00, 0x0c, 0x15,
-             0xe0, 0x94, 0x4c, 0x25,
-             0x60, 0x98, 0x4c, 0x85,
-             0xf1, 0x80, 0x40, 0x22,
-             0x60, 0xbc, 0x4c, 0x05,
-             0x4c, 0x25, 0xa2, 0x23,
-             0xe1, 0x25, 0xe0, 0xc0,
-             0xf8, 0x1c, 0x04, 0x0c,
-             0x81, 0x61, 0x02, 0x24,
-             0x60, 0x20, 0x00, 0x15,
-             0x00, 0x45, 0x81, 0x71,
-             0x88, 0x34, 0xe0, 0xa0,
-             0xc8, 0xc4, 0x8a, 0x54,
-             0x00, 0x35, 0xca, 0x24,
-             0x86, 0x53, 0x60, 0x18,
-             0x58, 0x52, 0x98, 0x53,
-             0x82, 0x5b, 0x70, 0x88,
-             0x04, 0x40, 0x55, 0xce,
-             0x81, 0xd5, 0xec, 0x10,
-             0x82, 0x71, 0x02, 0x84,
-             0x7c, 0x18, 0x10, 0x85,
-             0xf0, 0x98, 0x52, 0x82,
-             0x60, 0x10, 0x12, 0x95,
-             0xb0, 0xc3, 0x88, 0x61,
-             0xd5, 0xce, 0x92, 0xc3,
-             0xfc, 0x75, 0x85, 0x7d,
-             0x60, 0x88, 0x18, 0x44,
-             0xec, 0x04, 0x08, 0x40,
-             0x70, 0xb0, 0x4a, 0x12,
-             0x0a, 0x50, 0x98, 0x33,
-             0x18, 0xc0, 0x6c, 0x30,
-             0x81, 0xf5, 0xec, 0x40,
-             0x82, 0x21, 0x4d, 0x74,
-             0x02, 0x85, 0x82, 0x64,
-             0xc4, 0x77, 0xfc, 0x30,
-             0x7c, 0x30, 0x0c, 0x95,
-             0x0c, 0x65, 0x88, 0xc1,
-             0xb2, 0x83, 0xfc, 0x1c,
-             0xd5, 0x8e, 0x8c, 0x83,
-             0xfc, 0x35, 0x89, 0x2d,
-             0xf0, 0x1c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xf8, 0x7c, 0x04, 0x0c,
-             0xed, 0x80, 0x1e, 0xf0,
-             0x60, 0xbc, 0x00, 0x75,
-             0x00, 0x35, 0xff, 0x61,
-             0x81, 0x11, 0x60, 0xc0,
-             0x60, 0x18, 0x00, 0x25,
-             0x40, 0x15, 0x81, 0x81,
-             0x40, 0x65, 0xe0, 0x7c,
-             0x00, 0x15, 0xe0, 0x88,
-             0x00, 0xc5, 0xe0, 0xb4,
-             0x40, 0x65, 0xe0, 0xa8,
-             0x25, 0x3e, 0xe1, 0x40,
-             0xe0, 0x88, 0x06, 0x74,
-             0x60, 0xd8, 0x00, 0x35,
-             0x00, 0x45, 0x86, 0x23,
-             0x16, 0x20, 0x60, 0x6c,
-             0x4a, 0xca, 0xec, 0x40,
-             0x81, 0x21, 0x66, 0x86,
-             0x46, 0x86, 0x21, 0x3e,
-             0x28, 0x33, 0xe0, 0x3c,
-             0x1b, 0x3e, 0xa0, 0x51,
-             0xe4, 0x40, 0x06, 0x10,
-             0x08, 0x10, 0x0b, 0x37,
-             0x7c, 0x3e, 0xe4, 0x10,
-             0xe4, 0x08, 0x06, 0x10,
-             0xcb, 0x57, 0x02, 0x11,
-             0x85, 0x37, 0x07, 0x47,
-             0x83, 0x17, 0x19, 0x5e,
-             0x81, 0x51, 0x3e, 0x4e,
-             0x81, 0x41, 0x09, 0x3e,
-             0x00, 0x15, 0x95, 0x1e,
-             0x93, 0x1e, 0xe0, 0xdc,
-             0xe0, 0xe0, 0x00, 0x15,
-             0x00, 0x15, 0xfe, 0x1e,
-             0x8d, 0x1e, 0xe0, 0x28,
-             0xe0, 0x2c, 0x00, 0x15,
-             0x00, 0x15, 0x91, 0x1e,
-             0x8f, 0xce, 0xe0, 0x24,
-             0x1d, 0x1e, 0xa3, 0x7e,
-             0xe0, 0x84, 0x02, 0xc4,
-             0x81, 0x11, 0x0b, 0x1e,
-             0x8e, 0xc3, 0x2b, 0x1e,
-             0x81, 0x11, 0x3c, 0xce,
-             0x1a, 0x38, 0x97, 0x1e,
-             0x0a, 0xa0, 0xe0, 0x00,
-             0x0b, 0x0a, 0xe4, 0x04,
-             0x1a, 0x48, 0xe7, 0x20,
-             0x16, 0x15, 0xc0, 0x00,
-             0xa2, 0x4d, 0x60, 0x10,
-             0x5e, 0x45, 0xad, 0x6e,
-             0x5e, 0x25, 0xc0, 0x5c,
-             0x98, 0xf5, 0xc0, 0x4c,
-             0xc4, 0x17, 0x27, 0xbe,
-             0x60, 0xac, 0x00, 0x35,
-             0x19, 0x74, 0x8c, 0xbb,
-             0x06, 0xc5, 0x8e, 0x6b,
-             0xab, 0x34, 0xfc, 0x04,
-             0x04, 0xcd, 0xae, 0xc3,
-             0x2b, 0x3e, 0x88, 0x33,
-             0x9c, 0x00, 0x58, 0x20,
-             0x4e, 0x60, 0x0e, 0x05,
-             0x29, 0x8e, 0x9c, 0x00,
-             0xaf, 0x4e, 0x98, 0x8b,
-             0xe0, 0xb0, 0x00, 0x35,
-             0x8b, 0xc4, 0x8f, 0x44,
-             0xfc, 0x04, 0x06, 0x15,
-             0x60, 0x84, 0x06, 0x14,
-             0x88, 0x33, 0x8e, 0x13,
-             0xe0, 0x32, 0x46, 0x3a,
-             0x46, 0x3a, 0x9d, 0xc4,
-             0x90, 0xcb, 0x66, 0xb2,
-             0xe5, 0x00, 0x06, 0x30,
-             0x46, 0x3a, 0xcf, 0x37,
-             0x0d, 0x34, 0xe6, 0x92,
-             0x42, 0x1a, 0x86, 0x13,
-             0x42, 0x1a, 0xf0, 0x0a,
-             0x02, 0x10, 0xe6, 0x8e,
-             0xd1, 0x17, 0xe6, 0x00,
-             0x1e, 0x45, 0x82, 0xcd,
-             0x58, 0x20, 0x00, 0x5c,
-             0x1e, 0x85, 0x9c, 0x00,
-             0x1e, 0x75, 0x80, 0x50,
-             0x82, 0x65, 0x80, 0x44,
-             0x96, 0x6b, 0x2f, 0x44,
-             0xe0, 0x88, 0x40, 0x95,
-             0xa1, 0x4b, 0xa9, 0x84,
-             0x81, 0x11, 0x80, 0xc5,
-             0x81, 0xe5, 0xab, 0x1e,
-             0x96, 0x6b, 0x01, 0xe5,
-             0x83, 0x41, 0x3c, 0x14,
-             0xe1, 0x40, 0x40, 0x95,
-             0x94, 0x13, 0xa5, 0x24,
-             0x7b, 0x08, 0x44, 0x12,
-             0xa5, 0x2e, 0x81, 0x11,
-             0xa3, 0x74, 0xab, 0x1e,
-             0xab, 0x24, 0x9b, 0x14,
-             0x82, 0x2d, 0xa7, 0xb4,
-             0xc0, 0x00, 0x13, 0xf8,
-             0x12, 0x78, 0xa3, 0x4d,
-             0x4c, 0x80, 0x40, 0x00,
-             0x27, 0xce, 0xdc, 0x00,
-             0x16, 0x15, 0x83, 0x21,
-             0xaf, 0x2e, 0xe0, 0x10,
-             0x60, 0x20, 0x16, 0x25,
-             0xe0, 0x88, 0x08, 0x14,
-             0xe0, 0x20, 0x00, 0x35,
-             0xe0, 0x10, 0x00, 0x15,
-             0xc4, 0x27, 0x21, 0xc4,
-             0xfc, 0x10, 0x06, 0x65,
-             0xfc, 0x08, 0x06, 0x25,
-             0x7c, 0x10, 0x02, 0x45,
-             0x10, 0x05, 0x99, 0xad,
-             0x93, 0xc4, 0x8c, 0x23,
-             0x9e, 0x65, 0x99, 0xad,
-             0x83, 0xad, 0xfe, 0x14,
-             0xee, 0x34, 0xaa, 0x85,
-             0xfc, 0xc4, 0x82, 0x14,
-             0x02, 0x15, 0xc4, 0x37,
-             0x42, 0xc2, 0xfc, 0x0c,
-             0x18, 0x14, 0xfa, 0x04,
-             0x4c, 0x22, 0xe0, 0x8c,
-             0xc2, 0x67, 0xf1, 0xb0,
-             0x1e, 0x95, 0x90, 0x6d,
-             0x4c, 0x80, 0x00, 0x58,
-             0x0f, 0xb8, 0x9c, 0x00,
-             0x29, 0x8e, 0x80, 0x00,
-             0xe4, 0x10, 0x0e, 0x40,
-             0xc7, 0x77, 0x40, 0xc4,
-             0xb3, 0x11, 0x1f, 0x1e,
-             0xe6, 0x86, 0x44, 0x2a,
-             0x18, 0x25, 0x9d, 0x14,
-             0x10, 0x20, 0x7c, 0x0c,
-             0x1f, 0x34, 0xe4, 0x08,
-             0x4e, 0x7a, 0xc5, 0x87,
-             0x82, 0xcb, 0x66, 0x86,
-             0xad, 0x11, 0x08, 0x83,
-             0x48, 0x3a, 0x10, 0x71,
-             0x49, 0x77, 0xe6, 0x86,
-             0xe0, 0x98, 0x02, 0x24,
-             0x06, 0x06, 0x0e, 0x83,
-             0x02, 0x83, 0xe0, 0x04,
-             0x10, 0x43, 0x83, 0x11,
-             0x13, 0xe5, 0x8f, 0x81,
-             0x1f, 0x5e, 0x83, 0x71,
-             0x16, 0x15, 0x80, 0x5b,
-             0x16, 0x65, 0xf8, 0x30,
-             0x16, 0x75, 0xf8, 0x20,
-             0x29, 0x8e, 0xf8, 0x10,
-             0x2c, 0x84, 0xc4, 0x17,
-             0x06, 0xc5, 0xc4, 0x67,
-             0xc4, 0x77, 0x7c, 0x04,
-             0xfc, 0x18, 0x06, 0x65,
-             0x7c, 0x1c, 0x06, 0x75,
-             0x06, 0x35, 0xc4, 0x87,
-             0x29, 0x04, 0xfc, 0x20,
-             0x8e, 0x63, 0x98, 0x63,
-             0x86, 0x63, 0x15, 0x34,
-             0x7a, 0x18, 0x46, 0x32,
-             0xe0, 0x84, 0x0c, 0x24,
-             0x80, 0x6d, 0xa6, 0x63,
-             0x1d, 0x84, 0x92, 0x45,
-             0xe4, 0x10, 0x0e, 0x40,
-             0xc7, 0x77, 0x0a, 0x0b,
-             0x84, 0x43, 0x42, 0xc4,
-             0x66, 0xa2, 0x4e, 0x7a,
-             0x9f, 0x54, 0xc4, 0x47,
-             0x7c, 0x04, 0x18, 0x15,
-             0x45, 0x77, 0x84, 0x71,
-             0x08, 0x73, 0x90, 0xcb,
-             0x02, 0x73, 0x91, 0x81,
-             0x48, 0x72, 0x90, 0x11,
-             0x04, 0x14, 0x70, 0x8c,
-             0x06, 0x06, 0xe1, 0x90,
-             0x89, 0x11, 0x60, 0x08,
-             0x87, 0x71, 0x0b, 0xf5,
-             0xf8, 0x10, 0x16, 0x75,
-             0xc4, 0x77, 0xac, 0xc4,
-             0x7c, 0x1c, 0x06, 0x65,
-             0x06, 0x35, 0xc4, 0xc7,
-             0x89, 0xc4, 0xfc, 0x30,
-             0x46, 0xc2, 0x8c, 0x33,
-             0x4c, 0x22, 0xfa, 0x0c,
-             0xc2, 0x67, 0xf1, 0x8c,
-             0x9e, 0xe5, 0x90, 0x6d,
-             0x18, 0x40, 0x29, 0x8e,
-             0x02, 0x15, 0xe4, 0x10,
-             0xc7, 0xc7, 0x7c, 0x1c,
-             0x84, 0x43, 0x1d, 0x74,
-             0x02, 0x43, 0x91, 0x81,
-             0x44, 0xca, 0x88, 0x11,
-             0x86, 0x43, 0x66, 0x9e,
-             0x8e, 0xcb, 0x44, 0x47,
-             0x06, 0x06, 0x04, 0x21,
-             0x45, 0x27, 0xe0, 0x08,
-             0x04, 0x43, 0x85, 0x71,
-             0xe1, 0x8c, 0x04, 0x14,
-             0x85, 0x11, 0x07, 0x35,
-             0x8a, 0x0b, 0x00, 0x6b,
-             0xa3, 0x74, 0xad, 0x94,
-             0xa7, 0xc4, 0xaf, 0x44,
-             0x8d, 0x55, 0x9f, 0x54,
-             0xc4, 0x77, 0xac, 0x74,
-             0xfc, 0x1c, 0x06, 0x15,
-             0x42, 0x32, 0xbe, 0x34,
-             0x06, 0x14, 0xfa, 0x04,
-             0x4c, 0x22, 0xe0, 0x84,
-             0xc2, 0x67, 0xf1, 0x8c,
-             0x92, 0xe5, 0x90, 0x6d,
-             0x18, 0x40, 0x29, 0x8e,
-             0x00, 0x35, 0xe4, 0x10,
-             0xc7, 0xc7, 0x60, 0x14,
-             0x84, 0x43, 0x1d, 0x84,
-             0x7c, 0x1c, 0x06, 0x35,
-             0x58, 0xca, 0x87, 0x71,
-             0x10, 0xc1, 0xe6, 0xa2,
-             0x49, 0xc7, 0x86, 0x13,
-             0x18, 0x43, 0x84, 0x31,
-             0x10, 0xcb, 0xc4, 0x17,
-             0x04, 0x34, 0x82, 0x43,
-             0x8f, 0x81, 0x61, 0x88,
-             0x60, 0x04, 0x06, 0x06,
-             0x44, 0x2a, 0x89, 0x11,
-             0x82, 0x23, 0xe6, 0xb2,
-             0x11, 0x24, 0xef, 0x2f,
-             0x42, 0x4a, 0x84, 0x43,
-             0x42, 0x1a, 0xf0, 0x0a,
-             0x86, 0x13, 0xe6, 0x8a,
-             0x82, 0x6d, 0xf1, 0x1f,
-             0x80, 0x50, 0x1e, 0x65,
-             0x80, 0x58, 0x1e, 0x95,
-             0x80, 0x44, 0x1e, 0x75,
-             0xaf, 0x44, 0x88, 0xc5,
-             0xe0, 0x88, 0x40, 0x95,
-             0x23, 0x74, 0x97, 0x14,
-             0xa7, 0xc4, 0xa3, 0x4b,
-             0x97, 0x1e, 0x82, 0x11,
-             0x00, 0x15, 0x84, 0x95,
-             0x8e, 0xa3, 0x60, 0xf0,
-             0x60, 0xa0, 0x00, 0x25,
-             0x85, 0x41, 0x87, 0x31,
-             0x44, 0x2a, 0x94, 0x13,
-             0x06, 0x10, 0x66, 0x8e,
-             0x85, 0x3d, 0xe4, 0x10,
-             0x40, 0x48, 0x5e, 0x15,
-             0x40, 0x15, 0x83, 0x11,
-             0x81, 0xb5, 0xe0, 0x7c,
-             0x81, 0x95, 0xad, 0x94,
-             0x90, 0x6b, 0x2d, 0x94,
-             0xa7, 0xc4, 0xaf, 0x44,
-             0x81, 0x35, 0xa3, 0x74,
-             0xa7, 0xc4, 0xaf, 0x44,
-             0x88, 0xb1, 0x0c, 0x8b,
-             0x92, 0x6b, 0x18, 0x2b,
-             0x8a, 0xab, 0x25, 0x14,
-             0xf0, 0xa8, 0x52, 0x72,
-             0x25, 0xa8, 0x82, 0x9d,
-             0xa1, 0x6d, 0x9f, 0xfc,
-             0x97, 0x24, 0x82, 0x15,
-             0xe0, 0xf0, 0x00, 0x15,
-             0x83, 0x2d, 0x82, 0x21,
-             0xc0, 0x88, 0x40, 0x65,
-             0x1e, 0xf0, 0x01, 0x11,
-             0x40, 0x15, 0xe5, 0x80,
-             0x0c, 0x0c, 0xe0, 0x98,
-             0xdd, 0x93, 0xf0, 0x7c,
-             0xf8, 0x7c, 0x04, 0x0c,
-             0xed, 0x80, 0x1e, 0xf0,
-             0xff, 0x31, 0x01, 0x21,
-             0x60, 0x80, 0x40, 0x25,
-             0xe0, 0x3c, 0x4a, 0x86,
-             0x60, 0x6c, 0x00, 0x25,
-             0x00, 0x15, 0x81, 0xb1,
-             0x81, 0x61, 0x60, 0xb4,
-             0x60, 0x8c, 0x40, 0x35,
-             0x40, 0x35, 0x81, 0x91,
-             0xa4, 0x53, 0x61, 0x44,
-             0x60, 0xc0, 0x00, 0x35,
-             0xe4, 0x40, 0x04, 0x10,
-             0x60, 0xa8, 0x00, 0xc5,
-             0x00, 0x45, 0x8b, 0x27,
-             0xa9, 0x3e, 0xe0, 0xbc,
-             0xe0, 0x18, 0x00, 0xa5,
-             0x04, 0x10, 0x09, 0x2e,
-             0x07, 0x27, 0xe4, 0x10,
-             0xe6, 0x86, 0x46, 0xca,
-             0x44, 0x42, 0x7e, 0x2e,
-             0x44, 0x27, 0xf1, 0xb0,
-             0x50, 0xa2, 0xa0, 0x31,
-             0x04, 0x10, 0x70, 0x88,
-             0x02, 0x11, 0xe4, 0x08,
-             0x05, 0x27, 0xcb, 0x37,
-             0x1f, 0x3e, 0x83, 0x17,
-             0xe0, 0x88, 0x06, 0x44,
-             0x86, 0xa3, 0x21, 0x5e,
-             0x81, 0x31, 0x0f, 0x2e,
-             0x00, 0x15, 0x9b, 0x1e,
-             0xa5, 0x1e, 0xe0, 0xe4,
-             0xe0, 0xe8, 0x00, 0x15,
-             0x00, 0x15, 0x99, 0x1e,
-             0x8d, 0x1e, 0xe0, 0xec,
-             0xe0, 0x28, 0x00, 0x15,
-             0x00, 0x15, 0x93, 0x1e,
-             0x97, 0x1e, 0xe0, 0x2c,
-             0xe0, 0x24, 0x00, 0x15,
-             0x23, 0x1e, 0x95, 0xce,
-             0xe0, 0x84, 0x02, 0xc4,
-             0xb8, 0x1b, 0x11, 0x1e,
-             0xff, 0x11, 0x7c, 0x1e,
-             0x81, 0x11, 0x0b, 0x1e,
-             0x81, 0xc1, 0x1d, 0x1e,
-             0x0d, 0x0a, 0xb1, 0xa5,
-             0x18, 0xb8, 0xe3, 0x1c,
-             0xa2, 0xcd, 0xc0, 0x00,
-             0x5c, 0x00, 0x4e, 0x30,
-             0xdc, 0x00, 0x46, 0xc0,
-             0x2d, 0xae, 0x96, 0x55,
-             0x20, 0x24, 0x8c, 0xab,
-             0x00, 0x15, 0x88, 0x6b,
-             0x98, 0xb3, 0x60, 0xac,
-             0xc4, 0x27, 0x9f, 0x44,
-             0xfc, 0x08, 0x02, 0x15,
-             0xf1, 0x90, 0x4e, 0x12,
-             0x0c, 0x05, 0x86, 0x7d,
-             0x9c, 0x00, 0x4e, 0x30,
-             0x8e, 0x9b, 0x2f, 0x9e,
-             0xe0, 0xb0, 0x00, 0x55,
-             0x91, 0x74, 0x95, 0x14,
-             0xfc, 0x08, 0x0a, 0x25,
-             0x60, 0x84, 0x0a, 0x24,
-             0x82, 0x53, 0x88, 0x23,
-             0xe0, 0x1e, 0x4a, 0x5a,
-             0x4a, 0x5a, 0xa3, 0x74,
-             0x92, 0x7b, 0x66, 0x9e,
-             0xe5, 0x00, 0x0a, 0x50,
-             0x4a, 0x5a, 0xcf, 0x57,
-             0x93, 0x14, 0xe6, 0x86,
-             0x44, 0x2a, 0x8a, 0x23,
-             0x44, 0x2a, 0xf0, 0x0a,
-             0x04, 0x20, 0xe6, 0x86,
-             0xd1, 0x27, 0xe6, 0x00,
-             0x1e, 0x95, 0x84, 0x7d,
-             0x4e, 0x30, 0x00, 0x5c,
-             0x82, 0x05, 0x9c, 0x00,
-             0xa1, 0xcb, 0x0c, 0x4b,
-             0xe0, 0x8c, 0x40, 0x45,
-             0x01, 0xe5, 0x80, 0xa5,
-             0x01, 0xd5, 0x81, 0xb1,
-             0x7c, 0x24, 0x8c, 0x4b,
-             0x40, 0x45, 0x81, 0xb1,
-             0x83, 0xc1, 0x61, 0x44,
-             0x88, 0x23, 0xa9, 0x14,
-             0xfa, 0x04, 0x42, 0x22,
-             0xaf, 0x94, 0xa9, 0x1e,
-             0x94, 0x6b, 0x21, 0x14,
-             0x82, 0xbd, 0xad, 0xa4,
-             0xc0, 0x00, 0x13, 0x48,
-             0x83, 0x31, 0x23, 0xcd,
-             0x5c, 0x00, 0x46, 0xc0,
-             0xdc, 0x00, 0x4a, 0x90,
-             0xc0, 0x00, 0x11, 0xb8,
-             0xad, 0xbe, 0xab, 0x7e,
-             0xf8, 0x10, 0x14, 0x25,
-             0xe0, 0x20, 0x00, 0x55,
-             0xf8, 0x20, 0x14, 0xc5,
-             0xc4, 0x27, 0x25, 0x14,
-             0xfc, 0x08, 0x0a, 0xb5,
-             0x60, 0x10, 0x00, 0x25,
-             0x0a, 0x75, 0xc4, 0xc7,
-             0x83, 0x6d, 0x7c, 0x30,
-             0xfc, 0x30, 0x04, 0xc5,
-             0x8e, 0xb3, 0x0e, 0x65,
-             0x83, 0x6d, 0x99, 0x14,
-             0x8d, 0x14, 0x9c, 0x25,
-             0x83, 0x6d, 0xa8, 0x74,
-             0x02, 0x14, 0xa6, 0x85,
-             0x89, 0x24, 0xc4, 0x77,
-             0xfc, 0x1c, 0x02, 0x15,
-             0xfa, 0x04, 0x44, 0x22,
-             0xe0, 0x8c, 0x02, 0x24,
-             0xf1, 0x84, 0x4a, 0xb2,
-             0x92, 0x5d, 0xc2, 0x57,
-             0x80, 0x00, 0x0f, 0xa8,
-             0x12, 0xc0, 0x2f, 0x9e,
-             0x27, 0x8e, 0xe4, 0x10,
-             0xc0, 0x14, 0xc7, 0x97,
-             0xb3, 0x11, 0x3e, 0x1e,
-             0xe6, 0x86, 0x50, 0xba,
-             0x3e, 0xb4, 0xa3, 0x14,
-             0xc5, 0x87, 0x84, 0x81,
-             0x66, 0x86, 0x52, 0x9a,
-             0x16, 0xb5, 0x98, 0x83,
-             0xad, 0xc1, 0x7c, 0x1c,
-             0x58, 0x2a, 0x10, 0x91,
-             0x49, 0x97, 0xe6, 0xb2,
-             0xe0, 0x04, 0x0e, 0x06,
-             0x04, 0xb4, 0x12, 0x83,
-             0x04, 0x83, 0xe0, 0x98,
-             0x10, 0xc3, 0x83, 0x91,
-             0x13, 0x45, 0x8f, 0x81,
-             0xa7, 0x8e, 0x83, 0x21,
-             0x14, 0x75, 0xa8, 0x24,
-             0x14, 0x85, 0xe0, 0x10,
-             0x2f, 0x9e, 0xe0, 0x20,
-             0x14, 0x95, 0xc4, 0x27,
-             0xc4, 0x77, 0x60, 0x30,
-             0x7c, 0x08, 0x0a, 0x15,
-             0x0a, 0x75, 0xc4, 0x87,
-             0x0a, 0x85, 0xfc, 0x1c,
-             0xc4, 0x97, 0x7c, 0x20,
-             0xfc, 0x24, 0x0a, 0x55,
-             0x82, 0x73, 0x1b, 0x14,
-             0x90, 0x73, 0x2f, 0x94,
-             0x0a, 0xb4, 0x0a, 0x73,
-             0x4e, 0x12, 0xe0, 0x84,
-             0xae, 0x53, 0xfa, 0x1c,
-             0x90, 0xe5, 0x92, 0x5d,
-             0x10, 0xc0, 0x23, 0x94,
-             0x42, 0x14, 0xe4, 0x10,
-             0x96, 0xc3, 0xc7, 0x87,
-             0x66, 0xa6, 0x50, 0x8a,
-             0x02, 0x15, 0xc4, 0xc7,
-             0x84, 0x81, 0xfc, 0x08,
-             0x98, 0x83, 0xc5, 0x87,
-             0x90, 0x11, 0x02, 0x83,
-             0x70, 0x9c, 0x58, 0x82,
-             0xe1, 0x90, 0x16, 0x14,
-             0x91, 0x81, 0x12, 0x1b,
-             0x0e, 0x06, 0x0b, 0x95,
-             0xa7, 0x8e, 0xe0, 0x08,
-             0x14, 0x15, 0xa8, 0x84,
-             0xc4, 0x87, 0xe0, 0x10,
-             0x7c, 0x20, 0x0a, 0x75,
-             0x0a, 0x15, 0xc4, 0x17,
-             0x8f, 0x54, 0xfc, 0x04,
-             0x4e, 0x52, 0x8e, 0x13,
-             0x4a, 0xb2, 0xfa, 0x04,
-             0xc2, 0x57, 0xf1, 0x9c,
-             0x86, 0x65, 0x92, 0x5d,
-             0x85, 0x91, 0x2f, 0x9e,
-             0x7c, 0x20, 0x04, 0x15,
-             0xe4, 0x10, 0x04, 0xc0,
-             0xc7, 0x27, 0x23, 0x84,
-             0x02, 0xc3, 0x96, 0xc3,
-             0x44, 0x2a, 0x88, 0x11,
-             0x8e, 0xc3, 0x66, 0xa2,
-             0x16, 0x14, 0x44, 0xc7,
-             0x04, 0x21, 0xe1, 0x8c,
-             0x45, 0x27, 0x90, 0x1b,
-             0x04, 0xc3, 0x91, 0x81,
-             0xe0, 0x08, 0x0e, 0x06,
-             0x85, 0x21, 0x05, 0xd5,
-             0x92, 0x5b, 0x0d, 0x05,
-             0xc4, 0x77, 0x7e, 0x24,
-             0xfc, 0x1c, 0x0a, 0x15,
-             0xfa, 0x04, 0x44, 0x22,
-             0xe0, 0x84, 0x02, 0x24,
-             0xf1, 0x84, 0x4a, 0xb2,
-             0x92, 0x5d, 0xc2, 0x57,
-             0xaf, 0x9e, 0x98, 0x05,
-             0x10, 0xc0, 0x27, 0x8e,
-             0x00, 0x15, 0xe4, 0x10,
-             0xc7, 0x87, 0x60, 0x14,
-             0x96, 0xc3, 0x23, 0x94,
-             0x7c, 0x1c, 0x02, 0x15,
-             0xe0, 0x04, 0x0e, 0x06,
-             0xe6, 0xa6, 0x50, 0x8a,
-             0x82, 0x23, 0x10, 0x81,
-             0x84, 0x11, 0x49, 0x87,
-             0xc4, 0x27, 0x10, 0xc3,
-             0x61, 0x88, 0x16, 0x14,
-             0x12, 0x1b, 0x84, 0xc3,
-             0x07, 0x21, 0x8f, 0x81,
-             0x42, 0xba, 0x89, 0x91,
-             0x92, 0x13, 0xe6, 0x86,
-             0xe5, 0x1f, 0x17, 0x24,
-             0x42, 0xca, 0x82, 0xc3,
-             0x42, 0x1a, 0xf0, 0x0a,
-             0x8e, 0x13, 0xe6, 0x8a,
-             0x82, 0x5d, 0xf1, 0x1f,
-             0x80, 0x5c, 0x1e, 0x55,
-             0x40, 0x45, 0x88, 0xc5,
-             0xa3, 0x3b, 0x60, 0x8c,
-             0x88, 0x2b, 0x1d, 0x14,
-             0x48, 0x20, 0x27, 0x84,
-             0xad, 0xb4, 0xdc, 0x00,
-             0x82, 0x11, 0x2b, 0x74,
-             0x86, 0x95, 0x9d, 0x1e,
-             0x60, 0xf4, 0x00, 0x15,
-             0x98, 0x4b, 0x84, 0xcb,
-             0x71, 0x84, 0x46, 0x22,
-             0x02, 0x30, 0xff, 0x21,
-             0x29, 0x24, 0xec, 0x40,
-             0x95, 0x14, 0x84, 0x1d,
-             0x5c, 0x00, 0x44, 0x30,
-             0x1e, 0x25, 0x83, 0x3d,
-             0x83, 0x11, 0x40, 0x50,
-             0x60, 0x80, 0x40, 0x15,
-             0x8b, 0x4e, 0x85, 0x31,
-             0x81, 0x45, 0xa9, 0x2e,
-             0xad, 0xb4, 0xa7, 0x84,
-             0x06, 0xcb, 0xab, 0x74,
-             0x08, 0x40, 0x82, 0x61,
-             0x10, 0x80, 0x6c, 0x04,
-             0x14, 0xa0, 0xec, 0x10,
-             0x8a, 0x9b, 0x6c, 0x10,
-             0x8e, 0x3b, 0x01, 0x45,
-             0x92, 0x5b, 0x7f, 0x35,
-             0x83, 0x4d, 0xa9, 0x14,
-             0x9f, 0xfc, 0x27, 0x58,
-             0xa1, 0x3d, 0x8b, 0x34,
-             0x9d, 0x24, 0x82, 0x15,
-             0xe0, 0xf4, 0x00, 0x15,
-             0x83, 0x2d, 0x82, 0x21,
-             0xc0, 0x8c, 0x40, 0x35,
-             0x1e, 0xf0, 0x01, 0x11,
-             0x40, 0x15, 0xe5, 0x80,
-             0x0c, 0x0c, 0xe0, 0x98,
-             0xdd, 0x93, 0xf0, 0x7c,
-             0xf8, 0x7c, 0x04, 0x0c,
-             0xec, 0xa0, 0x1e, 0xf0,
-             0x60, 0xbc, 0x00, 0x85,
-             0x40, 0x15, 0xff, 0x11,
-             0x00, 0x15, 0xe0, 0x90,
-             0x91, 0x1e, 0xe0, 0xc0,
-             0xe0, 0x30, 0x00, 0x15,
-             0xe0, 0x18, 0x00, 0xb5,
-             0x00, 0x15, 0x8d, 0x1e,
-             0x8b, 0x1e, 0xe0, 0x24,
-             0xe0, 0x64, 0x00, 0x15,
-             0x89, 0xbe, 0xfe, 0x8e,
-             0x81, 0x11, 0x0f, 0x1e,
-             0x81, 0x11, 0x13, 0x1e,
-             0x81, 0x11, 0x3e, 0x1e,
-             0xad, 0xb5, 0xfc, 0x1e,
-             0xe3, 0x1c, 0x05, 0x0a,
-             0xc0, 0x00, 0x16, 0xe8,
-             0x60, 0x20, 0x00, 0x75,
-             0xe0, 0x88, 0x06, 0xa4,
-             0x7c, 0x0c, 0x16, 0x85,
-             0x8f, 0x14, 0x82, 0x21,
-             0x0e, 0x95, 0xc4, 0x87,
-             0xa1, 0x1b, 0x7c, 0x20,
-             0x96, 0xc5, 0x93, 0x2e,
-             0xb4, 0x13, 0xfe, 0x14,
-             0x96, 0x45, 0xb0, 0x1d,
-             0x60, 0xb4, 0x00, 0x15,
-             0x06, 0x55, 0x96, 0x33,
-             0x06, 0x25, 0xfa, 0x10,
-             0xc4, 0x57, 0xe0, 0x20,
-             0x7c, 0x14, 0x0e, 0x45,
-             0x0e, 0xc5, 0xc4, 0x27,
-             0x04, 0x10, 0x7c, 0x08,
-             0x87, 0x27, 0xe4, 0x10,
-             0xfa, 0x10, 0x44, 0x22,
-             0x60, 0x10, 0x00, 0x95,
-             0x08, 0x24, 0x92, 0xc3,
-             0x4c, 0xc2, 0xe0, 0x84,
-             0x12, 0x85, 0xf1, 0x90,
-             0xa3, 0x6d, 0x7c, 0x20,
-             0xa4, 0xb5, 0xbc, 0x8e,
-             0x60, 0x14, 0x00, 0x45,
-             0x8b, 0x94, 0xc2, 0x67,
-             0x7c, 0x14, 0x08, 0x45,
-             0xe4, 0x10, 0x0a, 0x80,
-             0x98, 0x83, 0x47, 0x57,
-             0xe6, 0xa6, 0x4a, 0x5a,
-             0x64, 0x08, 0x16, 0x40,
-             0x45, 0xb7, 0x88, 0x23,
-             0x56, 0xba, 0x90, 0x51,
-             0xc9, 0x57, 0x66, 0xa6,
-             0xc4, 0x27, 0x0a, 0x83,
-             0x84, 0x83, 0x08, 0xb1,
-             0xc7, 0xb7, 0x0d, 0x44,
-             0x44, 0x8a, 0x96, 0x83,
-             0x44, 0x2a, 0xf0, 0x0a,
-             0x04, 0x20, 0xe6, 0x92,
-             0xcf, 0x27, 0xe5, 0x00,
-             0x1e, 0xb5, 0x84, 0x6d,
-             0x9a, 0xe5, 0x80, 0x10,
-             0x84, 0x6d, 0xfc, 0x24,
-             0xc0, 0x90, 0x40, 0xa5,
-             0x89, 0xb4, 0xbe, 0x24,
-             0xc0, 0x08, 0x5e, 0x65,
-             0x98, 0xb5, 0xa1, 0x2b,
-             0xe0, 0xf8, 0x00, 0x25,
-             0x44, 0xa2, 0x91, 0x44,
-             0x48, 0x22, 0xf1, 0x88,
-             0x83, 0x21, 0x7a, 0x10,
-             0xbe, 0x2e, 0x91, 0x4e,
-             0x00, 0x65, 0x8b, 0xa5,
-             0x42, 0xb2, 0x60, 0xb4,
-             0x02, 0x45, 0xf0, 0x8c,
-             0x00, 0xb5, 0xfa, 0x10,
-             0x06, 0x60, 0xe0, 0x14,
-             0x44, 0x47, 0xe4, 0x10,
-             0x0e, 0x25, 0x87, 0x37,
-             0x16, 0xc5, 0xfc, 0x10,
-             0x4a, 0x32, 0xfc, 0x20,
-             0x04, 0x94, 0x7a, 0x08,
-             0x06, 0x54, 0xe0, 0x84,
-             0x46, 0x22, 0xe0, 0x84,
-             0xa3, 0x3d, 0xf1, 0x8c,
-             0xc0, 0x10, 0x1e, 0xb5,
-             0x16, 0x45, 0xa2, 0x55,
-             0x50, 0xc2, 0x7c, 0x10,
-             0x3c, 0xce, 0xf0, 0xa4,
-             0xe4, 0x08, 0x16, 0xc0,
-             0xc5, 0xb7, 0x0b, 0xc4,
-             0x84, 0x41, 0x08, 0x83,
-             0x8a, 0x83, 0x45, 0x47,
-             0x66, 0xb2, 0x56, 0xba,
-             0x48, 0x4a, 0xc4, 0x87,
-             0xc2, 0x37, 0x66, 0xb2,
-             0x88, 0xb1, 0x0d, 0x54,
-             0xc7, 0xb7, 0x08, 0x41,
-             0x96, 0x43, 0xc7, 0x47,
-             0x48, 0x4a, 0x90, 0x43,
-             0x48, 0x4a, 0xf0, 0x0a,
-             0x08, 0x40, 0xe6, 0x96,
-             0xcf, 0x47, 0xe5, 0x00,
-             0x1e, 0xb5, 0x88, 0x3d,
-             0x1e, 0xc5, 0x80, 0x10,
-             0x98, 0x65, 0x80, 0x00,
-             0x89, 0xb4, 0xfc, 0x44,
-             0x40, 0xa5, 0x88, 0x3d,
-             0x5e, 0x35, 0xc0, 0x90,
-             0xbe, 0x34, 0xc0, 0x08,
-             0xa1, 0x3b, 0xbc, 0xc4,
-             0x00, 0x35, 0x96, 0x15,
-             0x91, 0x44, 0xe0, 0xf8,
-             0xf1, 0x8c, 0x46, 0xa2,
-             0x7a, 0x10, 0x48, 0x32,
-             0x91, 0x4e, 0x83, 0x31,
-             0x89, 0xd5, 0xbe, 0x3e,
-             0x10, 0xa0, 0x0c, 0x34,
-             0x04, 0x84, 0xec, 0x04,
-             0xa0, 0x11, 0x60, 0x88,
-             0x7c, 0x08, 0x16, 0x65,
-             0x02, 0x24, 0x8b, 0x17,
-             0x0e, 0x45, 0xc4, 0x37,
-             0xc4, 0x67, 0xfc, 0x0c,
-             0xfc, 0x18, 0x04, 0x25,
-             0xfa, 0x08, 0x46, 0x12,
-             0xe0, 0x88, 0x02, 0x34,
-             0xa2, 0xa5, 0x89, 0x1d,
-             0xe0, 0x8c, 0x02, 0x34,
-             0xf1, 0x84, 0x42, 0xc2,
-             0xa0, 0xf5, 0xa3, 0x1d,
-             0xb3, 0x41, 0x40, 0x24,
-             0x66, 0x92, 0x48, 0xca,
-             0x8b, 0xc4, 0xc2, 0x17,
-             0x7c, 0x18, 0x04, 0x25,
-             0x3c, 0x64, 0x84, 0x41,
-             0x0a, 0x60, 0xc5, 0x47,
-             0x8c, 0x43, 0x64, 0x10,
-             0xad, 0x61, 0x47, 0x57,
-             0xe6, 0xb2, 0x4a, 0x5a,
-             0x66, 0xb2, 0x58, 0x2a,
-             0x10, 0x51, 0xcc, 0x27,
-             0xe6, 0x9a, 0x46, 0x3a,
-             0x82, 0xc1, 0x49, 0x57,
-             0xc3, 0xc7, 0x0a, 0x43,
-             0x86, 0x43, 0x0d, 0x34,
-             0x98, 0x43, 0x84, 0x43,
-             0xf0, 0x0a, 0x44, 0x4a,
-             0xe6, 0x8e, 0x44, 0x2a,
-             0xe5, 0x00, 0x04, 0x20,
-             0x84, 0x1d, 0xcf, 0x27,
-             0xfc, 0x24, 0x96, 0xc5,
-             0x40, 0xa5, 0x84, 0x1d,
-             0x5e, 0x15, 0xc0, 0x90,
-             0x89, 0xb5, 0xc0, 0x08,
-             0x10, 0xa0, 0x02, 0x44,
-             0x04, 0x54, 0xec, 0x04,
-             0xe0, 0x88, 0x06, 0x84,
-             0x7c, 0x0c, 0x16, 0x35,
-             0x8b, 0x67, 0xa0, 0x61,
-             0x02, 0x34, 0xc4, 0x57,
-             0x08, 0x35, 0xe0, 0x88,
-             0x0e, 0x45, 0xfc, 0x04,
-             0x4c, 0x62, 0xfc, 0x14,
-             0x06, 0x64, 0xfa, 0x0c,
-             0x89, 0x3d, 0xe0, 0x88,
-             0x06, 0x64, 0x90, 0x05,
-             0x46, 0x22, 0xe0, 0x8c,
-             0xa3, 0x3d, 0xf1, 0x8c,
-             0x40, 0x24, 0x8e, 0x55,
-             0xe4, 0x08, 0x08, 0xc0,
-             0xc5, 0x47, 0x0b, 0x74,
-             0xc4, 0xc7, 0x39, 0x51,
-             0x7c, 0x04, 0x04, 0x15,
-             0x48, 0x4a, 0x9b, 0x21,
-             0xc2, 0x37, 0x66, 0x9e,
-             0xe6, 0x8a, 0x44, 0x9a,
-             0x4a, 0x6a, 0x08, 0x41,
-             0x04, 0xc3, 0xe6, 0x96,
-             0xe6, 0x9e, 0x44, 0x1a,
-             0xcc, 0x17, 0x47, 0x47,
-             0x82, 0x21, 0x08, 0xc3,
-             0xc3, 0x27, 0x0a, 0xc3,
-             0x0d, 0x24, 0x82, 0xc3,
-             0x42, 0xca, 0x84, 0xc3,
-             0x42, 0x1a, 0xf0, 0x0a,
-             0x02, 0x10, 0xe6, 0x8a,
-             0xcf, 0x17, 0xe5, 0x00,
-             0x84, 0x65, 0x82, 0x3d,
-             0x82, 0x3d, 0xfc, 0x14,
-             0xc0, 0x90, 0x40, 0xa5,
-             0xc0, 0x08, 0x5e, 0x35,
-             0xa1, 0x1b, 0xbe, 0x14,
-             0x00, 0x15, 0x82, 0x55,
-             0x11, 0x14, 0xe0, 0xf8,
-             0x42, 0xa2, 0xa2, 0xa3,
-             0x11, 0x1e, 0xfa, 0x04,
-             0xbe, 0x1e, 0x83, 0x11,
-             0x90, 0xab, 0x11, 0x14,
-             0x83, 0xad, 0x93, 0x24,
-             0x9f, 0xfc, 0x29, 0x28,
-             0xd0, 0xf1, 0x01, 0x11,
-             0xe0, 0x98, 0x40, 0x15,
-             0xf0, 0x7c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x60, 0xac, 0x00, 0x15,
-             0x00, 0x25, 0x81, 0x41,
-             0x81, 0x51, 0x60, 0xa0,
-             0x81, 0x85, 0x84, 0x34,
-             0x06, 0xcd, 0xc5, 0xc4,
-             0xfb, 0x30, 0x46, 0x32,
-             0x1c, 0x00, 0x48, 0x50,
-             0x85, 0x5d, 0x82, 0x51,
-             0x40, 0x45, 0xfe, 0x15,
-             0xdd, 0x93, 0xe0, 0xb8,
-             0xf8, 0x7c, 0x04, 0x0c,
-             0x60, 0x18, 0x02, 0x65,
-             0x8e, 0x35, 0xa3, 0x2b,
-             0xe0, 0x4c, 0x02, 0x55,
-             0x94, 0x65, 0x81, 0x5d,
-             0x08, 0x04, 0x06, 0xc4,
-             0x0c, 0x25, 0xe0, 0x88,
-             0x88, 0x63, 0x7c, 0x10,
-             0x6c, 0x04, 0x0e, 0x00,
-             0x80, 0x4b, 0x83, 0x81,
-             0xe0, 0x88, 0x06, 0x24,
-             0xfc, 0x0c, 0x18, 0x35,
-             0x86, 0xab, 0x03, 0xf5,
-             0xf8, 0x04, 0x0c, 0x95,
-             0x18, 0x95, 0xc4, 0x97,
-             0x95, 0x9d, 0xfc, 0x24,
-             0x87, 0x9d, 0x82, 0xa5,
-             0x02, 0xa5, 0x82, 0x65,
-             0x16, 0xa4, 0xe0, 0xb4,
-             0xf7, 0xb7, 0xe1, 0x7c,
-             0x8e, 0xbb, 0x16, 0xa3,
-             0x94, 0x9d, 0x8b, 0xa7,
-             0xa3, 0x8b, 0x80, 0x95,
-             0x88, 0xbb, 0x82, 0x75,
-             0x0c, 0x60, 0x02, 0x81,
-             0x0e, 0x70, 0xec, 0x10,
-             0x92, 0xab, 0x6c, 0x04,
-             0x8a, 0x8d, 0x96, 0x4b,
-             0x98, 0x54, 0xf8, 0x45,
-             0x18, 0x55, 0xc4, 0x57,
-             0x81, 0xc5, 0xfc, 0x14,
-             0x04, 0x04, 0x06, 0x34,
-             0x0c, 0x25, 0xe0, 0x88,
-             0x08, 0x24, 0xfc, 0x08,
-             0x06, 0x55, 0xe0, 0x88,
-             0x80, 0x4b, 0x7c, 0x10,
-             0x02, 0xc5, 0x8a, 0x3b,
-             0xc4, 0x27, 0x60, 0x20,
-             0xe3, 0x40, 0x02, 0x19,
-             0xfc, 0x08, 0x18, 0x25,
-             0xe6, 0x86, 0x46, 0x3a,
-             0xe6, 0x86, 0x42, 0x5a,
-             0x86, 0x53, 0x04, 0x21,
-             0x82, 0x23, 0x85, 0x27,
-             0x48, 0x00, 0x85, 0x5d,
-             0x88, 0x0b, 0xdc, 0x00,
-             0xf0, 0x7c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xf8, 0x7c, 0x04, 0x0c,
-             0xec, 0x80, 0x1e, 0xf0,
-             0xe0, 0x84, 0x00, 0x15,
-             0xb0, 0xf5, 0xa1, 0x1d,
-             0x60, 0x1c, 0x00, 0x25,
-             0xe0, 0x84, 0x12, 0x14,
-             0x12, 0x73, 0x84, 0x93,
-             0xa1, 0x7d, 0xe0, 0x30,
-             0x00, 0x45, 0xae, 0xd5,
-             0x87, 0x51, 0x60, 0xa0,
-             0xe0, 0x60, 0x12, 0x33,
-             0xe6, 0x96, 0x50, 0x4a,
-             0xac, 0xa5, 0x91, 0x3d,
-             0xac, 0x75, 0xa1, 0x3d,
-             0xac, 0x25, 0x91, 0x7d,
-             0x0c, 0x70, 0x09, 0x2e,
-             0x00, 0x45, 0xe4, 0x0c,
-             0x00, 0xa5, 0xe0, 0xb4,
-             0xa0, 0x41, 0xe0, 0xd4,
-             0x61, 0x7c, 0x0a, 0x44,
-             0xfa, 0x80, 0x04, 0xa4,
-             0xf7, 0x57, 0x0f, 0x2e,
-             0x04, 0xa4, 0x0a, 0x43,
-             0x0b, 0x47, 0xe1, 0xa0,
-             0x0d, 0x4e, 0xe1, 0xa7,
-             0xe0, 0x88, 0x08, 0x64,
-             0x60, 0x18, 0x00, 0x55,
-             0xfa, 0x80, 0x16, 0x24,
-             0xfe, 0x2e, 0xfc, 0xae,
-             0x54, 0x52, 0x0b, 0x5e,
-             0x01, 0x51, 0xf0, 0x90,
-             0x81, 0xc5, 0x81, 0x41,
-             0x82, 0x61, 0x69, 0x24,
-             0xe0, 0x20, 0x00, 0xc5,
-             0x18, 0x25, 0xc4, 0x27,
-             0x84, 0x21, 0xfc, 0x08,
-             0x48, 0x22, 0x85, 0x27,
-             0x86, 0x6d, 0xfa, 0x10,
-             0x0f, 0xc4, 0xfc, 0x85,
-             0x12, 0x23, 0xa0, 0x1d,
-             0x8e, 0xc3, 0xc0, 0x2c,
-             0xf0, 0xac, 0x4e, 0xc2,
-             0x5b, 0x1c, 0x4e, 0x22,
-             0x9c, 0xf5, 0xa3, 0xcd,
-             0x89, 0x2d, 0x8d, 0x24,
-             0x04, 0xb0, 0x9c, 0x85,
-             0xfa, 0x2d, 0xec, 0x04,
-             0x91, 0x7d, 0x9c, 0x15,
-             0x0d, 0x24, 0x9a, 0xc5,
-             0xe1, 0x84, 0x06, 0xb4,
-             0x0c, 0xc0, 0x0b, 0xa4,
-             0x3e, 0x1e, 0xe4, 0x04,
-             0xe0, 0x88, 0x02, 0x64,
-             0xa8, 0x23, 0x0f, 0x1e,
-             0x82, 0xa3, 0x44, 0x27,
-             0x81, 0x91, 0x26, 0x23,
-             0x60, 0xae, 0x46, 0x2a,
-             0xe0, 0x88, 0x04, 0x44,
-             0x8c, 0x8b, 0x01, 0xb1,
-             0x03, 0x15, 0xa6, 0xcb,
-             0x69, 0x24, 0xa4, 0xc3,
-             0x82, 0x14, 0x82, 0x81,
-             0x02, 0x15, 0xc4, 0x27,
-             0xc4, 0x17, 0xfc, 0x08,
-             0xa6, 0xc3, 0x18, 0x13,
-             0x60, 0x00, 0x04, 0x12,
-             0xe8, 0x00, 0x02, 0x12,
-             0xa2, 0x93, 0x04, 0xb3,
-             0xfc, 0x05, 0x8e, 0x8d,
-             0x18, 0x90, 0x0b, 0x84,
-             0x0f, 0x14, 0xe4, 0x08,
-             0xe4, 0x08, 0x06, 0xb0,
-             0x03, 0x25, 0x89, 0x94,
-             0x61, 0x14, 0x82, 0x83,
-             0xc0, 0x24, 0x82, 0x61,
-             0x04, 0x15, 0xc4, 0x17,
-             0x00, 0x25, 0xfc, 0x04,
-             0x44, 0x2a, 0xe0, 0x24,
-             0x8a, 0x13, 0x66, 0x86,
-             0xe5, 0x00, 0x04, 0x20,
-             0x4a, 0x12, 0xcf, 0x27,
-             0x8e, 0x6d, 0xf0, 0x88,
-             0xfe, 0x14, 0xfa, 0xe5,
-             0xf4, 0x20, 0x02, 0x8a,
-             0x0c, 0x34, 0x88, 0xd5,
-             0x85, 0xc7, 0x61, 0x08,
-             0xf1, 0xb0, 0x46, 0x62,
-             0x86, 0xe5, 0xa0, 0x3d,
-             0x60, 0xd0, 0x00, 0x05,
-             0x7c, 0x24, 0x8c, 0xc3,
-             0x42, 0xca, 0x8a, 0xc3,
-             0xd1, 0x07, 0xf0, 0x0a,
-             0xfa, 0x80, 0x00, 0x04,
-             0xe6, 0x92, 0x40, 0x0a,
-             0xe6, 0x8a, 0x42, 0x1a,
-             0x05, 0x07, 0x84, 0x01,
-             0xe6, 0x00, 0x02, 0x10,
-             0x91, 0x17, 0x06, 0x03,
-             0x82, 0x0d, 0x3e, 0x04,
-             0xd0, 0xa4, 0x40, 0x02,
-             0xc1, 0xe0, 0x00, 0x19,
-             0xc4, 0x04, 0x02, 0x10,
-             0xc1, 0xe0, 0x40, 0x11,
-             0x0c, 0x0c, 0xc0, 0xf1,
-             0xdd, 0x93, 0xf0, 0x7c,
-             0xe1, 0x00, 0x00, 0x0c,
-             0xf8, 0x7c, 0x04, 0x0c,
-             0xec, 0x40, 0x1e, 0xf0,
-             0x60, 0xa8, 0x00, 0x15,
-             0x00, 0x75, 0x81, 0x41,
-             0x00, 0x25, 0xe0, 0xac,
-             0x00, 0xa5, 0xe0, 0xb0,
-             0xa3, 0x1d, 0x60, 0xa0,
-             0x88, 0x4e, 0x9c, 0x4e,
-             0x83, 0x13, 0x84, 0x35,
-             0x8d, 0xf3, 0x83, 0x33,
-             0x9c, 0xc4, 0x82, 0x54,
-             0xfc, 0x10, 0x0a, 0x55,
-             0x9c, 0x5e, 0x98, 0x53,
-             0x88, 0xc4, 0xc0, 0x54,
-             0x7c, 0x10, 0x0a, 0x55,
-             0x98, 0x53, 0x88, 0x41,
-             0x02, 0x54, 0x88, 0x5e,
-             0xf1, 0x84, 0x48, 0xa2,
-             0x18, 0x70, 0x23, 0x4d,
-             0x4c, 0x70, 0xe4, 0x10,
-             0x08, 0x55, 0xdc, 0x00,
-             0xdc, 0x00, 0x50, 0x50,
-             0x60, 0x88, 0x06, 0x44,
-             0x7c, 0x3e, 0x8e, 0x6b,
-             0xe0, 0x88, 0x16, 0x14,
-             0xfe, 0x0c, 0x0c, 0x95,
-             0x82, 0xa1, 0x7e, 0xae,
-             0xa2, 0xa3, 0x09, 0x13,
-             0x8a, 0xab, 0x3e, 0xae,
-             0x89, 0x73, 0x83, 0x33,
-             0x7c, 0x2c, 0x14, 0xa5,
-             0xcd, 0x84, 0x94, 0x3b,
-             0x14, 0x93, 0xb0, 0x93,
-             0xf1, 0x9e, 0x86, 0xab,
-             0xbe, 0xc4, 0xfc, 0x84,
-             0x02, 0x54, 0xfe, 0xa4,
-             0xc4, 0xc7, 0x8a, 0x83,
-             0x0e, 0xa0, 0x8e, 0xc3,
-             0x48, 0x9a, 0xec, 0x04,
-             0x00, 0xd8, 0xe0, 0x1c,
-             0x0e, 0x10, 0xa0, 0x00,
-             0x8f, 0x13, 0xec, 0x04,
-             0x87, 0x73, 0x83, 0x33,
-             0xe1, 0x74, 0xd9, 0x34,
-             0xae, 0x33, 0xd5, 0x94,
-             0xf1, 0x3e, 0x92, 0x33,
-             0x18, 0x20, 0x40, 0x54,
-             0x88, 0x75, 0xe4, 0x10,
-             0x60, 0x88, 0x0e, 0x44,
-             0x0c, 0x85, 0x84, 0x6b,
-             0x06, 0xa0, 0x7e, 0x1c,
-             0x09, 0x13, 0xe4, 0x04,
-             0xf1, 0x84, 0x48, 0x32,
-             0x06, 0x14, 0x07, 0x33,
-             0x30, 0xac, 0xe0, 0x88,
-             0x8a, 0x9b, 0x68, 0x00,
-             0x7c, 0x0c, 0x12, 0x95,
-             0xe9, 0xb4, 0x92, 0xab,
-             0x12, 0x83, 0xb6, 0x83,
-             0xf1, 0x8e, 0x94, 0x9b,
-             0x46, 0x52, 0x40, 0x54,
-             0xc4, 0x47, 0xf0, 0x9c,
-             0x20, 0x01, 0x00, 0xa8,
-             0x58, 0x22, 0x40, 0x00,
-             0x83, 0x05, 0xf0, 0x90,
-             0x8a, 0x3b, 0x04, 0x6b,
-             0xa0, 0x00, 0x00, 0xd8,
-             0xec, 0x04, 0x00, 0x10,
-             0x83, 0x33, 0x81, 0x13,
-             0xd9, 0x04, 0x87, 0x73,
-             0xd5, 0x24, 0xcd, 0x14,
-             0x84, 0x03, 0xa2, 0x03,
-             0xa0, 0xf1, 0xf1, 0x0e,
-             0xf0, 0x7c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xf8, 0x1c, 0x04, 0x0c,
-             0x60, 0xa0, 0x02, 0x35,
-             0x02, 0x25, 0x87, 0x41,
-             0x46, 0x3a, 0xe0, 0x50,
-             0x48, 0x22, 0xe6, 0x92,
-             0x06, 0x30, 0xf0, 0x80,
-             0x87, 0x4d, 0xec, 0x04,
-             0x02, 0x35, 0x8a, 0xa5,
-             0x08, 0x04, 0x60, 0x18,
-             0x83, 0xc1, 0xe0, 0x88,
-             0xfc, 0x10, 0x06, 0x55,
-             0xc4, 0x57, 0x86, 0x44,
-             0xfc, 0x14, 0x08, 0x55,
-             0x0c, 0x00, 0x83, 0xf5,
-             0x0e, 0x04, 0x64, 0x04,
-             0x06, 0x75, 0xe0, 0x88,
-             0x10, 0x64, 0x7c, 0x1c,
-             0x06, 0x85, 0xe0, 0x88,
-             0xc4, 0x77, 0xfc, 0x20,
-             0x7c, 0x1c, 0x08, 0x95,
-             0x08, 0x75, 0xc4, 0x87,
-             0x93, 0x7d, 0xfc, 0x20,
-             0x8b, 0x7d, 0x82, 0x05,
-             0x02, 0x85, 0x80, 0xc5,
-             0xca, 0x77, 0x60, 0xb4,
-             0x80, 0x95, 0x90, 0x7d,
-             0x80, 0x6b, 0x23, 0xcb,
-             0x02, 0xc1, 0x80, 0xb5,
-             0x84, 0xcd, 0x8c, 0x0b,
-             0x0c, 0x0c, 0xf8, 0x25,
-             0xdd, 0x93, 0xf0, 0x1c,
-             0x60, 0xa0, 0x00, 0x55,
-             0x00, 0x45, 0x81, 0x31,
-             0x02, 0x54, 0xe0, 0x18,
-             0x04, 0x54, 0x60, 0x88,
-             0x81, 0xc5, 0xe0, 0x8c,
-             0x4a, 0x42, 0x08, 0xcb,
-             0x71, 0x3e, 0xf0, 0x84,
-             0x94, 0x3e, 0x84, 0x43,
-             0x82, 0x31, 0x10, 0x3e,
-             0x60, 0xa0, 0x00, 0x55,
-             0x8b, 0x3d, 0x98, 0x4b,
-             0xdd, 0x93, 0xfc, 0x95,
-             0xf8, 0x7c, 0x04, 0x0c,
-             0xec, 0xa0, 0x1e, 0xf0,
-             0x81, 0x31, 0x2d, 0x0d,
-             0x04, 0x55, 0xac, 0x35,
-             0x04, 0x45, 0xe1, 0x04,
-             0x04, 0xa5, 0xe1, 0x08,
-             0x13, 0x5e, 0xe1, 0x0c,
-             0xf1, 0x94, 0x56, 0x12,
-             0x4a, 0x12, 0x11, 0x4e,
-             0x04, 0x95, 0xf1, 0x90,
-             0x40, 0x12, 0x61, 0x10,
-             0x04, 0x85, 0xf1, 0xa8,
-             0x58, 0x52, 0x61, 0x14,
-             0x04, 0x45, 0xf9, 0xac,
-             0x4c, 0xc2, 0x61, 0x18,
-             0x0f, 0x1e, 0xf9, 0x80,
-             0xf1, 0xa4, 0x4e, 0x12,
-             0x58, 0x12, 0x0d, 0x7e,
-             0x2c, 0x7f, 0xf1, 0xa0,
-             0xf1, 0x90, 0x48, 0x12,
-             0xb8, 0x7f, 0x0b, 0xce,
-             0xa1, 0x7d, 0xa8, 0x7f,
-             0x7c, 0x4e, 0xa2, 0x75,
-             0xe0, 0x88, 0x02, 0xb4,
-             0xc4, 0x57, 0x09, 0xae,
-             0xfe, 0x8e, 0xbe, 0x9e,
-             0xe0, 0x18, 0x04, 0x95,
-             0xe1, 0x1c, 0x04, 0x85,
-             0xe0, 0xb4, 0x04, 0xa5,
-             0xfc, 0x14, 0x12, 0x75,
-             0xfc, 0x04, 0x12, 0x15,
-             0xe0, 0x20, 0x04, 0x55,
-             0xc4, 0x17, 0xc4, 0x77,
-             0xfc, 0x04, 0x0a, 0x45,
-             0xfc, 0x1c, 0x0a, 0x15,
-             0xe1, 0x20, 0x04, 0x75,
-             0xe6, 0xa2, 0x50, 0x4a,
-             0xf1, 0x90, 0x48, 0x12,
-             0x66, 0x9e, 0x4e, 0x4a,
-             0x90, 0x7d, 0xb4, 0x83,
-             0x04, 0x45, 0x98, 0xe5,
-             0x0c, 0x04, 0x61, 0x24,
-             0x12, 0x35, 0xe0, 0x88,
-             0x93, 0x04, 0xfc, 0x18,
-             0x0a, 0x35, 0xc4, 0x37,
-             0x42, 0x32, 0xfc, 0x0c,
-             0x42, 0x1a, 0xf1, 0x84,
-             0x92, 0x4b, 0x66, 0x92,
-             0x8c, 0x25, 0x8e, 0x1d,
-             0xc4, 0xb7, 0x8d, 0xb4,
-             0xfc, 0x2c, 0x08, 0x05,
-             0x0a, 0x65, 0xc4, 0x07,
-             0x04, 0x05, 0xfc, 0x00,
-             0x46, 0x62, 0xe1, 0x28,
-             0x46, 0x3a, 0xf1, 0x8c,
-             0x91, 0x04, 0xe6, 0x82,
-             0x88, 0x25, 0x82, 0x3d,
-             0xc4, 0xa7, 0x8b, 0xa4,
-             0xfc, 0x28, 0x08, 0x05,
-             0x0a, 0x95, 0xc4, 0x07,
-             0x04, 0x05, 0xfc, 0x00,
-             0x42, 0x92, 0xe1, 0x2c,
-             0x42, 0x1a, 0xf1, 0x98,
-             0x89, 0x04, 0xe6, 0x82,
-             0x84, 0x25, 0x86, 0x1d,
-             0x04, 0x35, 0xfc, 0x04,
-             0xc4, 0x07, 0xe1, 0x30,
-             0xfc, 0x00, 0x08, 0x05,
-             0x0a, 0x05, 0xc4, 0x07,
-             0xb2, 0x03, 0xfc, 0x00,
-             0xe6, 0x8e, 0x40, 0x0a,
-             0x82, 0x0d, 0x7e, 0x04,
-             0x80, 0x04, 0x1e, 0x05,
-             0x88, 0x75, 0xa9, 0x0d,
-             0xe0, 0x74, 0x04, 0x15,
-             0xe0, 0x94, 0x42, 0x0a,
-             0x8f, 0xc4, 0x86, 0xc5,
-             0xaf, 0xcd, 0xa0, 0xc3,
-             0xc4, 0xc7, 0x86, 0x55,
-             0x18, 0x15, 0x88, 0xc3,
-             0x18, 0x25, 0xf8, 0x18,
-             0xf0, 0x34, 0xf8, 0x08,
-             0x0a, 0x15, 0xc4, 0x17,
-             0xc4, 0x27, 0x7c, 0x04,
-             0x7c, 0x08, 0x0a, 0x25,
-             0x0a, 0x35, 0xc4, 0x37,
-             0xa4, 0x13, 0xfc, 0x0c,
-             0x84, 0x1d, 0xa6, 0x23,
-             0x8c, 0x10, 0x00, 0x00,
-             0x0c, 0x0c, 0xd0, 0xf1,
-             0xdd, 0x93, 0xf0, 0x7c,
-             0x06, 0x0b, 0x80, 0x3b,
-             0x0c, 0x0c, 0xd0, 0xf1,
-             0xdd, 0x93, 0xf0, 0x7c,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x90, 0x1e, 0xf0,
-             0x82, 0x7b, 0x0b, 0x2e,
-             0x02, 0x40, 0x09, 0x0e,
-             0x00, 0x08, 0xe4, 0xc0,
-             0xe7, 0x00, 0x04, 0x40,
-             0x66, 0x40, 0x0a, 0x40,
-             0x01, 0xf5, 0x99, 0xc1,
-             0x42, 0x65, 0x81, 0x61,
-             0x18, 0xc0, 0x78, 0x30,
-             0xc5, 0x6e, 0xec, 0x04,
-             0x42, 0x65, 0xd5, 0x6c,
-             0x4a, 0x63, 0xe0, 0x2c,
-             0xc9, 0x66, 0xe0, 0x2c,
-             0xe0, 0x2c, 0x44, 0x61,
-             0xfc, 0x55, 0xa1, 0xcb,
-             0x60, 0x88, 0x02, 0x04,
-             0x7c, 0x0e, 0xc2, 0x07,
-             0xe7, 0x00, 0x00, 0x40,
-             0x00, 0x40, 0x3e, 0x0e,
-             0x7e, 0x1e, 0xe6, 0x40,
-             0xe4, 0xc0, 0x12, 0x30,
-             0x64, 0xc0, 0x14, 0x40,
-             0xe6, 0x40, 0x0c, 0x30,
-             0x81, 0x81, 0x11, 0x0e,
-             0x12, 0x05, 0x8d, 0x45,
-             0x99, 0x21, 0x78, 0x30,
-             0x7f, 0x58, 0x9c, 0x1a,
-             0x1c, 0x1a, 0xe8, 0x14,
-             0x7f, 0xfd, 0x57, 0xfe,
-             0x40, 0x02, 0xcf, 0xff,
-             0x99, 0x21, 0x7b, 0xac,
-             0xf8, 0x30, 0x54, 0x05,
-             0x7e, 0x98, 0xe5, 0x04,
-             0x69, 0x0e, 0xe8, 0x14,
-             0x8f, 0x9e, 0x99, 0x21,
-             0xe0, 0x2c, 0x12, 0x05,
-             0x7e, 0x18, 0x9c, 0x1a,
-             0x59, 0x3a, 0xe8, 0x14,
-             0xfb, 0xac, 0x40, 0x02,
-             0x99, 0x21, 0x1e, 0x1a,
-             0x54, 0x05, 0x8d, 0xae,
-             0x86, 0x0b, 0x60, 0x2c,
-             0xe8, 0x14, 0x7d, 0x68,
-             0x99, 0x21, 0x11, 0xb4,
-             0x0c, 0x03, 0xed, 0x0c,
-             0x9e, 0x1a, 0xe0, 0x5c,
-             0xe8, 0x14, 0x7e, 0xc8,
-             0x60, 0x2c, 0x0c, 0x03,
-             0x1e, 0x1a, 0x80, 0xab,
-             0x7e, 0x58, 0x99, 0x21,
-             0x0c, 0x03, 0xe8, 0x14,
-             0x80, 0x9b, 0x60, 0x8c,
-             0x99, 0x21, 0x1e, 0x1a,
-             0xe8, 0x14, 0x7d, 0xe8,
-             0x89, 0x34, 0xfc, 0x24,
-             0x42, 0x22, 0xfe, 0x44,
-             0xb4, 0x23, 0x71, 0xa4,
-             0x92, 0x23, 0x00, 0x13,
-             0x40, 0x2a, 0x8e, 0x38,
-             0x44, 0x1a, 0xe0, 0x92,
-             0x11, 0x44, 0xe0, 0x92,
-             0x02, 0x02, 0xa1, 0x3b,
-             0x92, 0x0b, 0x60, 0x00,
-             0x60, 0x00, 0x06, 0x22,
-             0xeb, 0xfc, 0x04, 0x12,
-             0x02, 0x32, 0x3e, 0x34,
-             0x00, 0x06, 0xeb, 0xfc,
-             0xa1, 0x9d, 0x40, 0x00,
-             0x9c, 0x00, 0x40, 0x90,
-             0x60, 0x30, 0x48, 0x03,
-             0x0c, 0x26, 0x90, 0x33,
-             0x46, 0x11, 0x82, 0x81,
-             0x8f, 0x94, 0xe0, 0x30,
-             0x91, 0xbe, 0x8d, 0xa4,
-             0x82, 0x08, 0x8b, 0x04,
-             0xe6, 0x55, 0x81, 0x8d,
-             0xc8, 0xf1, 0x01, 0x01,
-             0xf2, 0x7c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xe0, 0x84, 0x00, 0x44,
-             0x7c, 0x00, 0x0a, 0x03,
-             0xf0, 0x80, 0x58, 0x52,
-             0xe0, 0x90, 0x18, 0xc3,
-             0xfd, 0x01, 0x20, 0xc3,
-             0x80, 0xcd, 0x3c, 0x04,
-             0x97, 0x80, 0x18, 0xc4,
-             0x44, 0x04, 0x18, 0xc0,
-             0x86, 0x15, 0xa3, 0x1d,
-             0xe6, 0x8a, 0x44, 0xca,
-             0xe5, 0x0e, 0x58, 0x2a,
-             0x65, 0x8e, 0x44, 0x2a,
-             0x18, 0xc0, 0x81, 0x31,
-             0xc1, 0x00, 0x64, 0x01,
-             0x72, 0x8c, 0x44, 0x22,
-             0xde, 0x27, 0xe3, 0xc7,
-             0x02, 0xcd, 0xa4, 0xcf,
-             0x80, 0xf5, 0x93, 0x11,
-             0x0a, 0x29, 0x88, 0x53,
-             0xe2, 0x2d, 0xe1, 0xe0,
-             0x8b, 0x11, 0x80, 0x55,
-             0x40, 0x11, 0x88, 0x03,
-             0xdd, 0x93, 0xe3, 0x90,
-             0x18, 0x24, 0x42, 0x5a,
-             0x98, 0x33, 0xe0, 0x88,
-             0xe0, 0x30, 0x06, 0x35,
-             0xc3, 0x5d, 0xc6, 0x57,
-             0x80, 0x00, 0x0a, 0x06,
-             0xd1, 0x94, 0x4a, 0x12,
-             0x82, 0x15, 0xcb, 0x3d,
-             0xe0, 0x10, 0x00, 0x0b,
-             0x82, 0x03, 0xc6, 0x07,
-             0x5c, 0x08, 0xc0, 0x3d,
-             0x04, 0x43, 0x9a, 0x00,
-             0x48, 0x01, 0x85, 0x01,
-             0xdd, 0x93, 0xe3, 0x90,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0xd0, 0x1e, 0xf0,
-             0x81, 0xc1, 0x0b, 0x1e,
-             0x91, 0x4e, 0xad, 0x14,
-             0x89, 0x1e, 0xb3, 0x44,
-             0x13, 0x5e, 0xab, 0x14,
-             0x8f, 0x3e, 0x80, 0x5b,
-             0xa9, 0x14, 0x97, 0x1e,
-             0x99, 0x21, 0x0d, 0x2e,
-             0x7e, 0x1e, 0xb1, 0x34,
-             0xe7, 0x90, 0x02, 0x40,
-             0x81, 0x45, 0xaf, 0x04,
-             0x04, 0x20, 0x45, 0xc6,
-             0xa1, 0x2b, 0xec, 0x04,
-             0x04, 0x00, 0xfe, 0x95,
-             0x4f, 0x06, 0x65, 0x80,
-             0x19, 0x06, 0xe0, 0x00,
-             0x81, 0xa1, 0x60, 0x08,
-             0x06, 0x05, 0x8d, 0x05,
-             0x00, 0x0a, 0xfc, 0x1c,
-             0xc7, 0xff, 0x63, 0xfd,
-             0x4c, 0x42, 0x94, 0xc5,
-             0x8d, 0x01, 0x70, 0xa8,
-             0xe3, 0x90, 0x4c, 0x01,
-             0xa1, 0x0b, 0x94, 0x0a,
-             0x88, 0x14, 0x80, 0xe5,
-             0x00, 0x86, 0xc1, 0x1d,
-             0x4c, 0x01, 0xc0, 0x00,
-             0x96, 0x0a, 0xc3, 0x90,
-             0x82, 0x65, 0xa1, 0x0b,
-             0x70, 0x9c, 0x42, 0x42,
-             0x02, 0x15, 0xce, 0x07,
-             0xc0, 0x1d, 0xe0, 0x30,
-             0xc0, 0x00, 0x00, 0x36,
-             0xc3, 0x90, 0x4c, 0x01,
-             0xd4, 0x0a, 0x99, 0x2e,
-             0x82, 0x05, 0xa1, 0x0b,
-             0xfc, 0x30, 0x08, 0x1b,
-             0x00, 0x36, 0xc0, 0x1d,
-             0x4c, 0x01, 0xc0, 0x00,
-             0x15, 0x6e, 0xc3, 0x90,
-             0x11, 0x14, 0x8a, 0x0b,
-             0x08, 0xbb, 0x94, 0x2b,
-             0x06, 0x9b, 0x8a, 0x6b,
-             0x78, 0xd8, 0x98, 0x8b,
-             0x13, 0x04, 0xef, 0xfc,
-             0x19, 0x24, 0x90, 0xcb,
-             0x0c, 0x5b, 0x92, 0x3b,
-             0x00, 0x09, 0x96, 0x4b,
-             0x00, 0x0a, 0xe0, 0x34,
-             0x86, 0x65, 0xe3, 0xfc,
-             0x00, 0x09, 0x95, 0x04,
-             0x00, 0x00, 0xe3, 0x90,
-             0x01, 0x0a, 0xec, 0x14,
-             0x84, 0x75, 0xf4, 0x04,
-             0x7c, 0x4e, 0x89, 0x04,
-             0x8b, 0x14, 0x94, 0x4b,
-             0xfe, 0x04, 0xbe, 0x0e,
-             0x8f, 0x34, 0x8d, 0x24,
-             0x8a, 0x0b, 0x3c, 0x0e,
-             0x41, 0x58, 0x93, 0x54,
-             0x19, 0x24, 0xe8, 0x00,
-             0x12, 0x3b, 0x90, 0xcb,
-             0x96, 0x4b, 0x8c, 0x5b,
-             0x88, 0x21, 0x02, 0xa1,
-             0x84, 0xc1, 0x08, 0x71,
-             0x82, 0x08, 0x97, 0x04,
-             0xe6, 0xd5, 0x81, 0xad,
-             0xe8, 0xf1, 0x01, 0x01,
-             0xf2, 0x7c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x70, 0x1e, 0xf0,
-             0x8a, 0x9b, 0x00, 0xab,
-             0x60, 0x14, 0x14, 0x03,
-             0xa1, 0xb4, 0x82, 0x8b,
-             0x0d, 0x0e, 0x9f, 0x54,
-             0x8e, 0xf5, 0xa3, 0x0d,
-             0x60, 0x30, 0x12, 0x09,
-             0xe0, 0x84, 0x0c, 0x44,
-             0x42, 0xb2, 0x15, 0xc1,
-             0x16, 0x63, 0xf0, 0x90,
-             0x1d, 0x04, 0x81, 0x71,
-             0x18, 0x46, 0xa1, 0x0b,
-             0x42, 0xc1, 0xc0, 0x00,
-             0x18, 0x60, 0x63, 0x90,
-             0x0b, 0x8e, 0xe6, 0xa0,
-             0xe5, 0xe0, 0x0c, 0x00,
-             0xfe, 0xae, 0x89, 0x5e,
-             0xbe, 0x3e, 0xfc, 0xbe,
-             0xb0, 0x02, 0x83, 0xe5,
-             0x0d, 0x14, 0x98, 0x12,
-             0x00, 0x04, 0xa2, 0x03,
-             0x82, 0x0d, 0xf0, 0x80,
-             0x14, 0x13, 0x84, 0x95,
-             0x90, 0x0b, 0x60, 0x20,
-             0x92, 0xbb, 0x3c, 0xbe,
-             0x84, 0x9b, 0x08, 0x8b,
-             0x6f, 0xfc, 0x6f, 0x48,
-             0x14, 0xcb, 0x98, 0xab,
-             0x16, 0x9b, 0x92, 0x2b,
-             0xfc, 0xb4, 0x90, 0x4b,
-             0xbe, 0x34, 0x89, 0x54,
-             0x8b, 0x84, 0xfe, 0xa4,
-             0x84, 0x61, 0x02, 0x71,
-             0xe0, 0x30, 0x12, 0x09,
-             0xf8, 0x15, 0x81, 0x7d,
-             0x0c, 0x0c, 0xb8, 0xf1,
-             0xdd, 0x93, 0xf2, 0x7c,
-             0x60, 0x20, 0x14, 0x13,
-             0xbc, 0xbe, 0x90, 0x0b,
-             0xef, 0xfc, 0x6d, 0xa8,
-             0x0c, 0x0c, 0xb8, 0xf1,
-             0xdd, 0x93, 0xf2, 0x7c,
-             0xfe, 0x7c, 0x04, 0x0c,
-             0xec, 0x60, 0x1e, 0xf0,
-             0x82, 0x9b, 0x00, 0xab,
-             0x60, 0x94, 0x00, 0x34,
-             0xe1, 0x84, 0x02, 0xa4,
-             0x82, 0x03, 0x25, 0xc4,
-             0x60, 0x2a, 0x40, 0x0a,
-             0x29, 0x84, 0xa1, 0x71,
-             0x42, 0x02, 0x81, 0x61,
-             0x40, 0xc2, 0x7b, 0xb0,
-             0xa2, 0x73, 0xfa, 0x80,
-             0xf3, 0x98, 0x42, 0x62,
-             0x40, 0x12, 0x80, 0x73,
-             0xcb, 0x77, 0x72, 0x98,
-             0xe0, 0xec, 0x02, 0x04,
-             0x0e, 0x04, 0x2e, 0x1f,
-             0x0b, 0x1e, 0xe1, 0x94,
-             0xfa, 0x90, 0x40, 0x22,
-             0x44, 0x42, 0x2e, 0x1f,
-             0x21, 0x1b, 0xfb, 0x88,
-             0xef, 0xfc, 0x43, 0xf6,
-             0xa4, 0x03, 0x20, 0x1c,
-             0x73, 0x98, 0x42, 0x62,
-             0x80, 0x08, 0x4c, 0x96,
-             0x80, 0x00, 0x10, 0x18,
-             0x48, 0xaa, 0x9f, 0x24,
-             0x89, 0x7e, 0xe6, 0xaa,
-             0x06, 0x44, 0x06, 0x23,
-             0x3e, 0x5e, 0xe1, 0x84,
-             0x06, 0x23, 0xca, 0x27,
-             0x44, 0x2a, 0x82, 0x3b,
-             0x84, 0xc3, 0xe0, 0x12,
-             0xf2, 0x98, 0x44, 0x62,
-             0x4e, 0x22, 0xa0, 0xc1,
-             0xcb, 0xc7, 0x72, 0x98,
-             0x60, 0xec, 0x16, 0x74,
-             0x38, 0xbf, 0xcb, 0x77,
-             0x7f, 0xfd, 0x45, 0xfe,
-             0x56, 0xca, 0xc0, 0x3f,
-             0x80, 0x2b, 0x64, 0x08,
-             0xe0, 0x00, 0x0e, 0x1a,
-             0xe1, 0x80, 0x42, 0x0a,
-             0x1f, 0xfd, 0x57, 0xfe,
-             0x0e, 0x06, 0x40, 0x3f,
-             0x42, 0x18, 0xc0, 0x00,
-             0x04, 0x04, 0xef, 0xd8,
-             0xd0, 0x17, 0x61, 0xe0,
-             0x45, 0xfe, 0x24, 0x1f,
-             0xc0, 0x3f, 0x7f, 0xfd,
-             0xff, 0xa1, 0x50, 0x07,
-             0x42, 0xca, 0x7c, 0x9e,
-             0x7e, 0x8e, 0xe4, 0x08,
-             0xe0, 0x08, 0x42, 0x1a,
-             0x40, 0x6a, 0x0b, 0x94,
-             0x09, 0x84, 0xe0, 0x28,
-             0xe5, 0x80, 0x42, 0x0a,
-             0xe1, 0x88, 0x42, 0x1a,
-             0x6d, 0x80, 0x42, 0x0a,
-             0x41, 0xfe, 0x92, 0x2b,
-             0x43, 0xfe, 0x5f, 0xfc,
-             0xc0, 0x3f, 0x1f, 0xfc,
-             0x6f, 0xd4, 0x76, 0xa8,
-             0x12, 0x2b, 0x90, 0x3b,
-             0x76, 0x58, 0x90, 0x3b,
-             0x02, 0x3b, 0xef, 0xd4,
-             0x23, 0xa4, 0x80, 0x2b,
-             0xe0, 0x28, 0x44, 0x6a,
-             0x06, 0xca, 0x21, 0x84,
-             0x1d, 0x94, 0xe5, 0xfc,
-             0xe1, 0xfc, 0x06, 0x1a,
-             0x65, 0x80, 0x42, 0x0a,
-             0x42, 0x1a, 0x96, 0x0b,
-             0x8e, 0x1b, 0x61, 0x88,
-             0xed, 0x80, 0x42, 0x0a,
-             0x5f, 0xfc, 0x45, 0xfe,
-             0xc0, 0x04, 0x47, 0xf6,
-             0xef, 0xd4, 0x7e, 0x28,
-             0x47, 0xfe, 0x3e, 0x24,
-             0xc0, 0x3f, 0x7f, 0xfd,
-             0x89, 0xb4, 0xa7, 0x74,
-             0x44, 0x62, 0x84, 0x93,
-             0x7e, 0x84, 0xf2, 0x98,
-             0x44, 0x22, 0x90, 0x93,
-             0x7c, 0x94, 0xf2, 0x98,
-             0x44, 0x22, 0x92, 0xa3,
-             0x54, 0xca, 0x72, 0x98,
-             0x04, 0x1a, 0xe4, 0x0c,
-             0x42, 0x0a, 0xe0, 0x00,
-             0x04, 0x06, 0xe1, 0x80,
-             0x55, 0xfe, 0x40, 0x00,
-             0xc0, 0x3f, 0x1f, 0xfc,
-             0x61, 0xe0, 0x06, 0xa4,
-             0x50, 0xa7, 0xd0, 0x27,
-             0x14, 0x03, 0xa6, 0x2f,
-             0x42, 0x12, 0xff, 0xa1,
-             0x45, 0xfe, 0x72, 0x88,
-             0xdf, 0xff, 0x7f, 0xfc,
-             0x64, 0x08, 0x42, 0xca,
-             0x42, 0x1a, 0x84, 0x71,
-             0xc7, 0x77, 0x60, 0x08,
-             0xe0, 0x28, 0x40, 0x6a,
-             0xe5, 0x80, 0x42, 0x0a,
-             0xe1, 0x88, 0x42, 0x1a,
-             0xed, 0x80, 0x42, 0x0a,
-             0x1f, 0xfd, 0x43, 0xfe,
-             0x41, 0xfe, 0x5f, 0xff,
-             0xa1, 0x1b, 0xdf, 0xfc,
-             0x0b, 0x24, 0x82, 0x45,
-             0x70, 0xb8, 0x96, 0x3b,
-             0x01, 0x31, 0xef, 0xd4,
-             0x79, 0xd8, 0x8e, 0x2b,
-             0x81, 0x95, 0xef, 0xd4,
-             0x8e, 0x2b, 0x01, 0x31,
-             0xef, 0xd4, 0x79, 0x88,
-             0x96, 0x3b, 0x0b, 0x24,
-             0xef, 0xd4, 0x6f, 0xe8,
-             0x43, 0xfe, 0xa1, 0x1d,
-             0x5f, 0xff, 0x1f, 0xfd,
-             0xdf, 0xfc, 0x41, 0xfe,
-             0x82, 0xe5, 0xa1, 0x1b,
-             0x96, 0x3b, 0x0b, 0x24,
-             0xef, 0xd4, 0x6f, 0x28,
-             0x60, 0xf8, 0x04, 0x14,
-             0x24, 0x0f, 0xc5, 0x07,
-             0x01, 0x31, 0xc5, 0x17,
-             0x77, 0xf8, 0x8e, 0x2b,
-             0x81, 0xe5, 0xef, 0xd4,
-             0x8e, 0x2b, 0x01, 0x31,
-             0xef, 0xd4, 0x77, 0xa8,
-             0x96, 0x3b, 0x0b, 0x24,
-             0xef, 0xd4, 0x6e, 0x08,
-             0x60, 0xf8, 0x04, 0x14,
-             0x24, 0x0f, 0xc5, 0x07,
-             0x21, 0x1d, 0xc5, 0x17,
-             0x7f, 0xfd, 0x45, 0xfe,
-             0x04, 0x14, 0xc7, 0xff,
-             0xff, 0x31, 0x01, 0x88,
-             0x01, 0x88, 0x00, 0x04,
-             0x80, 0xf8, 0x02, 0x14,
-             0x19, 0x84, 0x46, 0x02,
-             0x46, 0x5a, 0xa1, 0x2b,
-             0x40, 0x9a, 0x60, 0x28,
-             0x40, 0x0a, 0xe5, 0x26,
-             0x47, 0xfe, 0xe1, 0x84,
-             0x04, 0x06, 0x5f, 0xfc,
-             0x00, 0x33, 0xc0, 0x00,
-             0xe5, 0xa6, 0x40, 0x9a,
-             0x40, 0x22, 0x95, 0x3b,
-             0x47, 0xfe, 0x72, 0x80,
-             0xa1, 0x0b, 0x9f, 0xfc,
-             0xdf, 0xfc, 0x47, 0xfe,
-             0xf0, 0x0a, 0x40, 0x3a,
-             0x0c, 0x0b, 0xa0, 0x0c,
-             0x0c, 0x0c, 0xb0, 0xf1,
-             0xdd, 0x93, 0xf6, 0x7c,
-             0x81, 0x41, 0x01, 0xb5,
-             0x82, 0x41, 0x49, 0x54,
-             0x98, 0x5d, 0xc5, 0xc4,
-             0x80, 0x00, 0x0a, 0x06,
-             0xd1, 0xb0, 0x4a, 0x52,
-             0x81, 0x4d, 0xcd, 0x5e,
-             0x5d, 0x93, 0xfc, 0xd5,
-             0xc1, 0xc3, 0x81, 0x01,
-             0xf8, 0x7c, 0x04, 0xcc,
-             0x67, 0x90, 0x0a, 0x30,
-             0xe6, 0xa0, 0x18, 0x30,
-             0x81, 0x61, 0x0f, 0x4e,
-             0x48, 0x06, 0x08, 0x8b,
-             0x03, 0xa5, 0xe0, 0x24,
-             0x20, 0x66, 0x80, 0x9b,
-             0x18, 0xa3, 0xa5, 0x1b,
-             0x16, 0x0e, 0x40, 0x00,
-             0x14, 0x78, 0xd0, 0x00,
-             0x00, 0x01, 0x16, 0x06,
-             0x06, 0xa5, 0x90, 0x00,
-             0xf2, 0x7d, 0x00, 0x00,
-             0x48, 0x4a, 0x80, 0xb5,
-             0x54, 0xa2, 0xe4, 0x9c,
-             0x65, 0xae, 0x90, 0xac,
-             0x08, 0x31, 0x82, 0x61,
-             0x04, 0xc1, 0x82, 0x51,
-             0x8a, 0xa8, 0x82, 0x81,
-             0xf8, 0xd5, 0x95, 0x6d,
-             0x88, 0xd5, 0xe5, 0xad,
-             0x82, 0x41, 0x8f, 0x44,
-             0x88, 0x5b, 0x03, 0x31,
-             0x81, 0xc1, 0x03, 0xb5,
-             0x78, 0x04, 0x0a, 0x69,
-             0x94, 0x78, 0xa5, 0x1b,
-             0xe0, 0x88, 0x10, 0x64,
-             0x7c, 0x20, 0x00, 0x85,
-             0xe0, 0x88, 0x12, 0x74,
-             0xfc, 0x24, 0x00, 0x95,
-             0x93, 0x8d, 0x80, 0x95,
-             0x81, 0x75, 0x80, 0x95,
-             0x80, 0xa5, 0x92, 0x8d,
-             0x78, 0x04, 0x4a, 0x71,
-             0x94, 0x66, 0x83, 0xc1,
-             0x82, 0x31, 0x0a, 0xa8,
-             0x0c, 0xa4, 0x82, 0x51,
-             0x8d, 0x3d, 0xfa, 0x80,
-             0xa3, 0xcd, 0xf8, 0x95,
-             0x81, 0x01, 0xf6, 0xc5,
-             0xf0, 0x7c, 0x0c, 0xcc,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xed, 0x70, 0x1e, 0xf0,
-             0x99, 0x5e, 0xbf, 0x74,
-             0xa5, 0x3e, 0xa1, 0x4e,
-             0xa3, 0x1e, 0xab, 0x2e,
-             0x0e, 0x05, 0x9e, 0x14,
-             0x1e, 0x85, 0xe0, 0x20,
-             0x1e, 0x65, 0xe0, 0x84,
-             0xbd, 0x94, 0xe0, 0x80,
-             0x82, 0x0b, 0x1f, 0x0e,
-             0x7b, 0x58, 0xa9, 0x1e,
-             0x1b, 0x0e, 0xe8, 0x10,
-             0x0e, 0x05, 0x83, 0xc1,
-             0x4c, 0x05, 0xe0, 0x18,
-             0x0e, 0x09, 0xeb, 0x54,
-             0xdc, 0x34, 0xe0, 0x58,
-             0x00, 0x60, 0x2d, 0x0e,
-             0xc0, 0x0b, 0x65, 0x41,
-             0x9e, 0x48, 0xa7, 0x0e,
-             0xe0, 0x20, 0x0e, 0x1b,
-             0x5c, 0x58, 0x9c, 0x28,
-             0x4c, 0x35, 0xa9, 0xcf,
-             0x4c, 0x21, 0xeb, 0x50,
-             0xc0, 0x02, 0x6d, 0x69,
-             0x04, 0xc4, 0x1e, 0x04,
-             0x4c, 0x13, 0xe8, 0x94,
-             0xc0, 0x01, 0x66, 0xb1,
-             0x6d, 0x6d, 0x4c, 0x41,
-             0x4c, 0x51, 0xc0, 0x02,
-             0xc0, 0x02, 0x6d, 0x71,
-             0xe8, 0x10, 0x7e, 0x88,
-             0x60, 0x18, 0x0e, 0x05,
-             0x0e, 0x29, 0x80, 0xbb,
-             0x90, 0xab, 0x60, 0x4c,
-             0xf0, 0x14, 0x54, 0x05,
-             0xe0, 0x48, 0x0e, 0x09,
-             0x12, 0x19, 0x97, 0x9e,
-             0x81, 0x91, 0x60, 0x34,
-             0xe0, 0x90, 0x0e, 0x39,
-             0xe0, 0x94, 0x0e, 0x49,
-             0x78, 0x18, 0x54, 0x01,
-             0xe7, 0xf4, 0x03, 0x0a,
-             0x78, 0x10, 0x54, 0x31,
-             0x00, 0x10, 0x81, 0x01,
-             0x02, 0x70, 0x04, 0x04,
-             0x54, 0x41, 0xe4, 0x60,
-             0x90, 0x4b, 0x78, 0x0c,
-             0xf8, 0x14, 0x54, 0x21,
-             0xe0, 0x1c, 0x0e, 0x35,
-             0x50, 0x01, 0x9d, 0x1e,
-             0x99, 0x01, 0x60, 0x48,
-             0x50, 0x91, 0xa8, 0x06,
-             0x50, 0x91, 0xe0, 0x54,
-             0xa7, 0x04, 0xe0, 0x58,
-             0xad, 0x24, 0xa9, 0x14,
-             0xef, 0xe4, 0x6f, 0xe8,
-             0x8d, 0x51, 0x21, 0x0b,
-             0x2b, 0xc4, 0x90, 0xa5,
-             0xad, 0x14, 0x80, 0x9b,
-             0x64, 0x01, 0x00, 0x60,
-             0x04, 0x70, 0x40, 0x09,
-             0x01, 0x65, 0xe4, 0xa0,
-             0x49, 0x44, 0x82, 0x3b,
-             0xec, 0x04, 0x06, 0x30,
-             0xa1, 0x3b, 0xc1, 0x4e,
-             0x1e, 0x05, 0xfe, 0x75,
-             0xa1, 0x9b, 0x60, 0x88,
-             0x99, 0x0e, 0x96, 0xf5,
-             0xe0, 0xa4, 0x18, 0x09,
-             0x12, 0xe5, 0xa1, 0x0b,
-             0x84, 0x60, 0x16, 0x80,
-             0x64, 0x60, 0x16, 0x80,
-             0xe4, 0x80, 0x02, 0xc0,
-             0x64, 0xe0, 0x04, 0xc0,
-             0xe5, 0xf0, 0x06, 0xc0,
-             0x64, 0x01, 0x00, 0x60,
-             0x08, 0x60, 0x40, 0x09,
-             0xc0, 0x02, 0x65, 0x01,
-             0x66, 0x01, 0x0a, 0x60,
-             0x18, 0x60, 0x40, 0x04,
-             0xc0, 0x06, 0x67, 0x01,
-             0x8d, 0xae, 0x8f, 0xbe,
-             0x89, 0x5e, 0x8b, 0xce,
-             0xfc, 0x6e, 0xfe, 0x4e,
-             0xad, 0x04, 0xbe, 0x0e,
-             0x9f, 0x54, 0xa1, 0x44,
-             0xa3, 0x04, 0xbc, 0x0e,
-             0xef, 0xec, 0x69, 0x28,
-             0x80, 0x9b, 0x2d, 0x14,
-             0xa1, 0x9b, 0x2b, 0xc4,
-             0x05, 0xf5, 0x88, 0xc5,
-             0xab, 0xc4, 0x95, 0x51,
-             0x18, 0x09, 0xa5, 0x24,
-             0xa1, 0x0b, 0xe0, 0x70,
-             0x18, 0x09, 0xee, 0x25,
-             0xa3, 0x0b, 0xe0, 0x74,
-             0x1d, 0x04, 0x96, 0xf5,
-             0xe4, 0x40, 0x02, 0x20,
-             0x99, 0x24, 0xca, 0x54,
-             0x00, 0xc0, 0x00, 0x34,
-             0xfe, 0x6e, 0xe4, 0x40,
-             0xbe, 0x0e, 0xfc, 0x2e,
-             0x96, 0x1b, 0x3c, 0x1e,
-             0x98, 0xbb, 0x23, 0x04,
-             0xad, 0x44, 0x9b, 0x24,
-             0xef, 0xdc, 0x50, 0xa8,
-             0x8f, 0x51, 0x21, 0x0b,
-             0x00, 0x9b, 0x90, 0x85,
-             0xf3, 0xc5, 0x96, 0xcb,
-             0x66, 0xf0, 0x00, 0xc0,
-             0x7f, 0x38, 0x94, 0x2b,
-             0x96, 0x3b, 0x6f, 0xe4,
-             0xa1, 0x9b, 0x80, 0x9b,
-             0x97, 0x51, 0x82, 0x65,
-             0x00, 0x9e, 0x99, 0x04,
-             0xe5, 0x70, 0x1e, 0xf0,
-             0x92, 0x0b, 0x02, 0x5e,
-             0xf2, 0x7c, 0x0c, 0x0c,
-             0x21, 0x04, 0xdd, 0x93,
-             0xe6, 0x70, 0x02, 0x80,
-             0x64, 0x01, 0x04, 0x60,
-             0x94, 0x3b, 0x40, 0x09,
-             0x00, 0x59, 0x96, 0x4b,
-             0xab, 0x04, 0xe0, 0x2c,
-             0xa1, 0x1e, 0xfe, 0x1e,
-             0xa0, 0x01, 0x2d, 0x14,
-             0xbe, 0x2e, 0xfc, 0x6e,
-             0x3c, 0x1e, 0x95, 0x2e,
-             0x93, 0x0e, 0x8e, 0x1b,
-             0x43, 0x78, 0x9d, 0x24,
-             0x19, 0x04, 0xef, 0xe4,
-             0x21, 0x9b, 0x80, 0x9b,
-             0xf6, 0x95, 0x99, 0x51,
-             0x0e, 0x80, 0x1d, 0xbe,
-             0xc0, 0x02, 0x64, 0xd1,
-             0x94, 0x2b, 0x27, 0x04,
-             0x8e, 0x4b, 0x29, 0x14,
-             0x68, 0xb8, 0xa1, 0x34,
-             0x80, 0x9b, 0xef, 0xe4,
-             0x8a, 0xa5, 0xa1, 0x9b,
-             0x9d, 0x51, 0x79, 0xc5,
-             0x60, 0x70, 0x16, 0x09,
-             0xa1, 0x0b, 0x96, 0xcb,
-             0x0e, 0x09, 0xd4, 0xe5,
-             0x04, 0x60, 0x60, 0x58,
-             0xc0, 0x02, 0x65, 0x00,
-             0x66, 0x01, 0x06, 0x60,
-             0x08, 0x60, 0x40, 0x04,
-             0xc0, 0x06, 0x67, 0x01,
-             0x68, 0x10, 0x4e, 0xc8,
-             0x21, 0x0b, 0x8c, 0x1b,
-             0xd0, 0x95, 0x91, 0x51,
-             0xad, 0x14, 0xab, 0xc4,
-             0xe0, 0x70, 0x18, 0x09,
-             0xd0, 0x25, 0xa1, 0x0b,
-             0x04, 0x70, 0x02, 0x0b,
-             0x06, 0x60, 0xe4, 0xa0,
-             0x40, 0x09, 0x64, 0x01,
-             0x65, 0xf8, 0x8c, 0x1b,
-             0x2d, 0x14, 0xef, 0xfc,
-             0x2b, 0xc4, 0x80, 0x9b,
-             0xe9, 0x05, 0x93, 0x51,
-             0x04, 0x80, 0x29, 0x7e,
-             0xc0, 0x01, 0x66, 0x31,
-             0x95, 0xb4, 0x9f, 0x74,
-             0x27, 0x2e, 0xfc, 0x2e,
-             0xe4, 0x40, 0x00, 0x70,
-             0x02, 0x04, 0x3e, 0xbe,
-             0x77, 0x17, 0xe1, 0x7c,
-             0x1d, 0x34, 0x94, 0x2b,
-             0x2b, 0x04, 0x82, 0x03,
-             0xe1, 0x14, 0x0a, 0x04,
-             0x8e, 0x4b, 0x11, 0x5e,
-             0x02, 0x00, 0x2d, 0x04,
-             0xbc, 0x0e, 0xe7, 0x00,
-             0x47, 0x58, 0xa3, 0x04,
-             0x80, 0x9b, 0xe8, 0x04,
-             0x60, 0x35, 0xa1, 0x9b,
-             0xc0, 0x00, 0x0a, 0xf6,
-             0x94, 0x3b, 0x2b, 0x04,
-             0xad, 0x24, 0xa9, 0x14,
-             0xe3, 0x04, 0x00, 0x09,
-             0xa7, 0x14, 0x8f, 0x1e,
-             0x8d, 0x1e, 0x9d, 0x44,
-             0xa5, 0x14, 0x8b, 0x6e,
-             0xfe, 0x2e, 0x89, 0xbe,
-             0xb0, 0x11, 0x11, 0x24,
-             0xfc, 0x2e, 0x9b, 0x64,
-             0x8c, 0x5b, 0x3e, 0x7e,
-             0xa3, 0x04, 0xbc, 0x0e,
-             0x47, 0x18, 0x93, 0x24,
-             0x80, 0x9b, 0xef, 0xe4,
-             0x58, 0x75, 0xa1, 0x9b,
-             0xc0, 0x00, 0x0b, 0x46,
-             0x8c, 0x2b, 0x2b, 0x04,
-             0x94, 0x3b, 0x25, 0x14,
-             0x29, 0x74, 0xa7, 0x64,
-             0xe7, 0x10, 0x00, 0x00,
-             0x8c, 0x4b, 0xa0, 0x11,
-             0x6f, 0xe4, 0x54, 0x68,
-             0x00, 0x9b, 0x8e, 0x5b,
-             0xa1, 0x9b, 0x8c, 0xbb,
-             0x0b, 0xc6, 0x54, 0x15,
-             0x2b, 0x04, 0xc0, 0x00,
-             0x64, 0x91, 0x0c, 0x80,
-             0x25, 0x14, 0xc0, 0x03,
-             0x0e, 0x3b, 0x94, 0x2b,
-             0x00, 0x00, 0x8c, 0x4b,
-             0x6f, 0x98, 0xe7, 0x20,
-             0xb8, 0x11, 0x6f, 0xf8,
-             0xa1, 0x9b, 0x80, 0x9b,
-             0x0b, 0xd6, 0x4e, 0xd5,
-             0x25, 0x04, 0xc0, 0x00,
-             0x0e, 0x2b, 0x94, 0x1b,
-             0x4c, 0x38, 0x8c, 0x3b,
-             0x80, 0x9b, 0xe8, 0x04,
-             0x4c, 0x75, 0xa1, 0x9b,
-             0xc0, 0x00, 0x0b, 0xe6,
-             0xa5, 0x14, 0xab, 0x74,
-             0x17, 0x54, 0xa1, 0xc4,
-             0xe7, 0x30, 0x00, 0x70,
-             0xe0, 0x10, 0x02, 0x45,
-             0xe1, 0x88, 0x0e, 0x3b,
-             0x63, 0x20, 0x0e, 0x19,
-             0xe4, 0x40, 0x04, 0x50,
-             0x89, 0xbe, 0x8b, 0x6e,
-             0x9d, 0xc4, 0xfe, 0xce,
-             0xbe, 0xae, 0xfc, 0xce,
-             0x9b, 0x24, 0xbc, 0x2e,
-             0xef, 0xf8, 0x7b, 0x88,
-             0xa1, 0x9b, 0x80, 0x9b,
-             0x0b, 0xf6, 0x44, 0xd5,
-             0x0e, 0x19, 0xc0, 0x00,
-             0x08, 0x80, 0x63, 0x80,
-             0xc0, 0x04, 0x64, 0x50,
-             0x94, 0x2b, 0x23, 0x04,
-             0x6f, 0xfc, 0x5d, 0x48,
-             0x00, 0x9b, 0x8c, 0x3b,
-             0xe0, 0x00, 0x4a, 0x06,
-             0xc1, 0xc3, 0xe1, 0x65,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x30, 0x1e, 0xf0,
-             0x82, 0xab, 0x19, 0x14,
-             0x84, 0x9b, 0x15, 0x74,
-             0x86, 0x6b, 0x3e, 0x5e,
-             0x88, 0xbb, 0x7c, 0x1e,
-             0x60, 0x40, 0x12, 0x89,
-             0x47, 0xf8, 0x94, 0x1b,
-             0x8e, 0x3b, 0x68, 0x00,
-             0xe0, 0x44, 0x12, 0x09,
-             0x82, 0xe5, 0xa6, 0x0d,
-             0x86, 0x65, 0xa9, 0x0b,
-             0x8c, 0x25, 0xad, 0x0b,
-             0xaf, 0x0b, 0x7c, 0xb4,
-             0x10, 0x0b, 0x9a, 0x15,
-             0x4d, 0x98, 0x8e, 0x1b,
-             0xa3, 0x0d, 0xef, 0xdc,
-             0x8d, 0x15, 0x8c, 0x25,
-             0x8e, 0x45, 0xa5, 0x0b,
-             0xa7, 0x0b, 0x7c, 0xb4,
-             0x02, 0x60, 0x96, 0x95,
-             0x90, 0x0b, 0x64, 0x20,
-             0x6f, 0xdc, 0x7d, 0x48,
-             0xa3, 0x0d, 0x8e, 0x2b,
-             0x8b, 0x35, 0x82, 0x25,
-             0x8e, 0x1b, 0x10, 0x0b,
-             0xef, 0xdc, 0x4c, 0x48,
-             0xa3, 0x0d, 0x7c, 0xb4,
-             0x3e, 0x64, 0x92, 0x95,
-             0x8e, 0x1b, 0x90, 0x0b,
-             0x6f, 0xdc, 0x4d, 0x48,
-             0x10, 0x0b, 0x8c, 0x2b,
-             0x55, 0x58, 0x8e, 0x1b,
-             0x8c, 0x2b, 0x6f, 0xdc,
-             0x92, 0x1b, 0x14, 0x0b,
-             0x6f, 0xdc, 0x59, 0x08,
-             0x87, 0xb5, 0x8c, 0x2b,
-             0x64, 0x20, 0x02, 0x60,
-             0x7b, 0x38, 0x90, 0x0b,
-             0x8e, 0x2b, 0x6f, 0xdc,
-             0xa3, 0x0d, 0x7c, 0xb4,
-             0x3e, 0x64, 0x8c, 0x55,
-             0x8e, 0x1b, 0x90, 0x0b,
-             0x6f, 0xdc, 0x4b, 0xa8,
-             0x10, 0x0b, 0x8c, 0x2b,
-             0x56, 0x18, 0x8e, 0x1b,
-             0x8c, 0x2b, 0x6f, 0xdc,
-             0x0e, 0x09, 0x85, 0x65,
-             0xc0, 0x05, 0x6f, 0xd1,
-             0x84, 0xe5, 0xa1, 0x0b,
-             0x67, 0xfd, 0x0e, 0x15,
-             0x97, 0x04, 0xc0, 0x01,
-             0x6f, 0xc9, 0x0e, 0x29,
-             0x0e, 0x39, 0xc0, 0x05,
-             0xc0, 0x05, 0x6f, 0xcd,
-             0x60, 0x09, 0x0e, 0x4b,
-             0xc2, 0x1e, 0xc0, 0x03,
-             0xe0, 0x10, 0x56, 0x15,
-             0xe0, 0x58, 0x56, 0x21,
-             0xe0, 0x5c, 0x56, 0x31,
-             0xe0, 0x30, 0x56, 0x43,
-             0x6f, 0xdc, 0x46, 0xe8,
-             0x7c, 0xb4, 0x8e, 0x0b,
-             0x80, 0xb5, 0xa3, 0x0d,
-             0x8e, 0x0b, 0x3e, 0x14,
-             0xef, 0xdc, 0x4e, 0xe8,
-             0x98, 0xf1, 0x01, 0x01,
-             0x40, 0x16, 0x2c, 0x0e,
-             0x2e, 0x0e, 0xe0, 0x00,
-             0x0c, 0x0c, 0x81, 0x01,
-             0xdd, 0x93, 0xf2, 0x7c,
-             0xfa, 0x7c, 0x04, 0x4c,
-             0x84, 0x6b, 0x02, 0x8b,
-             0x86, 0x7b, 0x60, 0x28,
-             0xa0, 0x08, 0xa2, 0x18,
-             0xe8, 0x10, 0x56, 0x68,
-             0x60, 0x58, 0x10, 0x19,
-             0xa2, 0x04, 0x80, 0x2b,
-             0x5a, 0x78, 0xe0, 0x34,
-             0xc8, 0x17, 0x68, 0x10,
-             0xe0, 0x44, 0x0c, 0x19,
-             0x9c, 0x55, 0xa5, 0x1b,
-             0x4e, 0x05, 0xe0, 0x14,
-             0xc0, 0x01, 0x67, 0xdd,
-             0xe0, 0x18, 0x0c, 0x0b,
-             0x98, 0x34, 0x9a, 0x24,
-             0x67, 0xe1, 0x4e, 0x15,
-             0x0c, 0x19, 0xc0, 0x01,
-             0x4e, 0x03, 0xe0, 0x38,
-             0xc0, 0x02, 0x6f, 0xe1,
-             0xe0, 0x54, 0x0c, 0x09,
-             0x67, 0xe9, 0x4e, 0x25,
-             0x4e, 0x35, 0xc0, 0x01,
-             0xc0, 0x01, 0x67, 0xed,
-             0x6f, 0xc9, 0x4e, 0x11,
-             0xa1, 0x0b, 0x40, 0x05,
-             0x60, 0x3c, 0x0c, 0x19,
-             0x0c, 0x29, 0x81, 0x01,
-             0x0c, 0x39, 0xe0, 0x40,
-             0x4e, 0x11, 0xe0, 0x48,
-             0xc0, 0x05, 0x6f, 0xcd,
-             0x6f, 0xd1, 0x4e, 0x01,
-             0x4e, 0x21, 0xc0, 0x05,
-             0xc0, 0x05, 0x6f, 0xd5,
-             0x6f, 0xd9, 0x4e, 0x31,
-             0xb0, 0xa5, 0xc0, 0x05,
-             0x60, 0x51, 0x0c, 0x09,
-             0x02, 0x60, 0x40, 0x01,
-             0xc0, 0x03, 0x64, 0x91,
-             0xe0, 0x88, 0x04, 0x04,
-             0x7c, 0x08, 0x02, 0x35,
-             0xf0, 0x88, 0x48, 0x12,
-             0x4e, 0x35, 0x84, 0x63,
-             0x40, 0x01, 0x67, 0xf9,
-             0xe0, 0x84, 0x06, 0x04,
-             0x60, 0x60, 0x08, 0x45,
-             0x06, 0x5b, 0x82, 0x33,
-             0x80, 0x13, 0x61, 0x20,
-             0x68, 0x01, 0x4e, 0x45,
-             0x83, 0x41, 0x40, 0x01,
-             0x60, 0x09, 0x4e, 0x53,
-             0x0c, 0x25, 0xc0, 0x03,
-             0x06, 0x3b, 0xe1, 0xbc,
-             0x4e, 0x41, 0xe1, 0x50,
-             0xc0, 0x05, 0x6f, 0xd1,
-             0x67, 0xfd, 0x4e, 0x25,
-             0x4e, 0x33, 0xc0, 0x01,
-             0xc0, 0x03, 0x60, 0x0d,
-             0xe3, 0x00, 0x02, 0x09,
-             0x60, 0x21, 0x4e, 0x01,
-             0x02, 0x09, 0xc0, 0x06,
-             0x4e, 0x01, 0xe3, 0x30,
-             0xc0, 0x06, 0x60, 0x25,
-             0xe3, 0x60, 0x02, 0x09,
-             0x60, 0x29, 0x4e, 0x01,
-             0x02, 0x09, 0xc0, 0x06,
-             0x4e, 0x01, 0xe3, 0x90,
-             0xc0, 0x06, 0x60, 0x2d,
-             0x0c, 0x29, 0x91, 0x45,
-             0x06, 0x70, 0x60, 0x40,
-             0xe0, 0x14, 0xe4, 0x70,
-             0xe0, 0x10, 0x4e, 0x05,
-             0x08, 0x24, 0x1a, 0x04,
-             0x4e, 0x15, 0xe0, 0x88,
-             0x86, 0x43, 0x60, 0x14,
-             0x60, 0x3c, 0x0e, 0x59,
-             0xe0, 0x84, 0x10, 0x24,
-             0x8c, 0x0b, 0x10, 0x0e,
-             0x70, 0x15, 0x00, 0x15,
-             0x86, 0x83, 0x40, 0x02,
-             0x60, 0x54, 0x0c, 0xc9,
-             0x44, 0x5a, 0x84, 0x33,
-             0x48, 0x15, 0xe6, 0x8a,
-             0x00, 0x1b, 0xe1, 0x00,
-             0xc0, 0x04, 0x78, 0x11,
-             0x78, 0x19, 0x00, 0x49,
-             0x50, 0x13, 0xc0, 0x08,
-             0x42, 0x52, 0x64, 0x00,
-             0x46, 0x41, 0xfb, 0xb0,
-             0x58, 0x72, 0x6a, 0x00,
-             0x00, 0x49, 0xf0, 0x88,
-             0xc0, 0x08, 0x78, 0x15,
-             0xec, 0x00, 0x46, 0x11,
-             0xeb, 0x00, 0x46, 0x41,
-             0x78, 0x11, 0x00, 0x49,
-             0x46, 0x41, 0xc0, 0x08,
-             0x08, 0x24, 0x6d, 0x00,
-             0x00, 0x59, 0xe0, 0x84,
-             0x40, 0x08, 0x78, 0x09,
-             0x0e, 0x43, 0xc4, 0x27,
-             0x04, 0x70, 0x84, 0x73,
-             0x40, 0x07, 0x67, 0x71,
-             0x67, 0x71, 0x08, 0x40,
-             0x46, 0x51, 0xc0, 0x11,
-             0x06, 0xc0, 0x6e, 0x00,
-             0xc0, 0x13, 0x67, 0x70,
-             0x81, 0x51, 0x07, 0x65,
-             0x7c, 0x14, 0x00, 0xc9,
-             0x64, 0x90, 0x10, 0x60,
-             0x0e, 0xc4, 0xc0, 0x03,
-             0x10, 0x95, 0xe0, 0x88,
-             0x54, 0x82, 0x7c, 0x1c,
-             0x8c, 0x73, 0xf0, 0x9c,
-             0x78, 0x01, 0x44, 0x95,
-             0x12, 0xc4, 0x40, 0x02,
-             0x14, 0xa5, 0xe0, 0x84,
-             0x90, 0x93, 0x60, 0x60,
-             0x61, 0x20, 0x12, 0xbb,
-             0x44, 0xa5, 0x98, 0x83,
-             0x48, 0xb3, 0xe4, 0x00,
-             0xc0, 0x02, 0x78, 0x01,
-             0xe1, 0xbc, 0x0e, 0x75,
-             0xe1, 0x50, 0x12, 0x9b,
-             0x4e, 0x32, 0x49, 0x7e,
-             0x51, 0x9c, 0xf0, 0x94,
-             0x10, 0xc9, 0x82, 0x51,
-             0x9c, 0xc6, 0xe3, 0x00,
-             0xe3, 0x30, 0x10, 0xc9,
-             0xe4, 0x00, 0x4e, 0xc1,
-             0xe3, 0x60, 0x10, 0xc9,
-             0xe8, 0x00, 0x4e, 0xc1,
-             0xe3, 0x90, 0x10, 0xc9,
-             0xec, 0x00, 0x4e, 0xc1,
-             0xf2, 0x75, 0x83, 0x5d,
-             0xf2, 0x7c, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x90, 0x1e, 0xf0,
-             0x84, 0xbb, 0x0b, 0x1e,
-             0x80, 0xab, 0x2b, 0x14,
-             0x81, 0x81, 0x3c, 0x5e,
-             0x86, 0x6b, 0x3e, 0x4e,
-             0x8d, 0x1e, 0xae, 0x04,
-             0xaf, 0x74, 0xa5, 0x14,
-             0xfe, 0x1e, 0xa7, 0x94,
-             0x43, 0xb8, 0x8f, 0x8e,
-             0x16, 0x39, 0xe8, 0x10,
-             0x98, 0x1a, 0xe0, 0x94,
-             0xa5, 0x3b, 0x9a, 0x2a,
-             0xe0, 0x10, 0x52, 0x13,
-             0xe0, 0x14, 0x52, 0x23,
-             0x09, 0x0e, 0x8a, 0x55,
-             0x74, 0x01, 0x00, 0x0e,
-             0xbe, 0x7e, 0xc0, 0x07,
-             0x83, 0x01, 0x26, 0x0e,
-             0x85, 0x01, 0x7c, 0x0e,
-             0x2d, 0x64, 0xa1, 0x8c,
-             0xfa, 0x80, 0x02, 0x04,
-             0x94, 0x0b, 0x29, 0x74,
-             0x8d, 0x34, 0xfe, 0x24,
-             0xe8, 0x00, 0x4d, 0x28,
-             0x60, 0x94, 0x16, 0x19,
-             0x12, 0x2b, 0x94, 0x0b,
-             0x49, 0x98, 0x8c, 0x3b,
-             0x0b, 0x64, 0xe8, 0x00,
-             0x16, 0x29, 0x94, 0x0b,
-             0x8e, 0x4b, 0x60, 0x90,
-             0xe0, 0x94, 0x16, 0x19,
-             0x68, 0x00, 0x4e, 0x88,
-             0x8d, 0x14, 0x8c, 0x3b,
-             0x89, 0x04, 0xbe, 0x74,
-             0x8f, 0x05, 0xfc, 0x94,
-             0x16, 0x19, 0xa3, 0x34,
-             0xcc, 0x28, 0xe0, 0x90,
-             0x82, 0x95, 0xc5, 0x1d,
-             0xc5, 0x1d, 0xce, 0x28,
-             0x00, 0x14, 0x1e, 0x65,
-             0x80, 0x00, 0x12, 0x26,
-             0x00, 0x18, 0x1e, 0x15,
-             0x80, 0x00, 0x50, 0xc6,
-             0x09, 0x0e, 0x96, 0xe5,
-             0xf0, 0x84, 0x40, 0x32,
-             0x60, 0x20, 0x00, 0x19,
-             0xe4, 0x70, 0x04, 0xf0,
-             0xe1, 0x20, 0x00, 0x09,
-             0x60, 0x80, 0x5e, 0x11,
-             0xe4, 0x80, 0x02, 0xf0,
-             0x60, 0x84, 0x5e, 0x01,
-             0x59, 0x78, 0x8c, 0x0b,
-             0xa1, 0x0b, 0xe8, 0x00,
-             0x00, 0x8b, 0x80, 0xe5,
-             0x8b, 0x64, 0x87, 0x91,
-             0x89, 0x04, 0x8d, 0x14,
-             0x0f, 0x04, 0x89, 0x55,
-             0xe4, 0x70, 0x04, 0xf0,
-             0x60, 0x84, 0x02, 0x04,
-             0x0c, 0x13, 0xc4, 0x07,
-             0x02, 0x1b, 0x80, 0x63,
-             0x0c, 0x05, 0xe2, 0x48,
-             0x52, 0x13, 0xe0, 0x24,
-             0x02, 0xf0, 0x60, 0x28,
-             0xa6, 0x0e, 0xe4, 0x80,
-             0x57, 0xb8, 0xbe, 0x64,
-             0x8c, 0x0b, 0x68, 0x00,
-             0x8b, 0x11, 0x21, 0x0b,
-             0x88, 0xf5, 0xfc, 0x1e,
-             0x04, 0xf0, 0x0f, 0x04,
-             0xfe, 0x14, 0xe4, 0x70,
-             0x02, 0x15, 0xc4, 0x07,
-             0x8c, 0x03, 0x60, 0x10,
-             0xe0, 0x24, 0x00, 0x05,
-             0x02, 0xf0, 0x02, 0x03,
-             0xe6, 0x0e, 0xe4, 0x80,
-             0x56, 0x58, 0xbc, 0x64,
-             0x8c, 0x0b, 0x68, 0x00,
-             0x84, 0x75, 0xa1, 0x0b,
-             0x8c, 0x1b, 0x0f, 0x04,
-             0x04, 0xf0, 0x21, 0x64,
-             0xc2, 0x07, 0xe4, 0x70,
-             0x02, 0xf0, 0x02, 0x03,
-             0x00, 0x0b, 0xe4, 0x80,
-             0x52, 0x03, 0xe0, 0x18,
-             0x8c, 0x0b, 0x60, 0x3c,
-             0xe8, 0x00, 0x55, 0x28,
-             0x84, 0x65, 0xa1, 0x0b,
-             0x80, 0x8b, 0x0b, 0x64,
-             0x8b, 0x91, 0x0d, 0x14,
-             0x02, 0x1b, 0x89, 0x04,
-             0x40, 0x38, 0xe1, 0xa8,
-             0x4c, 0x03, 0xef, 0xe4,
-             0x90, 0x0b, 0x60, 0x18,
-             0xc8, 0xf1, 0x1c, 0x8e,
-             0x0c, 0x0c, 0x9e, 0x9e,
-             0xdd, 0x93, 0xf2, 0x7c,
-             0xbe, 0x7e, 0x8f, 0x04,
-             0x80, 0x63, 0xc2, 0x07,
-             0xe0, 0x18, 0x0c, 0x0b,
-             0xe0, 0x38, 0x52, 0x03,
-             0xe0, 0x94, 0x16, 0x09,
-             0xc1, 0xc3, 0xeb, 0xb5,
-             0xfa, 0x04, 0x04, 0x4c,
-             0x84, 0x3b, 0x06, 0x6b,
-             0x44, 0x06, 0x02, 0x7b,
-             0x0c, 0x0b, 0xe0, 0x00,
-             0x43, 0x58, 0x86, 0x1b,
-             0xa6, 0x7d, 0xef, 0xd4,
-             0xa9, 0x7b, 0x82, 0x25,
-             0xad, 0x7b, 0x80, 0xa5,
-             0xaf, 0x7b, 0x82, 0x25,
-             0x01, 0x85, 0x86, 0x95,
-             0xa5, 0x7b, 0x81, 0x01,
-             0xa7, 0x7b, 0x82, 0x85,
-             0x81, 0x01, 0x84, 0xd5,
-             0x4c, 0x03, 0xda, 0x0e,
-             0x02, 0x06, 0x60, 0x28,
-             0x4c, 0x13, 0xe1, 0x00,
-             0x81, 0xd5, 0xe0, 0x38,
-             0xda, 0x0e, 0x81, 0x01,
-             0xe0, 0x28, 0x4c, 0x03,
-             0x60, 0x30, 0x4c, 0x03,
-             0xe1, 0x00, 0x00, 0x06,
-             0xe0, 0x38, 0x4c, 0x03,
-             0xe0, 0x3c, 0x4c, 0x03,
-             0xf2, 0x04, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x0c, 0x04, 0x0c,
-             0x84, 0x7b, 0x06, 0x6b,
-             0x44, 0x46, 0x02, 0x8b,
-             0x0c, 0x0b, 0xe0, 0x0c,
-             0x40, 0x38, 0x8e, 0x1b,
-             0xad, 0x8b, 0xef, 0xd4,
-             0xe0, 0x0c, 0x10, 0x1a,
-             0xed, 0x80, 0x42, 0x0a,
-             0x80, 0x00, 0x00, 0x06,
-             0x80, 0x70, 0x4c, 0x01,
-             0xa5, 0x8b, 0x82, 0xe5,
-             0x01, 0x21, 0x82, 0xb5,
-             0xe4, 0x80, 0x00, 0x60,
-             0x60, 0x70, 0x4c, 0x21,
-             0xe4, 0xb0, 0x02, 0x70,
-             0x0c, 0x0c, 0x99, 0x21,
-             0x3e, 0xb8, 0xf2, 0x0c,
-             0x0c, 0x0c, 0xff, 0xd0,
-             0xdd, 0x93, 0xf2, 0x0c,
-             0xf8, 0x3c, 0x04, 0x4c,
-             0x8c, 0x35, 0xa5, 0x1b,
-             0x6f, 0xd1, 0x06, 0x09,
-             0x06, 0x19, 0xc0, 0x05,
-             0xc0, 0x05, 0x6f, 0xd9,
-             0x6f, 0xc9, 0x06, 0x29,
-             0x06, 0x59, 0xc0, 0x05,
-             0x40, 0x05, 0x6f, 0xcd,
-             0x48, 0x11, 0xa1, 0x0b,
-             0x48, 0x21, 0xe0, 0x34,
-             0x48, 0x51, 0xe0, 0x20,
-             0x48, 0x01, 0xe0, 0x24,
-             0x9a, 0xc5, 0xe0, 0x30,
-             0x67, 0xf9, 0x06, 0x05,
-             0x06, 0x1b, 0xc0, 0x01,
-             0xc0, 0x03, 0x60, 0x09,
-             0x60, 0x2d, 0x06, 0x29,
-             0x48, 0x05, 0xc0, 0x06,
-             0x48, 0x13, 0xe0, 0x10,
-             0x06, 0x05, 0xe0, 0xe0,
-             0xc0, 0x01, 0x68, 0x01,
-             0x60, 0x0d, 0x06, 0x1b,
-             0x48, 0x21, 0xc0, 0x03,
-             0x48, 0x05, 0xe2, 0x80,
-             0x48, 0x13, 0xe0, 0x40,
-             0x8b, 0x45, 0xe1, 0x10,
-             0x60, 0x3c, 0x06, 0x59,
-             0xf0, 0x88, 0x40, 0x32,
-             0x6e, 0x70, 0x00, 0x19,
-             0xe6, 0x80, 0x18, 0x40,
-             0x81, 0x71, 0x01, 0x61,
-             0xe0, 0x34, 0x48, 0x11,
-             0xea, 0x70, 0x00, 0x19,
-             0xe0, 0x20, 0x48, 0x11,
-             0xeb, 0x70, 0x00, 0x19,
-             0xe0, 0x24, 0x48, 0x11,
-             0xe6, 0x8a, 0x42, 0x5a,
-             0xec, 0x70, 0x00, 0x09,
-             0x60, 0x84, 0x04, 0x14,
-             0xe0, 0x88, 0x0a, 0x14,
-             0x10, 0x02, 0x86, 0x23,
-             0x00, 0x10, 0x6c, 0x30,
-             0xc0, 0x16, 0x67, 0x70,
-             0x67, 0x71, 0x02, 0x20,
-             0x04, 0x50, 0x40, 0x0f,
-             0xc0, 0x0b, 0x67, 0x71,
-             0x60, 0x30, 0x48, 0x81,
-             0xe5, 0x00, 0x0a, 0x40,
-             0x02, 0x9b, 0x85, 0x35,
-             0x50, 0x32, 0x7c, 0x18,
-             0x10, 0x85, 0xf0, 0x88,
-             0x40, 0x04, 0x78, 0x01,
-             0xf0, 0x98, 0x54, 0xc2,
-             0x78, 0x60, 0x54, 0x93,
-             0xf0, 0x98, 0x52, 0x12,
-             0x78, 0x30, 0x4a, 0x85,
-             0x06, 0x85, 0x84, 0x61,
-             0x88, 0x21, 0x7c, 0x08,
-             0xe4, 0x00, 0x12, 0x9b,
-             0x50, 0x32, 0x55, 0x8e,
-             0x54, 0x93, 0xf0, 0x9c,
-             0x52, 0xc2, 0x78, 0x30,
-             0x10, 0x89, 0xf0, 0x9c,
-             0x82, 0x71, 0x7c, 0x00,
-             0x08, 0x89, 0xa4, 0x86,
-             0x10, 0x84, 0xe0, 0x30,
-             0x91, 0x7d, 0xfa, 0x80,
-             0x0c, 0x4c, 0xf6, 0x75,
-             0xdd, 0x93, 0xf0, 0x3c,
-             0xf8, 0x8c, 0x04, 0x0c,
-             0x60, 0x38, 0x46, 0x11,
-             0x46, 0x21, 0x81, 0x51,
-             0x04, 0x30, 0x60, 0x3c,
-             0xc0, 0x01, 0x64, 0x70,
-             0x60, 0x18, 0x46, 0x53,
-             0x64, 0x70, 0x18, 0x30,
-             0x0c, 0x30, 0xc0, 0x02,
-             0x40, 0x02, 0x66, 0x71,
-             0xe0, 0x0c, 0x43, 0xf6,
-             0x81, 0x71, 0x03, 0x25,
-             0x79, 0x00, 0x44, 0x55,
-             0xf0, 0x9c, 0x50, 0x62,
-             0xf1, 0x5c, 0xc9, 0x5e,
-             0x63, 0x00, 0x50, 0x71,
-             0xa0, 0x56, 0x82, 0x71,
-             0xe1, 0x00, 0x50, 0x51,
-             0xe2, 0x00, 0x50, 0x51,
-             0xe4, 0x00, 0x50, 0x11,
-             0xe1, 0x00, 0x0e, 0x0a,
-             0x04, 0x30, 0xfa, 0xd5,
-             0x40, 0x16, 0x67, 0x71,
-             0xe0, 0x10, 0x18, 0x06,
-             0x49, 0x56, 0x81, 0x45,
-             0xec, 0x04, 0x18, 0xc0,
-             0xfe, 0x95, 0xa1, 0xcb,
-             0x67, 0xf1, 0x46, 0x55,
-             0x04, 0x06, 0x40, 0x01,
-             0x46, 0x55, 0xef, 0xf0,
-             0xc0, 0x01, 0x67, 0xed,
-             0x67, 0xe9, 0x46, 0x55,
-             0x46, 0x11, 0xc0, 0x01,
-             0x40, 0x05, 0x6f, 0xd9,
-             0x46, 0x23, 0x88, 0x1b,
-             0xc0, 0x02, 0x6f, 0xe9,
-             0x60, 0x2d, 0x46, 0x51,
-             0x0c, 0x0c, 0xc0, 0x06,
-             0x0f, 0xd8, 0xf0, 0x8c,
-             0xc1, 0xc3, 0xff, 0xd8,
-             0xf8, 0x1c, 0x04, 0x0c,
-             0xe0, 0x18, 0x00, 0x79,
-             0xe0, 0x28, 0x00, 0x39,
-             0xe0, 0x20, 0x00, 0xc9,
-             0x08, 0x70, 0x06, 0x68,
-             0x4a, 0x3a, 0xec, 0x04,
-             0x00, 0x49, 0xe6, 0x92,
-             0x00, 0x89, 0xe0, 0x14,
-             0x52, 0x52, 0x60, 0x1c,
-             0x00, 0x59, 0xf0, 0xb0,
-             0x81, 0x01, 0x60, 0x24,
-             0xd2, 0x6d, 0x04, 0x18,
-             0x40, 0xc6, 0x08, 0x0e,
-             0x8e, 0x55, 0xe0, 0x00,
-             0xec, 0x04, 0x12, 0x40,
-             0xe6, 0xa6, 0x52, 0x5a,
-             0xd2, 0x1d, 0x90, 0x93,
-             0xd9, 0x6d, 0x8c, 0x75,
-             0xd1, 0x1d, 0x8c, 0x35,
-             0xa1, 0x3b, 0x8a, 0xf5,
-             0xa1, 0x5b, 0x8a, 0xa5,
-             0x52, 0xc2, 0x8a, 0x65,
-             0x12, 0x8a, 0xf9, 0xa0,
-             0x88, 0xd5, 0xf0, 0x00,
-             0x88, 0x95, 0xf0, 0x7d,
-             0x88, 0x55, 0xf4, 0x4d,
-             0xec, 0x08, 0x12, 0x40,
-             0xf4, 0xf4, 0x13, 0x0a,
-             0xe5, 0x7d, 0x86, 0xb5,
-             0x4e, 0x32, 0x86, 0x75,
-             0xa2, 0x7f, 0xf9, 0x94,
-             0x0e, 0x8a, 0xac, 0x7f,
-             0x84, 0x95, 0xf0, 0x00,
-             0x4e, 0x1a, 0xb0, 0x13,
-             0xa1, 0x7b, 0xe1, 0x16,
-             0xb8, 0x63, 0x82, 0xf5,
-             0xe1, 0x0e, 0x58, 0x6a,
-             0x82, 0x55, 0xa1, 0xcb,
-             0xe0, 0x0e, 0x40, 0x6a,
-             0xe0, 0x16, 0x42, 0x1a,
-             0xe6, 0x92, 0x40, 0x0a,
-             0x08, 0x0e, 0x82, 0x03,
-             0x0c, 0x0c, 0x81, 0x01,
-             0xdd, 0x93, 0xf0, 0x1c,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xed, 0x50, 0x1e, 0xf0,
-             0x80, 0xab, 0x3d, 0x04,
-             0x81, 0x91, 0x25, 0x5e,
-             0x84, 0x8b, 0x15, 0x4e,
-             0x16, 0x30, 0x13, 0x0e,
-             0x3b, 0x04, 0xe5, 0x20,
-             0xe0, 0x08, 0x0d, 0x06,
-             0x81, 0x71, 0x21, 0x1e,
-             0xa3, 0x0e, 0xa9, 0x9e,
-             0x27, 0x0e, 0xb9, 0x04,
-             0x65, 0x01, 0x00, 0xa0,
-             0x1b, 0x0e, 0xc0, 0x02,
-             0x66, 0x01, 0x00, 0xa0,
-             0x19, 0x0e, 0xc0, 0x04,
-             0x67, 0x01, 0x00, 0xa0,
-             0x17, 0x0e, 0xc0, 0x06,
-             0x64, 0x01, 0x00, 0xa0,
-             0x1f, 0x0e, 0xc0, 0x09,
-             0x65, 0x01, 0x00, 0xa0,
-             0x1d, 0x0e, 0xc0, 0x0b,
-             0x8d, 0x85, 0x81, 0x01,
-             0x98, 0x55, 0xa1, 0x0b,
-             0x78, 0x90, 0x16, 0x03,
-             0xac, 0x12, 0x94, 0x5b,
-             0xa7, 0x34, 0xa5, 0x24,
-             0x6f, 0x18, 0xa3, 0x44,
-             0xa1, 0x0b, 0xef, 0xe0,
-             0xa1, 0x34, 0x94, 0xf5,
-             0x16, 0x03, 0x9d, 0x44,
-             0xac, 0x12, 0xf8, 0x90,
-             0xe0, 0x30, 0x16, 0x23,
-             0x8b, 0x4e, 0x8c, 0x38,
-             0xa7, 0x54, 0x9f, 0x44,
-             0x97, 0x44, 0x89, 0x4e,
-             0x99, 0x44, 0xfe, 0x4e,
-             0x9b, 0x44, 0xfc, 0x4e,
-             0xbc, 0xae, 0xbe, 0x4e,
-             0x70, 0x58, 0xa5, 0x44,
-             0xa1, 0x0b, 0xef, 0xe0,
-             0x93, 0x44, 0x8e, 0xf5,
-             0x16, 0x03, 0xa1, 0x34,
-             0x2c, 0x12, 0xf8, 0x90,
-             0xf0, 0xa4, 0x4a, 0x42,
-             0x60, 0x30, 0x16, 0x23,
-             0x8e, 0x38, 0x8c, 0x43,
-             0xe0, 0x51, 0x0f, 0x5e,
-             0x09, 0x4e, 0x8b, 0x5e,
-             0xe5, 0x40, 0x08, 0xf0,
-             0x9d, 0x44, 0xfe, 0x4e,
-             0xa7, 0x54, 0x91, 0x5e,
-             0x9f, 0x44, 0xfc, 0x4e,
-             0xbc, 0xae, 0xbe, 0x4e,
-             0x75, 0x98, 0x95, 0x44,
-             0xa1, 0x0b, 0xef, 0xe0,
-             0xa9, 0x04, 0x88, 0x35,
-             0x11, 0x04, 0x8f, 0xc4,
-             0x00, 0x34, 0xa3, 0x0b,
-             0xc0, 0x00, 0x00, 0x06,
-             0xc0, 0x00, 0x58, 0x35,
-             0xc0, 0x60, 0x58, 0x35,
-             0xa1, 0x44, 0x84, 0xb5,
-             0x16, 0x03, 0x93, 0x24,
-             0x50, 0x58, 0xf8, 0x90,
-             0xe5, 0x80, 0x08, 0xc0,
-             0x04, 0x23, 0xac, 0x12,
-             0x89, 0x4e, 0xfc, 0x18,
-             0xfe, 0xce, 0xa7, 0x44,
-             0xbe, 0x4e, 0xfc, 0xae,
-             0x3c, 0x4e, 0x95, 0x44,
-             0x68, 0x18, 0x83, 0x41,
-             0x02, 0x71, 0xef, 0xdc,
-             0x04, 0xb1, 0x88, 0x91,
-             0xa2, 0x18, 0x84, 0x61,
-             0xe4, 0xf5, 0x83, 0x7d,
-             0xe5, 0x50, 0x1e, 0xf0,
-             0xf2, 0x7c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfe, 0x7c, 0x04, 0x0c,
-             0xec, 0x60, 0x1e, 0xf0,
-             0x84, 0xab, 0x06, 0xb8,
-             0x60, 0x10, 0x00, 0x23,
-             0x02, 0x14, 0x99, 0x41,
-             0x00, 0x0b, 0x81, 0x51,
-             0x3e, 0x0e, 0xe0, 0x14,
-             0xe7, 0x60, 0x00, 0x30,
-             0x41, 0x56, 0x81, 0x45,
-             0xec, 0x04, 0x08, 0x40,
-             0xfe, 0x95, 0xa1, 0x4b,
-             0x6c, 0x04, 0x00, 0x10,
-             0x7f, 0xfc, 0x49, 0xee,
-             0x3e, 0x04, 0xcf, 0xff,
-             0xe4, 0x10, 0x41, 0x4a,
-             0xe0, 0x04, 0x04, 0xda,
-             0xed, 0x80, 0x42, 0x0a,
-             0xec, 0x04, 0x00, 0x00,
-             0x6f, 0xf9, 0x01, 0x5a,
-             0x40, 0xc6, 0x40, 0x0f,
-             0x42, 0x0a, 0xe0, 0x00,
-             0x17, 0x5a, 0xed, 0x80,
-             0x42, 0x0a, 0xe4, 0x30,
-             0x00, 0x06, 0xed, 0x80,
-             0xbc, 0x0e, 0xc0, 0x00,
-             0x80, 0x00, 0x13, 0xc8,
-             0x60, 0x0a, 0x40, 0x2e,
-             0xe7, 0x60, 0x12, 0x30,
-             0xe6, 0xa0, 0x10, 0x30,
-             0xe5, 0x02, 0x44, 0x1a,
-             0xe5, 0x82, 0x48, 0x1a,
-             0x02, 0x24, 0x09, 0x2e,
-             0x7e, 0x4e, 0xe1, 0x84,
-             0xe0, 0xfc, 0x00, 0x44,
-             0xc3, 0x47, 0x20, 0x1f,
-             0x8b, 0x4e, 0xfc, 0x1e,
-             0x20, 0x12, 0xa5, 0x35,
-             0xa8, 0x34, 0x81, 0x01,
-             0x40, 0x1a, 0xa0, 0x1d,
-             0x42, 0x3a, 0xc6, 0x86,
-             0x40, 0x3a, 0xe5, 0x82,
-             0x04, 0x14, 0xe5, 0x02,
-             0x06, 0x20, 0xf6, 0x80,
-             0x05, 0x0a, 0x6c, 0x80,
-             0x00, 0x5b, 0xe4, 0x7c,
-             0xfb, 0x8c, 0x48, 0x22,
-             0x6c, 0x7c, 0x06, 0x42,
-             0x9c, 0x00, 0x4a, 0x10,
-             0x68, 0x8c, 0x18, 0x54,
-             0x4a, 0x00, 0x81, 0x51,
-             0x0c, 0x34, 0x1c, 0x00,
-             0x0e, 0x54, 0xec, 0x00,
-             0xa6, 0x43, 0x6f, 0x8c,
-             0x78, 0x9c, 0x4c, 0x62,
-             0xec, 0x04, 0x08, 0x42,
-             0xac, 0xcf, 0x0b, 0x64,
-             0x68, 0x90, 0x08, 0xc4,
-             0x48, 0x3b, 0xa7, 0x5f,
-             0x4d, 0x4a, 0xca, 0xcb,
-             0x4c, 0x1a, 0xe4, 0x0c,
-             0x8c, 0x3b, 0x60, 0x0c,
-             0x42, 0x0a, 0x7c, 0x64,
-             0x4d, 0x6a, 0xe5, 0x80,
-             0x42, 0x1a, 0xe4, 0x30,
-             0x42, 0x0a, 0xe1, 0x88,
-             0x40, 0x52, 0xed, 0x80,
-             0x4e, 0x20, 0x50, 0x98,
-             0x08, 0xf5, 0xdc, 0x00,
-             0xd2, 0x8c, 0x42, 0x42,
-             0x08, 0x65, 0xa1, 0x2b,
-             0x80, 0x00, 0x0e, 0x06,
-             0x6c, 0x04, 0x0e, 0x20,
-             0x0f, 0x0a, 0x80, 0x3b,
-             0x46, 0x10, 0xe4, 0x7c,
-             0x02, 0x20, 0x1c, 0x00,
-             0x44, 0x72, 0xec, 0x84,
-             0x00, 0x06, 0x7b, 0x84,
-             0x02, 0x22, 0xc0, 0x00,
-             0x08, 0x04, 0xec, 0x7c,
-             0x0a, 0x14, 0x6f, 0x84,
-             0x22, 0x23, 0xec, 0x00,
-             0x23, 0x3f, 0xa3, 0x0f,
-             0xf8, 0x90, 0x48, 0x52,
-             0xa8, 0x3f, 0x0b, 0x14,
-             0x6c, 0x04, 0x04, 0x22,
-             0xa5, 0x3f, 0x8c, 0x03,
-             0xf2, 0x84, 0x42, 0x32,
-             0xfe, 0x34, 0x89, 0x24,
-             0xef, 0xcc, 0x72, 0xa8,
-             0x00, 0x70, 0x00, 0x2b,
-             0x08, 0x70, 0xe4, 0x2c,
-             0x01, 0x0a, 0x6c, 0x54,
-             0x03, 0x31, 0xe4, 0x7c,
-             0xfb, 0x90, 0x48, 0x02,
-             0x00, 0x00, 0x06, 0x06,
-             0xe4, 0x80, 0x00, 0xca,
-             0x62, 0x00, 0x00, 0x0c,
-             0xec, 0x7c, 0x0a, 0x42,
-             0x6f, 0x94, 0x18, 0x04,
-             0xec, 0x00, 0x0c, 0x54,
-             0xab, 0x3f, 0x2a, 0x43,
-             0x78, 0xb0, 0x58, 0x62,
-             0xec, 0x04, 0x08, 0x42,
-             0xab, 0x0f, 0x38, 0x3f,
-             0x44, 0xaa, 0x29, 0x3f,
-             0x47, 0x1d, 0xe4, 0x00,
-             0xe0, 0x0c, 0x41, 0xf6,
-             0xe0, 0x0c, 0x42, 0x1a,
-             0xe5, 0x80, 0x42, 0x0a,
-             0xe1, 0x88, 0x42, 0x1a,
-             0xed, 0x80, 0x42, 0x0a,
-             0xa1, 0x1b, 0x9e, 0xc5,
-             0xbe, 0x44, 0x8e, 0xf5,
-             0xf6, 0x80, 0x00, 0x24,
-             0xf6, 0x80, 0x02, 0x44,
-             0x02, 0x8a, 0x80, 0x13,
-             0x90, 0x75, 0xe4, 0x80,
-             0x64, 0x74, 0x0f, 0x0a,
-             0x9c, 0x15, 0x83, 0x41,
-             0xbd, 0x11, 0x3e, 0x04,
-             0x40, 0x2a, 0xae, 0x13,
-             0x04, 0x44, 0x66, 0x82,
-             0x02, 0x70, 0xe8, 0x84,
-             0x04, 0x20, 0x64, 0x08,
-             0xa3, 0x2f, 0xec, 0x04,
-             0xf8, 0x08, 0x46, 0x02,
-             0x98, 0xd5, 0x85, 0x3b,
-             0x6c, 0x80, 0x06, 0x10,
-             0xe4, 0x7c, 0x03, 0x0a,
-             0x46, 0x12, 0x01, 0x21,
-             0x04, 0x16, 0xfb, 0x8c,
-             0x02, 0xca, 0x40, 0x00,
-             0x08, 0x0c, 0xe4, 0x80,
-             0x02, 0x32, 0x62, 0x00,
-             0x0a, 0x44, 0xec, 0x7c,
-             0x18, 0x14, 0x6f, 0x84,
-             0x22, 0x33, 0xec, 0x00,
-             0x4a, 0xc2, 0xa3, 0x2f,
-             0xa3, 0x4f, 0x78, 0x94,
-             0x06, 0x32, 0x2a, 0x2f,
-             0x27, 0x2f, 0xec, 0x04,
-             0x81, 0x11, 0x88, 0x03,
-             0x42, 0x22, 0x07, 0x55,
-             0x04, 0x0b, 0xf2, 0x84,
-             0xbe, 0x24, 0x81, 0x31,
-             0xef, 0xcc, 0x74, 0xe8,
-             0x64, 0x08, 0x06, 0x70,
-             0x07, 0x0a, 0x81, 0x21,
-             0x01, 0xe5, 0xe4, 0x7c,
-             0xc0, 0x00, 0x04, 0x16,
-             0x64, 0x08, 0x06, 0x70,
-             0xe5, 0x12, 0x40, 0x2a,
-             0x65, 0x92, 0x42, 0x2a,
-             0xe4, 0x7c, 0x07, 0x0a,
-             0x04, 0x06, 0x83, 0x21,
-             0x08, 0x70, 0x80, 0x00,
-             0x06, 0xca, 0x6c, 0x78,
-             0x0a, 0x0c, 0xe4, 0x80,
-             0x48, 0x32, 0x62, 0x00,
-             0x06, 0x42, 0xfb, 0x90,
-             0x18, 0x54, 0xec, 0x7c,
-             0x0c, 0x34, 0x6f, 0x8c,
-             0x26, 0x43, 0xec, 0x00,
-             0x58, 0x62, 0xa7, 0x2f,
-             0xa7, 0x5f, 0x78, 0xb0,
-             0x08, 0x42, 0x38, 0x2f,
-             0x29, 0x2f, 0xec, 0x04,
-             0x42, 0x12, 0x8a, 0x03,
-             0x77, 0xf8, 0xf2, 0x88,
-             0x04, 0x70, 0x6f, 0xcc,
-             0x00, 0x8a, 0xe4, 0x0c,
-             0x41, 0xf6, 0xe7, 0xfc,
-             0xa1, 0x1b, 0x00, 0x0c,
-             0xc0, 0x0c, 0x41, 0xf6,
-             0x16, 0xb0, 0xa4, 0x06,
-             0x82, 0x91, 0x6c, 0x04,
-             0x84, 0x81, 0x08, 0xa1,
-             0x02, 0x44, 0x81, 0x95,
-             0x86, 0x71, 0x68, 0x84,
-             0xef, 0x0f, 0x82, 0x03,
-             0x00, 0x02, 0x7f, 0x45,
-             0xa1, 0xbb, 0xef, 0xfc,
-             0xdf, 0xfc, 0x2d, 0xd8,
-             0xb0, 0xf1, 0x3c, 0x04,
-             0xf6, 0x7c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xf8, 0x04, 0x04, 0x0c,
-             0x80, 0xcb, 0x06, 0x1d,
-             0x7a, 0x0c, 0x4c, 0x12,
-             0xfb, 0x04, 0x42, 0x32,
-             0x1c, 0x00, 0x58, 0x20,
-             0xf1, 0x84, 0x46, 0x62,
-             0x1c, 0x00, 0x44, 0x00,
-             0x67, 0x0f, 0xff, 0x01,
-             0xe1, 0x7c, 0x0c, 0xc4,
-             0x69, 0x8c, 0x0e, 0xc4,
-             0xf8, 0x98, 0x40, 0x02,
-             0x84, 0x03, 0xae, 0x0f,
-             0x79, 0x08, 0x4c, 0x02,
-             0xf9, 0x30, 0x4e, 0x02,
-             0xa1, 0x6d, 0x8e, 0x6f,
-             0x04, 0x04, 0x84, 0xf5,
-             0xbf, 0x61, 0x70, 0x80,
-             0x46, 0x62, 0x63, 0x2f,
-             0x42, 0x29, 0xf1, 0x8c,
-             0x04, 0x24, 0xa7, 0xcf,
-             0x06, 0xc4, 0x76, 0x80,
-             0x04, 0x20, 0xfc, 0x7c,
-             0x42, 0x22, 0xec, 0x04,
-             0x22, 0x63, 0xf1, 0x84,
-             0x6d, 0x3f, 0xa3, 0x0f,
-             0x03, 0x35, 0x84, 0x1b,
-             0xa3, 0x1d, 0x86, 0x03,
-             0x41, 0xfc, 0x04, 0x24,
-             0x1f, 0xfc, 0x41, 0xfe,
-             0x02, 0x75, 0xdf, 0xff,
-             0xd0, 0x88, 0x40, 0x02,
-             0x60, 0x01, 0x06, 0x06,
-             0xc3, 0x07, 0x60, 0x00,
-             0x02, 0x10, 0x06, 0x2f,
-             0xa4, 0x0f, 0xec, 0x04,
-             0x94, 0x1e, 0x90, 0x0e,
-             0xf0, 0x04, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x70, 0x1e, 0xf0,
-             0x88, 0x9b, 0x1d, 0x34,
-             0x82, 0x6b, 0x00, 0xcb,
-             0x50, 0x22, 0x06, 0x2d,
-             0x58, 0x90, 0xfa, 0x0c,
-             0x52, 0x00, 0x1c, 0x00,
-             0x21, 0x04, 0x9c, 0x00,
-             0xfb, 0x08, 0x46, 0x32,
-             0x71, 0x8c, 0x54, 0x82,
-             0x9c, 0x00, 0x4c, 0x50,
-             0x4a, 0x10, 0x7e, 0xce,
-             0x0d, 0x0e, 0x9c, 0x00,
-             0x1f, 0x04, 0x8c, 0x1b,
-             0x09, 0x5e, 0x94, 0x2b,
-             0x0b, 0x0e, 0x86, 0x8b,
-             0x6e, 0xf8, 0x98, 0x0b,
-             0x00, 0x7b, 0xef, 0xcc,
-             0x7f, 0x01, 0x82, 0xbb,
-             0x7c, 0xae, 0xff, 0x11,
-             0x6e, 0x78, 0x94, 0x2b,
-             0x09, 0xa4, 0xef, 0xcc,
-             0xe1, 0x7c, 0x04, 0x64,
-             0x78, 0x88, 0x40, 0x02,
-             0xf8, 0x88, 0x42, 0x12,
-             0xb6, 0x1f, 0x2e, 0x0f,
-             0x56, 0x02, 0x3e, 0x6e,
-             0x4e, 0x12, 0xf0, 0xa4,
-             0x40, 0x72, 0xf2, 0xa8,
-             0x42, 0x72, 0x79, 0x28,
-             0x82, 0x0f, 0xf9, 0x18,
-             0x98, 0x35, 0xa1, 0x0d,
-             0xe1, 0x7c, 0x02, 0x74,
-             0xf0, 0x84, 0x40, 0xb2,
-             0x72, 0x84, 0x44, 0x72,
-             0x44, 0x1f, 0xc2, 0x0f,
-             0x6c, 0x78, 0x90, 0x2b,
-             0x21, 0x1b, 0xef, 0xcc,
-             0x00, 0x14, 0xbf, 0xc1,
-             0x81, 0x11, 0x56, 0x80,
-             0x9c, 0x04, 0x40, 0x00,
-             0x96, 0x80, 0x00, 0x04,
-             0x84, 0x80, 0x00, 0x00,
-             0xec, 0x04, 0x0c, 0x00,
-             0x44, 0x62, 0x7c, 0x84,
-             0x00, 0x20, 0xf1, 0xa0,
-             0x05, 0x0a, 0x6c, 0x80,
-             0x48, 0x22, 0xe4, 0x7c,
-             0x42, 0xb0, 0x7b, 0x80,
-             0x00, 0x42, 0x9c, 0x00,
-             0x56, 0x70, 0x6c, 0x7c,
-             0x06, 0x14, 0x9c, 0x00,
-             0x0a, 0x04, 0x6f, 0x80,
-             0x46, 0x52, 0xec, 0x00,
-             0xa1, 0xbf, 0x78, 0x8c,
-             0x4e, 0xb2, 0x7e, 0xb4,
-             0x47, 0xf6, 0xf9, 0x8c,
-             0xb0, 0xc3, 0x60, 0x00,
-             0x71, 0xa0, 0x4a, 0x32,
-             0x0b, 0x0a, 0xa0, 0x43,
-             0x58, 0x52, 0x64, 0x7c,
-             0x1e, 0xb5, 0xfb, 0xb0,
-             0x96, 0x5b, 0x00, 0x04,
-             0x6c, 0x04, 0x10, 0x42,
-             0xec, 0x7c, 0x08, 0xc2,
-             0x40, 0x00, 0x0a, 0x06,
-             0xec, 0x00, 0x14, 0x44,
-             0x6f, 0x90, 0x12, 0x54,
-             0x10, 0x14, 0xb1, 0x7f,
-             0x40, 0xa2, 0x68, 0x80,
-             0x02, 0xb4, 0xf8, 0xa4,
-             0xa8, 0xc3, 0x68, 0x90,
-             0x00, 0xc2, 0x20, 0x1f,
-             0x21, 0x1f, 0xec, 0x04,
-             0xe8, 0x90, 0x00, 0x54,
-             0x7c, 0x7c, 0x02, 0x14,
-             0xf1, 0x88, 0x44, 0x32,
-             0xef, 0xcc, 0x67, 0x68,
-             0x03, 0xd5, 0x90, 0x03,
-             0xf2, 0x9c, 0x42, 0x12,
-             0xff, 0x01, 0x23, 0x8d,
-             0x02, 0x06, 0x82, 0xf5,
-             0x60, 0x00, 0x60, 0x01,
-             0xe0, 0xfc, 0x00, 0x74,
-             0xc3, 0x77, 0x43, 0xb7,
-             0xb6, 0x0f, 0x02, 0xaf,
-             0x79, 0xa8, 0x42, 0x72,
-             0xec, 0x04, 0x0c, 0x80,
-             0x7f, 0xa7, 0x81, 0xa5,
-             0x7f, 0xfd, 0x43, 0xfe,
-             0x01, 0x21, 0xdf, 0xff,
-             0x42, 0x22, 0x94, 0x03,
-             0x90, 0x6b, 0x72, 0x84,
-             0x88, 0x0e, 0x8b, 0x24,
-             0x0d, 0x04, 0x8a, 0x1e,
-             0x80, 0x6e, 0xb8, 0xf1,
-             0xf2, 0x7c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x7c, 0x04, 0x4c,
-             0x88, 0x7b, 0x0a, 0x6b,
-             0x76, 0x80, 0x14, 0x24,
-             0xe0, 0x00, 0x48, 0xc6,
-             0xb4, 0x43, 0x19, 0x51,
-             0x09, 0x0a, 0x34, 0x53,
-             0x4a, 0x42, 0xe4, 0x7c,
-             0x81, 0xc1, 0x7b, 0x94,
-             0x6c, 0x7c, 0x08, 0x52,
-             0x9c, 0x00, 0x58, 0x00,
-             0x00, 0x00, 0x00, 0x06,
-             0xe4, 0xb0, 0x12, 0x10,
-             0x6f, 0x90, 0x02, 0xc4,
-             0xec, 0x00, 0x16, 0x44,
-             0x78, 0x84, 0x42, 0xb2,
-             0x28, 0x53, 0xa9, 0x0f,
-             0x02, 0x52, 0xa2, 0x0f,
-             0x86, 0xa3, 0x6c, 0x04,
-             0x68, 0x84, 0x02, 0x04,
-             0xe8, 0x90, 0x00, 0xc4,
-             0x6f, 0xcc, 0x46, 0x88,
-             0x81, 0x81, 0x81, 0x31,
-             0xff, 0x21, 0x34, 0x93,
-             0x84, 0x9d, 0x1e, 0x1e,
-             0x82, 0x85, 0x9c, 0x0e,
-             0x12, 0x8a, 0x18, 0x9e,
-             0x8a, 0x55, 0xe0, 0xfc,
-             0x6f, 0xcc, 0x5f, 0xa8,
-             0xec, 0xf8, 0x04, 0x90,
-             0x51, 0xe6, 0x05, 0x25,
-             0x32, 0x2b, 0xe0, 0x00,
-             0x05, 0x0a, 0x80, 0x3b,
-             0x46, 0x10, 0xe4, 0x7c,
-             0xc1, 0x11, 0x1c, 0x00,
-             0x42, 0x22, 0xb2, 0x13,
-             0x04, 0x12, 0xfb, 0x84,
-             0x08, 0x34, 0xec, 0x7c,
-             0x81, 0x31, 0x68, 0x88,
-             0x1c, 0x00, 0x46, 0x00,
-             0xec, 0x00, 0x0a, 0x24,
-             0x6f, 0x88, 0x00, 0x34,
-             0x40, 0x52, 0xa4, 0x13,
-             0x20, 0x4f, 0xf8, 0x80,
-             0xec, 0x04, 0x00, 0x12,
-             0x68, 0x80, 0x02, 0x44,
-             0xe8, 0x88, 0x00, 0x34,
-             0x9e, 0x1e, 0x9c, 0x0e,
-             0x0c, 0x4c, 0x98, 0x8e,
-             0xdd, 0x93, 0xf2, 0x7c,
-             0xf8, 0x7c, 0x04, 0xcc,
-             0xd2, 0xc4, 0x8f, 0x5e,
-             0xf0, 0x14, 0x08, 0x65,
-             0x58, 0x0a, 0x9d, 0x54,
-             0x83, 0xc1, 0x60, 0x90,
-             0x40, 0x00, 0x04, 0x16,
-             0x19, 0x64, 0xa1, 0x6b,
-             0x91, 0x88, 0x44, 0xc2,
-             0xa3, 0x2b, 0x15, 0x74,
-             0x97, 0x94, 0x9b, 0x84,
-             0x91, 0xb4, 0x93, 0xa4,
-             0xe6, 0x86, 0x44, 0x3a,
-             0x82, 0x75, 0x8d, 0x5e,
-             0xf9, 0x51, 0x15, 0xc1,
-             0xe6, 0xb2, 0x58, 0x1a,
-             0x58, 0xca, 0x8a, 0xc1,
-             0x96, 0xc1, 0xe6, 0x82,
-             0x98, 0x43, 0x8a, 0xcf,
-             0x0a, 0x40, 0x0f, 0xc4,
-             0x42, 0x1a, 0xe4, 0x10,
-             0xc4, 0x07, 0x66, 0x82,
-             0x90, 0x41, 0x30, 0x4e,
-             0x0a, 0x14, 0x2c, 0x5e,
-             0x18, 0x24, 0xe0, 0x88,
-             0x56, 0x42, 0x60, 0x88,
-             0x18, 0x43, 0xf0, 0x94,
-             0x28, 0x4e, 0x96, 0xc3,
-             0x24, 0xce, 0x8a, 0xb3,
-             0xe0, 0x88, 0x08, 0x34,
-             0x80, 0xb3, 0x16, 0x43,
-             0x70, 0x88, 0x40, 0xb2,
-             0x16, 0x13, 0x82, 0xb3,
-             0x20, 0x4e, 0x84, 0xb3,
-             0x9c, 0x0e, 0x86, 0x13,
-             0x8d, 0x04, 0x98, 0xbe,
-             0x0c, 0xcc, 0x80, 0x1e,
-             0xdd, 0x93, 0xf0, 0x7c,
-             0xfa, 0x7c, 0x04, 0x4c,
-             0x88, 0xab, 0x02, 0x7b,
-             0x61, 0x7c, 0x10, 0x74,
-             0x10, 0x03, 0x86, 0x6b,
-             0x52, 0x72, 0x84, 0xbb,
-             0x50, 0x9f, 0xf2, 0xa0,
-             0x10, 0x0b, 0xc0, 0x8f,
-             0x59, 0x18, 0x92, 0x1b,
-             0xa1, 0x1b, 0xef, 0xcc,
-             0xd6, 0x80, 0x00, 0x14,
-             0x9c, 0x04, 0x40, 0x00,
-             0x96, 0x80, 0x00, 0x04,
-             0x84, 0x80, 0x00, 0x00,
-             0x60, 0x80, 0x01, 0x0a,
-             0xec, 0x84, 0x02, 0x00,
-             0x82, 0x55, 0xa8, 0x1e,
-             0x41, 0xfe, 0x7f, 0x77,
-             0xdf, 0xff, 0x7f, 0xfd,
-             0x81, 0x01, 0x00, 0x73,
-             0xa8, 0x0e, 0x98, 0x7e,
-             0x56, 0x1b, 0x85, 0x15,
-             0x82, 0x03, 0x90, 0x2b,
-             0x6c, 0x80, 0x02, 0x00,
-             0xe4, 0x7c, 0x01, 0x0a,
-             0x7b, 0x84, 0x40, 0x02,
-             0xc0, 0x00, 0x04, 0x06,
-             0x6c, 0x7c, 0x02, 0x02,
-             0x9c, 0x00, 0x50, 0x90,
-             0x6f, 0x84, 0x04, 0x24,
-             0xec, 0x00, 0x06, 0x14,
-             0x44, 0x32, 0x22, 0x03,
-             0x23, 0x8f, 0xf8, 0x88,
-             0xec, 0x04, 0x00, 0x02,
-             0xa1, 0x7d, 0x24, 0x8f,
-             0xe8, 0x80, 0x00, 0x84,
-             0xd1, 0x80, 0x00, 0x04,
-             0x0c, 0x4c, 0x98, 0x0e,
-             0xdd, 0x93, 0xf2, 0x7c,
-             0xfa, 0x7c, 0x04, 0x4c,
-             0x82, 0x7b, 0x0a, 0x6b,
-             0x61, 0x7c, 0x02, 0x64,
-             0xe1, 0x7c, 0x06, 0x74,
-             0x81, 0xa1, 0x02, 0x43,
-             0x58, 0x62, 0x11, 0xb4,
-             0x06, 0x03, 0xf2, 0x84,
-             0xf9, 0x04, 0x50, 0xc2,
-             0x72, 0x8c, 0x4a, 0x72,
-             0x58, 0x42, 0xc6, 0x0f,
-             0xc6, 0x5f, 0x79, 0x04,
-             0xe5, 0xb2, 0x42, 0x0a,
-             0xe5, 0x32, 0x46, 0x5a,
-             0xe5, 0xb2, 0x48, 0x5a,
-             0x42, 0x8a, 0x02, 0x33,
-             0x48, 0x42, 0xe5, 0x02,
-             0x52, 0x8a, 0x72, 0xa8,
-             0x06, 0x13, 0xe5, 0x82,
-             0xe5, 0x22, 0x46, 0x5a,
-             0x72, 0xa4, 0x48, 0x42,
-             0xe5, 0xa2, 0x4a, 0x5a,
-             0x70, 0x8c, 0x50, 0x42,
-             0xe5, 0x32, 0x40, 0x0a,
-             0xf2, 0xa8, 0x48, 0x52,
-             0xf9, 0x90, 0x46, 0x82,
-             0x8e, 0x85, 0xa1, 0x3b,
-             0x06, 0x44, 0x0f, 0x2e,
-             0x4a, 0x82, 0xe1, 0x7c,
-             0x58, 0x42, 0xf0, 0x8c,
-             0x07, 0xcb, 0xf2, 0x8c,
-             0x06, 0xc4, 0xc6, 0xcf,
-             0x90, 0xcb, 0x56, 0x80,
-             0x99, 0x0c, 0x4a, 0x52,
-             0x96, 0x80, 0x06, 0x54,
-             0x84, 0x80, 0x06, 0x30,
-             0xec, 0x04, 0x0a, 0x30,
-             0xe4, 0x7c, 0x0b, 0x0a,
-             0x1c, 0x00, 0x58, 0x40,
-             0xec, 0x84, 0x08, 0x30,
-             0x7b, 0x90, 0x4a, 0x52,
-             0xc0, 0x00, 0x10, 0x06,
-             0xec, 0x7c, 0x08, 0x52,
-             0x6f, 0x90, 0x12, 0x84,
-             0xec, 0x00, 0x14, 0x44,
-             0x52, 0xa2, 0x29, 0xcf,
-             0x28, 0x53, 0xf8, 0xa4,
-             0x12, 0x16, 0xb2, 0xcf,
-             0x0a, 0x52, 0x60, 0x04,
-             0x26, 0x93, 0xec, 0x04,
-             0xe8, 0x94, 0x14, 0xc4,
-             0x92, 0x2b, 0x29, 0x8f,
-             0xef, 0xcc, 0x4e, 0xe8,
-             0xb4, 0x1f, 0x0f, 0x24,
-             0x81, 0xa1, 0x30, 0x0f,
-             0x01, 0xe5, 0x84, 0xb3,
-             0xa1, 0x1d, 0xb2, 0xb3,
-             0x56, 0xb2, 0x02, 0x65,
-             0x04, 0xb3, 0x90, 0x88,
-             0xe0, 0xfc, 0x06, 0x14,
-             0xc3, 0x17, 0x43, 0x07,
-             0x16, 0xb0, 0x26, 0x0f,
-             0x21, 0xbd, 0xec, 0x04,
-             0xe0, 0x00, 0x04, 0xb2,
-             0x1f, 0xfd, 0x43, 0xfe,
-             0x41, 0xfe, 0x5f, 0xff,
-             0x04, 0x8a, 0xdf, 0xfc,
-             0xff, 0x81, 0x60, 0xfc,
-             0x4c, 0xd8, 0x80, 0xf5,
-             0x04, 0x20, 0x6f, 0xcc,
-             0x45, 0xe6, 0xec, 0xf8,
-             0x4e, 0x6f, 0xe0, 0x00,
-             0xf1, 0x80, 0x48, 0xa2,
-             0x90, 0x6d, 0x13, 0x54,
-             0x40, 0x40, 0x15, 0x44,
-             0x46, 0xa2, 0x9c, 0x00,
-             0x42, 0x30, 0xf3, 0x84,
-             0x96, 0x1e, 0x9c, 0x00,
-             0x90, 0x2e, 0x94, 0x0e,
-             0xf2, 0x7c, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x04, 0x04, 0x4c,
-             0x80, 0x7b, 0x02, 0x6b,
-             0x81, 0x11, 0x58, 0x04,
-             0x6b, 0xc8, 0x04, 0xf6,
-             0x44, 0xb8, 0x81, 0x31,
-             0x04, 0x04, 0xef, 0xcc,
-             0xc2, 0x17, 0x61, 0xfc,
-             0x7c, 0x7c, 0x00, 0x04,
-             0x84, 0x03, 0xa2, 0x2f,
-             0x7c, 0x7c, 0x02, 0x04,
-             0x00, 0x13, 0xff, 0x07,
-             0x70, 0x01, 0x00, 0x0e,
-             0x41, 0x1d, 0xcf, 0xff,
-             0xe1, 0xc0, 0x00, 0x14,
-             0x00, 0x00, 0x58, 0x1e,
-             0x80, 0x3f, 0x0f, 0xfd,
-             0x45, 0xf6, 0x5c, 0x14,
-             0x40, 0x22, 0xc3, 0xfc,
-             0x00, 0x9a, 0xd1, 0x80,
-             0xc0, 0x3f, 0x63, 0x4d,
-             0x20, 0x01, 0x00, 0xf8,
-             0xdd, 0x17, 0x40, 0x00,
-             0x6d, 0x8d, 0x00, 0x00,
-             0x40, 0x1a, 0xc0, 0x3e,
-             0x87, 0x11, 0x66, 0x82,
-             0x66, 0x86, 0x40, 0x0a,
-             0xe0, 0x14, 0x43, 0x06,
-             0x00, 0x9a, 0x8f, 0xa5,
-             0xc0, 0x3f, 0x61, 0xc9,
-             0x20, 0x01, 0x00, 0xe8,
-             0x00, 0x00, 0xc0, 0x00,
-             0xc0, 0x3c, 0x6f, 0x2d,
-             0x66, 0x82, 0x40, 0x1a,
-             0x40, 0x0a, 0x87, 0x11,
-             0x02, 0x86, 0x66, 0x86,
-             0x8d, 0x95, 0xe0, 0x30,
-             0x61, 0xbd, 0x00, 0x9a,
-             0x00, 0xe8, 0xc0, 0x3e,
-             0xc0, 0x00, 0x20, 0x01,
-             0x6d, 0x75, 0x00, 0x00,
-             0x40, 0x1a, 0xc0, 0x38,
-             0x87, 0x11, 0x66, 0x82,
-             0x66, 0x86, 0x40, 0x0a,
-             0xe0, 0x80, 0x03, 0x86,
-             0x00, 0x9a, 0x8b, 0x85,
-             0xc0, 0x3c, 0x60, 0x71,
-             0x20, 0x01, 0x00, 0xe8,
-             0x00, 0x00, 0xc0, 0x00,
-             0xc0, 0x30, 0x6d, 0xf5,
-             0x66, 0x82, 0x40, 0x1a,
-             0x40, 0x0a, 0x87, 0x11,
-             0x03, 0x86, 0x66, 0x86,
-             0x89, 0x75, 0xe1, 0x28,
-             0x61, 0xc9, 0x00, 0x9a,
-             0x00, 0xe8, 0xc0, 0x37,
-             0xc0, 0x00, 0x20, 0x01,
-             0x6f, 0x29, 0x00, 0x00,
-             0x40, 0x1a, 0xc0, 0x24,
-             0x87, 0x11, 0x66, 0x82,
-             0x66, 0x86, 0x40, 0x0a,
-             0xe2, 0x54, 0x03, 0x06,
-             0x00, 0x9a, 0x87, 0x65,
-             0xc0, 0x2f, 0x61, 0x49,
-             0x20, 0x01, 0x00, 0xe8,
-             0x00, 0x00, 0xc0, 0x00,
-             0xc0, 0x16, 0x6f, 0xc9,
-             0x66, 0x82, 0x40, 0x1a,
-             0x40, 0x0a, 0x87, 0x11,
-             0x02, 0x06, 0x66, 0x86,
-             0x85, 0x55, 0xe4, 0x10,
-             0x63, 0xf9, 0x00, 0x9a,
-             0x00, 0xe8, 0xc0, 0x22,
-             0xc0, 0x00, 0x20, 0x01,
-             0x6d, 0x59, 0x00, 0x00,
-             0x40, 0x1a, 0xc0, 0x0a,
-             0x87, 0x11, 0x66, 0x82,
-             0x66, 0x86, 0x40, 0x0a,
-             0xe6, 0x28, 0x42, 0x06,
-             0x07, 0x21, 0x83, 0x45,
-             0x62, 0xd9, 0x00, 0x9a,
-             0x42, 0x1a, 0xc0, 0x12,
-             0x40, 0x0a, 0xe6, 0x8a,
-             0x40, 0x00, 0x26, 0x87,
-             0x29, 0x59, 0x43, 0x06,
-             0x00, 0x00, 0xc0, 0x00,
-             0x80, 0x02, 0x2d, 0xb9,
-             0x26, 0x86, 0x40, 0x0a,
-             0xa8, 0x24, 0x02, 0x06,
-             0xe0, 0x86, 0x40, 0x0a,
-             0xd1, 0x80, 0x00, 0x04,
-             0xf2, 0x04, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x04, 0x04, 0x4c,
-             0xe0, 0x30, 0x06, 0x49,
-             0xe0, 0x90, 0x48, 0x0a,
-             0xc0, 0x00, 0x04, 0x06,
-             0xc0, 0x00, 0x46, 0x25,
-             0x8c, 0x44, 0x80, 0xf5,
-             0x08, 0x16, 0xa1, 0x4b,
-             0x44, 0x42, 0x80, 0x00,
-             0x15, 0x41, 0x91, 0x88,
-             0x42, 0x1a, 0xa3, 0x2b,
-             0xf9, 0x21, 0x66, 0x92,
-             0x64, 0x50, 0x0c, 0x30,
-             0x8a, 0x11, 0x81, 0x71,
-             0x66, 0x82, 0x40, 0x1a,
-             0x96, 0x01, 0x81, 0x11,
-             0x4c, 0x62, 0x80, 0x2f,
-             0x58, 0x58, 0x90, 0x88,
-             0x8c, 0x0b, 0x6f, 0xcc,
-             0x0c, 0x4c, 0x98, 0x7e,
-             0xdd, 0x93, 0xf2, 0x04,
-             0xfe, 0x7c, 0x04, 0x0c,
-             0x6c, 0x61, 0x1e, 0xf0,
-             0x13, 0x3e, 0xc0, 0x01,
-             0x0e, 0x09, 0x80, 0x7b,
-             0x81, 0x21, 0x60, 0x4c,
-             0x60, 0xbc, 0x5e, 0x25,
-             0x5e, 0x25, 0x88, 0x6b,
-             0x81, 0xa1, 0x60, 0xb4,
-             0x0a, 0xf0, 0x1d, 0x0e,
-             0xc0, 0x01, 0x64, 0x51,
-             0x5e, 0x25, 0xdc, 0x34,
-             0x5e, 0x25, 0xe0, 0xac,
-             0x5e, 0x25, 0xe0, 0x9c,
-             0xa1, 0x3b, 0x60, 0x8c,
-             0x06, 0x34, 0x3f, 0x2e,
-             0x5e, 0x25, 0xc1, 0x54,
-             0x5e, 0x25, 0xe1, 0x04,
-             0x5e, 0x25, 0xe1, 0x00,
-             0x5e, 0x25, 0xe0, 0xfc,
-             0x5e, 0x25, 0xe0, 0xf8,
-             0x5e, 0x25, 0xe0, 0xf4,
-             0x5e, 0x25, 0xe0, 0xf0,
-             0x5e, 0x25, 0xe0, 0xec,
-             0x5e, 0x25, 0xe0, 0xe8,
-             0x5e, 0x25, 0xe0, 0xe4,
-             0x5e, 0x25, 0xe0, 0xe0,
-             0x5e, 0x25, 0xe0, 0xdc,
-             0x5e, 0x25, 0xe0, 0xd8,
-             0x5e, 0x25, 0xe0, 0xd4,
-             0x5e, 0x25, 0xe0, 0xd0,
-             0x5e, 0x25, 0xe0, 0xcc,
-             0x5e, 0x25, 0xe0, 0xc8,
-             0x5e, 0x25, 0xe0, 0xc4,
-             0x5e, 0x25, 0xe0, 0xc0,
-             0x5e, 0x25, 0xe0, 0xb8,
-             0x5e, 0x25, 0xe0, 0xb0,
-             0x5e, 0x25, 0xe0, 0xa8,
-             0x5e, 0x25, 0xe0, 0xa4,
-             0x5e, 0x25, 0xe0, 0x98,
-             0x5e, 0x25, 0xe0, 0x94,
-             0x5e, 0x25, 0xe0, 0x88,
-             0xbd, 0x2e, 0xe0, 0x84,
-             0x44, 0x3a, 0xbb, 0x2e,
-             0x87, 0x31, 0x46, 0x8e,
-             0x80, 0x0c, 0x0e, 0x25,
-             0xe0, 0x50, 0x0e, 0x09,
-             0x04, 0x24, 0x97, 0x1e,
-             0xa3, 0x2d, 0x81, 0x38,
-             0xc4, 0x00, 0x04, 0x06,
-             0x81, 0x21, 0x19, 0x2e,
-             0x93, 0x14, 0x98, 0x2e,
-             0x60, 0x20, 0x42, 0x31,
-             0x04, 0x2e, 0x81, 0x31,
-             0xe7, 0xc0, 0x02, 0xf0,
-             0x04, 0xf0, 0x0d, 0x1e,
-             0x0b, 0x2e, 0xe7, 0xd0,
-             0xe7, 0xe0, 0x02, 0xf0,
-             0x04, 0xf0, 0x09, 0x1e,
-             0x7e, 0x2e, 0xe7, 0xf0,
-             0x64, 0x01, 0x02, 0xf0,
-             0x7c, 0x1e, 0xc0, 0x01,
-             0x64, 0x11, 0x04, 0xf0,
-             0x3e, 0x2e, 0xc0, 0x01,
-             0x64, 0x31, 0x02, 0xf0,
-             0x3c, 0x1e, 0xc0, 0x01,
-             0x91, 0x0e, 0x83, 0x21,
-             0x97, 0x44, 0x9d, 0x14,
-             0xef, 0xfc, 0x56, 0x48,
-             0xe1, 0x14, 0x1e, 0x05,
-             0xab, 0x0b, 0x80, 0x04,
-             0xe0, 0x08, 0x00, 0x1a,
-             0xed, 0x80, 0x42, 0x0a,
-             0xc0, 0x00, 0x3c, 0x58,
-             0xe1, 0x0c, 0x1e, 0x05,
-             0xa1, 0x0b, 0x80, 0x04,
-             0x80, 0x00, 0x00, 0xb6,
-             0x80, 0x00, 0x4c, 0x05,
-             0x80, 0x00, 0x3b, 0xb8,
-             0x67, 0x60, 0x00, 0xf0,
-             0x64, 0x40, 0x0a, 0xf0,
-             0x0d, 0x0e, 0xc0, 0x01,
-             0xe7, 0x70, 0x00, 0xf0,
-             0x00, 0xf0, 0x0b, 0x0e,
-             0x09, 0x0e, 0xe7, 0x80,
-             0xe7, 0x90, 0x00, 0xf0,
-             0x00, 0xf0, 0x7e, 0x0e,
-             0x7c, 0x0e, 0xe7, 0xa0,
-             0xe7, 0xb0, 0x00, 0xf0,
-             0x00, 0xf0, 0x3e, 0x0e,
-             0xc0, 0x01, 0x64, 0x21,
-             0x81, 0x21, 0x3c, 0x0e,
-             0x81, 0x31, 0x11, 0x04,
-             0x97, 0x44, 0x9d, 0x14,
-             0xef, 0xfc, 0x53, 0x08,
-             0xe1, 0x10, 0x1e, 0x05,
-             0xab, 0x0b, 0x80, 0x04,
-             0xe0, 0x08, 0x00, 0x1a,
-             0xed, 0x80, 0x42, 0x0a,
-             0xc1, 0x14, 0x1e, 0x05,
-             0xc0, 0x00, 0x00, 0x05,
-             0xc0, 0x00, 0x34, 0x28,
-             0x61, 0x08, 0x1e, 0x05,
-             0xe5, 0x80, 0x08, 0xf0,
-             0x61, 0x0c, 0x1e, 0x15,
-             0xe5, 0x70, 0x0a, 0xf0,
-             0x80, 0x04, 0x81, 0x31,
-             0x81, 0x11, 0x04, 0x24,
-             0xef, 0xfc, 0x4b, 0x28,
-             0x06, 0xf0, 0x33, 0x14,
-             0xb1, 0x04, 0xe5, 0x30,
-             0x7c, 0x3e, 0xaf, 0x24,
-             0xe5, 0x40, 0x06, 0xf0,
-             0x80, 0x4b, 0x3e, 0x3e,
-             0x82, 0x5b, 0x3c, 0x2e,
-             0xef, 0xfc, 0x59, 0xc8,
-             0x81, 0x61, 0x1b, 0x7e,
-             0x2f, 0xb8, 0x91, 0x54,
-             0x0e, 0x09, 0xe0, 0x00,
-             0x81, 0x11, 0x60, 0x40,
-             0xe0, 0x9c, 0x5e, 0x15,
-             0xe0, 0x88, 0x5e, 0x15,
-             0x40, 0x00, 0x3d, 0x1e,
-             0x1e, 0x05, 0xf3, 0xf8,
-             0xad, 0x0b, 0x60, 0xf4,
-             0xe0, 0x98, 0x5e, 0x15,
-             0xe0, 0x94, 0x5e, 0x15,
-             0xe0, 0x8c, 0x5e, 0x15,
-             0xe0, 0x84, 0x5e, 0x15,
-             0xbb, 0x1e, 0xbf, 0x1e,
-             0x88, 0xf5, 0x95, 0x6e,
-             0x60, 0xf0, 0x1e, 0x35,
-             0xe7, 0x10, 0x0c, 0xf0,
-             0x18, 0xf0, 0x00, 0x44,
-             0xab, 0x14, 0xe6, 0xc0,
-             0x7c, 0x6e, 0x8c, 0x30,
-             0xe1, 0x7c, 0x0a, 0x44,
-             0xa9, 0x04, 0xbe, 0xce,
-             0xbc, 0x3e, 0xa7, 0x24,
-             0xef, 0xfc, 0x56, 0xc8,
-             0x60, 0xb4, 0x1e, 0x15,
-             0xe7, 0x00, 0x06, 0xf0,
-             0x60, 0xb0, 0x1e, 0x05,
-             0x1e, 0x25, 0x8c, 0x4b,
-             0x51, 0x58, 0xe0, 0xc4,
-             0x1e, 0x25, 0xef, 0xfc,
-             0x1e, 0x35, 0xe0, 0xdc,
-             0x1e, 0x05, 0xe0, 0xd8,
-             0x1e, 0x15, 0xe0, 0xc0,
-             0x81, 0x95, 0xe0, 0xc4,
-             0xe0, 0xf0, 0x1e, 0x15,
-             0xe0, 0xdc, 0x1e, 0x25,
-             0xe0, 0xd8, 0x1e, 0x35,
-             0x84, 0x10, 0x80, 0x04,
-             0x08, 0xf0, 0x08, 0x24,
-             0x0c, 0x30, 0xe5, 0xc0,
-             0xe5, 0xb0, 0x0a, 0xf0,
-             0xef, 0xf8, 0x74, 0x08,
-             0x81, 0x91, 0x01, 0x81,
-             0x0e, 0x09, 0xa9, 0xd5,
-             0x40, 0x00, 0xe0, 0x40,
-             0xad, 0x0b, 0xf3, 0xf8,
-             0x1e, 0x35, 0x8a, 0x75,
-             0x0c, 0xf0, 0x60, 0xf8,
-             0x1e, 0x05, 0xe7, 0x10,
-             0x18, 0xf0, 0x60, 0xfc,
-             0xab, 0x14, 0xe6, 0xc0,
-             0xfc, 0x24, 0x06, 0x31,
-             0xfc, 0x20, 0x00, 0x45,
-             0xbe, 0xce, 0xfc, 0x6e,
-             0x0a, 0x44, 0x29, 0x04,
-             0xa7, 0x24, 0xe1, 0x7c,
-             0x52, 0x98, 0xbc, 0x3e,
-             0x1e, 0x15, 0xef, 0xfc,
-             0x06, 0xf0, 0x60, 0xb4,
-             0x1e, 0x05, 0xe7, 0x00,
-             0x8c, 0x4b, 0x60, 0xb0,
-             0xe0, 0xc4, 0x1e, 0x25,
-             0xef, 0xfc, 0x4d, 0x28,
-             0xe0, 0xe4, 0x1e, 0x25,
-             0xe0, 0xe0, 0x1e, 0x35,
-             0xe0, 0xc0, 0x1e, 0x05,
-             0xe0, 0xc4, 0x1e, 0x15,
-             0x1e, 0x05, 0x81, 0xd5,
-             0x1e, 0x15, 0xe0, 0xfc,
-             0x1e, 0x25, 0xe0, 0xf8,
-             0x1e, 0x35, 0xe0, 0xe4,
-             0x00, 0x05, 0xe0, 0xe0,
-             0x02, 0x11, 0xfc, 0x20,
-             0x04, 0x25, 0xfc, 0x24,
-             0x08, 0xf0, 0x7c, 0x20,
-             0x06, 0x31, 0xe7, 0x50,
-             0x0a, 0xf0, 0x7c, 0x24,
-             0x6f, 0x78, 0xe7, 0x40,
-             0x1e, 0x25, 0xef, 0xf8,
-             0xa3, 0x2d, 0xe0, 0xd4,
-             0xdc, 0x04, 0x80, 0x95,
-             0x82, 0xc5, 0xa1, 0x0b,
-             0x60, 0xd0, 0x1e, 0x15,
-             0x08, 0xf0, 0x84, 0x0b,
-             0x0a, 0xf0, 0x67, 0x50,
-             0x19, 0x24, 0xe7, 0x40,
-             0x6e, 0x58, 0x9d, 0x31,
-             0x1e, 0x25, 0xef, 0xf8,
-             0x1e, 0x35, 0xe0, 0xd4,
-             0x08, 0xf0, 0x60, 0xd0,
-             0x0a, 0xf0, 0xe6, 0xa0,
-             0x83, 0x01, 0x66, 0x90,
-             0x6f, 0xf8, 0x7e, 0xa8,
-             0x0e, 0x09, 0x81, 0x11,
-             0x40, 0x00, 0xe0, 0x40,
-             0xad, 0x0b, 0xf3, 0xf8,
-             0x1e, 0x35, 0x8a, 0xf5,
-             0x0c, 0xf0, 0x61, 0x00,
-             0x1e, 0x05, 0xe7, 0x10,
-             0x18, 0xf0, 0x61, 0x04,
-             0xb3, 0x14, 0xe6, 0xc0,
-             0xfc, 0x24, 0x06, 0x31,
-             0xfc, 0x20, 0x00, 0x45,
-             0xbe, 0xce, 0xfc, 0x6e,
-             0x0a, 0x44, 0x31, 0x04,
-             0xaf, 0x24, 0xe1, 0x7c,
-             0x4c, 0x58, 0xbc, 0x3e,
-             0x1e, 0x15, 0xef, 0xfc,
-             0x06, 0xf0, 0x60, 0xb4,
-             0x1e, 0x05, 0xe7, 0x00,
-             0x8c, 0x4b, 0x60, 0xb0,
-             0xe0, 0xc4, 0x1e, 0x25,
-             0xef, 0xfc, 0x46, 0xe8,
-             0xe0, 0xec, 0x1e, 0x15,
-             0xe0, 0xe8, 0x1e, 0x25,
-             0xe0, 0xc0, 0x1e, 0x05,
-             0xfc, 0x20, 0x02, 0x45,
-             0xe0, 0xc4, 0x1e, 0x15,
-             0xfc, 0x24, 0x04, 0x31,
-             0x1e, 0x05, 0x83, 0x15,
-             0x1e, 0x35, 0xe1, 0x04,
-             0x1e, 0x15, 0xe0, 0xe8,
-             0x1e, 0x25, 0xe0, 0xec,
-             0x00, 0x05, 0xe1, 0x00,
-             0x02, 0x45, 0xfc, 0x20,
-             0x04, 0x11, 0xfc, 0x20,
-             0x06, 0x31, 0xfc, 0x24,
-             0x28, 0x2b, 0xfc, 0x24,
-             0xe7, 0x30, 0x08, 0xf0,
-             0x6f, 0xf8, 0x69, 0x08,
-             0xe7, 0x20, 0x0a, 0xf0,
-             0xa5, 0x8e, 0xa3, 0x9e,
-             0xa1, 0x0b, 0xdc, 0x04,
-             0x17, 0x14, 0x84, 0x25,
-             0x52, 0xd8, 0x8e, 0x0b,
-             0x1e, 0x05, 0xef, 0xfc,
-             0x80, 0x2b, 0x60, 0xcc,
-             0x60, 0xc8, 0x1e, 0x15,
-             0xe7, 0x30, 0x08, 0xf0,
-             0x67, 0x20, 0x0a, 0xf0,
-             0x67, 0x98, 0x9d, 0x31,
-             0x1e, 0x65, 0xef, 0xf8,
-             0x12, 0xf0, 0x60, 0xcc,
-             0x1e, 0x35, 0xe7, 0x40,
-             0x0e, 0xf0, 0x60, 0xc8,
-             0xfc, 0x9e, 0xe6, 0xe0,
-             0x0a, 0x64, 0x3e, 0x7e,
-             0x1e, 0x15, 0xe1, 0x7c,
-             0x8c, 0x4b, 0x60, 0xac,
-             0xe0, 0xa8, 0x1e, 0x05,
-             0xe0, 0xa4, 0x1e, 0x25,
-             0xbc, 0x3e, 0x9f, 0x3e,
-             0x46, 0x98, 0xa1, 0x5e,
-             0x1e, 0xb5, 0xef, 0xfc,
-             0x1e, 0x85, 0xe0, 0xbc,
-             0x1e, 0xa5, 0xe0, 0xb8,
-             0x96, 0x1b, 0xe0, 0xd0,
-             0x59, 0x78, 0x90, 0x0b,
-             0x94, 0x2b, 0x6f, 0xc8,
-             0xe0, 0x00, 0x02, 0xca,
-             0xe0, 0x00, 0x02, 0x1a,
-             0x67, 0x05, 0x00, 0xea,
-             0x42, 0x0a, 0xc9, 0x27,
-             0x42, 0x1a, 0xe5, 0x80,
-             0x42, 0x0a, 0xe1, 0x88,
-             0x82, 0xa5, 0xed, 0x80,
-             0x72, 0x7d, 0x10, 0x06,
-             0x81, 0x01, 0x40, 0x02,
-             0x60, 0xb8, 0x5e, 0x85,
-             0x5e, 0x05, 0x81, 0xa1,
-             0x81, 0xb1, 0x60, 0xbc,
-             0xe0, 0xd0, 0x5e, 0x05,
-             0x60, 0x9c, 0x1e, 0x15,
-             0xe6, 0x50, 0x06, 0xf0,
-             0x06, 0xf0, 0x7c, 0x3e,
-             0x3e, 0x3e, 0xe6, 0x60,
-             0x1e, 0x05, 0x90, 0x4b,
-             0x96, 0x5b, 0x60, 0x98,
-             0xe0, 0x94, 0x1e, 0x25,
-             0x67, 0x78, 0xbc, 0xae,
-             0x1f, 0x34, 0xef, 0xf8,
-             0xfc, 0x9e, 0x8c, 0x4b,
-             0x1e, 0x15, 0xbe, 0x7e,
-             0x1e, 0x05, 0xe0, 0xbc,
-             0x1e, 0x25, 0xe0, 0xb8,
-             0xbc, 0x3e, 0xe0, 0xd0,
-             0x42, 0x58, 0xa1, 0x54,
-             0x1e, 0x35, 0xef, 0xfc,
-             0x18, 0xf0, 0x60, 0xd0,
-             0x7c, 0xce, 0xe6, 0x10,
-             0xe6, 0x20, 0x18, 0xf0,
-             0x1e, 0x15, 0xbe, 0xce,
-             0x1e, 0x05, 0xe0, 0x8c,
-             0x1e, 0x25, 0xe0, 0x88,
-             0x1e, 0x55, 0xe0, 0x84,
-             0x1e, 0x45, 0xe0, 0xbc,
-             0xbc, 0x3e, 0xe0, 0xb8,
-             0xef, 0xf8, 0x65, 0x48,
-             0x60, 0xa4, 0x1e, 0x35,
-             0xe5, 0xd0, 0x18, 0xf0,
-             0x18, 0xf0, 0x7c, 0xce,
-             0xbe, 0xce, 0xe5, 0xe0,
-             0xbd, 0x04, 0xbf, 0x14,
-             0x1e, 0x55, 0xbb, 0x24,
-             0x1e, 0x45, 0xe0, 0xac,
-             0xbc, 0x3e, 0xe0, 0xa8,
-             0xef, 0xf8, 0x64, 0x28,
-             0xa5, 0x84, 0xa3, 0x94,
-             0x82, 0x91, 0x9b, 0x74,
-             0x9d, 0x04, 0x88, 0x81,
-             0x2b, 0x28, 0x93, 0x0b,
-             0x39, 0x44, 0xdf, 0xfc,
-             0xe5, 0xd0, 0x0c, 0xf0,
-             0x0e, 0xf0, 0x37, 0x34,
-             0xfc, 0x6e, 0xe5, 0xe0,
-             0x0a, 0x44, 0x3e, 0x7e,
-             0xbf, 0x14, 0xe1, 0x7c,
-             0xbb, 0x24, 0xbd, 0x04,
-             0x7e, 0x58, 0xbc, 0x3e,
-             0x7c, 0x6e, 0xef, 0xf8,
-             0x3e, 0x7e, 0x81, 0x31,
-             0x3f, 0x14, 0x83, 0x41,
-             0xbd, 0x04, 0x81, 0x51,
-             0xbc, 0x3e, 0xbb, 0x24,
-             0xef, 0xf8, 0x61, 0xe8,
-             0x81, 0x51, 0x39, 0x04,
-             0xbb, 0x94, 0xb7, 0x14,
-             0x3d, 0x44, 0xbf, 0x34,
-             0xe9, 0x84, 0x04, 0x04,
-             0xf6, 0x80, 0x0c, 0x24,
-             0x37, 0x6e, 0xbe, 0x61,
-             0xf1, 0x84, 0x42, 0x62,
-             0x6c, 0x80, 0x04, 0x10,
-             0xe4, 0x7c, 0x03, 0x0a,
-             0x7b, 0x88, 0x50, 0x12,
-             0x9c, 0x00, 0x4a, 0x00,
-             0x6c, 0x7c, 0x0e, 0x82,
-             0x81, 0x7c, 0x00, 0x04,
-             0x6f, 0x9c, 0x02, 0x54,
-             0xec, 0x00, 0x04, 0x74,
-             0x54, 0x22, 0x0c, 0x9d,
-             0x16, 0x04, 0xf8, 0x84,
-             0xae, 0x83, 0x68, 0x9c,
-             0x82, 0xa5, 0xa5, 0x5e,
-             0x71, 0x98, 0x44, 0x92,
-             0x4e, 0x78, 0x88, 0x0b,
-             0x86, 0x1b, 0x6f, 0xc8,
-             0x82, 0x3b, 0x00, 0x4b,
-             0x8c, 0x9b, 0x3d, 0x4e,
-             0xbb, 0x6e, 0xbf, 0x3e,
-             0xb4, 0xbf, 0x37, 0x9d,
-             0x14, 0x82, 0x02, 0xf5,
-             0x04, 0x90, 0xec, 0x04,
-             0x88, 0x0b, 0x6c, 0x28,
-             0x6f, 0xc8, 0x4d, 0x68,
-             0x00, 0x4b, 0x86, 0x1b,
-             0x3d, 0x4e, 0x95, 0x91,
-             0xbf, 0x3e, 0x82, 0x3b,
-             0x25, 0x24, 0xbb, 0x9e,
-             0xf9, 0x8c, 0x40, 0x42,
-             0x02, 0xb4, 0x21, 0x0b,
-             0x02, 0x35, 0xe8, 0xa8,
-             0xe8, 0x9c, 0x00, 0x24,
-             0x83, 0x41, 0x01, 0x21,
-             0x83, 0x21, 0x3f, 0x2e,
-             0x81, 0x31, 0x3d, 0x2e,
-             0x6f, 0xc4, 0x71, 0xe8,
-             0x3f, 0x1e, 0x88, 0x2b,
-             0x1e, 0x15, 0xb2, 0x63,
-             0x0e, 0xf0, 0x60, 0x9c,
-             0x1e, 0x35, 0xe6, 0x60,
-             0x1e, 0x25, 0xe0, 0x98,
-             0x3b, 0x6e, 0xe0, 0x94,
-             0xe6, 0x50, 0x0c, 0xf0,
-             0x86, 0x0b, 0x3d, 0x0e,
-             0x86, 0x4b, 0x7c, 0x6e,
-             0x82, 0x5b, 0x3e, 0x7e,
-             0x76, 0xf8, 0xbc, 0x2e,
-             0xbb, 0x34, 0xef, 0xf8,
-             0xbe, 0x7e, 0xfc, 0x6e,
-             0xe0, 0x9c, 0x1e, 0x15,
-             0xe0, 0x98, 0x1e, 0x05,
-             0xe0, 0x94, 0x1e, 0x25,
-             0xbd, 0x44, 0xbf, 0x54,
-             0x76, 0x18, 0xbc, 0x3e,
-             0x1e, 0x35, 0xef, 0xf8,
-             0x81, 0x71, 0x60, 0x98,
-             0xe0, 0x9c, 0x1e, 0x55,
-             0xe0, 0x8c, 0x1e, 0x15,
-             0x60, 0x94, 0x1e, 0x35,
-             0xf1, 0x8c, 0x48, 0x72,
-             0x73, 0x94, 0x4a, 0x72,
-             0xe6, 0x10, 0x18, 0xf0,
-             0x18, 0xf0, 0x7c, 0xce,
-             0xbe, 0xce, 0xe6, 0x20,
-             0xe0, 0x88, 0x1e, 0x05,
-             0xe0, 0x84, 0x1e, 0x25,
-             0x58, 0xb8, 0xbc, 0x3e,
-             0x1e, 0x65, 0xef, 0xf8,
-             0xff, 0x01, 0x60, 0x8c,
-             0xe0, 0x84, 0x1e, 0x85,
-             0x1e, 0x95, 0x80, 0x6d,
-             0x0c, 0x06, 0x40, 0x88,
-             0x5e, 0x75, 0x80, 0x00,
-             0x8c, 0x1b, 0x00, 0x8c,
-             0x00, 0x88, 0x5e, 0x75,
-             0x12, 0x06, 0x90, 0x2b,
-             0x46, 0xb8, 0x80, 0x00,
-             0x92, 0x0b, 0x6f, 0xc8,
-             0xe0, 0x00, 0x02, 0xca,
-             0xe0, 0x00, 0x02, 0x1a,
-             0x64, 0x01, 0x00, 0xea,
-             0x42, 0x0a, 0xc1, 0x00,
-             0x42, 0x1a, 0xe5, 0x80,
-             0x42, 0x0a, 0xe1, 0x88,
-             0x82, 0x25, 0xed, 0x80,
-             0x60, 0x8c, 0x5e, 0x75,
-             0x5e, 0x05, 0xff, 0x01,
-             0x81, 0xa1, 0x60, 0x88,
-             0xff, 0x01, 0x03, 0x05,
-             0xe0, 0x44, 0x10, 0x8a,
-             0x04, 0x80, 0x82, 0xf5,
-             0x92, 0x0b, 0x6c, 0x40,
-             0x6f, 0xc8, 0x44, 0xc8,
-             0x81, 0xa1, 0x8c, 0x1b,
-             0xe0, 0x8c, 0x5e, 0x15,
-             0xe0, 0x88, 0x5e, 0x05,
-             0x91, 0x54, 0x9b, 0x74,
-             0x21, 0x01, 0x85, 0x55,
-             0x30, 0x03, 0xe1, 0x11,
-             0x44, 0x02, 0xb0, 0x13,
-             0x01, 0x0a, 0x7b, 0x84,
-             0x12, 0x1b, 0xe4, 0x7c,
-             0xec, 0x7c, 0x00, 0x22,
-             0x40, 0x00, 0x02, 0x06,
-             0x9c, 0x00, 0x52, 0x60,
-             0x6f, 0x80, 0x06, 0x14,
-             0xec, 0x00, 0x08, 0x04,
-             0xa1, 0x9f, 0x20, 0x23,
-             0x46, 0x42, 0x11, 0x54,
-             0x26, 0x9f, 0xf8, 0x8c,
-             0xec, 0x04, 0x04, 0x22,
-             0x00, 0x14, 0x1b, 0x74,
-             0x25, 0x9f, 0xe8, 0x80,
-             0x5e, 0x05, 0x81, 0xa1,
-             0x5e, 0x95, 0xe0, 0x88,
-             0x95, 0x64, 0xe0, 0x8c,
-             0x1e, 0x25, 0x93, 0x34,
-             0x1e, 0x45, 0xe1, 0x04,
-             0x02, 0x64, 0x60, 0xf8,
-             0x1e, 0x35, 0xe0, 0x88,
-             0x86, 0x13, 0x61, 0x00,
-             0x82, 0x61, 0x46, 0x0e,
-             0x1e, 0x15, 0x9d, 0xc4,
-             0x00, 0xc4, 0xe0, 0xfc,
-             0x98, 0x33, 0x60, 0x88,
-             0x80, 0x13, 0x00, 0x23,
-             0x61, 0x04, 0x5e, 0x25,
-             0x1e, 0x25, 0x98, 0x43,
-             0x5e, 0x35, 0xe0, 0xf4,
-             0x1e, 0x35, 0xe1, 0x00,
-             0x5e, 0x15, 0xe0, 0xf0,
-             0x88, 0x21, 0x60, 0xfc,
-             0xe0, 0xec, 0x1e, 0x15,
-             0x60, 0xf4, 0x5e, 0x25,
-             0x1e, 0x25, 0x82, 0x31,
-             0x5e, 0x45, 0xe0, 0xe4,
-             0x80, 0x13, 0x60, 0xf8,
-             0xe0, 0xe8, 0x1e, 0x45,
-             0x60, 0xdc, 0x1e, 0x05,
-             0x5e, 0x35, 0x80, 0x23,
-             0x1e, 0x35, 0xe0, 0xf0,
-             0x98, 0x43, 0x60, 0xe0,
-             0x60, 0xec, 0x5e, 0x15,
-             0x1e, 0x15, 0x88, 0x01,
-             0x5e, 0x25, 0xe0, 0xd8,
-             0x98, 0x33, 0x60, 0xe4,
-             0x60, 0xe8, 0x5e, 0x45,
-             0x5e, 0x35, 0xa1, 0x21,
-             0x82, 0x11, 0x60, 0xe0,
-             0xe0, 0x84, 0x5e, 0x25,
-             0xe0, 0xdc, 0x5e, 0x05,
-             0xe0, 0xd8, 0x5e, 0x15,
-             0x10, 0x68, 0x8b, 0x6b,
-             0x13, 0x04, 0xdf, 0xfc,
-             0x01, 0xb5, 0x81, 0x11,
-             0x41, 0x24, 0x98, 0x01,
-             0xec, 0x04, 0x0a, 0x50,
-             0x45, 0x4a, 0x9e, 0x34,
-             0x04, 0x0c, 0xe4, 0x0c,
-             0x84, 0x13, 0xe2, 0x00,
-             0xfc, 0xd5, 0xa1, 0x5b,
-             0xe0, 0x58, 0x0e, 0x09,
-             0x1e, 0x05, 0x93, 0x34,
-             0x81, 0x1d, 0x61, 0x14,
-             0xe2, 0x00, 0x04, 0x0c,
-             0x8e, 0xae, 0x8c, 0x2e,
-             0x46, 0x11, 0x80, 0x04,
-             0x89, 0x11, 0x60, 0x24,
-             0xa5, 0x0b, 0x93, 0x24,
-             0xc0, 0x00, 0x02, 0x66,
-             0xe0, 0x20, 0x44, 0x11,
-             0xa5, 0x0b, 0x17, 0x34,
-             0x93, 0x14, 0x86, 0x45,
-             0xa3, 0x1b, 0x84, 0x14,
-             0xce, 0x14, 0x80, 0xe5,
-             0xe0, 0x94, 0x42, 0x4a,
-             0x00, 0x30, 0x0e, 0x25,
-             0x0e, 0x19, 0x84, 0x30,
-             0xad, 0x1b, 0xe0, 0x40,
-             0x40, 0x0c, 0x06, 0x15,
-             0xc4, 0x30, 0x00, 0x30,
-             0xab, 0x0b, 0x8a, 0xf5,
-             0x80, 0x0c, 0x06, 0x05,
-             0x9c, 0x94, 0x00, 0x04,
-             0x80, 0x0c, 0x46, 0x05,
-             0xe1, 0x10, 0x1e, 0x05,
-             0xa5, 0x1b, 0x80, 0x14,
-             0x0e, 0x19, 0x82, 0x75,
-             0x04, 0x10, 0xe0, 0x40,
-             0xa1, 0x1b, 0x6c, 0x18,
-             0xe4, 0x08, 0x04, 0xda,
-             0xed, 0x80, 0x42, 0x0a,
-             0xce, 0x14, 0x88, 0xf5,
-             0xe0, 0x44, 0x0e, 0x29,
-             0xf0, 0xc0, 0x42, 0x10,
-             0x44, 0x10, 0x29, 0x2b,
-             0xce, 0x2e, 0xfc, 0x04,
-             0x80, 0x04, 0x80, 0xf5,
-             0x42, 0x10, 0xa5, 0x0b,
-             0x46, 0x15, 0x9c, 0x0c,
-             0xce, 0x14, 0x80, 0x0c,
-             0xe0, 0x94, 0x42, 0x0a,
-             0x00, 0x30, 0x82, 0x05,
-             0x89, 0x21, 0x64, 0x30,
-             0x91, 0x21, 0x81, 0x25,
-             0x80, 0x1e, 0xa4, 0x1f,
-             0xe0, 0x50, 0x0e, 0x09,
-             0x42, 0x01, 0x93, 0x14,
-             0x1e, 0xf0, 0xe0, 0x28,
-             0xc0, 0x01, 0x64, 0x61,
-             0xf6, 0x7c, 0x0c, 0x0c,
-             0xa3, 0x1b, 0xdd, 0x93,
-             0x93, 0x14, 0xfa, 0x35,
-             0xa3, 0x1b, 0x84, 0x14,
-             0xfd, 0x45, 0xf4, 0xa5,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xed, 0xd0, 0x1e, 0xf0,
-             0x60, 0x90, 0x1e, 0xa5,
-             0x11, 0x5e, 0x82, 0xbb,
-             0xa1, 0x4e, 0x81, 0x81,
-             0xe0, 0x90, 0x14, 0x19,
-             0xe0, 0xa0, 0x1e, 0x65,
-             0xe0, 0x48, 0x00, 0x49,
-             0x02, 0x71, 0x80, 0x13,
-             0x98, 0x8e, 0xe0, 0x70,
-             0xe0, 0x10, 0x4c, 0x85,
-             0x00, 0x19, 0xee, 0x24,
-             0x93, 0x0e, 0xe0, 0x4c,
-             0x60, 0x50, 0x00, 0x99,
-             0xe0, 0x80, 0x44, 0x0a,
-             0xa7, 0x1e, 0xea, 0x08,
-             0x9f, 0x3e, 0xa3, 0x4e,
-             0x84, 0x25, 0xa5, 0x0e,
-             0x44, 0x1a, 0x2c, 0x04,
-             0xa1, 0x0b, 0xe0, 0x84,
-             0xe2, 0x00, 0x00, 0x0c,
-             0x00, 0x98, 0xac, 0x0e,
-             0x01, 0x21, 0xa0, 0x00,
-             0x74, 0x78, 0x92, 0x0b,
-             0x96, 0x3b, 0x6f, 0xf8,
-             0xee, 0x24, 0xa7, 0x14,
-             0xe0, 0x88, 0x44, 0x0a,
-             0x03, 0x21, 0x80, 0xe5,
-             0x73, 0xd8, 0x92, 0x0b,
-             0x96, 0x3b, 0x6f, 0xf8,
-             0x00, 0xf0, 0xa7, 0x14,
-             0x0a, 0xf0, 0x65, 0x40,
-             0x0d, 0x0e, 0xe5, 0xb0,
-             0xe5, 0x70, 0x00, 0xf0,
-             0x00, 0xf0, 0x0b, 0x0e,
-             0x09, 0x0e, 0xe5, 0x50,
-             0xe5, 0x80, 0x00, 0xf0,
-             0x00, 0xf0, 0x7e, 0x0e,
-             0x7c, 0x0e, 0xe5, 0x60,
-             0xe5, 0x90, 0x00, 0xf0,
-             0x00, 0xf0, 0x3e, 0x0e,
-             0x3c, 0x0e, 0xe5, 0xa0,
-             0x12, 0x0b, 0x83, 0x21,
-             0x53, 0x18, 0x8e, 0x3b,
-             0x96, 0x4b, 0x6f, 0xf8,
-             0xe1, 0x21, 0x6e, 0x04,
-             0xe0, 0x94, 0x14, 0x19,
-             0xe0, 0x8c, 0x40, 0x0a,
-             0x40, 0x6c, 0x1e, 0x05,
-             0x40, 0x85, 0xc8, 0x19,
-             0x16, 0x05, 0xc0, 0x00,
-             0xab, 0x1b, 0x40, 0x0c,
-             0xee, 0x0e, 0x84, 0x0f,
-             0x17, 0x38, 0xa7, 0x34,
-             0xa1, 0x7d, 0xc0, 0x00,
-             0xc0, 0x00, 0x14, 0x78,
-             0x80, 0x04, 0xb7, 0x04,
-             0x16, 0xb8, 0xa5, 0x0b,
-             0x1e, 0x05, 0x80, 0x00,
-             0x93, 0x14, 0xe0, 0x98,
-             0x00, 0x05, 0xa5, 0x54,
-             0x84, 0x14, 0xe0, 0x10,
-             0xc8, 0x57, 0x23, 0x24,
-             0x16, 0x50, 0x21, 0xc4,
-             0x02, 0x03, 0xe4, 0x40,
-             0x82, 0x0d, 0xff, 0x11,
-             0xc1, 0xac, 0x00, 0x04,
-             0x41, 0x2e, 0x52, 0x0a,
-             0x91, 0x80, 0x00, 0x04,
-             0x81, 0xac, 0x00, 0x04,
-             0x91, 0x80, 0x00, 0x04,
-             0x81, 0xae, 0x52, 0x0a,
-             0xe6, 0x8a, 0x40, 0x3a,
-             0x00, 0x26, 0xd7, 0x0d,
-             0x4c, 0x05, 0x80, 0x00,
-             0x14, 0x78, 0x80, 0x00,
-             0x9f, 0x04, 0x80, 0x00,
-             0xe0, 0x18, 0x14, 0x15,
-             0x08, 0x14, 0x80, 0x08,
-             0x6a, 0x08, 0xe1, 0x20,
-             0x82, 0x35, 0xa7, 0x0b,
-             0x60, 0x2c, 0x18, 0x19,
-             0x83, 0x0b, 0x83, 0x31,
-             0x18, 0x19, 0x84, 0x15,
-             0x81, 0x85, 0xe0, 0x28,
-             0x60, 0x24, 0x18, 0x19,
-             0x83, 0x0b, 0x83, 0x31,
-             0x18, 0x19, 0x82, 0x15,
-             0x02, 0x11, 0xe0, 0x20,
-             0xe4, 0x04, 0x06, 0x00,
-             0xe6, 0x92, 0x48, 0x1a,
-             0x86, 0xc5, 0xa1, 0x4b,
-             0xe0, 0x84, 0x00, 0x44,
-             0x86, 0x45, 0x81, 0x3d,
-             0x9f, 0x4e, 0xa5, 0x5e,
-             0xe0, 0x20, 0x14, 0x05,
-             0x40, 0x0a, 0xa1, 0x3e,
-             0x9d, 0x0e, 0xe6, 0x8a,
-             0xe6, 0x8a, 0x40, 0x0a,
-             0x60, 0x0e, 0x44, 0x3e,
-             0x02, 0x04, 0x81, 0x31,
-             0x9b, 0x2e, 0xe1, 0x7c,
-             0xef, 0xc4, 0x64, 0x68,
-             0xe1, 0x94, 0x04, 0x14,
-             0x80, 0xe5, 0xa1, 0x2b,
-             0xf6, 0x80, 0x0e, 0x24,
-             0x89, 0x01, 0x81, 0xc5,
-             0xa1, 0x75, 0x98, 0x0e,
-             0x61, 0x94, 0x04, 0x04,
-             0xe0, 0xec, 0x06, 0x14,
-             0x0e, 0x24, 0xa6, 0x2f,
-             0xc0, 0x71, 0xf6, 0x80,
-             0x6c, 0x14, 0x04, 0x70,
-             0x05, 0x0a, 0x80, 0x3b,
-             0x46, 0x10, 0xe4, 0x7c,
-             0x02, 0x70, 0x1c, 0x00,
-             0x42, 0x22, 0xec, 0x94,
-             0x04, 0x12, 0xfb, 0x84,
-             0x08, 0x34, 0xec, 0x7c,
-             0x81, 0x31, 0x68, 0x88,
-             0x1c, 0x00, 0x46, 0x00,
-             0xec, 0x00, 0x0a, 0x24,
-             0x6f, 0x88, 0x00, 0x34,
-             0x40, 0x52, 0xa4, 0x13,
-             0x20, 0x4f, 0xf8, 0x80,
-             0xec, 0x04, 0x00, 0x12,
-             0x4a, 0x1a, 0x9f, 0x14,
-             0x02, 0x44, 0x66, 0x86,
-             0x00, 0x34, 0xe8, 0x80,
-             0x81, 0x31, 0x68, 0x88,
-             0x44, 0x5a, 0x99, 0x5e,
-             0x57, 0x58, 0xe6, 0xae,
-             0x68, 0x28, 0xef, 0xc4,
-             0x97, 0x1e, 0x80, 0x6b,
-             0x66, 0x58, 0xa4, 0x73,
-             0x8e, 0x2b, 0x6f, 0xc4,
-             0x00, 0x14, 0xa1, 0x1b,
-             0x00, 0x04, 0xd6, 0x80,
-             0x00, 0x00, 0x96, 0x80,
-             0xae, 0x03, 0x84, 0x80,
-             0xe0, 0x80, 0x01, 0x0a,
-             0x40, 0x60, 0x02, 0xb5,
-             0x42, 0x16, 0xdc, 0x00,
-             0x44, 0x12, 0xe0, 0x00,
-             0x8c, 0x0b, 0x71, 0x80,
-             0x84, 0x6b, 0x17, 0x14,
-             0xef, 0xc4, 0x64, 0xe8,
-             0x2f, 0x44, 0xac, 0x73,
-             0xe5, 0xc0, 0x0a, 0xf0,
-             0xb9, 0x7e, 0xa9, 0x14,
-             0x04, 0x30, 0x90, 0x24,
-             0x6e, 0x78, 0x8e, 0x1b,
-             0x39, 0x04, 0xef, 0xf4,
-             0xe0, 0x00, 0x46, 0x06,
-             0xa1, 0x24, 0xa9, 0x14,
-             0xa5, 0x64, 0x84, 0x06,
-             0xf6, 0x80, 0x04, 0x24,
-             0x48, 0x32, 0x15, 0xae,
-             0x17, 0x4e, 0xf1, 0x88,
-             0x8f, 0x35, 0x9e, 0x61,
-             0x90, 0x5b, 0x23, 0x04,
-             0x81, 0x81, 0x21, 0x34,
-             0x02, 0x94, 0x83, 0x35,
-             0x00, 0x00, 0x61, 0x7c,
-             0x8c, 0x1f, 0xec, 0x04,
-             0x96, 0x1b, 0x02, 0x93,
-             0x02, 0x06, 0x97, 0x9d,
-             0xa2, 0x93, 0xc0, 0x00,
-             0x60, 0x88, 0x02, 0x94,
-             0x94, 0x13, 0x82, 0x91,
-             0xe0, 0x28, 0x02, 0x15,
-             0xa1, 0x0b, 0x82, 0x83,
-             0x1d, 0x14, 0xfa, 0xb5,
-             0xe0, 0x94, 0x00, 0x84,
-             0x0a, 0xf0, 0x0a, 0xab,
-             0x0e, 0xa4, 0xe5, 0xc0,
-             0xa2, 0x03, 0xe0, 0x88,
-             0xf0, 0x80, 0x04, 0x04,
-             0xe1, 0x94, 0x02, 0x24,
-             0xf6, 0x80, 0x02, 0x14,
-             0xec, 0x18, 0x02, 0x10,
-             0x42, 0x12, 0x82, 0x4d,
-             0x04, 0x24, 0x91, 0x90,
-             0x02, 0x10, 0x08, 0x84,
-             0x42, 0x42, 0x84, 0x14,
-             0x08, 0x56, 0x51, 0x84,
-             0x04, 0x24, 0xc0, 0x00,
-             0x42, 0x42, 0x49, 0x04,
-             0x1f, 0x04, 0xd1, 0x84,
-             0x44, 0x2a, 0xa1, 0x0d,
-             0xb3, 0x44, 0xe6, 0x8e,
-             0xe0, 0x82, 0x40, 0x2a,
-             0xb9, 0x1e, 0xad, 0x34,
-             0x7c, 0x1c, 0x08, 0x25,
-             0xd1, 0x80, 0x00, 0x04,
-             0x7c, 0x28, 0x06, 0x31,
-             0xa5, 0x5e, 0x8e, 0x43,
-             0xef, 0xf4, 0x68, 0xc8,
-             0xad, 0x24, 0x9b, 0x04,
-             0x40, 0x8a, 0xb9, 0x34,
-             0x94, 0x8b, 0x66, 0x82,
-             0x02, 0x04, 0x90, 0x23,
-             0x08, 0x36, 0xf6, 0x80,
-             0x25, 0xc4, 0xa4, 0x1d,
-             0x80, 0x00, 0x02, 0x06,
-             0x02, 0x10, 0x31, 0x44,
-             0x2b, 0x34, 0xcc, 0x08,
-             0x99, 0x54, 0xa3, 0x0f,
-             0x95, 0xa4, 0xb9, 0x1e,
-             0x7c, 0x1c, 0x08, 0x25,
-             0x40, 0x0a, 0x8e, 0x43,
-             0x98, 0x5b, 0x60, 0x16,
-             0xfc, 0x20, 0x06, 0x31,
-             0xef, 0xf4, 0x66, 0xc8,
-             0xb9, 0x14, 0xab, 0x04,
-             0x82, 0x81, 0x10, 0x03,
-             0x97, 0x44, 0x80, 0x16,
-             0x81, 0x8b, 0xa7, 0x04,
-             0x91, 0x14, 0xe2, 0x95,
-             0xb5, 0x34, 0x93, 0x24,
-             0x86, 0x18, 0x84, 0x08,
-             0xe0, 0x54, 0x04, 0x49,
-             0x40, 0x1a, 0x8c, 0x24,
-             0x48, 0x0a, 0xe6, 0x82,
-             0x02, 0x20, 0x66, 0x92,
-             0x8c, 0x1e, 0xe4, 0x04,
-             0x80, 0xb5, 0x89, 0x1b,
-             0x85, 0x11, 0x37, 0x04,
-             0x83, 0x55, 0x80, 0x1e,
-             0x84, 0x75, 0xa1, 0x2d,
-             0x84, 0x25, 0xa1, 0x0b,
-             0x04, 0x29, 0x93, 0x24,
-             0x04, 0x24, 0xe0, 0x40,
-             0x04, 0x0a, 0xfc, 0x00,
-             0x82, 0x35, 0xf0, 0x18,
-             0xe1, 0x82, 0x40, 0x1a,
-             0x1e, 0x05, 0xa1, 0x0b,
-             0x02, 0x56, 0x00, 0x6c,
-             0xfa, 0x65, 0x80, 0x00,
-             0xe5, 0xd0, 0x1e, 0xf0,
-             0xf2, 0x7c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x84, 0x04, 0x0c,
-             0x82, 0x6b, 0x00, 0x7b,
-             0x60, 0x4c, 0x0e, 0x19,
-             0x0e, 0x09, 0x95, 0x21,
-             0x81, 0x51, 0x60, 0x50,
-             0x44, 0x1a, 0x90, 0x5e,
-             0x48, 0x55, 0xe6, 0x8a,
-             0x8a, 0x21, 0xe0, 0x10,
-             0xe6, 0x8a, 0x44, 0x0a,
-             0xc8, 0x21, 0xc2, 0x27,
-             0x64, 0x25, 0x04, 0x8a,
-             0x08, 0xa5, 0xc0, 0x0c,
-             0x80, 0x00, 0x00, 0x66,
-             0xe0, 0x40, 0x0e, 0x29,
-             0x86, 0xd5, 0xee, 0x2d,
-             0xe0, 0x0c, 0x18, 0x36,
-             0xe4, 0x88, 0x58, 0x4a,
-             0x0e, 0xc9, 0x86, 0x35,
-             0xf3, 0xcd, 0xe0, 0x48,
-             0x00, 0x76, 0x04, 0xc5,
-             0x06, 0xc9, 0x80, 0x00,
-             0xfc, 0xcd, 0xe0, 0x2c,
-             0x06, 0xc9, 0x82, 0xb5,
-             0xfc, 0xcd, 0xe0, 0x24,
-             0x06, 0xc9, 0x82, 0x35,
-             0xfc, 0xcd, 0xe0, 0x28,
-             0x06, 0x39, 0x80, 0xb5,
-             0xff, 0x3d, 0xe0, 0x20,
-             0x01, 0x35, 0x82, 0x15,
-             0x93, 0x01, 0x91, 0x01,
-             0x0c, 0x0c, 0x90, 0x0e,
-             0xdd, 0x93, 0xf2, 0x84,
-             0x60, 0x44, 0x0e, 0x39,
-             0xe0, 0xc0, 0x08, 0x14,
-             0xa0, 0x4f, 0x18, 0x5e,
-             0xe0, 0x10, 0x4c, 0x45,
-             0x07, 0xf6, 0x2b, 0x3b,
-             0x58, 0x3e, 0xfe, 0xac,
-             0x07, 0x06, 0x81, 0x31,
-             0xad, 0x2b, 0x00, 0x00,
-             0x04, 0x34, 0x5a, 0x3e,
-             0x4c, 0x25, 0xdc, 0x94,
-             0x81, 0x21, 0x40, 0x0c,
-             0x6f, 0xf8, 0x53, 0xc8,
-             0x0e, 0x09, 0x8c, 0x3b,
-             0x83, 0x21, 0x60, 0x50,
-             0x60, 0x4c, 0x0e, 0x19,
-             0x0c, 0x0c, 0x8c, 0x3b,
-             0x13, 0x18, 0xf2, 0x84,
-             0xc1, 0xc3, 0xff, 0xf8,
-             0xfa, 0x3c, 0x04, 0x0c,
-             0xec, 0x20, 0x1e, 0xf0,
-             0x82, 0x9b, 0x00, 0x6b,
-             0x0e, 0x60, 0x3e, 0x2e,
-             0x08, 0x8b, 0xec, 0x04,
-             0x3c, 0x9e, 0x86, 0xab,
-             0x01, 0x21, 0x81, 0x01,
-             0x01, 0x41, 0x89, 0x31,
-             0x5e, 0xd8, 0x8e, 0x1b,
-             0x8c, 0x5b, 0x6f, 0xd0,
-             0x82, 0xb5, 0xa1, 0x0b,
-             0x81, 0x01, 0x3e, 0xae,
-             0x81, 0x21, 0x3c, 0x9e,
-             0x81, 0x41, 0x11, 0x31,
-             0x8c, 0x5b, 0x0e, 0x1b,
-             0xef, 0xd0, 0x5e, 0x08,
-             0x80, 0xa5, 0xa1, 0x0b,
-             0x0c, 0x0c, 0x90, 0xf1,
-             0xdd, 0x93, 0xf2, 0x3c,
-             0x81, 0x01, 0x3e, 0x8e,
-             0x81, 0x21, 0x3c, 0x9e,
-             0x81, 0x41, 0x21, 0x31,
-             0x8c, 0x5b, 0x0e, 0x1b,
-             0xef, 0xd0, 0x5d, 0x08,
-             0x0c, 0x0c, 0x90, 0xf1,
-             0xdd, 0x93, 0xf2, 0x3c,
-             0x86, 0x05, 0xa1, 0x1b,
-             0x88, 0x0d, 0xff, 0x41,
-             0xc1, 0xac, 0x08, 0x04,
-             0xc1, 0x06, 0x48, 0x4a,
-             0xd1, 0x90, 0x48, 0x12,
-             0x17, 0x80, 0x08, 0x04,
-             0x73, 0xfc, 0x40, 0x00,
-             0x08, 0x44, 0xc0, 0x07,
-             0x08, 0x40, 0x81, 0x2c,
-             0x42, 0x4a, 0x84, 0x04,
-             0x88, 0x16, 0xe1, 0x86,
-             0x81, 0x01, 0x0c, 0x0e,
-             0x5d, 0x93, 0xdd, 0x93,
-             0xe0, 0x08, 0x40, 0x96,
-             0xfe, 0x7c, 0x04, 0x0c,
-             0xec, 0xe0, 0x1e, 0xf0,
-             0x88, 0x6b, 0x00, 0xbb,
-             0x60, 0x18, 0x16, 0x89,
-             0x06, 0x7b, 0x84, 0x4b,
-             0x04, 0xf0, 0x82, 0xab,
-             0x06, 0xf0, 0x64, 0xd0,
-             0x09, 0x4e, 0xe4, 0xa0,
-             0x7d, 0x38, 0x88, 0x0b,
-             0x90, 0x1b, 0x6f, 0xfc,
-             0x64, 0xc0, 0x04, 0xf0,
-             0xe4, 0x90, 0x06, 0xf0,
-             0x90, 0x1b, 0x14, 0x0b,
-             0xef, 0xfc, 0x7c, 0xa8,
-             0x64, 0xb0, 0x04, 0xf0,
-             0xe4, 0x80, 0x06, 0xf0,
-             0x8e, 0x0b, 0x0b, 0x7e,
-             0x6f, 0xfc, 0x7c, 0x28,
-             0x1e, 0x09, 0x90, 0x1b,
-             0x98, 0xb1, 0x60, 0xd0,
-             0x60, 0xc0, 0x1e, 0x39,
-             0xe0, 0x84, 0x04, 0x84,
-             0x60, 0xb0, 0x1e, 0x59,
-             0x42, 0x07, 0x96, 0x23,
-             0xec, 0x08, 0x04, 0x20,
-             0x70, 0x80, 0x42, 0xb2,
-             0x00, 0x10, 0xc2, 0x37,
-             0x4e, 0xb2, 0x6c, 0x08,
-             0x57, 0x0d, 0xf0, 0x8c,
-             0x42, 0x57, 0x84, 0x9b,
-             0x9c, 0x00, 0x52, 0x00,
-             0x6c, 0x08, 0x00, 0x70,
-             0xf0, 0x94, 0x46, 0xb2,
-             0x84, 0x5b, 0x57, 0x0d,
-             0x1c, 0x00, 0x4a, 0x00,
-             0xec, 0x08, 0x00, 0x30,
-             0x84, 0xcb, 0x57, 0x0d,
-             0x58, 0x00, 0x15, 0x04,
-             0xfc, 0x0e, 0x9c, 0x00,
-             0x0b, 0x04, 0x89, 0x04,
-             0x13, 0x04, 0x81, 0xab,
-             0xe0, 0x00, 0x54, 0x1a,
-             0xed, 0x84, 0x40, 0x0a,
-             0x91, 0x04, 0xbe, 0x0e,
-             0x81, 0x01, 0x3c, 0x0e,
-             0x91, 0x95, 0xfe, 0x0e,
-             0x8a, 0xab, 0x0f, 0x8e,
-             0x8e, 0x5b, 0x04, 0x8a,
-             0xa4, 0x0a, 0x8d, 0x9e,
-             0x89, 0x94, 0xfc, 0x74,
-             0x40, 0x0a, 0xb0, 0x03,
-             0x0f, 0x2a, 0x66, 0x9e,
-             0xc0, 0x08, 0x64, 0x00,
-             0x52, 0x1a, 0x8b, 0x74,
-             0x0e, 0x00, 0x60, 0x1c,
-             0xc0, 0x04, 0x64, 0x00,
-             0x40, 0x0d, 0x41, 0x26,
-             0xd7, 0x77, 0x40, 0x00,
-             0x40, 0x0d, 0x5e, 0x05,
-             0x8c, 0x9b, 0x40, 0x00,
-             0x20, 0x00, 0x01, 0x88,
-             0xa0, 0x00, 0x0c, 0x06,
-             0xb0, 0x0a, 0x8c, 0x6a,
-             0xac, 0x03, 0xbc, 0x44,
-             0x66, 0x92, 0x40, 0x0a,
-             0x64, 0x00, 0x09, 0x1a,
-             0x49, 0x26, 0xc0, 0x08,
-             0xc0, 0x00, 0x20, 0x0d,
-             0x20, 0x0d, 0x5e, 0x45,
-             0x00, 0x00, 0x40, 0x00,
-             0xc0, 0x04, 0x64, 0x01,
-             0x80, 0x63, 0xd7, 0x07,
-             0x06, 0x25, 0x8e, 0x83,
-             0x80, 0x00, 0x0e, 0x06,
-             0x82, 0x4b, 0x14, 0x7a,
-             0xbe, 0x14, 0xa8, 0x0a,
-             0x40, 0x0a, 0xae, 0x03,
-             0x03, 0x1a, 0x66, 0x86,
-             0xc0, 0x08, 0x64, 0x00,
-             0x20, 0x0d, 0x43, 0x26,
-             0x5e, 0x15, 0xc0, 0x00,
-             0x40, 0x00, 0x20, 0x0d,
-             0x64, 0x01, 0x00, 0x00,
-             0x57, 0x07, 0xc0, 0x04,
-             0x80, 0x73, 0x88, 0x1b,
-             0x7b, 0x80, 0x00, 0x64,
-             0xfb, 0x80, 0x0c, 0x84,
-             0x7a, 0x80, 0x4c, 0x62,
-             0xe4, 0x08, 0x00, 0x10,
-             0x7b, 0x80, 0x02, 0x74,
-             0xe4, 0x08, 0x41, 0x1a,
-             0x7a, 0x98, 0x42, 0x12,
-             0x59, 0x1c, 0x92, 0x6b,
-             0x42, 0x00, 0x96, 0x1b,
-             0x00, 0x50, 0x3c, 0x00,
-             0x41, 0x1a, 0xe4, 0x08,
-             0x96, 0x7b, 0x64, 0x08,
-             0x4e, 0x00, 0x0d, 0x44,
-             0x00, 0x30, 0xbc, 0x00,
-             0x96, 0x3b, 0x64, 0x08,
-             0x64, 0x08, 0x41, 0x1a,
-             0x46, 0x00, 0x96, 0x9b,
-             0x00, 0x40, 0x3c, 0x00,
-             0x0f, 0x84, 0xe4, 0x08,
-             0xe4, 0x08, 0x41, 0x1a,
-             0x3c, 0x00, 0x52, 0x00,
-             0xe4, 0x08, 0x00, 0xa0,
-             0x64, 0x08, 0x41, 0x1a,
-             0x4a, 0x00, 0x96, 0x5b,
-             0x00, 0xc0, 0x3c, 0x00,
-             0x41, 0x1a, 0xe4, 0x08,
-             0x96, 0xcb, 0x64, 0x08,
-             0x3c, 0x00, 0x58, 0x00,
-             0xec, 0x04, 0x10, 0x80,
-             0xe0, 0x00, 0x10, 0x1a,
-             0x3f, 0xfd, 0x37, 0x68,
-             0x7e, 0x04, 0xc3, 0xff,
-             0x0c, 0x0c, 0xf0, 0xf1,
-             0xdd, 0x93, 0xf6, 0x7c,
-             0x71, 0x88, 0x44, 0x12,
-             0xe1, 0xf5, 0x82, 0x33,
-             0x84, 0x01, 0xc2, 0x07,
-             0x00, 0x04, 0x5d, 0x93,
-             0xc1, 0xc3, 0xfa, 0x80,
-             0xfa, 0x00, 0x00, 0x4c,
-             0xe5, 0x06, 0x44, 0x0a,
-             0x65, 0x86, 0x40, 0x0a,
-             0x04, 0x20, 0x81, 0x11,
-             0xc2, 0x00, 0x64, 0x01,
-             0x72, 0x84, 0x40, 0x02,
-             0xe1, 0xcc, 0x08, 0x24,
-             0x60, 0xb8, 0x02, 0x04,
-             0x06, 0x24, 0xda, 0x07,
-             0xa0, 0x4f, 0x61, 0xc8,
-             0x79, 0x84, 0x44, 0x32,
-             0xfc, 0x7c, 0x00, 0x44,
-             0x60, 0x10, 0x02, 0x06,
-             0x6d, 0x18, 0x81, 0x31,
-             0x08, 0x4c, 0xef, 0xc0,
-             0xdd, 0x93, 0xf2, 0x00,
-             0xfa, 0x04, 0x04, 0x4c,
-             0x80, 0x2b, 0x04, 0x6b,
-             0x4e, 0x96, 0x21, 0x2b,
-             0x82, 0xc5, 0xe0, 0x08,
-             0x60, 0xc8, 0x00, 0x14,
-             0xe1, 0x84, 0x06, 0x24,
-             0xdd, 0x17, 0x06, 0x03,
-             0x81, 0x31, 0x01, 0x71,
-             0x6f, 0xc0, 0x6b, 0xc8,
-             0xf2, 0x9c, 0x42, 0x12,
-             0x8e, 0x0b, 0x98, 0x0e,
-             0xf2, 0x04, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xe5, 0x06, 0x44, 0x0a,
-             0x65, 0x86, 0x40, 0x0a,
-             0x04, 0x20, 0x81, 0x11,
-             0xc2, 0x00, 0x64, 0x01,
-             0x72, 0x84, 0x40, 0x02,
-             0xdc, 0x07, 0xe5, 0x27,
-             0xa4, 0x0f, 0x5d, 0x93,
-             0xfa, 0x00, 0x00, 0x4c,
-             0x82, 0x2b, 0x42, 0x07,
-             0x81, 0x11, 0x04, 0x01,
-             0x7a, 0x80, 0x00, 0x04,
-             0x73, 0x18, 0x81, 0x31,
-             0x04, 0x04, 0xef, 0xc0,
-             0xa2, 0x2f, 0xe1, 0xa0,
-             0x41, 0xfe, 0xa1, 0x2b,
-             0x00, 0x04, 0xdf, 0xfc,
-             0x08, 0x4c, 0xfa, 0x80,
-             0xdd, 0x93, 0xf2, 0x00,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x6f, 0xfc, 0x7a, 0x08,
-             0x02, 0x64, 0x84, 0x6b,
-             0x82, 0x03, 0xe1, 0x84,
-             0xe0, 0x1a, 0x40, 0x0a,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x69, 0x29, 0x43, 0x86,
-             0x44, 0x1a, 0xc0, 0x01,
-             0x40, 0x1a, 0xe5, 0x02,
-             0x81, 0x11, 0x65, 0x82,
-             0x64, 0x01, 0x04, 0x20,
-             0x40, 0x02, 0xc2, 0x00,
-             0xe5, 0x27, 0x72, 0x84,
-             0x5d, 0x93, 0xdc, 0x07,
-             0xc1, 0xc3, 0xa4, 0x0f,
-             0x04, 0x34, 0x83, 0x31,
-             0xa3, 0x3f, 0x68, 0x88,
-             0x42, 0x2a, 0x82, 0x21,
-             0x80, 0x13, 0xe6, 0x8e,
-             0x00, 0x14, 0x5d, 0x93,
-             0xc1, 0xc3, 0xfb, 0x80,
-             0xfa, 0x04, 0x04, 0x4c,
-             0x84, 0x7b, 0x06, 0x6b,
-             0xef, 0xfc, 0x77, 0x28,
-             0x84, 0x61, 0xc2, 0x67,
-             0xfa, 0x80, 0x02, 0x64,
-             0xe6, 0x9e, 0x42, 0x1a,
-             0xe5, 0x02, 0x44, 0x1a,
-             0x65, 0x82, 0x40, 0x1a,
-             0x04, 0x20, 0x81, 0x11,
-             0xc0, 0x08, 0x64, 0x01,
-             0x72, 0x84, 0x40, 0x02,
-             0xe8, 0x07, 0xd9, 0x27,
-             0x0c, 0x4c, 0xa4, 0x0f,
-             0xdd, 0x93, 0xf2, 0x04,
-             0x81, 0x11, 0x21, 0x0b,
-             0x00, 0x00, 0x84, 0x65,
-             0x04, 0x0e, 0x6c, 0x04,
-             0x46, 0x02, 0xff, 0xf0,
-             0xa1, 0x3b, 0xf8, 0x08,
-             0x41, 0x84, 0x00, 0x04,
-             0xc4, 0x04, 0x02, 0x10,
-             0x02, 0x14, 0xfe, 0x35,
-             0x00, 0x04, 0x7b, 0x80,
-             0xd0, 0x17, 0xfa, 0x80,
-             0x5d, 0x93, 0xa0, 0x1f,
-             0xfb, 0x80, 0x00, 0x14,
-             0x7a, 0x80, 0x02, 0x04,
-             0xa1, 0x1f, 0xd1, 0x07,
-             0x00, 0x10, 0x5d, 0x93,
-             0xc1, 0xc3, 0xe4, 0x04,
-             0xfa, 0x00, 0x00, 0x4c,
-             0xe5, 0x02, 0x48, 0x2a,
-             0xe5, 0x82, 0x4a, 0x2a,
-             0x65, 0x06, 0x40, 0x3a,
-             0x42, 0x3a, 0x88, 0x2b,
-             0x8a, 0x3b, 0x65, 0x86,
-             0xef, 0xc0, 0x6b, 0x08,
-             0x60, 0x01, 0x04, 0x06,
-             0x81, 0x31, 0x42, 0x00,
-             0x42, 0x12, 0x84, 0x03,
-             0xf9, 0x07, 0x72, 0x8c,
-             0x60, 0x90, 0x04, 0x14,
-             0x24, 0x0f, 0xf9, 0x17,
-             0x85, 0x0b, 0xff, 0x21,
-             0x1f, 0xfc, 0x41, 0xfe,
-             0x41, 0xfe, 0xa1, 0x1b,
-             0x08, 0x4c, 0xdf, 0xfc,
-             0xdd, 0x93, 0xf2, 0x00,
-             0xfa, 0x04, 0x04, 0x4c,
-             0x86, 0x6b, 0x21, 0x1b,
-             0x81, 0x71, 0x0a, 0x45,
-             0x88, 0xe5, 0xa1, 0x2b,
-             0x7e, 0x81, 0x06, 0x0e,
-             0x48, 0x1a, 0x40, 0x00,
-             0x4a, 0x0a, 0xe5, 0x0a,
-             0x40, 0x0a, 0xe5, 0x0e,
-             0x46, 0x1a, 0xe5, 0x8e,
-             0x18, 0x54, 0x65, 0x8a,
-             0x56, 0x07, 0xe1, 0xd4,
-             0xe1, 0x84, 0x02, 0x44,
-             0x00, 0x34, 0x20, 0xcf,
-             0x56, 0x57, 0xe0, 0xfc,
-             0x04, 0x34, 0xa0, 0x1f,
-             0x40, 0x12, 0x61, 0x84,
-             0x42, 0x22, 0xf0, 0x94,
-             0x88, 0x2b, 0x72, 0xb0,
-             0xef, 0xc0, 0x5d, 0xe8,
-             0x85, 0x0b, 0xff, 0x21,
-             0x1f, 0xfc, 0x41, 0xfe,
-             0x01, 0x65, 0xa1, 0x1b,
-             0xdf, 0xfc, 0x41, 0xfe,
-             0x4e, 0x96, 0x01, 0x01,
-             0x18, 0x0e, 0xe0, 0x08,
-             0x0c, 0x4c, 0x8e, 0x0b,
-             0xdd, 0x93, 0xf2, 0x04,
-             0x7f, 0xfd, 0x47, 0xfe,
-             0x86, 0x0d, 0xc0, 0x3f,
-             0x00, 0x00, 0x06, 0x02,
-             0x08, 0x3e, 0xa1, 0x1b,
-             0x80, 0x00, 0x02, 0x06,
-             0x40, 0x9c, 0x06, 0x34,
-             0xc1, 0x84, 0x08, 0x14,
-             0x50, 0x90, 0x46, 0x32,
-             0x42, 0x3a, 0x81, 0x01,
-             0x40, 0x96, 0x40, 0x06,
-             0x88, 0x1e, 0x80, 0x08,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x8a, 0x25, 0xa1, 0x2b,
-             0x0a, 0x02, 0x06, 0x13,
-             0x06, 0x14, 0xe0, 0x00,
-             0x03, 0x0a, 0x7a, 0x80,
-             0x08, 0x30, 0xf4, 0x7c,
-             0x81, 0x11, 0x6c, 0x80,
-             0x7b, 0x90, 0x46, 0x32,
-             0x00, 0x32, 0x81, 0x41,
-             0x48, 0x50, 0x6c, 0x7c,
-             0x0a, 0x06, 0x9c, 0x00,
-             0x18, 0x44, 0x00, 0x00,
-             0x0c, 0x04, 0xef, 0x80,
-             0xa0, 0x33, 0x6c, 0x00,
-             0x78, 0xb0, 0x58, 0x62,
-             0x21, 0x4f, 0xa1, 0x5f,
-             0xe1, 0x84, 0x00, 0x24,
-             0x06, 0x32, 0x38, 0x5f,
-             0x27, 0x5f, 0xec, 0x04,
-             0x42, 0x52, 0x88, 0x03,
-             0x81, 0x31, 0x72, 0x84,
-             0xef, 0xc0, 0x58, 0xa8,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x00, 0x00, 0x4c,
-             0xa1, 0x2b, 0x00, 0x3b,
-             0xe5, 0x06, 0x40, 0x3a,
-             0xe5, 0x86, 0x42, 0x3a,
-             0x06, 0x20, 0x82, 0x65,
-             0x83, 0x41, 0x6c, 0x04,
-             0x81, 0x31, 0x27, 0x4f,
-             0x66, 0xb8, 0x88, 0x03,
-             0x42, 0x12, 0x6f, 0xc0,
-             0xff, 0x21, 0xf2, 0x8c,
-             0x41, 0xfe, 0x85, 0x0b,
-             0xa1, 0x1b, 0x1f, 0xfc,
-             0xdf, 0xfc, 0x41, 0xfe,
-             0xf2, 0x00, 0x08, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfe, 0x00, 0x04, 0x4c,
-             0xa3, 0x2d, 0x00, 0x3b,
-             0xe4, 0x06, 0x40, 0x3a,
-             0xe4, 0x86, 0x42, 0x3a,
-             0x08, 0x20, 0x86, 0x75,
-             0x83, 0x31, 0x6c, 0x04,
-             0x68, 0x90, 0x08, 0x34,
-             0x21, 0x1d, 0x81, 0xc1,
-             0xe1, 0x7c, 0x0a, 0x44,
-             0x71, 0x90, 0x4c, 0xc2,
-             0xe8, 0x88, 0x04, 0x34,
-             0x73, 0x94, 0x58, 0xc2,
-             0xdc, 0x00, 0x48, 0x60,
-             0x5c, 0x00, 0x4a, 0xc0,
-             0x42, 0x52, 0x88, 0x03,
-             0x06, 0x24, 0x72, 0x84,
-             0x47, 0xf8, 0xe1, 0x7c,
-             0x03, 0x4a, 0xef, 0xc0,
-             0x02, 0x1a, 0xe0, 0x00,
-             0x00, 0xea, 0xe0, 0x00,
-             0x42, 0x0a, 0xe0, 0x00,
-             0x42, 0x1a, 0xe5, 0x80,
-             0x42, 0x0a, 0xe1, 0x88,
-             0x80, 0xf5, 0xed, 0x80,
-             0x7f, 0xfd, 0x41, 0xfe,
-             0x0c, 0x4c, 0xdf, 0xff,
-             0xdd, 0x93, 0xf6, 0x00,
-             0x06, 0x06, 0x7f, 0x21,
-             0xe0, 0x00, 0x60, 0x01,
-             0xe0, 0x08, 0x43, 0x4a,
-             0xe0, 0x08, 0x42, 0x1a,
-             0xe4, 0x0c, 0x41, 0x6a,
-             0xe5, 0x80, 0x42, 0x0a,
-             0xe1, 0x88, 0x42, 0x1a,
-             0xed, 0x80, 0x42, 0x0a,
-             0x00, 0x01, 0x00, 0x06,
-             0x0c, 0x4c, 0xe0, 0x00,
-             0xdd, 0x93, 0xf6, 0x00,
-             0xfa, 0x7c, 0x04, 0x4c,
-             0x86, 0x6b, 0x04, 0x4b,
-             0x70, 0x90, 0x08, 0x09,
-             0x08, 0x29, 0x81, 0x51,
-             0x12, 0x10, 0x78, 0x8c,
-             0x08, 0x39, 0xe6, 0x00,
-             0x14, 0x10, 0x78, 0x84,
-             0x18, 0x06, 0xe4, 0xc0,
-             0xff, 0xf8, 0x57, 0xce,
-             0x4e, 0x46, 0x1a, 0x26,
-             0x58, 0x56, 0xe0, 0x00,
-             0xda, 0x36, 0x81, 0x81,
-             0x89, 0xa5, 0x8f, 0x4e,
-             0xf0, 0xa0, 0x40, 0x42,
-             0xe0, 0x40, 0x00, 0x19,
-             0x8a, 0xa5, 0xa1, 0x1b,
-             0xe0, 0x60, 0x00, 0x19,
-             0x8a, 0x25, 0xa1, 0x1b,
-             0xa1, 0x1b, 0xa4, 0x1a,
-             0x08, 0x19, 0x88, 0xc5,
-             0x44, 0x62, 0x7c, 0x20,
-             0x44, 0x11, 0xf0, 0xa0,
-             0x00, 0x19, 0xe0, 0x10,
-             0x44, 0x11, 0xe0, 0x20,
-             0x00, 0x19, 0xe0, 0x30,
-             0x44, 0x11, 0xe0, 0x40,
-             0x00, 0x09, 0xe0, 0x50,
-             0x44, 0x01, 0xe0, 0x60,
-             0xa4, 0x2a, 0xe0, 0x70,
-             0xaa, 0x14, 0xa8, 0x04,
-             0xe1, 0x84, 0x06, 0x24,
-             0x81, 0x31, 0x06, 0x03,
-             0x6f, 0xc0, 0x4d, 0xa8,
-             0xf2, 0x94, 0x42, 0x12,
-             0x42, 0x62, 0x0f, 0x44,
-             0x04, 0x0e, 0xf0, 0x9c,
-             0x12, 0x0b, 0x81, 0x51,
-             0x81, 0xf5, 0xf8, 0x20,
-             0xf0, 0xa0, 0x40, 0x62,
-             0xe0, 0x10, 0x40, 0x51,
-             0xe0, 0x30, 0x40, 0x51,
-             0xe0, 0x50, 0x40, 0x51,
-             0x60, 0x70, 0x40, 0x51,
-             0xf0, 0x9c, 0x40, 0x62,
-             0x81, 0x01, 0x00, 0x5e,
-             0x71, 0xac, 0x42, 0x62,
-             0x04, 0x0c, 0x82, 0x81,
-             0xec, 0x08, 0x16, 0xb0,
-             0x88, 0x71, 0x04, 0x91,
-             0xb1, 0x8b, 0x90, 0xa1,
-             0x81, 0x01, 0xec, 0xd5,
-             0xf2, 0x7c, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xf8, 0x7c, 0x04, 0x0c,
-             0x06, 0x00, 0x06, 0x28,
-             0x60, 0x01, 0xe6, 0x00,
-             0xe6, 0x10, 0x08, 0x10,
-             0x65, 0x10, 0x0a, 0x10,
-             0x59, 0xc6, 0xf8, 0x11,
-             0x81, 0x61, 0x60, 0x00,
-             0x02, 0x79, 0x83, 0xf5,
-             0xa1, 0x7b, 0xf8, 0x20,
-             0x84, 0x78, 0x84, 0xa5,
-             0x84, 0x45, 0xa1, 0x7b,
-             0x80, 0x84, 0x94, 0x74,
-             0x06, 0xab, 0x82, 0x94,
-             0x10, 0x7a, 0xf8, 0x20,
-             0x0c, 0xba, 0x8e, 0x83,
-             0xf2, 0x98, 0x52, 0x92,
-             0x00, 0x8e, 0x82, 0x9e,
-             0x46, 0xa3, 0x8e, 0xa3,
-             0x82, 0xb1, 0x78, 0x20,
-             0x02, 0xc1, 0x8c, 0xbc,
-             0x04, 0x41, 0x84, 0x31,
-             0x08, 0x51, 0x90, 0x01,
-             0x0e, 0xc0, 0x82, 0x11,
-             0x85, 0x7d, 0xec, 0xf0,
-             0x0c, 0x0c, 0xf6, 0xf5,
-             0xdd, 0x93, 0xf0, 0x7c,
-             0xfa, 0x3c, 0x04, 0x0c,
-             0x84, 0x6b, 0x06, 0x28,
-             0x83, 0x81, 0x44, 0x38,
-             0x80, 0x7b, 0x46, 0x08,
-             0x91, 0x11, 0x25, 0x8f,
-             0x6f, 0xfc, 0x5c, 0xe8,
-             0xe8, 0x8c, 0x12, 0x84,
-             0x14, 0x04, 0x1c, 0x14,
-             0x1e, 0x34, 0xe0, 0x90,
-             0x02, 0x0b, 0x90, 0x2b,
-             0x64, 0x18, 0x94, 0x1b,
-             0x1c, 0x14, 0xef, 0xfc,
-             0x98, 0x0e, 0x92, 0x2b,
-             0x02, 0x0b, 0x9e, 0x34,
-             0x63, 0x98, 0x94, 0x1b,
-             0x9c, 0x24, 0xef, 0xfc,
-             0x0e, 0x1b, 0x9a, 0x0e,
-             0x1e, 0x34, 0xe0, 0x10,
-             0x63, 0x18, 0x84, 0x0b,
-             0x92, 0x2b, 0x6f, 0xfc,
-             0x0c, 0x0c, 0xd8, 0x0e,
-             0xdd, 0x93, 0xf2, 0x3c,
-             0xfa, 0x1c, 0x04, 0x4c,
-             0x88, 0x7b, 0x44, 0x48,
-             0x81, 0x01, 0x00, 0x9b,
-             0x84, 0x6b, 0x0a, 0x8b,
-             0x86, 0x0b, 0x0b, 0x0e,
-             0x90, 0x2b, 0x0e, 0x1b,
-             0x68, 0x00, 0x43, 0x48,
-             0xab, 0x9b, 0x88, 0x3b,
-             0xa5, 0x9b, 0x84, 0x05,
-             0x0c, 0x60, 0x02, 0xe5,
-             0xa7, 0x9b, 0x84, 0x10,
-             0xa9, 0x9b, 0x82, 0x45,
-             0x40, 0x80, 0x02, 0x25,
-             0xa3, 0x9b, 0x9c, 0x00,
-             0x08, 0x61, 0x86, 0x75,
-             0x81, 0x25, 0x8e, 0x0b,
-             0x0d, 0x14, 0x90, 0x61,
-             0xe4, 0x50, 0x06, 0xf0,
-             0x62, 0x98, 0x98, 0x24,
-             0x0b, 0x14, 0xef, 0xfc,
-             0xe0, 0x00, 0x00, 0x1a,
-             0x61, 0x9c, 0x4e, 0x0a,
-             0x0f, 0x24, 0x81, 0x01,
-             0x20, 0x01, 0x02, 0x06,
-             0x02, 0x06, 0xc0, 0x00,
-             0x88, 0x1e, 0xc0, 0x00,
-             0xf2, 0x1c, 0x0c, 0x4c,
-             0x40, 0xc6, 0xdd, 0x93,
-             0x4e, 0x0a, 0x60, 0x08,
-             0x4e, 0x1a, 0xe9, 0x9c,
-             0x81, 0x11, 0x61, 0x9c,
-             0xc1, 0xc3, 0xfd, 0xf5,
-             0x84, 0x03, 0xa7, 0x2f,
-             0x5c, 0x08, 0xc3, 0x0d,
-             0x00, 0x06, 0x1a, 0x00,
-             0x5d, 0x93, 0x80, 0x00,
-             0xf1, 0x80, 0x40, 0x12,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x50, 0x1e, 0xf0,
-             0x64, 0x61, 0x00, 0x00,
-             0x81, 0x41, 0x40, 0x03,
-             0xfc, 0x1e, 0xbe, 0x0e,
-             0x06, 0x08, 0x8b, 0xf5,
-             0x01, 0xb1, 0x81, 0xa1,
-             0x81, 0x4d, 0x81, 0x71,
-             0x7e, 0x4e, 0x92, 0x65,
-             0x02, 0x09, 0x88, 0x13,
-             0x81, 0xa1, 0x60, 0xb0,
-             0x60, 0xf0, 0x02, 0x39,
-             0x02, 0x49, 0x81, 0xb1,
-             0x81, 0x61, 0x60, 0x90,
-             0x60, 0xd0, 0x02, 0x29,
-             0x42, 0x0a, 0x9d, 0x11,
-             0x80, 0x33, 0x66, 0x86,
-             0x81, 0x71, 0x3e, 0x54,
-             0x88, 0x23, 0x08, 0x13,
-             0xc4, 0x17, 0x09, 0x4e,
-             0x81, 0x41, 0x02, 0x53,
-             0x18, 0x85, 0x83, 0x25,
-             0xc0, 0x01, 0x78, 0x31,
-             0x10, 0xa3, 0xf1, 0x94,
-             0x48, 0x42, 0x81, 0x81,
-             0x92, 0xb3, 0xf2, 0xa0,
-             0x72, 0xa0, 0x4c, 0x62,
-             0x82, 0x11, 0x82, 0x71,
-             0xfc, 0x55, 0x85, 0x1d,
-             0xf0, 0x51, 0x02, 0x01,
-             0x1e, 0x15, 0x87, 0x0d,
-             0x58, 0x50, 0x40, 0x10,
-             0xfc, 0xf5, 0xdc, 0x00,
-             0x84, 0xd5, 0xe5, 0x7d,
-             0x61, 0x84, 0x10, 0x74,
-             0x40, 0x82, 0x81, 0x91,
-             0x81, 0x31, 0x70, 0xa8,
-             0x72, 0xa4, 0x42, 0x42,
-             0x7b, 0x98, 0x8e, 0x2b,
-             0x00, 0xab, 0xef, 0xbc,
-             0xf0, 0xac, 0x40, 0x82,
-             0x72, 0xa4, 0x42, 0x62,
-             0x7b, 0x18, 0x81, 0x31,
-             0x8e, 0x2b, 0x6f, 0xbc,
-             0xfc, 0x14, 0x80, 0xbb,
-             0x00, 0x44, 0xfe, 0x44,
-             0x06, 0x10, 0x60, 0x88,
-             0x04, 0x44, 0xe5, 0x10,
-             0x86, 0x03, 0x60, 0x84,
-             0x82, 0x41, 0x04, 0x33,
-             0x40, 0xb5, 0x80, 0xae,
-             0x46, 0x73, 0xe0, 0x20,
-             0x84, 0x08, 0xe0, 0x80,
-             0xe8, 0x15, 0x81, 0x4d,
-             0x0c, 0x0c, 0xa8, 0xf1,
-             0xdd, 0x93, 0xf2, 0x7c,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x70, 0x1e, 0xf0,
-             0x81, 0xc1, 0x30, 0x01,
-             0x82, 0x7b, 0x7c, 0x0e,
-             0x0c, 0x70, 0x0d, 0xce,
-             0x0b, 0xce, 0xe4, 0xf0,
-             0x89, 0xce, 0x81, 0xa1,
-             0xfc, 0x94, 0xfe, 0xce,
-             0x1e, 0x08, 0x89, 0x55,
-             0x8d, 0xce, 0x81, 0x11,
-             0x01, 0xad, 0xfe, 0xce,
-             0x89, 0xce, 0x81, 0x01,
-             0x8c, 0x05, 0x8b, 0xce,
-             0x70, 0xa8, 0x56, 0x62,
-             0xf0, 0xa8, 0x50, 0x92,
-             0x78, 0xe0, 0x16, 0x09,
-             0xe4, 0x30, 0x04, 0xf0,
-             0x78, 0xa0, 0x16, 0x19,
-             0xe4, 0x60, 0x0a, 0xf0,
-             0xf8, 0x20, 0x10, 0x39,
-             0xe0, 0x20, 0x10, 0x49,
-             0x9b, 0x21, 0x3c, 0x2e,
-             0xe8, 0x00, 0x43, 0x08,
-             0x78, 0xc0, 0x16, 0x09,
-             0xe4, 0x50, 0x04, 0xf0,
-             0x78, 0x80, 0x16, 0x19,
-             0xe4, 0x40, 0x0a, 0xf0,
-             0xfc, 0x28, 0x12, 0x39,
-             0xe0, 0x40, 0x10, 0x49,
-             0x93, 0x21, 0x3c, 0x2e,
-             0xe8, 0x00, 0x42, 0x08,
-             0x81, 0xc1, 0x7e, 0x04,
-             0x80, 0x85, 0xa1, 0x0b,
-             0xa1, 0x1b, 0x8b, 0x14,
-             0x7e, 0xce, 0x80, 0xb5,
-             0x0b, 0xce, 0x81, 0x11,
-             0x0d, 0x24, 0x81, 0x01,
-             0xf0, 0xa8, 0x48, 0x62,
-             0x82, 0xa1, 0x09, 0x34,
-             0xf8, 0x20, 0x48, 0x01,
-             0xf8, 0x60, 0x48, 0x21,
-             0xf8, 0x40, 0x48, 0x31,
-             0x9c, 0x08, 0x90, 0x16,
-             0xee, 0x55, 0x81, 0xad,
-             0x0c, 0x0c, 0xb8, 0xf1,
-             0xdd, 0x93, 0xf2, 0x7c,
-             0x58, 0x12, 0x00, 0x33,
-             0x14, 0x3e, 0xf0, 0x80,
-             0xf0, 0x90, 0x40, 0x32,
-             0x00, 0x00, 0x19, 0x0d,
-             0x00, 0x1b, 0xec, 0x04,
-             0x02, 0xc0, 0x81, 0x51,
-             0x3c, 0x14, 0x8c, 0x04,
-             0xfb, 0x04, 0x44, 0x22,
-             0x82, 0x35, 0x84, 0x3d,
-             0x88, 0x5b, 0x04, 0x0d,
-             0xc0, 0x00, 0x00, 0x16,
-             0xd1, 0x8c, 0x40, 0x02,
-             0xd0, 0x88, 0x4a, 0x02,
-             0xdd, 0x93, 0x84, 0x5e,
-             0xfa, 0x3c, 0x04, 0x0c,
-             0xec, 0x20, 0x1e, 0xf0,
-             0x82, 0x8b, 0x0a, 0x6b,
-             0x84, 0x7b, 0x11, 0x94,
-             0x8c, 0x1b, 0x08, 0x0b,
-             0x6f, 0xfc, 0x69, 0x88,
-             0x01, 0x01, 0x90, 0x2b,
-             0x85, 0x65, 0x91, 0xa1,
-             0x88, 0x35, 0xa1, 0x0b,
-             0x60, 0x80, 0x12, 0x15,
-             0x12, 0x45, 0x81, 0x31,
-             0x90, 0x2b, 0x60, 0x40,
-             0xe0, 0x60, 0x12, 0x55,
-             0xbe, 0x9e, 0x9c, 0x08,
-             0x8c, 0x1b, 0x3c, 0x1e,
-             0xef, 0xfc, 0x6b, 0x08,
-             0x84, 0x35, 0xa1, 0x0b,
-             0x60, 0x80, 0x12, 0x15,
-             0xe4, 0x80, 0x04, 0x90,
-             0x60, 0x40, 0x12, 0x45,
-             0x12, 0x55, 0x81, 0x31,
-             0x9e, 0x08, 0xe0, 0x60,
-             0x90, 0x2b, 0x3e, 0x2e,
-             0x8c, 0x1b, 0x3c, 0x1e,
-             0xef, 0xfc, 0x69, 0xe8,
-             0x6c, 0x04, 0x14, 0xa0,
-             0xa1, 0xab, 0x88, 0x91,
-             0x90, 0xf1, 0xf6, 0x55,
-             0xf2, 0x3c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x3c, 0x04, 0x0c,
-             0xec, 0x20, 0x1e, 0xf0,
-             0x82, 0x7b, 0x15, 0x84,
-             0x84, 0x6b, 0x17, 0x94,
-             0x8e, 0x2b, 0x13, 0x04,
-             0x6f, 0xfc, 0x65, 0xc8,
-             0x01, 0x01, 0x90, 0x1b,
-             0xe0, 0x08, 0x14, 0xc6,
-             0xa1, 0x0b, 0x85, 0x75,
-             0x12, 0x15, 0x88, 0x55,
-             0x81, 0x31, 0x68, 0xc0,
-             0x64, 0x60, 0x12, 0x45,
-             0x12, 0x55, 0x8e, 0x2b,
-             0x98, 0x08, 0xe6, 0x90,
-             0x3c, 0x1e, 0xbe, 0x9e,
-             0x67, 0x38, 0x90, 0x1b,
-             0xa1, 0x0b, 0xef, 0xfc,
-             0x12, 0x15, 0x84, 0x55,
-             0x04, 0x90, 0x68, 0xc0,
-             0xc0, 0x02, 0x64, 0xc0,
-             0x64, 0x60, 0x12, 0x45,
-             0x12, 0x55, 0x81, 0x31,
-             0x9a, 0x08, 0xe6, 0x90,
-             0x8e, 0x2b, 0x3e, 0x2e,
-             0x90, 0x1b, 0x3c, 0x1e,
-             0xef, 0xfc, 0x66, 0x08,
-             0x6c, 0x04, 0x14, 0xa0,
-             0xa1, 0xab, 0x88, 0x91,
-             0x90, 0xf1, 0xf6, 0x35,
-             0xf2, 0x3c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x3c, 0x04, 0x0c,
-             0xec, 0x40, 0x1e, 0xf0,
-             0x80, 0x9b, 0x15, 0x84,
-             0x84, 0x7b, 0x0a, 0x6b,
-             0x00, 0x80, 0x82, 0xab,
-             0x08, 0x80, 0x64, 0x50,
-             0x3c, 0x0e, 0xe4, 0x10,
-             0xe4, 0x40, 0x0a, 0x80,
-             0xef, 0xfc, 0x77, 0x68,
-             0x84, 0x15, 0xa1, 0x0b,
-             0x67, 0xa0, 0x02, 0x80,
-             0xe7, 0x60, 0x00, 0x80,
-             0x04, 0x80, 0x7e, 0x1e,
-             0x7c, 0x2e, 0xe7, 0x90,
-             0x3e, 0x0e, 0x94, 0x1b,
-             0x7a, 0x38, 0x8e, 0x2b,
-             0xa1, 0x0b, 0xef, 0xfc,
-             0xa0, 0xf1, 0x80, 0xa5,
-             0xf2, 0x3c, 0x0c, 0x0c,
-             0x17, 0x44, 0xdd, 0x93,
-             0x0e, 0x1b, 0x92, 0x0b,
-             0x10, 0x3b, 0x8c, 0x2b,
-             0x0c, 0x0c, 0xa0, 0xf1,
-             0x81, 0x15, 0xf2, 0x3c,
-             0xfa, 0x0c, 0x04, 0x0c,
-             0x86, 0x8b, 0x08, 0x6b,
-             0x84, 0x7b, 0x02, 0x0b,
-             0x6f, 0xfc, 0x6d, 0x88,
-             0x10, 0x0b, 0x8c, 0x1b,
-             0x66, 0x38, 0x8c, 0x1b,
-             0x10, 0x09, 0xef, 0xfc,
-             0x00, 0x00, 0xe3, 0x58,
-             0xe2, 0x0d, 0xec, 0x0c,
-             0x1c, 0x00, 0x40, 0x70,
-             0x9c, 0x00, 0x42, 0x60,
-             0x8f, 0xfc, 0x5a, 0xe8,
-             0x0c, 0x0c, 0x81, 0x01,
-             0xdd, 0x93, 0xf2, 0x0c,
-             0xf8, 0x3c, 0x04, 0x4c,
-             0x62, 0x01, 0x02, 0x5b,
-             0x81, 0xc1, 0x40, 0x01,
-             0x0c, 0xc4, 0x85, 0x95,
-             0x0e, 0x64, 0xfb, 0x80,
-             0x82, 0x63, 0x60, 0x84,
-             0x60, 0x01, 0x0c, 0x89,
-             0x82, 0x73, 0x40, 0x02,
-             0xe8, 0x00, 0x0e, 0x7b,
-             0x06, 0xa5, 0xc4, 0x87,
-             0xc4, 0x77, 0x7c, 0x20,
-             0xfc, 0x1c, 0x00, 0x95,
-             0x50, 0x82, 0xd3, 0xad,
-             0x50, 0x95, 0xd0, 0x8c,
-             0x04, 0x89, 0xc0, 0x00,
-             0xa1, 0x8b, 0xe0, 0x30,
-             0x0c, 0x60, 0x82, 0xc5,
-             0x40, 0x08, 0x64, 0x01,
-             0x98, 0x68, 0x80, 0x73,
-             0xc4, 0x67, 0x9c, 0x74,
-             0x7c, 0x18, 0x08, 0x85,
-             0x88, 0x63, 0xcf, 0x77,
-             0x98, 0x8e, 0x8e, 0x83,
-             0x58, 0x8a, 0x82, 0xc1,
-             0xf4, 0xd5, 0xec, 0x14,
-             0x0c, 0x4c, 0x81, 0x01,
-             0xdd, 0x93, 0xf0, 0x3c,
-             0xf8, 0x7c, 0x04, 0xcc,
-             0x81, 0xc1, 0x0f, 0x4e,
-             0x81, 0x61, 0x0d, 0x3e,
-             0x64, 0x09, 0x00, 0x39,
-             0x87, 0x45, 0xc0, 0x02,
-             0x60, 0x34, 0x02, 0x99,
-             0xfa, 0x80, 0x0e, 0xc4,
-             0x60, 0x30, 0x02, 0xb9,
-             0x04, 0x85, 0xc4, 0x77,
-             0xa1, 0xbb, 0xfc, 0x1c,
-             0xe5, 0xa6, 0x54, 0x8a,
-             0x65, 0x26, 0x50, 0x8a,
-             0xf0, 0x9c, 0x52, 0x22,
-             0xd1, 0x87, 0xf0, 0xa7,
-             0x56, 0x82, 0x0f, 0x84,
-             0x8e, 0x83, 0xf9, 0xa8,
-             0x8d, 0xa4, 0xa0, 0xbe,
-             0x8e, 0xa3, 0x02, 0xc5,
-             0xc6, 0x5a, 0xa8, 0x64,
-             0xe5, 0x16, 0x48, 0x6a,
-             0xe5, 0x96, 0x4a, 0x6a,
-             0xee, 0x57, 0xd3, 0x47,
-             0xf9, 0x94, 0x4c, 0x42,
-             0xa0, 0xbe, 0x8c, 0xb3,
-             0x80, 0x73, 0x24, 0x44,
-             0x4e, 0x45, 0x82, 0xc1,
-             0xa8, 0x44, 0xe9, 0x04,
-             0xe9, 0x44, 0x4e, 0x45,
-             0x4e, 0x65, 0xa0, 0x44,
-             0x4e, 0x45, 0xe9, 0xc4,
-             0x58, 0x8a, 0xe9, 0x84,
-             0xf2, 0x75, 0xf4, 0x0c,
-             0x0c, 0xcc, 0x81, 0x01,
-             0xdd, 0x93, 0xf0, 0x7c,
-             0xf8, 0x00, 0x04, 0x4c,
-             0x81, 0x41, 0x19, 0x31,
-             0x18, 0x54, 0x83, 0x95,
-             0x4c, 0x12, 0x60, 0x84,
-             0x02, 0xc3, 0xf0, 0x94,
-             0x18, 0x5b, 0x82, 0x41,
-             0x0c, 0xc9, 0xe8, 0x00,
-             0xc0, 0x02, 0x60, 0x01,
-             0xe0, 0x88, 0x0c, 0x54,
-             0x7c, 0x18, 0x00, 0x65,
-             0x04, 0xc5, 0xc4, 0xc7,
-             0xd9, 0x6d, 0xfc, 0x30,
-             0xd0, 0x80, 0x4a, 0x52,
-             0x0c, 0x01, 0x4a, 0x31,
-             0x02, 0xcb, 0xc0, 0x04,
-             0x40, 0x01, 0x62, 0x01,
-             0xfb, 0x80, 0x0a, 0x44,
-             0xf8, 0x55, 0xd9, 0x5d,
-             0x0c, 0x4c, 0x81, 0x01,
-             0xdd, 0x93, 0xf0, 0x00,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xef, 0x10, 0x1e, 0xf0,
-             0x84, 0x8b, 0x02, 0x6b,
-             0x64, 0x09, 0x0c, 0x09,
-             0x80, 0x7b, 0x40, 0x02,
-             0x65, 0x10, 0x02, 0xf0,
-             0xe6, 0x10, 0x04, 0xf0,
-             0x81, 0x31, 0x01, 0x65,
-             0x00, 0x00, 0x49, 0x3e,
-             0xc5, 0x3e, 0xec, 0x04,
-             0xfe, 0x75, 0xa1, 0x0b,
-             0x66, 0x10, 0x12, 0xf0,
-             0xe5, 0x10, 0x14, 0xf0,
-             0x8c, 0x1b, 0x0e, 0x0b,
-             0x92, 0x3b, 0x10, 0x2b,
-             0x6f, 0xfc, 0x74, 0x08,
-             0x16, 0xf0, 0x94, 0x4b,
-             0x8c, 0x0b, 0x64, 0x10,
-             0x92, 0x2b, 0x10, 0x1b,
-             0x96, 0x4b, 0x14, 0x3b,
-             0xef, 0xfc, 0x76, 0xc8,
-             0x8c, 0x1b, 0x0e, 0x0b,
-             0x6f, 0xfc, 0x7a, 0xc8,
-             0x01, 0x01, 0x96, 0x2b,
-             0xe7, 0x10, 0x1e, 0xf0,
-             0xf2, 0x7c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xff, 0x01, 0x00, 0x24,
-             0x83, 0x2d, 0x84, 0x14,
-             0x00, 0x00, 0x00, 0x06,
-             0x5d, 0x93, 0x82, 0x2d,
-             0xc0, 0x00, 0x00, 0x16,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x90, 0x1e, 0xf0,
-             0x82, 0x9b, 0x7e, 0x2e,
-             0x02, 0x06, 0x3e, 0x0e,
-             0x09, 0x21, 0xe0, 0x10,
-             0x69, 0x09, 0x46, 0x0e,
-             0x46, 0x98, 0xc0, 0x10,
-             0x92, 0x0b, 0x6f, 0xc0,
-             0x81, 0x11, 0x01, 0x01,
-             0x81, 0x01, 0x09, 0x0e,
-             0x83, 0x81, 0x11, 0x1e,
-             0x81, 0xa1, 0x0f, 0x1e,
-             0x81, 0x31, 0x7c, 0x0e,
-             0x0d, 0x3e, 0x91, 0xa5,
-             0xe0, 0x88, 0x00, 0x74,
-             0x12, 0x05, 0x8b, 0x1e,
-             0x4c, 0x78, 0xfc, 0x00,
-             0x0c, 0x74, 0xe8, 0x00,
-             0x01, 0x0a, 0x60, 0x84,
-             0xc0, 0x01, 0x64, 0x00,
-             0x4c, 0x03, 0x92, 0x63,
-             0x00, 0x04, 0x68, 0x00,
-             0x1e, 0x15, 0x80, 0x84,
-             0x40, 0x02, 0x80, 0x04,
-             0x00, 0xb3, 0x90, 0x84,
-             0x00, 0x01, 0x0c, 0x01,
-             0xc0, 0x0c, 0x41, 0x26,
-             0xc0, 0x08, 0x5e, 0x05,
-             0x47, 0xfc, 0x57, 0xf6,
-             0xfb, 0xfc, 0x10, 0x0a,
-             0x7e, 0xa4, 0x86, 0xc5,
-             0xe4, 0x80, 0x04, 0xf0,
-             0x64, 0x70, 0x06, 0xf0,
-             0x14, 0x19, 0x96, 0x0b,
-             0x47, 0xb8, 0xe0, 0x28,
-             0x14, 0x09, 0xe8, 0x00,
-             0x80, 0x8b, 0x60, 0x2c,
-             0xa1, 0x0b, 0x28, 0x02,
-             0x40, 0x0e, 0x82, 0x45,
-             0x42, 0x06, 0x60, 0x2e,
-             0x40, 0x0a, 0xe0, 0xf8,
-             0xaa, 0x12, 0xe0, 0x86,
-             0xfa, 0x04, 0x40, 0x02,
-             0x81, 0x11, 0x09, 0x0e,
-             0x81, 0xa1, 0x09, 0x05,
-             0x00, 0x8a, 0x8b, 0x04,
-             0x14, 0xa0, 0xf4, 0x3c,
-             0x02, 0xf6, 0x04, 0x04,
-             0x0c, 0xe5, 0x80, 0x00,
-             0x80, 0x00, 0x10, 0x06,
-             0x89, 0x14, 0x8f, 0x04,
-             0xf1, 0x80, 0x40, 0xb2,
-             0xf0, 0x80, 0x00, 0x04,
-             0x82, 0xc5, 0x83, 0x0d,
-             0x04, 0xf0, 0x7e, 0x04,
-             0x06, 0xf0, 0xe4, 0x80,
-             0x00, 0x19, 0xe4, 0x70,
-             0x96, 0x0b, 0x60, 0x28,
-             0xe8, 0x00, 0x44, 0x28,
-             0x81, 0x81, 0x02, 0xa1,
-             0x0b, 0x04, 0x83, 0xf5,
-             0xe4, 0x80, 0x04, 0xf0,
-             0x06, 0xf0, 0x7e, 0xa4,
-             0x82, 0x01, 0xe4, 0x70,
-             0xe0, 0x28, 0x14, 0x19,
-             0x96, 0x0b, 0x0b, 0x0e,
-             0xe8, 0x00, 0x43, 0xc8,
-             0x60, 0x2c, 0x14, 0x09,
-             0x28, 0x02, 0x80, 0x8b,
-             0x82, 0x45, 0xa1, 0x0b,
-             0x60, 0x2e, 0x40, 0x0e,
-             0xe0, 0xf8, 0x42, 0x06,
-             0xe0, 0x86, 0x40, 0x0a,
-             0x40, 0x02, 0xaa, 0x12,
-             0x09, 0x0e, 0xfa, 0x04,
-             0x8b, 0x14, 0x81, 0xa1,
-             0x92, 0x73, 0x0d, 0x34,
-             0x4e, 0x11, 0x8f, 0x04,
-             0xc0, 0x02, 0x60, 0x01,
-             0x6c, 0x00, 0x4c, 0xa3,
-             0x4c, 0x03, 0x82, 0x31,
-             0xc0, 0x01, 0x64, 0x09,
-             0x62, 0x01, 0x12, 0x0b,
-             0x0e, 0x34, 0x40, 0x01,
-             0xc1, 0x7d, 0xfb, 0x80,
-             0x00, 0x10, 0xdc, 0x35,
-             0x52, 0x01, 0xe4, 0x04,
-             0xc0, 0x02, 0x64, 0x09,
-             0xc8, 0xf1, 0x7c, 0x04,
-             0xf2, 0x7c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x0a, 0x44, 0x88, 0x44,
-             0xaa, 0x43, 0xe9, 0x04,
-             0x81, 0x01, 0x00, 0x43,
-             0xc3, 0x4f, 0x08, 0x4e,
-             0xdd, 0x93, 0x8c, 0x4e,
-             0xa3, 0x0f, 0x0c, 0x0e,
-             0x81, 0x01, 0x08, 0x0e,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x60, 0x3c, 0x02, 0x09,
-             0xa1, 0x0b, 0x80, 0x3b,
-             0x40, 0x96, 0x06, 0x65,
-             0x48, 0x3a, 0x80, 0x08,
-             0x40, 0x3a, 0xe0, 0x02,
-             0x08, 0x44, 0xe1, 0x02,
-             0x82, 0x43, 0xfa, 0x80,
-             0xec, 0x70, 0x08, 0x49,
-             0x81, 0x01, 0x49, 0x0d,
-             0x86, 0x13, 0x82, 0xa5,
-             0x6b, 0x71, 0x02, 0x19,
-             0xf4, 0x1d, 0xc0, 0x05,
-             0x46, 0x06, 0x80, 0xf5,
-             0x46, 0x4a, 0xe0, 0x64,
-             0x83, 0x11, 0x64, 0x84,
-             0x81, 0x11, 0x80, 0x45,
-             0xdd, 0x93, 0x88, 0x16,
-             0x00, 0x04, 0x5d, 0x93,
-             0xc1, 0xc3, 0xfa, 0x80,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x30, 0x1e, 0xf0,
-             0x82, 0xbb, 0x00, 0x7b,
-             0x67, 0x71, 0x10, 0x70,
-             0x12, 0x70, 0x40, 0x11,
-             0xc0, 0x03, 0x67, 0x71,
-             0x81, 0xa1, 0x3e, 0xbe,
-             0x81, 0x01, 0x01, 0x61,
-             0x00, 0xa4, 0x85, 0x25,
-             0x04, 0xf0, 0x7b, 0x80,
-             0x7c, 0x58, 0xe4, 0x20,
-             0x8e, 0x1b, 0x6f, 0xfc,
-             0xa1, 0x1b, 0x91, 0x18,
-             0x1f, 0xfd, 0x43, 0xfe,
-             0x56, 0x15, 0x9f, 0xff,
-             0x82, 0xe5, 0x80, 0x00,
-             0x45, 0xfe, 0x20, 0x1a,
-             0xcf, 0xff, 0x7f, 0xfd,
-             0xfb, 0x80, 0x0c, 0x64,
-             0xe0, 0x17, 0x82, 0x61,
-             0xac, 0x1e, 0xb4, 0x1f,
-             0xc4, 0x1d, 0xa4, 0x14,
-             0xc0, 0x00, 0x40, 0xc6,
-             0x88, 0xb1, 0x02, 0xa1,
-             0x88, 0x91, 0x04, 0x81,
-             0x60, 0x01, 0x14, 0x0a,
-             0xf6, 0x95, 0xc0, 0x01,
-             0x98, 0xf1, 0x3e, 0x14,
-             0x62, 0x01, 0x42, 0x63,
-             0x0c, 0x0c, 0xc0, 0x01,
-             0xdd, 0x93, 0xf2, 0x7c,
-             0x81, 0x01, 0x5d, 0x93,
-             0x60, 0x38, 0x00, 0x19,
-             0xa1, 0x1b, 0x81, 0x21,
-             0x00, 0x00, 0x02, 0x16,
-             0x80, 0x08, 0x40, 0x96,
-             0xcc, 0x2a, 0x86, 0x25,
-             0xe0, 0x28, 0x06, 0x09,
-             0x7c, 0xc0, 0x08, 0x24,
-             0x48, 0x4a, 0xe2, 0x27,
-             0x02, 0x10, 0x66, 0x86,
-             0x01, 0x0a, 0xec, 0x04,
-             0x40, 0xc6, 0x64, 0x40,
-             0x44, 0x2a, 0xe0, 0x00,
-             0x08, 0x06, 0x60, 0x12,
-             0x00, 0x06, 0xf0, 0x00,
-             0x42, 0x2a, 0x80, 0x00,
-             0x42, 0x42, 0xe6, 0x86,
-             0xce, 0x2c, 0xf1, 0x84,
-             0xe0, 0x10, 0x46, 0x13,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x3c, 0x04, 0x0c,
-             0x80, 0x8b, 0x06, 0x6b,
-             0x60, 0x38, 0x0c, 0x09,
-             0x21, 0x0b, 0x84, 0x7b,
-             0x86, 0x95, 0x81, 0x01,
-             0x8e, 0x1b, 0x10, 0x0b,
-             0xef, 0xfc, 0x78, 0xe8,
-             0x40, 0x96, 0x00, 0xab,
-             0x14, 0x0a, 0xe0, 0x08,
-             0x84, 0x45, 0xe2, 0xa4,
-             0x67, 0x71, 0x12, 0x80,
-             0x8e, 0x1b, 0x40, 0x03,
-             0x8c, 0x2b, 0x12, 0x0b,
-             0xef, 0xfc, 0x69, 0x48,
-             0x41, 0x26, 0x00, 0x8b,
-             0xa1, 0x8b, 0xe0, 0x0c,
-             0x9c, 0x00, 0x50, 0xa0,
-             0xe3, 0xc8, 0x10, 0x0a,
-             0x0c, 0x0c, 0x80, 0x95,
-             0xdd, 0x93, 0xf2, 0x3c,
-             0x8e, 0x1b, 0x12, 0x0b,
-             0x6f, 0xfc, 0x64, 0x48,
-             0xa1, 0x0b, 0x8c, 0x2b,
-             0xdc, 0x00, 0x50, 0x00,
-             0x0c, 0x0c, 0x90, 0x0b,
-             0xdd, 0x93, 0xf2, 0x3c,
-             0xfa, 0x00, 0x00, 0x4c,
-             0xe1, 0x00, 0x1e, 0x06,
-             0x61, 0x94, 0x01, 0x86,
-             0x5d, 0xb8, 0x83, 0x11,
-             0xc1, 0xc3, 0xef, 0xbc,
-             0xfa, 0x0c, 0x04, 0x0c,
-             0x80, 0x6b, 0x02, 0x7b,
-             0x60, 0x3c, 0x41, 0xf6,
-             0x6b, 0x78, 0x81, 0x11,
-             0x81, 0x81, 0x6f, 0xc0,
-             0x60, 0x00, 0x42, 0x76,
-             0x61, 0x58, 0x8c, 0x0b,
-             0x5b, 0xd8, 0xe8, 0x24,
-             0x8c, 0x0b, 0x68, 0x10,
-             0xe1, 0x38, 0x41, 0x06,
-             0x80, 0x18, 0x80, 0x04,
-             0xf1, 0xfc, 0x42, 0x10,
-             0x41, 0x46, 0x00, 0x16,
-             0x80, 0x04, 0xe1, 0x40,
-             0x00, 0x06, 0x00, 0x86,
-             0x80, 0x04, 0xe1, 0x44,
-             0x00, 0xc6, 0x00, 0x86,
-             0x80, 0x04, 0xe1, 0x44,
-             0x41, 0xc6, 0x00, 0x86,
-             0x0c, 0x2b, 0xef, 0x14,
-             0xc0, 0x15, 0x6e, 0x09,
-             0x73, 0xf5, 0x42, 0x20,
-             0x44, 0x4a, 0x40, 0xff,
-             0x4c, 0x13, 0xe0, 0x98,
-             0xc0, 0x15, 0x6e, 0x09,
-             0xf8, 0x70, 0x00, 0x39,
-             0xf3, 0xec, 0x44, 0x30,
-             0xf8, 0x70, 0x40, 0x21,
-             0x4c, 0x81, 0x84, 0x45,
-             0x40, 0x2b, 0x6c, 0x21,
-             0x73, 0xf9, 0x42, 0x10,
-             0x4c, 0x13, 0xc0, 0xff,
-             0xc0, 0x15, 0x6e, 0x09,
-             0xf8, 0x20, 0x40, 0x81,
-             0xf8, 0x10, 0x00, 0x19,
-             0xf3, 0xf8, 0x42, 0x10,
-             0xf8, 0x10, 0x40, 0x11,
-             0x42, 0x10, 0x80, 0x18,
-             0x80, 0x16, 0xf3, 0xf8,
-             0x42, 0x10, 0x80, 0x18,
-             0x80, 0x16, 0xf3, 0xf4,
-             0xf8, 0x30, 0x00, 0x19,
-             0x40, 0x11, 0xc8, 0x19,
-             0x40, 0x81, 0xf8, 0x30,
-             0x00, 0x09, 0xe0, 0x30,
-             0x40, 0x0a, 0xf8, 0x30,
-             0x82, 0xe5, 0xe0, 0x88,
-             0x43, 0xf6, 0x1c, 0x04,
-             0xff, 0xc0, 0x6f, 0xfd,
-             0x02, 0x0e, 0x02, 0x0f,
-             0x40, 0x00, 0xf0, 0x00,
-             0xc3, 0x00, 0x7c, 0x01,
-             0x9c, 0x04, 0x9c, 0x0e,
-             0x9c, 0x0e, 0x82, 0x0f,
-             0x6d, 0xed, 0x0c, 0x09,
-             0xa3, 0x0b, 0xc0, 0x33,
-             0x0c, 0x05, 0x84, 0x15,
-             0xc0, 0x0d, 0x64, 0xbd,
-             0x41, 0xc6, 0xa3, 0x0b,
-             0x00, 0x20, 0x12, 0xfd,
-             0x00, 0x01, 0x02, 0x06,
-             0x4c, 0x85, 0xbf, 0xc1,
-             0x80, 0x0d, 0x04, 0xbd,
-             0x80, 0x00, 0x40, 0x15,
-             0x68, 0x00, 0x62, 0xc8,
-             0x42, 0x86, 0x8c, 0x0b,
-             0x8c, 0x0b, 0x60, 0x00,
-             0xe8, 0x24, 0x59, 0xc8,
-             0xef, 0xfc, 0x76, 0xe8,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x8b, 0x11, 0x00, 0x6b,
-             0xe8, 0x28, 0x53, 0x08,
-             0x61, 0x20, 0x41, 0xc6,
-             0xe0, 0x00, 0x42, 0x06,
-             0x4c, 0x11, 0x80, 0x04,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x00, 0x16, 0x81, 0x11,
-             0xe1, 0x38, 0x41, 0x06,
-             0x80, 0x18, 0x80, 0x04,
-             0xf1, 0xfc, 0x42, 0x10,
-             0x41, 0x86, 0x00, 0x16,
-             0x80, 0x08, 0xef, 0x14,
-             0xe0, 0x80, 0x40, 0x0a,
-             0x0e, 0x09, 0x0c, 0x0b,
-             0x40, 0x00, 0xc0, 0x15,
-             0xc0, 0xff, 0x13, 0x7d,
-             0x0e, 0x09, 0x4c, 0x03,
-             0x8c, 0x0b, 0x40, 0x15,
-             0xe8, 0x00, 0x5f, 0xc8,
-             0xe8, 0x00, 0x5f, 0x28,
-             0x61, 0x44, 0x00, 0xc6,
-             0x80, 0x04, 0x85, 0x11,
-             0x00, 0x06, 0x00, 0x16,
-             0x80, 0x04, 0xe1, 0x44,
-             0x41, 0x46, 0x00, 0x16,
-             0x80, 0x04, 0xe1, 0x40,
-             0x0c, 0x09, 0x80, 0x16,
-             0xc0, 0x2b, 0x6c, 0x21,
-             0xec, 0x04, 0x02, 0x00,
-             0x84, 0x95, 0xe7, 0x1d,
-             0xec, 0x2c, 0x02, 0x00,
-             0x84, 0xb5, 0xe7, 0x1d,
-             0xec, 0x10, 0x02, 0x00,
-             0x84, 0xd5, 0xe5, 0x1d,
-             0x86, 0x25, 0xad, 0x0b,
-             0x86, 0x65, 0xb3, 0x0b,
-             0x86, 0xb5, 0xb5, 0x0b,
-             0x0c, 0x0c, 0x8c, 0x0b,
-             0x16, 0x38, 0xf2, 0x00,
-             0x8c, 0x0b, 0xe0, 0x54,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0xe0, 0x3c, 0x2b, 0x28,
-             0x0c, 0x0c, 0x8c, 0x0b,
-             0x3e, 0x18, 0xf2, 0x00,
-             0x8c, 0x0b, 0xe0, 0x4c,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0xe0, 0x48, 0x03, 0x08,
-             0x0c, 0x0c, 0x8c, 0x0b,
-             0x85, 0xb5, 0xf2, 0x00,
-             0x0c, 0x0c, 0x8c, 0x0b,
-             0x85, 0x75, 0xf2, 0x00,
-             0x0c, 0x0c, 0x81, 0x01,
-             0xdd, 0x93, 0xf2, 0x00,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x81, 0x11, 0x01, 0x01,
-             0x68, 0x20, 0x7c, 0x68,
-             0x43, 0xc6, 0x81, 0x61,
-             0x83, 0x31, 0x61, 0x48,
-             0x08, 0x36, 0x84, 0x24,
-             0xe1, 0x14, 0x05, 0xc6,
-             0x90, 0x36, 0x88, 0x44,
-             0x08, 0x66, 0x88, 0x24,
-             0x84, 0x14, 0x87, 0x21,
-             0x83, 0x11, 0x04, 0x26,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0xe0, 0x20, 0x3b, 0x28,
-             0x61, 0x14, 0x01, 0xc6,
-             0x80, 0x04, 0x83, 0x11,
-             0xc1, 0x83, 0x80, 0x16,
-             0xdd, 0x93, 0xc7, 0x13,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x10, 0x1e, 0xf0,
-             0x0c, 0x09, 0x80, 0x6b,
-             0xc0, 0x2b, 0x6c, 0x21,
-             0x82, 0x55, 0xb3, 0x0b,
-             0xe0, 0x00, 0x40, 0x96,
-             0x6c, 0x1d, 0x4c, 0x01,
-             0x8c, 0x0b, 0x40, 0x2b,
-             0xe8, 0x48, 0x73, 0xe8,
-             0x40, 0x66, 0x81, 0x95,
-             0x4c, 0x01, 0xe0, 0x00,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x76, 0xf8, 0x8c, 0x0b,
-             0x42, 0x98, 0xe8, 0x48,
-             0x8c, 0x0b, 0x68, 0x18,
-             0x61, 0xd1, 0x0c, 0x09,
-             0x80, 0x7b, 0x40, 0x15,
-             0x6c, 0x79, 0x0c, 0x19,
-             0x40, 0x0a, 0xc0, 0x2c,
-             0x82, 0x01, 0xe6, 0x86,
-             0x67, 0xf9, 0x00, 0x8a,
-             0x41, 0xd6, 0xc0, 0x03,
-             0x0e, 0x66, 0x00, 0x3c,
-             0x00, 0x04, 0x80, 0x04,
-             0xa1, 0x7b, 0x5a, 0x80,
-             0x66, 0x31, 0x4c, 0x03,
-             0x82, 0x45, 0xc0, 0x16,
-             0x6c, 0x1d, 0x0c, 0x29,
-             0x8c, 0x0b, 0x40, 0x2b,
-             0x68, 0x10, 0x4c, 0xe8,
-             0xa1, 0x0b, 0x8e, 0x1b,
-             0x7d, 0x38, 0xa0, 0x55,
-             0x8c, 0x0b, 0x68, 0x3c,
-             0x65, 0xc1, 0x10, 0x60,
-             0x0c, 0x09, 0xc0, 0x54,
-             0x40, 0x2b, 0x6c, 0x21,
-             0xb3, 0x0b, 0x80, 0x7b,
-             0x21, 0x7b, 0x90, 0x15,
-             0xe0, 0x00, 0x40, 0x96,
-             0x6c, 0x1d, 0x4c, 0x01,
-             0x98, 0xb5, 0xc0, 0x2b,
-             0x61, 0x4c, 0x01, 0x06,
-             0x64, 0x50, 0x02, 0x60,
-             0x3c, 0x1e, 0xc0, 0x9e,
-             0x65, 0x41, 0x04, 0x60,
-             0x00, 0x04, 0xc0, 0x54,
-             0x66, 0xd1, 0x06, 0x60,
-             0x08, 0x60, 0xc0, 0x54,
-             0x40, 0xa3, 0x66, 0xe1,
-             0x66, 0x71, 0x0a, 0x60,
-             0x5b, 0xf8, 0xc0, 0xa2,
-             0x90, 0x1b, 0x6f, 0xc4,
-             0xa1, 0x7b, 0x80, 0x7b,
-             0x68, 0xf8, 0x92, 0x95,
-             0x8c, 0x0b, 0x68, 0x38,
-             0x40, 0x06, 0x00, 0x7b,
-             0x00, 0x04, 0xe1, 0x34,
-             0xe0, 0x04, 0x02, 0x96,
-             0x6c, 0x1d, 0x4c, 0x11,
-             0x00, 0x16, 0xc0, 0x2b,
-             0xff, 0xf8, 0x00, 0x0e,
-             0x6c, 0xfd, 0x0c, 0x19,
-             0x02, 0x0a, 0xc0, 0x2c,
-             0x00, 0x10, 0xe3, 0xf0,
-             0x4c, 0x01, 0xc4, 0x04,
-             0x40, 0x2c, 0x6c, 0xfd,
-             0x4c, 0x58, 0x8c, 0x0b,
-             0xa1, 0x7b, 0xe8, 0x04,
-             0x87, 0x65, 0x8a, 0xd5,
-             0x40, 0x66, 0x21, 0x7b,
-             0x4c, 0x01, 0xe0, 0x00,
-             0xc0, 0x2b, 0x6c, 0x1d,
-             0x17, 0x06, 0x88, 0xd5,
-             0x12, 0x60, 0x61, 0x4c,
-             0xc0, 0xa3, 0x66, 0xe0,
-             0x14, 0x60, 0x2c, 0x04,
-             0xc0, 0x9f, 0x67, 0x61,
-             0x65, 0x41, 0x04, 0x60,
-             0x06, 0x60, 0x40, 0x54,
-             0xc0, 0x54, 0x66, 0xd1,
-             0x92, 0x4b, 0x10, 0x1b,
-             0x6f, 0xc4, 0x64, 0xc8,
-             0x80, 0x7b, 0x94, 0x5b,
-             0x82, 0xf5, 0xa1, 0x7b,
-             0x02, 0x60, 0x2c, 0x04,
-             0xc0, 0xad, 0x66, 0x31,
-             0x64, 0x71, 0x08, 0x60,
-             0x92, 0x2b, 0x40, 0xa1,
-             0x6f, 0xc4, 0x67, 0x68,
-             0x80, 0x7b, 0x94, 0x3b,
-             0x84, 0x05, 0xa1, 0x7b,
-             0x6c, 0x1d, 0x0c, 0x29,
-             0x8c, 0x0b, 0x40, 0x2b,
-             0x68, 0x10, 0x44, 0xe8,
-             0xa1, 0x0b, 0x8e, 0x1b,
-             0x81, 0x71, 0x80, 0x55,
-             0x88, 0xf1, 0x0e, 0x0b,
-             0xf2, 0x7c, 0x0c, 0x0c,
-             0x2c, 0x04, 0xdd, 0x93,
-             0x64, 0x81, 0x04, 0x60,
-             0x06, 0x60, 0xc0, 0x99,
-             0x40, 0xa2, 0x65, 0x21,
-             0x4e, 0x78, 0x92, 0x1b,
-             0xf3, 0x95, 0xef, 0xf8,
-             0x66, 0x15, 0x00, 0x8a,
-             0x80, 0xf5, 0xc0, 0x03,
-             0x61, 0x18, 0x00, 0x46,
-             0x80, 0x04, 0x87, 0x11,
-             0xdd, 0x93, 0x80, 0x16,
-             0x65, 0x61, 0x00, 0x8a,
-             0x80, 0xf5, 0xc0, 0x02,
-             0x61, 0x18, 0x00, 0x46,
-             0x80, 0x04, 0x85, 0x11,
-             0xdd, 0x93, 0x80, 0x16,
-             0x61, 0x18, 0x02, 0x46,
-             0x64, 0xac, 0x01, 0x4a,
-             0x84, 0x14, 0xc0, 0x01,
-             0xe2, 0x00, 0x00, 0x0c,
-             0xdd, 0x93, 0x84, 0x06,
-             0x66, 0x61, 0x02, 0x8a,
-             0x02, 0x86, 0xc0, 0x03,
-             0x04, 0x66, 0x01, 0x04,
-             0x02, 0x15, 0x80, 0x00,
-             0x86, 0xc5, 0x80, 0x00,
-             0x64, 0x99, 0x02, 0x8a,
-             0x02, 0x86, 0xc0, 0x03,
-             0x04, 0x56, 0x01, 0x04,
-             0x02, 0x15, 0x80, 0x00,
-             0x84, 0x85, 0x80, 0x00,
-             0x66, 0xc9, 0x02, 0x8a,
-             0x02, 0x86, 0xc0, 0x02,
-             0x04, 0x46, 0x01, 0x04,
-             0x02, 0x15, 0x80, 0x00,
-             0x82, 0x45, 0x80, 0x00,
-             0x64, 0x95, 0x03, 0x0a,
-             0x02, 0x86, 0x40, 0x02,
-             0x04, 0x14, 0xe1, 0x04,
-             0x04, 0x26, 0x87, 0x21,
-             0x04, 0x26, 0x80, 0x00,
-             0xe1, 0x04, 0x02, 0x86,
-             0x84, 0x18, 0x84, 0x14,
-             0x65, 0x79, 0x40, 0x11,
-             0xdd, 0x93, 0xc0, 0x2b,
-             0x03, 0x0a, 0xc4, 0x17,
-             0xc0, 0x0f, 0x66, 0x81,
-             0x02, 0x8a, 0x86, 0xf5,
-             0xc0, 0x0f, 0x64, 0xf5,
-             0x01, 0x04, 0x02, 0x46,
-             0x80, 0x00, 0x04, 0x06,
-             0x80, 0x00, 0x02, 0x15,
-             0x02, 0x8a, 0x84, 0x85,
-             0xc0, 0x0c, 0x66, 0xcd,
-             0x01, 0x04, 0x02, 0x46,
-             0x80, 0x00, 0x04, 0x16,
-             0x80, 0x00, 0x02, 0x15,
-             0x03, 0x0a, 0x82, 0x45,
-             0x40, 0x0a, 0x64, 0xa1,
-             0xe1, 0x04, 0x02, 0x46,
-             0x85, 0x21, 0x04, 0x14,
-             0x80, 0x00, 0x04, 0x36,
-             0x02, 0x46, 0x84, 0x26,
-             0x84, 0x14, 0xe1, 0x04,
-             0x40, 0x11, 0x84, 0x18,
-             0xc0, 0x2b, 0x65, 0x75,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x61, 0x18, 0x02, 0x46,
-             0xe1, 0x14, 0x45, 0x86,
-             0x84, 0x18, 0x84, 0x14,
-             0x8c, 0x16, 0x88, 0x34,
-             0x84, 0x18, 0x88, 0x14,
-             0x65, 0x7d, 0x40, 0x11,
-             0xdd, 0x93, 0xc0, 0x2b,
-             0xe1, 0x18, 0x04, 0x86,
-             0x88, 0x28, 0x88, 0x24,
-             0x00, 0x15, 0xa1, 0x2b,
-             0x00, 0x09, 0x0e, 0x0d,
-             0xc1, 0x18, 0x04, 0x46,
-             0xc0, 0x00, 0x04, 0x25,
-             0x81, 0xb0, 0x02, 0x14,
-             0x40, 0x00, 0x04, 0x29,
-             0x84, 0x04, 0x02, 0x10,
-             0xc4, 0x04, 0x04, 0x20,
-             0xc0, 0x0a, 0x42, 0x1a,
-             0x6e, 0x01, 0x40, 0x13,
-             0xdd, 0x93, 0xc0, 0x15,
-             0xe1, 0x24, 0x00, 0x46,
-             0x84, 0x28, 0x80, 0x14,
-             0xf3, 0xf8, 0x44, 0x20,
-             0x42, 0x06, 0x04, 0x26,
-             0x84, 0x14, 0xe1, 0x14,
-             0x04, 0x24, 0x84, 0x28,
-             0x84, 0x26, 0xfc, 0x94,
-             0x84, 0x28, 0x80, 0x14,
-             0xf3, 0xf4, 0x44, 0x20,
-             0x80, 0x04, 0x84, 0x26,
-             0x42, 0x10, 0x80, 0x18,
-             0x80, 0x16, 0xf3, 0xcc,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xe1, 0x24, 0x00, 0x46,
-             0x80, 0x18, 0x80, 0x04,
-             0x80, 0x16, 0xc2, 0x19,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0xfc, 0x04, 0x0c,
-             0x00, 0x26, 0x00, 0x6b,
-             0x4c, 0x01, 0xe0, 0x0c,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x60, 0xb8, 0x81, 0x01,
-             0x81, 0x11, 0x68, 0x20,
-             0x6f, 0xa9, 0x0c, 0x15,
-             0x25, 0x1b, 0xc0, 0x0b,
-             0xe1, 0x24, 0x02, 0x46,
-             0x82, 0x45, 0x84, 0x24,
-             0x42, 0x4a, 0x88, 0x18,
-             0x80, 0xc5, 0xe0, 0x80,
-             0x0c, 0x0c, 0x83, 0x11,
-             0x1f, 0x98, 0xf2, 0xfc,
-             0x3e, 0x0e, 0xe0, 0x20,
-             0x88, 0x18, 0x8c, 0x0b,
-             0xf3, 0xf8, 0x42, 0x10,
-             0x02, 0x86, 0x08, 0x16,
-             0x68, 0x38, 0xe0, 0x0c,
-             0x81, 0x21, 0x68, 0x4c,
-             0x61, 0x40, 0x51, 0x46,
-             0xe1, 0x48, 0x52, 0x06,
-             0xff, 0xa1, 0x20, 0x04,
-             0xe1, 0x24, 0x56, 0x46,
-             0xc7, 0x07, 0x80, 0x08,
-             0xf0, 0x04, 0x4e, 0x00,
-             0x80, 0xc5, 0xa1, 0x7b,
-             0x6f, 0xa9, 0x0c, 0x05,
-             0xa5, 0x0b, 0xc0, 0x0b,
-             0xa4, 0x04, 0x82, 0xd5,
-             0x94, 0x0d, 0x80, 0x00,
-             0x0c, 0x29, 0x84, 0x05,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0xe0, 0x0c, 0x02, 0x96,
-             0x68, 0x0c, 0x73, 0x08,
-             0x81, 0x95, 0x8c, 0x0b,
-             0x80, 0x08, 0xa0, 0x04,
-             0x01, 0x55, 0xc7, 0x07,
-             0xf0, 0x04, 0x4e, 0x00,
-             0xef, 0xfc, 0x4f, 0xc8,
-             0x80, 0x04, 0xac, 0x04,
-             0xf8, 0x35, 0xa1, 0x0b,
-             0x83, 0x11, 0x3e, 0x04,
-             0xf2, 0xfc, 0x0c, 0x0c,
-             0xe0, 0x20, 0x1b, 0xc8,
-             0xfa, 0xfc, 0x04, 0x0c,
-             0x00, 0x36, 0x00, 0x7b,
-             0x4e, 0x01, 0xe0, 0x0c,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x5b, 0x18, 0x81, 0x01,
-             0x81, 0x11, 0x68, 0x20,
-             0x3e, 0x0e, 0x81, 0x81,
-             0xe1, 0x24, 0x00, 0xc6,
-             0x54, 0x46, 0x00, 0x04,
-             0x80, 0x86, 0xe1, 0x24,
-             0x80, 0x64, 0xa8, 0x04,
-             0x8e, 0x0b, 0x00, 0x14,
-             0xe8, 0x20, 0x70, 0x48,
-             0x43, 0xa6, 0x03, 0x91,
-             0x03, 0x21, 0xe0, 0x0c,
-             0x62, 0xf8, 0x8e, 0x0b,
-             0x40, 0x86, 0xe8, 0x4c,
-             0x80, 0x14, 0xe1, 0x14,
-             0x02, 0x46, 0x04, 0x8c,
-             0x84, 0x14, 0xe1, 0x24,
-             0xc4, 0x29, 0x84, 0x28,
-             0x42, 0x46, 0x04, 0x26,
-             0x04, 0x14, 0xe1, 0x18,
-             0x84, 0xb8, 0x83, 0x21,
-             0x43, 0xc6, 0x04, 0x86,
-             0x84, 0x14, 0xe1, 0x20,
-             0x02, 0x86, 0x04, 0x96,
-             0x80, 0x04, 0xe0, 0x0c,
-             0x8e, 0x0b, 0x00, 0x9c,
-             0xe8, 0x4c, 0x61, 0x48,
-             0x61, 0x24, 0x00, 0xc6,
-             0x80, 0x04, 0xa9, 0x11,
-             0x8e, 0x0b, 0x00, 0x96,
-             0xe8, 0x20, 0x6d, 0xa8,
-             0x60, 0x0c, 0x02, 0x86,
-             0x60, 0x78, 0x81, 0x21,
-             0x8e, 0x0b, 0x68, 0x4c,
-             0xe1, 0x40, 0x41, 0x46,
-             0x80, 0x08, 0x80, 0x04,
-             0x52, 0x00, 0xc7, 0x07,
-             0x12, 0x0a, 0xf0, 0x04,
-             0x80, 0xc5, 0xfb, 0xfc,
-             0x6f, 0xa9, 0x0e, 0x05,
-             0xa3, 0x0b, 0xc0, 0x0b,
-             0x00, 0xc6, 0x86, 0xb5,
-             0x80, 0x04, 0xe1, 0x24,
-             0x40, 0x46, 0x00, 0x86,
-             0x80, 0x04, 0xe1, 0x18,
-             0x41, 0xc6, 0x00, 0xb6,
-             0x80, 0x04, 0xe1, 0x20,
-             0x00, 0x46, 0x00, 0x86,
-             0x80, 0x04, 0xe1, 0x24,
-             0x42, 0x10, 0x80, 0x18,
-             0x00, 0x16, 0xf3, 0xf4,
-             0xe0, 0x0c, 0x02, 0xa6,
-             0x6c, 0x1d, 0x0e, 0x29,
-             0x8e, 0x0b, 0x40, 0x2b,
-             0xe8, 0x0c, 0x6a, 0x88,
-             0x41, 0x46, 0x81, 0x85,
-             0x80, 0x04, 0xe1, 0x40,
-             0xc7, 0x07, 0x80, 0x08,
-             0xf0, 0x04, 0x52, 0x00,
-             0x80, 0x04, 0xa8, 0x04,
-             0xf4, 0x45, 0x81, 0x6b,
-             0x8e, 0x0b, 0x2b, 0x11,
-             0xe8, 0x20, 0x69, 0xa8,
-             0x00, 0x14, 0xa8, 0x04,
-             0x69, 0x58, 0x8e, 0x0b,
-             0x00, 0xc6, 0xe8, 0x20,
-             0x80, 0x04, 0xe1, 0x24,
-             0x40, 0x46, 0x00, 0x86,
-             0x80, 0x04, 0xe1, 0x18,
-             0x41, 0xc6, 0x00, 0xb6,
-             0x80, 0x04, 0xe1, 0x20,
-             0x00, 0x46, 0x00, 0x86,
-             0x80, 0x04, 0xe1, 0x24,
-             0x42, 0x10, 0x80, 0x18,
-             0x00, 0x16, 0xf3, 0xf4,
-             0xbe, 0x04, 0x83, 0x11,
-             0xf2, 0xfc, 0x0c, 0x0c,
-             0xe0, 0x20, 0x11, 0xa8,
-             0x70, 0x01, 0x00, 0x06,
-             0x02, 0x06, 0x40, 0x20,
-             0xff, 0xc0, 0x60, 0x01,
-             0xdd, 0x93, 0x80, 0x1e,
-             0xfa, 0x0c, 0x04, 0x0c,
-             0x80, 0x8b, 0x02, 0x7b,
-             0x81, 0x01, 0x04, 0x6b,
-             0x68, 0x20, 0x50, 0xa8,
-             0x42, 0x06, 0x81, 0x11,
-             0x48, 0x46, 0x61, 0x48,
-             0x04, 0x24, 0xe1, 0x48,
-             0x70, 0x01, 0x02, 0x06,
-             0x04, 0x34, 0xc0, 0x20,
-             0x88, 0x58, 0xa1, 0x8b,
-             0x08, 0x48, 0x90, 0x24,
-             0x60, 0x01, 0x04, 0x06,
-             0x0c, 0xc9, 0xff, 0xc0,
-             0x40, 0x2b, 0x6c, 0x19,
-             0xa6, 0x5f, 0x84, 0x3f,
-             0x60, 0xc7, 0xd0, 0x47,
-             0x46, 0x52, 0xa8, 0x5f,
-             0x0c, 0x49, 0xf9, 0xb0,
-             0xc0, 0x2c, 0x0c, 0xfd,
-             0xc0, 0xe0, 0x08, 0x44,
-             0x44, 0x22, 0x00, 0xb5,
-             0xa1, 0x7b, 0xd0, 0x90,
-             0x49, 0xfe, 0x80, 0xc5,
-             0xc0, 0x3f, 0x7f, 0xfd,
-             0xa4, 0x3f, 0x88, 0x3f,
-             0x83, 0x11, 0x04, 0x3e,
-             0xf2, 0x0c, 0x0c, 0x0c,
-             0xe0, 0x20, 0x0d, 0xa8,
-             0xfa, 0xfc, 0x04, 0x0c,
-             0x51, 0x46, 0x00, 0x6b,
-             0x0c, 0x09, 0xe1, 0x98,
-             0x40, 0x2d, 0x67, 0xcd,
-             0x20, 0x9e, 0x81, 0x91,
-             0xe1, 0x4c, 0x04, 0x46,
-             0xe0, 0x80, 0x40, 0x0a,
-             0xc0, 0x00, 0x00, 0x16,
-             0x0c, 0xf5, 0x4c, 0x01,
-             0x00, 0x86, 0x40, 0x2c,
-             0x80, 0x04, 0xe1, 0x4c,
-             0x88, 0x04, 0x80, 0x74,
-             0xe1, 0xe0, 0x16, 0x74,
-             0xe0, 0xe0, 0x14, 0xb4,
-             0xfc, 0xc0, 0x02, 0xa4,
-             0x00, 0x74, 0x00, 0x1e,
-             0x08, 0x14, 0xe1, 0xc0,
-             0xfc, 0xc4, 0x04, 0xa4,
-             0xf0, 0x10, 0x00, 0x0a,
-             0x94, 0x05, 0x84, 0x2e,
-             0xf0, 0x08, 0x00, 0x0a,
-             0x00, 0x0a, 0x98, 0x85,
-             0xaa, 0x65, 0xf0, 0x0c,
-             0xf0, 0x04, 0x00, 0x0a,
-             0x40, 0x00, 0x13, 0x38,
-             0xc1, 0x4c, 0x16, 0x46,
-             0x02, 0x56, 0x04, 0xab,
-             0x6a, 0x78, 0xe0, 0x10,
-             0x8c, 0x0b, 0x68, 0x20,
-             0x61, 0x90, 0x44, 0x86,
-             0xfb, 0x80, 0x00, 0x74,
-             0x72, 0xfd, 0x49, 0xc6,
-             0x02, 0x06, 0x40, 0x20,
-             0xc0, 0x20, 0x73, 0x01,
-             0x40, 0x12, 0x20, 0x43,
-             0x20, 0x14, 0xf1, 0x80,
-             0xe1, 0x4c, 0x16, 0x46,
-             0x85, 0x55, 0x88, 0x2a,
-             0x6c, 0x08, 0x0a, 0x40,
-             0x77, 0x5d, 0x80, 0x7b,
-             0xe1, 0x90, 0x0a, 0x34,
-             0x73, 0xfd, 0x4a, 0x50,
-             0x08, 0x16, 0x40, 0x0f,
-             0x48, 0x4a, 0x80, 0x00,
-             0xe1, 0x37, 0x66, 0x96,
-             0x4a, 0x30, 0x84, 0x33,
-             0x41, 0xff, 0x73, 0xf1,
-             0x06, 0x00, 0xc5, 0x47,
-             0x82, 0x53, 0x64, 0x10,
-             0x88, 0xcb, 0x01, 0x65,
-             0x18, 0xc0, 0x5d, 0x84,
-             0xd5, 0x8e, 0xec, 0x04,
-             0xfe, 0x75, 0xa1, 0xcb,
-             0xe0, 0x88, 0x0a, 0x44,
-             0x70, 0x94, 0x48, 0x02,
-             0xf0, 0x94, 0x40, 0x32,
-             0x48, 0x30, 0x90, 0x34,
-             0xbf, 0x4b, 0xf0, 0x3c,
-             0x1d, 0xe5, 0xf6, 0x15,
-             0x02, 0x56, 0x94, 0x2b,
-             0x8c, 0x0b, 0x60, 0x80,
-             0x68, 0x20, 0x66, 0x48,
-             0x0c, 0x0b, 0x84, 0x7b,
-             0x40, 0x15, 0x6e, 0x09,
-             0xe1, 0x4c, 0x16, 0x46,
-             0x40, 0x00, 0xac, 0x14,
-             0xc0, 0xff, 0x72, 0xf1,
-             0x6e, 0x09, 0x4c, 0x03,
-             0x8c, 0x0b, 0x40, 0x15,
-             0xef, 0xf8, 0x78, 0xe8,
-             0x8e, 0x2b, 0x1b, 0x75,
-             0x02, 0x56, 0x3e, 0x2e,
-             0x64, 0xd8, 0xe0, 0x20,
-             0x8c, 0x0b, 0x68, 0x20,
-             0x7b, 0x80, 0x00, 0x74,
-             0x72, 0xfc, 0x43, 0xc6,
-             0x40, 0x12, 0xc0, 0x20,
-             0x02, 0x46, 0x71, 0x80,
-             0xc0, 0x20, 0x72, 0xc0,
-             0x04, 0x10, 0x00, 0x34,
-             0x09, 0x91, 0xe4, 0x00,
-             0x16, 0x46, 0x88, 0x11,
-             0x08, 0x3e, 0xe1, 0x4c,
-             0xe1, 0x90, 0x44, 0x86,
-             0x08, 0xca, 0x85, 0xa5,
-             0xec, 0x08, 0x0a, 0x40,
-             0x0a, 0x34, 0x77, 0x5d,
-             0x4a, 0x50, 0xe1, 0x90,
-             0x40, 0x0f, 0x73, 0xfd,
-             0x80, 0x00, 0x08, 0x16,
-             0x66, 0x96, 0x48, 0x4a,
-             0x20, 0x74, 0xe1, 0x37,
-             0x46, 0xc0, 0x86, 0xc3,
-             0x41, 0xff, 0x73, 0xf1,
-             0xe1, 0x88, 0x0a, 0x44,
-             0x8a, 0xcb, 0x08, 0x01,
-             0x82, 0x7b, 0x0e, 0x33,
-             0x4d, 0xa4, 0x81, 0x55,
-             0xec, 0x04, 0x18, 0xc0,
-             0xa1, 0xcb, 0xdd, 0xae,
-             0x00, 0x34, 0xfe, 0x75,
-             0xfb, 0x80, 0x18, 0x94,
-             0x88, 0xc3, 0x44, 0x57,
-             0x12, 0xc0, 0x0a, 0x13,
-             0xc5, 0x3e, 0xe4, 0x10,
-             0xf0, 0x3c, 0x48, 0x30,
-             0xf4, 0x95, 0xbf, 0x4b,
-             0x91, 0xc5, 0xbe, 0x24,
-             0x60, 0x40, 0x02, 0x56,
-             0x60, 0x38, 0x8c, 0x0b,
-             0x4a, 0x58, 0xe8, 0x20,
-             0x8c, 0x0b, 0x68, 0x00,
-             0xef, 0xfc, 0x42, 0xe8,
-             0x6e, 0x09, 0x0c, 0x0b,
-             0x03, 0xee, 0x40, 0x15,
-             0x0e, 0x0a, 0xff, 0xfc,
-             0x82, 0x0f, 0xe8, 0x00,
-             0x7c, 0x04, 0x42, 0x00,
-             0xfd, 0x04, 0x40, 0x00,
-             0x6e, 0x09, 0x4c, 0x13,
-             0x42, 0xc6, 0x40, 0x15,
-             0x84, 0x9e, 0xe1, 0x90,
-             0x6e, 0x09, 0x4c, 0x03,
-             0x00, 0x74, 0x40, 0x15,
-             0x4c, 0xb1, 0xfb, 0x80,
-             0x40, 0x15, 0x62, 0xe5,
-             0xe1, 0x4c, 0x16, 0x46,
-             0x49, 0xc6, 0x8e, 0x05,
-             0x40, 0x20, 0x72, 0xfd,
-             0xe1, 0x90, 0x44, 0x86,
-             0x73, 0x01, 0x02, 0x06,
-             0xa0, 0x43, 0x40, 0x20,
-             0x40, 0x12, 0x20, 0x14,
-             0x88, 0x2a, 0xf1, 0x80,
-             0x0a, 0x40, 0x85, 0x55,
-             0x80, 0x7b, 0x6c, 0x08,
-             0x0a, 0x34, 0x77, 0x5d,
-             0x4a, 0x50, 0xe1, 0x90,
-             0x40, 0x0f, 0x73, 0xfd,
-             0x80, 0x00, 0x08, 0x16,
-             0x66, 0x96, 0x48, 0x4a,
-             0x84, 0x33, 0xe1, 0x37,
-             0x73, 0xf1, 0x4a, 0x30,
-             0xc5, 0x47, 0x41, 0xff,
-             0x64, 0x10, 0x06, 0x00,
-             0x01, 0x65, 0x82, 0x53,
-             0x5d, 0x94, 0x88, 0xcb,
-             0xec, 0x04, 0x18, 0xc0,
-             0xa1, 0xcb, 0xd5, 0x9e,
-             0x0a, 0x44, 0xfe, 0x75,
-             0x48, 0x02, 0xe0, 0x88,
-             0x40, 0x32, 0x70, 0x94,
-             0x90, 0x34, 0xf0, 0x94,
-             0xf0, 0x3c, 0x48, 0x30,
-             0xf6, 0x15, 0xbf, 0x4b,
-             0x62, 0x65, 0x0c, 0x19,
-             0x40, 0xc6, 0x40, 0x15,
-             0x80, 0x04, 0xe1, 0x48,
-             0x80, 0x28, 0x88, 0x19,
-             0xf3, 0xec, 0x44, 0x20,
-             0x80, 0x26, 0xa2, 0x2f,
-             0x64, 0xc5, 0x0c, 0x09,
-             0x4c, 0x01, 0xc0, 0x2b,
-             0x40, 0x2b, 0x6c, 0x21,
-             0x45, 0x78, 0x8c, 0x0b,
-             0x20, 0x44, 0xe8, 0x00,
-             0x65, 0x01, 0x00, 0x60,
-             0x04, 0x04, 0xc0, 0x54,
-             0x81, 0x01, 0x7b, 0x80,
-             0x06, 0x46, 0x19, 0x11,
-             0xc0, 0x20, 0x72, 0xc1,
-             0xe8, 0x00, 0x4f, 0x48,
-             0x9f, 0x21, 0x2c, 0x14,
-             0x4e, 0xa0, 0x00, 0x2e,
-             0xc3, 0x00, 0x7c, 0x51,
-             0x6a, 0xf8, 0x84, 0x7e,
-             0x0e, 0x2b, 0xef, 0xf8,
-             0x02, 0x06, 0xa9, 0x91,
-             0x7f, 0xc0, 0x60, 0x01,
-             0xfb, 0x80, 0x00, 0x94,
-             0x84, 0x1f, 0x2c, 0x24,
-             0x40, 0x10, 0xa0, 0x1f,
-             0xc3, 0x00, 0x7c, 0x01,
-             0x0c, 0x09, 0x88, 0x0e,
-             0xc0, 0x2d, 0x67, 0xcd,
-             0xe0, 0x80, 0x40, 0x0a,
-             0x0c, 0x09, 0x80, 0xe5,
-             0xc0, 0x2b, 0x6c, 0x11,
-             0xe0, 0x98, 0x40, 0x0a,
-             0x0c, 0x0c, 0x80, 0x95,
-             0xdd, 0x93, 0xf2, 0xfc,
-             0x0c, 0x0c, 0x8c, 0x0b,
-             0x9f, 0x95, 0xf2, 0xfc,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x40, 0x06, 0x00, 0x6b,
-             0x80, 0x14, 0xe1, 0x48,
-             0x44, 0x20, 0x84, 0x28,
-             0x84, 0x26, 0xf3, 0xbc,
-             0x84, 0x28, 0x80, 0x14,
-             0xf3, 0x7c, 0x44, 0x20,
-             0x80, 0x04, 0x84, 0x26,
-             0x42, 0x10, 0x80, 0x18,
-             0x80, 0x16, 0xf1, 0xfc,
-             0xef, 0xf8, 0x77, 0x88,
-             0x83, 0x11, 0x01, 0x01,
-             0x0c, 0x0c, 0x8c, 0x2b,
-             0x22, 0xb8, 0xf2, 0x00,
-             0xc1, 0xc3, 0xff, 0xfc,
-             0xf8, 0x1c, 0x04, 0x0c,
-             0x61, 0x41, 0x00, 0x19,
-             0x08, 0x00, 0x40, 0x15,
-             0xc0, 0xcd, 0x65, 0xe1,
-             0x61, 0x45, 0x00, 0x29,
-             0x0a, 0x00, 0x40, 0x15,
-             0xc0, 0xcd, 0x65, 0xa1,
-             0x62, 0x11, 0x00, 0x39,
-             0x91, 0xc1, 0x40, 0x15,
-             0x81, 0x71, 0x01, 0x61,
-             0xe6, 0x86, 0x44, 0x2a,
-             0x62, 0x1d, 0x00, 0x19,
-             0x40, 0x21, 0xc0, 0x15,
-             0x40, 0x15, 0x63, 0x09,
-             0x40, 0x31, 0x81, 0x21,
-             0xc0, 0x15, 0x63, 0x0d,
-             0x06, 0x10, 0x07, 0xc5,
-             0x0c, 0x4a, 0xe4, 0x30,
-             0x0c, 0x1a, 0xe0, 0x00,
-             0x40, 0x0a, 0xf8, 0x7c,
-             0x0a, 0x50, 0xe1, 0x84,
-             0x0e, 0x06, 0x04, 0x10,
-             0x94, 0x84, 0x80, 0x00,
-             0x50, 0x0a, 0x51, 0x84,
-             0x82, 0x25, 0xe4, 0x9c,
-             0x6c, 0x34, 0x12, 0x80,
-             0x12, 0xda, 0xa1, 0x8b,
-             0x42, 0x0a, 0xe4, 0x08,
-             0x80, 0x95, 0xed, 0x80,
-             0x82, 0x61, 0x02, 0x71,
-             0xbf, 0x8b, 0x85, 0x05,
-             0xa1, 0x6b, 0x88, 0x25,
-             0x00, 0x95, 0x82, 0x45,
-             0xc0, 0x0c, 0x6d, 0x65,
-             0x12, 0xc0, 0x93, 0x6b,
-             0x40, 0x93, 0x84, 0x20,
-             0x80, 0x16, 0x0b, 0xe1,
-             0xf0, 0x3c, 0x52, 0x80,
-             0x02, 0xa5, 0xb9, 0x9b,
-             0x9b, 0x80, 0x18, 0xc4,
-             0xa1, 0x9b, 0x49, 0x87,
-             0x73, 0xfd, 0x50, 0x80,
-             0x18, 0xc4, 0x40, 0x0f,
-             0x50, 0x8a, 0xfb, 0x80,
-             0x90, 0xc3, 0xc6, 0xa6,
-             0x88, 0xc1, 0x7d, 0x05,
-             0xe5, 0xfc, 0x0d, 0x0a,
-             0x40, 0x23, 0xf0, 0xa5,
-             0x40, 0x0a, 0x68, 0x95,
-             0xfb, 0x80, 0x08, 0xc4,
-             0x68, 0x89, 0x40, 0x13,
-             0x88, 0x33, 0x40, 0x0a,
-             0x6f, 0xf1, 0x06, 0x8a,
-             0x0a, 0x34, 0x40, 0x2b,
-             0x00, 0x49, 0xfb, 0x80,
-             0x00, 0x2d, 0x07, 0xcd,
-             0x40, 0x13, 0x88, 0x11,
-             0x40, 0x0a, 0x68, 0x8d,
-             0xec, 0x04, 0x02, 0x30,
-             0x68, 0x91, 0x40, 0x33,
-             0x06, 0x06, 0x40, 0x0a,
-             0xc0, 0x20, 0x70, 0x01,
-             0x68, 0x85, 0x40, 0x13,
-             0x02, 0x14, 0x40, 0x0a,
-             0x48, 0x40, 0xfb, 0x80,
-             0xa6, 0x1f, 0x1c, 0x20,
-             0x07, 0xcd, 0x40, 0x41,
-             0x00, 0x45, 0x80, 0x2d,
-             0xc0, 0x0c, 0x6d, 0x61,
-             0x64, 0xf9, 0x40, 0x15,
-             0x40, 0x15, 0xc0, 0x0b,
-             0xc0, 0x0b, 0x64, 0xfd,
-             0x89, 0x41, 0x09, 0x5b,
-             0x0e, 0x09, 0x00, 0x2b,
-             0x40, 0x43, 0xc0, 0x15,
-             0xc0, 0x0a, 0x68, 0x81,
-             0x12, 0xfd, 0x44, 0x20,
-             0x40, 0x23, 0xc0, 0xff,
-             0x40, 0x15, 0x0e, 0x09,
-             0xe1, 0x3c, 0x44, 0xc6,
-             0x41, 0x06, 0x08, 0x24,
-             0x88, 0x1e, 0xe1, 0x3c,
-             0x80, 0x1e, 0x80, 0x04,
-             0xf0, 0x1c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xf8, 0x04, 0x04, 0x0c,
-             0x61, 0x90, 0x4a, 0x86,
-             0xe0, 0x90, 0x0c, 0x14,
-             0x4e, 0x00, 0x14, 0xca,
-             0x0c, 0x64, 0xf0, 0x3c,
-             0xa1, 0x0b, 0x7b, 0x80,
-             0x00, 0x16, 0x2e, 0x6f,
-             0x58, 0x22, 0x80, 0x00,
-             0x40, 0x1a, 0x71, 0xb0,
-             0x04, 0xc4, 0xe6, 0x82,
-             0x02, 0xc4, 0x60, 0xc0,
-             0x24, 0x6f, 0xfb, 0x80,
-             0x49, 0x6e, 0x86, 0x2b,
-             0x94, 0x5a, 0xc5, 0x07,
-             0x02, 0x00, 0x02, 0x53,
-             0x4a, 0x50, 0xe4, 0x04,
-             0xc1, 0xff, 0x73, 0xf1,
-             0x8a, 0x43, 0x01, 0x65,
-             0x00, 0x00, 0x51, 0x54,
-             0xc9, 0x5e, 0xec, 0x04,
-             0xfe, 0x75, 0xa1, 0x0b,
-             0x40, 0x32, 0xc4, 0x17,
-             0x0c, 0x0c, 0xf0, 0x84,
-             0xdd, 0x93, 0xf0, 0x04,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x50, 0x1e, 0xf0,
-             0x0c, 0x09, 0x80, 0x6b,
-             0xc0, 0x33, 0x6d, 0xe1,
-             0x40, 0x60, 0xa3, 0x0b,
-             0x4f, 0x78, 0x9c, 0x00,
-             0x40, 0x06, 0x88, 0x00,
-             0x02, 0x96, 0x61, 0x34,
-             0x00, 0x04, 0xe0, 0x04,
-             0xe1, 0x98, 0x51, 0x46,
-             0x6c, 0x1d, 0x4c, 0x11,
-             0x81, 0x71, 0x40, 0x2b,
-             0x00, 0x16, 0xa0, 0x7e,
-             0x0c, 0x0b, 0x81, 0x11,
-             0xc0, 0x15, 0x6e, 0x09,
-             0x73, 0xfd, 0x40, 0x00,
-             0x4c, 0x03, 0xc0, 0xfd,
-             0x40, 0x15, 0x6e, 0x09,
-             0x63, 0x98, 0x81, 0x01,
-             0x7e, 0x0e, 0xe8, 0x1c,
-             0xe1, 0x48, 0x40, 0x06,
-             0x40, 0x46, 0x00, 0x14,
-             0xfc, 0x1e, 0xe1, 0x48,
-             0x80, 0x04, 0x84, 0x18,
-             0x0c, 0x29, 0x80, 0x08,
-             0xc0, 0x2d, 0x67, 0xcd,
-             0x68, 0x89, 0x0c, 0x0b,
-             0x06, 0x04, 0x40, 0x0a,
-             0x02, 0x29, 0xe0, 0xa0,
-             0x3e, 0x3e, 0xa6, 0x1f,
-             0x24, 0x1f, 0xf0, 0x27,
-             0x4c, 0x15, 0xc5, 0x07,
-             0x40, 0x02, 0x68, 0x01,
-             0x64, 0x31, 0x06, 0x60,
-             0x83, 0x11, 0xc0, 0x28,
-             0x46, 0x75, 0xc1, 0x1d,
-             0x02, 0x10, 0x58, 0x04,
-             0x7e, 0x75, 0xc4, 0x04,
-             0xc4, 0x10, 0x06, 0x30,
-             0x61, 0x90, 0x01, 0xc6,
-             0x65, 0xe0, 0x08, 0x60,
-             0x00, 0x0a, 0xc0, 0xcd,
-             0x65, 0xa1, 0x0a, 0x60,
-             0x01, 0xb1, 0xc0, 0xcd,
-             0xbc, 0x0e, 0x81, 0xa1,
-             0xf8, 0x04, 0x46, 0x05,
-             0x09, 0x0e, 0xa0, 0x04,
-             0xe1, 0x90, 0x40, 0x86,
-             0x81, 0x01, 0x00, 0x9a,
-             0x14, 0x4a, 0x8b, 0x85,
-             0x14, 0x1a, 0xe0, 0x00,
-             0x40, 0x0a, 0xf8, 0x7c,
-             0x0a, 0x50, 0xe1, 0x84,
-             0x16, 0x06, 0x04, 0x10,
-             0x94, 0x14, 0x80, 0x00,
-             0x42, 0x0a, 0x51, 0x14,
-             0x90, 0xe5, 0xe4, 0xac,
-             0x84, 0x25, 0xa1, 0xab,
-             0x6d, 0x65, 0x0c, 0x25,
-             0x85, 0xab, 0xc0, 0x0c,
-             0x08, 0x91, 0x0c, 0x0b,
-             0x40, 0x00, 0x80, 0x0a,
-             0x80, 0xff, 0x13, 0xf1,
-             0x90, 0x98, 0x40, 0x02,
-             0x06, 0x00, 0x0e, 0xa5,
-             0x80, 0x28, 0x04, 0x01,
-             0xec, 0x34, 0x04, 0x10,
-             0x80, 0xb5, 0xe4, 0x2d,
-             0xbf, 0x1b, 0x4d, 0x1e,
-             0x87, 0x25, 0x8a, 0xd5,
-             0x8a, 0x65, 0xa1, 0x1b,
-             0x70, 0x3c, 0x58, 0x10,
-             0xe1, 0xc0, 0x04, 0x14,
-             0xb9, 0xcb, 0x0c, 0x1e,
-             0x84, 0x8b, 0x01, 0x71,
-             0x49, 0x17, 0x82, 0x45,
-             0x4e, 0x10, 0xa1, 0xcb,
-             0x40, 0x0f, 0x73, 0xfd,
-             0x4e, 0x7a, 0x80, 0x8b,
-             0xc5, 0x77, 0xc6, 0xb2,
-             0x92, 0x23, 0x09, 0x14,
-             0x73, 0xf1, 0x40, 0x20,
-             0x88, 0x31, 0x41, 0xff,
-             0x02, 0x03, 0x86, 0x2b,
-             0x81, 0xa5, 0x8e, 0x1b,
-             0x02, 0x10, 0x21, 0x8b,
-             0x00, 0xc5, 0xec, 0x04,
-             0x88, 0x01, 0x00, 0x00,
-             0x00, 0x00, 0x44, 0xc5,
-             0xa1, 0x1b, 0x88, 0x21,
-             0x44, 0x77, 0xfc, 0xd5,
-             0x8e, 0x33, 0x90, 0x0b,
-             0x82, 0xa1, 0x02, 0xb1,
-             0xe5, 0xfc, 0x15, 0x0a,
-             0x9d, 0x01, 0xe8, 0xe5,
-             0x9f, 0x01, 0x0c, 0x0e,
-             0xbc, 0x04, 0x8e, 0x0e,
-             0xfc, 0x04, 0xcc, 0x0e,
-             0x0c, 0x19, 0x80, 0x08,
-             0xc0, 0x15, 0x62, 0xed,
-             0xf0, 0x17, 0xbe, 0x24,
-             0xa2, 0x0f, 0xa4, 0x0f,
-             0x68, 0x01, 0x4c, 0x05,
-             0x8c, 0x0b, 0x40, 0x02,
-             0xe8, 0x10, 0x47, 0x28,
-             0xe1, 0x48, 0x40, 0x06,
-             0x80, 0x18, 0x80, 0x04,
-             0xe0, 0x90, 0x42, 0x0a,
-             0x80, 0x18, 0x82, 0x65,
-             0x42, 0x10, 0x80, 0x28,
-             0x44, 0x20, 0xf0, 0x80,
-             0xa2, 0x2f, 0xf3, 0x7c,
-             0xf8, 0x80, 0x42, 0x20,
-             0x7e, 0x04, 0x80, 0x16,
-             0x57, 0x98, 0x83, 0x11,
-             0x40, 0xc6, 0xe8, 0x1c,
-             0x80, 0x04, 0xe1, 0x90,
-             0x0c, 0x0b, 0xa3, 0x0b,
-             0x80, 0x15, 0x0e, 0x09,
-             0x9c, 0xa4, 0x00, 0x04,
-             0x0e, 0x09, 0x4c, 0x03,
-             0x80, 0x85, 0x80, 0x15,
-             0x68, 0x00, 0x49, 0xc8,
-             0x03, 0x01, 0x8c, 0x0b,
-             0x45, 0x58, 0x81, 0x11,
-             0x8c, 0x2b, 0x6f, 0xfc,
-             0x0c, 0x0c, 0xa8, 0xf1,
-             0x19, 0x58, 0xf2, 0x7c,
-             0xc1, 0xc3, 0xff, 0xf8,
-             0xf8, 0x7c, 0x04, 0x0c,
-             0x63, 0x09, 0x00, 0x19,
-             0x81, 0x21, 0x40, 0x15,
-             0x00, 0xc9, 0x91, 0x15,
-             0x40, 0x33, 0x6d, 0xe9,
-             0xfa, 0x80, 0x08, 0x24,
-             0x63, 0x0d, 0x00, 0x69,
-             0x46, 0x02, 0x40, 0x15,
-             0x06, 0x59, 0xf0, 0x90,
-             0xc0, 0x15, 0x6f, 0x41,
-             0x58, 0x6a, 0xa1, 0xcb,
-             0x0c, 0x30, 0x66, 0x92,
-             0xc0, 0xcf, 0x65, 0xf0,
-             0x6d, 0xf1, 0x46, 0x51,
-             0x86, 0x45, 0xc0, 0x33,
-             0x7a, 0x80, 0x0e, 0xc4,
-             0x12, 0x84, 0x81, 0x81,
-             0xcb, 0x9d, 0xfa, 0x80,
-             0x54, 0x92, 0x84, 0x05,
-             0x56, 0x02, 0xf0, 0x9c,
-             0x16, 0xb9, 0xf0, 0xa8,
-             0xc0, 0x1a, 0x6e, 0x41,
-             0x7c, 0x85, 0xb9, 0xbb,
-             0x84, 0x04, 0x10, 0x80,
-             0x94, 0xcb, 0x32, 0x53,
-             0x81, 0x45, 0x98, 0x56,
-             0x81, 0x71, 0x0b, 0x9b,
-             0x0a, 0x8a, 0x80, 0xa5,
-             0x83, 0x71, 0x74, 0x08,
-             0x18, 0x76, 0x80, 0x75,
-             0x18, 0xc4, 0x8e, 0x5b,
-             0x0c, 0x00, 0x7a, 0x80,
-             0xc0, 0x58, 0x66, 0x40,
-             0x60, 0x88, 0x0e, 0xc4,
-             0xe0, 0x88, 0x12, 0x44,
-             0x7c, 0x1c, 0x0c, 0x85,
-             0x65, 0xf0, 0x14, 0x00,
-             0x14, 0x93, 0xc0, 0xcf,
-             0x0a, 0x0a, 0x8c, 0x73,
-             0x82, 0x21, 0x7b, 0xfc,
-             0xe0, 0x40, 0x52, 0x85,
-             0xe8, 0x00, 0x0e, 0x85,
-             0x62, 0x40, 0x52, 0x85,
-             0xe0, 0x84, 0x10, 0xc4,
-             0x64, 0x00, 0x0e, 0x75,
-             0x18, 0x63, 0x8c, 0x83,
-             0xd0, 0x80, 0x58, 0xc2,
-             0x61, 0x40, 0x52, 0x75,
-             0xe0, 0x84, 0x12, 0x44,
-             0x68, 0x01, 0x10, 0x7b,
-             0x94, 0x93, 0x40, 0x01,
-             0x52, 0x73, 0x88, 0xa3,
-             0x10, 0x7b, 0xe6, 0x80,
-             0xc0, 0x01, 0x6c, 0x01,
-             0xe7, 0x80, 0x52, 0x73,
-             0x60, 0x01, 0x0c, 0x79,
-             0x54, 0x71, 0xc0, 0x04,
-             0xc0, 0x01, 0x61, 0x01,
-             0x64, 0x01, 0x0c, 0x49,
-             0x54, 0x41, 0xc0, 0x04,
-             0xc0, 0x01, 0x62, 0x01,
-             0x68, 0x01, 0x0c, 0x49,
-             0x54, 0x41, 0xc0, 0x04,
-             0x40, 0x01, 0x63, 0x01,
-             0x18, 0x49, 0x81, 0x41,
-             0xc0, 0x1a, 0x0e, 0x41,
-             0x61, 0xf1, 0x46, 0x41,
-             0x44, 0x8a, 0xc0, 0x35,
-             0xde, 0xd5, 0xf4, 0x04,
-             0xf0, 0x7c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x84, 0x04, 0x0c,
-             0x81, 0x01, 0x00, 0x7b,
-             0x68, 0x1c, 0x4c, 0xa8,
-             0x0e, 0x1b, 0x81, 0x11,
-             0x40, 0x0a, 0x68, 0x91,
-             0x00, 0x70, 0x80, 0x6b,
-             0x40, 0x28, 0x64, 0x01,
-             0x70, 0x01, 0x04, 0x06,
-             0x88, 0x11, 0xc0, 0x20,
-             0xc5, 0x17, 0x01, 0x65,
-             0x02, 0x10, 0x41, 0x34,
-             0xc9, 0x3e, 0xec, 0x04,
-             0xfe, 0x75, 0xa1, 0x1b,
-             0x61, 0x48, 0x40, 0x06,
-             0x80, 0x04, 0x8e, 0x2b,
-             0xe0, 0x19, 0x80, 0x18,
-             0x83, 0x01, 0x00, 0x16,
-             0x6f, 0xf8, 0x79, 0xc8,
-             0x4d, 0xf8, 0x81, 0x11,
-             0x79, 0x78, 0xef, 0xf8,
-             0x8e, 0x0b, 0x68, 0x0c,
-             0xe1, 0x90, 0x01, 0xc6,
-             0x82, 0x11, 0x80, 0x1a,
-             0x83, 0x11, 0x00, 0x1c,
-             0x0c, 0x0c, 0x8c, 0x0b,
-             0x09, 0xb8, 0xf2, 0x84,
-             0xc1, 0xc3, 0xe0, 0x1c,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x42, 0x06, 0x02, 0x6b,
-             0x04, 0x14, 0xe1, 0x48,
-             0xe0, 0x98, 0x06, 0x04,
-             0xf1, 0x00, 0x46, 0x30,
-             0x44, 0x20, 0x84, 0x28,
-             0x26, 0x2f, 0xf2, 0xfc,
-             0xe1, 0x90, 0x46, 0xc6,
-             0x0c, 0x0e, 0x84, 0x26,
-             0x0c, 0x1b, 0x82, 0x09,
-             0x40, 0x15, 0x6e, 0x09,
-             0x42, 0x10, 0xd0, 0x07,
-             0xc0, 0xfe, 0x73, 0xfd,
-             0x4c, 0x13, 0xa0, 0x1f,
-             0xc0, 0x15, 0x6e, 0x09,
-             0xef, 0xf8, 0x4b, 0x08,
-             0x81, 0x11, 0x01, 0x01,
-             0x0c, 0x0c, 0x8c, 0x2b,
-             0x36, 0x38, 0xf2, 0x00,
-             0xc1, 0xc3, 0xff, 0xf8,
-             0xe1, 0x00, 0x01, 0x86,
-             0x80, 0x08, 0x80, 0x04,
-             0x82, 0x09, 0x5d, 0x93,
-             0xc7, 0x13, 0xc1, 0x83,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x0c, 0x04, 0x0c,
-             0x81, 0x01, 0x00, 0x6b,
-             0x82, 0x8b, 0x04, 0x7b,
-             0x65, 0x39, 0x4c, 0x01,
-             0x04, 0x60, 0x40, 0x2c,
-             0xc0, 0xb1, 0x65, 0x41,
-             0x8c, 0x0b, 0x03, 0x11,
-             0xe8, 0x00, 0x42, 0x88,
-             0x8c, 0x0b, 0x03, 0x11,
-             0xe8, 0x00, 0x4e, 0x28,
-             0x80, 0xd5, 0xa1, 0x0b,
-             0x68, 0x44, 0x4c, 0xc8,
-             0xa1, 0x0b, 0x8c, 0x0b,
-             0x0c, 0x0c, 0x80, 0x85,
-             0xdd, 0x93, 0xf2, 0x0c,
-             0x45, 0x76, 0x01, 0x11,
-             0x09, 0x31, 0xe0, 0x00,
-             0x50, 0x98, 0x8c, 0x0b,
-             0xa3, 0x8b, 0xe8, 0x44,
-             0xa1, 0x0b, 0xfc, 0xb5,
-             0x0c, 0x0b, 0xfc, 0x75,
-             0x52, 0x38, 0x8e, 0x1b,
-             0xa1, 0x0b, 0xe8, 0x00,
-             0x01, 0x11, 0xfa, 0xb5,
-             0x8c, 0x0b, 0x81, 0x21,
-             0xf2, 0x0c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xb1, 0x45,
-             0xf8, 0x7c, 0x04, 0x0c,
-             0xec, 0xc0, 0x1e, 0xf0,
-             0x60, 0x04, 0x46, 0x86,
-             0x40, 0x31, 0xa5, 0x1b,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0xe0, 0x04, 0x0e, 0x06,
-             0xa1, 0x81, 0x0e, 0xa5,
-             0xaa, 0x35, 0xa3, 0x1b,
-             0x60, 0x0c, 0x41, 0xe6,
-             0xe0, 0x0c, 0x59, 0xe6,
-             0x01, 0xa6, 0x17, 0x0e,
-             0x11, 0x0e, 0xe0, 0x04,
-             0xe0, 0x04, 0x01, 0x26,
-             0x01, 0x86, 0x0f, 0x0e,
-             0x15, 0x0e, 0xe0, 0x04,
-             0xe0, 0x04, 0x00, 0x06,
-             0xa1, 0x01, 0x0b, 0x0e,
-             0x00, 0x06, 0x09, 0x0e,
-             0x7e, 0x0e, 0xe0, 0x04,
-             0x7c, 0x0e, 0xa1, 0x01,
-             0xe0, 0x04, 0x01, 0x86,
-             0x01, 0x86, 0x0d, 0x0e,
-             0x3e, 0x0e, 0xe0, 0x04,
-             0xe0, 0x04, 0x01, 0xa6,
-             0x49, 0xf6, 0x3c, 0x0e,
-             0x4b, 0xa6, 0xe0, 0x0c,
-             0x03, 0xa6, 0x60, 0x0c,
-             0x07, 0x06, 0xe0, 0x0c,
-             0x11, 0x06, 0x60, 0x04,
-             0x0d, 0xa6, 0xe0, 0x04,
-             0x13, 0xa6, 0x60, 0x04,
-             0x0f, 0xa6, 0xe0, 0x0c,
-             0x55, 0xa6, 0x60, 0x0c,
-             0x13, 0xce, 0xe0, 0x0c,
-             0xe0, 0x0c, 0x41, 0xe6,
-             0x57, 0xf6, 0x05, 0x95,
-             0x00, 0x06, 0xe0, 0x0c,
-             0x89, 0x11, 0x60, 0x08,
-             0x91, 0x01, 0x13, 0x0e,
-             0x40, 0x06, 0x17, 0x0e,
-             0x0d, 0x0e, 0xe0, 0x00,
-             0x15, 0x0e, 0x85, 0x01,
-             0x0b, 0x0e, 0x83, 0x01,
-             0x09, 0x0e, 0x81, 0x01,
-             0x7e, 0x0e, 0xa1, 0x01,
-             0x7c, 0x0e, 0x83, 0x01,
-             0x0f, 0x0e, 0x81, 0x01,
-             0x11, 0x0e, 0x85, 0x01,
-             0x3e, 0x0e, 0x81, 0x01,
-             0xe0, 0x00, 0x40, 0x06,
-             0x81, 0x31, 0x3c, 0x0e,
-             0x81, 0x91, 0x01, 0x61,
-             0x14, 0x06, 0x01, 0x51,
-             0x01, 0x01, 0xe0, 0x04,
-             0x16, 0x06, 0x81, 0x41,
-             0x81, 0xc1, 0xe0, 0x08,
-             0x8b, 0xc4, 0x88, 0xc6,
-             0x89, 0xc4, 0x8a, 0xc6,
-             0xfe, 0xc4, 0xc8, 0xc6,
-             0xfc, 0xc4, 0xca, 0xc6,
-             0xe0, 0x18, 0x44, 0x81,
-             0xe0, 0x14, 0x44, 0x31,
-             0xe0, 0x10, 0x44, 0xc1,
-             0xe0, 0x1c, 0x44, 0x31,
-             0xe0, 0x20, 0x44, 0x31,
-             0x44, 0x31, 0x95, 0x34,
-             0x8f, 0x34, 0xe0, 0x24,
-             0xe0, 0x28, 0x44, 0x31,
-             0x44, 0x31, 0x8d, 0x34,
-             0x91, 0x34, 0xe0, 0x2c,
-             0xe0, 0x30, 0x44, 0x31,
-             0x44, 0x31, 0xbe, 0x34,
-             0xbc, 0x34, 0xe0, 0x34,
-             0xe0, 0x3c, 0x44, 0x61,
-             0xe0, 0x40, 0x44, 0x61,
-             0xe0, 0x38, 0x44, 0x31,
-             0xe0, 0x48, 0x44, 0x91,
-             0xe0, 0x4c, 0x44, 0x71,
-             0xe0, 0x44, 0x44, 0x11,
-             0xe0, 0x50, 0x44, 0x11,
-             0xe0, 0x58, 0x44, 0xa1,
-             0xe0, 0x54, 0x44, 0x51,
-             0xe0, 0x5c, 0x44, 0x51,
-             0xe0, 0x60, 0x44, 0x51,
-             0xe0, 0x68, 0x44, 0x01,
-             0x44, 0x01, 0x93, 0x04,
-             0x97, 0x04, 0xe0, 0x6c,
-             0xe0, 0x78, 0x44, 0xb1,
-             0xe0, 0x74, 0x44, 0x41,
-             0xe0, 0x64, 0x44, 0x01,
-             0xe0, 0x70, 0x44, 0x01,
-             0xe0, 0x7c, 0x44, 0x41,
-             0xe0, 0xf1, 0x01, 0x01,
-             0xf0, 0x7c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x04, 0x04, 0x0c,
-             0xec, 0x90, 0x1e, 0xf0,
-             0x80, 0x6b, 0x25, 0x1b,
-             0x81, 0x01, 0x04, 0x25,
-             0x92, 0x95, 0xa3, 0x1b,
-             0x65, 0x41, 0x02, 0x60,
-             0x8c, 0x0b, 0x40, 0xb1,
-             0xe8, 0x44, 0x56, 0x28,
-             0x90, 0x95, 0xa1, 0x0b,
-             0x4c, 0x01, 0x83, 0x01,
-             0xc0, 0x2c, 0x65, 0x39,
-             0x42, 0x86, 0x87, 0xe5,
-             0x04, 0x06, 0x60, 0x04,
-             0x4c, 0x11, 0xe0, 0x04,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x60, 0x11, 0x02, 0x06,
-             0x3e, 0x1e, 0xc4, 0x00,
-             0x09, 0x1c, 0x83, 0x11,
-             0x15, 0x16, 0xa1, 0x11,
-             0xe0, 0x00, 0x42, 0x06,
-             0x85, 0x71, 0x1f, 0x16,
-             0x89, 0x11, 0x25, 0x16,
-             0x31, 0x16, 0xab, 0x16,
-             0xaf, 0x26, 0x91, 0x11,
-             0x04, 0x06, 0x35, 0x26,
-             0x97, 0x06, 0xe0, 0x08,
-             0x9b, 0x76, 0x99, 0x06,
-             0xa1, 0x76, 0x9d, 0x06,
-             0xa7, 0x06, 0xa3, 0x06,
-             0xad, 0x06, 0xa9, 0x06,
-             0xb7, 0x06, 0xb3, 0x06,
-             0xbb, 0x16, 0xb9, 0x06,
-             0x60, 0x80, 0x5e, 0x11,
-             0xe4, 0x10, 0x02, 0xf0,
-             0xbf, 0x26, 0xbd, 0x06,
-             0xe0, 0x84, 0x5e, 0x01,
-             0x60, 0x8c, 0x5e, 0x01,
-             0x5e, 0x21, 0x8c, 0x0b,
-             0x52, 0x38, 0xe0, 0x88,
-             0xa1, 0x0b, 0xe8, 0x44,
-             0x4c, 0x71, 0x80, 0xb5,
-             0xc0, 0x2c, 0x65, 0x39,
-             0xc8, 0xf1, 0x81, 0x01,
-             0xf2, 0x04, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfe, 0x7c, 0x04, 0xcc,
-             0x80, 0x6b, 0x02, 0x7b,
-             0x64, 0x90, 0x02, 0xf0,
-             0xe4, 0x80, 0x04, 0xf0,
-             0xe8, 0x10, 0x49, 0x08,
-             0x60, 0x90, 0x1e, 0x89,
-             0xe0, 0x04, 0x0e, 0x2a,
-             0xe0, 0x80, 0x1e, 0x79,
-             0x40, 0x01, 0x01, 0x88,
-             0x04, 0x60, 0xc0, 0x00,
-             0x40, 0xb1, 0x65, 0xc1,
-             0x01, 0x55, 0x99, 0x31,
-             0x49, 0x16, 0x81, 0x11,
-             0xec, 0x04, 0x06, 0x30,
-             0xfe, 0x95, 0xa1, 0x3b,
-             0x65, 0xf1, 0x04, 0x60,
-             0x9d, 0x31, 0x40, 0xb1,
-             0x49, 0x1c, 0x81, 0x45,
-             0xec, 0x04, 0x06, 0x30,
-             0xfe, 0x95, 0xa1, 0x3b,
-             0x15, 0xc6, 0x01, 0x91,
-             0x07, 0x85, 0xea, 0xf0,
-             0xa1, 0x0b, 0x81, 0xb1,
-             0x40, 0x62, 0x8e, 0x15,
-             0x04, 0x74, 0x70, 0xa8,
-             0x00, 0x9c, 0xfa, 0x80,
-             0xe0, 0x90, 0x00, 0x84,
-             0x79, 0x9c, 0x42, 0x02,
-             0xf0, 0xac, 0x40, 0x62,
-             0x6e, 0xf1, 0x40, 0x11,
-             0x43, 0xf6, 0x40, 0x2b,
-             0x80, 0x00, 0x40, 0x0d,
-             0x60, 0x31, 0x40, 0x91,
-             0x40, 0x11, 0xc0, 0x2c,
-             0x80, 0x2c, 0x42, 0xb1,
-             0x43, 0xf1, 0x40, 0x11,
-             0x02, 0xb4, 0x00, 0x2c,
-             0x40, 0x91, 0xfa, 0x80,
-             0x00, 0x2c, 0x41, 0x71,
-             0x54, 0x18, 0x8c, 0x0b,
-             0x1e, 0x89, 0xe8, 0x00,
-             0x00, 0x80, 0x60, 0x90,
-             0x02, 0x04, 0xe4, 0x04,
-             0x82, 0xb1, 0x7a, 0x80,
-             0x04, 0x80, 0x84, 0xa1,
-             0x43, 0x4a, 0xe4, 0x24,
-             0x02, 0x0c, 0xe4, 0x08,
-             0x50, 0x00, 0x62, 0x00,
-             0x02, 0x73, 0xdc, 0x00,
-             0x17, 0x0a, 0x81, 0x01,
-             0xf2, 0x05, 0xe5, 0x3c,
-             0xf6, 0x7c, 0x0c, 0xcc,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xee, 0x70, 0x1e, 0xf0,
-             0xa1, 0x1b, 0x00, 0x6b,
-             0x65, 0x39, 0x0c, 0x09,
-             0x84, 0x8b, 0x40, 0x2c,
-             0x42, 0x66, 0x8a, 0x85,
-             0xa5, 0x0b, 0x60, 0x04,
-             0x6c, 0x1d, 0x4c, 0x11,
-             0x81, 0x91, 0x40, 0x2b,
-             0x81, 0xa1, 0x02, 0xc5,
-             0x8c, 0x0b, 0x05, 0x11,
-             0xef, 0xfc, 0x72, 0x68,
-             0xa1, 0xab, 0x80, 0xab,
-             0xc0, 0x00, 0x10, 0x58,
-             0x68, 0x04, 0x6e, 0xa8,
-             0x80, 0xab, 0x8c, 0x0b,
-             0xe4, 0x40, 0x10, 0x8a,
-             0xc0, 0x00, 0x0d, 0x68,
-             0x0d, 0x38, 0xa1, 0xab,
-             0x0c, 0x29, 0xc0, 0x00,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0xe0, 0x00, 0x42, 0xb6,
-             0x68, 0x04, 0x7e, 0x28,
-             0x54, 0xb6, 0x8c, 0x0b,
-             0x23, 0x0b, 0xe0, 0x00,
-             0x0c, 0x78, 0x81, 0x81,
-             0x9d, 0xa5, 0xc0, 0x00,
-             0x40, 0xa6, 0x23, 0x0b,
-             0x4c, 0x01, 0xe0, 0x04,
-             0xc0, 0x2b, 0x6c, 0x1d,
-             0x03, 0x11, 0x82, 0x25,
-             0x6f, 0xd8, 0x8c, 0x0b,
-             0x80, 0xab, 0xef, 0xfc,
-             0x0d, 0xc8, 0xa1, 0xab,
-             0x00, 0xc6, 0xc0, 0x00,
-             0x02, 0xf0, 0x60, 0x08,
-             0x01, 0x55, 0xe4, 0x40,
-             0x45, 0x86, 0x81, 0x81,
-             0xec, 0x04, 0x00, 0x00,
-             0xfe, 0x95, 0xa1, 0x0b,
-             0x81, 0x01, 0x3e, 0x6e,
-             0x81, 0x01, 0x7e, 0x0e,
-             0x65, 0x71, 0x12, 0x60,
-             0x17, 0x06, 0x40, 0xb0,
-             0x7c, 0x0e, 0xe0, 0x04,
-             0x89, 0x55, 0x81, 0x71,
-             0x78, 0x81, 0x12, 0x09,
-             0x95, 0x11, 0x40, 0x01,
-             0x14, 0x04, 0x8e, 0x6b,
-             0x9e, 0x09, 0x61, 0x90,
-             0xe6, 0x86, 0x42, 0xaa,
-             0x01, 0x0a, 0x82, 0x03,
-             0x80, 0xf5, 0xe6, 0x30,
-             0xe1, 0x34, 0x02, 0x46,
-             0x84, 0x14, 0x84, 0x14,
-             0x82, 0xf5, 0xb7, 0x1b,
-             0x03, 0x36, 0x3e, 0x04,
-             0x0f, 0x36, 0xe0, 0x08,
-             0x00, 0x29, 0xe0, 0x08,
-             0xc0, 0x2b, 0x6c, 0x1d,
-             0xe8, 0x04, 0x79, 0x68,
-             0x00, 0xc6, 0x23, 0x0b,
-             0x88, 0x05, 0xe0, 0x08,
-             0x06, 0xd5, 0xa1, 0x6b,
-             0xdc, 0x00, 0x4e, 0x60,
-             0x04, 0xf0, 0x24, 0x18,
-             0x16, 0x0a, 0xe4, 0x40,
-             0x80, 0x23, 0x61, 0x40,
-             0x5e, 0xa5, 0x88, 0x16,
-             0x0e, 0x06, 0x00, 0x0c,
-             0x5e, 0xa5, 0x80, 0x00,
-             0x82, 0xc5, 0x80, 0x08,
-             0x81, 0x71, 0x7e, 0x04,
-             0xfa, 0x80, 0x00, 0x04,
-             0xfb, 0x80, 0x40, 0xa2,
-             0xfc, 0x04, 0xfe, 0x0e,
-             0xfa, 0x80, 0x00, 0x04,
-             0xfa, 0x80, 0x40, 0xa2,
-             0x16, 0xb0, 0xfc, 0x0e,
-             0x82, 0x91, 0x6c, 0x04,
-             0xee, 0x75, 0xa1, 0xbb,
-             0x16, 0x46, 0x3e, 0x64,
-             0x87, 0xe5, 0xe1, 0x34,
-             0x7a, 0x80, 0x02, 0x84,
-             0x5f, 0xb8, 0x8c, 0x0b,
-             0xa1, 0x0b, 0xe8, 0x00,
-             0xac, 0x04, 0x80, 0xb5,
-             0xb9, 0x0b, 0x80, 0x04,
-             0x40, 0x62, 0x8c, 0x55,
-             0x95, 0x11, 0x70, 0xa0,
-             0x6b, 0x51, 0x00, 0x09,
-             0x12, 0x04, 0xc0, 0x2c,
-             0x9e, 0x09, 0x61, 0x90,
-             0xe6, 0x86, 0x54, 0x9a,
-             0x15, 0x0a, 0x80, 0xa3,
-             0x80, 0xb5, 0xe6, 0x30,
-             0x80, 0x04, 0xac, 0x04,
-             0x82, 0xd5, 0xb9, 0x0b,
-             0x6c, 0x1d, 0x0c, 0x29,
-             0x03, 0x36, 0x40, 0x2b,
-             0x74, 0x58, 0xe0, 0x08,
-             0x8c, 0x0b, 0x68, 0x04,
-             0x14, 0xc6, 0xa3, 0x0b,
-             0x0f, 0x36, 0x40, 0x08,
-             0x00, 0xf0, 0x80, 0x08,
-             0x9f, 0x11, 0x64, 0x40,
-             0x80, 0x16, 0x94, 0x03,
-             0xfc, 0x14, 0xfe, 0x04,
-             0xfa, 0x80, 0x00, 0x04,
-             0x7b, 0x80, 0x40, 0x92,
-             0xfa, 0x80, 0x02, 0x14,
-             0x40, 0x92, 0x7e, 0x0e,
-             0xfc, 0x0e, 0xfa, 0x84,
-             0x10, 0x0a, 0x82, 0x81,
-             0xf0, 0x35, 0xe0, 0x80,
-             0x8e, 0xab, 0x21, 0x7b,
-             0xfc, 0x04, 0x8c, 0xf5,
-             0xfa, 0x80, 0x00, 0x04,
-             0x7e, 0x04, 0xc4, 0x07,
-             0xe4, 0x10, 0x0e, 0x00,
-             0x7a, 0x80, 0x12, 0x04,
-             0x67, 0x18, 0x8c, 0x0b,
-             0xc4, 0x97, 0x68, 0x00,
-             0x80, 0xab, 0x03, 0xd5,
-             0x88, 0xd5, 0xa1, 0xab,
-             0x61, 0x9d, 0x00, 0x36,
-             0x81, 0x11, 0x40, 0x00,
-             0x42, 0x0a, 0x81, 0xb5,
-             0x90, 0x2b, 0x60, 0x80,
-             0x5c, 0x00, 0x10, 0x29,
-             0xe4, 0x40, 0x06, 0xf0,
-             0x82, 0x11, 0x02, 0x33,
-             0x02, 0x0a, 0x8c, 0x26,
-             0xfc, 0x95, 0xe2, 0x30,
-             0x90, 0x1b, 0x0c, 0x0b,
-             0xe8, 0x04, 0x61, 0x08,
-             0x4f, 0x76, 0x00, 0xab,
-             0xa1, 0xab, 0xe0, 0x00,
-             0x02, 0x94, 0x82, 0x75,
-             0x04, 0x74, 0x7a, 0x80,
-             0x06, 0xf0, 0xfa, 0x80,
-             0x8c, 0x0b, 0x64, 0x40,
-             0xe8, 0x40, 0x78, 0x28,
-             0x14, 0x0b, 0x80, 0xab,
-             0xe6, 0x70, 0x1e, 0xf0,
-             0xf2, 0x7c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x30, 0x1e, 0xf0,
-             0x82, 0x8b, 0x00, 0x9b,
-             0x0c, 0x90, 0x7c, 0x2e,
-             0xc0, 0xaf, 0x64, 0x71,
-             0xf0, 0xa0, 0x54, 0x62,
-             0xe2, 0x80, 0x14, 0x19,
-             0xe8, 0x00, 0x55, 0x08,
-             0x80, 0x7b, 0x42, 0x87,
-             0x67, 0xc0, 0x00, 0xa0,
-             0x3c, 0x6e, 0x90, 0x63,
-             0x65, 0x45, 0x12, 0x90,
-             0x3e, 0x0e, 0xc0, 0xb1,
-             0x01, 0xa1, 0x81, 0xb1,
-             0x05, 0x55, 0x81, 0x81,
-             0xfc, 0x24, 0x81, 0x61,
-             0xf8, 0x04, 0x12, 0x09,
-             0x44, 0x0a, 0xa4, 0x18,
-             0xd0, 0x07, 0xe0, 0x80,
-             0x48, 0x00, 0x5f, 0x68,
-             0x0e, 0x0f, 0xa2, 0x0f,
-             0xfb, 0x80, 0x02, 0x64,
-             0x82, 0x45, 0x83, 0x0b,
-             0x10, 0x84, 0x03, 0x11,
-             0x14, 0xa4, 0xfa, 0x80,
-             0xb7, 0x1f, 0x7b, 0x80,
-             0x82, 0x81, 0x22, 0xaf,
-             0x3f, 0xbb, 0x80, 0x6b,
-             0x1e, 0x05, 0x82, 0xb1,
-             0x84, 0x91, 0x00, 0x04,
-             0x80, 0x00, 0x40, 0x81,
-             0x80, 0x00, 0x1e, 0x05,
-             0x80, 0x00, 0x40, 0xa3,
-             0xe0, 0x40, 0x16, 0x0a,
-             0x01, 0x01, 0xf6, 0x75,
-             0x0c, 0x0c, 0x98, 0xf1,
-             0xdd, 0x93, 0xf2, 0x7c,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x30, 0x1e, 0xf0,
-             0x82, 0x9b, 0x00, 0x6b,
-             0x6c, 0x41, 0x0c, 0x09,
-             0x83, 0xa1, 0x40, 0x2b,
-             0x6c, 0x39, 0x0c, 0x19,
-             0xa1, 0x9b, 0x40, 0x2b,
-             0x16, 0x90, 0x04, 0x8b,
-             0xfc, 0x0e, 0xe4, 0x24,
-             0x6c, 0x49, 0x0c, 0x09,
-             0x3e, 0x0e, 0xc0, 0x2b,
-             0x4c, 0x03, 0x81, 0x01,
-             0x40, 0x16, 0x65, 0x51,
-             0xe0, 0x80, 0x00, 0x86,
-             0x65, 0x59, 0x4c, 0x03,
-             0x91, 0x01, 0x40, 0x16,
-             0x6a, 0xa9, 0x4c, 0xa1,
-             0x4c, 0x01, 0xc0, 0x2c,
-             0xc0, 0x2c, 0x6a, 0xb9,
-             0x6a, 0xad, 0x4c, 0xa1,
-             0x4c, 0x01, 0xc0, 0x2c,
-             0xc0, 0x2c, 0x6a, 0xbd,
-             0x00, 0x90, 0x82, 0x65,
-             0x82, 0x7b, 0x6c, 0x04,
-             0x6a, 0x91, 0x4c, 0xa1,
-             0x04, 0x04, 0x40, 0x2c,
-             0x01, 0xb5, 0xfa, 0x80,
-             0x21, 0x1b, 0x81, 0x11,
-             0x02, 0x85, 0x82, 0x7b,
-             0x4c, 0xa1, 0x81, 0x01,
-             0x40, 0x2c, 0x6a, 0x91,
-             0x81, 0x21, 0x81, 0x11,
-             0x90, 0x3b, 0x0c, 0x0b,
-             0xe8, 0x00, 0x46, 0x88,
-             0x17, 0x0a, 0x83, 0x01,
-             0x4c, 0xa1, 0xf4, 0x30,
-             0x00, 0x2c, 0x0a, 0x95,
-             0x84, 0x28, 0x12, 0x90,
-             0x04, 0x94, 0x04, 0x45,
-             0xfc, 0x14, 0x9a, 0x80,
-             0x42, 0x2a, 0xbe, 0x24,
-             0x04, 0xb4, 0x66, 0x86,
-             0xc5, 0x17, 0xfa, 0x80,
-             0x02, 0x10, 0x8e, 0x13,
-             0xc5, 0x1d, 0xec, 0x04,
-             0x4c, 0xa1, 0x90, 0x25,
-             0xc0, 0x2c, 0x6a, 0x95,
-             0x8c, 0x0b, 0x03, 0x11,
-             0x68, 0x00, 0x44, 0xa8,
-             0x00, 0x80, 0x90, 0x3b,
-             0x01, 0x0a, 0xe4, 0x1c,
-             0x82, 0xb5, 0xf4, 0x20,
-             0x6a, 0x99, 0x4c, 0xa1,
-             0x00, 0x80, 0x40, 0x2c,
-             0x06, 0x04, 0xe4, 0x20,
-             0x85, 0x11, 0x7a, 0x80,
-             0x8e, 0x2b, 0x0c, 0x0b,
-             0xe8, 0x00, 0x43, 0x88,
-             0x82, 0xa5, 0xa1, 0x8b,
-             0x6a, 0x9d, 0x4c, 0xa1,
-             0x00, 0x80, 0x40, 0x2c,
-             0x06, 0x04, 0xec, 0x04,
-             0x87, 0x11, 0x7a, 0x80,
-             0x8e, 0x2b, 0x0c, 0x0b,
-             0xe8, 0x00, 0x42, 0xa8,
-             0x64, 0x85, 0x4c, 0xa1,
-             0x00, 0x60, 0x40, 0x26,
-             0xc0, 0xb2, 0x66, 0x91,
-             0x89, 0x11, 0x01, 0xb5,
-             0x14, 0xa4, 0x41, 0x28,
-             0x02, 0x10, 0xfa, 0x80,
-             0x84, 0xa3, 0xec, 0x04,
-             0x64, 0x85, 0x4c, 0xa1,
-             0xa1, 0x1b, 0xc0, 0x26,
-             0x81, 0x91, 0xfc, 0xd5,
-             0x98, 0xf1, 0x12, 0x0b,
-             0xf2, 0x7c, 0x0c, 0x0c,
-             0xa1, 0x0b, 0xdd, 0x93,
-             0x0c, 0x29, 0xf0, 0xf5,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0xe0, 0x0c, 0x02, 0x76,
-             0x68, 0x04, 0x5f, 0xc8,
-             0x12, 0x76, 0x8c, 0x0b,
-             0xa3, 0x0b, 0xe0, 0x0c,
-             0xfd, 0xd5, 0xee, 0x75,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x30, 0x1e, 0xf0,
-             0x84, 0x7b, 0x00, 0x8b,
-             0x70, 0x84, 0x40, 0x82,
-             0x00, 0x29, 0x86, 0x6b,
-             0x40, 0x2c, 0x6a, 0xa1,
-             0x40, 0x71, 0xc6, 0x17,
-             0x40, 0x26, 0x64, 0x95,
-             0x66, 0xa1, 0x06, 0x00,
-             0x40, 0x61, 0xc0, 0xb2,
-             0x40, 0x26, 0x64, 0xb5,
-             0x23, 0x2b, 0x81, 0xa1,
-             0x7c, 0x1e, 0x91, 0x21,
-             0x04, 0x16, 0x83, 0x11,
-             0x02, 0x86, 0x40, 0x00,
-             0xbe, 0x3e, 0xc0, 0x00,
-             0x64, 0xd5, 0x40, 0x21,
-             0x40, 0x11, 0xc0, 0x26,
-             0xc0, 0x26, 0x64, 0xf5,
-             0x90, 0x03, 0xfc, 0x04,
-             0x87, 0xb5, 0xbc, 0x0e,
-             0x00, 0x74, 0x7c, 0x94,
-             0x42, 0x60, 0xe0, 0x90,
-             0x56, 0x02, 0xf0, 0x3c,
-             0x90, 0x0b, 0x79, 0x84,
-             0x7a, 0x80, 0x02, 0xb4,
-             0x43, 0x58, 0x94, 0x93,
-             0x4a, 0x78, 0xe8, 0x00,
-             0xa1, 0x11, 0x68, 0x48,
-             0x61, 0x8c, 0x02, 0x94,
-             0x3e, 0x19, 0x8e, 0x99,
-             0x10, 0x13, 0x83, 0x31,
-             0x02, 0x29, 0xb3, 0x3f,
-             0x40, 0x2c, 0x6b, 0x41,
-             0x48, 0x6a, 0x9d, 0x41,
-             0x3c, 0x34, 0xe6, 0x92,
-             0x42, 0x21, 0xa6, 0x2f,
-             0x40, 0x2c, 0x6b, 0x41,
-             0x14, 0x33, 0x8e, 0x43,
-             0x46, 0x41, 0x82, 0xa1,
-             0xc0, 0x2c, 0x6a, 0xc1,
-             0x6b, 0x51, 0x46, 0xb1,
-             0x46, 0x01, 0xc0, 0x2c,
-             0xc0, 0x2c, 0x6b, 0xd1,
-             0x80, 0x08, 0xbe, 0x04,
-             0xe0, 0x04, 0x00, 0x4a,
-             0x62, 0x00, 0x00, 0x0c,
-             0xe0, 0x04, 0x00, 0x1a,
-             0x62, 0x00, 0x00, 0x1c,
-             0x80, 0x73, 0x80, 0x63,
-             0xf0, 0xb5, 0xb1, 0xab,
-             0x0c, 0x0c, 0x98, 0xf1,
-             0xdd, 0x93, 0xf2, 0x7c,
-             0x61, 0x90, 0x04, 0x14,
-             0x44, 0x2a, 0xa9, 0x31,
-             0x06, 0x14, 0x66, 0x8e,
-             0x8e, 0x39, 0xe1, 0x84,
-             0x81, 0x21, 0x04, 0x03,
-             0x81, 0x31, 0x06, 0x03,
-             0x00, 0x00, 0x01, 0xe5,
-             0xc0, 0x9c, 0x67, 0x81,
-             0x70, 0x14, 0x00, 0x49,
-             0xe0, 0x80, 0x42, 0x0a,
-             0xc1, 0x90, 0x08, 0x44,
-             0x25, 0x4f, 0x9e, 0x49,
-             0xa8, 0x3f, 0x88, 0x21,
-             0xe0, 0x40, 0x04, 0x0a,
-             0x5d, 0x93, 0xfc, 0x95,
-             0xfb, 0x80, 0x00, 0x34,
-             0xe4, 0x7c, 0x03, 0x0a,
-             0x04, 0x14, 0x82, 0xb5,
-             0x8e, 0x19, 0x61, 0x8c,
-             0x00, 0x09, 0x84, 0x03,
-             0xc0, 0x2c, 0x6b, 0x41,
-             0xe4, 0x84, 0x40, 0x4a,
-             0xe2, 0x00, 0x00, 0x0c,
-             0x5d, 0x93, 0xdd, 0x93,
-             0xc1, 0xc3, 0x81, 0x01,
-             0xe5, 0x7c, 0x03, 0x0a,
-             0x04, 0x14, 0x82, 0xb5,
-             0x8e, 0x19, 0x61, 0x8c,
-             0x00, 0x09, 0x84, 0x03,
-             0xc0, 0x2c, 0x65, 0xc1,
-             0xe4, 0x84, 0x40, 0x4a,
-             0xe2, 0x00, 0x00, 0x0c,
-             0x5d, 0x93, 0xdd, 0x93,
-             0xc1, 0xc3, 0x81, 0x01,
-             0xfa, 0x00, 0x00, 0x4c,
-             0x64, 0x71, 0x00, 0x00,
-             0x04, 0x14, 0x40, 0xaf,
-             0x00, 0x0b, 0xe0, 0x84,
-             0x80, 0x13, 0x7c, 0x08,
-             0xe5, 0x00, 0x02, 0x19,
-             0x68, 0x48, 0x42, 0x48,
-             0xd0, 0x07, 0x82, 0x11,
-             0xf2, 0x00, 0x08, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x7c, 0x04, 0x4c,
-             0x6c, 0x59, 0x00, 0x19,
-             0x82, 0x9b, 0x40, 0x2b,
-             0x88, 0x7b, 0x0a, 0x6b,
-             0x84, 0xab, 0x06, 0x8b,
-             0x81, 0x11, 0x23, 0x1b,
-             0xa1, 0x9b, 0x88, 0x25,
-             0xa1, 0xab, 0x80, 0xa5,
-             0xa1, 0x8b, 0x80, 0x65,
-             0x00, 0x29, 0x82, 0x95,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0xe0, 0x08, 0x42, 0x96,
-             0x68, 0x04, 0x51, 0xa8,
-             0xe0, 0x08, 0x56, 0x96,
-             0x84, 0x45, 0xa3, 0x0b,
-             0xe0, 0x22, 0x40, 0x7a,
-             0xe1, 0x22, 0x42, 0x7a,
-             0xe0, 0x2a, 0x40, 0x0a,
-             0xe0, 0x26, 0x42, 0x1a,
-             0xe6, 0xa2, 0x40, 0x0a,
-             0xe0, 0x26, 0x40, 0x0a,
-             0x02, 0x02, 0x82, 0x03,
-             0x18, 0x16, 0xef, 0xfc,
-             0x96, 0x0b, 0x81, 0xb1,
-             0xf2, 0x7c, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x7c, 0x04, 0x4c,
-             0x6c, 0x59, 0x00, 0x19,
-             0x82, 0xab, 0x40, 0x2b,
-             0x88, 0x7b, 0x0a, 0x6b,
-             0x84, 0x9b, 0x06, 0x8b,
-             0x81, 0x11, 0x23, 0x1b,
-             0xa1, 0xab, 0x86, 0xe5,
-             0xa1, 0x9b, 0x80, 0xa5,
-             0xa1, 0x8b, 0x80, 0x65,
-             0x00, 0x29, 0x82, 0x95,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0xe0, 0x08, 0x42, 0x96,
-             0x68, 0x04, 0x4e, 0x68,
-             0xe0, 0x08, 0x56, 0x96,
-             0x84, 0x05, 0xa3, 0x0b,
-             0xe0, 0x22, 0x40, 0x7a,
-             0xe1, 0x22, 0x42, 0x7a,
-             0xe1, 0x26, 0x40, 0x0a,
-             0xe1, 0x2a, 0x42, 0x1a,
-             0xe6, 0xaa, 0x40, 0x0a,
-             0x02, 0x02, 0x82, 0x03,
-             0x18, 0x16, 0xef, 0xfc,
-             0x96, 0x0b, 0x81, 0xb1,
-             0xf2, 0x7c, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x9f, 0x21, 0x01, 0x11,
-             0x81, 0x31, 0x03, 0x95,
-             0x68, 0x84, 0x08, 0x24,
-             0xfb, 0x80, 0x06, 0x34,
-             0xe3, 0x4f, 0x80, 0x4f,
-             0x61, 0x8c, 0x0a, 0x44,
-             0xe1, 0x84, 0x18, 0x44,
-             0x84, 0xc9, 0x02, 0x59,
-             0x18, 0x44, 0x38, 0x5f,
-             0x46, 0x47, 0xe0, 0x84,
-             0x38, 0x5f, 0x88, 0xc9,
-             0xa8, 0x5f, 0x90, 0x49,
-             0x88, 0x11, 0x23, 0x5f,
-             0x02, 0x0a, 0xaa, 0x3f,
-             0xf8, 0xf5, 0xe0, 0x40,
-             0x00, 0x34, 0x5d, 0x93,
-             0xc1, 0xc3, 0xfb, 0x80,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x70, 0x1e, 0xf0,
-             0x9d, 0x81, 0x00, 0xab,
-             0x81, 0x91, 0x1e, 0x0b,
-             0x9d, 0x11, 0x01, 0x55,
-             0x02, 0x10, 0x41, 0x9c,
-             0xa1, 0x1b, 0xec, 0x04,
-             0x00, 0xa0, 0xfe, 0x95,
-             0x40, 0xb1, 0x65, 0xf1,
-             0x81, 0x45, 0x9d, 0x11,
-             0x02, 0x10, 0x41, 0x9c,
-             0xa1, 0x1b, 0xec, 0x04,
-             0x85, 0xc5, 0xfe, 0x95,
-             0x70, 0xa4, 0x4c, 0xa2,
-             0xfa, 0x80, 0x0e, 0x94,
-             0x6e, 0xf1, 0x0c, 0xb9,
-             0x94, 0x0b, 0x40, 0x2b,
-             0x6f, 0xfc, 0x73, 0x08,
-             0x00, 0x0a, 0x8e, 0x1b,
-             0x86, 0xb5, 0xf0, 0x04,
-             0x6c, 0xe9, 0x14, 0x09,
-             0x0c, 0x19, 0xc0, 0x2c,
-             0xc0, 0x2c, 0x62, 0xb1,
-             0xfa, 0x80, 0x00, 0x04,
-             0xfa, 0x80, 0x02, 0x14,
-             0x84, 0x35, 0x83, 0x0b,
-             0x73, 0xc0, 0x40, 0xb0,
-             0x47, 0x07, 0x9e, 0x1b,
-             0x02, 0x2b, 0x9e, 0xb9,
-             0x83, 0x31, 0x7c, 0x00,
-             0x80, 0x13, 0x37, 0x3f,
-             0xa6, 0x2f, 0x94, 0x0b,
-             0x8e, 0x1b, 0x04, 0x2c,
-             0xe8, 0x00, 0x42, 0x48,
-             0x12, 0x0a, 0x82, 0x91,
-             0xf4, 0x75, 0xe1, 0x40,
-             0x64, 0x8d, 0x00, 0xe6,
-             0x9e, 0x1b, 0x40, 0x20,
-             0x9d, 0x21, 0x01, 0x65,
-             0x04, 0x20, 0x45, 0x3a,
-             0xc1, 0x3c, 0xec, 0x04,
-             0xfe, 0x75, 0xa1, 0x2b,
-             0x64, 0x8d, 0x40, 0xa6,
-             0x9e, 0x1b, 0x40, 0x20,
-             0x45, 0x2a, 0x81, 0x55,
-             0xec, 0x04, 0x10, 0x80,
-             0xa1, 0x8b, 0xc1, 0x2c,
-             0x53, 0x78, 0xfe, 0x75,
-             0x94, 0x0b, 0x68, 0x40,
-             0x0c, 0x0c, 0xb8, 0xf1,
-             0xdd, 0x93, 0xf2, 0x7c,
-             0x83, 0x31, 0x00, 0x13,
-             0x6e, 0xf1, 0x02, 0x19,
-             0x04, 0x14, 0xc0, 0x2b,
-             0x9e, 0x19, 0x61, 0x8c,
-             0xa3, 0x3f, 0x3c, 0x29,
-             0x00, 0x2b, 0x84, 0x03,
-             0xc0, 0x16, 0x62, 0xf9,
-             0x40, 0x33, 0xa4, 0x3f,
-             0xc0, 0x16, 0x62, 0xf9,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0xd0, 0x1e, 0xf0,
-             0x02, 0xf0, 0x00, 0x9b,
-             0x44, 0x98, 0xe4, 0xc0,
-             0x04, 0xf0, 0x68, 0x0c,
-             0x12, 0x39, 0xe4, 0xb0,
-             0xc0, 0x2b, 0x6c, 0x49,
-             0x6c, 0x41, 0x12, 0x09,
-             0x12, 0x19, 0xc0, 0x2b,
-             0xc0, 0x2b, 0x6c, 0x45,
-             0x6c, 0x4d, 0x12, 0x89,
-             0x12, 0x29, 0xc0, 0x2b,
-             0xc0, 0x2b, 0x6c, 0x39,
-             0x40, 0x3a, 0x8d, 0x3e,
-             0x12, 0x39, 0xe6, 0x82,
-             0xc0, 0x2b, 0x6c, 0x3d,
-             0x66, 0x86, 0x54, 0x8a,
-             0xe1, 0x88, 0x02, 0x04,
-             0x52, 0x01, 0x91, 0x01,
-             0x40, 0x26, 0x64, 0x81,
-             0x0f, 0x2e, 0xc5, 0xa7,
-             0x52, 0x21, 0x92, 0x0b,
-             0xc0, 0x26, 0x64, 0x91,
-             0x52, 0x31, 0x89, 0x3e,
-             0xc0, 0x26, 0x64, 0xb1,
-             0x12, 0xb9, 0x8b, 0x1e,
-             0xc0, 0x2b, 0x6c, 0x51,
-             0x6c, 0x55, 0x12, 0x69,
-             0x52, 0x11, 0xc0, 0x2b,
-             0x40, 0x26, 0x64, 0xd1,
-             0xe4, 0xa0, 0x02, 0xf0,
-             0x64, 0xf1, 0x52, 0xa1,
-             0x50, 0x58, 0xc0, 0x26,
-             0x80, 0x7b, 0xe8, 0x0c,
-             0x80, 0xc5, 0xa1, 0x7b,
-             0xe8, 0xf1, 0x0e, 0x0b,
-             0xf2, 0x7c, 0x0c, 0x0c,
-             0x45, 0xb7, 0xdd, 0x93,
-             0xe1, 0x88, 0x06, 0x64,
-             0xa1, 0xbb, 0x7c, 0xbe,
-             0xa1, 0x3b, 0x80, 0x65,
-             0x12, 0x29, 0x82, 0xf5,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0xe0, 0x08, 0x42, 0x96,
-             0x86, 0x6b, 0x12, 0x0b,
-             0x68, 0x00, 0x7d, 0x68,
-             0xe0, 0x08, 0x4e, 0x96,
-             0x8c, 0x3b, 0x23, 0x0b,
-             0x0d, 0x04, 0xf8, 0xc5,
-             0x7c, 0x14, 0xc5, 0x87,
-             0xe0, 0x0c, 0x4b, 0xf6,
-             0x60, 0x0e, 0x48, 0x8a,
-             0xc5, 0x07, 0x81, 0xb1,
-             0xe0, 0x06, 0x44, 0x0a,
-             0x8b, 0x14, 0x8f, 0x04,
-             0xbc, 0x4e, 0xbe, 0x2e,
-             0x42, 0x4a, 0x02, 0x03,
-             0x09, 0x24, 0xe6, 0x8a,
-             0xec, 0x04, 0x00, 0x00,
-             0x84, 0xa3, 0xfe, 0x0e,
-             0x6c, 0x04, 0x00, 0xa0,
-             0x8d, 0x0e, 0x81, 0xa1,
-             0x65, 0x3d, 0x52, 0x11,
-             0x8b, 0xe5, 0xc0, 0x2c,
-             0xf0, 0xac, 0x4c, 0x92,
-             0x6e, 0xf1, 0x0c, 0x09,
-             0x4c, 0x51, 0xc0, 0x2b,
-             0xc0, 0x2c, 0x62, 0xb1,
-             0x63, 0xf1, 0x4c, 0x51,
-             0x42, 0x00, 0xc0, 0x2c,
-             0xc5, 0x1d, 0xf0, 0x3c,
-             0x8d, 0x44, 0x92, 0xd5,
-             0x92, 0x75, 0xc8, 0x1d,
-             0xc9, 0x07, 0x7e, 0x14,
-             0x90, 0xf5, 0xc2, 0x0d,
-             0xc3, 0x0d, 0x8f, 0x14,
-             0x00, 0xb4, 0x90, 0x95,
-             0x44, 0xb0, 0x61, 0x8c,
-             0x3e, 0x09, 0xf0, 0x1c,
-             0x12, 0x03, 0x83, 0x41,
-             0xe8, 0x88, 0x04, 0x44,
-             0x65, 0xc1, 0x00, 0x19,
-             0x86, 0x8b, 0x40, 0x2c,
-             0x7a, 0x80, 0x08, 0xa4,
-             0xe4, 0x90, 0x0a, 0xf0,
-             0x58, 0x12, 0x7c, 0x14,
-             0x0b, 0x34, 0xf9, 0x88,
-             0xfa, 0x80, 0x04, 0x34,
-             0x65, 0xc1, 0x40, 0xc1,
-             0x92, 0x0b, 0x40, 0x2c,
-             0xfa, 0x80, 0x02, 0x14,
-             0x6f, 0xfc, 0x64, 0x88,
-             0xfa, 0x80, 0x06, 0x34,
-             0xa1, 0x7b, 0x80, 0x7b,
-             0x3e, 0x04, 0xe2, 0x55,
-             0xe4, 0x80, 0x0a, 0xf0,
-             0xe0, 0x90, 0x1e, 0x49,
-             0xe0, 0xa0, 0x1e, 0x39,
-             0x02, 0x04, 0x3c, 0x04,
-             0x4c, 0x41, 0xfa, 0x80,
-             0xc0, 0x2c, 0x63, 0xf1,
-             0x7a, 0x80, 0x04, 0x04,
-             0x66, 0x58, 0x92, 0x0b,
-             0x80, 0x7b, 0xef, 0xfc,
-             0xdc, 0xb5, 0xa1, 0x7b,
-             0x60, 0x80, 0x1e, 0x09,
-             0x10, 0x3b, 0x82, 0xa1,
-             0xe0, 0x0c, 0x4b, 0xf6,
-             0x62, 0xb1, 0x4c, 0x01,
-             0x89, 0x24, 0xc0, 0x2c,
-             0x17, 0x0a, 0x82, 0xb1,
-             0xe8, 0x25, 0xe5, 0x3c,
-             0x68, 0x00, 0x41, 0x08,
-             0x80, 0x7b, 0x92, 0x0b,
-             0xd8, 0x35, 0xa1, 0x7b,
-             0x60, 0xb0, 0x1e, 0x29,
-             0x1e, 0x19, 0x92, 0x0b,
-             0x4a, 0x78, 0xe0, 0xc0,
-             0x6b, 0x95, 0xef, 0xfc,
-             0xc1, 0xc3, 0x80, 0x7b,
-             0xfa, 0x1c, 0x04, 0x0c,
-             0xec, 0x30, 0x1e, 0xf0,
-             0x81, 0x81, 0x00, 0x6b,
-             0x6c, 0x59, 0x0c, 0x09,
-             0xa3, 0x0b, 0xc0, 0x2b,
-             0x02, 0xf0, 0x8a, 0x85,
-             0x8c, 0x0b, 0x64, 0x20,
-             0xe8, 0x0c, 0x45, 0x48,
-             0x88, 0xd5, 0xa1, 0x0b,
-             0x6f, 0x14, 0x41, 0x86,
-             0x80, 0x08, 0x81, 0x91,
-             0xe0, 0x80, 0x40, 0x4a,
-             0x04, 0xf1, 0x00, 0x60,
-             0x00, 0x60, 0xc0, 0xad,
-             0x80, 0xad, 0x04, 0xf9,
-             0x03, 0x15, 0x80, 0x0a,
-             0xfb, 0x80, 0x0e, 0x04,
-             0x7a, 0x80, 0x02, 0x84,
-             0xe4, 0x10, 0x08, 0xf0,
-             0x8c, 0x0b, 0x01, 0x21,
-             0x68, 0x00, 0x42, 0x88,
-             0x7c, 0x0a, 0x8e, 0x3b,
-             0xfb, 0x80, 0x12, 0x94,
-             0x80, 0x93, 0x82, 0x81,
-             0xc1, 0x8d, 0xfc, 0x04,
-             0x4c, 0x93, 0xfc, 0x15,
-             0xc0, 0x16, 0x62, 0x99,
-             0x98, 0xf1, 0x81, 0x01,
-             0xf2, 0x1c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x82, 0xf5, 0xfc, 0x1d,
-             0x02, 0x14, 0x83, 0x31,
-             0x82, 0x11, 0xfa, 0x80,
-             0xf4, 0x38, 0x03, 0x0a,
-             0x08, 0x14, 0x82, 0x15,
-             0x08, 0x34, 0xfa, 0x80,
-             0x80, 0x4f, 0xe8, 0x90,
-             0xfc, 0x85, 0xa1, 0x4b,
-             0x81, 0x01, 0x08, 0x16,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xf8, 0x00, 0x10, 0xfc,
-             0xec, 0xf0, 0x1e, 0xf0,
-             0x80, 0x5b, 0x02, 0x9b,
-             0x63, 0xfc, 0x12, 0x0a,
-             0xfc, 0x2e, 0x81, 0x01,
-             0x90, 0x0c, 0xbe, 0x4e,
-             0x80, 0x00, 0x0b, 0xa8,
-             0x10, 0x50, 0x49, 0x37,
-             0xc0, 0xb0, 0x66, 0xb1,
-             0x0e, 0x50, 0x3c, 0x3e,
-             0xc0, 0xb0, 0x64, 0x31,
-             0x81, 0xa1, 0x01, 0xb1,
-             0x81, 0x61, 0x7e, 0x5e,
-             0x0e, 0x09, 0x85, 0x85,
-             0x93, 0x0b, 0xe3, 0xc0,
-             0xfc, 0x04, 0x88, 0x35,
-             0x80, 0xf5, 0xa3, 0x0b,
-             0x6c, 0xe9, 0x0a, 0x09,
-             0xa0, 0x18, 0xc0, 0x2c,
-             0x86, 0x15, 0x83, 0x0b,
-             0x7a, 0x80, 0x02, 0xb4,
-             0x56, 0xb8, 0x8a, 0x0b,
-             0x00, 0x0a, 0xef, 0xfc,
-             0x1e, 0x55, 0xf0, 0x04,
-             0x82, 0xd5, 0xc0, 0x0c,
-             0x02, 0xa4, 0x1c, 0x08,
-             0x04, 0xf0, 0xe0, 0x88,
-             0x82, 0xa1, 0x64, 0x50,
-             0x82, 0x23, 0x7e, 0x54,
-             0x80, 0x63, 0x70, 0xad,
-             0x80, 0x45, 0x88, 0xbe,
-             0x02, 0xb1, 0x81, 0x95,
-             0x82, 0x71, 0x82, 0x81,
-             0xe5, 0x3c, 0x17, 0x0a,
-             0xa1, 0xab, 0xf4, 0xe5,
-             0x0a, 0x8b, 0xa0, 0x05,
-             0xc0, 0x15, 0x6a, 0x7d,
-             0xc9, 0x87, 0xbc, 0x14,
-             0xfb, 0x80, 0x00, 0x14,
-             0x6a, 0x81, 0x0a, 0x0b,
-             0xd1, 0x0d, 0x40, 0x15,
-             0x9c, 0x00, 0x50, 0x10,
-             0xfb, 0x80, 0x02, 0x84,
-             0xc0, 0x1d, 0xc9, 0x07,
-             0xdc, 0x00, 0x50, 0x00,
-             0xec, 0x18, 0x51, 0x0a,
-             0x3e, 0x14, 0x84, 0x65,
-             0xe0, 0x90, 0x00, 0x64,
-             0x00, 0xf0, 0x04, 0x0c,
-             0x01, 0x95, 0xe4, 0x50,
-             0x41, 0x24, 0x9f, 0x11,
-             0xec, 0x04, 0x14, 0xa0,
-             0x44, 0x11, 0x8a, 0x23,
-             0xc0, 0x2c, 0x61, 0x71,
-             0xfe, 0x15, 0xa1, 0xab,
-             0x81, 0x31, 0x8b, 0x85,
-             0x00, 0x34, 0x85, 0x05,
-             0x02, 0xf0, 0x60, 0x88,
-             0x02, 0x15, 0xe4, 0x50,
-             0x00, 0x14, 0xfc, 0x00,
-             0x8a, 0x03, 0xe0, 0x84,
-             0x6e, 0x39, 0x00, 0x2b,
-             0x81, 0x01, 0x40, 0x15,
-             0x82, 0x85, 0xa1, 0x2b,
-             0x44, 0x4a, 0x81, 0x01,
-             0x44, 0x20, 0xe0, 0x80,
-             0x40, 0xff, 0x13, 0xf9,
-             0xc4, 0x04, 0x00, 0x00,
-             0x04, 0x24, 0x7e, 0x35,
-             0x0a, 0x13, 0xc1, 0x84,
-             0x42, 0x01, 0x82, 0x31,
-             0xc0, 0x2c, 0x61, 0x71,
-             0xf8, 0x15, 0x95, 0x3b,
-             0x94, 0x7b, 0x21, 0x06,
-             0x83, 0xa3, 0xa1, 0x43,
-             0xe8, 0x00, 0x12, 0xcc,
-             0xec, 0x20, 0x4e, 0x8a,
-             0x12, 0xf0, 0x8a, 0x25,
-             0xff, 0xb1, 0x64, 0x50,
-             0xd5, 0xbd, 0x82, 0xb1,
-             0x24, 0x64, 0x88, 0x45,
-             0x64, 0x71, 0x00, 0x50,
-             0x04, 0xf0, 0xc0, 0xaf,
-             0x02, 0x64, 0xe4, 0x40,
-             0x80, 0x63, 0x60, 0x84,
-             0xfc, 0x04, 0x00, 0x0b,
-             0xe5, 0x00, 0x0c, 0x19,
-             0xef, 0xfc, 0x73, 0xc8,
-             0x88, 0x91, 0x21, 0x08,
-             0xe5, 0x00, 0x0c, 0x19,
-             0x02, 0x60, 0x83, 0x0b,
-             0x40, 0x01, 0x05, 0x01,
-             0xdb, 0x80, 0x0e, 0x74,
-             0x40, 0x00, 0x42, 0x01,
-             0xc4, 0x04, 0x0e, 0x70,
-             0x4e, 0x8a, 0x7e, 0x54,
-             0xf6, 0xb5, 0xec, 0x20,
-             0x3e, 0x04, 0xc1, 0xc3,
-             0x80, 0x7c, 0xc8, 0x77,
-             0xf8, 0xf1, 0x01, 0x01,
-             0xf0, 0x00, 0x18, 0xfc,
-             0xf2, 0x7c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x43, 0x46, 0x02, 0x6b,
-             0x04, 0x14, 0xe1, 0x24,
-             0x84, 0x34, 0x83, 0x21,
-             0x65, 0x75, 0x00, 0x19,
-             0x00, 0x45, 0xc0, 0x1b,
-             0xc0, 0x06, 0x6d, 0x49,
-             0x65, 0x79, 0x00, 0x09,
-             0x82, 0x31, 0x40, 0x1b,
-             0xa1, 0x11, 0x23, 0x2f,
-             0x88, 0x0b, 0x21, 0x2f,
-             0xef, 0xe8, 0x5a, 0xa8,
-             0x81, 0x01, 0x18, 0x0e,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x50, 0x1e, 0xf0,
-             0x88, 0x7b, 0x00, 0x8b,
-             0x65, 0x0d, 0x10, 0x09,
-             0x82, 0x6b, 0x40, 0x2b,
-             0x60, 0x88, 0x02, 0x74,
-             0x10, 0x13, 0x84, 0xab,
-             0x23, 0x0b, 0x81, 0x21,
-             0x42, 0x25, 0x86, 0x9b,
-             0xc0, 0x0b, 0x61, 0xa5,
-             0xa7, 0x0b, 0x82, 0x25,
-             0x10, 0x0b, 0x8c, 0x75,
-             0x40, 0x15, 0x6a, 0x79,
-             0x91, 0x0c, 0x81, 0xb1,
-             0x3e, 0x5e, 0x85, 0x05,
-             0x66, 0x91, 0x00, 0x10,
-             0x7c, 0x0e, 0xc0, 0xb1,
-             0x42, 0xb8, 0x90, 0x0b,
-             0x8e, 0x1b, 0x68, 0x00,
-             0x02, 0xf0, 0x49, 0x07,
-             0x3c, 0x1e, 0xe4, 0x40,
-             0xfb, 0x80, 0x16, 0x04,
-             0x64, 0x30, 0x0a, 0xf0,
-             0x0c, 0x1b, 0x90, 0x0b,
-             0x12, 0x3b, 0x94, 0x2b,
-             0x43, 0xb8, 0x96, 0x4b,
-             0x7e, 0x14, 0xe8, 0x00,
-             0xfc, 0x24, 0xa1, 0x0b,
-             0x84, 0x35, 0x88, 0x1e,
-             0xbe, 0x54, 0x91, 0x0a,
-             0xfb, 0x80, 0x06, 0x04,
-             0x04, 0x16, 0x97, 0x3b,
-             0x40, 0x80, 0x40, 0x00,
-             0x42, 0x70, 0xdc, 0x00,
-             0x48, 0x50, 0x5c, 0x00,
-             0x6c, 0xb8, 0xdc, 0x00,
-             0x81, 0x01, 0xcf, 0xfc,
-             0x0c, 0x0c, 0xa8, 0xf1,
-             0xdd, 0x93, 0xf2, 0x7c,
-             0xfa, 0x1c, 0x04, 0x4c,
-             0x80, 0x7b, 0x02, 0x6b,
-             0x81, 0x81, 0x01, 0x91,
-             0x40, 0x72, 0x83, 0x25,
-             0x00, 0x09, 0xf0, 0xa4,
-             0xc0, 0x2c, 0x63, 0xf1,
-             0xe3, 0xfc, 0x00, 0x0a,
-             0x8d, 0x0b, 0x82, 0x25,
-             0x02, 0x94, 0x80, 0xf5,
-             0x8e, 0x0b, 0x7a, 0x80,
-             0xef, 0xfc, 0x45, 0xa8,
-             0x82, 0x91, 0x80, 0x83,
-             0xe1, 0x40, 0x12, 0x0a,
-             0x90, 0x0b, 0xfa, 0xb5,
-             0xf2, 0x1c, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x50, 0x1e, 0xf0,
-             0x01, 0x06, 0x00, 0x6b,
-             0x00, 0x04, 0xe1, 0x18,
-             0x19, 0x14, 0x82, 0xbb,
-             0x08, 0x8b, 0x8a, 0x7b,
-             0x00, 0x08, 0x86, 0x9b,
-             0x7e, 0x1e, 0x84, 0xab,
-             0x4a, 0x58, 0x91, 0x11,
-             0x00, 0x2b, 0xef, 0xe8,
-             0xe4, 0x40, 0x00, 0xf0,
-             0x0a, 0x84, 0x3e, 0x0e,
-             0x3c, 0x7e, 0xe0, 0x90,
-             0x64, 0xe1, 0x06, 0x60,
-             0x16, 0x0b, 0xc0, 0xad,
-             0x7b, 0x98, 0x94, 0x1b,
-             0x92, 0x4b, 0x6f, 0xb4,
-             0xa1, 0x7b, 0x80, 0x7b,
-             0x0c, 0x29, 0x82, 0x65,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x56, 0xb8, 0x8c, 0x0b,
-             0x8e, 0x1b, 0x68, 0x00,
-             0x81, 0x01, 0x23, 0x0b,
-             0x09, 0x04, 0x80, 0xe5,
-             0xc9, 0x07, 0x81, 0x71,
-             0x6f, 0xfd, 0x00, 0x02,
-             0x7e, 0x14, 0xc0, 0xff,
-             0x04, 0x0c, 0xa8, 0xf1,
-             0x0c, 0x0c, 0x8e, 0x0b,
-             0xdd, 0x93, 0xf2, 0x7c,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x30, 0x1e, 0xf0,
-             0x02, 0x00, 0x02, 0x6b,
-             0xc0, 0xb0, 0x65, 0x71,
-             0x16, 0x00, 0x7c, 0x1e,
-             0xc0, 0xaf, 0x66, 0xf1,
-             0x81, 0x91, 0x3e, 0x0e,
-             0x7f, 0xf4, 0x4e, 0x0e,
-             0x01, 0xa1, 0x9d, 0x81,
-             0x03, 0xa5, 0x81, 0x01,
-             0xac, 0x18, 0x81, 0x31,
-             0x70, 0x3c, 0x44, 0x10,
-             0x44, 0x2a, 0xc9, 0x17,
-             0x82, 0x23, 0xe6, 0xa2,
-             0x82, 0xb5, 0x8d, 0x2b,
-             0x16, 0x19, 0xfc, 0x04,
-             0xb4, 0x03, 0xe2, 0x80,
-             0x78, 0x81, 0x00, 0x0b,
-             0x82, 0x11, 0x40, 0x01,
-             0xe8, 0x44, 0x41, 0xc8,
-             0x83, 0x01, 0x00, 0x3b,
-             0x6c, 0x08, 0x14, 0xa0,
-             0x8f, 0xab, 0x82, 0xb1,
-             0xa1, 0x0b, 0xf8, 0xf5,
-             0xbe, 0x84, 0x86, 0x35,
-             0x4e, 0x82, 0x83, 0x45,
-             0x0e, 0x09, 0xf0, 0xa4,
-             0xc0, 0x2c, 0x6a, 0xc1,
-             0x82, 0x95, 0x8d, 0x0b,
-             0x7a, 0x80, 0x02, 0x94,
-             0x7b, 0x18, 0x90, 0x0b,
-             0x86, 0xab, 0x6f, 0xf8,
-             0xa1, 0x0b, 0x14, 0x3b,
-             0x0b, 0xd1, 0x0e, 0x39,
-             0x82, 0x91, 0xc0, 0x2c,
-             0xe0, 0x80, 0x12, 0x0a,
-             0x00, 0x34, 0xfa, 0x75,
-             0x98, 0xf1, 0x60, 0xa0,
-             0xf2, 0x7c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x02, 0x06, 0x00, 0x6b,
-             0x76, 0xd8, 0xe2, 0x80,
-             0x43, 0xf6, 0xe8, 0x40,
-             0x05, 0x86, 0x60, 0x0c,
-             0x56, 0x38, 0xe0, 0x10,
-             0x8c, 0x0b, 0x6f, 0xac,
-             0x45, 0x76, 0x01, 0x11,
-             0x0c, 0x0b, 0xe0, 0x00,
-             0x0c, 0x0c, 0x8c, 0x3b,
-             0x17, 0x18, 0xf2, 0x00,
-             0xc1, 0xc3, 0xe0, 0x3c,
-             0xfa, 0x9c, 0x04, 0x0c,
-             0x40, 0x96, 0x00, 0x6b,
-             0x4c, 0x01, 0xe0, 0x04,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x02, 0x06, 0x82, 0x7b,
-             0x8c, 0x0b, 0x62, 0x80,
-             0xe8, 0x40, 0x74, 0xe8,
-             0xe4, 0x40, 0x0e, 0x8a,
-             0x0c, 0x29, 0x82, 0xd5,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0xe0, 0x00, 0x42, 0xb6,
-             0x68, 0x00, 0x4d, 0xa8,
-             0x50, 0xb6, 0x8c, 0x0b,
-             0x23, 0x0b, 0xe0, 0x00,
-             0x8c, 0x85, 0x81, 0x71,
-             0x61, 0x88, 0x00, 0x74,
-             0x06, 0x09, 0x91, 0x91,
-             0x04, 0x94, 0x83, 0x11,
-             0xa1, 0x1f, 0x69, 0x80,
-             0x40, 0x22, 0xc8, 0x27,
-             0x81, 0x11, 0x79, 0x84,
-             0x44, 0x12, 0x81, 0xa5,
-             0x04, 0x4a, 0xf9, 0x1c,
-             0x44, 0x62, 0xf8, 0x0c,
-             0x82, 0x11, 0x50, 0x84,
-             0xc0, 0x00, 0x44, 0x01,
-             0xe0, 0x40, 0x02, 0x0a,
-             0x01, 0x11, 0xfc, 0xb5,
-             0x0c, 0x0b, 0x9f, 0x21,
-             0x40, 0x98, 0x8c, 0x3b,
-             0x80, 0x8b, 0xe8, 0x3c,
-             0x84, 0x55, 0xa1, 0x8b,
-             0x6a, 0xa9, 0x0c, 0x09,
-             0xa3, 0x0b, 0xc0, 0x2b,
-             0x00, 0x60, 0x84, 0x35,
-             0x40, 0x8b, 0x66, 0xb1,
-             0xe0, 0x10, 0x02, 0x06,
-             0x41, 0x1e, 0x81, 0x45,
-             0xec, 0x04, 0x12, 0x90,
-             0xfe, 0x95, 0xa1, 0x9b,
-             0x90, 0x0b, 0x81, 0x81,
-             0xf2, 0x9c, 0x0c, 0x0c,
-             0x0c, 0x0b, 0xdd, 0x93,
-             0x0c, 0x0c, 0x8c, 0x1b,
-             0x31, 0xb8, 0xf2, 0x9c,
-             0xc1, 0xc3, 0xe0, 0x34,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x61, 0x00, 0x0d, 0xc6,
-             0xe0, 0x04, 0x45, 0x36,
-             0x40, 0x21, 0x98, 0x14,
-             0xc0, 0x2b, 0x6c, 0x1d,
-             0x44, 0x20, 0x84, 0x28,
-             0x84, 0x26, 0xf3, 0xec,
-             0x84, 0x28, 0x98, 0x14,
-             0xf3, 0xf8, 0x44, 0x20,
-             0x43, 0x46, 0x04, 0x26,
-             0x7b, 0x38, 0xe0, 0x1c,
-             0x83, 0x21, 0x68, 0x3c,
-             0x80, 0x18, 0x98, 0x04,
-             0xf3, 0xf4, 0x42, 0x10,
-             0x0c, 0x0c, 0x80, 0x16,
-             0xdd, 0x93, 0xf2, 0x00,
-             0xfa, 0x80, 0x00, 0x0c,
-             0x40, 0x06, 0x00, 0x3b,
-             0x00, 0x04, 0xe1, 0x48,
-             0xe0, 0x04, 0x09, 0x46,
-             0x6c, 0x1d, 0x46, 0x41,
-             0x80, 0x48, 0xc0, 0x2b,
-             0xfc, 0x9c, 0x08, 0x44,
-             0x40, 0x46, 0x00, 0x46,
-             0x80, 0x04, 0xe1, 0x48,
-             0x83, 0x01, 0x00, 0x16,
-             0x6c, 0x25, 0x46, 0x21,
-             0x81, 0x11, 0x40, 0x2b,
-             0x6f, 0xf0, 0x5e, 0xc8,
-             0x08, 0x0c, 0x86, 0x2b,
-             0x32, 0xd8, 0xf2, 0x80,
-             0xc1, 0xc3, 0xff, 0xec,
-             0xfa, 0x3c, 0x04, 0x0c,
-             0x81, 0x01, 0x00, 0x6b,
-             0x68, 0x10, 0x6f, 0x08,
-             0x81, 0x81, 0x81, 0x11,
-             0x68, 0x24, 0x6d, 0xc8,
-             0x53, 0x06, 0x80, 0x7b,
-             0xa4, 0x04, 0xe1, 0x38,
-             0x42, 0x10, 0x80, 0x18,
-             0x80, 0x16, 0xf3, 0xbc,
-             0xe8, 0x2c, 0x4e, 0x88,
-             0x95, 0x11, 0x03, 0xa1,
-             0x8c, 0x0b, 0x03, 0x21,
-             0xe8, 0x3c, 0x77, 0x08,
-             0xe1, 0x10, 0x40, 0x46,
-             0x84, 0x86, 0x80, 0x14,
-             0x80, 0xa6, 0x80, 0x04,
-             0x80, 0x18, 0xa4, 0x04,
-             0x00, 0x16, 0xe0, 0x19,
-             0x79, 0xb8, 0x8c, 0x0b,
-             0x41, 0xc6, 0xef, 0xfc,
-             0x80, 0x04, 0xe1, 0x28,
-             0x42, 0x10, 0x80, 0x18,
-             0x00, 0x16, 0xf3, 0xf8,
-             0xe1, 0x18, 0x40, 0x06,
-             0x00, 0x86, 0x80, 0x04,
-             0xe1, 0x14, 0x40, 0x06,
-             0x80, 0x18, 0x80, 0x04,
-             0xf2, 0xfc, 0x42, 0x10,
-             0x40, 0x46, 0x00, 0x16,
-             0x00, 0x04, 0xe1, 0x14,
-             0x00, 0x86, 0x83, 0x11,
-             0xe1, 0x14, 0x40, 0x86,
-             0x00, 0x8c, 0x80, 0x04,
-             0xe1, 0x14, 0x41, 0x06,
-             0x00, 0x86, 0x80, 0x04,
-             0xe1, 0x14, 0x41, 0x46,
-             0x00, 0x86, 0x80, 0x04,
-             0xe1, 0x14, 0x41, 0xc6,
-             0x00, 0x86, 0x80, 0x04,
-             0x0c, 0x0c, 0x8e, 0x0b,
-             0x2a, 0x38, 0xf2, 0x3c,
-             0xc1, 0xc3, 0xe0, 0x10,
-             0xfa, 0x3c, 0x04, 0x0c,
-             0x81, 0x61, 0x02, 0xab,
-             0x80, 0x7b, 0x21, 0xab,
-             0x41, 0x9c, 0x0c, 0xa4,
-             0xe0, 0x04, 0x01, 0x16,
-             0x6c, 0x1d, 0x4e, 0x01,
-             0x84, 0x9b, 0x40, 0x2b,
-             0x50, 0x04, 0x4c, 0x60,
-             0x68, 0xf8, 0x81, 0x01,
-             0x81, 0x11, 0x68, 0x10,
-             0x42, 0x56, 0x00, 0x8b,
-             0x7e, 0xb8, 0xe0, 0x00,
-             0x8e, 0x0b, 0x68, 0x10,
-             0x01, 0x06, 0x21, 0x6b,
-             0x4e, 0x01, 0xe0, 0x04,
-             0xc0, 0x2b, 0x6c, 0x1d,
-             0x01, 0x26, 0x88, 0xa5,
-             0x94, 0x1b, 0x60, 0x04,
-             0x6c, 0x1d, 0x4e, 0x01,
-             0x8e, 0x0b, 0x40, 0x2b,
-             0x6f, 0xfc, 0x76, 0x48,
-             0x41, 0xc6, 0x92, 0x2b,
-             0x40, 0x20, 0x72, 0xfd,
-             0x60, 0x01, 0x02, 0x06,
-             0x80, 0x04, 0xff, 0xc0,
-             0x02, 0x06, 0x02, 0x0f,
-             0xc0, 0x20, 0x72, 0xc1,
-             0xfc, 0xc4, 0x00, 0x04,
-             0x41, 0x06, 0x04, 0x0e,
-             0x80, 0x04, 0xe1, 0x90,
-             0x84, 0x75, 0xa3, 0x0b,
-             0x72, 0xc1, 0x02, 0x06,
-             0x8e, 0x0b, 0x40, 0x20,
-             0xef, 0xec, 0x59, 0xe8,
-             0x01, 0x36, 0x81, 0xf5,
-             0x94, 0x1b, 0x60, 0x04,
-             0x6c, 0x1d, 0x4e, 0x01,
-             0x8e, 0x0b, 0x40, 0x2b,
-             0x6f, 0xfc, 0x74, 0x08,
-             0x81, 0x95, 0x92, 0x2b,
-             0x68, 0x00, 0x41, 0x68,
-             0x42, 0x96, 0x8e, 0x0b,
-             0x8e, 0x0b, 0x60, 0x00,
-             0xe8, 0x10, 0x7a, 0xc8,
-             0x60, 0x00, 0x42, 0x66,
-             0x7a, 0x78, 0x8e, 0x0b,
-             0x03, 0x11, 0xe8, 0x10,
-             0x64, 0x18, 0x90, 0x0b,
-             0x8c, 0x0b, 0xe8, 0x10,
-             0xf2, 0x3c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x84, 0x04, 0x0c,
-             0x0c, 0x0b, 0x80, 0x6b,
-             0xc0, 0x15, 0x6e, 0x09,
-             0x72, 0xf9, 0x40, 0x00,
-             0x4c, 0x03, 0xc0, 0xff,
-             0x40, 0x15, 0x6e, 0x09,
-             0x4c, 0x01, 0x81, 0x01,
-             0xc0, 0x2b, 0x64, 0xd5,
-             0xe8, 0x00, 0x62, 0x48,
-             0x8c, 0x0b, 0x00, 0x7b,
-             0xe8, 0x14, 0x7d, 0xc8,
-             0x68, 0x00, 0x61, 0x68,
-             0x69, 0x98, 0x8c, 0x0b,
-             0xa1, 0x7b, 0xe8, 0x08,
-             0x49, 0xf8, 0x86, 0x25,
-             0x8c, 0x0b, 0x68, 0x00,
-             0x68, 0x00, 0x41, 0x88,
-             0x41, 0x46, 0x8c, 0x0b,
-             0x42, 0x46, 0x6f, 0x14,
-             0x42, 0x1e, 0xe0, 0x04,
-             0x02, 0x16, 0x83, 0x11,
-             0xe0, 0x1c, 0x43, 0x46,
-             0xf8, 0x08, 0x40, 0x15,
-             0xef, 0xf0, 0x4f, 0x48,
-             0x0c, 0x0c, 0x8c, 0x0b,
-             0x2c, 0x18, 0xf2, 0x84,
-             0x0c, 0x0c, 0xe0, 0x08,
-             0xdd, 0x93, 0xf2, 0x84,
-             0x63, 0x49, 0x00, 0x19,
-             0x81, 0x21, 0x40, 0x2d,
-             0x6e, 0x51, 0x40, 0x21,
-             0x06, 0x5e, 0x40, 0x2c,
-             0xc0, 0x00, 0x70, 0x01,
-             0x68, 0x09, 0x40, 0x23,
-             0x40, 0x23, 0xc0, 0x0a,
-             0x40, 0x0a, 0x68, 0x15,
-             0x40, 0x25, 0xe0, 0x19,
-             0x40, 0x0a, 0x61, 0x1d,
-             0x40, 0x21, 0xaf, 0x21,
-             0x40, 0x28, 0x64, 0x91,
-             0xe0, 0x0c, 0x45, 0xf6,
-             0x67, 0xc9, 0x40, 0x21,
-             0x04, 0x06, 0x40, 0x2d,
-             0x40, 0x35, 0xe0, 0x08,
-             0x40, 0x05, 0x64, 0x01,
-             0x40, 0x23, 0xa1, 0x31,
-             0x40, 0x13, 0x69, 0x85,
-             0x40, 0x21, 0x91, 0x21,
-             0x40, 0x27, 0x63, 0x15,
-             0xe0, 0x10, 0x05, 0x86,
-             0x65, 0x65, 0x40, 0x31,
-             0x40, 0x33, 0xc0, 0x1b,
-             0xc0, 0x14, 0x62, 0x41,
-             0x69, 0x81, 0x40, 0x33,
-             0x40, 0x31, 0xc0, 0x13,
-             0x40, 0x27, 0x63, 0x11,
-             0xe0, 0x8c, 0x06, 0x06,
-             0x69, 0x91, 0x40, 0x23,
-             0x45, 0x86, 0x40, 0x13,
-             0x40, 0x33, 0xe0, 0x00,
-             0x40, 0x13, 0x69, 0x95,
-             0xe0, 0x00, 0x46, 0x86,
-             0x63, 0x49, 0x40, 0x11,
-             0x02, 0x26, 0x40, 0x2d,
-             0xc0, 0xc0, 0x60, 0x11,
-             0x63, 0x31, 0x40, 0x21,
-             0x89, 0x21, 0x40, 0x27,
-             0x63, 0x35, 0x40, 0x31,
-             0x00, 0x3b, 0xc0, 0x27,
-             0xc0, 0x0a, 0x69, 0x31,
-             0x63, 0x29, 0x40, 0x15,
-             0x83, 0x11, 0x40, 0x0b,
-             0x6c, 0x61, 0x40, 0x21,
-             0x85, 0x21, 0x40, 0x22,
-             0x6c, 0x65, 0x40, 0x21,
-             0x9d, 0x21, 0x40, 0x22,
-             0x68, 0x0d, 0x40, 0x13,
-             0x40, 0x13, 0xc0, 0x0a,
-             0xc0, 0x0a, 0x68, 0x11,
-             0x65, 0x45, 0x40, 0x11,
-             0x03, 0x06, 0x40, 0x22,
-             0x40, 0x21, 0xe0, 0x08,
-             0x40, 0x22, 0x6f, 0xb1,
-             0xfc, 0xa8, 0x04, 0x34,
-             0x65, 0x6d, 0x40, 0x11,
-             0x40, 0x11, 0xc0, 0x1b,
-             0xc0, 0x22, 0x65, 0x4d,
-             0x64, 0x89, 0x40, 0x11,
-             0x95, 0x11, 0x40, 0x28,
-             0x64, 0x8d, 0x40, 0x11,
-             0x40, 0x11, 0xc0, 0x28,
-             0xc0, 0x22, 0x6f, 0xb5,
-             0x69, 0x31, 0x40, 0x23,
-             0xdd, 0x93, 0xc0, 0x0a,
-             0xf8, 0x1c, 0x04, 0x0c,
-             0x53, 0xc6, 0x01, 0xc1,
-             0x40, 0xc1, 0xe0, 0x04,
-             0x40, 0x15, 0x62, 0x05,
-             0xe0, 0x08, 0x0e, 0x06,
-             0x63, 0x6d, 0x40, 0xc1,
-             0x59, 0xf6, 0x40, 0x2d,
-             0xc0, 0x20, 0x72, 0xfd,
-             0x6e, 0x81, 0x40, 0x91,
-             0xb7, 0x91, 0x40, 0x2c,
-             0x64, 0xe1, 0x40, 0xc5,
-             0x49, 0x86, 0x40, 0x0b,
-             0x40, 0xc5, 0xef, 0xf0,
-             0x40, 0x0b, 0x64, 0xe5,
-             0x0b, 0x86, 0xbd, 0xc1,
-             0x0d, 0xc6, 0x60, 0x24,
-             0x40, 0x91, 0xe0, 0x5c,
-             0x40, 0x2c, 0x6e, 0x89,
-             0xe0, 0x0c, 0x10, 0x86,
-             0x63, 0xa9, 0x40, 0xc1,
-             0xab, 0x91, 0x40, 0x2d,
-             0x02, 0x0e, 0x0d, 0xc1,
-             0xc0, 0xbb, 0x63, 0xc1,
-             0x6b, 0x19, 0x40, 0x43,
-             0x07, 0x06, 0x40, 0x15,
-             0x40, 0x53, 0xe0, 0x7c,
-             0x40, 0x15, 0x6b, 0x1d,
-             0x40, 0x63, 0x99, 0x41,
-             0x40, 0x15, 0x6d, 0xb1,
-             0xf9, 0x00, 0x0a, 0x06,
-             0x6d, 0xb5, 0x40, 0x83,
-             0x0c, 0xd6, 0x40, 0x15,
-             0x40, 0x91, 0xe0, 0xcc,
-             0x40, 0x2c, 0x6e, 0x95,
-             0xef, 0xfc, 0x51, 0xf6,
-             0x63, 0xd1, 0x40, 0xc1,
-             0x12, 0xc6, 0x40, 0x2d,
-             0x40, 0x71, 0xe0, 0x0c,
-             0x40, 0x29, 0x6e, 0x21,
-             0x72, 0xbd, 0x59, 0xf6,
-             0x40, 0x71, 0xc0, 0x20,
-             0x40, 0x29, 0x6e, 0x29,
-             0x40, 0x71, 0x85, 0x21,
-             0x40, 0x2c, 0x6e, 0x9d,
-             0x40, 0x15, 0xb5, 0x71,
-             0x40, 0x05, 0x64, 0x59,
-             0xe0, 0x08, 0x03, 0x06,
-             0x6a, 0xe1, 0x40, 0x33,
-             0xa3, 0x31, 0x40, 0x15,
-             0x66, 0x41, 0x40, 0x41,
-             0x08, 0x0e, 0x40, 0x2b,
-             0x40, 0x55, 0xff, 0xc0,
-             0x40, 0x0a, 0x6d, 0x95,
-             0xe0, 0x40, 0x0a, 0x06,
-             0x6d, 0xb9, 0x40, 0x63,
-             0x4c, 0x66, 0x40, 0x15,
-             0x40, 0x83, 0xe0, 0x00,
-             0x40, 0x15, 0x6d, 0xc1,
-             0xe0, 0x0c, 0x51, 0xf6,
-             0x63, 0x49, 0x40, 0x91,
-             0x13, 0x86, 0x40, 0x2d,
-             0x40, 0x71, 0xe0, 0x60,
-             0xc0, 0x2d, 0x63, 0x29,
-             0x63, 0x39, 0x40, 0x71,
-             0x40, 0x71, 0xc0, 0x2d,
-             0xc0, 0x2d, 0x63, 0xd9,
-             0x64, 0x09, 0x40, 0x71,
-             0x0e, 0x66, 0x40, 0x2d,
-             0xc0, 0x20, 0x68, 0x01,
-             0x64, 0xf9, 0x40, 0xc5,
-             0x40, 0xc5, 0xc0, 0x0b,
-             0x40, 0x0b, 0x64, 0xfd,
-             0x60, 0x01, 0x18, 0x06,
-             0x40, 0x11, 0xc0, 0x20,
-             0x40, 0x29, 0x6e, 0x25,
-             0x40, 0x31, 0x83, 0x11,
-             0x40, 0x2b, 0x65, 0xc9,
-             0x40, 0x45, 0x91, 0x31,
-             0x40, 0x0a, 0x6d, 0x99,
-             0x40, 0x55, 0x89, 0x41,
-             0x40, 0x0a, 0x6d, 0x9d,
-             0x40, 0x61, 0x8b, 0x51,
-             0x40, 0x2b, 0x6b, 0x95,
-             0x40, 0x93, 0x8f, 0x61,
-             0x40, 0x16, 0x69, 0xa9,
-             0x40, 0x81, 0x87, 0x91,
-             0xc0, 0x2c, 0x6c, 0xfd,
-             0x63, 0x69, 0x40, 0x81,
-             0x10, 0x56, 0x40, 0x2d,
-             0xc0, 0x20, 0x70, 0x01,
-             0x65, 0x05, 0x40, 0xc5,
-             0x40, 0xc5, 0xc0, 0x0b,
-             0x40, 0x0b, 0x65, 0x09,
-             0x40, 0x75, 0xb9, 0xc1,
-             0xc0, 0x0b, 0x65, 0x11,
-             0x65, 0x15, 0x40, 0x75,
-             0x93, 0x71, 0x40, 0x0b,
-             0x65, 0x11, 0x40, 0x11,
-             0x40, 0x21, 0xc0, 0x2b,
-             0xc0, 0x2b, 0x65, 0x31,
-             0x65, 0xcd, 0x40, 0x31,
-             0x40, 0x11, 0xc0, 0x2b,
-             0xc0, 0x2b, 0x65, 0xd1,
-             0x66, 0x81, 0x40, 0x11,
-             0x40, 0x11, 0xc0, 0x2b,
-             0xc0, 0x2b, 0x66, 0x85,
-             0x6a, 0xa1, 0x40, 0x51,
-             0x40, 0x41, 0xc0, 0x2b,
-             0xc0, 0x2b, 0x6a, 0xa5,
-             0x6b, 0x89, 0x40, 0x41,
-             0x40, 0x11, 0xc0, 0x2b,
-             0xc0, 0x2b, 0x6b, 0x8d,
-             0x6b, 0x91, 0x40, 0x11,
-             0x40, 0x61, 0xc0, 0x2b,
-             0xc0, 0x2c, 0x6d, 0x51,
-             0x6d, 0x61, 0x40, 0x11,
-             0x40, 0x61, 0xc0, 0x2c,
-             0xc0, 0x2c, 0x6e, 0x59,
-             0x6e, 0x5d, 0x40, 0x11,
-             0x40, 0x11, 0xc0, 0x2c,
-             0xc0, 0x2c, 0x6e, 0x61,
-             0x6e, 0x65, 0x40, 0x41,
-             0x40, 0x41, 0xc0, 0x2c,
-             0xc0, 0x2c, 0x6e, 0x69,
-             0x6e, 0x85, 0x40, 0x31,
-             0x40, 0x21, 0xc0, 0x2c,
-             0xc0, 0x2c, 0x6e, 0x8d,
-             0x6e, 0x91, 0x40, 0x11,
-             0x40, 0x11, 0xc0, 0x2c,
-             0xc0, 0x2c, 0x6e, 0x99,
-             0x6e, 0xa5, 0x40, 0x31,
-             0x40, 0x51, 0xc0, 0x2c,
-             0xc0, 0x2d, 0x63, 0x25,
-             0x63, 0x31, 0x40, 0x11,
-             0x40, 0x51, 0xc0, 0x2d,
-             0xc0, 0x2d, 0x63, 0x35,
-             0x63, 0x41, 0x40, 0x21,
-             0x40, 0x51, 0xc0, 0x2d,
-             0xc0, 0x2d, 0x63, 0x45,
-             0x63, 0x59, 0x40, 0x91,
-             0x40, 0x51, 0xc0, 0x2d,
-             0xc0, 0x2d, 0x63, 0x5d,
-             0x63, 0x61, 0x40, 0x41,
-             0x40, 0x51, 0xc0, 0x2d,
-             0xc0, 0x2d, 0x63, 0x65,
-             0x63, 0x71, 0x40, 0x91,
-             0x40, 0x51, 0xc0, 0x2d,
-             0xc0, 0x2d, 0x63, 0xa1,
-             0x63, 0xa5, 0x40, 0x51,
-             0x40, 0x85, 0xc0, 0x2d,
-             0xc0, 0x0b, 0x64, 0xed,
-             0x64, 0xf1, 0x40, 0x85,
-             0x40, 0x51, 0xc0, 0x0b,
-             0xc0, 0x2d, 0x63, 0xd5,
-             0x64, 0x01, 0x40, 0x61,
-             0x40, 0x51, 0xc0, 0x2d,
-             0xc0, 0x2d, 0x64, 0x05,
-             0x64, 0x31, 0x40, 0x31,
-             0x40, 0x51, 0xc0, 0x2d,
-             0xc0, 0x2d, 0x64, 0x35,
-             0x64, 0x39, 0x40, 0xc1,
-             0x40, 0x71, 0xc0, 0x2d,
-             0xc0, 0x2d, 0x64, 0x61,
-             0x64, 0x65, 0x40, 0x51,
-             0x40, 0xc1, 0xc0, 0x2d,
-             0xc0, 0x2d, 0x64, 0x69,
-             0x65, 0x31, 0x40, 0x61,
-             0x40, 0x61, 0xc0, 0x2d,
-             0xc0, 0x2d, 0x65, 0x35,
-             0x68, 0x11, 0x40, 0x41,
-             0x40, 0x11, 0xc0, 0x2d,
-             0xc0, 0x2d, 0x68, 0x1d,
-             0x69, 0xd9, 0x40, 0x11,
-             0x40, 0x11, 0xc0, 0x2d,
-             0xc0, 0x2d, 0x69, 0xdd,
-             0x6a, 0x31, 0x40, 0x21,
-             0x40, 0x31, 0xc0, 0x2d,
-             0xc0, 0x2d, 0x6a, 0x35,
-             0x6a, 0x39, 0x40, 0x91,
-             0x40, 0x41, 0xc0, 0x2d,
-             0xc0, 0x2d, 0x6a, 0x71,
-             0x6a, 0x7d, 0x40, 0x11,
-             0x0c, 0x0c, 0xc0, 0x2d,
-             0xdd, 0x93, 0xf0, 0x1c,
-             0xe1, 0x14, 0x03, 0x46,
-             0x84, 0x18, 0x84, 0x14,
-             0x6b, 0xf1, 0x40, 0x11,
-             0xdd, 0x93, 0xc0, 0x2b,
-             0xe1, 0x48, 0x40, 0x86,
-             0x80, 0x08, 0x80, 0x04,
-             0xe0, 0x00, 0x00, 0x4a,
-             0xe2, 0x00, 0x00, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x61, 0x48, 0x40, 0x86,
-             0x80, 0x04, 0x81, 0x11,
-             0xdd, 0x93, 0x80, 0x16,
-             0x61, 0x48, 0x40, 0x06,
-             0xe1, 0x90, 0x45, 0x06,
-             0x83, 0x31, 0x00, 0x04,
-             0xc2, 0x19, 0x80, 0x18,
-             0x88, 0x3e, 0x80, 0x16,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x61, 0x48, 0x40, 0x06,
-             0xe1, 0x90, 0x45, 0x06,
-             0x81, 0x31, 0x00, 0x04,
-             0x42, 0x10, 0x80, 0x18,
-             0x80, 0x16, 0xf3, 0xf8,
-             0xdd, 0x93, 0x88, 0x3e,
-             0xe1, 0x48, 0x40, 0x06,
-             0x80, 0x00, 0x80, 0x04,
-             0x40, 0x46, 0xa1, 0x0d,
-             0x00, 0x05, 0x81, 0x48,
-             0x00, 0x19, 0x80, 0x00,
-             0x42, 0x10, 0x80, 0x00,
-             0x40, 0x11, 0x9c, 0x04,
-             0xdd, 0x93, 0x80, 0x00,
-             0xe1, 0x48, 0x40, 0x06,
-             0x80, 0x00, 0x80, 0x04,
-             0x40, 0x46, 0xa1, 0x0d,
-             0x00, 0x05, 0x81, 0x48,
-             0x00, 0x19, 0x80, 0x00,
-             0x42, 0x10, 0x80, 0x00,
-             0x40, 0x11, 0x9c, 0x08,
-             0xdd, 0x93, 0x80, 0x00,
-             0xe1, 0x48, 0x40, 0x06,
-             0x80, 0x00, 0x80, 0x04,
-             0x40, 0x46, 0xa1, 0x0d,
-             0x00, 0x05, 0x81, 0x48,
-             0x00, 0x19, 0x80, 0x00,
-             0x42, 0x10, 0x80, 0x00,
-             0x40, 0x11, 0x93, 0xf4,
-             0xdd, 0x93, 0x80, 0x00,
-             0xe1, 0x48, 0x40, 0x06,
-             0x80, 0x00, 0x80, 0x04,
-             0x40, 0x46, 0xa1, 0x0d,
-             0x00, 0x05, 0x81, 0x48,
-             0x00, 0x19, 0x80, 0x00,
-             0x42, 0x10, 0x80, 0x00,
-             0x40, 0x11, 0x9c, 0x10,
-             0xdd, 0x93, 0x80, 0x00,
-             0xe1, 0x48, 0x40, 0x06,
-             0x80, 0x00, 0x80, 0x04,
-             0x40, 0x46, 0xa1, 0x0d,
-             0x00, 0x05, 0x81, 0x48,
-             0x00, 0x19, 0x80, 0x00,
-             0x42, 0x10, 0x80, 0x00,
-             0x40, 0x11, 0x93, 0xec,
-             0xdd, 0x93, 0x80, 0x00,
-             0xfa, 0xfc, 0x04, 0x0c,
-             0x81, 0x01, 0x00, 0x6b,
-             0x68, 0x0c, 0x78, 0xa8,
-             0x81, 0x81, 0x81, 0x11,
-             0x61, 0x34, 0x17, 0x86,
-             0x2c, 0x04, 0x80, 0x7b,
-             0xe1, 0x48, 0x53, 0x86,
-             0x83, 0x21, 0x03, 0xa1,
-             0xa4, 0x04, 0x80, 0x86,
-             0xa4, 0x04, 0x80, 0x86,
-             0xa4, 0x04, 0x80, 0xa6,
-             0x0c, 0x15, 0x80, 0x86,
-             0xc0, 0x0b, 0x69, 0xf9,
-             0x00, 0x06, 0xa1, 0x1b,
-             0x00, 0x15, 0x8f, 0x18,
-             0x8c, 0x0b, 0x00, 0x00,
-             0xe8, 0x3c, 0x41, 0xc8,
-             0x83, 0x11, 0x2c, 0x04,
-             0x01, 0x46, 0x00, 0xa6,
-             0x80, 0x04, 0xe1, 0x34,
-             0xa4, 0x04, 0x80, 0xa6,
-             0xa4, 0x04, 0x80, 0x86,
-             0xa4, 0x04, 0x80, 0xa6,
-             0x8c, 0x0b, 0x00, 0x86,
-             0xe8, 0x10, 0x64, 0x88,
-             0x8e, 0x0b, 0x03, 0x11,
-             0xe8, 0x0c, 0x75, 0xa8,
-             0x0c, 0x0c, 0x8c, 0x0b,
-             0x09, 0x98, 0xf2, 0xfc,
-             0xc1, 0xc3, 0xe0, 0x28,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xed, 0x50, 0x1e, 0xf0,
-             0x97, 0x11, 0x00, 0x6b,
-             0xe8, 0x10, 0x4a, 0xe8,
-             0xef, 0x14, 0x43, 0xc6,
-             0x40, 0x00, 0x84, 0x08,
-             0x84, 0x06, 0xf3, 0xf8,
-             0x62, 0x65, 0x0c, 0x09,
-             0x40, 0x4a, 0xc0, 0x15,
-             0x21, 0xb8, 0xe0, 0x8c,
-             0x0c, 0x09, 0x80, 0x00,
-             0xc0, 0x2d, 0x6b, 0x85,
-             0x21, 0x58, 0xa1, 0x0b,
-             0x06, 0x60, 0x80, 0x00,
-             0x40, 0xb6, 0x67, 0xa1,
-             0xe0, 0x04, 0x00, 0x06,
-             0x64, 0x50, 0x04, 0xf0,
-             0x81, 0x45, 0x81, 0x11,
-             0x00, 0x00, 0x49, 0x16,
-             0xa1, 0x0b, 0xec, 0x04,
-             0x19, 0x21, 0xfe, 0x95,
-             0x3e, 0x3e, 0x81, 0x51,
-             0x1b, 0x48, 0x81, 0x01,
-             0x00, 0x0a, 0xe0, 0x00,
-             0x1b, 0x48, 0xf0, 0x00,
-             0x52, 0x5a, 0xc0, 0x00,
-             0x86, 0x93, 0xe6, 0x8a,
-             0xe0, 0x20, 0x12, 0xa9,
-             0x12, 0x49, 0xa1, 0xab,
-             0x15, 0xf8, 0x80, 0x28,
-             0x12, 0xb9, 0x80, 0x00,
-             0xb1, 0xab, 0x60, 0x2c,
-             0xe0, 0x28, 0x12, 0x49,
-             0xe1, 0x84, 0x00, 0xb4,
-             0x40, 0x40, 0x7c, 0x0e,
-             0x89, 0x0e, 0xf0, 0xfc,
-             0xac, 0x05, 0xfe, 0x4e,
-             0x1e, 0x05, 0xb3, 0xab,
-             0x40, 0x02, 0x80, 0x10,
-             0x00, 0x49, 0x90, 0x98,
-             0x80, 0x15, 0x0f, 0x41,
-             0x80, 0x00, 0x0b, 0xa8,
-             0x8e, 0xe5, 0xb5, 0xab,
-             0x1e, 0x05, 0xb7, 0xab,
-             0x40, 0x02, 0x80, 0x10,
-             0x00, 0x41, 0x90, 0x98,
-             0x80, 0x15, 0x0e, 0x41,
-             0x0c, 0x09, 0xaa, 0xc5,
-             0x40, 0x15, 0x62, 0x11,
-             0x89, 0xc4, 0xb9, 0xab,
-             0xe6, 0x82, 0x40, 0xca,
-             0x9a, 0x80, 0x00, 0x04,
-             0x90, 0x98, 0x40, 0x02,
-             0x0e, 0x41, 0x00, 0x49,
-             0xa6, 0xe5, 0x80, 0x1a,
-             0xa4, 0x25, 0xbb, 0xab,
-             0x8a, 0x45, 0xbd, 0xab,
-             0x81, 0x41, 0x3f, 0xab,
-             0x14, 0x0a, 0xa6, 0x05,
-             0x0c, 0x45, 0xe0, 0x40,
-             0x80, 0x0c, 0x0c, 0x51,
-             0x14, 0x0a, 0xa2, 0x85,
-             0x0c, 0x45, 0xe0, 0x44,
-             0x80, 0x0c, 0x0c, 0x55,
-             0x14, 0x0a, 0xa0, 0xc5,
-             0x0c, 0x49, 0xe0, 0x48,
-             0x80, 0x33, 0x01, 0x65,
-             0x14, 0x0a, 0xa0, 0xc5,
-             0x86, 0x85, 0xe0, 0x4c,
-             0xe0, 0x50, 0x14, 0x0a,
-             0x89, 0x04, 0x88, 0x15,
-             0x8c, 0x03, 0xc4, 0x07,
-             0x6c, 0xdd, 0x00, 0x45,
-             0x8f, 0x35, 0xc0, 0x0c,
-             0xc2, 0x07, 0x89, 0x04,
-             0x00, 0x4b, 0x8c, 0x03,
-             0xc0, 0x0a, 0x6d, 0xa1,
-             0x89, 0x04, 0x8f, 0x25,
-             0x00, 0x41, 0x8c, 0x03,
-             0xc0, 0x15, 0x6e, 0x41,
-             0x6d, 0x41, 0x00, 0x01,
-             0x0d, 0x35, 0xc0, 0x15,
-             0x89, 0x04, 0xa0, 0x43,
-             0x8c, 0x03, 0xc4, 0x07,
-             0x6c, 0x5d, 0x00, 0x45,
-             0x8b, 0xb5, 0xc0, 0x0c,
-             0x08, 0x04, 0x09, 0x24,
-             0x3c, 0x5e, 0xfa, 0x80,
-             0x8c, 0x23, 0x89, 0x01,
-             0x6f, 0x41, 0x04, 0x39,
-             0x81, 0x21, 0x40, 0x15,
-             0x0e, 0x24, 0x85, 0x45,
-             0x88, 0x73, 0xfa, 0x80,
-             0x0e, 0x70, 0x8c, 0x73,
-             0xc0, 0x6b, 0x66, 0x41,
-             0x11, 0x0a, 0x98, 0x8b,
-             0x06, 0x35, 0xf4, 0x1c,
-             0xc4, 0x04, 0x04, 0x20,
-             0x70, 0x10, 0x00, 0x0a,
-             0xe4, 0x04, 0x18, 0x80,
-             0x1c, 0x58, 0xfc, 0xd5,
-             0xfa, 0x80, 0x10, 0x84,
-             0x10, 0x89, 0x8c, 0x83,
-             0xc0, 0x2e, 0x67, 0xc1,
-             0xfa, 0x80, 0x0a, 0x54,
-             0xfa, 0x80, 0x10, 0x84,
-             0xfa, 0x35, 0x91, 0x5b,
-             0x93, 0xc1, 0x04, 0x0b,
-             0x89, 0x21, 0x7b, 0xf5,
-             0xf4, 0x0c, 0x44, 0x8a,
-             0x18, 0x06, 0x76, 0x75,
-             0x00, 0x0a, 0xc0, 0x00,
-             0x04, 0x04, 0x70, 0x10,
-             0xa2, 0x15, 0xfa, 0x80,
-             0xe0, 0x80, 0x56, 0x1a,
-             0xa0, 0x00, 0x08, 0x58,
-             0x06, 0xf0, 0x7c, 0x04,
-             0x09, 0x44, 0xe4, 0x50,
-             0xbc, 0x54, 0x83, 0x21,
-             0xe0, 0x80, 0x40, 0x0a,
-             0x5c, 0x10, 0x06, 0x29,
-             0xf0, 0x90, 0x40, 0x32,
-             0x44, 0x20, 0xbe, 0x34,
-             0x80, 0x26, 0xd0, 0x04,
-             0x89, 0x04, 0x95, 0x05,
-             0x8c, 0x03, 0xc4, 0x07,
-             0x64, 0xd1, 0x00, 0x45,
-             0x81, 0x75, 0xc0, 0x05,
-             0xc4, 0x07, 0x89, 0x04,
-             0x00, 0x45, 0x8c, 0x03,
-             0xc0, 0x05, 0x65, 0xd1,
-             0x60, 0x01, 0x00, 0x06,
-             0x81, 0x4b, 0xfc, 0x00,
-             0x80, 0x00, 0x08, 0xf8,
-             0xe0, 0x24, 0x12, 0x09,
-             0x84, 0x45, 0xab, 0x0b,
-             0x84, 0x65, 0xa3, 0x0b,
-             0x88, 0x65, 0xa5, 0x0b,
-             0x88, 0x85, 0xa7, 0x0b,
-             0x8a, 0x85, 0xa9, 0x0b,
-             0xa0, 0x15, 0xa1, 0x0b,
-             0x81, 0x4d, 0xa4, 0x04,
-             0xa6, 0x04, 0x90, 0x35,
-             0x82, 0x65, 0x80, 0x4d,
-             0xa4, 0x04, 0x87, 0xd5,
-             0x81, 0x4b, 0x03, 0x95,
-             0x81, 0x4d, 0xa4, 0x04,
-             0xa6, 0x04, 0x80, 0x95,
-             0x8c, 0x85, 0x80, 0x4d,
-             0x04, 0xf0, 0x7c, 0x04,
-             0x89, 0x44, 0xe4, 0x50,
-             0x60, 0x80, 0x40, 0x0a,
-             0x04, 0x09, 0x83, 0x01,
-             0x07, 0x35, 0xdc, 0x10,
-             0xd0, 0x04, 0x40, 0x00,
-             0x01, 0xe5, 0xa4, 0x04,
-             0xa6, 0x04, 0x80, 0x4d,
-             0x09, 0xc4, 0x80, 0x4d,
-             0xe4, 0x50, 0x00, 0xf0,
-             0x00, 0x29, 0xfc, 0x34,
-             0x82, 0x65, 0xfc, 0x30,
-             0xa4, 0x04, 0x83, 0x15,
-             0x09, 0xc4, 0x81, 0x4b,
-             0xe4, 0x50, 0x00, 0xf0,
-             0x00, 0x29, 0xfc, 0x34,
-             0x82, 0x05, 0xfc, 0x30,
-             0x46, 0x4a, 0x7e, 0x44,
-             0x04, 0x06, 0xe0, 0x80,
-             0x01, 0x85, 0x80, 0x00,
-             0x7e, 0x44, 0x84, 0x3b,
-             0xe0, 0x80, 0x46, 0x0a,
-             0x46, 0x20, 0x83, 0x31,
-             0x98, 0x03, 0xd0, 0x04,
-             0xbe, 0x34, 0x80, 0x36,
-             0x7c, 0x04, 0x81, 0xd5,
-             0xe4, 0x50, 0x04, 0xf0,
-             0x40, 0x4a, 0x89, 0x44,
-             0x81, 0x01, 0x60, 0x80,
-             0xdc, 0x10, 0x04, 0x09,
-             0x88, 0x23, 0x7e, 0x44,
-             0x07, 0x15, 0x88, 0x06,
-             0xbc, 0x54, 0x99, 0x21,
-             0x56, 0x4a, 0x84, 0x55,
-             0x82, 0xe5, 0xe0, 0x80,
-             0x06, 0xf0, 0x7c, 0x04,
-             0x09, 0xc4, 0xe4, 0x50,
-             0xfe, 0x44, 0x81, 0x21,
-             0xe0, 0x80, 0x40, 0x4a,
-             0x5c, 0x30, 0x06, 0x29,
-             0xf0, 0xb0, 0x40, 0x32,
-             0xfb, 0xe5, 0x80, 0x26,
-             0x01, 0x0a, 0x3e, 0x34,
-             0x84, 0xf5, 0xf4, 0x0c,
-             0x86, 0x85, 0xaf, 0xab,
-             0x8a, 0x85, 0xa5, 0xab,
-             0x8c, 0x25, 0xa7, 0xab,
-             0x8c, 0xc5, 0xa9, 0xab,
-             0x8e, 0x85, 0xab, 0xab,
-             0x90, 0x25, 0xad, 0xab,
-             0x82, 0x35, 0xa3, 0xab,
-             0xc2, 0x27, 0x88, 0x23,
-             0x04, 0x43, 0x8c, 0x23,
-             0x40, 0x0c, 0x6d, 0x21,
-             0xef, 0x55, 0x99, 0x21,
-             0xfe, 0x44, 0x99, 0x21,
-             0x72, 0x00, 0x40, 0x40,
-             0x09, 0x45, 0x82, 0x51,
-             0x08, 0x23, 0xcf, 0x07,
-             0x66, 0x41, 0x00, 0x60,
-             0x06, 0x24, 0xc0, 0x58,
-             0x80, 0x23, 0x60, 0x84,
-             0x64, 0x01, 0x04, 0x29,
-             0x86, 0x03, 0x40, 0x04,
-             0x6c, 0x01, 0x00, 0x43,
-             0xbe, 0x34, 0xc0, 0x01,
-             0x07, 0x05, 0xc8, 0x27,
-             0x88, 0x23, 0x84, 0x43,
-             0x8c, 0x23, 0xc4, 0x27,
-             0x68, 0x91, 0x04, 0x45,
-             0x85, 0x85, 0xc0, 0x05,
-             0xc4, 0x27, 0x88, 0x23,
-             0x04, 0x45, 0x8c, 0x23,
-             0xc0, 0x06, 0x60, 0x91,
-             0x88, 0x23, 0x85, 0x15,
-             0x8c, 0x23, 0xc2, 0x27,
-             0x69, 0x21, 0x04, 0x4b,
-             0x99, 0x21, 0x40, 0x0c,
-             0x88, 0x23, 0xe9, 0x65,
-             0x04, 0x49, 0x8c, 0x23,
-             0x40, 0x1a, 0x6a, 0x41,
-             0xe7, 0xf5, 0x99, 0x21,
-             0x00, 0x60, 0x08, 0x23,
-             0xc0, 0x58, 0x66, 0x41,
-             0x60, 0x84, 0x06, 0x24,
-             0x04, 0x29, 0x80, 0x23,
-             0x40, 0x04, 0x60, 0x01,
-             0x00, 0x43, 0x86, 0x03,
-             0xc0, 0x01, 0x6c, 0x01,
-             0xc8, 0x27, 0xbe, 0x34,
-             0x65, 0x75, 0xa4, 0x43,
-             0x0b, 0x0a, 0x99, 0x21,
-             0x24, 0xc8, 0xe4, 0xfc,
-             0x4c, 0x15, 0x9f, 0xfc,
-             0x40, 0x0b, 0x69, 0xed,
-             0x4c, 0x15, 0x81, 0x01,
-             0x40, 0x0b, 0x69, 0xe9,
-             0x85, 0xa5, 0x81, 0x21,
-             0x64, 0x50, 0x06, 0xf0,
-             0xec, 0x80, 0x08, 0x10,
-             0x7c, 0x04, 0x06, 0x39,
-             0xfb, 0x90, 0x4a, 0x12,
-             0x64, 0x7c, 0x03, 0x0a,
-             0xec, 0x7c, 0x08, 0x52,
-             0x6c, 0x00, 0x10, 0x44,
-             0x06, 0xcb, 0xa8, 0x53,
-             0x18, 0x06, 0x82, 0x11,
-             0x0e, 0xc4, 0x80, 0x00,
-             0x81, 0xc1, 0x68, 0x90,
-             0x9c, 0x00, 0x58, 0x30,
-             0x6f, 0x90, 0x06, 0xc4,
-             0x46, 0x82, 0xa9, 0xcf,
-             0xb8, 0x0f, 0x78, 0x8c,
-             0x06, 0x52, 0x26, 0x7f,
-             0x4c, 0x05, 0xec, 0x04,
-             0x40, 0x0b, 0x69, 0xe9,
-             0xae, 0x2f, 0xa7, 0x7f,
-             0x69, 0xed, 0x4c, 0x25,
-             0x02, 0x0a, 0xc0, 0x0b,
-             0xf4, 0xb5, 0xe1, 0x00,
-             0x43, 0xc6, 0x24, 0x0f,
-             0x04, 0x08, 0xef, 0x14,
-             0x04, 0x25, 0xa1, 0x0b,
-             0x93, 0xf8, 0x40, 0x00,
-             0x84, 0x06, 0xc2, 0x09,
-             0x6d, 0xed, 0x0c, 0x09,
-             0xa3, 0x0b, 0xc0, 0x33,
-             0x80, 0x00, 0x00, 0x16,
-             0x04, 0xbd, 0x4c, 0x05,
-             0x81, 0x45, 0x80, 0x0d,
-             0xc2, 0x09, 0x84, 0x08,
-             0x1e, 0xf0, 0x84, 0x06,
-             0x0c, 0x0c, 0xe5, 0x50,
-             0xdd, 0x93, 0xf2, 0x7c,
-             0xef, 0x14, 0x41, 0xc6,
-             0x80, 0x28, 0x80, 0x18,
-             0x04, 0x19, 0xc2, 0x17,
-             0xf3, 0xf4, 0x44, 0x20,
-             0x80, 0x26, 0xa2, 0x2f,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xef, 0x14, 0x42, 0x06,
-             0xe0, 0x70, 0x02, 0x29,
-             0xe0, 0x84, 0x44, 0x0a,
-             0x9a, 0x00, 0x5c, 0x08,
-             0x64, 0xd5, 0x00, 0x29,
-             0xa7, 0x2b, 0xc0, 0x2b,
-             0x80, 0x00, 0x02, 0x29,
-             0x9c, 0x20, 0x44, 0x20,
-             0x80, 0x00, 0x42, 0x21,
-             0xff, 0xfc, 0x17, 0x08,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x6c, 0x51, 0x00, 0x19,
-             0x00, 0x29, 0xc0, 0x2b,
-             0xc0, 0x15, 0x61, 0x41,
-             0xe0, 0x84, 0x06, 0x14,
-             0x66, 0x86, 0x42, 0x2a,
-             0xfa, 0x80, 0x04, 0x34,
-             0x6c, 0x49, 0x40, 0x31,
-             0x06, 0x0a, 0x40, 0x2b,
-             0x42, 0x1a, 0xf0, 0x00,
-             0x40, 0x11, 0xe0, 0x0a,
-             0xc0, 0x2b, 0x6c, 0x41,
-             0x81, 0x01, 0x80, 0xa5,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0x00, 0x29, 0xdd, 0x93,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0xe0, 0x08, 0x42, 0x96,
-             0x6f, 0xf8, 0x63, 0xa8,
-             0xe0, 0x08, 0x4c, 0x96,
-             0x0c, 0x06, 0xa3, 0x0b,
-             0x8c, 0x0b, 0xc0, 0x00,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x6c, 0x55, 0x00, 0x19,
-             0x00, 0x29, 0xc0, 0x2b,
-             0xc0, 0x15, 0x61, 0x45,
-             0xe0, 0x84, 0x06, 0x14,
-             0x66, 0x86, 0x42, 0x2a,
-             0xfa, 0x80, 0x04, 0x34,
-             0x6c, 0x4d, 0x40, 0x31,
-             0x06, 0x0a, 0x40, 0x2b,
-             0x42, 0x1a, 0xf0, 0x00,
-             0x40, 0x11, 0xe0, 0x0a,
-             0xc0, 0x2b, 0x6c, 0x45,
-             0x81, 0x01, 0x80, 0xa5,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0x00, 0x29, 0xdd, 0x93,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0xe0, 0x08, 0x42, 0x96,
-             0x6f, 0xf8, 0x60, 0xc8,
-             0xe0, 0x08, 0x4c, 0x96,
-             0x0c, 0x06, 0xa3, 0x0b,
-             0x8c, 0x0b, 0xc0, 0x00,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x04, 0x04, 0x4c,
-             0x0c, 0x09, 0x80, 0x6b,
-             0xc0, 0x15, 0x61, 0x45,
-             0xec, 0x04, 0x02, 0x00,
-             0xf4, 0x1c, 0x03, 0x0a,
-             0x0c, 0x19, 0x82, 0xd5,
-             0xc0, 0x15, 0x61, 0x41,
-             0xec, 0x04, 0x04, 0x10,
-             0xf4, 0x24, 0x05, 0x0a,
-             0x40, 0x0a, 0x80, 0xd5,
-             0x00, 0x8a, 0xe6, 0x86,
-             0x84, 0x35, 0xe5, 0x44,
-             0x6c, 0x1d, 0x0c, 0x29,
-             0x0f, 0xf6, 0x40, 0x2b,
-             0x03, 0xf6, 0xe0, 0x08,
-             0x8c, 0x0b, 0x60, 0x08,
-             0xef, 0xf8, 0x5e, 0x08,
-             0x0d, 0x78, 0xa3, 0x0b,
-             0x0c, 0x19, 0x80, 0x00,
-             0xc0, 0x15, 0x61, 0x41,
-             0x61, 0x51, 0x0c, 0x09,
-             0x04, 0x14, 0x40, 0x15,
-             0x44, 0x0a, 0xfa, 0x80,
-             0x05, 0x0a, 0xe6, 0x8a,
-             0x82, 0x95, 0xe4, 0xa0,
-             0x61, 0x45, 0x0c, 0x29,
-             0x0c, 0x39, 0xc0, 0x15,
-             0xc0, 0x15, 0x61, 0x55,
-             0xe6, 0x8a, 0x44, 0x3a,
-             0xe4, 0x84, 0x04, 0x8a,
-             0x0c, 0x29, 0x84, 0x95,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0xe0, 0x08, 0x4e, 0x76,
-             0x60, 0x08, 0x42, 0x76,
-             0x5b, 0xb8, 0x8c, 0x0b,
-             0xa3, 0x0b, 0xef, 0xf8,
-             0x80, 0x00, 0x0b, 0x28,
-             0x61, 0x41, 0x0c, 0x19,
-             0x0c, 0x09, 0xc0, 0x15,
-             0xc0, 0x15, 0x61, 0x51,
-             0x7a, 0x80, 0x02, 0x14,
-             0xfa, 0x80, 0x04, 0x04,
-             0x61, 0x49, 0x0c, 0x39,
-             0x42, 0x2a, 0xc0, 0x15,
-             0x86, 0x13, 0xe6, 0x86,
-             0xe4, 0xa0, 0x03, 0x0a,
-             0x0c, 0x19, 0x84, 0x15,
-             0xc0, 0x15, 0x61, 0x45,
-             0x61, 0x55, 0x0c, 0x29,
-             0x0c, 0x39, 0xc0, 0x15,
-             0xc0, 0x15, 0x61, 0x4d,
-             0xe6, 0x86, 0x42, 0x2a,
-             0x02, 0x8a, 0x86, 0x13,
-             0x84, 0x15, 0xe4, 0x84,
-             0x6c, 0x1d, 0x0c, 0x29,
-             0x4e, 0x76, 0x40, 0x2b,
-             0x42, 0x76, 0xe0, 0x08,
-             0x8c, 0x0b, 0x60, 0x08,
-             0xef, 0xf8, 0x58, 0xc8,
-             0xa0, 0x65, 0xa3, 0x0b,
-             0x61, 0x51, 0x0c, 0x09,
-             0x00, 0x0a, 0xc0, 0x15,
-             0x86, 0xd5, 0xf0, 0x10,
-             0x61, 0x55, 0x0c, 0x09,
-             0xa9, 0x0b, 0xc0, 0x15,
-             0x0c, 0x09, 0x86, 0x35,
-             0xc0, 0x15, 0x61, 0x41,
-             0xe0, 0x80, 0x40, 0x4a,
-             0x0c, 0x09, 0x80, 0xe5,
-             0xc0, 0x15, 0x61, 0x45,
-             0xe0, 0x80, 0x40, 0x0a,
-             0x0c, 0x29, 0x82, 0xa5,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0xe0, 0x08, 0x4e, 0x06,
-             0x60, 0x08, 0x42, 0x06,
-             0x56, 0x98, 0x8c, 0x0b,
-             0xa3, 0x0b, 0xef, 0xf8,
-             0x0c, 0x09, 0x98, 0x05,
-             0xc0, 0x15, 0x61, 0x49,
-             0xf8, 0x0c, 0x00, 0x4a,
-             0x0c, 0x09, 0x84, 0x65,
-             0xc0, 0x15, 0x61, 0x4d,
-             0xf8, 0x0c, 0x00, 0x4a,
-             0x0c, 0x09, 0x82, 0xa5,
-             0xc0, 0x15, 0x61, 0x51,
-             0xf8, 0x0c, 0x00, 0x4a,
-             0x0c, 0x09, 0x80, 0xe5,
-             0xc0, 0x15, 0x61, 0x55,
-             0xf8, 0x0c, 0x00, 0x0a,
-             0x0c, 0x29, 0x82, 0xa5,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0xe0, 0x08, 0x4e, 0x16,
-             0x60, 0x08, 0x42, 0x16,
-             0x54, 0x58, 0x8c, 0x0b,
-             0xa3, 0x0b, 0xef, 0xf8,
-             0x0c, 0x09, 0x8e, 0x85,
-             0xc0, 0x15, 0x61, 0x41,
-             0x88, 0xb5, 0xa3, 0x0b,
-             0x61, 0x45, 0x0c, 0x09,
-             0xa3, 0x0b, 0xc0, 0x15,
-             0x0c, 0x09, 0x88, 0x15,
-             0xc0, 0x15, 0x61, 0x51,
-             0xec, 0x10, 0x00, 0x00,
-             0xf4, 0x30, 0x01, 0x0a,
-             0x0c, 0x09, 0x82, 0x55,
-             0x40, 0x15, 0x61, 0x55,
-             0x00, 0x00, 0x81, 0x71,
-             0x00, 0x8a, 0xec, 0x10,
-             0x88, 0x35, 0xf4, 0x34,
-             0x6c, 0x1d, 0x0c, 0x29,
-             0x4e, 0x36, 0x40, 0x2b,
-             0x42, 0x36, 0xe0, 0x08,
-             0x8c, 0x0b, 0x60, 0x08,
-             0xef, 0xf8, 0x51, 0xe8,
-             0x03, 0x55, 0xa3, 0x0b,
-             0xc0, 0x00, 0x0e, 0x06,
-             0x61, 0x51, 0x0c, 0x09,
-             0xb1, 0x0b, 0xc0, 0x15,
-             0xa9, 0x0b, 0x82, 0x05,
-             0x0c, 0x09, 0x84, 0x15,
-             0xc0, 0x15, 0x61, 0x55,
-             0xa9, 0x0b, 0x01, 0x65,
-             0x61, 0x55, 0x0c, 0x09,
-             0xb1, 0x0b, 0xc0, 0x15,
-             0x81, 0x71, 0x00, 0xd5,
-             0x0c, 0x4c, 0x8e, 0x0b,
-             0xdd, 0x93, 0xf2, 0x04,
-             0x6c, 0x1d, 0x0c, 0x29,
-             0x4e, 0x26, 0x40, 0x2b,
-             0x42, 0x26, 0xe0, 0x08,
-             0x8c, 0x0b, 0x60, 0x08,
-             0xef, 0xf8, 0x4f, 0xa8,
-             0x0e, 0x06, 0xa3, 0x0b,
-             0x8e, 0x0b, 0xc0, 0x00,
-             0xf2, 0x04, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x6c, 0x51, 0x00, 0x19,
-             0x00, 0x29, 0xc0, 0x2b,
-             0xc0, 0x2b, 0x6c, 0x55,
-             0x61, 0x88, 0x06, 0x14,
-             0x40, 0x11, 0x83, 0x11,
-             0x40, 0x2b, 0x6c, 0x59,
-             0xe1, 0x88, 0x08, 0x24,
-             0xe6, 0x92, 0x44, 0x3a,
-             0x6c, 0x41, 0x40, 0x31,
-             0x04, 0x0a, 0xc0, 0x2b,
-             0x89, 0x21, 0x60, 0x40,
-             0x6c, 0x49, 0x40, 0x21,
-             0x40, 0x21, 0xc0, 0x2b,
-             0xc0, 0x2b, 0x6c, 0x4d,
-             0x6c, 0x45, 0x40, 0x41,
-             0x40, 0x11, 0xc0, 0x2b,
-             0xc0, 0x2c, 0x6c, 0x79,
-             0x0c, 0x69, 0x40, 0x21,
-             0x40, 0x21, 0x80, 0x2b,
-             0x80, 0x2b, 0x0c, 0x6d,
-             0x0c, 0x81, 0x40, 0x11,
-             0xdd, 0x93, 0x80, 0x2c,
-             0xfa, 0x00, 0x04, 0xcc,
-             0x81, 0x01, 0x00, 0x6b,
-             0x66, 0x35, 0x0c, 0x1b,
-             0x99, 0x06, 0xc0, 0x16,
-             0x42, 0x4a, 0x91, 0x06,
-             0x42, 0x06, 0x60, 0x80,
-             0x4c, 0x11, 0xe0, 0x04,
-             0xc0, 0x2b, 0x6c, 0x1d,
-             0x80, 0x00, 0x0c, 0x98,
-             0x6f, 0xfc, 0x6b, 0x28,
-             0xa1, 0x0b, 0x8c, 0x0b,
-             0xc0, 0x00, 0x0c, 0x38,
-             0x61, 0x41, 0x0c, 0x09,
-             0x04, 0xf0, 0x40, 0x15,
-             0x0c, 0x19, 0xe4, 0x20,
-             0xc0, 0x15, 0x61, 0x45,
-             0x66, 0x82, 0x40, 0x1a,
-             0xe4, 0x30, 0x02, 0xf0,
-             0x63, 0x09, 0x4c, 0x01,
-             0x8c, 0x0b, 0x40, 0x15,
-             0xe8, 0x00, 0x4b, 0xc8,
-             0x61, 0x49, 0x0c, 0x09,
-             0x99, 0x18, 0xc0, 0x15,
-             0x61, 0x4d, 0x0c, 0x29,
-             0x11, 0x38, 0xc0, 0x15,
-             0x0c, 0x09, 0xc5, 0x07,
-             0x40, 0x15, 0x61, 0x41,
-             0x4c, 0x11, 0x80, 0x13,
-             0x40, 0x2b, 0x6c, 0x39,
-             0xe1, 0x88, 0x08, 0x24,
-             0x61, 0x51, 0x0c, 0x19,
-             0x86, 0x43, 0x40, 0x15,
-             0x61, 0x55, 0x0c, 0x29,
-             0xa3, 0x0b, 0x40, 0x15,
-             0x61, 0x45, 0x0c, 0x39,
-             0x4c, 0x41, 0xc0, 0x15,
-             0xc0, 0x2b, 0x6c, 0x3d,
-             0x6c, 0x51, 0x4c, 0x11,
-             0x4c, 0x21, 0xc0, 0x2b,
-             0xc0, 0x2b, 0x6c, 0x55,
-             0x06, 0x0a, 0x82, 0x15,
-             0x80, 0xb5, 0xf0, 0x04,
-             0x6f, 0xfc, 0x78, 0x08,
-             0x8f, 0x25, 0x8c, 0x0b,
-             0xf4, 0x0c, 0x07, 0x0a,
-             0x4c, 0x21, 0x84, 0x55,
-             0x40, 0x2b, 0x6c, 0x4d,
-             0x4c, 0x31, 0xea, 0x0d,
-             0xc0, 0x2b, 0x6c, 0x45,
-             0x60, 0x58, 0x8c, 0x25,
-             0x8c, 0x0b, 0x6f, 0xfc,
-             0x9c, 0x55, 0xa1, 0x0b,
-             0x6c, 0x41, 0x0c, 0x09,
-             0x85, 0xe5, 0xc0, 0x2b,
-             0xf0, 0x10, 0x06, 0x0a,
-             0x68, 0x0d, 0x86, 0x15,
-             0x4c, 0x21, 0x89, 0x31,
-             0xc0, 0x2b, 0x6c, 0x4d,
-             0x6c, 0x45, 0x4c, 0x31,
-             0x86, 0x85, 0xc0, 0x2b,
-             0x6f, 0xfc, 0x5f, 0x08,
-             0xa1, 0x0b, 0x8c, 0x0b,
-             0x0c, 0x09, 0x96, 0xb5,
-             0xc0, 0x2b, 0x6c, 0x41,
-             0x86, 0x15, 0xab, 0x0b,
-             0x6f, 0xfc, 0x61, 0x48,
-             0xfd, 0x15, 0x8c, 0x0b,
-             0x6f, 0xfc, 0x61, 0x08,
-             0xa1, 0x0b, 0x8c, 0x0b,
-             0x0c, 0x09, 0x92, 0xf5,
-             0xc0, 0x15, 0x61, 0x41,
-             0xf4, 0x95, 0xe8, 0x0d,
-             0x6c, 0x51, 0x0c, 0x19,
-             0x4c, 0x11, 0xc0, 0x2b,
-             0xc0, 0x2b, 0x6c, 0x49,
-             0x6c, 0x41, 0x4c, 0x01,
-             0x0c, 0x19, 0xc0, 0x2b,
-             0x40, 0x2b, 0x6c, 0x45,
-             0xfa, 0x80, 0x00, 0x04,
-             0x6c, 0x4d, 0x0c, 0x39,
-             0x40, 0x1a, 0xc0, 0x2b,
-             0x0c, 0x19, 0xe6, 0x82,
-             0xc0, 0x2b, 0x6c, 0x55,
-             0x6c, 0x51, 0x0c, 0x09,
-             0x00, 0x0a, 0x40, 0x2b,
-             0x04, 0x16, 0xe0, 0x40,
-             0x4c, 0x21, 0x80, 0x00,
-             0x80, 0x2c, 0x0c, 0x81,
-             0x6c, 0x49, 0x0c, 0x29,
-             0x4c, 0x11, 0xc0, 0x2b,
-             0x00, 0x2b, 0x0c, 0x6d,
-             0xfa, 0x80, 0x02, 0x14,
-             0x0c, 0x69, 0x4c, 0x01,
-             0x44, 0x3a, 0x80, 0x2b,
-             0x40, 0x1a, 0xe6, 0x8a,
-             0x40, 0x2a, 0xe6, 0x82,
-             0x4c, 0x01, 0xe0, 0x02,
-             0x40, 0x2c, 0x6c, 0x79,
-             0xfa, 0x80, 0x02, 0x04,
-             0x66, 0x31, 0x4c, 0x13,
-             0x44, 0x98, 0xc0, 0x16,
-             0x8c, 0x0b, 0x68, 0x00,
-             0x82, 0x95, 0xa1, 0x0b,
-             0x6f, 0xf0, 0x7c, 0x68,
-             0xa1, 0x0b, 0x8c, 0x0b,
-             0x6a, 0x18, 0x80, 0xf5,
-             0x8c, 0x0b, 0x68, 0x20,
-             0x68, 0x28, 0x7f, 0x08,
-             0x21, 0x11, 0x8c, 0x0b,
-             0x4c, 0x11, 0x83, 0x21,
-             0xc0, 0x1b, 0x65, 0x61,
-             0x65, 0x41, 0x4c, 0x21,
-             0x0c, 0xcc, 0xc0, 0x22,
-             0xdd, 0x93, 0xf2, 0x00,
-             0x68, 0x11, 0x00, 0x49,
-             0x00, 0x39, 0xc0, 0x27,
-             0x40, 0x27, 0x68, 0x15,
-             0x08, 0x8a, 0x81, 0x01,
-             0x08, 0x44, 0xe5, 0x40,
-             0x00, 0x40, 0x81, 0x88,
-             0x06, 0x8a, 0x0c, 0x50,
-             0x04, 0x06, 0xe5, 0x00,
-             0x06, 0x34, 0x81, 0x01,
-             0x00, 0x34, 0x81, 0x88,
-             0x00, 0x00, 0x9a, 0x80,
-             0x88, 0x06, 0x8c, 0x40,
-             0xa1, 0x3b, 0x84, 0x38,
-             0xc4, 0x08, 0x06, 0x30,
-             0xc1, 0x88, 0x06, 0x34,
-             0xc0, 0x00, 0x42, 0x31,
-             0xc0, 0x00, 0x04, 0x09,
-             0xfb, 0xfc, 0x00, 0x0a,
-             0xda, 0x80, 0x00, 0x04,
-             0xc4, 0x08, 0x00, 0x00,
-             0xc1, 0x88, 0x00, 0x04,
-             0x40, 0x00, 0x44, 0x01,
-             0xdd, 0x93, 0x81, 0x01,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x68, 0x00, 0x40, 0xc8,
-             0xa1, 0x0b, 0x80, 0x6b,
-             0x0c, 0x0c, 0x80, 0x85,
-             0xdd, 0x93, 0xf2, 0x00,
-             0x0c, 0x0c, 0x8c, 0x0b,
-             0x8b, 0x55, 0xf2, 0x00,
-             0xfa, 0x04, 0x04, 0x4c,
-             0x0c, 0x19, 0x80, 0x6b,
-             0xc0, 0x2b, 0x6c, 0x51,
-             0x6c, 0x55, 0x0c, 0x09,
-             0x44, 0x1a, 0xc0, 0x2b,
-             0xa1, 0x2b, 0xe5, 0x02,
-             0x0c, 0x39, 0x86, 0x05,
-             0xc0, 0x2b, 0x6c, 0x4d,
-             0x6c, 0x49, 0x0c, 0x49,
-             0x0c, 0x59, 0xc0, 0x2b,
-             0xc0, 0x2b, 0x6c, 0x45,
-             0x6c, 0x41, 0x0c, 0xc9,
-             0x46, 0x4a, 0xc0, 0x2b,
-             0x48, 0xca, 0xe5, 0x0e,
-             0x46, 0x4a, 0xe5, 0x16,
-             0x44, 0x3a, 0xe5, 0x0e,
-             0x03, 0x65, 0xe0, 0x0a,
-             0xef, 0xfc, 0x04, 0x22,
-             0x6c, 0x1d, 0x0c, 0x29,
-             0x4e, 0x56, 0x40, 0x2b,
-             0x42, 0x56, 0xe0, 0x08,
-             0x8c, 0x0b, 0x60, 0x08,
-             0xef, 0xf4, 0x77, 0x88,
-             0x88, 0x05, 0xa3, 0x0b,
-             0x6c, 0x51, 0x0c, 0x19,
-             0x81, 0x21, 0x40, 0x2b,
-             0x6c, 0x55, 0x0c, 0x09,
-             0x04, 0x24, 0xc0, 0x2b,
-             0xc2, 0x07, 0x7a, 0x80,
-             0x04, 0x22, 0x01, 0x71,
-             0x4c, 0x01, 0xed, 0x00,
-             0x40, 0x1b, 0x63, 0x05,
-             0x4c, 0x11, 0xc2, 0x17,
-             0x40, 0x1b, 0x63, 0x01,
-             0xe0, 0x04, 0x00, 0x06,
-             0x63, 0x09, 0x4c, 0x01,
-             0x4c, 0x21, 0xc0, 0x1b,
-             0xc0, 0x1b, 0x63, 0x0d,
-             0x63, 0x11, 0x4c, 0x71,
-             0x8e, 0x0b, 0xc0, 0x1b,
-             0xf2, 0x04, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x30, 0x1e, 0xf0,
-             0x81, 0x01, 0x00, 0x6b,
-             0x63, 0x0d, 0x0c, 0x79,
-             0x02, 0xf0, 0x40, 0x1b,
-             0x0c, 0x99, 0xe4, 0x20,
-             0xc0, 0x2b, 0x6c, 0x51,
-             0x6c, 0x55, 0x0c, 0xa9,
-             0xfc, 0x0e, 0xc0, 0x2b,
-             0x3c, 0x06, 0x89, 0x06,
-             0x45, 0x18, 0x8c, 0x0b,
-             0xa1, 0x0b, 0xe8, 0x00,
-             0xc0, 0x00, 0x10, 0x06,
-             0x00, 0x08, 0x1e, 0x85,
-             0x90, 0x95, 0xa1, 0x0b,
-             0x64, 0x10, 0x02, 0xf0,
-             0x74, 0xf8, 0x9e, 0x2b,
-             0x8c, 0x0b, 0x6f, 0xfc,
-             0x8e, 0x65, 0xa1, 0x8b,
-             0x6c, 0x3d, 0x0c, 0x39,
-             0x02, 0x90, 0x40, 0x2b,
-             0x3c, 0x48, 0xec, 0x04,
-             0xec, 0x04, 0x04, 0xa0,
-             0x6c, 0x39, 0x0c, 0x59,
-             0x81, 0xc1, 0x40, 0x2b,
-             0xa8, 0x33, 0x89, 0x08,
-             0x60, 0x8c, 0x08, 0x34,
-             0x64, 0x20, 0x06, 0x60,
-             0xa0, 0x53, 0xc0, 0x6d,
-             0xc6, 0x57, 0x05, 0x45,
-             0x12, 0x44, 0x02, 0xc1,
-             0x51, 0xcd, 0xfa, 0x80,
-             0xf0, 0x94, 0x54, 0x12,
-             0x79, 0x00, 0x46, 0xa1,
-             0xf0, 0xa4, 0x56, 0x22,
-             0x82, 0x25, 0x8c, 0xb6,
-             0x6c, 0x51, 0x0c, 0x99,
-             0x0a, 0x54, 0x40, 0x2b,
-             0xc2, 0x97, 0xfa, 0x80,
-             0x92, 0x53, 0x01, 0xd5,
-             0x6c, 0x55, 0x0c, 0x49,
-             0x81, 0xc1, 0x40, 0x2b,
-             0x6c, 0x39, 0x0c, 0x59,
-             0xc2, 0x47, 0xc0, 0x2b,
-             0x92, 0x43, 0x20, 0x53,
-             0x0e, 0x70, 0xc6, 0x57,
-             0x82, 0x31, 0x6c, 0x04,
-             0xf6, 0xb5, 0xa1, 0x7b,
-             0x98, 0xf1, 0x81, 0x01,
-             0xf2, 0x7c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x6c, 0x51, 0x00, 0x39,
-             0x82, 0x4b, 0x40, 0x2b,
-             0x6c, 0x49, 0x00, 0x29,
-             0x00, 0x19, 0xc0, 0x2b,
-             0xc0, 0x2b, 0x6c, 0x41,
-             0xc1, 0xc3, 0x87, 0x25,
-             0xfa, 0x04, 0x04, 0x0c,
-             0xec, 0x30, 0x1e, 0xf0,
-             0x81, 0x01, 0x00, 0x7b,
-             0x82, 0x6b, 0x7c, 0x0e,
-             0x02, 0xf0, 0x3e, 0x0e,
-             0x7e, 0x98, 0xe4, 0x20,
-             0x8e, 0x0b, 0x6f, 0xfc,
-             0x84, 0x15, 0xa1, 0x0b,
-             0x64, 0x10, 0x02, 0xf0,
-             0x41, 0x18, 0x8e, 0x0b,
-             0xa1, 0x0b, 0xe8, 0x00,
-             0xfc, 0x04, 0x82, 0x35,
-             0x40, 0x1a, 0xbe, 0x14,
-             0x00, 0x02, 0xe6, 0x82,
-             0x18, 0x0e, 0xef, 0xfc,
-             0x98, 0xf1, 0x81, 0x01,
-             0xf2, 0x04, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x6c, 0x55, 0x00, 0x39,
-             0x82, 0x4b, 0x40, 0x2b,
-             0x6c, 0x4d, 0x00, 0x29,
-             0x00, 0x19, 0xc0, 0x2b,
-             0xc0, 0x2b, 0x6c, 0x45,
-             0xc1, 0xc3, 0x81, 0x25,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x82, 0x85, 0xa1, 0x3b,
-             0xe5, 0x0a, 0x40, 0x1a,
-             0xe0, 0x0e, 0x40, 0x0a,
-             0xef, 0xfc, 0x00, 0x02,
-             0x81, 0x01, 0x10, 0x0e,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0x00, 0x29, 0xdd, 0x93,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0xe0, 0x08, 0x42, 0x56,
-             0x6f, 0xf4, 0x69, 0xa8,
-             0xe0, 0x08, 0x4c, 0x56,
-             0x0c, 0x06, 0xa3, 0x0b,
-             0x8c, 0x0b, 0xc0, 0x00,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x04, 0x5e, 0x65,
-             0xec, 0x10, 0x0c, 0xf0,
-             0x74, 0x1c, 0x5e, 0x60,
-             0xbc, 0x6e, 0x88, 0x61,
-             0xfe, 0x80, 0x03, 0xfc,
-             0xf8, 0x04, 0x17, 0x0c,
-             0xec, 0x30, 0x1e, 0xf0,
-             0x81, 0x93, 0x81, 0x83,
-             0x40, 0x46, 0xc1, 0x83,
-             0x43, 0x26, 0x61, 0x48,
-             0x80, 0x04, 0xe0, 0x0c,
-             0x40, 0x06, 0x00, 0x16,
-             0x80, 0x04, 0xe1, 0x48,
-             0x02, 0x14, 0x80, 0x18,
-             0x80, 0x16, 0xfc, 0x9c,
-             0xef, 0xe4, 0x54, 0x68,
-             0x6f, 0xa0, 0x57, 0x88,
-             0xc1, 0xc3, 0x81, 0x01,
-             0xfa, 0x00, 0x00, 0x4c,
-             0x61, 0x48, 0x40, 0x46,
-             0xe0, 0x0c, 0x43, 0x36,
-             0x00, 0x16, 0x80, 0x04,
-             0x60, 0x11, 0x00, 0x06,
-             0x00, 0x04, 0xc0, 0x20,
-             0xe1, 0x48, 0x42, 0x06,
-             0x80, 0x18, 0x84, 0x04,
-             0xfc, 0x9c, 0x02, 0x14,
-             0x52, 0xd8, 0x80, 0x16,
-             0x55, 0xf8, 0xef, 0xe4,
-             0x81, 0x01, 0x6f, 0xa0,
-             0xfa, 0x00, 0x00, 0x4c,
-             0x61, 0x48, 0x40, 0x46,
-             0xe0, 0x0c, 0x43, 0x46,
-             0x00, 0x16, 0x80, 0x04,
-             0x60, 0x11, 0x00, 0x06,
-             0x00, 0x04, 0xc0, 0x20,
-             0xe1, 0x48, 0x42, 0x06,
-             0x80, 0x18, 0x84, 0x04,
-             0xfc, 0x9c, 0x02, 0x14,
-             0x51, 0x58, 0x80, 0x16,
-             0x54, 0x78, 0xef, 0xe4,
-             0x81, 0x01, 0x6f, 0xa0,
-             0xfa, 0x00, 0x00, 0x4c,
-             0x61, 0x48, 0x40, 0x46,
-             0xe0, 0x0c, 0x43, 0x76,
-             0x00, 0x16, 0x80, 0x04,
-             0x60, 0x11, 0x00, 0x06,
-             0x00, 0x04, 0xc0, 0x20,
-             0xe1, 0x48, 0x42, 0x06,
-             0x80, 0x18, 0x84, 0x04,
-             0xfc, 0x9c, 0x02, 0x14,
-             0x4f, 0xd8, 0x80, 0x16,
-             0x52, 0xf8, 0xef, 0xe4,
-             0x81, 0x01, 0x6f, 0xa0,
-             0xfa, 0x00, 0x00, 0x4c,
-             0x61, 0x48, 0x40, 0x46,
-             0xe0, 0x0c, 0x43, 0x96,
-             0x00, 0x16, 0x80, 0x04,
-             0x60, 0x11, 0x00, 0x06,
-             0x00, 0x04, 0xc0, 0x20,
-             0xe1, 0x48, 0x42, 0x06,
-             0x80, 0x18, 0x84, 0x04,
-             0xfc, 0x9c, 0x02, 0x14,
-             0x4e, 0x58, 0x80, 0x16,
-             0x51, 0x78, 0xef, 0xe4,
-             0x81, 0x01, 0x6f, 0xa0,
-             0xfa, 0x00, 0x00, 0x4c,
-             0x61, 0x48, 0x40, 0x46,
-             0xe0, 0x0c, 0x43, 0xa6,
-             0x00, 0x16, 0x80, 0x04,
-             0x60, 0x11, 0x00, 0x06,
-             0x00, 0x04, 0xc0, 0x20,
-             0xe1, 0x48, 0x42, 0x06,
-             0x80, 0x18, 0x84, 0x04,
-             0xfc, 0x9c, 0x02, 0x14,
-             0x4c, 0xd8, 0x80, 0x16,
-             0x4f, 0xf8, 0xef, 0xe4,
-             0x81, 0x01, 0x6f, 0xa0,
-             0xfa, 0x00, 0x00, 0x4c,
-             0x61, 0x48, 0x40, 0x46,
-             0xe0, 0x0c, 0x43, 0xe6,
-             0x00, 0x16, 0x80, 0x04,
-             0x60, 0x11, 0x00, 0x06,
-             0x00, 0x04, 0xc0, 0x20,
-             0xe1, 0x48, 0x42, 0x06,
-             0x80, 0x18, 0x84, 0x04,
-             0xfc, 0x9c, 0x02, 0x14,
-             0x4b, 0x58, 0x80, 0x16,
-             0x4e, 0x78, 0xef, 0xe4,
-             0x81, 0x01, 0x6f, 0xa0,
-             0xfa, 0x00, 0x00, 0x4c,
-             0xe2, 0xc0, 0x00, 0x2c,
-             0x61, 0x48, 0x40, 0x46,
-             0xe0, 0x0c, 0x43, 0xf6,
-             0x00, 0x16, 0x80, 0x04,
-             0xe1, 0x48, 0x40, 0x06,
-             0x80, 0x18, 0x80, 0x04,
-             0xfc, 0x9c, 0x02, 0x14,
-             0x49, 0xf8, 0x80, 0x16,
-             0x4d, 0x18, 0xef, 0xe4,
-             0x81, 0x01, 0x6f, 0xa0,
-             0xfa, 0x1c, 0x04, 0x0c,
-             0xec, 0x30, 0x1e, 0xf0,
-             0x6f, 0xf8, 0x45, 0xa8,
-             0x80, 0x7b, 0x80, 0x6b,
-             0x90, 0x25, 0xa1, 0x7b,
-             0x81, 0x11, 0x05, 0x01,
-             0x6c, 0x1d, 0x4c, 0x01,
-             0x01, 0x86, 0x40, 0x2b,
-             0x00, 0x1e, 0xe1, 0x90,
-             0x64, 0x1d, 0x10, 0x60,
-             0x7d, 0xf8, 0xc0, 0xaf,
-             0xa1, 0x0b, 0xef, 0xe8,
-             0x87, 0x01, 0x82, 0x65,
-             0x44, 0xd8, 0xa0, 0x06,
-             0x45, 0x18, 0xef, 0xf8,
-             0x47, 0xb8, 0xef, 0xf8,
-             0x7d, 0x98, 0xef, 0xe4,
-             0x01, 0x11, 0xef, 0xe8,
-             0xed, 0x54, 0x04, 0x06,
-             0x6f, 0xa0, 0x60, 0x48,
-             0x40, 0x06, 0x8c, 0x0b,
-             0x81, 0x11, 0x6f, 0x14,
-             0x6f, 0xa0, 0x5f, 0xe8,
-             0xe0, 0x00, 0x44, 0xc6,
-             0x60, 0x01, 0x00, 0x06,
-             0x03, 0xe6, 0x40, 0x7d,
-             0x4c, 0x05, 0xe0, 0x50,
-             0x40, 0x0a, 0x6d, 0x49,
-             0x4c, 0x01, 0x83, 0x01,
-             0x40, 0x2c, 0x6e, 0x91,
-             0xe4, 0x00, 0x00, 0x06,
-             0x67, 0x39, 0x4c, 0x13,
-             0x42, 0x16, 0x40, 0x16,
-             0x4c, 0x03, 0xe0, 0x00,
-             0xc0, 0x16, 0x67, 0x3d,
-             0x6e, 0x01, 0x4c, 0x13,
-             0x83, 0x05, 0xc0, 0x15,
-             0x61, 0x90, 0x01, 0x86,
-             0x64, 0x1c, 0x10, 0x60,
-             0x80, 0x14, 0xc0, 0xaf,
-             0x83, 0x11, 0x23, 0x1b,
-             0x6c, 0x1d, 0x4c, 0x11,
-             0x02, 0x06, 0x40, 0x2b,
-             0x40, 0x15, 0xc0, 0x00,
-             0x5d, 0x58, 0xc0, 0x00,
-             0x18, 0xf0, 0xef, 0xe4,
-             0x8c, 0x0b, 0x64, 0x10,
-             0xe8, 0x10, 0x5a, 0xe8,
-             0xa1, 0x0b, 0xbe, 0x04,
-             0xfc, 0x94, 0x82, 0x55,
-             0x80, 0xe5, 0xa1, 0x9b,
-             0xe1, 0x34, 0x00, 0x46,
-             0x80, 0x04, 0x80, 0x04,
-             0x88, 0xb5, 0xa3, 0x0b,
-             0x68, 0x0c, 0x5a, 0xe8,
-             0x20, 0x28, 0x8c, 0x0b,
-             0xe0, 0x08, 0x10, 0xb6,
-             0x60, 0x08, 0x02, 0xb6,
-             0x54, 0xf8, 0x8c, 0x0b,
-             0x40, 0x38, 0xef, 0xf4,
-             0x8c, 0x0b, 0x68, 0x34,
-             0x68, 0x04, 0x50, 0x48,
-             0xa1, 0x8b, 0x8c, 0x0b,
-             0x6f, 0xf4, 0x7e, 0xa8,
-             0x9c, 0x00, 0x50, 0x00,
-             0xef, 0xf4, 0x7e, 0xc8,
-             0xef, 0xe4, 0x41, 0x68,
-             0x83, 0x11, 0x01, 0x01,
-             0x6f, 0xe4, 0x6c, 0xc8,
-             0x10, 0x0b, 0x8c, 0x2b,
-             0x0c, 0x0c, 0x98, 0xf1,
-             0xdd, 0x93, 0xf2, 0x1c,
-             0x68, 0x0c, 0x75, 0x08,
-             0x00, 0x8b, 0x8c, 0x0b,
-             0xa1, 0x8b, 0x8c, 0x0b,
-             0x64, 0xf8, 0x80, 0x85,
-             0xfb, 0xe5, 0xef, 0xf4,
-             0xe8, 0x14, 0x53, 0x48,
-             0xa1, 0x8b, 0x80, 0x8b,
-             0x7b, 0x78, 0xf6, 0x35,
-             0x8c, 0x0b, 0x6f, 0xf4,
-             0xe8, 0x00, 0x43, 0xa8,
-             0x88, 0x65, 0xa1, 0x7b,
-             0x6f, 0xf4, 0x64, 0x08,
-             0x5b, 0x98, 0x8c, 0x0b,
-             0x8c, 0x0b, 0x6f, 0xf4,
-             0x6f, 0x14, 0x41, 0x46,
-             0xe0, 0x04, 0x42, 0x46,
-             0x83, 0x11, 0x42, 0x1e,
-             0x43, 0x46, 0x02, 0x16,
-             0x40, 0x15, 0xe0, 0x1c,
-             0x69, 0x58, 0xf8, 0x08,
-             0x46, 0x58, 0xef, 0xe4,
-             0x8c, 0x0b, 0x68, 0x00,
-             0x82, 0x75, 0xa3, 0x9b,
-             0x68, 0x0c, 0x6f, 0xe8,
-             0x00, 0x8b, 0x8c, 0x0b,
-             0x7b, 0x78, 0x8c, 0x0b,
-             0xa1, 0x8b, 0xe8, 0x30,
-             0x81, 0x45, 0xec, 0x95,
-             0x68, 0x30, 0x7b, 0x28,
-             0x0c, 0x0b, 0x8c, 0x0b,
-             0x73, 0x18, 0x8e, 0x1b,
-             0x8e, 0x2b, 0x6f, 0xe8,
-             0xa1, 0x8b, 0x80, 0x8b,
-             0x01, 0x11, 0xea, 0x15,
-             0x03, 0x31, 0x9f, 0x21,
-             0x45, 0x38, 0x8c, 0x0b,
-             0x75, 0x15, 0xe8, 0x30,
-             0xc1, 0xc3, 0x80, 0x8b,
-             0x61, 0x1c, 0x41, 0xc6,
-             0x80, 0x04, 0x81, 0x11,
-             0x00, 0x06, 0x00, 0x16,
-             0x80, 0x04, 0xe1, 0x20,
-             0x00, 0x46, 0x00, 0x16,
-             0x80, 0x04, 0xe1, 0x20,
-             0x00, 0x86, 0x00, 0x16,
-             0x80, 0x04, 0xe1, 0x20,
-             0x00, 0xc6, 0x00, 0x16,
-             0x80, 0x04, 0xe1, 0x20,
-             0x01, 0x06, 0x00, 0x16,
-             0x80, 0x04, 0xe1, 0x20,
-             0x01, 0x46, 0x00, 0x16,
-             0x80, 0x04, 0xe1, 0x20,
-             0x01, 0x86, 0x00, 0x16,
-             0x80, 0x04, 0xe1, 0x20,
-             0x01, 0xc6, 0x00, 0x16,
-             0x80, 0x04, 0xe1, 0x20,
-             0x40, 0x06, 0x00, 0x16,
-             0x80, 0x04, 0xe1, 0x20,
-             0x40, 0x46, 0x00, 0x16,
-             0x80, 0x04, 0xe1, 0x20,
-             0x40, 0x86, 0x00, 0x16,
-             0x80, 0x04, 0xe1, 0x20,
-             0x40, 0xc6, 0x00, 0x16,
-             0x80, 0x04, 0xe1, 0x20,
-             0x41, 0x06, 0x00, 0x16,
-             0x80, 0x04, 0xe1, 0x20,
-             0x41, 0x46, 0x00, 0x16,
-             0x80, 0x04, 0xe1, 0x20,
-             0x41, 0x86, 0x00, 0x16,
-             0x80, 0x04, 0xe1, 0x20,
-             0xdd, 0x93, 0x80, 0x16,
-             0x62, 0x65, 0x00, 0x09,
-             0x42, 0xc6, 0x40, 0x15,
-             0x04, 0x14, 0xe1, 0x48,
-             0x88, 0x09, 0x81, 0x31,
-             0x44, 0x20, 0x84, 0x28,
-             0x20, 0x2f, 0xf3, 0xec,
-             0xe1, 0x34, 0x01, 0x86,
-             0x83, 0x11, 0x04, 0x26,
-             0x00, 0x16, 0x80, 0x04,
-             0xe1, 0x34, 0x01, 0x46,
-             0x00, 0x16, 0x80, 0x04,
-             0xe1, 0x48, 0x41, 0x86,
-             0x88, 0x36, 0x80, 0x24,
-             0x88, 0x16, 0x80, 0x24,
-             0x00, 0x36, 0x80, 0x04,
-             0xe1, 0x34, 0x01, 0x06,
-             0x00, 0x16, 0x80, 0x04,
-             0xe1, 0x48, 0x41, 0x06,
-             0x43, 0x06, 0x00, 0x04,
-             0x80, 0x16, 0xe0, 0x00,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x68, 0x05, 0x00, 0x1b,
-             0x00, 0x2b, 0xc0, 0x0a,
-             0xc0, 0x0a, 0x68, 0x01,
-             0x68, 0x15, 0x00, 0x3b,
-             0x00, 0x4b, 0xc0, 0x0a,
-             0x40, 0x0a, 0x68, 0x09,
-             0x00, 0x2b, 0xe0, 0x17,
-             0x40, 0x0a, 0x68, 0x0d,
-             0x00, 0x5b, 0xa4, 0x1f,
-             0x40, 0x0a, 0x68, 0x11,
-             0x80, 0x1e, 0xe0, 0x37,
-             0x28, 0x2f, 0xe0, 0x27,
-             0x82, 0x2e, 0xaa, 0x3f,
-             0xdd, 0x93, 0xc0, 0x3e,
-             0xfa, 0x04, 0x5e, 0x65,
-             0xec, 0x10, 0x0c, 0xf0,
-             0x74, 0x1c, 0x5e, 0x60,
-             0xbc, 0x6e, 0x88, 0x61,
-             0xfe, 0x84, 0x07, 0xfc,
-             0xf8, 0x04, 0x17, 0x0c,
-             0xec, 0x50, 0x1e, 0xf0,
-             0x81, 0x93, 0x81, 0x83,
-             0x01, 0x61, 0xc1, 0x83,
-             0xe0, 0x3c, 0x41, 0xf6,
-             0x6f, 0xa4, 0x4e, 0xa8,
-             0x40, 0x46, 0x81, 0x11,
-             0x0e, 0xc6, 0x61, 0x90,
-             0x00, 0x1a, 0xe1, 0x4c,
-             0xe1, 0x38, 0x04, 0x86,
-             0x88, 0x44, 0x9c, 0x34,
-             0x00, 0x1c, 0xc2, 0x19,
-             0x46, 0x01, 0xa1, 0x01,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x10, 0x16, 0x83, 0x11,
-             0x88, 0x04, 0x83, 0x11,
-             0x41, 0xf6, 0x00, 0x66,
-             0x4d, 0x18, 0xe0, 0x3c,
-             0x5a, 0x78, 0xef, 0xa4,
-             0x1c, 0x04, 0xe8, 0x14,
-             0x4d, 0x38, 0x81, 0x11,
-             0xa8, 0xf1, 0xe8, 0x08,
-             0xf0, 0x04, 0x1f, 0x0c,
-             0xf6, 0x84, 0x0f, 0xfc,
-             0xfd, 0x64, 0xbc, 0xf4,
-             0xc1, 0xc3, 0xc1, 0x53,
-             0xfa, 0x04, 0x5e, 0x65,
-             0xec, 0x10, 0x0c, 0xf0,
-             0x74, 0x1c, 0x5e, 0x60,
-             0xbc, 0x6e, 0x88, 0x61,
-             0xfe, 0x80, 0x03, 0xfc,
-             0xf8, 0x04, 0x17, 0x0c,
-             0xec, 0x30, 0x1e, 0xf0,
-             0x81, 0x93, 0x81, 0x83,
-             0x40, 0x46, 0xc1, 0x83,
-             0x04, 0xc6, 0x61, 0x90,
-             0x00, 0x1a, 0xe1, 0x4c,
-             0xe1, 0x38, 0x07, 0x06,
-             0x8c, 0x54, 0x88, 0x44,
-             0x00, 0x1c, 0xc4, 0x19,
-             0x48, 0x01, 0xa3, 0x01,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x14, 0x16, 0x83, 0x11,
-             0x8c, 0x04, 0x81, 0x11,
-             0x83, 0x11, 0x00, 0x16,
-             0x4a, 0x18, 0x88, 0x04,
-             0x98, 0xf1, 0xe8, 0x08,
-             0xf0, 0x04, 0x1f, 0x0c,
-             0xf6, 0x80, 0x0b, 0xfc,
-             0xfd, 0x64, 0xbc, 0xf4,
-             0xc1, 0xc3, 0xc1, 0x53,
-             0xfa, 0x04, 0x5e, 0x65,
-             0xec, 0x10, 0x0c, 0xf0,
-             0x74, 0x1c, 0x5e, 0x60,
-             0xbc, 0x6e, 0x88, 0x61,
-             0xfe, 0x84, 0x07, 0xfc,
-             0xf8, 0x04, 0x17, 0x0c,
-             0xec, 0x50, 0x1e, 0xf0,
-             0x81, 0x93, 0x81, 0x83,
-             0x41, 0xf6, 0xc1, 0x83,
-             0x81, 0x11, 0x60, 0x3c,
-             0xef, 0xa4, 0x47, 0xa8,
-             0x61, 0x4c, 0x0c, 0xc6,
-             0x98, 0x04, 0xa5, 0x11,
-             0x6c, 0x1d, 0x40, 0x11,
-             0x85, 0x11, 0x40, 0x2b,
-             0xe8, 0x08, 0x47, 0x88,
-             0xe1, 0x38, 0x0f, 0xc6,
-             0x80, 0x18, 0x9c, 0x04,
-             0xe0, 0x80, 0x42, 0x0a,
-             0x40, 0x46, 0x86, 0x45,
-             0x05, 0x86, 0x61, 0x90,
-             0x80, 0x1a, 0xe1, 0x38,
-             0xc8, 0x19, 0x88, 0x34,
-             0x8c, 0x08, 0x80, 0x1c,
-             0x8c, 0x06, 0xc2, 0x09,
-             0x80, 0x18, 0x88, 0x04,
-             0xf3, 0xf8, 0x42, 0x10,
-             0x98, 0x04, 0x80, 0x16,
-             0xe8, 0x30, 0x6d, 0x08,
-             0x02, 0x26, 0x18, 0x04,
-             0x45, 0x98, 0xe0, 0x10,
-             0x9c, 0x04, 0xe8, 0x08,
-             0x40, 0x0a, 0x80, 0x08,
-             0x84, 0xc5, 0xe0, 0x84,
-             0x61, 0x90, 0x40, 0x46,
-             0xe1, 0x38, 0x05, 0x86,
-             0x88, 0x34, 0x80, 0x1a,
-             0x80, 0x1c, 0xd0, 0x19,
-             0xc4, 0x09, 0x8c, 0x08,
-             0x88, 0x04, 0x8c, 0x06,
-             0x42, 0x10, 0x80, 0x18,
-             0x00, 0x16, 0xf3, 0xf4,
-             0xe0, 0x20, 0x02, 0x26,
-             0x43, 0xf8, 0x98, 0x04,
-             0x41, 0xf6, 0xe8, 0x08,
-             0x83, 0x11, 0x60, 0x3c,
-             0xef, 0xa4, 0x43, 0x28,
-             0x1f, 0x0c, 0xa8, 0xf1,
-             0x0f, 0xfc, 0xf0, 0x04,
-             0xbc, 0xf4, 0xf6, 0x84,
-             0xc1, 0x53, 0xfd, 0x64,
-             0xfa, 0x04, 0x5e, 0x65,
-             0xec, 0x10, 0x0c, 0xf0,
-             0x74, 0x1c, 0x5e, 0x60,
-             0xbc, 0x6e, 0x88, 0x61,
-             0xfe, 0x84, 0x07, 0xfc,
-             0xf8, 0x04, 0x17, 0x0c,
-             0xec, 0x50, 0x1e, 0xf0,
-             0x81, 0x93, 0x81, 0x83,
-             0x41, 0xf6, 0xc1, 0x83,
-             0x81, 0x11, 0x60, 0x3c,
-             0xef, 0xa4, 0x41, 0x48,
-             0x61, 0x4c, 0x0c, 0xc6,
-             0x98, 0x04, 0xa7, 0x11,
-             0x6c, 0x1d, 0x40, 0x11,
-             0x87, 0x11, 0x40, 0x2b,
-             0xe8, 0x08, 0x41, 0x28,
-             0xe1, 0x38, 0x4e, 0xc6,
-             0x80, 0x18, 0x9c, 0x04,
-             0xe0, 0x80, 0x42, 0x0a,
-             0x40, 0x46, 0x84, 0xe5,
-             0x44, 0x86, 0x61, 0x90,
-             0x80, 0x1a, 0xe1, 0x38,
-             0xe0, 0x19, 0x88, 0x34,
-             0x8c, 0x08, 0x80, 0x1c,
-             0x8c, 0x06, 0xc2, 0x09,
-             0x80, 0x18, 0x88, 0x04,
-             0xf3, 0xf8, 0x42, 0x10,
-             0x02, 0x36, 0x00, 0x16,
-             0x98, 0x04, 0xe0, 0x10,
-             0xe8, 0x04, 0x7f, 0x68,
-             0x80, 0x18, 0x9c, 0x04,
-             0xe0, 0x84, 0x42, 0x0a,
-             0x40, 0x46, 0x86, 0x05,
-             0x44, 0x86, 0x61, 0x90,
-             0x80, 0x1a, 0xe1, 0x38,
-             0x02, 0x14, 0x88, 0x34,
-             0x80, 0x1c, 0xfc, 0x94,
-             0xc4, 0x09, 0x8c, 0x08,
-             0x88, 0x04, 0x8c, 0x06,
-             0x42, 0x10, 0x80, 0x18,
-             0x00, 0x16, 0xf3, 0xf4,
-             0xe0, 0x20, 0x02, 0x36,
-             0x7d, 0xb8, 0x98, 0x04,
-             0x9c, 0x04, 0xe8, 0x04,
-             0x40, 0x0a, 0x80, 0x08,
-             0x8a, 0x05, 0xe0, 0x88,
-             0x61, 0x90, 0x40, 0x46,
-             0xe1, 0x38, 0x44, 0x86,
-             0x88, 0x34, 0x80, 0x1a,
-             0xfc, 0x98, 0x02, 0x14,
-             0x8c, 0x08, 0x80, 0x1c,
-             0x8c, 0x06, 0xc8, 0x09,
-             0x80, 0x18, 0x88, 0x04,
-             0xf3, 0xec, 0x42, 0x10,
-             0x40, 0x46, 0x00, 0x16,
-             0x80, 0x04, 0xe1, 0x38,
-             0x42, 0x10, 0x80, 0x18,
-             0x80, 0x16, 0xf3, 0xec,
-             0x00, 0x1b, 0x98, 0x04,
-             0xc0, 0x15, 0x6e, 0x09,
-             0xfc, 0x98, 0x02, 0x14,
-             0x6e, 0x09, 0x40, 0x13,
-             0x02, 0x36, 0x40, 0x15,
-             0x7b, 0x18, 0xe0, 0x40,
-             0x4d, 0xf8, 0xe8, 0x04,
-             0x41, 0xf6, 0xef, 0xe0,
-             0x83, 0x11, 0x60, 0x3c,
-             0xef, 0xa0, 0x7a, 0x28,
-             0x1f, 0x0c, 0xa8, 0xf1,
-             0x0f, 0xfc, 0xf0, 0x04,
-             0xbc, 0xf4, 0xf6, 0x84,
-             0xc1, 0x53, 0xfd, 0x64,
-             0xfa, 0x04, 0x5e, 0x65,
-             0xec, 0x10, 0x0c, 0xf0,
-             0x74, 0x1c, 0x5e, 0x60,
-             0xbc, 0x6e, 0x88, 0x61,
-             0xfe, 0x84, 0x07, 0xfc,
-             0xf8, 0x04, 0x17, 0x0c,
-             0xec, 0x50, 0x1e, 0xf0,
-             0x81, 0x93, 0x81, 0x83,
-             0x41, 0xf6, 0xc1, 0x83,
-             0x81, 0x11, 0x60, 0x3c,
-             0xef, 0xa0, 0x78, 0x48,
-             0x61, 0x4c, 0x0c, 0xc6,
-             0x98, 0x04, 0xa9, 0x11,
-             0x6c, 0x1d, 0x40, 0x11,
-             0x89, 0x11, 0x40, 0x2b,
-             0xe8, 0x04, 0x78, 0x28,
-             0xe1, 0x38, 0x4f, 0x86,
-             0x80, 0x18, 0x9c, 0x04,
-             0xe0, 0x80, 0x42, 0x0a,
-             0x40, 0x46, 0x86, 0xa5,
-             0x45, 0x46, 0x61, 0x90,
-             0x80, 0x1a, 0xe1, 0x38,
-             0x02, 0x14, 0x88, 0x34,
-             0x80, 0x1c, 0xfc, 0x9c,
-             0xc2, 0x09, 0x8c, 0x08,
-             0x88, 0x04, 0x8c, 0x06,
-             0x42, 0x10, 0x80, 0x18,
-             0x00, 0x16, 0xf3, 0xf8,
-             0xe0, 0x10, 0x02, 0x46,
-             0x76, 0x58, 0x98, 0x04,
-             0x18, 0x04, 0xe8, 0x04,
-             0xe0, 0x0c, 0x42, 0x96,
-             0xe8, 0x04, 0x4c, 0xe8,
-             0x80, 0x18, 0x9c, 0x04,
-             0xe0, 0x84, 0x42, 0x0a,
-             0x40, 0x46, 0x86, 0xa5,
-             0x45, 0x46, 0x61, 0x90,
-             0x80, 0x1a, 0xe1, 0x38,
-             0x02, 0x14, 0x88, 0x34,
-             0x80, 0x1c, 0xfc, 0xa0,
-             0xc4, 0x09, 0x8c, 0x08,
-             0x88, 0x04, 0x8c, 0x06,
-             0x42, 0x10, 0x80, 0x18,
-             0x00, 0x16, 0xf3, 0xf4,
-             0xe0, 0x0c, 0x42, 0xa6,
-             0x4b, 0x38, 0x98, 0x04,
-             0x18, 0x04, 0xe8, 0x04,
-             0xe0, 0x20, 0x02, 0x46,
-             0xe8, 0x04, 0x74, 0x08,
-             0x80, 0x18, 0x9c, 0x04,
-             0xe0, 0x88, 0x42, 0x0a,
-             0x40, 0x46, 0x86, 0xa5,
-             0x45, 0x46, 0x61, 0x90,
-             0x80, 0x1a, 0xe1, 0x38,
-             0x02, 0x14, 0x88, 0x34,
-             0x80, 0x1c, 0xfc, 0xa4,
-             0xc8, 0x09, 0x8c, 0x08,
-             0x88, 0x04, 0x8c, 0x06,
-             0x42, 0x10, 0x80, 0x18,
-             0x00, 0x16, 0xf3, 0xec,
-             0xe0, 0x0c, 0x42, 0xb6,
-             0x49, 0x38, 0x98, 0x04,
-             0x18, 0x04, 0xe8, 0x04,
-             0xe0, 0x40, 0x02, 0x46,
-             0xe8, 0x04, 0x72, 0x08,
-             0x80, 0x18, 0x9c, 0x04,
-             0xe0, 0x8c, 0x42, 0x0a,
-             0x40, 0x46, 0x86, 0xa5,
-             0x45, 0x46, 0x61, 0x90,
-             0x80, 0x1a, 0xe1, 0x38,
-             0x02, 0x14, 0x88, 0x34,
-             0x80, 0x1c, 0xfc, 0xa8,
-             0xd0, 0x09, 0x8c, 0x08,
-             0x88, 0x04, 0x8c, 0x06,
-             0x42, 0x10, 0x80, 0x18,
-             0x00, 0x16, 0xf3, 0xdc,
-             0xe0, 0x80, 0x02, 0x46,
-             0x70, 0x58, 0x98, 0x04,
-             0x18, 0x04, 0xe8, 0x04,
-             0xe0, 0x0c, 0x42, 0xc6,
-             0xe8, 0x04, 0x46, 0xe8,
-             0x80, 0x18, 0x9c, 0x04,
-             0xe0, 0x90, 0x42, 0x0a,
-             0x40, 0x46, 0x86, 0xa5,
-             0x45, 0x46, 0x61, 0x90,
-             0x80, 0x1a, 0xe1, 0x38,
-             0x02, 0x14, 0x88, 0x34,
-             0x80, 0x1c, 0xfc, 0xac,
-             0xe0, 0x09, 0x8c, 0x08,
-             0x88, 0x04, 0x8c, 0x06,
-             0x42, 0x10, 0x80, 0x18,
-             0x00, 0x16, 0xf3, 0xbc,
-             0xe1, 0x00, 0x02, 0x46,
-             0x6e, 0x58, 0x98, 0x04,
-             0x18, 0x04, 0xe8, 0x04,
-             0xe0, 0x0c, 0x42, 0xd6,
-             0xe8, 0x04, 0x44, 0xe8,
-             0x80, 0x18, 0x9c, 0x04,
-             0xe0, 0x94, 0x42, 0x0a,
-             0x40, 0x46, 0x86, 0xc5,
-             0x45, 0x46, 0x61, 0x90,
-             0x80, 0x1a, 0xe1, 0x38,
-             0x02, 0x14, 0x88, 0x34,
-             0x80, 0x1c, 0xfc, 0xb0,
-             0x00, 0x04, 0x8c, 0x08,
-             0x8c, 0x06, 0xfc, 0x94,
-             0x80, 0x18, 0x88, 0x04,
-             0xf3, 0x7c, 0x42, 0x10,
-             0x02, 0x46, 0x00, 0x16,
-             0x98, 0x04, 0xe2, 0x00,
-             0xe8, 0x04, 0x6c, 0x48,
-             0x42, 0xe6, 0x18, 0x04,
-             0x42, 0xd8, 0xe0, 0x0c,
-             0x9c, 0x04, 0xe8, 0x04,
-             0x42, 0x0a, 0x80, 0x18,
-             0x86, 0xc5, 0xe0, 0x98,
-             0x61, 0x90, 0x40, 0x46,
-             0xe1, 0x38, 0x45, 0x46,
-             0x88, 0x34, 0x80, 0x1a,
-             0xfc, 0xb4, 0x02, 0x14,
-             0x8c, 0x08, 0x80, 0x1c,
-             0xfc, 0x98, 0x00, 0x04,
-             0x88, 0x04, 0x8c, 0x06,
-             0x42, 0x10, 0x80, 0x18,
-             0x00, 0x16, 0xf2, 0xfc,
-             0xe4, 0x00, 0x02, 0x46,
-             0x6a, 0x38, 0x98, 0x04,
-             0x18, 0x04, 0xe8, 0x04,
-             0xe0, 0x0c, 0x42, 0xf6,
-             0xe8, 0x04, 0x40, 0xc8,
-             0x00, 0x00, 0x9c, 0x04,
-             0x82, 0x0d, 0xff, 0x11,
-             0x41, 0x46, 0x86, 0xb5,
-             0x80, 0x14, 0xe1, 0x38,
-             0x04, 0x24, 0x84, 0x28,
-             0x84, 0x26, 0xfc, 0x9c,
-             0x80, 0x18, 0x80, 0x04,
-             0xf1, 0xfc, 0x42, 0x10,
-             0x42, 0x46, 0x00, 0x16,
-             0x84, 0x2a, 0xe1, 0x90,
-             0x04, 0x24, 0x98, 0x04,
-             0x04, 0x2c, 0xfc, 0xb8,
-             0xe8, 0x00, 0x02, 0x46,
-             0xe8, 0x04, 0x68, 0x28,
-             0x43, 0x06, 0x18, 0x04,
-             0x40, 0x18, 0xe0, 0x0c,
-             0x41, 0xf6, 0xe8, 0x04,
-             0x83, 0x11, 0x60, 0x3c,
-             0xef, 0xa0, 0x67, 0x08,
-             0x1f, 0x0c, 0xa8, 0xf1,
-             0x0f, 0xfc, 0xf0, 0x04,
-             0xbc, 0xf4, 0xf6, 0x84,
-             0xc1, 0x53, 0xfd, 0x64,
-             0xfa, 0x04, 0x5e, 0x65,
-             0xec, 0x10, 0x0c, 0xf0,
-             0x74, 0x1c, 0x5e, 0x60,
-             0xbc, 0x6e, 0x88, 0x61,
-             0xfe, 0x84, 0x07, 0xfc,
-             0xf8, 0x04, 0x17, 0x0c,
-             0xec, 0x50, 0x1e, 0xf0,
-             0x81, 0x93, 0x81, 0x83,
-             0x01, 0x61, 0xc1, 0x83,
-             0xe0, 0x3c, 0x41, 0xf6,
-             0x6f, 0xa0, 0x65, 0x28,
-             0x0e, 0xc6, 0x81, 0x11,
-             0x42, 0x46, 0x61, 0x4c,
-             0x1c, 0x04, 0xe1, 0x90,
-             0xe1, 0x3c, 0x06, 0xc6,
-             0xab, 0x41, 0x04, 0x2a,
-             0x40, 0x41, 0x8c, 0x54,
-             0xc0, 0x2b, 0x6c, 0x1d,
-             0x7c, 0xbc, 0x00, 0x24,
-             0x04, 0x0c, 0x83, 0x21,
-             0x94, 0x26, 0x8b, 0x11,
-             0x80, 0x66, 0x8c, 0x04,
-             0x64, 0x18, 0x9c, 0x04,
-             0x9c, 0x04, 0xe8, 0x04,
-             0xef, 0xe0, 0x76, 0x08,
-             0x60, 0x3c, 0x41, 0xf6,
-             0x63, 0x18, 0x83, 0x11,
-             0xa8, 0xf1, 0xef, 0xa0,
-             0xf0, 0x04, 0x1f, 0x0c,
-             0xf6, 0x84, 0x0f, 0xfc,
-             0xfd, 0x64, 0xbc, 0xf4,
-             0xc1, 0xc3, 0xc1, 0x53,
-             0xfa, 0x04, 0x5e, 0x65,
-             0xec, 0x10, 0x0c, 0xf0,
-             0x74, 0x1c, 0x5e, 0x60,
-             0xbc, 0x6e, 0x88, 0x61,
-             0xfe, 0x8c, 0x07, 0xfc,
-             0xf8, 0x04, 0x17, 0x0c,
-             0xec, 0x40, 0x1e, 0xf0,
-             0x81, 0x93, 0x81, 0x83,
-             0x01, 0x61, 0xc1, 0x83,
-             0xe0, 0x3c, 0x41, 0xf6,
-             0x6f, 0xa0, 0x61, 0x28,
-             0x0e, 0xc6, 0x81, 0x11,
-             0xad, 0x01, 0x61, 0x4c,
-             0x83, 0x81, 0x1c, 0x14,
-             0x6c, 0x1d, 0x42, 0x01,
-             0x83, 0x01, 0x40, 0x2b,
-             0xef, 0xe4, 0x77, 0x08,
-             0xe1, 0x3c, 0x40, 0x46,
-             0x04, 0x86, 0x80, 0x14,
-             0x80, 0x04, 0x8d, 0x11,
-             0x9c, 0x04, 0x80, 0x66,
-             0xe8, 0x04, 0x60, 0x48,
-             0x60, 0x3c, 0x41, 0xf6,
-             0x5f, 0x78, 0x83, 0x11,
-             0xa0, 0xf1, 0xef, 0xa0,
-             0xf0, 0x04, 0x1f, 0x0c,
-             0xf6, 0x8c, 0x0f, 0xfc,
-             0xfd, 0x64, 0xbc, 0xf4,
-             0xc1, 0xc3, 0xc1, 0x53,
-             0xfa, 0x04, 0x5e, 0x65,
-             0xec, 0x10, 0x0c, 0xf0,
-             0x74, 0x1c, 0x5e, 0x60,
-             0xbc, 0x6e, 0x88, 0x61,
-             0xfe, 0x84, 0x07, 0xfc,
-             0xf8, 0x04, 0x17, 0x0c,
-             0xec, 0x50, 0x1e, 0xf0,
-             0x81, 0x93, 0x81, 0x83,
-             0x41, 0xf6, 0xc1, 0x83,
-             0x81, 0x11, 0x60, 0x3c,
-             0x6f, 0xa0, 0x5d, 0x88,
-             0x0e, 0xc6, 0x81, 0x61,
-             0xaf, 0x01, 0x61, 0x4c,
-             0x42, 0x01, 0x9c, 0x14,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x73, 0x78, 0x81, 0x01,
-             0x1c, 0x04, 0xef, 0xe4,
-             0x5d, 0x18, 0x8f, 0x11,
-             0x40, 0x06, 0xe8, 0x04,
-             0x80, 0x18, 0xef, 0x14,
-             0xf8, 0xc0, 0x02, 0x0a,
-             0x80, 0x18, 0x80, 0xe5,
-             0xf0, 0xc0, 0x42, 0x10,
-             0xe0, 0x80, 0x02, 0x0a,
-             0x9c, 0x14, 0x82, 0xb5,
-             0x6c, 0x15, 0x02, 0x19,
-             0x42, 0x0a, 0xc0, 0x2b,
-             0x00, 0x19, 0xe0, 0x84,
-             0x80, 0x18, 0xc0, 0x70,
-             0xf3, 0xdc, 0x42, 0x10,
-             0x9c, 0x04, 0x80, 0x16,
-             0x6c, 0x15, 0x00, 0x19,
-             0x42, 0x0a, 0xc0, 0x2b,
-             0x84, 0x45, 0xe0, 0x84,
-             0x68, 0x04, 0x5b, 0x08,
-             0xe0, 0x10, 0x02, 0x76,
-             0x6d, 0x78, 0x9c, 0x04,
-             0x9c, 0x04, 0xef, 0xe4,
-             0x6e, 0x09, 0x00, 0x1b,
-             0x42, 0x10, 0xc0, 0x15,
-             0xc0, 0xfd, 0x73, 0xfd,
-             0x6e, 0x09, 0x40, 0x13,
-             0x00, 0x19, 0xc0, 0x15,
-             0x40, 0x2d, 0x67, 0xcd,
-             0xe1, 0x3c, 0x45, 0xc6,
-             0x83, 0x41, 0x08, 0x34,
-             0x40, 0x11, 0xc8, 0x19,
-             0x40, 0x2d, 0x67, 0xcd,
-             0x8c, 0x46, 0x83, 0x11,
-             0x00, 0x66, 0x88, 0x04,
-             0xe0, 0x3c, 0x41, 0xf6,
-             0xef, 0xa0, 0x58, 0x68,
-             0x1f, 0x0c, 0xa8, 0xf1,
-             0x0f, 0xfc, 0xf0, 0x04,
-             0xbc, 0xf4, 0xf6, 0x84,
-             0xc1, 0x53, 0xfd, 0x64,
-             0xfa, 0x04, 0x5e, 0x65,
-             0xec, 0x10, 0x0c, 0xf0,
-             0x74, 0x1c, 0x5e, 0x60,
-             0xbc, 0x6e, 0x88, 0x61,
-             0xfe, 0x80, 0x03, 0xfc,
-             0xf8, 0x04, 0x17, 0x0c,
-             0xec, 0x30, 0x1e, 0xf0,
-             0x81, 0x93, 0x81, 0x83,
-             0x00, 0x1c, 0xc1, 0x83,
-             0x40, 0x00, 0xe2, 0xc0,
-             0x03, 0x46, 0x7f, 0x00,
-             0x84, 0x0e, 0xe1, 0x94,
-             0xe3, 0x40, 0x00, 0x1c,
-             0x61, 0x4c, 0x00, 0xc6,
-             0xe1, 0x40, 0x03, 0x46,
-             0xb1, 0x31, 0x00, 0x04,
-             0x83, 0x41, 0x04, 0x24,
-             0x6c, 0x1d, 0x40, 0x31,
-             0x08, 0x46, 0xc0, 0x2b,
-             0x84, 0x14, 0x81, 0x21,
-             0x91, 0x11, 0x04, 0x26,
-             0xe8, 0x04, 0x55, 0xa8,
-             0x1f, 0x0c, 0x98, 0xf1,
-             0x0b, 0xfc, 0xf0, 0x04,
-             0xbc, 0xf4, 0xf6, 0x80,
-             0xc1, 0x53, 0xfd, 0x64,
-             0xfa, 0x04, 0x5e, 0x65,
-             0xec, 0x10, 0x0c, 0xf0,
-             0x74, 0x1c, 0x5e, 0x60,
-             0xbc, 0x6e, 0x88, 0x61,
-             0xfe, 0x84, 0x07, 0xfc,
-             0xf8, 0x04, 0x17, 0x0c,
-             0xec, 0x50, 0x1e, 0xf0,
-             0x81, 0x93, 0x81, 0x83,
-             0x00, 0x1c, 0xc1, 0x83,
-             0x40, 0x00, 0xe2, 0xc0,
-             0x03, 0x46, 0x7f, 0x00,
-             0x84, 0x0e, 0xe1, 0x94,
-             0xe3, 0x40, 0x00, 0x1c,
-             0x61, 0x4c, 0x0e, 0xc6,
-             0xe1, 0x34, 0x03, 0xc6,
-             0xb3, 0x21, 0x1c, 0x04,
-             0x0d, 0x06, 0x04, 0x14,
-             0x40, 0x21, 0xe1, 0x94,
-             0xc0, 0x2b, 0x6c, 0x1d,
-             0x18, 0x16, 0x84, 0x18,
-             0x52, 0x78, 0x93, 0x11,
-             0x98, 0x08, 0xe8, 0x04,
-             0x82, 0xe5, 0xa7, 0x0b,
-             0x84, 0xa5, 0xa3, 0x0b,
-             0x86, 0x65, 0xa5, 0x0b,
-             0x88, 0x55, 0xa1, 0x0b,
-             0x02, 0x96, 0x1c, 0x04,
-             0x51, 0x98, 0xe0, 0x10,
-             0xc1, 0x83, 0xe8, 0x04,
-             0x83, 0x85, 0xc1, 0x13,
-             0x02, 0x96, 0x1c, 0x04,
-             0x51, 0x18, 0xe0, 0x80,
-             0xc1, 0x83, 0xe8, 0x04,
-             0x83, 0x05, 0xc7, 0x13,
-             0x02, 0x96, 0x1c, 0x04,
-             0x50, 0x98, 0xe0, 0x20,
-             0xc1, 0x83, 0xe8, 0x04,
-             0x81, 0x85, 0xc3, 0x13,
-             0x02, 0x96, 0x1c, 0x04,
-             0x50, 0x18, 0xe0, 0x40,
-             0xc1, 0x83, 0xe8, 0x04,
-             0x81, 0x01, 0xc5, 0x13,
-             0x40, 0xc6, 0x98, 0x06,
-             0x83, 0x11, 0x61, 0x40,
-             0x81, 0x21, 0x00, 0x04,
-             0x80, 0x16, 0xa8, 0xf1,
-             0x1f, 0x0c, 0x80, 0x26,
-             0x0f, 0xfc, 0xf0, 0x04,
-             0xbc, 0xf4, 0xf6, 0x84,
-             0xc1, 0x53, 0xfd, 0x64,
-             0xfa, 0x04, 0x04, 0x4c,
-             0x68, 0x00, 0x5e, 0xe8,
-             0xa1, 0x0b, 0x80, 0x6b,
-             0xc0, 0x00, 0x1d, 0x48,
-             0x63, 0x29, 0x0c, 0x39,
-             0x01, 0x4e, 0x40, 0x2d,
-             0xc0, 0x10, 0x6c, 0xf5,
-             0x63, 0x21, 0x0c, 0x19,
-             0x0c, 0x29, 0xc0, 0x2d,
-             0xc0, 0x2d, 0x63, 0x25,
-             0x61, 0x84, 0x08, 0x34,
-             0x4d, 0x58, 0x82, 0x39,
-             0x82, 0x49, 0x6f, 0xa0,
-             0x1b, 0xf8, 0xa1, 0x0b,
-             0x0c, 0x39, 0xc0, 0x00,
-             0x40, 0x2d, 0x63, 0x39,
-             0x6c, 0xfd, 0x01, 0x0e,
-             0x0c, 0x19, 0xc0, 0x10,
-             0xc0, 0x2d, 0x63, 0x31,
-             0x63, 0x35, 0x0c, 0x29,
-             0x08, 0x34, 0xc0, 0x2d,
-             0x82, 0x39, 0x61, 0x84,
-             0x6f, 0xa0, 0x4c, 0x08,
-             0xa1, 0x0b, 0x82, 0x49,
-             0xc0, 0x00, 0x1a, 0xa8,
-             0x63, 0x49, 0x0c, 0x39,
-             0x41, 0x4e, 0x40, 0x2d,
-             0xc0, 0x10, 0x6d, 0x01,
-             0x63, 0x41, 0x0c, 0x19,
-             0x0c, 0x29, 0xc0, 0x2d,
-             0xc0, 0x2d, 0x63, 0x45,
-             0x61, 0x84, 0x08, 0x34,
-             0x4a, 0xb8, 0x82, 0x39,
-             0x82, 0x49, 0x6f, 0xa0,
-             0x19, 0x58, 0xa1, 0x0b,
-             0x0c, 0x3b, 0xc0, 0x00,
-             0x40, 0x16, 0x69, 0xa9,
-             0x6d, 0x11, 0x00, 0x0e,
-             0x0c, 0x19, 0xc0, 0x10,
-             0xc0, 0x2d, 0x63, 0x59,
-             0x63, 0x5d, 0x0c, 0x29,
-             0x08, 0x34, 0xc0, 0x2d,
-             0x82, 0x39, 0x61, 0x84,
-             0x6f, 0xa0, 0x49, 0x68,
-             0xa1, 0x0b, 0x82, 0x49,
-             0xc0, 0x00, 0x18, 0x08,
-             0x63, 0x71, 0x0c, 0x39,
-             0x40, 0x0e, 0x40, 0x2d,
-             0xc0, 0x10, 0x6d, 0x21,
-             0x63, 0x61, 0x0c, 0x19,
-             0x0c, 0x29, 0xc0, 0x2d,
-             0xc0, 0x2d, 0x63, 0x65,
-             0x61, 0x84, 0x08, 0x34,
-             0x48, 0x18, 0x82, 0x39,
-             0x82, 0x49, 0x6f, 0xa0,
-             0x16, 0xb8, 0xa1, 0x0b,
-             0x0c, 0x39, 0xc0, 0x00,
-             0x40, 0x2d, 0x63, 0xa9,
-             0x6d, 0x49, 0x00, 0x4e,
-             0x0c, 0x19, 0xc0, 0x10,
-             0xc0, 0x2d, 0x63, 0xa1,
-             0x63, 0xa5, 0x0c, 0x29,
-             0x08, 0x34, 0xc0, 0x2d,
-             0x82, 0x39, 0x61, 0x84,
-             0x6f, 0xa0, 0x46, 0xc8,
-             0xa1, 0x0b, 0x82, 0x49,
-             0xc0, 0x00, 0x15, 0x68,
-             0x63, 0xd9, 0x0c, 0x39,
-             0x00, 0x4e, 0x40, 0x2d,
-             0xc0, 0x10, 0x6d, 0x51,
-             0x63, 0xd1, 0x0c, 0x19,
-             0x0c, 0x29, 0xc0, 0x2d,
-             0xc0, 0x2d, 0x63, 0xd5,
-             0x61, 0x84, 0x08, 0x34,
-             0x45, 0x78, 0x82, 0x39,
-             0x82, 0x49, 0x6f, 0xa0,
-             0x14, 0x18, 0xa1, 0x0b,
-             0x0c, 0x39, 0xc0, 0x00,
-             0x40, 0x2d, 0x64, 0x09,
-             0x6d, 0x55, 0x41, 0x8e,
-             0x0c, 0x19, 0xc0, 0x10,
-             0xc0, 0x2d, 0x64, 0x01,
-             0x64, 0x05, 0x0c, 0x29,
-             0x08, 0x34, 0xc0, 0x2d,
-             0x82, 0x39, 0x61, 0x84,
-             0x6f, 0xa0, 0x44, 0x28,
-             0xa1, 0x0b, 0x82, 0x49,
-             0xc0, 0x00, 0x12, 0xc8,
-             0x64, 0x39, 0x0c, 0x39,
-             0x01, 0x8e, 0x40, 0x2d,
-             0xc0, 0x10, 0x6d, 0x65,
-             0x64, 0x31, 0x0c, 0x19,
-             0x0c, 0x29, 0xc0, 0x2d,
-             0xc0, 0x2d, 0x64, 0x35,
-             0x42, 0xf8, 0x82, 0x39,
-             0x86, 0x4b, 0x6f, 0xa0,
-             0x11, 0x98, 0xa1, 0x0b,
-             0x0c, 0x39, 0xc0, 0x00,
-             0x40, 0x2d, 0x64, 0x69,
-             0x6d, 0x6d, 0x00, 0x0e,
-             0x0c, 0x19, 0xc0, 0x10,
-             0xc0, 0x2d, 0x64, 0x61,
-             0x64, 0x65, 0x0c, 0x29,
-             0x08, 0x34, 0xc0, 0x2d,
-             0x82, 0x39, 0x61, 0x84,
-             0x6f, 0xa0, 0x41, 0xa8,
-             0xa1, 0x0b, 0x82, 0x49,
-             0xc0, 0x00, 0x10, 0x48,
-             0x6f, 0xa0, 0x48, 0x28,
-             0x41, 0xf6, 0x81, 0x01,
-             0x83, 0x11, 0x60, 0x3c,
-             0xef, 0xa0, 0x40, 0x68,
-             0x63, 0x29, 0x0c, 0x09,
-             0x02, 0x46, 0x40, 0x2d,
-             0x84, 0x14, 0xe1, 0x38,
-             0x82, 0x09, 0xc7, 0x07,
-             0x02, 0xc6, 0x04, 0x06,
-             0x0c, 0x09, 0xe1, 0x38,
-             0xc0, 0x2d, 0x63, 0x39,
-             0xc7, 0x07, 0x84, 0x14,
-             0x04, 0x06, 0x82, 0x09,
-             0xe1, 0x38, 0x01, 0x46,
-             0x0c, 0x29, 0x80, 0x14,
-             0xc0, 0x2d, 0x63, 0x49,
-             0xc9, 0x27, 0x84, 0x38,
-             0x46, 0x30, 0x82, 0x29,
-             0xa4, 0x3f, 0xf3, 0xf8,
-             0x80, 0x04, 0x84, 0x36,
-             0x63, 0x49, 0x0c, 0x19,
-             0x80, 0x28, 0xc0, 0x2d,
-             0x84, 0x19, 0xc9, 0x17,
-             0xf3, 0xf4, 0x44, 0x20,
-             0x00, 0x26, 0xa2, 0x2f,
-             0xe1, 0x38, 0x40, 0x46,
-             0x0c, 0x2b, 0x80, 0x14,
-             0xc0, 0x16, 0x69, 0xa9,
-             0xcb, 0x27, 0x84, 0x38,
-             0x46, 0x30, 0x82, 0x29,
-             0xa4, 0x3f, 0xf3, 0xf8,
-             0x80, 0x14, 0x84, 0x36,
-             0x69, 0xa9, 0x0c, 0x2b,
-             0x84, 0x38, 0xc0, 0x16,
-             0x84, 0x29, 0xcb, 0x27,
-             0xf3, 0xf4, 0x46, 0x30,
-             0x84, 0x36, 0xa4, 0x3f,
-             0x0c, 0x1b, 0x80, 0x04,
-             0xc0, 0x16, 0x69, 0xa9,
-             0xcb, 0x17, 0x80, 0x28,
-             0x44, 0x20, 0x88, 0x19,
-             0xa2, 0x2f, 0xf3, 0xec,
-             0x41, 0x06, 0x00, 0x26,
-             0x0c, 0x19, 0xe1, 0x38,
-             0xc0, 0x2d, 0x63, 0x69,
-             0x00, 0x16, 0x80, 0x04,
-             0xe1, 0x38, 0x41, 0xc6,
-             0x64, 0xe1, 0x0c, 0x15,
-             0x80, 0x04, 0xc0, 0x0b,
-             0x00, 0x06, 0x00, 0x1e,
-             0x0c, 0x15, 0xe1, 0x3c,
-             0xc0, 0x0b, 0x64, 0xe5,
-             0x00, 0x1e, 0x80, 0x04,
-             0xe1, 0x3c, 0x02, 0x46,
-             0x63, 0xa9, 0x0c, 0x09,
-             0x84, 0x14, 0xc0, 0x2d,
-             0x82, 0x09, 0xc5, 0x07,
-             0x02, 0x86, 0x04, 0x06,
-             0x0c, 0x09, 0xe1, 0x3c,
-             0xc0, 0x2d, 0x63, 0xa9,
-             0xc7, 0x07, 0x84, 0x14,
-             0x04, 0x06, 0x82, 0x09,
-             0xe1, 0x3c, 0x01, 0x46,
-             0x64, 0xed, 0x0c, 0x15,
-             0x80, 0x04, 0xc0, 0x0b,
-             0x01, 0x86, 0x00, 0x1e,
-             0x0c, 0x15, 0xe1, 0x3c,
-             0xc0, 0x0b, 0x64, 0xf1,
-             0x00, 0x1e, 0x80, 0x04,
-             0xe1, 0x3c, 0x03, 0xc6,
-             0x63, 0xd9, 0x0c, 0x09,
-             0x84, 0x14, 0xc0, 0x2d,
-             0x82, 0x09, 0xc5, 0x07,
-             0x42, 0x06, 0x04, 0x06,
-             0x0c, 0x09, 0xe1, 0x3c,
-             0xc0, 0x2d, 0x63, 0xd9,
-             0xc7, 0x07, 0x84, 0x14,
-             0x04, 0x06, 0x82, 0x09,
-             0xe1, 0x3c, 0x40, 0xc6,
-             0x64, 0xf9, 0x0c, 0x15,
-             0x80, 0x04, 0xc0, 0x0b,
-             0x41, 0x06, 0x00, 0x1e,
-             0x0c, 0x15, 0xe1, 0x3c,
-             0xc0, 0x0b, 0x64, 0xfd,
-             0x00, 0x1e, 0x80, 0x04,
-             0xe1, 0x3c, 0x43, 0x46,
-             0x64, 0x09, 0x0c, 0x09,
-             0x84, 0x14, 0xc0, 0x2d,
-             0x82, 0x09, 0xc5, 0x07,
-             0x43, 0x86, 0x04, 0x06,
-             0x0c, 0x09, 0xe1, 0x3c,
-             0xc0, 0x2d, 0x64, 0x09,
-             0xc7, 0x07, 0x84, 0x14,
-             0x04, 0x06, 0x82, 0x09,
-             0xe1, 0x40, 0x00, 0x46,
-             0x65, 0x05, 0x0c, 0x15,
-             0x80, 0x04, 0xc0, 0x0b,
-             0x00, 0x86, 0x00, 0x1e,
-             0x0c, 0x15, 0xe1, 0x40,
-             0xc0, 0x0b, 0x65, 0x09,
-             0x00, 0x1e, 0x80, 0x04,
-             0xe1, 0x40, 0x02, 0xc6,
-             0x64, 0x39, 0x0c, 0x09,
-             0x84, 0x14, 0xc0, 0x2d,
-             0x82, 0x09, 0xc5, 0x07,
-             0x03, 0x06, 0x04, 0x06,
-             0x0c, 0x09, 0xe1, 0x40,
-             0xc0, 0x2d, 0x64, 0x39,
-             0xc7, 0x07, 0x84, 0x14,
-             0x04, 0x06, 0x82, 0x09,
-             0xe1, 0x40, 0x01, 0xc6,
-             0x65, 0x11, 0x0c, 0x15,
-             0x80, 0x04, 0xc0, 0x0b,
-             0x40, 0x06, 0x00, 0x1e,
-             0x0c, 0x15, 0xe1, 0x40,
-             0xc0, 0x0b, 0x65, 0x15,
-             0x00, 0x1e, 0x80, 0x04,
-             0xe1, 0x40, 0x42, 0x46,
-             0x64, 0x69, 0x0c, 0x09,
-             0x84, 0x14, 0xc0, 0x2d,
-             0x82, 0x09, 0xc5, 0x07,
-             0x42, 0x86, 0x04, 0x06,
-             0x0c, 0x09, 0xe1, 0x40,
-             0xc0, 0x2d, 0x64, 0x69,
-             0xc7, 0x07, 0x84, 0x14,
-             0x04, 0x06, 0x82, 0x09,
-             0xe1, 0x34, 0x00, 0x46,
-             0x80, 0x04, 0x80, 0x04,
-             0x84, 0x55, 0xbf, 0x0b,
-             0x6c, 0x1d, 0x0c, 0x29,
-             0x0e, 0xa6, 0x40, 0x2b,
-             0x02, 0xa6, 0xe0, 0x08,
-             0x8c, 0x0b, 0x60, 0x08,
-             0xef, 0xec, 0x66, 0x48,
-             0x0e, 0x06, 0xa3, 0x0b,
-             0x8e, 0x0b, 0xc0, 0x00,
-             0xf2, 0x04, 0x0c, 0x4c,
-             0x81, 0x01, 0xdd, 0x93,
-             0xf2, 0x04, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x0c, 0x09, 0x80, 0x6b,
-             0xc0, 0x2d, 0x63, 0x21,
-             0x63, 0x25, 0x0c, 0x19,
-             0x73, 0xb8, 0xc0, 0x2d,
-             0xa1, 0x0b, 0xef, 0x9c,
-             0x0c, 0x09, 0x94, 0x35,
-             0xc0, 0x2d, 0x63, 0x31,
-             0x63, 0x35, 0x0c, 0x19,
-             0x73, 0x18, 0xc0, 0x2d,
-             0xa1, 0x0b, 0xef, 0x9c,
-             0x0c, 0x09, 0x90, 0xf5,
-             0xc0, 0x2d, 0x63, 0x41,
-             0x63, 0x45, 0x0c, 0x19,
-             0x72, 0x78, 0xc0, 0x2d,
-             0xa1, 0x0b, 0xef, 0x9c,
-             0x0c, 0x09, 0x8e, 0xb5,
-             0xc0, 0x2d, 0x63, 0x59,
-             0x63, 0x5d, 0x0c, 0x19,
-             0x71, 0xd8, 0xc0, 0x2d,
-             0xa1, 0x0b, 0xef, 0x9c,
-             0x0c, 0x09, 0x8c, 0x75,
-             0xc0, 0x2d, 0x63, 0x61,
-             0x63, 0x65, 0x0c, 0x19,
-             0x71, 0x38, 0xc0, 0x2d,
-             0xa1, 0x0b, 0xef, 0x9c,
-             0x0c, 0x09, 0x8a, 0x35,
-             0xc0, 0x2d, 0x63, 0xa1,
-             0x63, 0xa5, 0x0c, 0x19,
-             0x70, 0x98, 0xc0, 0x2d,
-             0xa1, 0x0b, 0xef, 0x9c,
-             0x0c, 0x09, 0x86, 0xf5,
-             0xc0, 0x2d, 0x63, 0xd1,
-             0x63, 0xd5, 0x0c, 0x19,
-             0x6f, 0xf8, 0xc0, 0x2d,
-             0xa1, 0x0b, 0xef, 0x9c,
-             0x0c, 0x09, 0x84, 0xb5,
-             0xc0, 0x2d, 0x64, 0x01,
-             0x64, 0x05, 0x0c, 0x19,
-             0x6f, 0x58, 0xc0, 0x2d,
-             0xa1, 0x0b, 0xef, 0x9c,
-             0x0c, 0x09, 0x82, 0x75,
-             0xc0, 0x2d, 0x64, 0x31,
-             0x64, 0x35, 0x0c, 0x19,
-             0x6e, 0xb8, 0xc0, 0x2d,
-             0xa1, 0x0b, 0xef, 0x9c,
-             0x0c, 0x0c, 0x80, 0x85,
-             0xdd, 0x93, 0xf2, 0x00,
-             0x64, 0x61, 0x0c, 0x09,
-             0x0c, 0x19, 0xc0, 0x2d,
-             0xc0, 0x2d, 0x64, 0x65,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0xff, 0x9c, 0x2d, 0xc8,
-             0xfa, 0x80, 0x00, 0x0c,
-             0x6c, 0x1d, 0x00, 0x29,
-             0x5e, 0x78, 0xc0, 0x2b,
-             0xa3, 0x0b, 0xef, 0xec,
-             0x41, 0xf6, 0x82, 0x55,
-             0x81, 0x11, 0x60, 0x3c,
-             0xef, 0x9c, 0x67, 0xe8,
-             0xf2, 0x80, 0x08, 0x0c,
-             0xff, 0xd8, 0x3b, 0x28,
-             0xf2, 0x80, 0x08, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x0c, 0x04, 0x0c,
-             0x0c, 0x0b, 0x80, 0x6b,
-             0xc0, 0x15, 0x6e, 0x09,
-             0xe0, 0x80, 0x40, 0x0a,
-             0x0c, 0x29, 0x82, 0x35,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x0c, 0x0c, 0x8c, 0x0b,
-             0x1c, 0x78, 0xf2, 0x0c,
-             0x4f, 0xc6, 0xff, 0xec,
-             0x0e, 0x09, 0xef, 0x14,
-             0xc2, 0x09, 0xf8, 0x10,
-             0xf8, 0x10, 0x4e, 0x01,
-             0x6c, 0x21, 0x0c, 0x09,
-             0xa7, 0x0b, 0xc0, 0x2b,
-             0x42, 0x36, 0x8c, 0xf5,
-             0x8c, 0x0b, 0x60, 0x00,
-             0xe8, 0x00, 0x5b, 0x88,
-             0x60, 0x04, 0x42, 0x46,
-             0x4e, 0x58, 0x83, 0x21,
-             0x8c, 0x0b, 0x68, 0x2c,
-             0x81, 0x81, 0x1c, 0x08,
-             0xf3, 0xf8, 0x40, 0x00,
-             0x9c, 0x08, 0x9c, 0x06,
-             0xf3, 0xf4, 0x40, 0x00,
-             0x4e, 0x81, 0x9c, 0x06,
-             0x0c, 0x0b, 0xe0, 0x30,
-             0xc0, 0x15, 0x6e, 0x09,
-             0x73, 0xfd, 0x40, 0x00,
-             0x4c, 0x03, 0xc0, 0xfd,
-             0x40, 0x15, 0x6e, 0x09,
-             0x78, 0x18, 0x8c, 0x0b,
-             0x54, 0x38, 0xe8, 0x18,
-             0x8c, 0x0b, 0x6f, 0xec,
-             0x61, 0x40, 0x41, 0x46,
-             0xe0, 0x00, 0x42, 0x46,
-             0x00, 0x86, 0x80, 0x04,
-             0xe1, 0x44, 0x00, 0x06,
-             0x00, 0x86, 0x80, 0x04,
-             0x58, 0xb8, 0x8c, 0x0b,
-             0x0c, 0x0c, 0xe8, 0x00,
-             0x35, 0xb8, 0xf2, 0x0c,
-             0x42, 0x56, 0xff, 0xd8,
-             0x8c, 0x0b, 0x60, 0x00,
-             0xe8, 0x00, 0x58, 0x28,
-             0x6e, 0x09, 0x0c, 0x0b,
-             0x02, 0x06, 0x40, 0x15,
-             0xff, 0xc0, 0x60, 0x01,
-             0xfc, 0x98, 0x00, 0x04,
-             0x6e, 0x09, 0x4c, 0x03,
-             0x41, 0xc6, 0x40, 0x15,
-             0xc0, 0x20, 0x72, 0xfd,
-             0x02, 0x0f, 0x80, 0x04,
-             0x72, 0xc1, 0x02, 0x06,
-             0x00, 0x04, 0xc0, 0x20,
-             0x04, 0x0e, 0xfc, 0xc4,
-             0x72, 0xc1, 0x02, 0x06,
-             0x8c, 0x0b, 0xc0, 0x20,
-             0xf2, 0x0c, 0x0c, 0x0c,
-             0xff, 0xd8, 0x34, 0x28,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x82, 0x25, 0xa1, 0x1b,
-             0x6f, 0x9c, 0x5f, 0xa8,
-             0x40, 0x06, 0x83, 0x11,
-             0x0c, 0x0c, 0xfa, 0x02,
-             0xdd, 0x93, 0xf2, 0x00,
-             0x7a, 0x02, 0x4c, 0x06,
-             0xe0, 0x3c, 0x41, 0xf6,
-             0x6f, 0x9c, 0x5e, 0xe8,
-             0x8c, 0x0b, 0x81, 0x11,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x7c, 0x04, 0x4c,
-             0x12, 0x06, 0x00, 0x6b,
-             0x55, 0xc6, 0xe0, 0x08,
-             0x56, 0x46, 0x61, 0x10,
-             0x51, 0x06, 0xe1, 0x10,
-             0x81, 0x01, 0x61, 0x38,
-             0x81, 0x71, 0x09, 0x95,
-             0x6c, 0x1d, 0x4c, 0x91,
-             0x8c, 0x0b, 0x40, 0x2b,
-             0xe8, 0x00, 0x44, 0x88,
-             0x14, 0x15, 0xa1, 0x0b,
-             0x02, 0x19, 0xc0, 0x00,
-             0x8e, 0x75, 0xc0, 0x00,
-             0x68, 0x00, 0x48, 0xc8,
-             0x28, 0x14, 0x8c, 0x0b,
-             0x84, 0x18, 0xa1, 0x0b,
-             0x42, 0x0a, 0x8c, 0x95,
-             0x8c, 0x25, 0xe0, 0x84,
-             0x8e, 0x1b, 0x0c, 0x0b,
-             0xe8, 0x00, 0x4d, 0x08,
-             0xe0, 0xc8, 0x00, 0x0a,
-             0x5c, 0x38, 0x8a, 0xb5,
-             0x2c, 0x04, 0xe8, 0x18,
-             0x83, 0x21, 0x81, 0x11,
-             0x95, 0x11, 0x00, 0x16,
-             0x68, 0x2c, 0x44, 0xa8,
-             0x2c, 0x04, 0x8c, 0x0b,
-             0x80, 0x16, 0x83, 0x11,
-             0x80, 0x08, 0xa8, 0x04,
-             0xe0, 0x84, 0x40, 0x4a,
-             0x40, 0x00, 0x16, 0x05,
-             0xc0, 0x00, 0x02, 0x06,
-             0xc0, 0x00, 0x40, 0x11,
-             0x80, 0x18, 0xa0, 0x04,
-             0xf3, 0xdc, 0x42, 0x10,
-             0xa0, 0x04, 0x80, 0x16,
-             0x42, 0x10, 0x80, 0x18,
-             0x00, 0x16, 0xf3, 0xbc,
-             0xe1, 0x10, 0x00, 0x46,
-             0x80, 0x18, 0x80, 0x04,
-             0x00, 0x16, 0xc2, 0x19,
-             0xe0, 0x00, 0x41, 0x26,
-             0xe8, 0x7d, 0x82, 0x71,
-             0x0c, 0x4c, 0xee, 0x05,
-             0xdd, 0x93, 0xf2, 0x7c,
-             0xfa, 0x0c, 0x04, 0x0c,
-             0x6f, 0xec, 0x7d, 0xe8,
-             0x0e, 0x16, 0x80, 0x6b,
-             0x42, 0xc6, 0x60, 0x08,
-             0x4c, 0x71, 0xe0, 0x10,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x41, 0x58, 0x81, 0x21,
-             0x8c, 0x0b, 0x68, 0x2c,
-             0x61, 0x40, 0x41, 0x46,
-             0xe1, 0x24, 0x11, 0x86,
-             0xa0, 0x14, 0x80, 0x04,
-             0x84, 0x38, 0x80, 0x28,
-             0xe0, 0x80, 0x46, 0x4a,
-             0x44, 0x4a, 0x84, 0x65,
-             0xfe, 0x25, 0xe0, 0x8c,
-             0xef, 0xec, 0x7d, 0x28,
-             0x6c, 0x1d, 0x0c, 0x29,
-             0x02, 0x16, 0x40, 0x2b,
-             0x4c, 0x98, 0xe0, 0x08,
-             0x8c, 0x0b, 0x6f, 0xec,
-             0x80, 0x95, 0xa3, 0x0b,
-             0xe8, 0x2c, 0x46, 0x68,
-             0x46, 0x38, 0x81, 0x95,
-             0xa0, 0x04, 0xe8, 0x2c,
-             0x40, 0x0a, 0x80, 0x08,
-             0x80, 0xd5, 0xe0, 0x84,
-             0x8e, 0x0b, 0x81, 0x71,
-             0xf2, 0x0c, 0x0c, 0x0c,
-             0x7b, 0x78, 0xdd, 0x93,
-             0x0c, 0x29, 0xef, 0xec,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0xe0, 0x08, 0x0e, 0x26,
-             0x60, 0x08, 0x02, 0x26,
-             0x4a, 0xb8, 0x8c, 0x0b,
-             0xa3, 0x0b, 0xef, 0xec,
-             0xc0, 0x00, 0x0e, 0x06,
-             0x0c, 0x0c, 0x8e, 0x0b,
-             0xdd, 0x93, 0xf2, 0x0c,
-             0xfa, 0x0c, 0x04, 0x0c,
-             0x6f, 0xec, 0x79, 0x28,
-             0x00, 0x26, 0x80, 0x6b,
-             0x42, 0x86, 0x60, 0x08,
-             0x4c, 0x01, 0xe0, 0x3c,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x7c, 0x98, 0x81, 0x21,
-             0x8c, 0x0b, 0x68, 0x28,
-             0x61, 0x40, 0x41, 0x46,
-             0xe1, 0x24, 0x11, 0x46,
-             0xa0, 0x14, 0x80, 0x04,
-             0x84, 0x38, 0x80, 0x28,
-             0xe0, 0x80, 0x46, 0x4a,
-             0x44, 0x4a, 0x84, 0xa5,
-             0xfe, 0x25, 0xe0, 0x8c,
-             0xef, 0xec, 0x78, 0x68,
-             0x6c, 0x1d, 0x0c, 0x29,
-             0x0e, 0x46, 0x40, 0x2b,
-             0x02, 0x46, 0xe0, 0x08,
-             0x8c, 0x0b, 0x60, 0x08,
-             0xef, 0xec, 0x47, 0xa8,
-             0x80, 0x95, 0xa3, 0x0b,
-             0xe8, 0x2c, 0x41, 0x88,
-             0x41, 0x58, 0x83, 0x75,
-             0xa0, 0x04, 0xe8, 0x2c,
-             0x40, 0x0a, 0x80, 0x08,
-             0x82, 0xe5, 0xe0, 0x84,
-             0xef, 0xec, 0x76, 0xe8,
-             0x6c, 0x1d, 0x0c, 0x29,
-             0x0e, 0x56, 0x40, 0x2b,
-             0x02, 0x56, 0xe0, 0x08,
-             0x8c, 0x0b, 0x60, 0x08,
-             0xef, 0xec, 0x46, 0x28,
-             0x80, 0x45, 0xa3, 0x0b,
-             0x41, 0x06, 0x81, 0x71,
-             0x80, 0x04, 0xe1, 0x38,
-             0xd0, 0x19, 0x80, 0x18,
-             0x8e, 0x0b, 0x00, 0x16,
-             0xf2, 0x0c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x1c, 0x04, 0x4c,
-             0x80, 0x6b, 0x02, 0x7b,
-             0xef, 0xec, 0x74, 0x08,
-             0x60, 0x08, 0x00, 0x36,
-             0xe0, 0x04, 0x42, 0x26,
-             0x6c, 0x1d, 0x4c, 0x01,
-             0x81, 0x21, 0x40, 0x2b,
-             0x68, 0x28, 0x77, 0x88,
-             0x41, 0x46, 0x8c, 0x0b,
-             0x13, 0xc6, 0x61, 0x40,
-             0x80, 0x04, 0xe1, 0x24,
-             0x80, 0x28, 0xa4, 0x14,
-             0x46, 0x4a, 0x84, 0x38,
-             0x84, 0xa5, 0xe0, 0x80,
-             0xe0, 0x8c, 0x44, 0x4a,
-             0x73, 0x58, 0xfe, 0x25,
-             0x0c, 0x29, 0xef, 0xec,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0xe0, 0x08, 0x10, 0x66,
-             0x60, 0x08, 0x02, 0x66,
-             0x42, 0x98, 0x8c, 0x0b,
-             0xa3, 0x0b, 0xef, 0xec,
-             0x7c, 0x78, 0x80, 0x95,
-             0x81, 0xe5, 0xe8, 0x28,
-             0xe8, 0x28, 0x7c, 0x48,
-             0x80, 0x08, 0xa4, 0x04,
-             0xe0, 0x84, 0x40, 0x0a,
-             0x10, 0x06, 0x00, 0xe5,
-             0x69, 0x7d, 0x80, 0x00,
-             0xe0, 0x00, 0x51, 0x26,
-             0x90, 0x0b, 0x80, 0xa5,
-             0xf2, 0x1c, 0x0c, 0x4c,
-             0x71, 0x38, 0xdd, 0x93,
-             0x0c, 0x29, 0xef, 0xec,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0xe0, 0x08, 0x0e, 0x76,
-             0x60, 0x08, 0x02, 0x76,
-             0x40, 0x78, 0x8c, 0x0b,
-             0xa3, 0x0b, 0xef, 0xec,
-             0xc0, 0x00, 0x0e, 0x06,
-             0x0c, 0x4c, 0x8e, 0x0b,
-             0xdd, 0x93, 0xf2, 0x1c,
-             0x6f, 0xa5, 0x00, 0x25,
-             0xa1, 0x2b, 0xc0, 0x0b,
-             0x9a, 0x00, 0x5c, 0x08,
-             0xe0, 0x6c, 0x02, 0x0a,
-             0x04, 0xcd, 0x00, 0x25,
-             0x9a, 0xa5, 0x80, 0x05,
-             0x00, 0x25, 0xa5, 0x1b,
-             0x80, 0x0b, 0x0a, 0x0d,
-             0x84, 0x04, 0x04, 0x20,
-             0x0a, 0x0d, 0x40, 0x25,
-             0x98, 0xc5, 0x80, 0x0b,
-             0x00, 0x25, 0xa7, 0x1b,
-             0x80, 0x0b, 0x0a, 0x15,
-             0x84, 0x04, 0x04, 0x20,
-             0x0a, 0x15, 0x40, 0x25,
-             0x96, 0x85, 0x80, 0x0b,
-             0x00, 0x25, 0xa9, 0x1b,
-             0x80, 0x0b, 0x0a, 0x11,
-             0x84, 0x04, 0x04, 0x20,
-             0x0a, 0x11, 0x40, 0x25,
-             0x94, 0x45, 0x80, 0x0b,
-             0x00, 0x25, 0xab, 0x1b,
-             0x80, 0x0b, 0x0a, 0x19,
-             0x84, 0x04, 0x04, 0x20,
-             0x0a, 0x19, 0x40, 0x25,
-             0x92, 0x05, 0x80, 0x0b,
-             0x00, 0x25, 0xad, 0x1b,
-             0x80, 0x0b, 0x0a, 0x1d,
-             0x84, 0x04, 0x04, 0x20,
-             0x0a, 0x1d, 0x40, 0x25,
-             0x8e, 0xc5, 0x80, 0x0b,
-             0x00, 0x25, 0xaf, 0x1b,
-             0x80, 0x0b, 0x0a, 0x21,
-             0x84, 0x04, 0x04, 0x20,
-             0x0a, 0x21, 0x40, 0x25,
-             0x8c, 0x85, 0x80, 0x0b,
-             0x00, 0x25, 0xb1, 0x1b,
-             0x80, 0x0b, 0x0a, 0x25,
-             0x84, 0x04, 0x04, 0x20,
-             0x0a, 0x25, 0x40, 0x25,
-             0x8a, 0x45, 0x80, 0x0b,
-             0x00, 0x25, 0xb3, 0x1b,
-             0x80, 0x0b, 0x0a, 0x29,
-             0x84, 0x04, 0x04, 0x20,
-             0x0a, 0x29, 0x40, 0x25,
-             0x88, 0x05, 0x80, 0x0b,
-             0x86, 0xc5, 0xb5, 0x1b,
-             0x00, 0x25, 0xb7, 0x1b,
-             0x80, 0x0b, 0x0a, 0x2d,
-             0x84, 0x04, 0x04, 0x20,
-             0x0a, 0x2d, 0x40, 0x25,
-             0x84, 0x85, 0x80, 0x0b,
-             0x00, 0x25, 0xa3, 0x1b,
-             0x80, 0x0b, 0x0a, 0x09,
-             0x84, 0x04, 0x04, 0x20,
-             0x0a, 0x09, 0x40, 0x25,
-             0x82, 0x45, 0x80, 0x0b,
-             0xfc, 0x04, 0x44, 0x10,
-             0xe0, 0x74, 0x04, 0x0a,
-             0x83, 0x21, 0x80, 0xb5,
-             0x6a, 0x31, 0x40, 0x25,
-             0x00, 0x25, 0xc0, 0x0b,
-             0x40, 0x0b, 0x6a, 0x01,
-             0x64, 0x01, 0x06, 0x00,
-             0xc6, 0x27, 0xc0, 0xba,
-             0x44, 0x86, 0x04, 0x33,
-             0x46, 0x15, 0xe0, 0x00,
-             0x42, 0x06, 0xe0, 0x34,
-             0x46, 0x15, 0xfc, 0x06,
-             0x00, 0x15, 0xe0, 0x38,
-             0xc0, 0x0b, 0x6a, 0x01,
-             0x44, 0x1a, 0x82, 0x11,
-             0x40, 0x15, 0xe1, 0x0a,
-             0xc0, 0x0b, 0x6a, 0x01,
-             0x00, 0x15, 0xa1, 0x2b,
-             0x00, 0x0b, 0x0a, 0x05,
-             0x80, 0x00, 0x04, 0x06,
-             0x0a, 0x01, 0x40, 0x25,
-             0x02, 0x10, 0x80, 0x0b,
-             0x40, 0x15, 0x84, 0x04,
-             0x80, 0x0b, 0x0a, 0x05,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x6f, 0xa5, 0x00, 0x25,
-             0xa1, 0x2b, 0xc0, 0x0b,
-             0x9a, 0x00, 0x5c, 0x08,
-             0x6b, 0x75, 0x00, 0x25,
-             0x06, 0x00, 0x40, 0x0b,
-             0xc0, 0xbb, 0x65, 0xd1,
-             0xe0, 0x00, 0x4a, 0x86,
-             0x86, 0x23, 0xc6, 0x27,
-             0x46, 0x06, 0xc8, 0x1e,
-             0x00, 0x45, 0xfc, 0x06,
-             0xc0, 0x0b, 0x6b, 0x75,
-             0x98, 0x21, 0x4a, 0x3e,
-             0x4a, 0x4a, 0x82, 0x41,
-             0x40, 0x45, 0xe1, 0x16,
-             0xc0, 0x0b, 0x6b, 0x75,
-             0x00, 0x35, 0xa1, 0x5b,
-             0x00, 0x0b, 0x0b, 0x79,
-             0x80, 0x00, 0x08, 0x06,
-             0x0b, 0x75, 0x40, 0x45,
-             0x06, 0x30, 0x80, 0x0b,
-             0x40, 0x35, 0x84, 0x04,
-             0x00, 0x0b, 0x0b, 0x79,
-             0xf0, 0x24, 0x02, 0x0a,
-             0x02, 0x0a, 0x98, 0xa5,
-             0x88, 0xc5, 0xf0, 0x04,
-             0xf0, 0x08, 0x02, 0x0a,
-             0x02, 0x0a, 0x9a, 0x65,
-             0x8a, 0x85, 0xf0, 0x0c,
-             0xf0, 0x10, 0x02, 0x0a,
-             0x02, 0x0a, 0x9c, 0x25,
-             0x9e, 0x45, 0xf0, 0x14,
-             0xf0, 0x18, 0x02, 0x0a,
-             0x02, 0x0a, 0x8a, 0xe5,
-             0x8e, 0x05, 0xf0, 0x1c,
-             0xf0, 0x20, 0x02, 0x0a,
-             0x02, 0x0a, 0x90, 0x25,
-             0x5c, 0x08, 0xf0, 0x00,
-             0x00, 0x15, 0xda, 0x00,
-             0xc0, 0x0b, 0x6c, 0xbd,
-             0x82, 0x11, 0x88, 0x24,
-             0x6c, 0xbd, 0x40, 0x15,
-             0x40, 0x25, 0xc0, 0x0b,
-             0xc0, 0x0b, 0x6c, 0xe5,
-             0x00, 0x15, 0xdd, 0x93,
-             0xc0, 0x0b, 0x6c, 0xc1,
-             0x40, 0x15, 0x82, 0x11,
-             0xc0, 0x0b, 0x6c, 0xc1,
-             0x40, 0x15, 0x88, 0x14,
-             0xc0, 0x0b, 0x6c, 0xe9,
-             0x00, 0x15, 0xdd, 0x93,
-             0xc0, 0x0b, 0x6c, 0xc9,
-             0x40, 0x15, 0x82, 0x11,
-             0xc0, 0x0b, 0x6c, 0xc9,
-             0x40, 0x15, 0x88, 0x14,
-             0xc0, 0x0b, 0x6c, 0xf1,
-             0x00, 0x15, 0xdd, 0x93,
-             0xc0, 0x0b, 0x6c, 0xd5,
-             0x82, 0x11, 0x88, 0x24,
-             0x6c, 0xd5, 0x40, 0x15,
-             0x40, 0x25, 0xc0, 0x0b,
-             0xc0, 0x0b, 0x6c, 0xfd,
-             0x00, 0x15, 0xdd, 0x93,
-             0xc0, 0x0b, 0x6c, 0xd9,
-             0x40, 0x15, 0x82, 0x11,
-             0xc0, 0x0b, 0x6c, 0xd9,
-             0x40, 0x15, 0x88, 0x14,
-             0xc0, 0x0b, 0x6d, 0x01,
-             0x00, 0x15, 0xdd, 0x93,
-             0xc0, 0x0b, 0x6c, 0xdd,
-             0x82, 0x11, 0x88, 0x24,
-             0x6c, 0xdd, 0x40, 0x15,
-             0x40, 0x25, 0xc0, 0x0b,
-             0xc0, 0x0b, 0x6d, 0x05,
-             0x00, 0x15, 0xdd, 0x93,
-             0xc0, 0x0b, 0x6c, 0xe1,
-             0x40, 0x15, 0x82, 0x11,
-             0xc0, 0x0b, 0x6c, 0xe1,
-             0x40, 0x15, 0x88, 0x14,
-             0xc0, 0x0b, 0x6d, 0x09,
-             0x00, 0x15, 0xdd, 0x93,
-             0xc0, 0x0b, 0x6c, 0xc5,
-             0x82, 0x11, 0x88, 0x24,
-             0x6c, 0xc5, 0x40, 0x15,
-             0x40, 0x25, 0xc0, 0x0b,
-             0xc0, 0x0b, 0x6c, 0xed,
-             0x00, 0x15, 0xdd, 0x93,
-             0xc0, 0x0b, 0x6c, 0xcd,
-             0x82, 0x11, 0x88, 0x24,
-             0x6c, 0xcd, 0x40, 0x15,
-             0x40, 0x25, 0xc0, 0x0b,
-             0xc0, 0x0b, 0x6c, 0xf5,
-             0x00, 0x35, 0xdd, 0x93,
-             0x40, 0x0b, 0x6c, 0xd1,
-             0x60, 0x15, 0x02, 0x0a,
-             0x82, 0x31, 0xc0, 0x08,
-             0x6c, 0xd1, 0x40, 0x35,
-             0x88, 0x34, 0xc0, 0x0b,
-             0x6c, 0xf9, 0x40, 0x35,
-             0x84, 0x45, 0xc0, 0x0b,
-             0x60, 0x15, 0x02, 0x0a,
-             0x5c, 0x08, 0xc0, 0x04,
-             0x00, 0x15, 0xda, 0x00,
-             0xc0, 0x0b, 0x6d, 0x0d,
-             0x82, 0x11, 0x88, 0x24,
-             0x6d, 0x0d, 0x40, 0x15,
-             0x40, 0x25, 0xc0, 0x0b,
-             0xc0, 0x0b, 0x6d, 0x15,
-             0x00, 0x15, 0xdd, 0x93,
-             0xc0, 0x0b, 0x6d, 0x11,
-             0x40, 0x15, 0x82, 0x11,
-             0xc0, 0x0b, 0x6d, 0x11,
-             0x40, 0x15, 0x88, 0x14,
-             0xc0, 0x0b, 0x6d, 0x19,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x6f, 0xa5, 0x00, 0x25,
-             0xa1, 0x2b, 0xc0, 0x0b,
-             0x9a, 0x00, 0x5c, 0x08,
-             0x6d, 0x1d, 0x00, 0x35,
-             0x08, 0x00, 0x40, 0x0b,
-             0xc0, 0xbd, 0x64, 0x71,
-             0x6d, 0x25, 0x00, 0x25,
-             0xc6, 0x37, 0xc0, 0x0b,
-             0x86, 0x43, 0x02, 0x21,
-             0x6d, 0x25, 0x40, 0x25,
-             0xa9, 0x21, 0x40, 0x0b,
-             0x42, 0x06, 0xd2, 0x1e,
-             0x48, 0x15, 0xfc, 0x06,
-             0x00, 0x15, 0xe0, 0x10,
-             0xc0, 0x0b, 0x6d, 0x1d,
-             0x44, 0x1a, 0x82, 0x11,
-             0x40, 0x15, 0xe1, 0x0a,
-             0xc0, 0x0b, 0x6d, 0x1d,
-             0x00, 0x15, 0xa1, 0x2b,
-             0x00, 0x0b, 0x0d, 0x21,
-             0x80, 0x00, 0x04, 0x06,
-             0x0d, 0x1d, 0x40, 0x25,
-             0x02, 0x10, 0x80, 0x0b,
-             0x40, 0x15, 0x84, 0x04,
-             0x80, 0x0b, 0x0d, 0x21,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x04, 0x04, 0x4c,
-             0x0c, 0x05, 0x80, 0x6b,
-             0xc0, 0x0b, 0x6f, 0xa5,
-             0x8a, 0xa5, 0xa1, 0x0b,
-             0x6d, 0xe9, 0x0c, 0x05,
-             0xa9, 0x21, 0x40, 0x0b,
-             0x66, 0x8a, 0x44, 0x0a,
-             0xe0, 0x88, 0x06, 0x04,
-             0xf0, 0x8c, 0x4e, 0x62,
-             0x00, 0x20, 0x8c, 0x23,
-             0x40, 0xbd, 0x67, 0xc1,
-             0x63, 0x18, 0xa9, 0x21,
-             0x40, 0x06, 0xef, 0x94,
-             0x4e, 0x05, 0xfc, 0x06,
-             0xc0, 0x0b, 0x6d, 0xc9,
-             0x6d, 0xe9, 0x0c, 0x05,
-             0x82, 0x01, 0xc0, 0x0b,
-             0x6d, 0xe9, 0x4c, 0x05,
-             0x00, 0x4a, 0x40, 0x0b,
-             0x0c, 0x05, 0xf8, 0x1c,
-             0x40, 0x0b, 0x0d, 0xed,
-             0xc0, 0x00, 0x02, 0x06,
-             0x0d, 0xe9, 0x4c, 0x15,
-             0x00, 0x00, 0xc0, 0x0b,
-             0x4c, 0x05, 0xc4, 0x04,
-             0xc0, 0x0b, 0x0d, 0xed,
-             0xf2, 0x04, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x6f, 0xa5, 0x00, 0x25,
-             0xa1, 0x2b, 0xc0, 0x0b,
-             0x9a, 0x00, 0x5c, 0x08,
-             0x6e, 0xb1, 0x00, 0x25,
-             0x86, 0x3a, 0xc0, 0x0b,
-             0xf0, 0x08, 0x02, 0x4b,
-             0x18, 0x24, 0x06, 0x5a,
-             0x04, 0x1a, 0xe0, 0x8c,
-             0x00, 0xc3, 0xc4, 0x27,
-             0x58, 0x53, 0x80, 0x23,
-             0xc0, 0x17, 0x6d, 0x7d,
-             0x6d, 0x79, 0x58, 0x13,
-             0x58, 0x33, 0xc0, 0x17,
-             0xc0, 0x17, 0x6d, 0x75,
-             0x6d, 0x71, 0x58, 0x43,
-             0x42, 0x06, 0xc0, 0x17,
-             0x44, 0x15, 0xfc, 0x06,
-             0xc0, 0x0b, 0x6e, 0x91,
-             0x6e, 0xb1, 0x00, 0x15,
-             0x82, 0x11, 0xc0, 0x0b,
-             0x6e, 0xb1, 0x40, 0x15,
-             0x02, 0x4a, 0x40, 0x0b,
-             0x00, 0x15, 0xf8, 0x1c,
-             0x40, 0x0b, 0x0e, 0xb5,
-             0xc0, 0x00, 0x04, 0x06,
-             0x0e, 0xb1, 0x40, 0x25,
-             0x02, 0x10, 0xc0, 0x0b,
-             0x40, 0x15, 0xc4, 0x04,
-             0xc0, 0x0b, 0x0e, 0xb5,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x6f, 0xa5, 0x00, 0x25,
-             0xa1, 0x2b, 0xc0, 0x0b,
-             0x9a, 0x00, 0x5c, 0x08,
-             0x6f, 0x19, 0x00, 0x25,
-             0xc6, 0x34, 0xc0, 0x0b,
-             0x60, 0x90, 0x08, 0x24,
-             0x00, 0x43, 0xc4, 0x27,
-             0x48, 0x35, 0x80, 0x23,
-             0xc0, 0x0b, 0x6f, 0x2d,
-             0x48, 0x35, 0xc4, 0x34,
-             0xc0, 0x0b, 0x6f, 0x29,
-             0x48, 0x35, 0x86, 0x34,
-             0xc0, 0x0b, 0x6f, 0x25,
-             0x48, 0x15, 0x84, 0x14,
-             0xc0, 0x0b, 0x6f, 0x21,
-             0xfc, 0x06, 0x42, 0x06,
-             0x6e, 0xf9, 0x44, 0x15,
-             0x00, 0x15, 0xc0, 0x0b,
-             0xc0, 0x0b, 0x6f, 0x19,
-             0x40, 0x15, 0x82, 0x11,
-             0x40, 0x0b, 0x6f, 0x19,
-             0xf8, 0x1c, 0x02, 0x4a,
-             0x0f, 0x1d, 0x00, 0x15,
-             0x04, 0x06, 0x40, 0x0b,
-             0x40, 0x25, 0xc0, 0x00,
-             0xc0, 0x0b, 0x0f, 0x19,
-             0xc4, 0x04, 0x02, 0x10,
-             0x0f, 0x1d, 0x40, 0x15,
-             0xdd, 0x93, 0xc0, 0x0b,
-             0xfa, 0x0c, 0x04, 0x0c,
-             0x61, 0x4c, 0x0c, 0xc6,
-             0xe1, 0x90, 0x42, 0x86,
-             0x81, 0x21, 0x18, 0x04,
-             0x6d, 0x54, 0x06, 0x06,
-             0xe1, 0x00, 0x0a, 0xc6,
-             0x42, 0xc6, 0x04, 0x0c,
-             0x04, 0x2e, 0xe1, 0x90,
-             0xe1, 0x90, 0x43, 0x06,
-             0x03, 0x86, 0x04, 0x2e,
-             0x40, 0x25, 0xe1, 0x9c,
-             0x40, 0x0b, 0x6f, 0xa9,
-             0xe1, 0x00, 0x00, 0x46,
-             0x04, 0x86, 0x00, 0x1e,
-             0x08, 0x3e, 0xe1, 0x00,
-             0x66, 0xa1, 0x08, 0x10,
-             0x02, 0x10, 0xc0, 0xbf,
-             0x40, 0xb9, 0x67, 0xf1,
-             0xe1, 0x00, 0x05, 0x06,
-             0x94, 0x4e, 0x98, 0x04,
-             0x7a, 0x78, 0x88, 0x1e,
-             0x18, 0x04, 0xef, 0xf0,
-             0x40, 0x71, 0xb5, 0x71,
-             0xc0, 0x2b, 0x6c, 0x1d,
-             0xef, 0xf4, 0x4e, 0x88,
-             0x02, 0x06, 0x18, 0x04,
-             0x84, 0x0e, 0xe1, 0x94,
-             0xe8, 0x28, 0x40, 0xc8,
-             0x04, 0xc6, 0x18, 0x14,
-             0x88, 0x0e, 0xe1, 0x94,
-             0x68, 0x28, 0x40, 0xa8,
-             0x43, 0xc6, 0x82, 0x0b,
-             0x04, 0x0e, 0xe1, 0x90,
-             0xe0, 0x3c, 0x41, 0xf6,
-             0x6f, 0x98, 0x5e, 0xe8,
-             0x00, 0x1c, 0x81, 0x11,
-             0x51, 0x46, 0xe2, 0xc0,
-             0xc0, 0x00, 0x61, 0x91,
-             0x01, 0x86, 0x20, 0x0e,
-             0x4e, 0xf8, 0xe1, 0x94,
-             0xa0, 0x04, 0xef, 0x98,
-             0xe3, 0x40, 0x00, 0x1c,
-             0x60, 0x3c, 0x41, 0xf6,
-             0x5d, 0xb8, 0x83, 0x11,
-             0x83, 0x81, 0x6f, 0x98,
-             0x43, 0x86, 0x18, 0x04,
-             0xc4, 0x80, 0x60, 0x15,
-             0x69, 0xfd, 0x40, 0x15,
-             0x03, 0x96, 0x40, 0x0b,
-             0xd9, 0x84, 0x63, 0x09,
-             0x6c, 0x1d, 0x40, 0x71,
-             0x40, 0x15, 0xc0, 0x2b,
-             0xc0, 0x0b, 0x6f, 0xa1,
-             0x6f, 0xa5, 0x40, 0x85,
-             0x40, 0x58, 0xc0, 0x0b,
-             0x98, 0x04, 0xe8, 0x00,
-             0xc1, 0xc3, 0xff, 0xd5,
-             0xfa, 0x0c, 0x04, 0x0c,
-             0x41, 0xf6, 0x00, 0x7b,
-             0x5b, 0xb8, 0xe0, 0x3c,
-             0x81, 0x11, 0x6f, 0x98,
-             0x09, 0x01, 0x81, 0x61,
-             0x4e, 0x01, 0xb7, 0x11,
-             0x40, 0x2b, 0x6c, 0x19,
-             0x4e, 0x11, 0x8e, 0x0b,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x51, 0x18, 0x83, 0x11,
-             0x0e, 0x0b, 0xef, 0xfc,
-             0xc0, 0x15, 0x6e, 0x09,
-             0xe0, 0x98, 0x40, 0x4a,
-             0x0e, 0x19, 0x82, 0xe5,
-             0xc0, 0x2b, 0x64, 0xc5,
-             0x8a, 0xf5, 0xa7, 0x1b,
-             0xef, 0x14, 0x42, 0x06,
-             0x42, 0x0a, 0x84, 0x18,
-             0x8a, 0x25, 0xe0, 0x80,
-             0xe0, 0x80, 0x40, 0x0a,
-             0x05, 0x11, 0x88, 0xc5,
-             0x4f, 0x98, 0x8e, 0x0b,
-             0x4f, 0x98, 0xef, 0xfc,
-             0xa1, 0x0b, 0xe8, 0x08,
-             0x4f, 0xb8, 0x80, 0xb5,
-             0x8e, 0x0b, 0x68, 0x08,
-             0x0e, 0x0b, 0x80, 0x6b,
-             0x40, 0x15, 0x6e, 0x09,
-             0x40, 0x00, 0x83, 0x11,
-             0xc0, 0xff, 0x72, 0xfd,
-             0x6e, 0x09, 0x4e, 0x03,
-             0x41, 0xf6, 0x40, 0x15,
-             0x57, 0xf8, 0xe0, 0x3c,
-             0xa1, 0x6b, 0xef, 0x98,
-             0x07, 0x11, 0x9c, 0x35,
-             0x4d, 0xd8, 0x8e, 0x0b,
-             0x74, 0x38, 0xef, 0xfc,
-             0x8e, 0x0b, 0x6f, 0xd4,
-             0x80, 0x6b, 0x0d, 0x95,
-             0x8e, 0x0b, 0x09, 0x11,
-             0xef, 0xfc, 0x4d, 0x48,
-             0x64, 0xd5, 0x0e, 0x09,
-             0xa7, 0x0b, 0xc0, 0x2b,
-             0x50, 0x06, 0x92, 0xd5,
-             0xa0, 0x08, 0xef, 0x14,
-             0xf8, 0xc0, 0x00, 0x0a,
-             0xa0, 0x08, 0x80, 0xe5,
-             0xf0, 0xc0, 0x40, 0x00,
-             0xe0, 0x80, 0x00, 0x0a,
-             0x0e, 0x0b, 0x90, 0x55,
-             0xc0, 0x15, 0x6e, 0x09,
-             0xe0, 0x80, 0x40, 0x0a,
-             0x0e, 0x09, 0x8e, 0x05,
-             0xc0, 0x2b, 0x6c, 0x21,
-             0x8c, 0x75, 0xa7, 0x0b,
-             0x40, 0x4a, 0xa0, 0x08,
-             0x8a, 0xe5, 0xe0, 0x8c,
-             0x8e, 0x0b, 0x1b, 0x11,
-             0xef, 0xfc, 0x4b, 0x08,
-             0x6f, 0xd8, 0x59, 0x28,
-             0x1d, 0x11, 0x8e, 0x0b,
-             0x4a, 0x98, 0x8e, 0x0b,
-             0x73, 0x38, 0xef, 0xfc,
-             0x8e, 0x0b, 0x68, 0x14,
-             0x64, 0xcd, 0x0e, 0x05,
-             0xe2, 0x14, 0xc0, 0x05,
-             0x86, 0xe5, 0xc2, 0x0d,
-             0xc8, 0x09, 0xa0, 0x08,
-             0x8e, 0x0b, 0x20, 0x06,
-             0xe8, 0x14, 0x76, 0x48,
-             0x6e, 0x09, 0x0e, 0x0b,
-             0x83, 0x11, 0x40, 0x15,
-             0xfc, 0x98, 0x00, 0x04,
-             0x6e, 0x09, 0x4e, 0x03,
-             0x41, 0xf6, 0x40, 0x15,
-             0x52, 0x98, 0xe0, 0x3c,
-             0x0b, 0x11, 0xef, 0x98,
-             0x48, 0x98, 0x8e, 0x0b,
-             0x5f, 0xb8, 0xef, 0xfc,
-             0x81, 0x55, 0xe8, 0x08,
-             0x8e, 0x0b, 0x1f, 0x11,
-             0xef, 0xfc, 0x48, 0x28,
-             0x60, 0x3c, 0x41, 0xf6,
-             0x51, 0x98, 0x83, 0x11,
-             0x0e, 0x09, 0xef, 0x98,
-             0xc0, 0x2b, 0x6c, 0x11,
-             0xe0, 0x98, 0x40, 0x4a,
-             0x11, 0x11, 0x80, 0xe5,
-             0x47, 0x38, 0x8e, 0x0b,
-             0xc1, 0x83, 0xef, 0xfc,
-             0x41, 0xf6, 0xc3, 0x13,
-             0x83, 0x11, 0x60, 0x3c,
-             0xef, 0x98, 0x50, 0x88,
-             0xfa, 0x80, 0x00, 0x64,
-             0xf2, 0x0c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x6c, 0x19, 0x40, 0x11,
-             0xdd, 0x93, 0xc0, 0x2b,
-             0x6d, 0xed, 0x00, 0x19,
-             0xa3, 0x1b, 0xc0, 0x33,
-             0xda, 0x00, 0x5c, 0x08,
-             0x64, 0xbd, 0x00, 0x15,
-             0xa3, 0x1b, 0xc0, 0x0d,
-             0x00, 0x2b, 0x82, 0xf5,
-             0x40, 0x15, 0x6e, 0x09,
-             0xe1, 0x4c, 0x02, 0x46,
-             0x44, 0x20, 0x84, 0x14,
-             0xc0, 0xff, 0x72, 0xf1,
-             0x6e, 0x09, 0x40, 0x23,
-             0x22, 0x78, 0xc0, 0x15,
-             0xdd, 0x93, 0xff, 0xd4,
-             0xfa, 0x84, 0x04, 0x0c,
-             0x40, 0x06, 0x00, 0x6b,
-             0x00, 0x04, 0xe1, 0x14,
-             0x83, 0x21, 0x83, 0x71,
-             0xc4, 0x19, 0x80, 0x18,
-             0x40, 0x06, 0x00, 0x16,
-             0x00, 0x04, 0xe1, 0x28,
-             0x00, 0x76, 0x85, 0x11,
-             0xe1, 0x28, 0x01, 0x06,
-             0x00, 0x76, 0x80, 0x04,
-             0x76, 0x38, 0x8c, 0x0b,
-             0x01, 0x46, 0xe8, 0x24,
-             0xbd, 0x11, 0x61, 0x28,
-             0x83, 0x21, 0x00, 0x04,
-             0x8c, 0x0b, 0x00, 0x76,
-             0xf2, 0x84, 0x0c, 0x0c,
-             0xe0, 0x24, 0x35, 0x88,
-             0xfa, 0x7c, 0x04, 0x4c,
-             0x40, 0x86, 0x00, 0x8b,
-             0x00, 0x04, 0xe1, 0x28,
-             0x03, 0x11, 0x82, 0x7b,
-             0x56, 0x72, 0x86, 0x6b,
-             0x14, 0x46, 0x70, 0x88,
-             0x80, 0x16, 0xe1, 0x34,
-             0x01, 0x86, 0x8d, 0x25,
-             0x83, 0x11, 0x61, 0x28,
-             0x81, 0x21, 0x00, 0x04,
-             0x40, 0xc6, 0x00, 0x76,
-             0x80, 0x04, 0xe1, 0x28,
-             0x02, 0x06, 0x00, 0x16,
-             0x73, 0xb8, 0xe0, 0x10,
-             0x90, 0x0b, 0x68, 0x24,
-             0x61, 0x40, 0x41, 0x46,
-             0xe1, 0x28, 0x43, 0x46,
-             0x84, 0x14, 0x80, 0x04,
-             0x80, 0x38, 0xa8, 0x24,
-             0xa1, 0x4b, 0x84, 0x48,
-             0x88, 0x44, 0x80, 0x85,
-             0x84, 0x75, 0xa5, 0x4b,
-             0xe0, 0x8c, 0x46, 0x0a,
-             0x88, 0x34, 0x80, 0x85,
-             0xfc, 0x95, 0xa5, 0x3b,
-             0x6c, 0x1d, 0x10, 0x29,
-             0x02, 0xc6, 0x40, 0x2b,
-             0x7e, 0xb8, 0xe0, 0x08,
-             0x90, 0x0b, 0x6f, 0xe4,
-             0xe0, 0x08, 0x12, 0xc6,
-             0x8c, 0xd5, 0xa1, 0x0b,
-             0x61, 0x28, 0x41, 0x86,
-             0x00, 0x04, 0x81, 0x11,
-             0x80, 0x04, 0x81, 0x21,
-             0x40, 0xc6, 0x18, 0x0e,
-             0x80, 0x04, 0xe1, 0x28,
-             0x02, 0x06, 0x00, 0x16,
-             0x70, 0xb8, 0xe0, 0x10,
-             0x90, 0x0b, 0x68, 0x24,
-             0x61, 0x40, 0x41, 0x46,
-             0xe1, 0x28, 0x43, 0x46,
-             0x84, 0x14, 0x80, 0x04,
-             0x80, 0x38, 0xa8, 0x24,
-             0xa3, 0x4b, 0x84, 0x48,
-             0x88, 0x44, 0x80, 0x85,
-             0x84, 0x75, 0xa7, 0x4b,
-             0xe0, 0x8c, 0x46, 0x0a,
-             0x88, 0x34, 0x80, 0x85,
-             0xfc, 0x95, 0xa7, 0x3b,
-             0x6c, 0x1d, 0x10, 0x29,
-             0x02, 0xc6, 0x40, 0x2b,
-             0x7b, 0xb8, 0xe0, 0x08,
-             0x90, 0x0b, 0x6f, 0xe4,
-             0xe0, 0x08, 0x12, 0xc6,
-             0x80, 0xd5, 0xa1, 0x0b,
-             0x82, 0x71, 0x08, 0x61,
-             0xe6, 0xc5, 0xd6, 0x7d,
-             0x92, 0x0b, 0x81, 0x91,
-             0xf2, 0x7c, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x61, 0x28, 0x03, 0x46,
-             0x04, 0x14, 0x81, 0x61,
-             0x04, 0x66, 0x83, 0x21,
-             0x6d, 0x58, 0x83, 0x11,
-             0x01, 0x06, 0xe8, 0x24,
-             0x80, 0x04, 0xe1, 0x28,
-             0x40, 0x06, 0x00, 0x66,
-             0x80, 0x04, 0xe1, 0x14,
-             0x42, 0x10, 0x80, 0x18,
-             0x80, 0x16, 0xf3, 0xf4,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xe0, 0x18, 0x00, 0x15,
-             0xe0, 0x50, 0x00, 0x25,
-             0x61, 0x27, 0xe0, 0x17,
-             0x70, 0x01, 0x42, 0x10,
-             0x40, 0x25, 0xc3, 0x00,
-             0xc0, 0x09, 0x6e, 0x09,
-             0xe0, 0x50, 0x00, 0x25,
-             0xfb, 0x80, 0x04, 0x24,
-             0x81, 0x21, 0x24, 0x1f,
-             0x6e, 0x0d, 0x40, 0x15,
-             0x00, 0x15, 0xc0, 0x09,
-             0xed, 0x17, 0xe0, 0x54,
-             0xf3, 0xf0, 0x42, 0x10,
-             0x68, 0x41, 0x40, 0x11,
-             0x00, 0x15, 0xc0, 0x27,
-             0xdd, 0x17, 0xe0, 0x54,
-             0xf3, 0xf0, 0x42, 0x10,
-             0x68, 0x45, 0x40, 0x11,
-             0x02, 0x00, 0x40, 0x27,
-             0x83, 0x95, 0xe5, 0x70,
-             0x88, 0x21, 0x04, 0x34,
-             0xc6, 0x3b, 0xf1, 0x37,
-             0x62, 0x11, 0x42, 0x31,
-             0x84, 0x34, 0xc0, 0x27,
-             0xc6, 0x3b, 0xe1, 0x37,
-             0x62, 0x15, 0x42, 0x31,
-             0x84, 0x34, 0xc0, 0x27,
-             0xc6, 0x3b, 0xd1, 0x37,
-             0x62, 0x19, 0x42, 0x31,
-             0xc5, 0x34, 0xc0, 0x27,
-             0x42, 0x31, 0xc6, 0x3b,
-             0xc0, 0x27, 0x62, 0x0d,
-             0x60, 0x61, 0x04, 0x8a,
-             0xf8, 0xb5, 0xc0, 0x01,
-             0x65, 0xd1, 0x02, 0x00,
-             0x81, 0x21, 0x40, 0x01,
-             0x46, 0x3b, 0x83, 0x75,
-             0x42, 0x31, 0x88, 0x21,
-             0xc0, 0x26, 0x6d, 0x71,
-             0xe1, 0x37, 0x84, 0x34,
-             0x42, 0x31, 0xc6, 0x3b,
-             0xc0, 0x26, 0x6d, 0x75,
-             0xd1, 0x37, 0x84, 0x34,
-             0x42, 0x31, 0xc6, 0x3b,
-             0xc0, 0x26, 0x6d, 0x79,
-             0xc6, 0x3b, 0xc5, 0x34,
-             0x6d, 0x6d, 0x42, 0x31,
-             0x04, 0x34, 0xc0, 0x26,
-             0xe0, 0x40, 0x04, 0x8a,
-             0xf1, 0x37, 0x78, 0xf5,
-             0x68, 0x01, 0x40, 0x31,
-             0x00, 0x15, 0xc0, 0x27,
-             0xe1, 0x17, 0xe1, 0x84,
-             0x68, 0x05, 0x40, 0x11,
-             0x00, 0x15, 0xc0, 0x27,
-             0xf1, 0x17, 0xe1, 0x88,
-             0x68, 0x11, 0x40, 0x11,
-             0x00, 0x15, 0xc0, 0x27,
-             0xe1, 0x17, 0xe1, 0x88,
-             0x68, 0x15, 0x40, 0x11,
-             0x00, 0x15, 0xc0, 0x27,
-             0xff, 0x17, 0xe1, 0x8c,
-             0x67, 0xf1, 0x40, 0x11,
-             0x00, 0x15, 0xc0, 0x27,
-             0xf1, 0x17, 0xe1, 0x8c,
-             0xf0, 0xfc, 0x42, 0x10,
-             0x67, 0xe1, 0x40, 0x11,
-             0x00, 0x15, 0xc0, 0x27,
-             0x00, 0x25, 0xe1, 0x8c,
-             0xe9, 0x17, 0xe1, 0x8c,
-             0x9e, 0x19, 0x47, 0x27,
-             0xa4, 0x1f, 0xa0, 0x29,
-             0x67, 0xed, 0x40, 0x11,
-             0x00, 0x15, 0xc0, 0x27,
-             0x00, 0x25, 0xe1, 0x8c,
-             0xe1, 0x17, 0xe1, 0x8c,
-             0x9e, 0x19, 0x45, 0x27,
-             0xa4, 0x1f, 0xa0, 0x29,
-             0x67, 0xe9, 0x40, 0x11,
-             0x00, 0x15, 0xc0, 0x27,
-             0x00, 0x25, 0xe1, 0x8c,
-             0xd1, 0x17, 0xe1, 0x8c,
-             0x44, 0x20, 0x3e, 0x19,
-             0x24, 0x1f, 0xf0, 0x80,
-             0xe0, 0x04, 0x04, 0x06,
-             0x67, 0xe5, 0x40, 0x11,
-             0x00, 0x15, 0xc0, 0x27,
-             0x40, 0x15, 0xe1, 0x90,
-             0xc0, 0x0a, 0x6e, 0xe9,
-             0xe1, 0xfc, 0x00, 0x15,
-             0x40, 0x13, 0xe1, 0x17,
-             0xc0, 0x13, 0x6c, 0x29,
-             0xe1, 0xfc, 0x00, 0x15,
-             0x6c, 0x2d, 0x40, 0x13,
-             0x00, 0x15, 0xc0, 0x13,
-             0xd1, 0x17, 0xe2, 0x00,
-             0x68, 0x65, 0x40, 0x11,
-             0x00, 0x15, 0xc0, 0x27,
-             0x40, 0x11, 0xe2, 0x00,
-             0xc0, 0x27, 0x68, 0x69,
-             0xe2, 0x04, 0x00, 0x15,
-             0x40, 0x11, 0xf1, 0x17,
-             0xc0, 0x27, 0x68, 0x6d,
-             0xe2, 0x04, 0x00, 0x15,
-             0x40, 0x11, 0xe1, 0x17,
-             0xc0, 0x27, 0x68, 0x71,
-             0xe2, 0x04, 0x00, 0x15,
-             0x40, 0x11, 0xd1, 0x17,
-             0xc0, 0x27, 0x68, 0x75,
-             0xe2, 0x04, 0x00, 0x15,
-             0x68, 0x79, 0x40, 0x11,
-             0x00, 0x15, 0xc0, 0x27,
-             0xf1, 0x17, 0xe2, 0x08,
-             0x68, 0x7d, 0x40, 0x11,
-             0x02, 0x00, 0x40, 0x27,
-             0xc0, 0x02, 0x64, 0x31,
-             0x45, 0x34, 0x81, 0x75,
-             0xec, 0x04, 0x04, 0x20,
-             0x6c, 0x29, 0x42, 0x35,
-             0xa1, 0x2b, 0xc0, 0x09,
-             0x02, 0x00, 0xfe, 0x35,
-             0x40, 0x03, 0x64, 0x31,
-             0x81, 0xb5, 0x81, 0x21,
-             0x84, 0x21, 0x04, 0x34,
-             0x42, 0x33, 0xe1, 0x37,
-             0xc0, 0x13, 0x68, 0x59,
-             0x42, 0x33, 0xc5, 0x34,
-             0xc0, 0x13, 0x68, 0x55,
-             0xe5, 0x00, 0x04, 0x8a,
-             0x02, 0x00, 0xfc, 0x95,
-             0x40, 0x03, 0x67, 0x31,
-             0x81, 0x75, 0x89, 0x21,
-             0x04, 0x20, 0x45, 0x34,
-             0x42, 0x35, 0xec, 0x04,
-             0xc0, 0x0a, 0x6b, 0x1d,
-             0xfe, 0x35, 0xa1, 0x2b,
-             0x67, 0x71, 0x00, 0x00,
-             0x93, 0x11, 0x40, 0x03,
-             0x41, 0x24, 0x81, 0x75,
-             0xec, 0x04, 0x02, 0x10,
-             0x60, 0x3d, 0x40, 0x25,
-             0xa1, 0x1b, 0xc0, 0x05,
-             0x5d, 0x93, 0xfe, 0x35,
-             0xc1, 0xc3, 0x81, 0x01,
-             0xfa, 0x00, 0x04, 0x0c,
-             0xef, 0x4c, 0x02, 0x29,
-             0x80, 0xb5, 0xa1, 0x2b,
-             0xef, 0x3c, 0x02, 0x29,
-             0x96, 0x25, 0xa1, 0x2b,
-             0xf9, 0x31, 0x01, 0x21,
-             0x81, 0x51, 0x07, 0x41,
-             0x58, 0x52, 0x83, 0x85,
-             0x4c, 0x52, 0x78, 0x0c,
-             0x82, 0xc3, 0xf8, 0x90,
-             0xfc, 0x18, 0x18, 0xc9,
-             0x91, 0xc1, 0x58, 0x2f,
-             0x44, 0x0a, 0x81, 0xb5,
-             0xc2, 0x27, 0x60, 0x9c,
-             0x73, 0xf9, 0x44, 0x20,
-             0x18, 0xc0, 0x40, 0x01,
-             0x44, 0x20, 0xec, 0x04,
-             0xa1, 0xcb, 0xd8, 0x74,
-             0x82, 0x51, 0xfc, 0xb5,
-             0xe1, 0x40, 0x0a, 0x0a,
-             0x06, 0x06, 0xf8, 0xf5,
-             0x04, 0x0a, 0x61, 0x38,
-             0x0c, 0x34, 0xfb, 0xfc,
-             0x9f, 0xf8, 0x05, 0x9e,
-             0xfa, 0x80, 0x04, 0x24,
-             0x02, 0x39, 0x8c, 0x2e,
-             0x87, 0x2b, 0xef, 0x4c,
-             0x06, 0x46, 0x80, 0xf5,
-             0x8c, 0x34, 0xe1, 0x34,
-             0xaf, 0x3b, 0x8c, 0x34,
-             0x02, 0x19, 0x86, 0xf5,
-             0x83, 0x2b, 0xef, 0x3c,
-             0x02, 0x46, 0x80, 0xf5,
-             0x84, 0x14, 0xe1, 0x34,
-             0xaf, 0x1b, 0x84, 0x14,
-             0x42, 0x06, 0x84, 0xb5,
-             0x0c, 0xe6, 0x61, 0x90,
-             0x86, 0x38, 0xe0, 0x08,
-             0x6c, 0x1d, 0x00, 0x29,
-             0x84, 0x66, 0xc0, 0x2b,
-             0xf3, 0xf0, 0x46, 0x30,
-             0x06, 0x36, 0xc4, 0x39,
-             0xe0, 0x08, 0x02, 0xe6,
-             0xef, 0xe4, 0x61, 0xa8,
-             0x82, 0x55, 0xa1, 0x0b,
-             0x40, 0x16, 0x81, 0x85,
-             0x80, 0x18, 0xe1, 0x90,
-             0xf3, 0xf0, 0x42, 0x10,
-             0x80, 0x16, 0xc2, 0x19,
-             0x8c, 0x0b, 0x81, 0x61,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x02, 0x06, 0x00, 0x6b,
-             0x46, 0xd8, 0xe2, 0x80,
-             0x5b, 0xd8, 0xe8, 0x28,
-             0x8c, 0x0b, 0x6f, 0xfc,
-             0x45, 0xf6, 0x01, 0x11,
-             0x0c, 0x0b, 0xe0, 0x0c,
-             0x5d, 0x78, 0x8c, 0x3b,
-             0xa1, 0x0b, 0xef, 0xfc,
-             0x64, 0xb8, 0x82, 0xd5,
-             0x8c, 0x0b, 0x6f, 0xfc,
-             0x8c, 0x1b, 0x0c, 0x0b,
-             0xef, 0xfc, 0x78, 0x08,
-             0x80, 0xb5, 0xa1, 0x0b,
-             0x6f, 0xfc, 0x65, 0xc8,
-             0x81, 0x01, 0x8c, 0x0b,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x0c, 0x04, 0x0c,
-             0xb9, 0x11, 0x00, 0x6b,
-             0x68, 0x28, 0x44, 0xa8,
-             0xe4, 0x10, 0x0e, 0x60,
-             0x81, 0x21, 0x29, 0x11,
-             0x8e, 0x3b, 0x0c, 0x0b,
-             0xef, 0xfc, 0x5b, 0x68,
-             0xa1, 0x7b, 0x80, 0x7b,
-             0x62, 0x98, 0x80, 0xc5,
-             0x8c, 0x0b, 0x6f, 0xfc,
-             0xe0, 0x00, 0x1e, 0x08,
-             0x64, 0x20, 0x10, 0x60,
-             0x09, 0x21, 0x85, 0x11,
-             0x5a, 0x78, 0x8c, 0x0b,
-             0x90, 0x3b, 0x6f, 0xfc,
-             0x8c, 0x0b, 0x00, 0x7b,
-             0xef, 0xfc, 0x61, 0xa8,
-             0x1d, 0x18, 0xa1, 0x7b,
-             0x20, 0x14, 0xc0, 0x00,
-             0xe1, 0x04, 0x4f, 0x86,
-             0x04, 0x14, 0x9c, 0x04,
-             0xd1, 0x17, 0x61, 0xc0,
-             0x7a, 0x80, 0x06, 0x14,
-             0xfa, 0x80, 0x04, 0x24,
-             0xa1, 0x39, 0x1f, 0x29,
-             0x68, 0x00, 0x5c, 0x68,
-             0x1c, 0x04, 0x89, 0x11,
-             0xe1, 0x14, 0x02, 0x46,
-             0x84, 0x14, 0x80, 0x08,
-             0x83, 0x0b, 0x84, 0x18,
-             0xc0, 0x00, 0x1a, 0xe8,
-             0xe1, 0x34, 0x00, 0x46,
-             0x80, 0x04, 0x80, 0x04,
-             0x1a, 0x78, 0xa9, 0x0b,
-             0x5a, 0x14, 0x80, 0x00,
-             0xe1, 0x44, 0x0f, 0x86,
-             0x04, 0x14, 0x9c, 0x04,
-             0xf1, 0x17, 0x61, 0xc0,
-             0x7a, 0x80, 0x06, 0x24,
-             0xf8, 0x7c, 0x44, 0x10,
-             0x78, 0x80, 0x46, 0x30,
-             0x5a, 0x58, 0x8b, 0x11,
-             0x1c, 0x04, 0xe8, 0x00,
-             0xe1, 0x48, 0x03, 0x46,
-             0x84, 0x14, 0x80, 0x08,
-             0x83, 0x0b, 0x84, 0x18,
-             0xc0, 0x00, 0x18, 0xe8,
-             0x0f, 0xc6, 0x5a, 0x14,
-             0x9c, 0x04, 0xe1, 0x44,
-             0x61, 0xa0, 0x04, 0x14,
-             0xfa, 0x80, 0x02, 0x14,
-             0x7a, 0x80, 0x04, 0x24,
-             0xf8, 0x80, 0x46, 0x10,
-             0x8b, 0x11, 0x3f, 0x29,
-             0xe8, 0x00, 0x58, 0xc8,
-             0x03, 0x86, 0x1c, 0x04,
-             0x80, 0x08, 0xe1, 0x48,
-             0x84, 0x18, 0x84, 0x14,
-             0x17, 0x58, 0x83, 0x0b,
-             0x0c, 0x45, 0xc0, 0x00,
-             0x43, 0x06, 0x60, 0x10,
-             0x84, 0x04, 0xe1, 0x44,
-             0xe1, 0xe0, 0x04, 0x44,
-             0x44, 0x20, 0x00, 0x38,
-             0xc4, 0x3d, 0xfb, 0xfc,
-             0xe1, 0x47, 0x80, 0xd5,
-             0xfa, 0x80, 0x04, 0x44,
-             0x80, 0x65, 0xc5, 0x3d,
-             0x84, 0x04, 0x80, 0x26,
-             0x02, 0x06, 0x00, 0x08,
-             0x84, 0x14, 0xe1, 0x48,
-             0x83, 0x0b, 0x84, 0x18,
-             0xc0, 0x00, 0x15, 0xa8,
-             0xe0, 0x10, 0x0c, 0x05,
-             0xe0, 0xb8, 0x40, 0x0a,
-             0x42, 0xc6, 0x84, 0x85,
-             0xd5, 0x07, 0x61, 0x44,
-             0x86, 0x09, 0x04, 0x24,
-             0x04, 0x04, 0x88, 0x06,
-             0xe1, 0x48, 0x02, 0x46,
-             0x84, 0x14, 0x80, 0x08,
-             0xcb, 0x17, 0x84, 0x18,
-             0x83, 0x0b, 0x86, 0x19,
-             0xc0, 0x00, 0x14, 0x48,
-             0xe0, 0x10, 0x0c, 0x05,
-             0xe0, 0xb4, 0x40, 0x0a,
-             0x42, 0x86, 0x84, 0x85,
-             0xd1, 0x07, 0x61, 0x44,
-             0x86, 0x09, 0x04, 0x24,
-             0x04, 0x04, 0x88, 0x06,
-             0xe1, 0x48, 0x02, 0x46,
-             0x84, 0x14, 0x80, 0x08,
-             0xc7, 0x17, 0x84, 0x18,
-             0x83, 0x0b, 0x86, 0x19,
-             0xc0, 0x00, 0x12, 0xe8,
-             0xe0, 0x10, 0x0c, 0x05,
-             0xe0, 0xb0, 0x40, 0x0a,
-             0x42, 0x46, 0x84, 0x45,
-             0x8e, 0x09, 0x61, 0x44,
-             0x88, 0x06, 0x84, 0x24,
-             0x02, 0x46, 0x04, 0x04,
-             0x80, 0x08, 0xe1, 0x48,
-             0x84, 0x18, 0x84, 0x14,
-             0x83, 0x0b, 0x8e, 0x19,
-             0xc0, 0x00, 0x11, 0xa8,
-             0xe0, 0x10, 0x0c, 0x05,
-             0xe0, 0x94, 0x40, 0x0a,
-             0x03, 0x86, 0x84, 0x05,
-             0xc7, 0x07, 0x61, 0x08,
-             0x86, 0x09, 0x04, 0x24,
-             0x04, 0x04, 0x88, 0x06,
-             0xe1, 0x14, 0x02, 0x86,
-             0x84, 0x14, 0x80, 0x08,
-             0x83, 0x0b, 0x84, 0x18,
-             0xc0, 0x00, 0x10, 0x68,
-             0xe0, 0x14, 0x0c, 0x05,
-             0xe0, 0xf8, 0x40, 0x0a,
-             0x43, 0x46, 0x84, 0x45,
-             0xf1, 0x07, 0x61, 0x44,
-             0x9e, 0x09, 0x04, 0x24,
-             0x04, 0x04, 0x88, 0x06,
-             0xe1, 0x48, 0x02, 0x86,
-             0x84, 0x14, 0x80, 0x08,
-             0x83, 0x0b, 0x84, 0x18,
-             0xc0, 0x00, 0x0f, 0x28,
-             0xe0, 0x14, 0x0c, 0x05,
-             0xe0, 0xf4, 0x40, 0x0a,
-             0x43, 0x86, 0x84, 0x45,
-             0xe9, 0x07, 0x61, 0x44,
-             0x9e, 0x09, 0x04, 0x24,
-             0x04, 0x04, 0x88, 0x06,
-             0xe1, 0x48, 0x02, 0xc6,
-             0x84, 0x14, 0x80, 0x08,
-             0x83, 0x0b, 0x84, 0x18,
-             0xc0, 0x00, 0x0d, 0xe8,
-             0xe0, 0x14, 0x0c, 0x05,
-             0xe0, 0xf0, 0x40, 0x0a,
-             0x43, 0xc6, 0x84, 0x45,
-             0xe1, 0x07, 0x61, 0x44,
-             0x9e, 0x09, 0x04, 0x24,
-             0x04, 0x04, 0x88, 0x06,
-             0xe1, 0x48, 0x03, 0x06,
-             0x84, 0x14, 0x80, 0x08,
-             0x83, 0x0b, 0x84, 0x18,
-             0xc0, 0x00, 0x0c, 0xa8,
-             0xe0, 0x14, 0x0c, 0x05,
-             0xe0, 0xb4, 0x40, 0x0a,
-             0x43, 0x06, 0x86, 0x25,
-             0xc9, 0x07, 0x61, 0x00,
-             0x84, 0x09, 0x04, 0x24,
-             0x46, 0x30, 0x88, 0x38,
-             0xa0, 0x3f, 0xf3, 0xf4,
-             0x04, 0x04, 0x88, 0x36,
-             0xe1, 0x14, 0x02, 0xc6,
-             0x84, 0x14, 0x80, 0x08,
-             0x84, 0x18, 0xc3, 0x07,
-             0xc0, 0x1f, 0xcd, 0x17,
-             0xe0, 0x80, 0x42, 0x4a,
-             0x0c, 0x05, 0xaa, 0xc5,
-             0x40, 0x0a, 0xe0, 0x14,
-             0x86, 0x05, 0xe0, 0xb0,
-             0x61, 0x00, 0x43, 0x06,
-             0x04, 0x24, 0xc9, 0x07,
-             0x88, 0x38, 0x82, 0x09,
-             0xf3, 0xf8, 0x46, 0x30,
-             0x88, 0x36, 0xa0, 0x3f,
-             0x02, 0xc6, 0x04, 0x04,
-             0x80, 0x08, 0xe1, 0x14,
-             0x84, 0x18, 0x84, 0x14,
-             0xc0, 0x1f, 0xcb, 0x17,
-             0xe0, 0x80, 0x42, 0x4a,
-             0x0c, 0x05, 0xa4, 0x85,
-             0x40, 0x0a, 0xe0, 0x14,
-             0x86, 0x25, 0xe0, 0xac,
-             0x61, 0x00, 0x42, 0xc6,
-             0x04, 0x24, 0xc5, 0x07,
-             0x88, 0x38, 0x84, 0x09,
-             0xf3, 0xf4, 0x46, 0x30,
-             0x88, 0x36, 0xa0, 0x3f,
-             0x02, 0xc6, 0x04, 0x04,
-             0x80, 0x08, 0xe1, 0x14,
-             0xc3, 0x07, 0x84, 0x14,
-             0xc7, 0x17, 0x84, 0x18,
-             0x42, 0x4a, 0xc0, 0x1f,
-             0x9e, 0x25, 0xe0, 0x80,
-             0xe0, 0x14, 0x0c, 0x05,
-             0xe0, 0xa8, 0x40, 0x0a,
-             0x42, 0xc6, 0x86, 0x05,
-             0xc5, 0x07, 0x61, 0x00,
-             0x82, 0x09, 0x04, 0x24,
-             0x46, 0x30, 0x88, 0x38,
-             0xa0, 0x3f, 0xf3, 0xf8,
-             0x04, 0x04, 0x88, 0x36,
-             0xe1, 0x14, 0x02, 0xc6,
-             0x84, 0x14, 0x80, 0x08,
-             0xc5, 0x17, 0x84, 0x18,
-             0x42, 0x4a, 0xc0, 0x1f,
-             0x96, 0xe5, 0xe0, 0x80,
-             0xe0, 0x14, 0x0c, 0x05,
-             0xe0, 0xa4, 0x40, 0x0a,
-             0x42, 0x86, 0x84, 0xc5,
-             0x84, 0x09, 0x61, 0x00,
-             0x88, 0x38, 0x84, 0x24,
-             0xf3, 0xf4, 0x46, 0x30,
-             0x88, 0x36, 0xa0, 0x3f,
-             0x02, 0xc6, 0x04, 0x04,
-             0x80, 0x08, 0xe1, 0x14,
-             0x84, 0x18, 0x84, 0x14,
-             0x42, 0x4a, 0xc0, 0x1f,
-             0x90, 0xe5, 0xe0, 0x84,
-             0xe0, 0x14, 0x0c, 0x05,
-             0xe0, 0xa0, 0x40, 0x0a,
-             0x42, 0x86, 0x84, 0x85,
-             0x82, 0x09, 0x61, 0x00,
-             0x88, 0x38, 0x84, 0x24,
-             0xf3, 0xf8, 0x46, 0x30,
-             0x88, 0x36, 0xa0, 0x3f,
-             0x02, 0xc6, 0x04, 0x04,
-             0x80, 0x08, 0xe1, 0x14,
-             0x84, 0x18, 0x84, 0x14,
-             0x42, 0x0a, 0xc0, 0x1f,
-             0x8a, 0xf5, 0xe0, 0x80,
-             0xe0, 0x18, 0x0c, 0x05,
-             0xe0, 0xf4, 0x40, 0x0a,
-             0x43, 0xc6, 0x86, 0x05,
-             0xeb, 0x07, 0x61, 0x00,
-             0x87, 0x31, 0x04, 0x14,
-             0x78, 0x8c, 0x46, 0x02,
-             0x84, 0x28, 0x86, 0x09,
-             0xf3, 0xf0, 0x44, 0x20,
-             0x04, 0x26, 0xa6, 0x2f,
-             0xe1, 0x14, 0x03, 0x06,
-             0x84, 0x18, 0x84, 0x14,
-             0x86, 0x19, 0xcb, 0x17,
-             0x84, 0xb5, 0x81, 0x1b,
-             0xe0, 0x18, 0x0c, 0x05,
-             0xe0, 0x07, 0x1a, 0x14,
-             0x70, 0x01, 0x40, 0x00,
-             0x81, 0x71, 0x43, 0x00,
-             0x61, 0xc0, 0x04, 0x14,
-             0xfb, 0x80, 0x02, 0x14,
-             0x6e, 0x09, 0x4c, 0x25,
-             0xa2, 0x0f, 0x40, 0x09,
-             0x6e, 0x0d, 0x4c, 0x05,
-             0x81, 0xb5, 0xc0, 0x09,
-             0x6c, 0x1d, 0x0c, 0x29,
-             0x4e, 0x66, 0x40, 0x2b,
-             0x42, 0x66, 0xe0, 0x0c,
-             0x8c, 0x0b, 0x60, 0x0c,
-             0xef, 0xe0, 0x7f, 0x28,
-             0x0c, 0x0c, 0x8e, 0x0b,
-             0xdd, 0x93, 0xf2, 0x0c,
-             0x69, 0x84, 0x08, 0x24,
-             0xe9, 0x84, 0x0a, 0x34,
-             0x18, 0x44, 0x00, 0x48,
-             0xb8, 0x5f, 0xe0, 0x84,
-             0x04, 0x25, 0xa7, 0x5b,
-             0xe9, 0x84, 0x02, 0x44,
-             0x86, 0x25, 0xa3, 0x5b,
-             0x86, 0xa5, 0xa5, 0x5b,
-             0x5c, 0x08, 0xa1, 0x5b,
-             0xc4, 0x4d, 0xda, 0x00,
-             0xa1, 0x1b, 0x80, 0x65,
-             0xa1, 0x1b, 0x84, 0x85,
-             0x81, 0x85, 0x86, 0x35,
-             0x82, 0xe5, 0xa1, 0x1b,
-             0x5c, 0x08, 0xa3, 0x1b,
-             0xc4, 0x4d, 0xda, 0x00,
-             0xc7, 0x4d, 0x82, 0x55,
-             0x9a, 0x00, 0x5c, 0x08,
-             0xdd, 0x93, 0x80, 0x36,
-             0x82, 0x05, 0xc4, 0x4d,
-             0x80, 0xd5, 0xa1, 0x1b,
-             0xdd, 0x93, 0x80, 0x26,
-             0x80, 0x16, 0x81, 0x11,
-             0xc7, 0x4d, 0xdd, 0x93,
-             0xa3, 0x1b, 0x80, 0x65,
-             0xdd, 0x93, 0xfc, 0x45,
-             0xfa, 0x1c, 0x04, 0x4c,
-             0x98, 0x6b, 0x00, 0x8b,
-             0xef, 0xf8, 0x77, 0x08,
-             0x67, 0xc1, 0x0e, 0x80,
-             0x43, 0x46, 0x40, 0xae,
-             0x01, 0x21, 0xe0, 0x0c,
-             0x78, 0x98, 0x90, 0x0b,
-             0x8e, 0x3b, 0x6f, 0xf8,
-             0xa1, 0x0b, 0x81, 0x91,
-             0x1c, 0x14, 0x82, 0x35,
-             0x7f, 0xfd, 0x45, 0xfe,
-             0x43, 0x4a, 0xc0, 0x3f,
-             0x12, 0x0c, 0xe4, 0x08,
-             0x98, 0x0e, 0xe2, 0x00,
-             0x0c, 0x4c, 0x9a, 0x9e,
-             0xdd, 0x93, 0xf2, 0x1c,
-             0xfa, 0x84, 0x04, 0x0c,
-             0x61, 0x94, 0x0e, 0x46,
-             0x1c, 0x6e, 0x80, 0x6b,
-             0xe1, 0x00, 0x02, 0x06,
-             0xe8, 0x24, 0x5f, 0xa8,
-             0x8c, 0x0b, 0x1c, 0x14,
-             0xe8, 0x00, 0x40, 0x88,
-             0x8c, 0x0b, 0x1c, 0x14,
-             0xf2, 0x84, 0x0c, 0x0c,
-             0xc1, 0xc3, 0x87, 0x65,
-             0xfa, 0x84, 0x04, 0x0c,
-             0x80, 0x7b, 0x02, 0x6b,
-             0x60, 0x08, 0x40, 0x26,
-             0x65, 0x50, 0x02, 0x70,
-             0x4e, 0x01, 0xc0, 0x89,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x64, 0x11, 0x00, 0x60,
-             0x09, 0x21, 0xc0, 0x11,
-             0x61, 0x98, 0x81, 0x31,
-             0x00, 0x60, 0xe8, 0x14,
-             0x40, 0x11, 0x64, 0x21,
-             0x65, 0x01, 0x02, 0x70,
-             0x29, 0x21, 0xc0, 0x89,
-             0x60, 0xf8, 0x81, 0x31,
-             0x00, 0x60, 0xe8, 0x14,
-             0x40, 0x11, 0x64, 0x71,
-             0x65, 0x61, 0x02, 0x70,
-             0x21, 0x21, 0xc0, 0x89,
-             0x60, 0x58, 0x81, 0x31,
-             0x00, 0x60, 0xe8, 0x14,
-             0x40, 0x11, 0x64, 0xb1,
-             0x65, 0xa1, 0x02, 0x70,
-             0x45, 0x06, 0xc0, 0x89,
-             0x89, 0x31, 0x60, 0x18,
-             0xf2, 0x84, 0x0c, 0x0c,
-             0xe0, 0x14, 0x1f, 0x88,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0xf0, 0x1e, 0xf0,
-             0x82, 0xab, 0x00, 0x6b,
-             0x6d, 0xe5, 0x0c, 0x09,
-             0xa3, 0x0b, 0xc0, 0x33,
-             0x14, 0x09, 0x90, 0xf5,
-             0xc0, 0x04, 0x64, 0xa1,
-             0xe3, 0xfc, 0x00, 0x0a,
-             0x14, 0x7b, 0x90, 0x25,
-             0x64, 0x11, 0x02, 0xa0,
-             0x18, 0xa0, 0xc0, 0x11,
-             0x40, 0x14, 0x64, 0x61,
-             0x65, 0xa1, 0x04, 0x60,
-             0x14, 0x70, 0xc0, 0xae,
-             0x40, 0x1f, 0x65, 0xe1,
-             0x66, 0x21, 0x16, 0x60,
-             0x00, 0x56, 0xc0, 0xae,
-             0x10, 0x60, 0x60, 0x0c,
-             0xc0, 0xbf, 0x66, 0xb0,
-             0x6c, 0x1d, 0x4c, 0x01,
-             0x12, 0x60, 0x40, 0x2b,
-             0xc0, 0xc0, 0x65, 0x21,
-             0x06, 0x60, 0x09, 0xbe,
-             0xc0, 0xad, 0x64, 0xc1,
-             0x08, 0x60, 0x7e, 0xae,
-             0xc0, 0xad, 0x65, 0x21,
-             0x0a, 0x60, 0x7c, 0x2e,
-             0xc0, 0x54, 0x65, 0x41,
-             0x90, 0x0b, 0x3e, 0xce,
-             0x92, 0x1b, 0x3c, 0x1e,
-             0x6f, 0xc4, 0x65, 0xe8,
-             0x00, 0x66, 0x8e, 0x2b,
-             0x06, 0x60, 0x60, 0x0c,
-             0xc0, 0xcc, 0x65, 0x40,
-             0x6c, 0x1d, 0x4c, 0x01,
-             0x90, 0x0b, 0x40, 0x2b,
-             0x8e, 0x2b, 0x12, 0x1b,
-             0x6f, 0xc0, 0x5e, 0xe8,
-             0x01, 0xa1, 0x96, 0x4b,
-             0xe1, 0x9c, 0x4e, 0x0a,
-             0x40, 0x46, 0x8d, 0xa5,
-             0x04, 0xa0, 0x60, 0x08,
-             0xc0, 0x11, 0x64, 0x10,
-             0x6c, 0x1d, 0x4c, 0x01,
-             0x12, 0xa0, 0x40, 0x2b,
-             0xc0, 0x10, 0x64, 0x01,
-             0x67, 0x91, 0x16, 0xa0,
-             0x0e, 0xa0, 0x40, 0x10,
-             0xc0, 0x13, 0x65, 0xb1,
-             0x14, 0x60, 0x17, 0xae,
-             0xc0, 0xae, 0x66, 0x21,
-             0x61, 0x4c, 0x03, 0x06,
-             0x65, 0xa0, 0x08, 0x60,
-             0x0f, 0xae, 0xc0, 0xae,
-             0x66, 0x11, 0x18, 0x60,
-             0x0d, 0xbe, 0xc0, 0xad,
-             0x67, 0x61, 0x10, 0x60,
-             0x15, 0xbe, 0xc0, 0x9f,
-             0x04, 0x04, 0x8e, 0xbb,
-             0x66, 0xd1, 0x02, 0x60,
-             0x0b, 0x9e, 0xc0, 0x54,
-             0x64, 0x51, 0x06, 0x60,
-             0x09, 0xbe, 0xc0, 0x9e,
-             0x66, 0x71, 0x0a, 0x60,
-             0xfe, 0x4e, 0xc0, 0xa2,
-             0x08, 0x60, 0x13, 0x4e,
-             0xc0, 0x6c, 0x67, 0x01,
-             0x18, 0x60, 0x7c, 0xce,
-             0xc0, 0xa3, 0x64, 0xa1,
-             0x90, 0x4b, 0x3e, 0x4e,
-             0x90, 0x9b, 0x19, 0x9e,
-             0xbc, 0xce, 0x9b, 0xae,
-             0x9d, 0x2e, 0x91, 0x1e,
-             0xef, 0xb8, 0x5b, 0x68,
-             0xa1, 0xab, 0x80, 0xab,
-             0x40, 0x56, 0x88, 0x75,
-             0x0a, 0x60, 0x60, 0x08,
-             0xc0, 0xa1, 0x64, 0x70,
-             0x6c, 0x1d, 0x4c, 0x01,
-             0x01, 0x06, 0x40, 0x2b,
-             0x1b, 0x14, 0xe1, 0x4c,
-             0x97, 0x24, 0x92, 0x4b,
-             0x89, 0x1e, 0x80, 0x04,
-             0x0e, 0x20, 0x1d, 0x14,
-             0xc0, 0x1f, 0x65, 0xe1,
-             0x10, 0x20, 0x7e, 0x7e,
-             0xc0, 0x14, 0x64, 0x61,
-             0x3e, 0x1e, 0xfc, 0x8e,
-             0xbc, 0xbe, 0x84, 0x1b,
-             0x95, 0x34, 0x99, 0x24,
-             0xef, 0xb4, 0x61, 0x88,
-             0xa1, 0xab, 0x80, 0xab,
-             0xa1, 0xab, 0x8a, 0x45,
-             0x6e, 0x89, 0x0c, 0x05,
-             0x14, 0x56, 0x40, 0x0a,
-             0x0c, 0x15, 0xc0, 0x0c,
-             0xc0, 0x0a, 0x6e, 0x8d,
-             0x6e, 0x91, 0x0c, 0x25,
-             0x0c, 0x35, 0xc0, 0x0a,
-             0xc0, 0x0a, 0x6e, 0x95,
-             0x69, 0x3d, 0x4c, 0x03,
-             0x40, 0x60, 0x40, 0x0a,
-             0x4c, 0x13, 0xdc, 0x00,
-             0x40, 0x0a, 0x69, 0x41,
-             0xc0, 0x0c, 0x02, 0x56,
-             0x69, 0x45, 0x4c, 0x23,
-             0x4c, 0x33, 0xc0, 0x0a,
-             0xc0, 0x0a, 0x69, 0x49,
-             0x0c, 0x1d, 0x0c, 0x29,
-             0x67, 0x58, 0xc0, 0x2b,
-             0x14, 0x0b, 0xcf, 0xe0,
-             0x0c, 0x0c, 0xf8, 0xf1,
-             0xdd, 0x93, 0xf2, 0x7c,
-             0x60, 0x08, 0x42, 0x66,
-             0x17, 0x74, 0x8e, 0x0b,
-             0x15, 0x8e, 0x80, 0x2b,
-             0xe1, 0x4c, 0x01, 0x06,
-             0x6c, 0x1d, 0x4c, 0x11,
-             0x02, 0x60, 0x40, 0x2b,
-             0xc0, 0xb6, 0x67, 0x01,
-             0x0a, 0x60, 0x1b, 0xb4,
-             0xc0, 0xa3, 0x66, 0xe1,
-             0x84, 0x9b, 0x13, 0x84,
-             0xfc, 0xbe, 0x80, 0x04,
-             0x90, 0x4b, 0x3e, 0x1e,
-             0x99, 0x34, 0x91, 0x14,
-             0x9d, 0x14, 0xbc, 0x1e,
-             0xef, 0xb4, 0x7a, 0xe8,
-             0xa1, 0xab, 0x80, 0xab,
-             0x77, 0x75, 0x80, 0x85,
-             0xe9, 0x9c, 0x4e, 0x0a,
-             0x90, 0x2b, 0x1d, 0x14,
-             0x92, 0xab, 0x15, 0xc4,
-             0xc1, 0xc3, 0xe3, 0x75,
-             0xfa, 0x7c, 0x04, 0x4c,
-             0x00, 0x46, 0x00, 0x8b,
-             0x00, 0x8e, 0xe1, 0x94,
-             0xe1, 0x00, 0x02, 0x06,
-             0x68, 0x24, 0x4a, 0x68,
-             0x01, 0x91, 0x90, 0x0b,
-             0xe6, 0xd4, 0x54, 0x06,
-             0x83, 0x61, 0x17, 0xb1,
-             0x81, 0x71, 0x09, 0xc5,
-             0x6e, 0x19, 0x10, 0x1b,
-             0x00, 0x64, 0x40, 0x15,
-             0x80, 0x1f, 0xe8, 0xa4,
-             0x90, 0x05, 0xa1, 0x1b,
-             0xe1, 0x34, 0x42, 0x86,
-             0x84, 0x28, 0x84, 0x14,
-             0x80, 0xa5, 0xa1, 0x2b,
-             0x80, 0x1f, 0x84, 0x18,
-             0x8c, 0xc5, 0xa1, 0x1b,
-             0xf0, 0xa4, 0x4c, 0x82,
-             0x68, 0x81, 0x0c, 0x09,
-             0x00, 0x0a, 0xc0, 0x1b,
-             0x00, 0x46, 0x63, 0xfc,
-             0x80, 0x14, 0xe1, 0x94,
-             0x04, 0x94, 0x80, 0xe5,
-             0x90, 0x0b, 0x7a, 0x80,
-             0xe8, 0x00, 0x43, 0x28,
-             0x68, 0xb8, 0x81, 0x45,
-             0x90, 0x0b, 0x6f, 0xfc,
-             0x68, 0x81, 0x0c, 0x09,
-             0x47, 0x06, 0x40, 0x1b,
-             0x0c, 0x14, 0xe1, 0x34,
-             0xec, 0x04, 0x04, 0xb0,
-             0x00, 0x0a, 0x83, 0x61,
-             0x10, 0x05, 0xe3, 0xfc,
-             0x10, 0x09, 0xdc, 0x28,
-             0x00, 0x27, 0x07, 0xe5,
-             0x50, 0x05, 0xa1, 0x7b,
-             0xc0, 0x0a, 0x6e, 0x69,
-             0x82, 0x55, 0x84, 0x2c,
-             0xe1, 0x94, 0x00, 0x46,
-             0x90, 0x0b, 0x00, 0x14,
-             0xef, 0xfc, 0x6a, 0x28,
-             0x61, 0x34, 0x47, 0x06,
-             0x8c, 0x04, 0x80, 0x7b,
-             0x02, 0x91, 0x80, 0xbc,
-             0x84, 0xb1, 0x88, 0xa1,
-             0xe0, 0x40, 0x12, 0x0a,
-             0x8e, 0x0b, 0xec, 0x95,
-             0xf2, 0x7c, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x0c, 0x04, 0x0c,
-             0x80, 0x8b, 0x02, 0x7b,
-             0x60, 0x08, 0x40, 0x36,
-             0x50, 0x01, 0x84, 0x6b,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x64, 0x11, 0x00, 0x70,
-             0x02, 0x80, 0xc0, 0x11,
-             0x40, 0x6d, 0x65, 0x71,
-             0x47, 0x58, 0x89, 0x21,
-             0x81, 0x31, 0x68, 0x14,
-             0x64, 0x21, 0x00, 0x70,
-             0x02, 0x80, 0x40, 0x11,
-             0xc0, 0x6d, 0x65, 0x21,
-             0x81, 0x31, 0x29, 0x21,
-             0xe8, 0x14, 0x46, 0xa8,
-             0x60, 0x88, 0x00, 0x64,
-             0x65, 0x80, 0x02, 0x80,
-             0x02, 0x25, 0xc0, 0x6d,
-             0x82, 0x03, 0x7c, 0x00,
-             0x89, 0x31, 0x0c, 0x13,
-             0x61, 0x1d, 0x4e, 0x25,
-             0x00, 0x25, 0xc0, 0x01,
-             0x4e, 0x25, 0xe0, 0x40,
-             0x40, 0x01, 0x61, 0x21,
-             0xe0, 0x18, 0x45, 0x06,
-             0xe0, 0x80, 0x00, 0x05,
-             0x61, 0x25, 0x4e, 0x05,
-             0x02, 0x09, 0xc0, 0x01,
-             0x4e, 0x01, 0xe3, 0x00,
-             0xc0, 0x04, 0x64, 0xa1,
-             0x63, 0x40, 0x02, 0x09,
-             0xe0, 0x18, 0x43, 0x06,
-             0xe6, 0x86, 0x42, 0x6a,
-             0x64, 0xa5, 0x4e, 0x01,
-             0x82, 0x83, 0x40, 0x04,
-             0x64, 0xb1, 0x00, 0x70,
-             0x02, 0x80, 0x40, 0x11,
-             0xc0, 0x6e, 0x65, 0x01,
-             0xf2, 0x0c, 0x0c, 0x0c,
-             0xe0, 0x14, 0x03, 0x88,
-             0xfa, 0x3c, 0x04, 0x0c,
-             0x55, 0x06, 0x00, 0x6b,
-             0x10, 0x60, 0xe1, 0x98,
-             0x40, 0x54, 0x66, 0xd1,
-             0x65, 0x41, 0x12, 0x60,
-             0x28, 0x6e, 0xc0, 0x54,
-             0x67, 0x61, 0x0e, 0x60,
-             0x10, 0x0b, 0xc0, 0xae,
-             0x0c, 0x2b, 0x92, 0x1b,
-             0x6f, 0x98, 0x8e, 0x3b,
-             0xa1, 0x0b, 0xef, 0xcc,
-             0x28, 0x24, 0x84, 0x55,
-             0x12, 0x1b, 0x90, 0x0b,
-             0x71, 0x78, 0x8e, 0x3b,
-             0xa1, 0x0b, 0xef, 0xcc,
-             0x00, 0x00, 0x14, 0x25,
-             0x9c, 0x00, 0x40, 0x80,
-             0x1c, 0x00, 0x42, 0x90,
-             0x9c, 0x00, 0x46, 0x70,
-             0x8f, 0xcc, 0x6e, 0x48,
-             0x6e, 0x89, 0x0c, 0x15,
-             0xa1, 0x0b, 0x40, 0x0a,
-             0x6e, 0x8d, 0x0c, 0x25,
-             0x0e, 0x06, 0x40, 0x0a,
-             0x0c, 0x35, 0x80, 0x00,
-             0xc0, 0x0a, 0x6e, 0x91,
-             0x6e, 0x95, 0x0c, 0x45,
-             0x4c, 0x13, 0xc0, 0x0a,
-             0xc0, 0x0a, 0x69, 0x3d,
-             0x69, 0x41, 0x4c, 0x23,
-             0x4c, 0x33, 0xc0, 0x0a,
-             0xc0, 0x0a, 0x69, 0x45,
-             0x69, 0x49, 0x4c, 0x43,
-             0x82, 0x65, 0xc0, 0x0a,
-             0x6c, 0x1d, 0x0c, 0x29,
-             0x0e, 0x56, 0x40, 0x2b,
-             0x02, 0x56, 0xe0, 0x0c,
-             0x8c, 0x0b, 0x60, 0x0c,
-             0xef, 0xe0, 0x54, 0x48,
-             0x0c, 0x0c, 0x8e, 0x0b,
-             0xdd, 0x93, 0xf2, 0x3c,
-             0xf8, 0x7c, 0x04, 0x0c,
-             0xec, 0x60, 0x1e, 0xf0,
-             0x61, 0x41, 0x00, 0x19,
-             0x17, 0xc6, 0x40, 0x15,
-             0x00, 0x29, 0xe0, 0x10,
-             0x40, 0x15, 0x61, 0x45,
-             0x42, 0x2a, 0x81, 0x81,
-             0x00, 0x29, 0xe6, 0x86,
-             0xc0, 0x2b, 0x69, 0x91,
-             0x04, 0x14, 0x7e, 0x2e,
-             0x00, 0x19, 0xfa, 0x80,
-             0xc0, 0x15, 0x62, 0x11,
-             0x02, 0x00, 0x0b, 0x1e,
-             0xc0, 0x66, 0x66, 0x49,
-             0x02, 0x00, 0x7c, 0x1e,
-             0xc0, 0x58, 0x66, 0x51,
-             0x02, 0x00, 0x3e, 0x1e,
-             0xc0, 0x6b, 0x66, 0x45,
-             0x97, 0xb5, 0xbc, 0x1e,
-             0xf0, 0x90, 0x42, 0x02,
-             0x6f, 0x41, 0x02, 0x99,
-             0xe5, 0x9d, 0xc0, 0x15,
-             0x8b, 0x14, 0x82, 0xd5,
-             0xe6, 0x86, 0x42, 0x4a,
-             0xf0, 0x84, 0x46, 0x02,
-             0x6e, 0x41, 0x06, 0x39,
-             0xf0, 0x3d, 0xc0, 0x1a,
-             0x56, 0x4a, 0x80, 0xd5,
-             0x80, 0x75, 0xe4, 0x8c,
-             0x82, 0x81, 0x15, 0x65,
-             0x06, 0x0a, 0xfe, 0x34,
-             0x06, 0x14, 0xf0, 0x08,
-             0x0a, 0x16, 0x40, 0x88,
-             0x46, 0x32, 0xc0, 0x00,
-             0x06, 0xa5, 0xd0, 0x80,
-             0xc0, 0x05, 0x08, 0x91,
-             0x06, 0x14, 0x86, 0xb5,
-             0x83, 0x51, 0x60, 0x84,
-             0x06, 0x73, 0x80, 0x33,
-             0xc0, 0x0c, 0x6d, 0x21,
-             0xfa, 0x80, 0x06, 0x54,
-             0x02, 0x14, 0xd3, 0x3d,
-             0x42, 0x12, 0x80, 0x88,
-             0x02, 0xa5, 0x90, 0x80,
-             0x80, 0x05, 0x08, 0x91,
-             0x02, 0x33, 0x88, 0x05,
-             0xc2, 0x37, 0x82, 0x51,
-             0x06, 0x33, 0x80, 0x33,
-             0xc0, 0x0c, 0x6d, 0x21,
-             0xfa, 0xa5, 0x8f, 0x3d,
-             0x06, 0x54, 0xfb, 0x65,
-             0xd3, 0x3d, 0xfa, 0x80,
-             0x80, 0x84, 0x02, 0x14,
-             0x90, 0x80, 0x42, 0x12,
-             0x0d, 0x21, 0x02, 0x7b,
-             0x82, 0x65, 0x80, 0x0c,
-             0x82, 0x51, 0x02, 0x33,
-             0x80, 0x33, 0xc4, 0x37,
-             0x68, 0x91, 0x06, 0x35,
-             0xd4, 0x3d, 0xc0, 0x05,
-             0xf9, 0x15, 0xfa, 0xa5,
-             0xd5, 0xa7, 0x0b, 0x14,
-             0x89, 0xae, 0xbe, 0x34,
-             0xe6, 0x92, 0x58, 0x1a,
-             0x08, 0xc4, 0xfc, 0x14,
-             0x0a, 0xc4, 0x60, 0x84,
-             0x3c, 0x34, 0xe0, 0x88,
-             0x02, 0x43, 0x86, 0x53,
-             0xfb, 0x00, 0x02, 0x74,
-             0x06, 0x19, 0xfb, 0x17,
-             0x02, 0x73, 0x86, 0xc3,
-             0x0e, 0x74, 0x83, 0x11,
-             0x09, 0xc5, 0xfb, 0x00,
-             0xb0, 0x38, 0x85, 0x77,
-             0x80, 0x95, 0xf0, 0x3d,
-             0xe4, 0x8c, 0x56, 0x4a,
-             0x90, 0x32, 0x90, 0x25,
-             0xe1, 0xf4, 0x0c, 0x34,
-             0x8c, 0x33, 0x86, 0x69,
-             0xfb, 0x00, 0x06, 0x34,
-             0x14, 0x34, 0x85, 0x37,
-             0xf1, 0x9c, 0x4c, 0x32,
-             0xed, 0xb0, 0x14, 0x60,
-             0x64, 0x75, 0x15, 0x0a,
-             0x02, 0xe5, 0xc0, 0x04,
-             0x0c, 0x60, 0xd5, 0x37,
-             0x54, 0x46, 0x6d, 0x40,
-             0x4c, 0x6a, 0xe0, 0x04,
-             0x82, 0x31, 0x60, 0xaa,
-             0x0c, 0x60, 0x89, 0xa4,
-             0x46, 0xaa, 0xec, 0x08,
-             0x83, 0xd5, 0xe0, 0x0e,
-             0x82, 0x31, 0x09, 0xa4,
-             0x60, 0x45, 0x0d, 0x0a,
-             0x46, 0xaa, 0xc0, 0x02,
-             0x15, 0xe6, 0x60, 0x0e,
-             0x4c, 0x6a, 0xc0, 0x00,
-             0x15, 0x06, 0x40, 0x2a,
-             0x02, 0xf5, 0xc0, 0x04,
-             0xd1, 0x98, 0x4c, 0xa2,
-             0x4c, 0x6a, 0x9f, 0xa1,
-             0x54, 0x46, 0x66, 0xaa,
-             0x0c, 0x60, 0xe0, 0x04,
-             0xc0, 0x04, 0x6e, 0xc1,
-             0xe0, 0xaa, 0x4c, 0x6a,
-             0xec, 0x14, 0x0c, 0x60,
-             0x06, 0xd6, 0xcc, 0x3d,
-             0x58, 0x31, 0xc0, 0x00,
-             0x02, 0x11, 0xc0, 0x00,
-             0x08, 0x51, 0x84, 0x41,
-             0xd3, 0x1d, 0x82, 0xc1,
-             0xeb, 0xb5, 0xec, 0xb5,
-             0xfa, 0x80, 0x08, 0x84,
-             0xd0, 0x75, 0xc5, 0x4d,
-             0xb0, 0xf1, 0x01, 0x01,
-             0xf0, 0x7c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x9c, 0x04, 0x0c,
-             0x10, 0x46, 0x00, 0x6b,
-             0x20, 0x6e, 0xe1, 0x94,
-             0x67, 0x01, 0x12, 0x60,
-             0x03, 0x15, 0xc0, 0x94,
-             0x0c, 0x0b, 0x81, 0x71,
-             0xc0, 0x16, 0x66, 0x35,
-             0x60, 0x80, 0x40, 0x4a,
-             0xe0, 0x10, 0x00, 0x06,
-             0x5c, 0x00, 0x40, 0x60,
-             0xdc, 0x00, 0x42, 0x70,
-             0xcf, 0xdc, 0x6e, 0x68,
-             0x82, 0x71, 0x65, 0x0e,
-             0xe2, 0x30, 0x0e, 0x0a,
-             0x20, 0x14, 0xfa, 0xf5,
-             0x0c, 0x0c, 0x8c, 0x0b,
-             0x81, 0x15, 0xf2, 0x9c,
-             0xfa, 0x04, 0x04, 0x0c,
-             0xec, 0x30, 0x1e, 0xf0,
-             0x00, 0x06, 0x00, 0x6b,
-             0x4c, 0x01, 0xe0, 0x0c,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0xe1, 0x4c, 0x01, 0x06,
-             0x64, 0x81, 0x0e, 0x60,
-             0x18, 0x60, 0x40, 0x99,
-             0xc0, 0x8b, 0x64, 0x61,
-             0x04, 0x60, 0x3e, 0x7e,
-             0xc0, 0xae, 0x66, 0xa1,
-             0x06, 0x60, 0x00, 0x04,
-             0xc0, 0x9f, 0x67, 0x61,
-             0x65, 0x21, 0x08, 0x60,
-             0x0a, 0x60, 0x40, 0xa2,
-             0xc0, 0xa3, 0x66, 0xe1,
-             0x73, 0x38, 0xbc, 0xce,
-             0xa1, 0x0b, 0xef, 0xc8,
-             0x0e, 0x06, 0x02, 0xa5,
-             0x0c, 0x29, 0x80, 0x00,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0xe0, 0x0c, 0x0e, 0x56,
-             0x60, 0x0c, 0x02, 0x56,
-             0x40, 0x38, 0x8c, 0x0b,
-             0x0e, 0x0b, 0xef, 0xe0,
-             0x0c, 0x0c, 0x98, 0xf1,
-             0xdd, 0x93, 0xf2, 0x04,
-             0xe1, 0x00, 0x41, 0x86,
-             0x80, 0x08, 0x80, 0x04,
-             0x82, 0x09, 0x5d, 0x93,
-             0xfa, 0x7c, 0x04, 0x4c,
-             0x81, 0x01, 0x00, 0x7b,
-             0x6f, 0xf0, 0x69, 0x28,
-             0x47, 0xc6, 0x81, 0x11,
-             0x80, 0x6b, 0x60, 0x04,
-             0x6e, 0x0d, 0x0e, 0x05,
-             0x04, 0x70, 0x40, 0x09,
-             0xc0, 0xad, 0x65, 0x61,
-             0x6d, 0x49, 0x0e, 0x15,
-             0x4e, 0x31, 0xc0, 0x0a,
-             0xc0, 0x2b, 0x6c, 0x1d,
-             0xef, 0xc4, 0x6d, 0xa8,
-             0xa1, 0x9b, 0x80, 0x9b,
-             0x0e, 0x29, 0x82, 0x25,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x7d, 0x78, 0x8e, 0x0b,
-             0x92, 0x1b, 0x6f, 0xdc,
-             0x0e, 0x15, 0x93, 0xd5,
-             0x40, 0x0a, 0x6d, 0x59,
-             0xe1, 0x04, 0x00, 0xc6,
-             0x80, 0x1e, 0x80, 0x04,
-             0x6d, 0x59, 0x0e, 0x05,
-             0x0e, 0x15, 0xc0, 0x0a,
-             0xc0, 0x09, 0x6e, 0x0d,
-             0xef, 0xc4, 0x6d, 0xa8,
-             0x64, 0x01, 0x10, 0x00,
-             0xe1, 0x87, 0xc0, 0x80,
-             0x6f, 0xcc, 0x78, 0x88,
-             0x0e, 0x0b, 0x90, 0x0b,
-             0x40, 0xb8, 0x90, 0x1b,
-             0x0e, 0x0b, 0xef, 0xd0,
-             0x79, 0xd8, 0x90, 0x1b,
-             0x0e, 0x0b, 0xef, 0xcc,
-             0x7c, 0x98, 0x90, 0x1b,
-             0x7f, 0x38, 0xef, 0xcc,
-             0x8e, 0x0b, 0x6f, 0xcc,
-             0x67, 0x39, 0x0e, 0x1b,
-             0x01, 0x06, 0x40, 0x16,
-             0x00, 0x04, 0xe1, 0x04,
-             0x83, 0xb1, 0x83, 0x21,
-             0x01, 0x46, 0x00, 0x1c,
-             0x0e, 0x1b, 0xe1, 0x04,
-             0xc0, 0x16, 0x67, 0x3d,
-             0x00, 0x1c, 0x80, 0x04,
-             0xe1, 0x00, 0x41, 0x46,
-             0x80, 0x18, 0x80, 0x04,
-             0x00, 0x16, 0xc2, 0x19,
-             0xe1, 0x00, 0x41, 0xc6,
-             0x80, 0x18, 0x80, 0x04,
-             0x00, 0x16, 0xd0, 0x19,
-             0x6c, 0x58, 0xa9, 0x11,
-             0x8e, 0x0b, 0x68, 0x1c,
-             0x6e, 0x91, 0x0e, 0x19,
-             0x40, 0x06, 0x40, 0x2c,
-             0x00, 0x04, 0xe1, 0x10,
-             0x00, 0x16, 0x89, 0x21,
-             0xe1, 0x00, 0x41, 0x86,
-             0x04, 0x26, 0x80, 0x14,
-             0x80, 0x14, 0x8f, 0x21,
-             0x02, 0x76, 0x04, 0x26,
-             0x00, 0x04, 0xe0, 0x04,
-             0x00, 0x16, 0x81, 0x21,
-             0xe0, 0x3c, 0x42, 0x86,
-             0x68, 0x1c, 0x6a, 0xc8,
-             0x41, 0x46, 0x8e, 0x0b,
-             0x03, 0x86, 0x61, 0x40,
-             0x00, 0x04, 0xe1, 0x00,
-             0xe1, 0x34, 0x04, 0x46,
-             0x88, 0x24, 0x84, 0x14,
-             0x84, 0x48, 0x80, 0x38,
-             0xe0, 0x90, 0x48, 0x0a,
-             0x88, 0x44, 0x80, 0x85,
-             0x86, 0x35, 0xad, 0x4b,
-             0xe0, 0x8c, 0x46, 0x0a,
-             0x88, 0x34, 0x80, 0x85,
-             0xfc, 0x75, 0xad, 0x3b,
-             0x6c, 0x1d, 0x0e, 0x29,
-             0x02, 0x36, 0x40, 0x2b,
-             0x75, 0x98, 0xe0, 0x08,
-             0x8e, 0x0b, 0x6f, 0xdc,
-             0xe0, 0x08, 0x12, 0x36,
-             0x83, 0x11, 0x00, 0xab,
-             0x6f, 0xf0, 0x5f, 0x28,
-             0x21, 0xab, 0x8c, 0x0b,
-             0x84, 0x55, 0x80, 0x6b,
-             0xe1, 0x18, 0x00, 0x86,
-             0x00, 0xb6, 0x80, 0x04,
-             0xe1, 0x18, 0x00, 0x46,
-             0x80, 0x08, 0x80, 0x04,
-             0x40, 0x8a, 0x82, 0x01,
-             0x4e, 0x03, 0xe0, 0x02,
-             0xc0, 0x15, 0x6e, 0x01,
-             0xef, 0xe0, 0x61, 0x08,
-             0x6d, 0xd8, 0x81, 0x91,
-             0x60, 0xf8, 0xe8, 0x1c,
-             0x03, 0x11, 0xef, 0xcc,
-             0x5d, 0x58, 0x8c, 0x0b,
-             0x92, 0x0b, 0xef, 0xf0,
-             0xf2, 0x7c, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x04, 0x04, 0x4c,
-             0x43, 0x26, 0x00, 0x6b,
-             0x0c, 0x01, 0xe0, 0x04,
-             0xc0, 0x2b, 0x65, 0xb5,
-             0x6c, 0x1d, 0x4c, 0x11,
-             0x40, 0x0a, 0xc0, 0x2b,
-             0x0c, 0x09, 0xe0, 0x84,
-             0xc0, 0x2b, 0x05, 0xa9,
-             0x02, 0x86, 0x8c, 0x95,
-             0x84, 0x18, 0xef, 0x18,
-             0x80, 0xb5, 0xa3, 0x1b,
-             0x66, 0xe9, 0x0c, 0x09,
-             0x85, 0xb5, 0xc0, 0x26,
-             0xf7, 0x00, 0x00, 0x8a,
-             0x0c, 0x19, 0x80, 0xd5,
-             0xc0, 0x26, 0x66, 0xed,
-             0xfc, 0xa5, 0xa1, 0x1b,
-             0xe0, 0x98, 0x40, 0x4a,
-             0x0c, 0x19, 0x80, 0xc5,
-             0xc0, 0x2c, 0x6c, 0xfd,
-             0x82, 0x65, 0xa1, 0x1b,
-             0x82, 0x0d, 0xff, 0x11,
-             0x0c, 0x19, 0x82, 0x15,
-             0xc0, 0x26, 0x66, 0xed,
-             0x04, 0x65, 0xa1, 0x1b,
-             0x80, 0x00, 0x40, 0x46,
-             0xe0, 0x94, 0x40, 0x0a,
-             0x05, 0xa9, 0x0c, 0x09,
-             0x02, 0x60, 0x00, 0x2b,
-             0x80, 0xad, 0x05, 0xb1,
-             0x04, 0x41, 0x02, 0x60,
-             0x84, 0x18, 0xc0, 0x9e,
-             0x08, 0x45, 0x0c, 0x09,
-             0x82, 0x03, 0xc0, 0x27,
-             0xe1, 0x00, 0x42, 0x06,
-             0x84, 0x06, 0x84, 0x14,
-             0xa1, 0x0b, 0x84, 0x08,
-             0x84, 0x08, 0x80, 0xa5,
-             0xe5, 0x04, 0x00, 0x8a,
-             0x40, 0x46, 0x80, 0x95,
-             0x84, 0x06, 0xe0, 0x00,
-             0x61, 0x00, 0x0f, 0xc6,
-             0x9c, 0x04, 0x83, 0x21,
-             0x42, 0x10, 0x80, 0x18,
-             0x80, 0x16, 0xf3, 0xdc,
-             0x80, 0x18, 0x9c, 0x04,
-             0x00, 0x16, 0xc2, 0x19,
-             0x60, 0x38, 0x87, 0x11,
-             0x8c, 0x0b, 0x68, 0x1c,
-             0x83, 0x21, 0x1c, 0x04,
-             0xc4, 0x19, 0x80, 0x18,
-             0x99, 0x11, 0x00, 0x16,
-             0x68, 0x1c, 0x5f, 0xa8,
-             0x9c, 0x04, 0x8c, 0x0b,
-             0xc8, 0x19, 0x80, 0x18,
-             0x0c, 0x4c, 0x80, 0x16,
-             0xdd, 0x93, 0xf2, 0x04,
-             0xe1, 0x04, 0x41, 0x46,
-             0x80, 0x18, 0x80, 0x04,
-             0x80, 0x16, 0xc2, 0x19,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x04, 0x04, 0x4c,
-             0x42, 0x46, 0x00, 0x7b,
-             0x5e, 0x38, 0xe0, 0x04,
-             0x81, 0x21, 0x68, 0x1c,
-             0x41, 0x46, 0x81, 0x61,
-             0x03, 0x86, 0x61, 0x40,
-             0x80, 0x04, 0xe1, 0x00,
-             0x80, 0x28, 0x84, 0x14,
-             0x46, 0x4a, 0x84, 0x38,
-             0x84, 0x25, 0xe0, 0x98,
-             0xe0, 0x8c, 0x44, 0x4a,
-             0x0e, 0x29, 0xfe, 0x25,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0xe0, 0x08, 0x0c, 0x86,
-             0x60, 0x08, 0x02, 0x86,
-             0x69, 0x58, 0x8e, 0x0b,
-             0xa3, 0x0b, 0xef, 0xdc,
-             0xc0, 0x00, 0x0c, 0x06,
-             0xe8, 0x1c, 0x63, 0x28,
-             0x0c, 0x4c, 0x8c, 0x0b,
-             0xdd, 0x93, 0xf2, 0x04,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x41, 0xf6, 0x01, 0x61,
-             0x72, 0x38, 0xe0, 0x3c,
-             0x81, 0x11, 0x6f, 0x8c,
-             0xe1, 0x44, 0x40, 0x46,
-             0x80, 0x66, 0x80, 0x04,
-             0xef, 0xe0, 0x53, 0x48,
-             0xef, 0xe0, 0x55, 0xe8,
-             0xef, 0xe0, 0x57, 0xc8,
-             0x60, 0x3c, 0x41, 0xf6,
-             0x71, 0x38, 0x83, 0x11,
-             0x0c, 0x0c, 0xef, 0x8c,
-             0x16, 0x18, 0xf2, 0x00,
-             0xc1, 0xc3, 0xff, 0xcc,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x40, 0xc6, 0x00, 0x6b,
-             0x4c, 0x01, 0xe0, 0x08,
-             0xc0, 0x2b, 0x6c, 0x1d,
-             0x6d, 0x49, 0x0c, 0x05,
-             0x4c, 0x05, 0xc0, 0x06,
-             0xc0, 0x0b, 0x66, 0x85,
-             0x66, 0x85, 0x0c, 0x05,
-             0x5a, 0x38, 0xc0, 0x0b,
-             0x00, 0x04, 0xef, 0xc4,
-             0x4c, 0x05, 0xfb, 0x80,
-             0xc0, 0x0b, 0x66, 0x89,
-             0x65, 0x39, 0x0c, 0x09,
-             0x4c, 0x01, 0xc0, 0x2b,
-             0xc0, 0x2d, 0x6a, 0x35,
-             0x65, 0x3d, 0x0c, 0x09,
-             0x4c, 0x01, 0xc0, 0x2b,
-             0xc0, 0x2d, 0x6a, 0x39,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x40, 0xd6, 0x00, 0x6b,
-             0x4c, 0x01, 0xe0, 0x08,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x0c, 0x05, 0x91, 0x11,
-             0xc0, 0x08, 0x69, 0x59,
-             0x66, 0x79, 0x4c, 0x05,
-             0x0c, 0x09, 0xc0, 0x0b,
-             0xc0, 0x2b, 0x65, 0xcd,
-             0xef, 0xc4, 0x55, 0x68,
-             0x6a, 0x05, 0x4c, 0x01,
-             0x0c, 0x05, 0xc0, 0x2d,
-             0xc0, 0x0b, 0x63, 0x7d,
-             0x66, 0x7d, 0x4c, 0x05,
-             0x0c, 0x0c, 0xc0, 0x0b,
-             0xdd, 0x93, 0xf2, 0x00,
-             0xfa, 0x0c, 0x04, 0x0c,
-             0xc4, 0x17, 0x00, 0x6b,
-             0x60, 0x08, 0x40, 0xe6,
-             0x4c, 0x01, 0x8c, 0x13,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x02, 0x05, 0x84, 0x7b,
-             0xc0, 0x06, 0x6d, 0x61,
-             0x66, 0x79, 0x4c, 0x05,
-             0x0c, 0x09, 0xc0, 0x0b,
-             0xc0, 0x2c, 0x6e, 0x31,
-             0x6d, 0x0d, 0x0c, 0x09,
-             0xa3, 0x0b, 0x40, 0x2c,
-             0x40, 0x4a, 0x84, 0x15,
-             0x00, 0x60, 0xe0, 0x8c,
-             0x00, 0xad, 0x05, 0x4d,
-             0x05, 0xa1, 0x02, 0x60,
-             0x00, 0x60, 0x80, 0xb3,
-             0x40, 0xad, 0x05, 0x49,
-             0x05, 0x91, 0x02, 0x60,
-             0x81, 0xc5, 0xc0, 0xb3,
-             0x60, 0x8c, 0x40, 0x4a,
-             0x65, 0xc0, 0x02, 0x60,
-             0x00, 0x60, 0xc0, 0xb3,
-             0x80, 0xad, 0x05, 0x45,
-             0x05, 0x41, 0x00, 0x60,
-             0x80, 0x08, 0xc0, 0xad,
-             0x91, 0x11, 0x04, 0x84,
-             0xef, 0xc4, 0x51, 0x28,
-             0x6a, 0x05, 0x4c, 0x01,
-             0xa3, 0x7b, 0x40, 0x2d,
-             0x03, 0x89, 0x0c, 0x85,
-             0x4c, 0x85, 0x80, 0x0b,
-             0xc0, 0x0b, 0x66, 0x7d,
-             0xf2, 0x0c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x60, 0x08, 0x48, 0xf6,
-             0x40, 0x41, 0x82, 0x31,
-             0xc0, 0x2b, 0x6c, 0x1d,
-             0x66, 0x71, 0x00, 0x45,
-             0xa1, 0x4b, 0xc0, 0x0b,
-             0x06, 0x71, 0x00, 0x45,
-             0x46, 0x3a, 0xc0, 0x0b,
-             0x40, 0x35, 0xc0, 0x12,
-             0xc0, 0x0b, 0x66, 0x69,
-             0x66, 0x69, 0x00, 0x35,
-             0x00, 0x45, 0xc0, 0x0b,
-             0xc0, 0x0b, 0x66, 0x6d,
-             0xe1, 0x92, 0x46, 0x3a,
-             0x66, 0x69, 0x40, 0x35,
-             0x40, 0x21, 0xc0, 0x0b,
-             0xc0, 0x2d, 0x69, 0xd1,
-             0x69, 0xd5, 0x40, 0x11,
-             0xdd, 0x93, 0xc0, 0x2d,
-             0x60, 0x08, 0x43, 0x06,
-             0x40, 0x11, 0x89, 0x21,
-             0xc0, 0x2b, 0x6c, 0x1d,
-             0x6a, 0x71, 0x40, 0x21,
-             0x00, 0x19, 0xc0, 0x2d,
-             0xc0, 0x2b, 0x65, 0x51,
-             0x40, 0x15, 0xd6, 0x17,
-             0xc0, 0x0b, 0x66, 0x91,
-             0x6d, 0x51, 0x00, 0x15,
-             0x40, 0x15, 0xc0, 0x06,
-             0xc0, 0x0b, 0x66, 0x95,
-             0x69, 0xd1, 0x00, 0x19,
-             0xa5, 0x1b, 0xc0, 0x2d,
-             0x03, 0x11, 0x84, 0xd5,
-             0x40, 0x11, 0x81, 0x21,
-             0xc0, 0x2d, 0x6a, 0x75,
-             0x65, 0xf5, 0x00, 0x15,
-             0x40, 0x15, 0xc0, 0x0b,
-             0xc0, 0x0b, 0x66, 0x99,
-             0x65, 0xf9, 0x00, 0x15,
-             0x40, 0x15, 0xc0, 0x0b,
-             0xc0, 0x0b, 0x66, 0xa1,
-             0x66, 0xb1, 0x40, 0x25,
-             0xdd, 0x93, 0xc0, 0x0b,
-             0x68, 0x15, 0x00, 0x19,
-             0x81, 0x21, 0x40, 0x2d,
-             0x6a, 0x75, 0x40, 0x11,
-             0x00, 0x15, 0xc0, 0x2d,
-             0xc0, 0x0b, 0x65, 0xfd,
-             0x66, 0x99, 0x40, 0x15,
-             0x02, 0x00, 0x40, 0x0b,
-             0xc0, 0xb6, 0x66, 0xc1,
-             0x68, 0x15, 0x00, 0x39,
-             0x87, 0x2d, 0xc0, 0x2d,
-             0x9a, 0x00, 0x5c, 0x08,
-             0x78, 0xa8, 0x02, 0x35,
-             0x02, 0x45, 0x82, 0x21,
-             0x00, 0x55, 0xf8, 0x98,
-             0xc0, 0x0b, 0x66, 0x69,
-             0xe6, 0x92, 0x48, 0x5a,
-             0x42, 0x45, 0x86, 0x43,
-             0x02, 0x35, 0xf8, 0x10,
-             0xc2, 0x37, 0xf8, 0x10,
-             0xf8, 0x10, 0x42, 0x35,
-             0xf8, 0x10, 0x02, 0x35,
-             0x69, 0xd5, 0x00, 0x49,
-             0xc2, 0x47, 0xc0, 0x2d,
-             0x08, 0x4b, 0x80, 0x43,
-             0xc0, 0x14, 0x66, 0x69,
-             0xe0, 0x12, 0x46, 0x3a,
-             0xf8, 0x10, 0x42, 0x35,
-             0xf8, 0x10, 0x02, 0x35,
-             0x42, 0x35, 0xc3, 0x37,
-             0x02, 0x35, 0xf8, 0x10,
-             0x02, 0x45, 0xf8, 0x88,
-             0x00, 0x55, 0xf8, 0x78,
-             0xc0, 0x0b, 0x66, 0x69,
-             0xe6, 0x92, 0x48, 0x5a,
-             0x84, 0x4e, 0x86, 0x43,
-             0xc2, 0x37, 0x84, 0x34,
-             0x84, 0x34, 0x84, 0x3e,
-             0x69, 0xd5, 0x00, 0x49,
-             0xc2, 0x47, 0xc0, 0x2d,
-             0x08, 0x4b, 0x80, 0x43,
-             0xc0, 0x14, 0x65, 0x51,
-             0xe0, 0x92, 0x46, 0x3a,
-             0x84, 0x34, 0x84, 0x3e,
-             0xc5, 0x3e, 0x83, 0x37,
-             0xc1, 0xc3, 0xf7, 0x85,
-             0x66, 0x7d, 0x00, 0x15,
-             0x40, 0x15, 0xc0, 0x0b,
-             0xc0, 0x08, 0x69, 0x45,
-             0x6a, 0x05, 0x00, 0x19,
-             0x40, 0x11, 0xc0, 0x2d,
-             0xc0, 0x22, 0x65, 0x49,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x66, 0x7d, 0x00, 0x15,
-             0x40, 0x15, 0xc0, 0x0b,
-             0xc0, 0x06, 0x6d, 0x4d,
-             0x6a, 0x05, 0x00, 0x19,
-             0x40, 0x11, 0xc0, 0x2d,
-             0xc0, 0x1b, 0x65, 0x69,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xe0, 0x28, 0x02, 0x25,
-             0xe0, 0x2c, 0x02, 0x15,
-             0x69, 0x5d, 0x40, 0x25,
-             0x45, 0xf6, 0x40, 0x08,
-             0x40, 0x15, 0xe0, 0x2c,
-             0xc0, 0x08, 0x69, 0x61,
-             0x62, 0xc9, 0x40, 0x23,
-             0xdd, 0x93, 0xc0, 0x11,
-             0xfa, 0x9c, 0x04, 0x0c,
-             0x80, 0x8b, 0x04, 0x6b,
-             0x60, 0x88, 0x00, 0x64,
-             0x52, 0x82, 0x82, 0x7b,
-             0x43, 0x36, 0x70, 0x80,
-             0x50, 0x11, 0xe0, 0x08,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x66, 0x81, 0x00, 0x90,
-             0x02, 0x70, 0xc0, 0x6d,
-             0x89, 0x21, 0x64, 0xa0,
-             0x68, 0x0c, 0x79, 0x88,
-             0x00, 0x90, 0x81, 0x31,
-             0x40, 0x6d, 0x67, 0x81,
-             0xe4, 0xb0, 0x02, 0x70,
-             0x81, 0x31, 0x09, 0x21,
-             0xe8, 0x0c, 0x78, 0xe8,
-             0x60, 0x18, 0x41, 0x06,
-             0xe4, 0xc0, 0x02, 0x70,
-             0x66, 0x82, 0x40, 0x6a,
-             0xe0, 0x24, 0x04, 0x06,
-             0x80, 0x83, 0x85, 0x31,
-             0x65, 0x01, 0x00, 0x80,
-             0x0c, 0x0c, 0xc0, 0x6e,
-             0x37, 0xd8, 0xf2, 0x9c,
-             0xc1, 0xc3, 0xe0, 0x0c,
-             0xfa, 0x0c, 0x04, 0x0c,
-             0x82, 0x6b, 0x00, 0x7b,
-             0x6c, 0xfd, 0x0e, 0x39,
-             0x43, 0xf6, 0x40, 0x2c,
-             0x6e, 0xb8, 0xe0, 0x0c,
-             0x85, 0x21, 0x6f, 0xfc,
-             0x6f, 0xfc, 0x70, 0xc8,
-             0x67, 0xf8, 0x8e, 0x0b,
-             0x8e, 0x0b, 0x6f, 0xfc,
-             0x60, 0x08, 0x40, 0xa6,
-             0x65, 0xe0, 0x02, 0x70,
-             0x4e, 0x01, 0xc0, 0xb6,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0xe1, 0x4c, 0x01, 0x06,
-             0x04, 0x70, 0x00, 0x04,
-             0xc0, 0xb6, 0x66, 0x41,
-             0x64, 0xa0, 0x08, 0x60,
-             0x48, 0x98, 0x8c, 0x3b,
-             0x00, 0x8b, 0xef, 0x9c,
-             0xe0, 0x08, 0x41, 0x26,
-             0x6c, 0x1d, 0x4e, 0x01,
-             0x00, 0x70, 0x40, 0x2b,
-             0xc0, 0x89, 0x65, 0xa1,
-             0x64, 0xc0, 0x02, 0x60,
-             0xe0, 0x24, 0x04, 0x06,
-             0x68, 0x0c, 0x74, 0x88,
-             0x90, 0x0b, 0x85, 0x31,
-             0xf2, 0x0c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x1c, 0x04, 0x4c,
-             0x86, 0x6b, 0x00, 0x8b,
-             0x70, 0x88, 0x52, 0x82,
-             0x12, 0x19, 0x82, 0x7b,
-             0x40, 0x1b, 0x68, 0x81,
-             0x10, 0x39, 0x83, 0x21,
-             0xc0, 0x2c, 0x6c, 0xfd,
-             0xef, 0xfc, 0x6a, 0xc8,
-             0x6f, 0xfc, 0x6c, 0xe8,
-             0x12, 0x19, 0x90, 0x0b,
-             0x40, 0x1b, 0x68, 0x81,
-             0x65, 0xd8, 0x90, 0x0b,
-             0x8c, 0x2b, 0x6f, 0xfc,
-             0x60, 0x08, 0x40, 0xb6,
-             0x65, 0xe0, 0x02, 0x80,
-             0x50, 0x01, 0xc0, 0xb6,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0xe1, 0x4c, 0x01, 0x06,
-             0x04, 0x80, 0x00, 0x04,
-             0xc0, 0xb6, 0x66, 0x41,
-             0x64, 0xa0, 0x08, 0x70,
-             0x44, 0x78, 0x8e, 0x3b,
-             0x12, 0x29, 0xef, 0x9c,
-             0x40, 0x1b, 0x68, 0x81,
-             0x10, 0x0b, 0x80, 0x6b,
-             0x76, 0x18, 0x8e, 0x1b,
-             0x8c, 0x0b, 0xef, 0xfc,
-             0xf2, 0x1c, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x61, 0x2c, 0x41, 0xc6,
-             0xe1, 0x30, 0x02, 0x06,
-             0x04, 0x46, 0x00, 0x04,
-             0x06, 0x86, 0xe1, 0x30,
-             0x08, 0xc6, 0x61, 0x30,
-             0x0b, 0x06, 0xe1, 0x30,
-             0x19, 0x46, 0x61, 0x30,
-             0x80, 0x04, 0xe1, 0x30,
-             0x84, 0x14, 0x84, 0x14,
-             0x00, 0x13, 0x88, 0x24,
-             0xe1, 0x30, 0x01, 0x86,
-             0x8c, 0x34, 0x88, 0x24,
-             0x8c, 0x34, 0x84, 0x13,
-             0x86, 0x13, 0x90, 0x44,
-             0x94, 0x54, 0x90, 0x44,
-             0x94, 0x54, 0x88, 0x13,
-             0x8a, 0x13, 0xb0, 0xc4,
-             0x80, 0x04, 0xb0, 0xc4,
-             0x80, 0x04, 0x98, 0x13,
-             0x82, 0x03, 0x5d, 0x93,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x00, 0x46, 0x00, 0x6b,
-             0x00, 0x04, 0xe1, 0x24,
-             0xe1, 0x24, 0x44, 0x46,
-             0x6e, 0x09, 0x0c, 0x15,
-             0x80, 0x08, 0xc0, 0x09,
-             0xc5, 0x07, 0x88, 0x24,
-             0x44, 0x00, 0x08, 0x34,
-             0x66, 0x58, 0xf0, 0x0c,
-             0x8c, 0x0b, 0x68, 0x1c,
-             0x6c, 0xfd, 0x0c, 0x19,
-             0x81, 0x21, 0x40, 0x2c,
-             0x64, 0xb5, 0x4c, 0x05,
-             0x4c, 0x21, 0xc0, 0x05,
-             0xc0, 0x15, 0x62, 0xe1,
-             0x62, 0xe9, 0x4c, 0x21,
-             0x4c, 0x11, 0xc0, 0x15,
-             0xc0, 0x15, 0x62, 0xed,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xe1, 0x18, 0x03, 0x06,
-             0x84, 0x18, 0x84, 0x14,
-             0x65, 0x5d, 0x40, 0x11,
-             0xdd, 0x93, 0xc0, 0x22,
-             0xe1, 0x18, 0x03, 0x06,
-             0x84, 0x18, 0x84, 0x14,
-             0x65, 0x7d, 0x40, 0x11,
-             0xdd, 0x93, 0xc0, 0x1b,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x41, 0x46, 0x00, 0x6b,
-             0x00, 0x04, 0xe1, 0x24,
-             0xe1, 0x18, 0x03, 0x06,
-             0x84, 0x14, 0x80, 0x04,
-             0x4c, 0x05, 0x82, 0x01,
-             0xc0, 0x08, 0x69, 0x45,
-             0x91, 0x11, 0x04, 0x08,
-             0xef, 0xc0, 0x71, 0x28,
-             0x65, 0x49, 0x4c, 0x01,
-             0x0c, 0x0c, 0xc0, 0x22,
-             0xdd, 0x93, 0xf2, 0x00,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x41, 0x46, 0x00, 0x6b,
-             0x00, 0x04, 0xe1, 0x24,
-             0xe1, 0x18, 0x03, 0x06,
-             0x84, 0x14, 0x80, 0x04,
-             0x4c, 0x05, 0x82, 0x01,
-             0xc0, 0x06, 0x6d, 0x4d,
-             0x91, 0x11, 0x04, 0x08,
-             0xef, 0xc0, 0x6f, 0xa8,
-             0x6d, 0x01, 0x0c, 0x19,
-             0x4c, 0x01, 0xc0, 0x2c,
-             0xc0, 0x1b, 0x65, 0x69,
-             0x65, 0x5d, 0x4c, 0x11,
-             0x0c, 0x0c, 0xc0, 0x1b,
-             0xdd, 0x93, 0xf2, 0x00,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x00, 0xc6, 0x00, 0x6b,
-             0x00, 0x04, 0xe1, 0x34,
-             0x80, 0x04, 0x8b, 0x31,
-             0x65, 0x49, 0x0c, 0x29,
-             0x0c, 0x19, 0xc0, 0x22,
-             0xc0, 0x22, 0x65, 0x59,
-             0x69, 0x5d, 0x4c, 0x05,
-             0x7c, 0xb8, 0xc0, 0x08,
-             0x4c, 0x05, 0xef, 0xc0,
-             0x40, 0x08, 0x69, 0x61,
-             0xe0, 0x0c, 0x43, 0xf6,
-             0x65, 0x91, 0x4c, 0x11,
-             0x0c, 0x0c, 0xc0, 0x22,
-             0xdd, 0x93, 0xf2, 0x00,
-             0xfa, 0x0c, 0x04, 0x0c,
-             0x68, 0x20, 0x46, 0x68,
-             0x42, 0x78, 0x80, 0x6b,
-             0x8c, 0x0b, 0x68, 0x00,
-             0x66, 0x81, 0x00, 0x60,
-             0x02, 0x06, 0x40, 0x6d,
-             0xc0, 0x20, 0x63, 0x41,
-             0x60, 0x04, 0x04, 0x06,
-             0x64, 0x18, 0x81, 0x31,
-             0x0e, 0x60, 0xe8, 0x0c,
-             0x40, 0x6d, 0x67, 0x81,
-             0x81, 0xf5, 0xa1, 0x81,
-             0x78, 0x40, 0x0e, 0x05,
-             0x0c, 0x29, 0x8b, 0x31,
-             0xc0, 0x1b, 0x65, 0x69,
-             0x65, 0x79, 0x0c, 0x19,
-             0x79, 0xd8, 0xc0, 0x1b,
-             0x5d, 0x0e, 0xef, 0xc0,
-             0xec, 0x04, 0x10, 0x80,
-             0xfc, 0x35, 0xa1, 0x8b,
-             0xf2, 0x0c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x9c, 0x04, 0x0c,
-             0x02, 0x06, 0x00, 0x6b,
-             0x5e, 0x58, 0xe0, 0x04,
-             0x0e, 0x60, 0xe8, 0x1c,
-             0x40, 0x6e, 0x64, 0x81,
-             0x01, 0x95, 0xa1, 0x81,
-             0x5d, 0x18, 0x8c, 0x9b,
-             0x5b, 0xd8, 0x8c, 0x0b,
-             0x65, 0x0e, 0xef, 0xd8,
-             0xec, 0x04, 0x10, 0x80,
-             0xfe, 0x15, 0xa1, 0x8b,
-             0x65, 0x81, 0x00, 0x60,
-             0x04, 0x06, 0x40, 0x6d,
-             0x01, 0x31, 0xe0, 0x04,
-             0x0c, 0x0c, 0x8c, 0x1b,
-             0x20, 0x78, 0xf2, 0x9c,
-             0xc1, 0xc3, 0xe0, 0x0c,
-             0x65, 0xa1, 0x00, 0x00,
-             0x02, 0x06, 0x40, 0x89,
-             0xc0, 0x20, 0x63, 0x1d,
-             0x60, 0x24, 0x04, 0x06,
-             0x1f, 0xb8, 0x87, 0x31,
-             0xc1, 0xc3, 0xe0, 0x0c,
-             0x65, 0x01, 0x00, 0x00,
-             0x02, 0x06, 0x40, 0x6e,
-             0xc0, 0x20, 0x61, 0x01,
-             0x62, 0x40, 0x04, 0x06,
-             0x1e, 0xf8, 0x87, 0x31,
-             0xc1, 0xc3, 0xe0, 0x0c,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0x6d, 0x91, 0x1e, 0xf0,
-             0x00, 0x6b, 0xc0, 0x04,
-             0xe1, 0x30, 0x40, 0x46,
-             0x6c, 0x6d, 0x0c, 0x29,
-             0x03, 0xc6, 0x40, 0x22,
-             0x0c, 0x39, 0xe1, 0x30,
-             0x40, 0x22, 0x6f, 0xbd,
-             0x4c, 0x41, 0x85, 0x41,
-             0x40, 0x22, 0x6c, 0x69,
-             0x00, 0x04, 0x81, 0x71,
-             0x4c, 0x21, 0x82, 0x21,
-             0x40, 0x22, 0x6c, 0x6d,
-             0x4c, 0x31, 0x82, 0x31,
-             0x40, 0x22, 0x6f, 0xbd,
-             0x64, 0xd1, 0x04, 0xf0,
-             0x04, 0x14, 0xc0, 0x02,
-             0xe4, 0x10, 0x06, 0xf0,
-             0x95, 0x51, 0x1d, 0x41,
-             0x81, 0x81, 0x01, 0xc1,
-             0x12, 0xc4, 0x83, 0x65,
-             0x82, 0xc1, 0x7a, 0x80,
-             0xe1, 0x12, 0x52, 0x9a,
-             0x66, 0x96, 0x54, 0x9a,
-             0x12, 0x0c, 0xbb, 0x9b,
-             0x10, 0xa3, 0xe2, 0x00,
-             0x14, 0xa4, 0x92, 0x83,
-             0xc4, 0xa7, 0xfa, 0x80,
-             0xfc, 0x28, 0x00, 0xb5,
-             0x02, 0xa5, 0xc9, 0xbe,
-             0xcd, 0xae, 0xfc, 0x28,
-             0xe2, 0x30, 0x18, 0x0a,
-             0x00, 0x60, 0xfa, 0x35,
-             0x40, 0x90, 0x65, 0x81,
-             0x64, 0xd1, 0x02, 0xf0,
-             0x45, 0x06, 0xc0, 0x02,
-             0x81, 0x31, 0x60, 0x20,
-             0xe8, 0x0c, 0x5a, 0x28,
-             0x66, 0x41, 0x00, 0x60,
-             0x02, 0xf0, 0x40, 0x92,
-             0x45, 0x06, 0xe4, 0x10,
-             0x81, 0x31, 0x60, 0x20,
-             0xe8, 0x0c, 0x59, 0x88,
-             0x61, 0x2c, 0x41, 0xc6,
-             0xe1, 0x2c, 0x43, 0x46,
-             0x45, 0xc6, 0x00, 0x04,
-             0x04, 0x14, 0xe1, 0x34,
-             0x66, 0x31, 0x06, 0x60,
-             0x08, 0x24, 0xc0, 0x8b,
-             0x83, 0x65, 0x81, 0x41,
-             0x70, 0x0c, 0x4a, 0x40,
-             0x18, 0x54, 0x82, 0x41,
-             0xa7, 0x5b, 0x60, 0x84,
-             0x62, 0x00, 0x0a, 0x0c,
-             0x18, 0xc4, 0x8e, 0xc3,
-             0x8a, 0x73, 0x7a, 0x80,
-             0xc4, 0xc7, 0x08, 0xce,
-             0xfc, 0x30, 0x00, 0x65,
-             0xf8, 0x20, 0x46, 0x65,
-             0xfc, 0x30, 0x02, 0xc5,
-             0xb1, 0x4b, 0xcd, 0xce,
-             0x1e, 0xf0, 0xfa, 0x55,
-             0xc0, 0x04, 0x65, 0x91,
-             0xf2, 0x7c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xe1, 0x18, 0x03, 0x06,
-             0x84, 0x18, 0x84, 0x14,
-             0x6c, 0xad, 0x40, 0x11,
-             0xdd, 0x93, 0xc0, 0x22,
-             0xe1, 0x18, 0x03, 0x06,
-             0x84, 0x18, 0x84, 0x14,
-             0x6f, 0xfd, 0x40, 0x11,
-             0xdd, 0x93, 0xc0, 0x22,
-             0x63, 0x85, 0x00, 0x15,
-             0x40, 0x15, 0xc0, 0x0b,
-             0xc0, 0x08, 0x6b, 0x21,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x63, 0x85, 0x00, 0x15,
-             0x40, 0x15, 0xc0, 0x0b,
-             0xc0, 0x08, 0x6b, 0xf5,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x1c, 0x04, 0x4c,
-             0x81, 0x01, 0x00, 0x8b,
-             0x6f, 0xec, 0x54, 0x08,
-             0x81, 0x61, 0x81, 0x11,
-             0x41, 0x86, 0x00, 0x7b,
-             0x00, 0x04, 0xe1, 0x0c,
-             0xe0, 0x04, 0x43, 0x16,
-             0x6c, 0x1d, 0x50, 0x11,
-             0x83, 0x91, 0x40, 0x2b,
-             0x41, 0xc6, 0x00, 0x96,
-             0x80, 0x04, 0xe1, 0x04,
-             0xc2, 0x19, 0x80, 0x18,
-             0x00, 0x06, 0x00, 0x16,
-             0x80, 0x04, 0xe1, 0x08,
-             0xc2, 0x19, 0x80, 0x18,
-             0x7c, 0x98, 0x80, 0x16,
-             0x7c, 0xf8, 0xef, 0xf8,
-             0x90, 0x0b, 0x6f, 0xf8,
-             0x82, 0xe5, 0xa1, 0x0b,
-             0x6c, 0x1d, 0x10, 0x29,
-             0x0c, 0x86, 0x40, 0x2b,
-             0x02, 0x86, 0xe0, 0x08,
-             0x90, 0x0b, 0x60, 0x08,
-             0xef, 0xd8, 0x67, 0x68,
-             0x0b, 0x45, 0xa3, 0x0b,
-             0xc0, 0x00, 0x0c, 0x06,
-             0xef, 0xdc, 0x53, 0x28,
-             0x6f, 0xf8, 0x74, 0x08,
-             0x45, 0x58, 0x90, 0x0b,
-             0x90, 0x0b, 0x68, 0x00,
-             0x61, 0x14, 0x40, 0x06,
-             0xe0, 0x04, 0x45, 0x66,
-             0x80, 0x18, 0x80, 0x04,
-             0x00, 0x16, 0xc2, 0x19,
-             0xe1, 0x04, 0x40, 0x06,
-             0x43, 0x56, 0x00, 0x04,
-             0x00, 0x96, 0xe0, 0x04,
-             0xe1, 0x14, 0x41, 0x46,
-             0x50, 0x11, 0x80, 0x04,
-             0xc0, 0x2b, 0x6c, 0x1d,
-             0x41, 0xc6, 0x00, 0x96,
-             0x80, 0x04, 0xe1, 0x14,
-             0x00, 0x86, 0x00, 0x96,
-             0x10, 0x19, 0xe1, 0x0c,
-             0xc0, 0x2c, 0x6e, 0x5d,
-             0x50, 0x21, 0x80, 0x04,
-             0xc0, 0x2b, 0x6c, 0x1d,
-             0x00, 0x46, 0x00, 0x16,
-             0x10, 0x19, 0xe1, 0x0c,
-             0xc0, 0x2c, 0x6e, 0x65,
-             0x00, 0x16, 0x80, 0x04,
-             0xe1, 0x08, 0x40, 0x06,
-             0x6e, 0x61, 0x10, 0x19,
-             0x80, 0x04, 0xc0, 0x2c,
-             0x01, 0xc6, 0x00, 0x16,
-             0x10, 0x19, 0xe1, 0x08,
-             0xc0, 0x2c, 0x6e, 0x69,
-             0x00, 0x16, 0x80, 0x04,
-             0xe1, 0x44, 0x40, 0x06,
-             0x6e, 0x59, 0x10, 0x19,
-             0x80, 0x04, 0xc0, 0x2c,
-             0x41, 0x76, 0x00, 0x16,
-             0x50, 0x01, 0xe0, 0x04,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0xef, 0xfc, 0x41, 0xf6,
-             0x68, 0x00, 0x46, 0xc8,
-             0x03, 0x11, 0x81, 0x11,
-             0x4b, 0xd8, 0x8e, 0x0b,
-             0x8c, 0x0b, 0xef, 0xec,
-             0xf2, 0x1c, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x6e, 0x81, 0x00, 0x29,
-             0x02, 0xc6, 0x40, 0x2c,
-             0x84, 0x14, 0xe1, 0x10,
-             0x03, 0x06, 0x04, 0x26,
-             0x00, 0x29, 0xe1, 0x10,
-             0xc0, 0x2c, 0x6e, 0x85,
-             0x04, 0x26, 0x84, 0x14,
-             0xe1, 0x10, 0x03, 0xc6,
-             0x6e, 0x89, 0x00, 0x29,
-             0x84, 0x14, 0xc0, 0x2c,
-             0x03, 0x86, 0x04, 0x26,
-             0x00, 0x29, 0xe1, 0x10,
-             0xc0, 0x2c, 0x6e, 0x51,
-             0x04, 0x26, 0x84, 0x14,
-             0xe1, 0x10, 0x05, 0x46,
-             0x6b, 0xad, 0x00, 0x19,
-             0x88, 0x24, 0xc0, 0x2b,
-             0xf0, 0xfc, 0x42, 0x10,
-             0x42, 0xc6, 0x08, 0x16,
-             0x00, 0x29, 0xe1, 0x10,
-             0xc0, 0x2c, 0x6e, 0xa1,
-             0x04, 0x26, 0x84, 0x14,
-             0xe1, 0x10, 0x43, 0x46,
-             0x6e, 0xa5, 0x00, 0x29,
-             0x84, 0x14, 0xc0, 0x2c,
-             0x43, 0x06, 0x04, 0x26,
-             0x00, 0x29, 0xe1, 0x10,
-             0xc0, 0x2c, 0x6e, 0x55,
-             0x04, 0x26, 0x84, 0x14,
-             0xe1, 0x10, 0x43, 0x86,
-             0x6e, 0x8d, 0x00, 0x29,
-             0x84, 0x14, 0xc0, 0x2c,
-             0x04, 0x86, 0x04, 0x26,
-             0x00, 0x19, 0xe1, 0x10,
-             0xc0, 0x2c, 0x6e, 0xa9,
-             0x02, 0x4a, 0x88, 0x24,
-             0x06, 0x0c, 0xe0, 0x00,
-             0xa1, 0x1b, 0x62, 0x00,
-             0x44, 0x86, 0x08, 0x36,
-             0x88, 0x24, 0xe1, 0x10,
-             0xe2, 0x00, 0x02, 0x0c,
-             0x44, 0x46, 0x08, 0x16,
-             0x88, 0x24, 0xe1, 0x10,
-             0x43, 0xc6, 0x08, 0x16,
-             0x00, 0x09, 0xe1, 0x0c,
-             0xc0, 0x2c, 0x6e, 0x9d,
-             0x84, 0x06, 0x84, 0x14,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xe1, 0x18, 0x45, 0xc6,
-             0x08, 0x16, 0x88, 0x24,
-             0xe1, 0x1c, 0x04, 0x06,
-             0x08, 0x16, 0x88, 0x24,
-             0xe1, 0x1c, 0x04, 0x46,
-             0x08, 0x16, 0x88, 0x24,
-             0xe1, 0x1c, 0x04, 0x86,
-             0x08, 0x16, 0x88, 0x24,
-             0xe1, 0x1c, 0x04, 0xc6,
-             0x08, 0x16, 0x88, 0x24,
-             0xe1, 0x1c, 0x05, 0x06,
-             0x08, 0x16, 0x88, 0x24,
-             0xe1, 0x1c, 0x05, 0x46,
-             0x08, 0x16, 0x88, 0x24,
-             0xe1, 0x1c, 0x05, 0x86,
-             0x08, 0x16, 0x88, 0x24,
-             0xe1, 0x1c, 0x05, 0xc6,
-             0x08, 0x16, 0x88, 0x24,
-             0xe1, 0x1c, 0x44, 0x06,
-             0x08, 0x16, 0x88, 0x24,
-             0xe1, 0x1c, 0x44, 0x46,
-             0x08, 0x16, 0x88, 0x24,
-             0xe1, 0x1c, 0x44, 0x86,
-             0x08, 0x16, 0x88, 0x24,
-             0xe1, 0x1c, 0x44, 0xc6,
-             0x08, 0x16, 0x88, 0x24,
-             0xe1, 0x1c, 0x45, 0x06,
-             0x08, 0x16, 0x88, 0x24,
-             0xe1, 0x1c, 0x45, 0x46,
-             0x08, 0x16, 0x88, 0x24,
-             0xe1, 0x1c, 0x45, 0x86,
-             0x08, 0x16, 0x88, 0x24,
-             0xe1, 0x14, 0x42, 0x86,
-             0x84, 0x0c, 0x84, 0x14,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x61, 0x24, 0x00, 0xc6,
-             0x80, 0x04, 0x81, 0x11,
-             0xdd, 0x93, 0x80, 0x16,
-             0xfa, 0x0c, 0x04, 0x0c,
-             0x41, 0x46, 0x00, 0x6b,
-             0x00, 0x14, 0xe1, 0x14,
-             0xe0, 0x08, 0x04, 0xc6,
-             0x6c, 0x1d, 0x4c, 0x21,
-             0x81, 0x21, 0x40, 0x2b,
-             0x10, 0xc6, 0x03, 0x71,
-             0x04, 0x26, 0xe1, 0x24,
-             0xe1, 0x2c, 0x42, 0x06,
-             0x04, 0x26, 0x84, 0x14,
-             0x80, 0x04, 0x85, 0x11,
-             0xa0, 0x04, 0x80, 0x76,
-             0x8c, 0x0b, 0x00, 0x26,
-             0xe8, 0x14, 0x6d, 0x28,
-             0x02, 0x76, 0x20, 0x04,
-             0x4c, 0x11, 0xe0, 0x08,
-             0xc0, 0x2b, 0x6c, 0x1d,
-             0x0c, 0x0c, 0x80, 0x76,
-             0xdd, 0x93, 0xf2, 0x0c,
-             0xfa, 0x0c, 0x04, 0x0c,
-             0x82, 0x7b, 0x04, 0x3b,
-             0x86, 0x1b, 0x01, 0x21,
-             0x68, 0x18, 0x47, 0x28,
-             0x41, 0x06, 0x81, 0x61,
-             0x42, 0x46, 0x61, 0x24,
-             0x00, 0x04, 0xe1, 0x2c,
-             0xe1, 0x40, 0x45, 0x46,
-             0x81, 0x31, 0x04, 0x14,
-             0x80, 0xc8, 0x88, 0x24,
-             0x84, 0x48, 0x84, 0x58,
-             0x50, 0x0a, 0x88, 0x88,
-             0x04, 0x05, 0xe0, 0x8c,
-             0x80, 0x08, 0x0d, 0x56,
-             0xc7, 0x57, 0x45, 0xc7,
-             0xc4, 0x47, 0x02, 0xc9,
-             0xa6, 0xcf, 0x04, 0x59,
-             0xaa, 0xcf, 0x08, 0x49,
-             0x46, 0xc2, 0xa8, 0xcf,
-             0x87, 0x7b, 0xf8, 0x1c,
-             0x4b, 0xd8, 0xfa, 0x75,
-             0x8c, 0x0b, 0xe8, 0x18,
-             0xf2, 0x0c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x02, 0x86, 0x02, 0x2b,
-             0x40, 0x11, 0xe0, 0x08,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0xf9, 0x95, 0x8f, 0x11,
-             0xfa, 0x84, 0x04, 0x0c,
-             0x00, 0x46, 0x00, 0x7b,
-             0x4e, 0x01, 0xe0, 0x08,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x79, 0x98, 0x82, 0x6b,
-             0x8e, 0x0b, 0x6f, 0xfc,
-             0x60, 0x08, 0x00, 0x86,
-             0x4e, 0x01, 0x8f, 0x11,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x8c, 0x2b, 0x8e, 0x0b,
-             0xf2, 0x84, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xf7, 0x25,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x50, 0x1e, 0xf0,
-             0x61, 0x38, 0x13, 0x86,
-             0x24, 0x04, 0x80, 0x6b,
-             0xe0, 0x04, 0x02, 0x06,
-             0x6c, 0x1d, 0x4c, 0x11,
-             0x15, 0x46, 0x40, 0x2b,
-             0x50, 0x06, 0xe1, 0x38,
-             0x80, 0x18, 0xe1, 0x34,
-             0x80, 0x16, 0xc2, 0x19,
-             0x80, 0x18, 0xa4, 0x04,
-             0xf3, 0xf8, 0x42, 0x10,
-             0xa8, 0x04, 0x80, 0x16,
-             0x42, 0x10, 0x80, 0x18,
-             0x00, 0x16, 0xf3, 0xf8,
-             0xe0, 0x04, 0x02, 0x16,
-             0x4c, 0x11, 0xa0, 0x04,
-             0xc0, 0x2b, 0x6c, 0x1d,
-             0x8c, 0x0b, 0x00, 0x16,
-             0xe8, 0x18, 0x65, 0x08,
-             0x6d, 0x15, 0x0c, 0x09,
-             0x80, 0x7b, 0x40, 0x2c,
-             0xe0, 0x84, 0x40, 0x4a,
-             0x40, 0x0a, 0x82, 0x45,
-             0x82, 0xe5, 0xe0, 0x88,
-             0x6d, 0x21, 0x0c, 0x19,
-             0x42, 0x0a, 0xc0, 0x2c,
-             0x82, 0x25, 0xe0, 0x88,
-             0x61, 0x34, 0x41, 0x46,
-             0x80, 0x04, 0x89, 0x11,
-             0x0c, 0x09, 0x80, 0x16,
-             0xc0, 0x2c, 0x6d, 0x15,
-             0xf8, 0x1c, 0x00, 0x4a,
-             0x01, 0x75, 0x80, 0x95,
-             0xe9, 0x9c, 0x4e, 0x0a,
-             0x6d, 0x11, 0x0c, 0x19,
-             0xa1, 0x1b, 0xc0, 0x2c,
-             0xe0, 0x00, 0x0e, 0x1a,
-             0x20, 0x01, 0x02, 0x88,
-             0x40, 0x0a, 0xc0, 0x00,
-             0x40, 0x0a, 0xe9, 0x9c,
-             0x88, 0x25, 0xe9, 0x9c,
-             0x60, 0x94, 0x40, 0x4a,
-             0x86, 0xa5, 0x81, 0x71,
-             0x63, 0x11, 0x0c, 0x09,
-             0xa1, 0x0b, 0xc0, 0x2d,
-             0x20, 0x04, 0x86, 0x15,
-             0xe0, 0x04, 0x02, 0x26,
-             0x6c, 0x1d, 0x4c, 0x11,
-             0x51, 0xc6, 0x40, 0x2b,
-             0x00, 0x16, 0xe1, 0x0c,
-             0xa0, 0x04, 0xa3, 0x11,
-             0x8c, 0x0b, 0x00, 0x16,
-             0xe8, 0x00, 0x64, 0xc8,
-             0x80, 0x7b, 0x20, 0x14,
-             0x6e, 0x9d, 0x0c, 0x09,
-             0x50, 0x06, 0x40, 0x2c,
-             0x84, 0x06, 0xe1, 0x34,
-             0x61, 0x00, 0x01, 0xc6,
-             0xe1, 0x38, 0x57, 0x06,
-             0xa1, 0x7b, 0x00, 0x14,
-             0x44, 0x20, 0x84, 0x28,
-             0x84, 0x26, 0xf3, 0xec,
-             0x84, 0x28, 0xac, 0x14,
-             0xfc, 0x9c, 0x04, 0x24,
-             0x80, 0x04, 0x84, 0x26,
-             0xc8, 0x19, 0x80, 0x18,
-             0x96, 0xc5, 0x80, 0x16,
-             0x61, 0x34, 0x41, 0x06,
-             0x80, 0x04, 0x87, 0x11,
-             0x28, 0x04, 0x80, 0x1c,
-             0x80, 0x18, 0xa1, 0x7b,
-             0x80, 0x16, 0xc2, 0x19,
-             0x80, 0x18, 0xa4, 0x04,
-             0x80, 0x16, 0xc2, 0x19,
-             0x80, 0x18, 0xa4, 0x04,
-             0xf3, 0xf8, 0x42, 0x10,
-             0xa8, 0x85, 0x80, 0x16,
-             0xa1, 0x7b, 0x24, 0x04,
-             0xc2, 0x19, 0x80, 0x18,
-             0xa4, 0x04, 0x80, 0x16,
-             0x42, 0x10, 0x80, 0x18,
-             0x80, 0x16, 0xf3, 0xf8,
-             0x80, 0x18, 0xa8, 0x04,
-             0xf3, 0xf8, 0x42, 0x10,
-             0x8a, 0x55, 0x80, 0x16,
-             0x6f, 0xfc, 0x41, 0x08,
-             0x20, 0x04, 0x8c, 0x0b,
-             0xe0, 0x04, 0x02, 0xb6,
-             0x6c, 0x1d, 0x4c, 0x11,
-             0x80, 0x16, 0xc0, 0x2b,
-             0xef, 0xfc, 0x6c, 0xe8,
-             0x83, 0x81, 0x2c, 0x04,
-             0x80, 0x18, 0x83, 0x21,
-             0xf3, 0xbc, 0x42, 0x10,
-             0x00, 0x46, 0x00, 0x16,
-             0x80, 0x04, 0xe1, 0x10,
-             0x42, 0x10, 0x80, 0x18,
-             0x00, 0x16, 0xf3, 0xf8,
-             0x76, 0x18, 0x95, 0x11,
-             0x8c, 0x0b, 0x68, 0x14,
-             0x61, 0x10, 0x40, 0x46,
-             0x80, 0x14, 0x81, 0x21,
-             0x80, 0x04, 0x84, 0x26,
-             0xac, 0x04, 0x80, 0x86,
-             0xe0, 0x19, 0x80, 0x18,
-             0x41, 0x06, 0x80, 0x16,
-             0x42, 0xe6, 0x61, 0x34,
-             0x00, 0x04, 0xe0, 0x00,
-             0x80, 0x1c, 0xa8, 0xf1,
-             0x80, 0x18, 0xac, 0x04,
-             0xf1, 0xfc, 0x42, 0x10,
-             0x8e, 0x0b, 0x00, 0x16,
-             0xf2, 0x7c, 0x0c, 0x0c,
-             0x0c, 0x09, 0xdd, 0x93,
-             0xc0, 0x2c, 0x6d, 0x15,
-             0xe0, 0x80, 0x40, 0x0a,
-             0x0c, 0x09, 0x80, 0xe5,
-             0xc0, 0x2d, 0x63, 0x11,
-             0x10, 0x08, 0xa1, 0x0b,
-             0x41, 0x06, 0x80, 0x00,
-             0x87, 0x11, 0x61, 0x34,
-             0x80, 0x1c, 0x80, 0x04,
-             0x6d, 0x15, 0x0c, 0x09,
-             0x40, 0x0a, 0xc0, 0x2c,
-             0x82, 0x05, 0xe0, 0x84,
-             0x6d, 0x21, 0x0c, 0x09,
-             0x40, 0x0a, 0xc0, 0x2c,
-             0x0c, 0xd8, 0xe0, 0x84,
-             0x0c, 0x09, 0xc0, 0x00,
-             0xc0, 0x2c, 0x6d, 0x11,
-             0x60, 0xc5, 0xa1, 0x0b,
-             0x80, 0x00, 0x0e, 0x06,
-             0x02, 0x66, 0x20, 0x04,
-             0x4c, 0x11, 0xe0, 0x04,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0xa1, 0x21, 0xa1, 0x81,
-             0x00, 0x60, 0x00, 0x16,
-             0xc0, 0x6e, 0x64, 0x81,
-             0x02, 0xf0, 0x01, 0x75,
-             0x41, 0x38, 0xe4, 0x10,
-             0xec, 0x04, 0x04, 0x20,
-             0xa1, 0x2b, 0xc5, 0x36,
-             0x49, 0x18, 0xfe, 0x75,
-             0x8c, 0x0b, 0x68, 0x1c,
-             0x8c, 0x1b, 0x0c, 0x0b,
-             0xe8, 0x00, 0x69, 0xc8,
-             0x00, 0x60, 0x00, 0x7b,
-             0xc0, 0x6e, 0x64, 0x81,
-             0x02, 0xf0, 0x01, 0x75,
-             0x45, 0x28, 0xe4, 0x10,
-             0xec, 0x04, 0x10, 0x80,
-             0xa1, 0x8b, 0xc1, 0x26,
-             0x0c, 0x09, 0xfe, 0x75,
-             0x40, 0x2d, 0x67, 0xc9,
-             0xe1, 0x34, 0x50, 0x06,
-             0xd4, 0x95, 0xa5, 0x0b,
-             0x68, 0x00, 0x5a, 0xc8,
-             0x6b, 0x05, 0x8c, 0x0b,
-             0x0c, 0x09, 0x80, 0x7b,
-             0xc0, 0x2c, 0x6d, 0x15,
-             0xe0, 0x88, 0x40, 0x0a,
-             0x0c, 0x19, 0x8c, 0x25,
-             0xc0, 0x2c, 0x6d, 0x21,
-             0xe0, 0x88, 0x42, 0x0a,
-             0x20, 0x04, 0x8a, 0x65,
-             0xe0, 0x04, 0x02, 0x76,
-             0x6c, 0x1d, 0x4c, 0x11,
-             0x00, 0x16, 0xc0, 0x2b,
-             0xe1, 0x34, 0x41, 0x46,
-             0x87, 0x11, 0x00, 0x04,
-             0x8c, 0x0b, 0x00, 0x16,
-             0xe8, 0x00, 0x6e, 0xe8,
-             0x67, 0xc9, 0x0c, 0x09,
-             0x81, 0x71, 0x40, 0x2d,
-             0x80, 0xb5, 0xa7, 0x0b,
-             0x68, 0x00, 0x58, 0x68,
-             0x80, 0x7b, 0x8c, 0x0b,
-             0x63, 0x11, 0x0c, 0x09,
-             0x40, 0x4a, 0xc0, 0x2d,
-             0x80, 0xe5, 0xe0, 0x80,
-             0x6f, 0xfc, 0x62, 0x08,
-             0x68, 0x78, 0x8c, 0x0b,
-             0x8c, 0x0b, 0x68, 0x14,
-             0xca, 0x75, 0xa1, 0x7b,
-             0x6d, 0x15, 0x0c, 0x09,
-             0x40, 0x0a, 0xc0, 0x2c,
-             0x86, 0x65, 0xe0, 0x8c,
-             0x02, 0x86, 0x20, 0x04,
-             0x4c, 0x11, 0xe0, 0x04,
-             0xc0, 0x2b, 0x6c, 0x1d,
-             0x8c, 0x0b, 0x00, 0x16,
-             0xe8, 0x00, 0x6d, 0x08,
-             0x67, 0xc9, 0x0c, 0x09,
-             0x80, 0x7b, 0x40, 0x2d,
-             0x80, 0xb5, 0xa9, 0x0b,
-             0x68, 0x00, 0x55, 0xe8,
-             0x80, 0x7b, 0x8c, 0x0b,
-             0x30, 0xf8, 0xa1, 0x7b,
-             0x0c, 0x09, 0xdf, 0xfc,
-             0xc0, 0x2c, 0x6d, 0x15,
-             0xe0, 0x90, 0x40, 0x0a,
-             0x6a, 0xd8, 0x84, 0x25,
-             0x8c, 0x0b, 0x6f, 0xd8,
-             0x02, 0x96, 0x20, 0x04,
-             0x4c, 0x11, 0xe0, 0x04,
-             0xc0, 0x2b, 0x6c, 0x1d,
-             0x8c, 0x0b, 0x00, 0x16,
-             0xef, 0xc8, 0x79, 0x68,
-             0x6d, 0x15, 0x0c, 0x09,
-             0x40, 0x0a, 0xc0, 0x2c,
-             0x81, 0x71, 0x60, 0x88,
-             0x9f, 0xfc, 0x2f, 0x48,
-             0x6d, 0x21, 0x0c, 0x09,
-             0x40, 0x0a, 0xc0, 0x2c,
-             0x2e, 0xd8, 0xe0, 0x88,
-             0x20, 0x04, 0x9f, 0xfc,
-             0xe0, 0x04, 0x02, 0xa6,
-             0x6c, 0x1d, 0x4c, 0x11,
-             0x80, 0x16, 0xc0, 0x2b,
-             0x63, 0x11, 0x0c, 0x09,
-             0x40, 0x4a, 0xc0, 0x2d,
-             0x98, 0xe5, 0xe0, 0x80,
-             0x6f, 0xfc, 0x48, 0xa8,
-             0x47, 0xf8, 0x8c, 0x0b,
-             0x8c, 0x0b, 0x6f, 0xfc,
-             0x6f, 0xfc, 0x46, 0xc8,
-             0x47, 0x18, 0x8c, 0x0b,
-             0x8c, 0x0b, 0x6f, 0xfc,
-             0x68, 0x00, 0x6c, 0x28,
-             0x8d, 0x95, 0x8c, 0x0b,
-             0x02, 0x46, 0x20, 0x04,
-             0x4c, 0x11, 0xe0, 0x04,
-             0xc0, 0x2b, 0x6c, 0x1d,
-             0x41, 0x46, 0x00, 0x16,
-             0x00, 0x04, 0xe1, 0x34,
-             0x00, 0x16, 0x85, 0x11,
-             0x58, 0xb8, 0x8c, 0x0b,
-             0x8c, 0x1b, 0x68, 0x00,
-             0xa1, 0x7b, 0x80, 0x7b,
-             0x41, 0x06, 0x8c, 0x25,
-             0x89, 0x21, 0x61, 0x34,
-             0x04, 0x2c, 0x80, 0x14,
-             0xe0, 0x08, 0x03, 0x36,
-             0x8b, 0x21, 0x00, 0x04,
-             0x6c, 0x1d, 0x4c, 0x11,
-             0x80, 0x2c, 0xc0, 0x2b,
-             0x20, 0x04, 0xd3, 0xf5,
-             0xe0, 0x04, 0x02, 0x36,
-             0x6c, 0x1d, 0x4c, 0x11,
-             0x00, 0x16, 0xc0, 0x2b,
-             0xe1, 0x34, 0x41, 0x46,
-             0x83, 0x11, 0x00, 0x04,
-             0x8c, 0x0b, 0x00, 0x16,
-             0xe8, 0x18, 0x5f, 0x28,
-             0x67, 0xc9, 0x0c, 0x09,
-             0x80, 0x7b, 0x40, 0x2d,
-             0x80, 0xb5, 0xa1, 0x0b,
-             0x68, 0x00, 0x4e, 0x28,
-             0x80, 0x7b, 0x8c, 0x0b,
-             0x61, 0x34, 0x41, 0x06,
-             0x00, 0x04, 0xa1, 0x7b,
-             0x80, 0x1c, 0x87, 0x11,
-             0xdf, 0xfc, 0x27, 0xf8,
-             0x6d, 0x38, 0xdd, 0x65,
-             0x8c, 0x0b, 0x6f, 0xf8,
-             0x63, 0x11, 0x0c, 0x09,
-             0x40, 0x0a, 0xc0, 0x2d,
-             0x8e, 0xf5, 0xe0, 0x80,
-             0x6f, 0xf8, 0x77, 0xc8,
-             0x6d, 0x78, 0x8c, 0x0b,
-             0x8c, 0x0b, 0x6f, 0xf8,
-             0x6f, 0xf8, 0x70, 0xa8,
-             0x87, 0xc5, 0x8c, 0x0b,
-             0x68, 0x18, 0x78, 0xc8,
-             0x74, 0xd8, 0x8c, 0x0b,
-             0x8c, 0x0b, 0x6f, 0xf8,
-             0x81, 0x01, 0x01, 0x95,
-             0x8c, 0x0b, 0x01, 0x31,
-             0x8e, 0x2b, 0x0c, 0x1b,
-             0xef, 0xf8, 0x62, 0xa8,
-             0x0e, 0x0a, 0x82, 0x71,
-             0xfc, 0xf5, 0xe0, 0x40,
-             0x80, 0x7b, 0x21, 0x0b,
-             0xdf, 0xfc, 0x26, 0x48,
-             0x68, 0x00, 0x69, 0xe8,
-             0x0c, 0x0b, 0x8c, 0x0b,
-             0x40, 0x16, 0x66, 0x35,
-             0x40, 0x4a, 0x81, 0x71,
-             0x25, 0x98, 0xe0, 0x80,
-             0x6a, 0x78, 0x9f, 0xfc,
-             0x8c, 0x0b, 0x6f, 0xf8,
-             0x63, 0x11, 0x0c, 0x09,
-             0x40, 0x0a, 0xc0, 0x2d,
-             0x92, 0xd5, 0xe0, 0x80,
-             0x6f, 0xf8, 0x75, 0x48,
-             0x6b, 0xb8, 0x8c, 0x0b,
-             0x8c, 0x0b, 0x6f, 0xf8,
-             0x6f, 0xf8, 0x6f, 0x48,
-             0x89, 0x75, 0x8c, 0x0b,
-             0x6f, 0xf8, 0x56, 0xa8,
-             0x0c, 0x0b, 0x8c, 0x0b,
-             0x58, 0x18, 0x8c, 0x1b,
-             0x51, 0x06, 0xef, 0xf8,
-             0x89, 0x11, 0x61, 0x34,
-             0x00, 0x1c, 0xa0, 0x04,
-             0xe0, 0x08, 0x01, 0x36,
-             0x6c, 0x1d, 0x4c, 0x01,
-             0x8c, 0x0b, 0x40, 0x2b,
-             0xef, 0xf0, 0x6f, 0x28,
-             0x80, 0x7b, 0x20, 0x04,
-             0xa1, 0x7b, 0x0b, 0x11,
-             0xe1, 0x34, 0x50, 0x06,
-             0x21, 0xa8, 0x80, 0x1c,
-             0x0c, 0x09, 0xdf, 0xfc,
-             0xc0, 0x2d, 0x67, 0xc9,
-             0x82, 0x15, 0xa3, 0x0b,
-             0x68, 0x00, 0x46, 0xc8,
-             0x80, 0x7b, 0x8c, 0x0b,
-             0x20, 0xe8, 0xa1, 0x7b,
-             0x20, 0x04, 0xdf, 0xfc,
-             0xe0, 0x04, 0x02, 0x56,
-             0x6c, 0x1d, 0x4c, 0x11,
-             0x80, 0x16, 0xc0, 0x2b,
-             0x6c, 0x81, 0x0c, 0x09,
-             0x02, 0x00, 0xc0, 0x2c,
-             0xe5, 0x1d, 0xec, 0x04,
-             0x40, 0x46, 0x86, 0xc5,
-             0x83, 0x11, 0x61, 0x04,
-             0x00, 0x16, 0x80, 0x04,
-             0xe1, 0x0c, 0x01, 0x06,
-             0x02, 0x06, 0x00, 0x04,
-             0x80, 0x1e, 0xe8, 0x00,
-             0x53, 0x58, 0xcd, 0x95,
-             0x8c, 0x0b, 0x6f, 0xf8,
-             0x43, 0xb6, 0x20, 0x04,
-             0x4c, 0x11, 0xe0, 0x08,
-             0xc0, 0x2b, 0x6c, 0x1d,
-             0x83, 0x11, 0x00, 0x16,
-             0x68, 0x00, 0x68, 0x08,
-             0x1f, 0x38, 0x8c, 0x0b,
-             0x80, 0x7b, 0x7f, 0xfc,
-             0x40, 0x46, 0xa1, 0x0b,
-             0x02, 0x06, 0x01, 0x04,
-             0x00, 0x05, 0x80, 0x00,
-             0x40, 0x11, 0x80, 0x00,
-             0xc9, 0xe5, 0x80, 0x00,
-             0xfa, 0x04, 0x04, 0x4c,
-             0x6e, 0x99, 0x00, 0x29,
-             0x02, 0x06, 0x40, 0x2c,
-             0x04, 0x14, 0xe1, 0x14,
-             0xe1, 0x14, 0x4c, 0x06,
-             0xe1, 0x38, 0x4f, 0x06,
-             0x98, 0x14, 0x84, 0x26,
-             0xe0, 0x29, 0x84, 0x28,
-             0x9c, 0x14, 0x84, 0x26,
-             0x44, 0x20, 0x84, 0x28,
-             0x84, 0x26, 0xf3, 0xdc,
-             0x84, 0x28, 0x9c, 0x14,
-             0xf3, 0xbc, 0x44, 0x20,
-             0x02, 0x46, 0x04, 0x26,
-             0x84, 0x14, 0xe1, 0x10,
-             0xc2, 0x29, 0x84, 0x28,
-             0x4d, 0x58, 0x84, 0x26,
-             0x9c, 0x14, 0xef, 0xe8,
-             0xe0, 0x29, 0x84, 0x28,
-             0x98, 0x14, 0x84, 0x26,
-             0x44, 0x20, 0x84, 0x28,
-             0x84, 0x26, 0xf3, 0xbc,
-             0xf2, 0x04, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x30, 0x1e, 0xf0,
-             0x08, 0x09, 0x80, 0x4b,
-             0xc0, 0x2d, 0x67, 0xcd,
-             0xe0, 0x8c, 0x40, 0x0a,
-             0x08, 0x0b, 0x96, 0xd5,
-             0x40, 0x16, 0x6b, 0xe1,
-             0x66, 0x81, 0x12, 0x40,
-             0x14, 0x40, 0xc0, 0xb5,
-             0x40, 0xb5, 0x65, 0x41,
-             0xbc, 0x4e, 0x81, 0x71,
-             0x73, 0xf1, 0x40, 0x00,
-             0x88, 0x03, 0xc0, 0xff,
-             0x64, 0x01, 0x10, 0x00,
-             0x00, 0x40, 0x40, 0x28,
-             0xc0, 0xb3, 0x66, 0xb1,
-             0x00, 0x40, 0x7c, 0x0e,
-             0xc0, 0x9c, 0x67, 0x41,
-             0x87, 0xb5, 0xbe, 0x0e,
-             0x7c, 0x04, 0xa8, 0x0a,
-             0x73, 0xf1, 0x4c, 0x00,
-             0x28, 0xba, 0xc0, 0xff,
-             0x81, 0x6b, 0x88, 0x63,
-             0x6a, 0xd8, 0x80, 0xf5,
-             0x88, 0x0b, 0x68, 0x10,
-             0xa1, 0x0b, 0x3c, 0x44,
-             0xbe, 0x04, 0x8c, 0x15,
-             0x80, 0xf5, 0x81, 0x6b,
-             0x68, 0x10, 0x68, 0x68,
-             0x3c, 0x44, 0x88, 0x0b,
-             0x88, 0xf5, 0xa1, 0x0b,
-             0xa1, 0x0b, 0xa4, 0x0a,
-             0x24, 0x0a, 0x86, 0xa5,
-             0xa4, 0x1a, 0xe0, 0xb7,
-             0x21, 0x0b, 0x9e, 0x09,
-             0x73, 0xc1, 0x44, 0x10,
-             0x20, 0xbf, 0xc0, 0xff,
-             0x00, 0x16, 0xc9, 0x17,
-             0xa4, 0xbf, 0x00, 0x00,
-             0xe6, 0x86, 0x40, 0x0a,
-             0x45, 0x07, 0xe1, 0xbe,
-             0x01, 0x65, 0x90, 0x2b,
-             0x59, 0x34, 0x80, 0x1b,
-             0xec, 0x04, 0x02, 0x10,
-             0xa1, 0x1b, 0xc9, 0x3e,
-             0xc4, 0x07, 0xfe, 0x75,
-             0x04, 0x91, 0x80, 0x83,
-             0x82, 0x71, 0x84, 0xa1,
-             0xe4, 0x9c, 0x0f, 0x0a,
-             0x81, 0x01, 0xf0, 0x85,
-             0x0c, 0x0c, 0x98, 0xf1,
-             0xdd, 0x93, 0xf2, 0x7c,
-             0x6c, 0x1d, 0x08, 0x29,
-             0x40, 0x00, 0x40, 0x2b,
-             0x48, 0x01, 0xf3, 0xf4,
-             0x40, 0x2d, 0x67, 0xcd,
-             0xe0, 0x0c, 0x0e, 0x36,
-             0x60, 0x0c, 0x02, 0x36,
-             0x59, 0x98, 0x88, 0x0b,
-             0x23, 0x0b, 0xef, 0xd4,
-             0x0e, 0x06, 0x98, 0xf1,
-             0x8e, 0x0b, 0xc0, 0x00,
-             0xf2, 0x7c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x0c, 0x04, 0x0c,
-             0x82, 0x7b, 0x00, 0x6b,
-             0x6d, 0x21, 0x0c, 0x09,
-             0x81, 0x81, 0x40, 0x2c,
-             0xe0, 0x84, 0x40, 0x0a,
-             0x40, 0x46, 0x8a, 0xe5,
-             0x85, 0x31, 0x61, 0x04,
-             0x83, 0x41, 0x00, 0x04,
-             0x8c, 0x0b, 0x00, 0x86,
-             0x63, 0x7d, 0x0c, 0x15,
-             0x76, 0xb8, 0xc0, 0x0b,
-             0x82, 0x2b, 0x68, 0x14,
-             0x63, 0x11, 0x0c, 0x09,
-             0x40, 0x4a, 0xc0, 0x2d,
-             0x82, 0xc5, 0xe0, 0x80,
-             0x6f, 0xfc, 0x40, 0x68,
-             0x45, 0x58, 0x8c, 0x0b,
-             0x8c, 0x0b, 0x68, 0x14,
-             0x79, 0x41, 0x02, 0x06,
-             0x8c, 0x0b, 0x5d, 0xcd,
-             0xef, 0xfc, 0x45, 0x28,
-             0x0c, 0x0b, 0x81, 0x55,
-             0x48, 0xd8, 0x8e, 0x1b,
-             0x00, 0x8b, 0xef, 0xf8,
-             0x43, 0x78, 0x8c, 0x0b,
-             0x0c, 0x09, 0xe8, 0x14,
-             0xc0, 0x2c, 0x6d, 0x01,
-             0x65, 0x3d, 0x4c, 0x01,
-             0x90, 0x0b, 0xc0, 0x22,
-             0xf2, 0x0c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x6c, 0x81, 0x00, 0x09,
-             0x02, 0x00, 0xc0, 0x2c,
-             0xe5, 0x1d, 0xec, 0x04,
-             0x40, 0x46, 0x82, 0xa5,
-             0x83, 0x11, 0x61, 0x04,
-             0x00, 0x16, 0x80, 0x04,
-             0xe1, 0x0c, 0x01, 0x06,
-             0x02, 0x06, 0x00, 0x04,
-             0x80, 0x1e, 0xe8, 0x00,
-             0xa1, 0x0b, 0xdd, 0x93,
-             0xda, 0x00, 0x5c, 0x08,
-             0x61, 0x04, 0x40, 0x46,
-             0x80, 0x04, 0x81, 0x11,
-             0xdd, 0x93, 0x80, 0x16,
-             0xfa, 0x7c, 0x04, 0x4c,
-             0x82, 0x6b, 0x00, 0x7b,
-             0x6d, 0x39, 0x0e, 0x09,
-             0x81, 0x81, 0x40, 0x2c,
-             0xe0, 0x80, 0x40, 0x0a,
-             0x0e, 0x09, 0x9c, 0xe5,
-             0xc0, 0x2d, 0x63, 0x11,
-             0x6d, 0x41, 0x4e, 0x81,
-             0x40, 0x4a, 0xc0, 0x2c,
-             0x40, 0x70, 0xe0, 0x80,
-             0x5e, 0x58, 0xdc, 0x00,
-             0x55, 0x06, 0xc8, 0x00,
-             0x91, 0xb1, 0x61, 0x34,
-             0x0e, 0x09, 0x8b, 0xf5,
-             0xc0, 0x2d, 0x63, 0x11,
-             0xe0, 0x80, 0x40, 0x0a,
-             0x12, 0x06, 0x04, 0x75,
-             0x02, 0x06, 0xc0, 0x00,
-             0x5d, 0xcd, 0x79, 0x41,
-             0x40, 0x18, 0x8e, 0x0b,
-             0x01, 0xd5, 0xef, 0xfc,
-             0x03, 0x31, 0x80, 0x8b,
-             0x0c, 0x1b, 0x8e, 0x0b,
-             0x46, 0xb8, 0x92, 0x2b,
-             0x00, 0x8b, 0xef, 0xf8,
-             0x12, 0x0a, 0x82, 0x91,
-             0xfc, 0xd5, 0xe0, 0x40,
-             0x6d, 0x41, 0x0e, 0x09,
-             0xa1, 0x0b, 0xc0, 0x2c,
-             0x00, 0x00, 0x14, 0x05,
-             0x80, 0x00, 0x02, 0x66,
-             0x80, 0x00, 0x40, 0x13,
-             0x0d, 0x41, 0x0e, 0x09,
-             0x00, 0x0a, 0x80, 0x2c,
-             0x14, 0x05, 0xf0, 0x04,
-             0x40, 0xb3, 0x80, 0x00,
-             0xa1, 0x8b, 0x00, 0x00,
-             0x01, 0x11, 0x8a, 0xf5,
-             0x51, 0x98, 0x8e, 0x0b,
-             0x0e, 0x09, 0xe8, 0x00,
-             0x40, 0x2c, 0x6d, 0x41,
-             0xa1, 0x0b, 0x80, 0x8b,
-             0x00, 0x00, 0x14, 0x05,
-             0x80, 0x00, 0x02, 0x76,
-             0x80, 0x00, 0x40, 0x13,
-             0x0d, 0x41, 0x0e, 0x09,
-             0x00, 0x0a, 0x80, 0x2c,
-             0x14, 0x05, 0xf0, 0x04,
-             0x02, 0x96, 0x00, 0x00,
-             0x40, 0x13, 0x80, 0x00,
-             0xa1, 0x8b, 0x00, 0x00,
-             0x0e, 0x1b, 0x82, 0x95,
-             0x40, 0x16, 0x66, 0x35,
-             0x0e, 0x29, 0x8e, 0x0b,
-             0xc0, 0x2c, 0x6d, 0x09,
-             0x6f, 0xcc, 0x4b, 0x88,
-             0x80, 0x8b, 0x82, 0x19,
-             0x6d, 0x41, 0x0e, 0x09,
-             0x82, 0x01, 0xc0, 0x2c,
-             0x6d, 0x41, 0x4e, 0x01,
-             0x0e, 0x09, 0xc0, 0x2c,
-             0xc0, 0x2c, 0x6d, 0x41,
-             0x6d, 0x11, 0x0e, 0x19,
-             0xc3, 0x0d, 0xc0, 0x2c,
-             0x90, 0x0b, 0xe6, 0x75,
-             0xf2, 0x7c, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x63, 0x81, 0x00, 0x15,
-             0x85, 0x31, 0x40, 0x0b,
-             0x63, 0x85, 0x00, 0x25,
-             0x81, 0x41, 0x40, 0x0b,
-             0xe0, 0x14, 0x29, 0x88,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x0c, 0x09, 0x80, 0x6b,
-             0xc0, 0x2c, 0x6d, 0x51,
-             0x60, 0x80, 0x40, 0x0a,
-             0x82, 0x85, 0x81, 0x01,
-             0x68, 0x00, 0x56, 0xa8,
-             0x0c, 0x19, 0x8c, 0x0b,
-             0xc0, 0x2d, 0x67, 0xc9,
-             0x40, 0x60, 0xab, 0x1b,
-             0x68, 0x38, 0x9c, 0x00,
-             0x0c, 0x19, 0x8f, 0xfc,
-             0xc0, 0x2c, 0x6d, 0x51,
-             0xe0, 0x84, 0x42, 0x0a,
-             0x64, 0x58, 0x82, 0x85,
-             0x8c, 0x0b, 0x6f, 0xf0,
-             0x67, 0xc9, 0x0c, 0x19,
-             0xb1, 0x1b, 0xc0, 0x2d,
-             0x9c, 0x00, 0x40, 0x60,
-             0x8f, 0xfc, 0x67, 0x28,
-             0x6d, 0x51, 0x0c, 0x19,
-             0x42, 0x0a, 0xc0, 0x2c,
-             0x82, 0xa5, 0xe0, 0x88,
-             0x68, 0x00, 0x56, 0x48,
-             0x0c, 0x19, 0x8c, 0x0b,
-             0xc0, 0x2d, 0x67, 0xc9,
-             0x80, 0xb5, 0xb3, 0x1b,
-             0x0c, 0x0c, 0x8c, 0x0b,
-             0xcb, 0xf5, 0xf2, 0x00,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x84, 0x04, 0x0c,
-             0x0c, 0x09, 0x80, 0x6b,
-             0xc0, 0x2d, 0x65, 0x31,
-             0xe0, 0x80, 0x40, 0x4a,
-             0x0c, 0x09, 0x80, 0xe5,
-             0xc0, 0x2d, 0x65, 0x35,
-             0xe0, 0x80, 0x40, 0x0a,
-             0x0d, 0x11, 0x8c, 0x85,
-             0x79, 0x41, 0x04, 0x06,
-             0x71, 0x18, 0xdd, 0xcd,
-             0x8c, 0x0b, 0x6f, 0xf8,
-             0x80, 0x85, 0xa1, 0x0b,
-             0xf2, 0x84, 0x0c, 0x0c,
-             0x50, 0x78, 0xdd, 0x93,
-             0x8c, 0x0b, 0x6f, 0xf8,
-             0x6a, 0xad, 0x0c, 0x09,
-             0x0c, 0x79, 0xc0, 0x2b,
-             0xc0, 0x2c, 0x6c, 0xfd,
-             0x1e, 0x79, 0xa3, 0x0b,
-             0x9c, 0x00, 0x40, 0x60,
-             0x08, 0x10, 0x68, 0xe8,
-             0x9a, 0x80, 0x02, 0x74,
-             0x6d, 0x51, 0x0c, 0x09,
-             0x40, 0x0a, 0xc0, 0x2c,
-             0x84, 0x25, 0xe0, 0x8c,
-             0x61, 0x34, 0x40, 0x06,
-             0xe0, 0x08, 0x45, 0xa6,
-             0x02, 0x74, 0x00, 0x04,
-             0x4c, 0x21, 0xfa, 0x80,
-             0xc0, 0x2b, 0x6c, 0x1d,
-             0x8c, 0x0b, 0x00, 0x26,
-             0xe8, 0x00, 0x4d, 0x88,
-             0xf4, 0xf5, 0xa1, 0x0b,
-             0x04, 0x06, 0x0f, 0x11,
-             0xdd, 0xcd, 0x79, 0x41,
-             0x0c, 0x0c, 0x8c, 0x0b,
-             0x2d, 0xb8, 0xf2, 0x84,
-             0xc1, 0xc3, 0xff, 0xf8,
-             0xfa, 0x04, 0x04, 0x4c,
-             0x81, 0x01, 0x00, 0x6b,
-             0x6f, 0xe4, 0x6b, 0x88,
-             0x00, 0x7b, 0x81, 0x11,
-             0xe1, 0x48, 0x40, 0x06,
-             0x80, 0x08, 0x80, 0x04,
-             0xe0, 0x90, 0x40, 0x0a,
-             0x0c, 0x09, 0x8c, 0xe5,
-             0xc0, 0x2d, 0x67, 0xcd,
-             0xe0, 0x84, 0x40, 0x0a,
-             0x0c, 0x09, 0x8c, 0x25,
-             0xc0, 0x2c, 0x6d, 0x15,
-             0xe0, 0x90, 0x40, 0x4a,
-             0x0c, 0x09, 0x80, 0xc5,
-             0xc0, 0x2c, 0x6c, 0xfd,
-             0x88, 0xd5, 0xa1, 0x0b,
-             0x60, 0x3c, 0x41, 0xf6,
-             0x49, 0x78, 0x83, 0x11,
-             0x42, 0x06, 0xef, 0x84,
-             0x8c, 0x0b, 0x60, 0x00,
-             0xef, 0xe4, 0x7f, 0x68,
-             0x61, 0x38, 0x00, 0x06,
-             0xe0, 0x0c, 0x43, 0xf6,
-             0x88, 0x1e, 0x80, 0x24,
-             0xc3, 0x13, 0xc1, 0x83,
-             0x67, 0xcd, 0x0c, 0x29,
-             0x44, 0x0a, 0xc0, 0x2d,
-             0xfc, 0xe5, 0xe0, 0x88,
-             0x60, 0x00, 0x42, 0x16,
-             0x7e, 0x38, 0x8c, 0x0b,
-             0x0c, 0x09, 0xef, 0xe4,
-             0xc0, 0x2d, 0x67, 0xcd,
-             0xf3, 0xec, 0x40, 0x00,
-             0x67, 0xcd, 0x4c, 0x01,
-             0x03, 0x11, 0xc0, 0x2d,
-             0x67, 0x58, 0x8e, 0x0b,
-             0x81, 0x01, 0xef, 0xe4,
-             0xf2, 0x04, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfe, 0x7c, 0x04, 0x0c,
-             0xec, 0x60, 0x1e, 0xf0,
-             0x80, 0x6b, 0x3e, 0x1e,
-             0x65, 0x0d, 0x0c, 0x09,
-             0x81, 0x11, 0x40, 0x2b,
-             0x81, 0xa1, 0x0b, 0x1e,
-             0x00, 0x2a, 0x91, 0x1c,
-             0x81, 0x01, 0x60, 0x04,
-             0x00, 0x98, 0xfe, 0x0e,
-             0xc0, 0x00, 0x40, 0x01,
-             0x64, 0x50, 0x02, 0xf0,
-             0x59, 0x78, 0x8c, 0x0b,
-             0x80, 0xab, 0xef, 0xd0,
-             0x60, 0x48, 0x02, 0x06,
-             0x61, 0xb8, 0x8c, 0x0b,
-             0x00, 0x60, 0xe8, 0x14,
-             0x40, 0x09, 0x64, 0x01,
-             0x61, 0x01, 0x12, 0x06,
-             0x7c, 0x0e, 0xc0, 0x20,
-             0xe6, 0xe4, 0x10, 0x06,
-             0x81, 0x71, 0x09, 0x15,
-             0x6e, 0x19, 0x0c, 0x0b,
-             0x40, 0x0a, 0xc0, 0x15,
-             0x8c, 0x65, 0xe4, 0x9c,
-             0xf0, 0x9c, 0x40, 0x62,
-             0x68, 0x81, 0x00, 0xb9,
-             0x16, 0x0a, 0xc0, 0x1b,
-             0x8a, 0x65, 0xe3, 0xfc,
-             0x40, 0x01, 0x01, 0x78,
-             0xbe, 0x04, 0xc0, 0x00,
-             0x04, 0x06, 0xa1, 0x0b,
-             0x06, 0x16, 0x00, 0x24,
-             0x40, 0x60, 0x80, 0x00,
-             0x42, 0x90, 0x1c, 0x00,
-             0x42, 0x62, 0x9c, 0x00,
-             0x45, 0x06, 0x50, 0xa0,
-             0x06, 0x46, 0xc0, 0x18,
-             0x40, 0x60, 0x40, 0x00,
-             0x62, 0x78, 0xdc, 0x00,
-             0x0b, 0x34, 0xe8, 0x04,
-             0xe4, 0x40, 0x0a, 0xf0,
-             0x8c, 0x1b, 0x0c, 0x0b,
-             0x96, 0x4b, 0x7c, 0x24,
-             0xef, 0xd0, 0x57, 0x68,
-             0xa1, 0xab, 0x80, 0xab,
-             0x7e, 0x14, 0x84, 0xb5,
-             0x91, 0x0a, 0x81, 0xa1,
-             0xfb, 0x80, 0x02, 0x14,
-             0xfe, 0x0e, 0x82, 0x03,
-             0x12, 0x90, 0x02, 0x71,
-             0xc0, 0x02, 0x65, 0x01,
-             0x66, 0xc1, 0x10, 0x80,
-             0xfe, 0x7d, 0xc0, 0x01,
-             0xfe, 0x04, 0xf0, 0x05,
-             0x62, 0x99, 0x4c, 0x03,
-             0x14, 0x0b, 0xc0, 0x16,
-             0x0c, 0x0c, 0xb0, 0xf1,
-             0xdd, 0x93, 0xf6, 0x7c,
-             0xe1, 0x10, 0x00, 0x46,
-             0x80, 0x18, 0x80, 0x04,
-             0xf3, 0xf8, 0x42, 0x10,
-             0xdd, 0x93, 0x80, 0x16,
-             0xfa, 0x84, 0x04, 0x0c,
-             0x80, 0x7b, 0x02, 0x6b,
-             0xef, 0xf0, 0x6f, 0xa8,
-             0x82, 0xb5, 0xa1, 0x0b,
-             0x66, 0x35, 0x0e, 0x1b,
-             0x42, 0x0a, 0xc0, 0x16,
-             0x80, 0xe5, 0xe0, 0x80,
-             0x8c, 0x1b, 0x0e, 0x0b,
-             0xf2, 0x84, 0x0c, 0x0c,
-             0xe0, 0x10, 0x14, 0x08,
-             0xf2, 0x84, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x63, 0x89, 0x00, 0x15,
-             0x85, 0x31, 0x40, 0x0b,
-             0x04, 0x10, 0x83, 0x41,
-             0x12, 0x58, 0xec, 0x28,
-             0xc1, 0xc3, 0xe0, 0x14,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x0c, 0x09, 0x80, 0x6b,
-             0xc0, 0x2d, 0x67, 0xc9,
-             0x82, 0x35, 0xad, 0x0b,
-             0x6f, 0xfc, 0x51, 0xa8,
-             0xa1, 0x0b, 0x8c, 0x0b,
-             0x0c, 0x09, 0x82, 0xb5,
-             0xc0, 0x2d, 0x67, 0xc9,
-             0x70, 0x1c, 0x00, 0x0a,
-             0x80, 0xd5, 0x81, 0x01,
-             0x0c, 0x0c, 0x8c, 0x0b,
-             0x10, 0xb8, 0xf2, 0x00,
-             0x0c, 0x0c, 0xff, 0xfc,
-             0xdd, 0x93, 0xf2, 0x00,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x0c, 0x09, 0x80, 0x6b,
-             0xc0, 0x2c, 0x6d, 0x15,
-             0xe0, 0x90, 0x40, 0x0a,
-             0x81, 0x01, 0x80, 0xb5,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0x57, 0x78, 0xdd, 0x93,
-             0x8c, 0x0b, 0x6f, 0xf0,
-             0x0c, 0x0c, 0x8c, 0x0b,
-             0x1c, 0x38, 0xf2, 0x00,
-             0xc1, 0xc3, 0xff, 0xf0,
-             0xfa, 0x0c, 0x04, 0x0c,
-             0x4a, 0x06, 0x00, 0x6b,
-             0x0c, 0x09, 0xef, 0x14,
-             0xc0, 0x2c, 0x6d, 0x0d,
-             0x6d, 0x15, 0x0c, 0x19,
-             0x0c, 0x2b, 0xc0, 0x2c,
-             0xc0, 0x16, 0x66, 0x31,
-             0x6c, 0xed, 0x0c, 0x79,
-             0x40, 0x4a, 0x40, 0x2c,
-             0x0c, 0x89, 0xe0, 0x80,
-             0xc0, 0x2c, 0x6c, 0x71,
-             0x6c, 0xf1, 0x0c, 0x49,
-             0x42, 0x10, 0x40, 0x2c,
-             0x02, 0x14, 0xdc, 0x20,
-             0x40, 0x0a, 0x1c, 0x0c,
-             0x06, 0x60, 0xe0, 0x90,
-             0xc0, 0xb3, 0x05, 0x31,
-             0x05, 0x35, 0x06, 0x60,
-             0x8c, 0x38, 0x80, 0xb3,
-             0x6d, 0x11, 0x4c, 0x31,
-             0x46, 0x10, 0x40, 0x2c,
-             0x4c, 0x31, 0xfc, 0x10,
-             0xc0, 0x2c, 0x6d, 0x15,
-             0x4a, 0x0a, 0x94, 0x58,
-             0x04, 0x24, 0xe0, 0x84,
-             0x04, 0x24, 0xc0, 0x84,
-             0x85, 0x4b, 0xfa, 0x80,
-             0xdc, 0x10, 0x02, 0x34,
-             0x1c, 0x50, 0x42, 0x10,
-             0xe0, 0x8c, 0x40, 0x4a,
-             0x6d, 0x15, 0x4c, 0x11,
-             0x40, 0x10, 0x40, 0x2c,
-             0x4c, 0x01, 0x93, 0xf0,
-             0x80, 0x2c, 0x0d, 0x15,
-             0x50, 0xd8, 0x80, 0x85,
-             0x8c, 0x0b, 0x68, 0x04,
-             0x63, 0x11, 0x0c, 0x09,
-             0x40, 0x0a, 0xc0, 0x2d,
-             0x0c, 0x09, 0xe0, 0x80,
-             0xc0, 0x2c, 0x0d, 0x15,
-             0xd3, 0xf8, 0x40, 0x00,
-             0x0d, 0x15, 0x4c, 0x01,
-             0x10, 0x0a, 0x40, 0x2c,
-             0x84, 0x65, 0xff, 0xfc,
-             0x7a, 0x80, 0x00, 0x84,
-             0xfa, 0x80, 0x02, 0x74,
-             0x0c, 0x09, 0x81, 0x1b,
-             0x00, 0x2c, 0x0d, 0x15,
-             0x80, 0x00, 0x02, 0x06,
-             0x0d, 0x11, 0x4c, 0x11,
-             0x40, 0x00, 0x80, 0x2c,
-             0x4c, 0x01, 0x93, 0xe0,
-             0x80, 0x2c, 0x0d, 0x15,
-             0x0c, 0x0c, 0x81, 0x01,
-             0xdd, 0x93, 0xf2, 0x0c,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x68, 0x00, 0x43, 0x08,
-             0x44, 0xf8, 0x80, 0x6b,
-             0x8c, 0x0b, 0x68, 0x0c,
-             0x6c, 0x11, 0x0c, 0x09,
-             0x40, 0x0a, 0xc0, 0x2b,
-             0x84, 0x65, 0xe0, 0x94,
-             0xef, 0x14, 0x41, 0x86,
-             0x40, 0x0a, 0x80, 0x08,
-             0x82, 0xb5, 0xe0, 0x80,
-             0x6c, 0x21, 0x0c, 0x09,
-             0xa7, 0x0b, 0xc0, 0x2b,
-             0x52, 0x78, 0x82, 0xb5,
-             0x8c, 0x0b, 0x6f, 0xfc,
-             0x68, 0x04, 0x67, 0x68,
-             0x81, 0x45, 0x8c, 0x0b,
-             0x6f, 0xd8, 0x5a, 0xc8,
-             0xa1, 0x0b, 0x8c, 0x0b,
-             0x57, 0x58, 0x82, 0x55,
-             0x8c, 0x0b, 0x68, 0x00,
-             0x80, 0xb5, 0xa1, 0x0b,
-             0x68, 0x00, 0x44, 0xe8,
-             0x81, 0x01, 0x8c, 0x0b,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x6c, 0x21, 0x00, 0x19,
-             0x45, 0xc6, 0x40, 0x2b,
-             0x40, 0x21, 0xe0, 0x08,
-             0xc0, 0x2b, 0x6c, 0x1d,
-             0x42, 0x26, 0xa3, 0x1b,
-             0x40, 0x11, 0x80, 0x00,
-             0x80, 0x2b, 0x0c, 0x1d,
-             0xa7, 0x1b, 0x8a, 0x45,
-             0xa5, 0x1b, 0x82, 0x05,
-             0x80, 0x00, 0x42, 0x36,
-             0x0c, 0x1d, 0x40, 0x11,
-             0x85, 0x15, 0x80, 0x2b,
-             0xe0, 0x00, 0x42, 0x46,
-             0x6c, 0x1d, 0x40, 0x11,
-             0x42, 0x06, 0x40, 0x2b,
-             0x84, 0x28, 0xef, 0x14,
-             0xf0, 0xc0, 0x44, 0x20,
-             0xe0, 0x40, 0x04, 0x0a,
-             0x84, 0x28, 0x80, 0xe5,
-             0xf0, 0xc0, 0x44, 0x20,
-             0xe0, 0x80, 0x04, 0x0a,
-             0x84, 0x28, 0x80, 0xb5,
-             0xf3, 0xdc, 0x44, 0x20,
-             0x00, 0x29, 0x84, 0x26,
-             0xc0, 0x2b, 0x6c, 0x11,
-             0xe0, 0x94, 0x44, 0x0a,
-             0xc0, 0x00, 0x04, 0x16,
-             0xc0, 0xa0, 0x42, 0x21,
-             0x6e, 0x09, 0x00, 0x1b,
-             0xc4, 0x19, 0xc0, 0x15,
-             0x6e, 0x09, 0x40, 0x13,
-             0x40, 0x06, 0x40, 0x15,
-             0x80, 0x18, 0xef, 0x14,
-             0xf3, 0xf8, 0x42, 0x10,
-             0xdd, 0x93, 0x80, 0x16,
-             0xfa, 0x9c, 0x04, 0x0c,
-             0x81, 0x01, 0x00, 0x7b,
-             0x6f, 0xe4, 0x4b, 0x48,
-             0x81, 0x81, 0x81, 0x11,
-             0x6c, 0x21, 0x0e, 0x09,
-             0x80, 0x6b, 0x40, 0x2b,
-             0xe0, 0x08, 0x43, 0xd6,
-             0x6c, 0x1d, 0x4e, 0x11,
-             0xa5, 0x0b, 0xc0, 0x2b,
-             0xa7, 0x0b, 0x88, 0x45,
-             0x0e, 0x0b, 0xa2, 0x75,
-             0xc0, 0x15, 0x6e, 0x09,
-             0x73, 0x75, 0x40, 0x00,
-             0x00, 0x04, 0xc0, 0xff,
-             0x4e, 0x03, 0xfc, 0x94,
-             0x40, 0x15, 0x6e, 0x09,
-             0x6d, 0xd8, 0x8e, 0x0b,
-             0x48, 0x38, 0xef, 0xc0,
-             0x8e, 0x0b, 0x68, 0x00,
-             0x64, 0xd5, 0x0e, 0x09,
-             0xa7, 0x0b, 0xc0, 0x2b,
-             0xa5, 0x0b, 0x86, 0x05,
-             0x40, 0x06, 0x08, 0xc5,
-             0xa3, 0x0b, 0x8f, 0x14,
-             0x03, 0xd5, 0x88, 0xf5,
-             0xef, 0x14, 0x40, 0x06,
-             0x6e, 0x09, 0x0e, 0x0b,
-             0x40, 0x00, 0xc0, 0x15,
-             0xc0, 0xff, 0x73, 0x71,
-             0xfc, 0x94, 0x00, 0x04,
-             0x6e, 0x09, 0x4e, 0x03,
-             0x0c, 0x0c, 0xc0, 0x15,
-             0xdd, 0x93, 0xf2, 0x9c,
-             0xef, 0x14, 0x40, 0x06,
-             0x42, 0x4a, 0x80, 0x18,
-             0x80, 0xe5, 0xe0, 0x8c,
-             0x6c, 0x15, 0x0e, 0x19,
-             0x42, 0x0a, 0xc0, 0x2b,
-             0x80, 0xa5, 0xe0, 0x84,
-             0x01, 0x55, 0x80, 0x08,
-             0xfc, 0x08, 0x00, 0x04,
-             0xc8, 0x09, 0x80, 0x08,
-             0xef, 0x14, 0x42, 0x06,
-             0x56, 0x38, 0x84, 0x06,
-             0x8e, 0x0b, 0x6f, 0xe8,
-             0xef, 0x14, 0x52, 0x06,
-             0x40, 0x0a, 0xa4, 0x08,
-             0x82, 0xb5, 0xe0, 0x80,
-             0x40, 0x0a, 0xa4, 0x08,
-             0x82, 0xf5, 0xe0, 0x88,
-             0x8e, 0x0b, 0x3d, 0x11,
-             0xef, 0xe4, 0x5b, 0x48,
-             0x68, 0x00, 0x49, 0x68,
-             0x87, 0x25, 0x8e, 0x0b,
-             0x8e, 0x0b, 0x3f, 0x11,
-             0xf2, 0x9c, 0x0c, 0x0c,
-             0xff, 0xe4, 0x1a, 0xa8,
-             0x6e, 0x09, 0x0e, 0x05,
-             0x02, 0x06, 0x40, 0x09,
-             0xc0, 0xfa, 0x60, 0x01,
-             0xe0, 0x02, 0x40, 0x1a,
-             0x64, 0xcd, 0x0e, 0x15,
-             0x04, 0x04, 0xc0, 0x05,
-             0xd0, 0x17, 0xe1, 0x84,
-             0xc2, 0x0d, 0x84, 0x13,
-             0xc0, 0x00, 0x00, 0x46,
-             0x00, 0x02, 0x40, 0x1a,
-             0xe1, 0x4c, 0x02, 0x06,
-             0x04, 0x0e, 0x84, 0x14,
-             0x0e, 0x0b, 0x95, 0x11,
-             0xc0, 0x15, 0x6e, 0x09,
-             0xfc, 0x98, 0x00, 0x04,
-             0x6e, 0x09, 0x4e, 0x03,
-             0x8e, 0x0b, 0x40, 0x15,
-             0xef, 0xe4, 0x58, 0x68,
-             0x60, 0x3c, 0x41, 0xf6,
-             0x61, 0xd8, 0x83, 0x11,
-             0x6f, 0x38, 0xef, 0x80,
-             0x52, 0x81, 0xef, 0xf0,
-             0x03, 0x11, 0xe0, 0xa0,
-             0x0c, 0x0c, 0x8c, 0x0b,
-             0x01, 0x58, 0xf2, 0x9c,
-             0xc1, 0xc3, 0xff, 0xe4,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x00, 0x46, 0x00, 0x6b,
-             0x00, 0x04, 0xe1, 0x24,
-             0xe0, 0x08, 0x43, 0xe6,
-             0x6c, 0x1d, 0x4c, 0x11,
-             0x44, 0x46, 0x40, 0x2b,
-             0x0c, 0x15, 0xe1, 0x24,
-             0xc0, 0x09, 0x6e, 0x09,
-             0x88, 0x24, 0x80, 0x08,
-             0x08, 0x34, 0xc5, 0x07,
-             0xf0, 0x0c, 0x44, 0x00,
-             0x68, 0x10, 0x79, 0xa8,
-             0x42, 0x06, 0x8c, 0x0b,
-             0x48, 0x86, 0x6f, 0x14,
-             0x86, 0x0e, 0xe0, 0x3c,
-             0xc4, 0x24, 0x86, 0x04,
-             0x68, 0xb1, 0x0c, 0x3b,
-             0x48, 0x0a, 0xc0, 0x0a,
-             0x00, 0x0e, 0x66, 0x92,
-             0xc3, 0xd0, 0x64, 0x00,
-             0x60, 0x0e, 0x40, 0x0a,
-             0x88, 0x23, 0xc9, 0x47,
-             0x40, 0x02, 0xc5, 0x0d,
-             0x02, 0x09, 0x91, 0x88,
-             0x40, 0x00, 0xc0, 0x00,
-             0x42, 0x01, 0xdc, 0x04,
-             0x00, 0x06, 0x40, 0x00,
-             0x4c, 0x05, 0xc0, 0x00,
-             0xc0, 0x05, 0x64, 0xcd,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x6e, 0x09, 0x00, 0x15,
-             0x04, 0x06, 0x40, 0x09,
-             0xc0, 0xfa, 0x60, 0x01,
-             0x64, 0xcd, 0x00, 0x05,
-             0x42, 0x2a, 0xc0, 0x05,
-             0xd0, 0x07, 0xe0, 0x06,
-             0xe1, 0x84, 0x04, 0x14,
-             0xc0, 0x1d, 0x84, 0x03,
-             0xc0, 0x00, 0x00, 0x46,
-             0x00, 0x06, 0x40, 0x0a,
-             0xe1, 0x4c, 0x02, 0x06,
-             0x84, 0x0e, 0x84, 0x14,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x41, 0xf6, 0x00, 0x6b,
-             0x4c, 0x01, 0xe0, 0x08,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x51, 0x38, 0xb7, 0x11,
-             0x8c, 0x0b, 0x6f, 0xe4,
-             0x64, 0xcd, 0x0c, 0x15,
-             0x02, 0x8a, 0xc0, 0x05,
-             0x80, 0xf5, 0xe5, 0x94,
-             0x8c, 0x0b, 0x01, 0x21,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0xe0, 0x10, 0x06, 0xc8,
-             0x8c, 0x0b, 0x3b, 0x11,
-             0xef, 0xe4, 0x50, 0x28,
-             0x60, 0x04, 0x42, 0x46,
-             0x8c, 0x0b, 0x81, 0x21,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0xe0, 0x10, 0x06, 0x08,
-             0xfa, 0x7c, 0x04, 0x4c,
-             0x41, 0x06, 0x00, 0x6b,
-             0x00, 0x04, 0xe1, 0x34,
-             0x00, 0xbc, 0x83, 0xb1,
-             0xe1, 0x90, 0x40, 0x06,
-             0xa1, 0xab, 0x80, 0xa8,
-             0x0c, 0x29, 0x82, 0x65,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x4e, 0x58, 0x8c, 0x0b,
-             0x94, 0x1b, 0x6f, 0xd0,
-             0x0c, 0x48, 0xa1, 0x0b,
-             0x0e, 0x60, 0xc0, 0x00,
-             0x40, 0xb3, 0x64, 0x51,
-             0x69, 0x98, 0x8c, 0x0b,
-             0x8e, 0x1b, 0x6f, 0xe4,
-             0x67, 0xcd, 0x0c, 0x09,
-             0x10, 0x60, 0x40, 0x2d,
-             0xc0, 0xaf, 0x64, 0x11,
-             0x81, 0x91, 0x01, 0xa1,
-             0x40, 0x0a, 0xc9, 0x07,
-             0x82, 0x09, 0x60, 0x80,
-             0x06, 0x31, 0x4c, 0x03,
-             0x00, 0x60, 0x40, 0x16,
-             0xc0, 0xb3, 0x64, 0xd1,
-             0x93, 0x95, 0x8f, 0x0e,
-             0xfb, 0xfc, 0x16, 0x0a,
-             0x13, 0x11, 0xa6, 0x05,
-             0x4c, 0x18, 0x8c, 0x0b,
-             0x12, 0x0a, 0xef, 0xe4,
-             0x41, 0x06, 0x7b, 0xfc,
-             0x4c, 0x01, 0xe0, 0x00,
-             0xc0, 0x2b, 0x6c, 0x1d,
-             0x41, 0x26, 0x9c, 0xa5,
-             0x4c, 0x01, 0xe0, 0x00,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x5b, 0xf8, 0x8c, 0x0b,
-             0x0f, 0x14, 0xe8, 0x00,
-             0x6d, 0xd8, 0x8c, 0x0b,
-             0x19, 0x11, 0xef, 0xe4,
-             0x4a, 0x98, 0x8c, 0x0b,
-             0x41, 0x66, 0xef, 0xe4,
-             0x4c, 0x01, 0xe0, 0x00,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x6d, 0x58, 0x8c, 0x0b,
-             0x80, 0xab, 0xe8, 0x00,
-             0x98, 0xf5, 0xa1, 0xab,
-             0xe0, 0x00, 0x41, 0x36,
-             0x6c, 0x1d, 0x4c, 0x01,
-             0x8c, 0x0b, 0x40, 0x2b,
-             0xe8, 0x10, 0x5b, 0x28,
-             0xa1, 0xab, 0x80, 0xab,
-             0x41, 0x46, 0x96, 0x95,
-             0x4c, 0x01, 0xe0, 0x00,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x4c, 0x38, 0x8c, 0x0b,
-             0x80, 0xab, 0xe8, 0x14,
-             0x94, 0x35, 0xa1, 0xab,
-             0x6d, 0x09, 0x0c, 0x09,
-             0x0c, 0x1b, 0xc0, 0x2c,
-             0xc0, 0x16, 0x66, 0x35,
-             0x6c, 0x04, 0x04, 0x00,
-             0xe0, 0x00, 0x41, 0x56,
-             0x6c, 0x1d, 0x4c, 0x01,
-             0x9e, 0x29, 0x40, 0x2b,
-             0x8c, 0x0b, 0x02, 0x19,
-             0xef, 0xc8, 0x46, 0x68,
-             0xa1, 0xab, 0x80, 0xab,
-             0x41, 0x76, 0x8e, 0x95,
-             0x4c, 0x01, 0xe0, 0x00,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x56, 0xb8, 0x8c, 0x0b,
-             0x80, 0xab, 0xef, 0xfc,
-             0x8c, 0x35, 0xa1, 0xab,
-             0x61, 0x34, 0x41, 0x06,
-             0xe0, 0x00, 0x43, 0x86,
-             0x4c, 0x11, 0x80, 0x04,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x00, 0x1c, 0x85, 0x11,
-             0x76, 0x58, 0x8c, 0x0b,
-             0x80, 0xab, 0xef, 0xf4,
-             0x88, 0x35, 0xa1, 0xab,
-             0x6c, 0x71, 0x0c, 0x09,
-             0x43, 0x96, 0x40, 0x2c,
-             0x4c, 0x11, 0xe0, 0x00,
-             0xc0, 0x2b, 0x6c, 0x1d,
-             0xe3, 0xfc, 0x00, 0x0a,
-             0x0c, 0x19, 0x80, 0xe5,
-             0xc0, 0x2c, 0x6c, 0xed,
-             0x16, 0x06, 0x81, 0x1b,
-             0x01, 0xf5, 0x80, 0x00,
-             0x41, 0x16, 0x81, 0xa1,
-             0x4c, 0x01, 0xe0, 0x00,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x42, 0x38, 0x8c, 0x0b,
-             0x00, 0xab, 0xe8, 0x00,
-             0xa1, 0xab, 0x83, 0x91,
-             0x83, 0x91, 0xe4, 0x25,
-             0x8e, 0x1b, 0x0c, 0x0b,
-             0xef, 0xe4, 0x5f, 0x08,
-             0x90, 0x1b, 0x0c, 0x0b,
-             0xef, 0xe4, 0x62, 0x48,
-             0xd8, 0xe5, 0xa1, 0xab,
-             0x6c, 0x91, 0x0c, 0x09,
-             0x21, 0x0b, 0xc0, 0x2c,
-             0xe0, 0x00, 0x41, 0xa6,
-             0x6c, 0x1d, 0x4c, 0x01,
-             0x40, 0x60, 0x40, 0x2b,
-             0x7c, 0xb8, 0x9c, 0x00,
-             0x94, 0x0b, 0x8f, 0xcc,
-             0xf2, 0x7c, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x04, 0x04, 0x4c,
-             0x03, 0x06, 0x00, 0x6b,
-             0x0c, 0x0b, 0xe0, 0x08,
-             0xc0, 0x15, 0x6e, 0x09,
-             0x6c, 0x1d, 0x4c, 0x11,
-             0x83, 0x11, 0x40, 0x2b,
-             0x6d, 0x09, 0x4c, 0x11,
-             0x40, 0x4a, 0xc0, 0x2c,
-             0x81, 0x01, 0x60, 0x94,
-             0x0d, 0x0d, 0x0c, 0x19,
-             0x4c, 0x03, 0xc0, 0x2c,
-             0xc0, 0x16, 0x66, 0x71,
-             0x6c, 0xe9, 0x4c, 0x01,
-             0x42, 0x10, 0xc0, 0x2c,
-             0x4c, 0x11, 0xdc, 0x40,
-             0xc0, 0x2c, 0x0d, 0x0d,
-             0x6d, 0x5d, 0x0c, 0x15,
-             0x0c, 0x29, 0xc0, 0x0c,
-             0xc0, 0x2c, 0x6d, 0x0d,
-             0xe0, 0x00, 0x02, 0x1a,
-             0xa0, 0x00, 0x00, 0x38,
-             0x44, 0x20, 0x80, 0xc5,
-             0x4c, 0x21, 0xf3, 0xdc,
-             0xc0, 0x2c, 0x6d, 0x0d,
-             0x66, 0x35, 0x0c, 0x1b,
-             0x44, 0x20, 0x40, 0x16,
-             0x4c, 0x01, 0xf3, 0xe0,
-             0x40, 0x2c, 0x6c, 0xed,
-             0x4c, 0x21, 0xc2, 0x29,
-             0x40, 0x2c, 0x6d, 0x0d,
-             0xe0, 0x0c, 0x45, 0xf6,
-             0x6c, 0xf1, 0x4c, 0x21,
-             0x42, 0x0a, 0x40, 0x2c,
-             0x4c, 0x03, 0xe0, 0x94,
-             0x40, 0x16, 0x06, 0x81,
-             0xe0, 0x88, 0x42, 0x0a,
-             0x0c, 0xf9, 0x4c, 0x21,
-             0x42, 0x0a, 0x40, 0x2c,
-             0x4c, 0x01, 0xe0, 0x8c,
-             0x40, 0x2c, 0x0c, 0xfd,
-             0xe0, 0x90, 0x42, 0x0a,
-             0x03, 0x35, 0x4c, 0x05,
-             0x42, 0x0a, 0x40, 0x0b,
-             0x4c, 0x21, 0xe0, 0x9c,
-             0xc0, 0x2c, 0x6c, 0xf5,
-             0x51, 0x98, 0x80, 0xe5,
-             0x8c, 0x0b, 0x6f, 0xf4,
-             0x66, 0x35, 0x0c, 0x1b,
-             0x42, 0x0a, 0xc0, 0x16,
-             0x86, 0x25, 0xe0, 0xa0,
-             0x67, 0xf1, 0x0c, 0x59,
-             0x8c, 0x0b, 0x40, 0x27,
-             0x67, 0xed, 0x0c, 0x49,
-             0x0c, 0x39, 0xc0, 0x27,
-             0xc0, 0x27, 0x67, 0xe9,
-             0x67, 0xe5, 0x0c, 0x29,
-             0x0c, 0x19, 0xc0, 0x27,
-             0xc0, 0x27, 0x67, 0xe1,
-             0xe8, 0x00, 0x7f, 0xc8,
-             0xa1, 0x7b, 0x80, 0x7b,
-             0x0c, 0x1b, 0x98, 0x95,
-             0xc0, 0x16, 0x66, 0x35,
-             0xe0, 0xa4, 0x42, 0x0a,
-             0x03, 0x11, 0x82, 0x85,
-             0x5d, 0x18, 0x81, 0x21,
-             0x8c, 0x0b, 0x6f, 0xc4,
-             0xa1, 0x7b, 0x80, 0x7b,
-             0x0c, 0x1b, 0x94, 0xd5,
-             0xc0, 0x16, 0x66, 0x35,
-             0xe0, 0xb8, 0x42, 0x0a,
-             0x7d, 0xd8, 0x80, 0xe5,
-             0x8c, 0x0b, 0x68, 0x0c,
-             0xa1, 0x7b, 0x80, 0x7b,
-             0x0c, 0x09, 0x92, 0x55,
-             0xc0, 0x2d, 0x63, 0x11,
-             0xe0, 0x80, 0x40, 0x0a,
-             0xdc, 0x00, 0x40, 0x60,
-             0xcf, 0xf0, 0x51, 0x08,
-             0x65, 0x51, 0x0c, 0x09,
-             0x42, 0xc6, 0x40, 0x2b,
-             0x04, 0x14, 0xe1, 0x04,
-             0x66, 0x71, 0x04, 0x60,
-             0x00, 0x00, 0xc0, 0xa2,
-             0x8e, 0x09, 0xec, 0x04,
-             0x40, 0x06, 0x04, 0x06,
-             0x4c, 0x01, 0xe0, 0x08,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x65, 0x41, 0x02, 0x60,
-             0x59, 0xb8, 0xc0, 0x54,
-             0x8c, 0x0b, 0x6f, 0x8c,
-             0x0c, 0x29, 0xa1, 0x0b,
-             0x40, 0x2b, 0x0c, 0x1d,
-             0xc0, 0x04, 0x02, 0x06,
-             0x44, 0x16, 0x84, 0xb5,
-             0x00, 0x60, 0x60, 0x08,
-             0xc0, 0x9e, 0x64, 0x50,
-             0x6c, 0x1d, 0x4c, 0x21,
-             0x02, 0x60, 0x40, 0x2b,
-             0xc0, 0xa3, 0x64, 0xa1,
-             0xef, 0x8c, 0x4d, 0xe8,
-             0x84, 0xe5, 0xa1, 0x0b,
-             0x6c, 0x1d, 0x0c, 0x29,
-             0x02, 0x16, 0x40, 0x2b,
-             0x4c, 0x15, 0xe0, 0x04,
-             0x40, 0x0a, 0x6e, 0x8d,
-             0xe0, 0x0c, 0x0e, 0x56,
-             0x6e, 0x89, 0x4c, 0x05,
-             0x02, 0x56, 0x40, 0x0a,
-             0x73, 0xf8, 0xe0, 0x0c,
-             0x8c, 0x0b, 0x6f, 0xcc,
-             0x0c, 0x4c, 0x8e, 0x0b,
-             0xdd, 0x93, 0xf2, 0x04,
-             0x6d, 0x5d, 0x0c, 0x05,
-             0xa1, 0x0b, 0xc0, 0x0c,
-             0x0c, 0x09, 0x80, 0xe5,
-             0xc0, 0x2b, 0x6c, 0x11,
-             0xe0, 0x94, 0x40, 0x4a,
-             0x01, 0x06, 0x84, 0xe5,
-             0x4b, 0xe6, 0x61, 0x4c,
-             0x00, 0x04, 0xe0, 0x0c,
-             0x66, 0xd1, 0x06, 0x60,
-             0x0c, 0x29, 0xc0, 0x54,
-             0x40, 0x15, 0x63, 0x0d,
-             0x66, 0xe1, 0x08, 0x60,
-             0x0c, 0x19, 0xc0, 0xa3,
-             0xc0, 0x15, 0x63, 0x09,
-             0x6c, 0x1d, 0x4c, 0x51,
-             0x7c, 0x38, 0xc0, 0x2b,
-             0x0c, 0x09, 0xef, 0xa4,
-             0xc0, 0x2b, 0x6c, 0x11,
-             0x60, 0x94, 0x40, 0x4a,
-             0xe0, 0x0c, 0x00, 0x46,
-             0x6c, 0x1d, 0x4c, 0x01,
-             0x86, 0x45, 0xc0, 0x2b,
-             0x66, 0xb1, 0x00, 0x60,
-             0x02, 0x60, 0x40, 0xbf,
-             0xc0, 0xc0, 0x65, 0x21,
-             0x64, 0xc1, 0x04, 0x60,
-             0x06, 0x60, 0x40, 0xad,
-             0xc0, 0xad, 0x65, 0x21,
-             0x6f, 0xb4, 0x42, 0xe8,
-             0x66, 0x20, 0x08, 0x60,
-             0x00, 0x60, 0xc0, 0xae,
-             0x40, 0xcc, 0x65, 0x41,
-             0x75, 0xd8, 0x81, 0x11,
-             0x04, 0xc6, 0x6f, 0x78,
-             0x77, 0x75, 0xe0, 0x10,
-             0xc1, 0xc3, 0x81, 0x71,
-             0xf8, 0x7c, 0x04, 0xcc,
-             0x6d, 0x0d, 0x00, 0xc9,
-             0x03, 0x16, 0x40, 0x2c,
-             0x40, 0x11, 0xe0, 0x08,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0xef, 0x14, 0x49, 0x86,
-             0x6c, 0x79, 0x00, 0x19,
-             0x00, 0x79, 0xc0, 0x2c,
-             0x40, 0x2c, 0x6c, 0x75,
-             0xfc, 0x00, 0x10, 0xc4,
-             0x6d, 0x0d, 0x40, 0x81,
-             0x00, 0xab, 0xc0, 0x2c,
-             0xc0, 0x16, 0x66, 0x31,
-             0x00, 0x19, 0x8d, 0x1e,
-             0xc0, 0x2c, 0x6d, 0x09,
-             0x63, 0x15, 0x00, 0xb5,
-             0x00, 0x69, 0xc0, 0x0b,
-             0xc0, 0x2c, 0x6c, 0xf9,
-             0x00, 0x19, 0x8f, 0x1e,
-             0xc0, 0x2c, 0x6c, 0xf5,
-             0x66, 0x35, 0x00, 0x5b,
-             0x00, 0x99, 0xc0, 0x16,
-             0xc0, 0x2c, 0x6c, 0xf1,
-             0xf8, 0x60, 0x08, 0x29,
-             0xe0, 0x84, 0x44, 0x0a,
-             0x0f, 0x1b, 0x86, 0x55,
-             0x06, 0x10, 0x83, 0x31,
-             0x02, 0x0a, 0x44, 0x04,
-             0x06, 0x16, 0xe3, 0xfc,
-             0x12, 0x0a, 0x00, 0x00,
-             0x40, 0x31, 0xe3, 0xfc,
-             0x40, 0x2c, 0x6c, 0xf5,
-             0x80, 0x85, 0x83, 0x21,
-             0x04, 0x90, 0x95, 0x9b,
-             0x40, 0x21, 0xc4, 0x04,
-             0x40, 0x2c, 0x6c, 0xf1,
-             0x82, 0xcf, 0xf1, 0x11,
-             0xc4, 0xc9, 0x07, 0x65,
-             0x63, 0xfc, 0x02, 0x0a,
-             0x16, 0x54, 0x96, 0x4b,
-             0x83, 0x21, 0x61, 0xb4,
-             0x83, 0x31, 0x02, 0x45,
-             0xe0, 0x84, 0x06, 0x74,
-             0xfa, 0x80, 0x06, 0x34,
-             0x83, 0x31, 0x07, 0x1b,
-             0xc4, 0x04, 0x06, 0x10,
-             0x6c, 0xf5, 0x40, 0x31,
-             0x12, 0x0a, 0x40, 0x2c,
-             0x80, 0xe5, 0xe3, 0xfc,
-             0x02, 0xa4, 0xc2, 0xa7,
-             0x83, 0x9b, 0xfa, 0x80,
-             0xc4, 0x04, 0x04, 0x90,
-             0x6c, 0xf1, 0x40, 0x21,
-             0x56, 0x0a, 0x40, 0x2c,
-             0x80, 0xa5, 0xe0, 0x80,
-             0xfa, 0x80, 0x02, 0x34,
-             0x80, 0xf5, 0xce, 0x1d,
-             0xe0, 0x80, 0x56, 0x4a,
-             0x46, 0x4a, 0x80, 0xe5,
-             0x80, 0x85, 0xe0, 0x80,
-             0x58, 0x80, 0x01, 0x55,
-             0x58, 0xc0, 0xfc, 0x18,
-             0x08, 0xbb, 0xf3, 0xe0,
-             0xef, 0x14, 0x49, 0x86,
-             0x6d, 0x0d, 0x40, 0xc1,
-             0x58, 0x0a, 0x40, 0x2c,
-             0x82, 0xc5, 0xe0, 0x84,
-             0xfa, 0x80, 0x02, 0x64,
-             0x83, 0x11, 0x0f, 0x1b,
-             0x44, 0x04, 0x02, 0x60,
-             0xf3, 0xfc, 0x0c, 0x0a,
-             0x80, 0x00, 0x02, 0x16,
-             0x6c, 0xf9, 0x40, 0x11,
-             0x00, 0x29, 0xc0, 0x2c,
-             0x40, 0x2c, 0x6c, 0xfd,
-             0xff, 0xf8, 0x02, 0x0e,
-             0xff, 0xf8, 0x0c, 0x0e,
-             0xe3, 0xfc, 0x04, 0x0a,
-             0x44, 0x04, 0x02, 0x20,
-             0xe0, 0xb4, 0x4a, 0x0a,
-             0x6c, 0xfd, 0x40, 0x11,
-             0x88, 0x55, 0xc0, 0x2c,
-             0x42, 0xc2, 0x91, 0x11,
-             0x18, 0xc4, 0x78, 0x84,
-             0x22, 0xcf, 0xfc, 0x0c,
-             0x40, 0xc1, 0xa1, 0x1b,
-             0xc0, 0x2c, 0x6d, 0x0d,
-             0x8d, 0x14, 0x90, 0x15,
-             0x02, 0x0a, 0x8f, 0x34,
-             0x80, 0xe5, 0xfb, 0xfc,
-             0x7a, 0x80, 0x02, 0x14,
-             0xfa, 0x80, 0x04, 0x34,
-             0x84, 0xf5, 0x83, 0x2b,
-             0x6c, 0xed, 0x00, 0x19,
-             0x83, 0x21, 0x40, 0x2c,
-             0x6d, 0x09, 0x40, 0x21,
-             0x02, 0x0a, 0xc0, 0x2c,
-             0x88, 0xd5, 0xe3, 0xf0,
-             0x8d, 0x14, 0x85, 0x75,
-             0x02, 0x0a, 0x8f, 0x34,
-             0x82, 0xa5, 0xfb, 0xfc,
-             0x7a, 0x80, 0x02, 0x14,
-             0xfa, 0x80, 0x04, 0x34,
-             0x80, 0xe5, 0x83, 0x2b,
-             0xe4, 0x04, 0x02, 0x30,
-             0x6d, 0x09, 0x40, 0x11,
-             0x83, 0x95, 0xc0, 0x2c,
-             0x6c, 0xed, 0x00, 0x19,
-             0x91, 0x21, 0x40, 0x2c,
-             0x78, 0x88, 0x44, 0xc2,
-             0xfc, 0x0c, 0x18, 0xc4,
-             0x83, 0x21, 0x24, 0xcf,
-             0x6d, 0x09, 0x40, 0x21,
-             0x02, 0x0a, 0x40, 0x2c,
-             0x40, 0xc1, 0xe3, 0xf0,
-             0xc0, 0x2c, 0x6d, 0x0d,
-             0x0c, 0x10, 0x80, 0x65,
-             0x40, 0x61, 0xe4, 0x04,
-             0xc0, 0x2c, 0x6c, 0xed,
-             0x6c, 0xed, 0x00, 0x19,
-             0xa1, 0x1b, 0xc0, 0x2c,
-             0x42, 0xc0, 0x82, 0xc5,
-             0x40, 0x11, 0xf3, 0xbc,
-             0xc0, 0x2c, 0x6d, 0x0d,
-             0x42, 0x10, 0x90, 0x18,
-             0x90, 0x16, 0xf3, 0xf8,
-             0x6d, 0x0d, 0x00, 0xc9,
-             0x83, 0x15, 0xc0, 0x2c,
-             0xe0, 0x8c, 0x58, 0x4a,
-             0x00, 0x19, 0x82, 0x25,
-             0xc0, 0x2b, 0x6c, 0x11,
-             0xe0, 0x94, 0x42, 0x4a,
-             0x58, 0xc0, 0x00, 0xb5,
-             0x58, 0xc0, 0xdc, 0x40,
-             0x40, 0xc1, 0xf3, 0xbc,
-             0xc0, 0x2c, 0x6d, 0x0d,
-             0xe0, 0x8c, 0x58, 0x4a,
-             0x00, 0x15, 0x84, 0x05,
-             0xc0, 0x0b, 0x63, 0x15,
-             0x82, 0x65, 0xa1, 0x1b,
-             0x63, 0x35, 0x00, 0x25,
-             0x83, 0x11, 0x40, 0x0b,
-             0x02, 0x20, 0x97, 0x2b,
-             0x40, 0x15, 0xc4, 0x04,
-             0xc0, 0x0b, 0x63, 0x35,
-             0xf0, 0x7c, 0x0c, 0xcc,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x04, 0x04, 0x4c,
-             0x68, 0x0c, 0x4a, 0x28,
-             0x0e, 0x01, 0x80, 0x7b,
-             0x40, 0x2c, 0x6d, 0x01,
-             0x00, 0x8a, 0x81, 0x61,
-             0x82, 0xd5, 0xe1, 0xb8,
-             0x6c, 0x1d, 0x0e, 0x29,
-             0x0c, 0x46, 0x40, 0x2b,
-             0x02, 0x46, 0xe0, 0x0c,
-             0x8e, 0x0b, 0x60, 0x0c,
-             0xef, 0xcc, 0x5b, 0x68,
-             0x0c, 0x06, 0xa1, 0x0b,
-             0x8c, 0x0b, 0x80, 0x00,
-             0xf2, 0x04, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x0c, 0x09, 0x80, 0x6b,
-             0xc0, 0x2c, 0x6c, 0xfd,
-             0x80, 0xf5, 0xa1, 0x0b,
-             0x6c, 0x6d, 0x0c, 0x09,
-             0x40, 0x4a, 0xc0, 0x2c,
-             0x82, 0x65, 0xe0, 0x8c,
-             0x63, 0x35, 0x0c, 0x05,
-             0xa1, 0x0b, 0xc0, 0x0b,
-             0x0c, 0x15, 0x82, 0x65,
-             0xc0, 0x0b, 0x63, 0x15,
-             0x80, 0xd5, 0x83, 0x0b,
-             0x6d, 0x15, 0x0c, 0x09,
-             0x05, 0x55, 0xc0, 0x2c,
-             0x0c, 0x09, 0xc6, 0x09,
-             0xc0, 0x2c, 0x6c, 0x6d,
-             0xe0, 0x90, 0x40, 0x0a,
-             0x0c, 0x09, 0x86, 0x25,
-             0xc0, 0x2c, 0x6c, 0x89,
-             0x84, 0x85, 0xa1, 0x0b,
-             0x68, 0x0c, 0x45, 0xe8,
-             0x0c, 0x11, 0x8c, 0x0b,
-             0xc0, 0x2c, 0x6d, 0x05,
-             0x6c, 0x89, 0x0c, 0x29,
-             0x0c, 0x01, 0xc0, 0x2c,
-             0xc0, 0x2c, 0x6d, 0x01,
-             0xf1, 0x88, 0x46, 0x12,
-             0x82, 0xf5, 0x87, 0x0d,
-             0x84, 0x0d, 0x82, 0x23,
-             0x0c, 0x09, 0x82, 0x95,
-             0xc0, 0x2c, 0x6d, 0x15,
-             0xf3, 0xf0, 0x40, 0x00,
-             0x6d, 0x15, 0x4c, 0x01,
-             0x0c, 0x0c, 0xc0, 0x2c,
-             0xdd, 0x93, 0xf2, 0x00,
-             0x6d, 0x15, 0x0c, 0x19,
-             0x4c, 0x01, 0xc0, 0x2c,
-             0xc0, 0x2c, 0x6d, 0x05,
-             0x4c, 0x11, 0xc6, 0x19,
-             0xc0, 0x2c, 0x6d, 0x15,
-             0xc1, 0xc3, 0xff, 0x35,
-             0x82, 0xc5, 0xa9, 0x3b,
-             0x02, 0xa5, 0xa3, 0x3b,
-             0x81, 0x88, 0x04, 0x24,
-             0x84, 0x85, 0xa5, 0x3b,
-             0x84, 0x85, 0xa7, 0x3b,
-             0x5c, 0x08, 0xa1, 0x3b,
-             0x15, 0x38, 0xda, 0x00,
-             0x89, 0x75, 0xff, 0x78,
-             0x5c, 0x08, 0xa1, 0x2b,
-             0x45, 0x34, 0x9a, 0x00,
-             0xec, 0x04, 0x04, 0x20,
-             0x7b, 0xfd, 0x46, 0x30,
-             0xc1, 0x3e, 0xdf, 0xff,
-             0x81, 0x31, 0xff, 0x65,
-             0x83, 0x31, 0x81, 0x45,
-             0xdd, 0x93, 0x81, 0x25,
-             0xf8, 0x1c, 0x04, 0x0c,
-             0x90, 0x01, 0x45, 0x27,
-             0x4b, 0xfe, 0x01, 0x41,
-             0xc0, 0x3f, 0x7f, 0xfd,
-             0x04, 0x84, 0x85, 0x95,
-             0x06, 0x74, 0xa3, 0x3b,
-             0xc4, 0xc4, 0x88, 0x41,
-             0xa0, 0x11, 0x46, 0x64,
-             0x1b, 0xfd, 0x50, 0x80,
-             0x4e, 0x70, 0x9f, 0xff,
-             0x1f, 0xff, 0x1b, 0xfd,
-             0x12, 0x74, 0x8a, 0x8f,
-             0x58, 0xc0, 0x60, 0xe0,
-             0x9f, 0xff, 0x1b, 0xfc,
-             0x1b, 0xfd, 0x4c, 0x60,
-             0xb0, 0x9f, 0x1f, 0xff,
-             0x10, 0xc4, 0x51, 0x77,
-             0x61, 0xc7, 0xe0, 0xc0,
-             0xfb, 0x80, 0x0e, 0x74,
-             0x18, 0xc4, 0x50, 0x67,
-             0x2e, 0x8f, 0xfa, 0x80,
-             0x40, 0x95, 0xb8, 0x6f,
-             0x40, 0x85, 0xf8, 0x08,
-             0x40, 0x65, 0xf8, 0x04,
-             0xc5, 0x4d, 0xf0, 0x0c,
-             0x0c, 0x0c, 0xf4, 0xf5,
-             0xdd, 0x93, 0xf0, 0x1c,
-             0xf8, 0x1c, 0x04, 0x0c,
-             0x90, 0x01, 0x45, 0x27,
-             0x49, 0xfe, 0x01, 0x31,
-             0xc0, 0x3f, 0x7f, 0xfd,
-             0x7f, 0xf1, 0x0a, 0x0e,
-             0x18, 0x0e, 0x40, 0x3f,
-             0xc0, 0x3f, 0x70, 0x01,
-             0x02, 0x65, 0x83, 0xd5,
-             0x86, 0x31, 0x70, 0x0c,
-             0xf8, 0x08, 0x02, 0x75,
-             0xf8, 0x04, 0x02, 0x85,
-             0x78, 0x10, 0x52, 0x62,
-             0x40, 0x95, 0xf1, 0x67,
-             0x12, 0x74, 0x78, 0x08,
-             0x0a, 0x9f, 0xe0, 0xa0,
-             0x2c, 0x9f, 0xe1, 0x77,
-             0xe0, 0xc0, 0x0c, 0x84,
-             0x78, 0x04, 0x40, 0x95,
-             0x2e, 0x6f, 0x98, 0x6f,
-             0x40, 0x65, 0xd1, 0x87,
-             0x40, 0x85, 0xf0, 0x10,
-             0xc5, 0x3d, 0xf8, 0x0c,
-             0x0c, 0x0c, 0xf8, 0x75,
-             0xdd, 0x93, 0xf0, 0x1c,
-             0xec, 0x40, 0x1e, 0xf0,
-             0x60, 0x18, 0x00, 0x29,
-             0x00, 0x49, 0x81, 0x31,
-             0xbe, 0x3e, 0xe0, 0x10,
-             0xc5, 0x27, 0x7c, 0x3e,
-             0xa7, 0x2b, 0x7e, 0x3e,
-             0x66, 0x8a, 0x46, 0x4a,
-             0x0a, 0x26, 0x83, 0x41,
-             0x18, 0x06, 0x00, 0x00,
-             0x82, 0x65, 0x80, 0x00,
-             0x81, 0x51, 0x25, 0x2b,
-             0x81, 0x41, 0x03, 0xc1,
-             0xa3, 0x2b, 0x80, 0xc5,
-             0x01, 0x51, 0x80, 0xf5,
-             0x81, 0x41, 0x81, 0xc1,
-             0xfc, 0xce, 0xbe, 0x5e,
-             0xc0, 0x08, 0xfe, 0x4e,
-             0x00, 0x34, 0x00, 0x13,
-             0x01, 0xb5, 0xfa, 0x80,
-             0x48, 0x4a, 0x81, 0x31,
-             0x0a, 0xf0, 0x61, 0x0a,
-             0x82, 0x31, 0xe4, 0x10,
-             0x0a, 0x45, 0xc4, 0x47,
-             0xc5, 0x46, 0xfc, 0x10,
-             0xfa, 0x80, 0x08, 0x34,
-             0xfc, 0x95, 0xc1, 0x4d,
-             0xa0, 0xf1, 0x01, 0x01,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xec, 0x40, 0x1e, 0xf0,
-             0x60, 0x1c, 0x00, 0x29,
-             0x00, 0x49, 0x81, 0x31,
-             0x85, 0x51, 0x60, 0x14,
-             0x7c, 0x3e, 0xbe, 0x3e,
-             0x27, 0x2b, 0xc5, 0x27,
-             0xe6, 0x8a, 0x48, 0x4a,
-             0x18, 0x16, 0x7e, 0x3e,
-             0x82, 0x05, 0x80, 0x00,
-             0x81, 0xc1, 0x25, 0x2b,
-             0xa3, 0x2b, 0x80, 0xa5,
-             0x01, 0x51, 0x80, 0xd5,
-             0xbe, 0x5e, 0x81, 0xc1,
-             0xfe, 0xce, 0xfc, 0x3e,
-             0x81, 0x31, 0x42, 0x08,
-             0x00, 0x44, 0x00, 0x13,
-             0x81, 0xa5, 0xfa, 0x80,
-             0x61, 0x0a, 0x48, 0x4a,
-             0xe4, 0x10, 0x0a, 0xf0,
-             0xc4, 0x47, 0x82, 0x31,
-             0xfc, 0x10, 0x0a, 0x45,
-             0x08, 0x34, 0xc5, 0x46,
-             0xc1, 0x4d, 0xfa, 0x80,
-             0x01, 0x01, 0xfc, 0x95,
-             0xdd, 0x93, 0xa0, 0xf1,
-             0xf8, 0x1c, 0x04, 0x0c,
-             0x61, 0x0c, 0x07, 0x46,
-             0xe1, 0x0c, 0x48, 0x86,
-             0x07, 0x86, 0x0c, 0xc4,
-             0x0c, 0x64, 0xe1, 0x0c,
-             0xe1, 0x0c, 0x46, 0x06,
-             0x4f, 0x06, 0x10, 0x54,
-             0x0c, 0x44, 0xe1, 0x0c,
-             0x1c, 0x34, 0x8b, 0x81,
-             0xe4, 0x60, 0x0e, 0x00,
-             0x1c, 0x98, 0x81, 0x75,
-             0xec, 0x04, 0x10, 0x80,
-             0xdd, 0x98, 0xf1, 0x96,
-             0xa1, 0x8b, 0xd9, 0x96,
-             0x18, 0x00, 0xfe, 0x35,
-             0x89, 0x61, 0x64, 0x74,
-             0x71, 0x78, 0x81, 0x55,
-             0xec, 0x04, 0x0c, 0x60,
-             0xa1, 0x6b, 0xd5, 0x76,
-             0x1d, 0x51, 0xfe, 0x75,
-             0x81, 0x55, 0x80, 0xcb,
-             0x0a, 0x50, 0x71, 0x68,
-             0xd1, 0x66, 0xec, 0x04,
-             0xfe, 0x75, 0xa1, 0x5b,
-             0x95, 0x41, 0x1c, 0x01,
-             0x41, 0x58, 0x81, 0x55,
-             0xec, 0x04, 0x08, 0x40,
-             0xa1, 0x4b, 0xcd, 0x56,
-             0x00, 0x20, 0xfe, 0x75,
-             0x83, 0x31, 0x6c, 0x04,
-             0x68, 0x80, 0x00, 0x34,
-             0x08, 0x00, 0x81, 0xc1,
-             0x00, 0x34, 0x6c, 0x04,
-             0x0a, 0x00, 0xe8, 0x88,
-             0x81, 0x01, 0x6c, 0x04,
-             0x81, 0x61, 0x03, 0x45,
-             0x0e, 0x54, 0xe9, 0x2d,
-             0x00, 0x04, 0x48, 0xb0,
-             0x82, 0x55, 0xdb, 0x80,
-             0xe8, 0xb0, 0x0e, 0x44,
-             0x00, 0x60, 0x00, 0x73,
-             0x00, 0x34, 0xe4, 0x30,
-             0x0e, 0x74, 0x68, 0x80,
-             0x0e, 0x03, 0xfb, 0x80,
-             0x86, 0xc1, 0x82, 0x61,
-             0xfa, 0xb5, 0x8d, 0x1b,
-             0x61, 0x04, 0x03, 0x86,
-             0x6b, 0xfc, 0x01, 0x0a,
-             0x04, 0x14, 0xc0, 0xff,
-             0xdb, 0x80, 0x00, 0x04,
-             0x04, 0x01, 0x00, 0x00,
-             0x04, 0x0c, 0xc0, 0x80,
-             0x0c, 0x0c, 0x81, 0x01,
-             0xdd, 0x93, 0xf0, 0x1c,
-             0xfa, 0x04, 0x04, 0x4c,
-             0x42, 0x16, 0x00, 0x6b,
-             0x66, 0x38, 0xe0, 0x00,
-             0x0c, 0x09, 0xe8, 0x0c,
-             0x40, 0x2b, 0x6c, 0x45,
-             0xe1, 0x0c, 0x03, 0xc6,
-             0x0e, 0x60, 0x04, 0x14,
-             0xc0, 0xaf, 0x64, 0x31,
-             0x00, 0x0c, 0xa9, 0x0b,
-             0x04, 0x06, 0xe2, 0x00,
-             0x71, 0x58, 0x8e, 0x0b,
-             0x8c, 0x1b, 0x6f, 0xfc,
-             0x64, 0x38, 0x02, 0x60,
-             0x74, 0x78, 0x8e, 0x0b,
-             0x0c, 0x19, 0xef, 0xfc,
-             0x40, 0x2b, 0x6c, 0x39,
-             0xe4, 0x60, 0x00, 0x60,
-             0x6c, 0x41, 0x0c, 0x29,
-             0x81, 0x31, 0x40, 0x2b,
-             0x0c, 0x49, 0x81, 0x85,
-             0xa1, 0x4b, 0xfc, 0x04,
-             0x41, 0x16, 0x80, 0x75,
-             0x82, 0x11, 0x82, 0x31,
-             0xfe, 0x15, 0xc5, 0x3d,
-             0x6c, 0x3d, 0x0c, 0x09,
-             0x02, 0x60, 0x40, 0x2b,
-             0x0c, 0x39, 0xe4, 0x74,
-             0x40, 0x2b, 0x6c, 0x45,
-             0x44, 0x62, 0x81, 0x41,
-             0x01, 0x95, 0xf0, 0x80,
-             0x88, 0x58, 0x9c, 0x21,
-             0x80, 0x75, 0xa1, 0x5b,
-             0x82, 0x41, 0x45, 0x06,
-             0x82, 0x21, 0x02, 0x01,
-             0xfe, 0x15, 0xc7, 0x4d,
-             0x6c, 0x45, 0x0c, 0x29,
-             0x8c, 0x0b, 0x40, 0x2b,
-             0x6c, 0x41, 0x0c, 0x19,
-             0x74, 0x78, 0xc0, 0x2b,
-             0x46, 0x38, 0xef, 0xfc,
-             0x8c, 0x0b, 0x68, 0x10,
-             0x0c, 0x4c, 0x81, 0x01,
-             0xdd, 0x93, 0xf2, 0x04,
-             0xfe, 0x7c, 0x04, 0x0c,
-             0xed, 0x40, 0x1e, 0xf0,
-             0x40, 0x16, 0x00, 0x6b,
-             0x08, 0x9b, 0xe0, 0x04,
-             0x4c, 0x01, 0x86, 0xab,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x01, 0x01, 0x84, 0xbb,
-             0x5e, 0xb1, 0x82, 0x8b,
-             0x8a, 0x7b, 0x61, 0x30,
-             0x61, 0x20, 0x5e, 0xa1,
-             0xe2, 0x80, 0x02, 0x06,
-             0xe1, 0x10, 0x5e, 0x91,
-             0x9f, 0x0e, 0xa1, 0x0e,
-             0x5e, 0x01, 0x9d, 0x0e,
-             0x5e, 0x01, 0xe0, 0xd0,
-             0x5e, 0x01, 0xe0, 0xc0,
-             0x8c, 0x0b, 0x60, 0xb0,
-             0xe8, 0x0c, 0x5f, 0x08,
-             0x9f, 0x21, 0x01, 0x11,
-             0x8c, 0x3b, 0x0c, 0x0b,
-             0xe8, 0x04, 0x6d, 0x48,
-             0x60, 0x90, 0x00, 0x84,
-             0xe1, 0x8c, 0x02, 0x84,
-             0x40, 0x00, 0x0d, 0x8e,
-             0x4e, 0x09, 0xf1, 0xc0,
-             0xe0, 0x04, 0x0e, 0x6a,
-             0x71, 0x84, 0x50, 0x02,
-             0x93, 0x7e, 0x8f, 0x01,
-             0x00, 0xb8, 0x95, 0x8e,
-             0x80, 0x00, 0x40, 0x01,
-             0xfa, 0x80, 0x00, 0x84,
-             0x15, 0x0e, 0x90, 0x01,
-             0x5e, 0x01, 0x91, 0x01,
-             0x9f, 0x01, 0x60, 0xb0,
-             0x40, 0xa2, 0x0f, 0x0e,
-             0xb2, 0x0f, 0xf9, 0xac,
-             0x9a, 0xa5, 0xa1, 0x0b,
-             0x4f, 0x76, 0x1e, 0x89,
-             0x11, 0x8e, 0xe0, 0x00,
-             0xf0, 0xac, 0x50, 0xa2,
-             0x92, 0x83, 0x07, 0x65,
-             0x6c, 0x1d, 0x0c, 0x29,
-             0x43, 0x76, 0x40, 0x2b,
-             0x75, 0x18, 0xe0, 0x00,
-             0x8c, 0x0b, 0x6f, 0xc8,
-             0x5e, 0xb1, 0xa1, 0x0b,
-             0x5e, 0xa1, 0xc1, 0x30,
-             0x5e, 0x91, 0xc1, 0x20,
-             0x15, 0x48, 0xc1, 0x10,
-             0x16, 0x0a, 0xc0, 0x00,
-             0x81, 0x01, 0x70, 0x00,
-             0x44, 0x04, 0x00, 0xb0,
-             0xf0, 0x00, 0x16, 0x4a,
-             0x62, 0x00, 0x02, 0x0c,
-             0xf0, 0x00, 0x14, 0x4a,
-             0x62, 0x00, 0x04, 0x0c,
-             0x14, 0x1a, 0x82, 0x83,
-             0x81, 0x11, 0x70, 0x00,
-             0x24, 0x05, 0x02, 0xa0,
-             0x84, 0x83, 0x40, 0x00,
-             0x70, 0x00, 0x12, 0x4a,
-             0x06, 0x0c, 0x81, 0x21,
-             0x12, 0x1a, 0x62, 0x00,
-             0x04, 0x90, 0xf0, 0x00,
-             0x40, 0x00, 0x24, 0x05,
-             0x04, 0x9b, 0x86, 0x83,
-             0x80, 0xbb, 0x82, 0xab,
-             0xf2, 0x65, 0xe8, 0x8d,
-             0x5e, 0xb1, 0x93, 0x04,
-             0x5e, 0xa1, 0xe1, 0x30,
-             0x11, 0x04, 0xe1, 0x20,
-             0x5e, 0x91, 0xa3, 0x0b,
-             0x5e, 0x07, 0xe1, 0x10,
-             0x15, 0x04, 0xe0, 0x3c,
-             0xe4, 0x20, 0x0e, 0x00,
-             0x1e, 0x75, 0x89, 0x7e,
-             0x16, 0x0a, 0x40, 0x20,
-             0x10, 0x74, 0xfb, 0xfc,
-             0xb0, 0x03, 0xfa, 0x80,
-             0x44, 0x00, 0x0c, 0x25,
-             0x15, 0x04, 0xf0, 0x7c,
-             0xe0, 0x80, 0x50, 0x0a,
-             0xa1, 0x2b, 0x88, 0x75,
-             0xa0, 0x01, 0x88, 0x85,
-             0x60, 0xd0, 0x5e, 0x01,
-             0xf3, 0xc0, 0x42, 0x00,
-             0x65, 0xc4, 0x02, 0x8a,
-             0x02, 0x80, 0x8e, 0x0b,
-             0x00, 0x80, 0x04, 0x3c,
-             0x5e, 0x11, 0x8c, 0x04,
-             0x83, 0x85, 0x80, 0xd0,
-             0x6c, 0x1d, 0x0c, 0x29,
-             0x43, 0x76, 0x40, 0x2b,
-             0x6e, 0xd8, 0xe0, 0x00,
-             0x8c, 0x0b, 0x6f, 0xc8,
-             0xe0, 0x00, 0x4f, 0x76,
-             0x0f, 0x48, 0xa1, 0x0b,
-             0x9b, 0xa1, 0xc0, 0x00,
-             0xe1, 0x20, 0x5e, 0xa1,
-             0xa1, 0x2b, 0xf1, 0x45,
-             0x84, 0x40, 0x00, 0x00,
-             0x60, 0xd0, 0x5e, 0x01,
-             0x5e, 0x01, 0x8e, 0x0b,
-             0x00, 0xf0, 0xe0, 0xc0,
-             0x16, 0xf0, 0x65, 0x00,
-             0x3e, 0x0e, 0xe4, 0xd0,
-             0xe4, 0xc0, 0x08, 0xf0,
-             0x04, 0xf0, 0x0b, 0x2e,
-             0x3c, 0xbe, 0xe5, 0x30,
-             0xe4, 0xb0, 0x0a, 0xf0,
-             0x8c, 0x0b, 0x01, 0x11,
-             0x68, 0x00, 0x4d, 0xe8,
-             0x1e, 0xa9, 0x8c, 0x3b,
-             0x14, 0x0a, 0x60, 0xc0,
-             0x86, 0x05, 0xfb, 0xfc,
-             0xe0, 0x80, 0x4e, 0x0a,
-             0x44, 0x3c, 0x02, 0x70,
-             0xcc, 0x04, 0x00, 0x70,
-             0xc0, 0xd0, 0x5e, 0x11,
-             0x8b, 0x04, 0x82, 0xb5,
-             0xe0, 0x40, 0x00, 0x0a,
-             0xc0, 0x28, 0x1e, 0x05,
-             0xc4, 0x40, 0x00, 0x00,
-             0x80, 0x28, 0x1e, 0x05,
-             0x60, 0xd0, 0x5e, 0x01,
-             0x5e, 0x01, 0x8e, 0x0b,
-             0x00, 0xf0, 0xe0, 0xc0,
-             0x04, 0xf0, 0x64, 0xf0,
-             0x3e, 0x0e, 0xe5, 0x20,
-             0xe4, 0xc0, 0x08, 0xf0,
-             0x0a, 0xf0, 0x3c, 0xbe,
-             0x03, 0x11, 0xe4, 0xb0,
-             0x4b, 0x38, 0x8c, 0x0b,
-             0x8c, 0x3b, 0x68, 0x00,
-             0x60, 0xc0, 0x1e, 0x99,
-             0xfb, 0xfc, 0x12, 0x0a,
-             0x50, 0x4a, 0x86, 0xa5,
-             0x0e, 0x70, 0xe0, 0x80,
-             0x5e, 0x71, 0xcc, 0x04,
-             0x84, 0x95, 0xc0, 0xd0,
-             0xa1, 0x0b, 0x8b, 0x04,
-             0x80, 0x28, 0x1e, 0x05,
-             0x80, 0xd0, 0x5e, 0x01,
-             0x95, 0x04, 0x82, 0xa5,
-             0x5e, 0x01, 0xa0, 0x01,
-             0x42, 0x00, 0x60, 0xd0,
-             0x02, 0x8a, 0xf3, 0xc0,
-             0x0e, 0x80, 0xe5, 0xc4,
-             0x5e, 0x71, 0x8c, 0x08,
-             0x5e, 0x71, 0x80, 0xd0,
-             0x00, 0xf0, 0xe0, 0xc0,
-             0x04, 0xf0, 0x64, 0xe0,
-             0x3e, 0x0e, 0xe5, 0x10,
-             0xe4, 0xc0, 0x08, 0xf0,
-             0x0a, 0xf0, 0x3c, 0xbe,
-             0x05, 0x11, 0xe4, 0xb0,
-             0x48, 0x38, 0x8c, 0x0b,
-             0x8c, 0x3b, 0x68, 0x00,
-             0x80, 0x7b, 0x85, 0x81,
-             0x96, 0xd5, 0xa1, 0x7b,
-             0x8c, 0x3b, 0x13, 0x14,
-             0x1e, 0x19, 0x8f, 0x04,
-             0xa1, 0x1b, 0x60, 0xc0,
-             0x40, 0x10, 0x1e, 0x25,
-             0xfa, 0x80, 0x00, 0x04,
-             0xfb, 0x80, 0x40, 0xa2,
-             0x7b, 0x80, 0x40, 0x92,
-             0xfa, 0x80, 0x02, 0x14,
-             0x40, 0x20, 0x5e, 0x25,
-             0xfb, 0x80, 0x42, 0x12,
-             0x04, 0x04, 0x91, 0x04,
-             0x8c, 0x0b, 0x7a, 0x80,
-             0xe8, 0x04, 0x5a, 0x48,
-             0xa1, 0x7b, 0x80, 0x7b,
-             0x0c, 0x0b, 0x90, 0x35,
-             0x4c, 0xd8, 0x8c, 0x1b,
-             0x1e, 0x07, 0xe8, 0x00,
-             0x40, 0x46, 0x60, 0x3c,
-             0x00, 0x04, 0xe1, 0x08,
-             0x01, 0x21, 0x85, 0x11,
-             0x02, 0x06, 0x81, 0x71,
-             0x00, 0x16, 0xc0, 0x00,
-             0xe1, 0x08, 0x40, 0x86,
-             0x02, 0x2c, 0x80, 0x04,
-             0x00, 0x26, 0xe2, 0x00,
-             0xe1, 0x08, 0x40, 0xc6,
-             0x00, 0x16, 0x80, 0x04,
-             0xe1, 0x08, 0x41, 0x06,
-             0x02, 0x0c, 0x80, 0x04,
-             0x00, 0x26, 0xe2, 0x00,
-             0xe1, 0x08, 0x41, 0x46,
-             0x00, 0x16, 0x80, 0x04,
-             0xe1, 0x08, 0x41, 0x86,
-             0x83, 0x11, 0x00, 0x04,
-             0x41, 0xc6, 0x00, 0x16,
-             0x80, 0x04, 0xe1, 0x08,
-             0x00, 0x06, 0x00, 0x86,
-             0x80, 0x04, 0xe1, 0x0c,
-             0x8d, 0x34, 0x80, 0x26,
-             0x9f, 0x14, 0xa1, 0x04,
-             0x4c, 0x31, 0x9d, 0x24,
-             0xc0, 0x27, 0x67, 0xe1,
-             0x67, 0xe5, 0x4c, 0x01,
-             0x4c, 0x11, 0xc0, 0x27,
-             0xc0, 0x27, 0x67, 0xe9,
-             0x67, 0xed, 0x4c, 0x21,
-             0x4c, 0x71, 0xc0, 0x27,
-             0x40, 0x27, 0x67, 0xf5,
-             0x13, 0x04, 0xa9, 0x31,
-             0x9f, 0x24, 0x8b, 0x41,
-             0x1d, 0x04, 0xa1, 0x14,
-             0x46, 0x16, 0xa1, 0x0b,
-             0x08, 0xf6, 0x40, 0x00,
-             0x44, 0x2a, 0xc0, 0x00,
-             0xd0, 0x17, 0x66, 0x8e,
-             0xe6, 0x92, 0x40, 0x0a,
-             0x80, 0x23, 0x82, 0x23,
-             0x69, 0x59, 0x4c, 0x25,
-             0x0e, 0x0b, 0xc0, 0x08,
-             0xe5, 0x40, 0x1e, 0xf0,
-             0xf6, 0x7c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x7c, 0x04, 0x4c,
-             0x93, 0x34, 0x8f, 0x3e,
-             0x8b, 0x75, 0x91, 0x64,
-             0x94, 0x88, 0x90, 0x98,
-             0x94, 0xf5, 0xd1, 0x9d,
-             0x50, 0x02, 0x18, 0xa8,
-             0x10, 0x79, 0xf0, 0xa4,
-             0x40, 0x27, 0x63, 0x41,
-             0x56, 0xa2, 0x83, 0xc1,
-             0x10, 0xb4, 0xf1, 0xa4,
-             0x4e, 0x70, 0x61, 0x90,
-             0x16, 0x84, 0xfb, 0xfc,
-             0x16, 0xc4, 0xfa, 0x80,
-             0x96, 0x7f, 0xe8, 0xac,
-             0x86, 0x75, 0xa1, 0x7b,
-             0x10, 0x8a, 0x0f, 0xc4,
-             0x0e, 0xb6, 0xf4, 0x10,
-             0x16, 0x16, 0x00, 0x00,
-             0x4e, 0x72, 0x80, 0x00,
-             0x0e, 0x74, 0x91, 0xa0,
-             0x18, 0x79, 0x9a, 0x80,
-             0x16, 0xb4, 0x7c, 0x24,
-             0x98, 0x93, 0x88, 0x9c,
-             0xa4, 0x76, 0xb6, 0x7f,
-             0x0e, 0x70, 0x88, 0x78,
-             0x88, 0x76, 0xec, 0x04,
-             0x82, 0x71, 0x8c, 0x74,
-             0x98, 0xa8, 0x8c, 0x7e,
-             0x7a, 0x80, 0x12, 0xa4,
-             0xec, 0x04, 0x0e, 0x10,
-             0x64, 0x80, 0x14, 0x90,
-             0x98, 0xa6, 0xe5, 0x7d,
-             0xa1, 0x1b, 0x84, 0x55,
-             0x14, 0x8a, 0x86, 0x55,
-             0x84, 0xf5, 0xf6, 0x00,
-             0x0e, 0x90, 0x4a, 0xa7,
-             0x50, 0xa0, 0xed, 0x44,
-             0xb0, 0x73, 0xf0, 0x80,
-             0x90, 0x78, 0x98, 0x76,
-             0xec, 0x04, 0x0e, 0x70,
-             0x81, 0xb5, 0x90, 0x76,
-             0xf3, 0xfc, 0x15, 0x0a,
-             0x0e, 0x90, 0x82, 0x15,
-             0x98, 0x76, 0xed, 0x88,
-             0x0e, 0x70, 0x90, 0x78,
-             0x90, 0x76, 0xec, 0x08,
-             0xa1, 0x8b, 0x88, 0x88,
-             0x81, 0xc5, 0xea, 0x15,
-             0x6c, 0x1d, 0x00, 0x29,
-             0x43, 0x66, 0x40, 0x2b,
-             0x58, 0x78, 0xe0, 0x08,
-             0x4d, 0x66, 0x6f, 0xc8,
-             0xa1, 0x0b, 0xe0, 0x08,
-             0x81, 0x61, 0x80, 0x55,
-             0x0c, 0x4c, 0x8c, 0x0b,
-             0xdd, 0x93, 0xf2, 0x7c,
-             0xf8, 0x7c, 0x04, 0x0c,
-             0xec, 0x40, 0x1e, 0xf0,
-             0x66, 0xb1, 0x04, 0x00,
-             0x91, 0x31, 0x40, 0x8b,
-             0x81, 0x41, 0x01, 0x55,
-             0x06, 0x30, 0x49, 0x4e,
-             0xa1, 0x3b, 0xec, 0x04,
-             0x01, 0x21, 0xfe, 0x95,
-             0x01, 0x51, 0x81, 0x31,
-             0x8b, 0x95, 0x81, 0x41,
-             0x10, 0x44, 0x7c, 0x2e,
-             0x7e, 0x1e, 0xfa, 0x80,
-             0xf4, 0x08, 0x08, 0x8a,
-             0x88, 0x81, 0x04, 0x28,
-             0x81, 0x91, 0x3e, 0x4e,
-             0x0c, 0x24, 0x88, 0xab,
-             0x0e, 0x24, 0x61, 0x94,
-             0x04, 0x69, 0xe1, 0x9c,
-             0xe1, 0x84, 0x18, 0x24,
-             0x0e, 0x24, 0x2e, 0x6f,
-             0x08, 0x79, 0xe1, 0x8c,
-             0x2e, 0x6f, 0x90, 0xc9,
-             0x38, 0x6f, 0x9e, 0x29,
-             0x48, 0x67, 0xa9, 0xc1,
-             0x80, 0x00, 0x58, 0x16,
-             0x8b, 0x61, 0x2c, 0x2f,
-             0x00, 0x00, 0x0c, 0xf6,
-             0xfa, 0x80, 0x0e, 0x24,
-             0x4e, 0x0a, 0x85, 0x75,
-             0x86, 0x65, 0xe4, 0xa4,
-             0x7a, 0x80, 0x08, 0xa4,
-             0xf0, 0x00, 0x06, 0x5a,
-             0x70, 0x00, 0x06, 0x0a,
-             0x04, 0x1c, 0x98, 0xbb,
-             0x02, 0x54, 0x62, 0x00,
-             0x44, 0x47, 0xfa, 0x80,
-             0xdc, 0x00, 0x56, 0x60,
-             0x44, 0x02, 0x05, 0x1b,
-             0x04, 0x15, 0xf0, 0x90,
-             0x40, 0x08, 0x6b, 0xad,
-             0x80, 0x10, 0x16, 0x06,
-             0x44, 0x15, 0x96, 0x13,
-             0xc0, 0x08, 0x6b, 0xad,
-             0x60, 0x0c, 0x12, 0x1a,
-             0x0a, 0x0a, 0x82, 0x91,
-             0x54, 0x80, 0x7b, 0xfc,
-             0x0a, 0x0c, 0xbc, 0x00,
-             0xb1, 0x9b, 0xe2, 0x00,
-             0x7c, 0x24, 0xf6, 0x35,
-             0xbe, 0x44, 0x83, 0x39,
-             0x7c, 0x0c, 0x04, 0x0a,
-             0x02, 0x0c, 0x82, 0x21,
-             0x7e, 0x14, 0xe2, 0x00,
-             0x82, 0x11, 0x82, 0x43,
-             0xf4, 0x3c, 0x05, 0x0a,
-             0x01, 0x01, 0xe8, 0xc5,
-             0x0c, 0x0c, 0xa0, 0xf1,
-             0xdd, 0x93, 0xf0, 0x7c,
-             0xfa, 0x7c, 0x04, 0x0c,
-             0xec, 0x30, 0x1e, 0xf0,
-             0x40, 0x56, 0x00, 0x6b,
-             0x4c, 0x01, 0xe0, 0x00,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x7c, 0x0e, 0x81, 0x01,
-             0x71, 0x78, 0x8c, 0x0b,
-             0x0c, 0x09, 0xe8, 0x00,
-             0xc0, 0x2b, 0x65, 0xf9,
-             0xe0, 0x80, 0x40, 0x0a,
-             0x05, 0x01, 0x00, 0x60,
-             0x02, 0x06, 0x40, 0x9b,
-             0x55, 0x58, 0xc0, 0x00,
-             0x04, 0x06, 0x4f, 0x74,
-             0x0c, 0x09, 0xc0, 0x18,
-             0xc0, 0x2b, 0x6c, 0x21,
-             0x88, 0xf5, 0xab, 0x0b,
-             0x6d, 0x21, 0x0c, 0x09,
-             0x40, 0x00, 0xc0, 0x2c,
-             0xc2, 0x09, 0xf3, 0xf0,
-             0x6d, 0x21, 0x4c, 0x01,
-             0x8c, 0x0b, 0x40, 0x2c,
-             0xef, 0xf4, 0x7e, 0x68,
-             0x6d, 0x21, 0x0c, 0x09,
-             0x80, 0x7b, 0x40, 0x2c,
-             0x02, 0x86, 0x21, 0x7b,
-             0x83, 0x21, 0xef, 0x18,
-             0x40, 0x00, 0x04, 0x26,
-             0xc4, 0x09, 0xf3, 0xf0,
-             0x6d, 0x21, 0x4c, 0x01,
-             0x82, 0x65, 0xc0, 0x2c,
-             0x6c, 0x1d, 0x0c, 0x29,
-             0x8c, 0x0b, 0x40, 0x2b,
-             0x6f, 0xc8, 0x4c, 0x68,
-             0xa1, 0x0b, 0x8e, 0x1b,
-             0xc0, 0x00, 0x0c, 0x38,
-             0x81, 0x11, 0x01, 0x71,
-             0x81, 0xa1, 0x13, 0x55,
-             0x12, 0xb4, 0x3e, 0x34,
-             0xd0, 0x9d, 0xfa, 0x80,
-             0x00, 0x4a, 0x9c, 0x35,
-             0x9a, 0xc5, 0xfb, 0xfc,
-             0x70, 0x00, 0x06, 0x0a,
-             0x01, 0x11, 0x96, 0x0b,
-             0x84, 0x05, 0x81, 0x21,
-             0xf0, 0x04, 0x06, 0x0a,
-             0x00, 0x00, 0x00, 0x06,
-             0x9c, 0x00, 0x42, 0xb0,
-             0x04, 0x06, 0x02, 0x25,
-             0x06, 0x0a, 0x80, 0x00,
-             0x82, 0xb5, 0xf0, 0x08,
-             0x81, 0x11, 0x01, 0x01,
-             0x4c, 0x01, 0x96, 0x2b,
-             0xc0, 0x27, 0x67, 0xe5,
-             0x67, 0xe9, 0x4c, 0x11,
-             0x4c, 0x21, 0xc0, 0x27,
-             0xc0, 0x27, 0x67, 0xed,
-             0x80, 0xf5, 0xa1, 0x7b,
-             0x6f, 0xf4, 0x79, 0xe8,
-             0x80, 0x7b, 0x8c, 0x0b,
-             0x82, 0x45, 0xa1, 0x7b,
-             0x6c, 0x1d, 0x0c, 0x29,
-             0x8c, 0x0b, 0x40, 0x2b,
-             0x6f, 0xc8, 0x48, 0xa8,
-             0xa1, 0x0b, 0x8e, 0x1b,
-             0x02, 0xf0, 0xa0, 0xf5,
-             0x8c, 0x0b, 0x64, 0x20,
-             0xe8, 0x00, 0x4e, 0x88,
-             0x80, 0x7b, 0x7c, 0x04,
-             0x65, 0xf9, 0x0c, 0x19,
-             0x44, 0x86, 0x40, 0x2b,
-             0x40, 0x0a, 0xe0, 0x3c,
-             0x42, 0x0a, 0xe0, 0x0a,
-             0xcf, 0x07, 0xe0, 0x80,
-             0x84, 0x05, 0xfc, 0x0e,
-             0x7a, 0x80, 0x02, 0xa4,
-             0x65, 0x00, 0x04, 0x60,
-             0x06, 0x14, 0xc0, 0x9b,
-             0x04, 0x33, 0xe0, 0x88,
-             0x8c, 0x0e, 0x82, 0x23,
-             0xe4, 0x00, 0x44, 0xb1,
-             0x44, 0x11, 0xbc, 0x14,
-             0x0c, 0x1b, 0xe5, 0x00,
-             0x40, 0x15, 0x6a, 0xf9,
-             0xc3, 0x0d, 0x82, 0xa1,
-             0xd1, 0x9d, 0x86, 0x25,
-             0x07, 0xf5, 0x0c, 0x09,
-             0x16, 0xb0, 0x40, 0x27,
-             0xe6, 0x75, 0xc4, 0x04,
-             0x6a, 0xf5, 0x0c, 0x1b,
-             0xc1, 0x1d, 0xc0, 0x15,
-             0x0c, 0x1b, 0x82, 0x05,
-             0xc0, 0x15, 0x6a, 0xf1,
-             0x43, 0xf6, 0x43, 0x0d,
-             0x88, 0x55, 0xe0, 0x0c,
-             0x41, 0x56, 0x03, 0xc5,
-             0xbc, 0x14, 0xe0, 0x00,
-             0x16, 0x0a, 0x83, 0xd5,
-             0x43, 0xf6, 0x70, 0x14,
-             0x86, 0x15, 0xe0, 0x0c,
-             0x02, 0x0a, 0xbc, 0x14,
-             0x84, 0x95, 0xf0, 0x0c,
-             0x6a, 0xf5, 0x0c, 0x1b,
-             0xc1, 0x1d, 0xc0, 0x15,
-             0x0c, 0x1b, 0x82, 0x05,
-             0xc0, 0x15, 0x6a, 0xf1,
-             0x43, 0xf6, 0x43, 0x0d,
-             0x82, 0x15, 0xe0, 0x0c,
-             0xe0, 0x00, 0x41, 0x46,
-             0x67, 0xf5, 0x4c, 0x01,
-             0x43, 0xf6, 0x40, 0x27,
-             0x03, 0x0a, 0xe0, 0x0c,
-             0x86, 0xd5, 0xf4, 0x0c,
-             0x67, 0xf5, 0x0c, 0x09,
-             0x00, 0x4a, 0xc0, 0x27,
-             0x86, 0x05, 0xfb, 0xfc,
-             0x67, 0xe1, 0x0c, 0x29,
-             0x8c, 0x0b, 0x40, 0x27,
-             0x82, 0x11, 0x3e, 0x1e,
-             0x02, 0x14, 0x3c, 0x1e,
-             0x41, 0xd8, 0xfa, 0x80,
-             0x80, 0x8b, 0xe8, 0x00,
-             0x16, 0x56, 0xeb, 0x8d,
-             0x00, 0x06, 0x00, 0x00,
-             0xd4, 0x65, 0x80, 0x00,
-             0xe0, 0x00, 0x41, 0x36,
-             0x67, 0xf5, 0x4c, 0x01,
-             0x4c, 0xa1, 0xc0, 0x27,
-             0x40, 0x26, 0x6c, 0xf1,
-             0x44, 0x78, 0x8c, 0x0b,
-             0x00, 0x86, 0xef, 0xbc,
-             0x81, 0x11, 0x6f, 0x18,
-             0x0e, 0x0b, 0x80, 0x16,
-             0x0c, 0x0c, 0x98, 0xf1,
-             0xdd, 0x93, 0xf2, 0x7c,
-             0xf8, 0x1c, 0x04, 0xcc,
-             0x67, 0xf1, 0x00, 0x59,
-             0xa7, 0x1b, 0x40, 0x27,
-             0x18, 0x24, 0x01, 0x31,
-             0x15, 0x3c, 0xe1, 0x8c,
-             0x05, 0x41, 0x8f, 0x61,
-             0x80, 0x04, 0x0f, 0x56,
-             0x02, 0x16, 0x04, 0x85,
-             0x25, 0x1b, 0x80, 0x00,
-             0xe0, 0x08, 0x4e, 0xa6,
-             0x00, 0x00, 0x02, 0x06,
-             0x80, 0x00, 0x10, 0x06,
-             0x23, 0x1b, 0x82, 0x65,
-             0x02, 0x95, 0x81, 0x41,
-             0x03, 0x56, 0x81, 0x11,
-             0x83, 0x41, 0x60, 0x04,
-             0x81, 0x11, 0x29, 0x16,
-             0x12, 0xf0, 0x83, 0x81,
-             0xb0, 0x9f, 0xe4, 0x50,
-             0x38, 0x63, 0xa4, 0x76,
-             0xfb, 0xfc, 0x0a, 0x4a,
-             0x70, 0x1c, 0x58, 0x20,
-             0x0a, 0x64, 0x81, 0x21,
-             0xff, 0x61, 0x7a, 0x80,
-             0x00, 0x00, 0x04, 0x86,
-             0xe8, 0xb0, 0x18, 0x64,
-             0x08, 0x44, 0x05, 0x55,
-             0x4c, 0x12, 0xfa, 0x80,
-             0x10, 0xf0, 0x70, 0x88,
-             0x00, 0x63, 0xe4, 0x50,
-             0x0c, 0x79, 0x8b, 0x1b,
-             0x40, 0x27, 0x63, 0x41,
-             0xe1, 0xfc, 0x0c, 0x14,
-             0x0c, 0x64, 0x82, 0x63,
-             0x4c, 0x12, 0xfc, 0x00,
-             0x10, 0x69, 0xf1, 0x98,
-             0x4e, 0x72, 0x7c, 0x18,
-             0x0c, 0x7f, 0x98, 0x30,
-             0xa1, 0x7b, 0x81, 0x61,
-             0x50, 0x04, 0x50, 0x70,
-             0xc1, 0x84, 0x0e, 0x74,
-             0x4c, 0x62, 0x7e, 0x75,
-             0x06, 0x34, 0xd0, 0xa0,
-             0x88, 0x13, 0x7a, 0x80,
-             0x8a, 0x1d, 0x8c, 0x33,
-             0x00, 0x34, 0xf6, 0xa5,
-             0x0c, 0xcc, 0xfa, 0x80,
-             0xdd, 0x93, 0xf0, 0x1c,
-             0xfa, 0x0c, 0x04, 0x0c,
-             0x82, 0x7b, 0x00, 0x6b,
-             0x6d, 0x59, 0x0c, 0x05,
-             0x91, 0x21, 0x40, 0x0a,
-             0x6e, 0x0d, 0x0c, 0x15,
-             0x6c, 0x78, 0xc0, 0x09,
-             0x0c, 0x29, 0xef, 0xac,
-             0x40, 0x2b, 0x65, 0x51,
-             0xe1, 0x18, 0x42, 0x46,
-             0x83, 0x51, 0x04, 0x14,
-             0x84, 0x18, 0x84, 0x48,
-             0x63, 0x7d, 0x0c, 0x35,
-             0x9e, 0x49, 0xc0, 0x0b,
-             0x8e, 0x19, 0xc9, 0x17,
-             0x02, 0x24, 0x23, 0x5f,
-             0x71, 0xb8, 0xe0, 0x90,
-             0x04, 0x54, 0x6f, 0xac,
-             0x71, 0x78, 0xe8, 0x90,
-             0x80, 0x8b, 0x6f, 0xe8,
-             0x60, 0x10, 0x02, 0x06,
-             0x73, 0x58, 0x90, 0x2b,
-             0x8e, 0x3b, 0x6f, 0xac,
-             0xa1, 0x7b, 0x80, 0x7b,
-             0x0c, 0x29, 0x82, 0xe5,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x76, 0x78, 0x8c, 0x0b,
-             0x8e, 0x1b, 0x6f, 0xc4,
-             0x0e, 0x06, 0xa3, 0x0b,
-             0x8e, 0x0b, 0xc0, 0x00,
-             0xf2, 0x0c, 0x0c, 0x0c,
-             0x81, 0x01, 0xdd, 0x93,
-             0xf2, 0x0c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x64, 0xc1, 0x00, 0x39,
-             0x02, 0x16, 0x40, 0x2b,
-             0x40, 0x11, 0xe0, 0x0c,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x00, 0x19, 0x83, 0x41,
-             0xc0, 0x15, 0x62, 0x19,
-             0x66, 0x35, 0x00, 0x2b,
-             0x00, 0x59, 0xc0, 0x16,
-             0xc0, 0x2b, 0x65, 0x0d,
-             0x6c, 0x75, 0x40, 0x11,
-             0x00, 0x19, 0xc0, 0x2c,
-             0x40, 0x2b, 0x6c, 0x11,
-             0x70, 0x05, 0x44, 0x20,
-             0x40, 0x31, 0xc0, 0x80,
-             0x40, 0x2c, 0x6c, 0x7d,
-             0x7e, 0xf9, 0x44, 0x20,
-             0x00, 0x39, 0xc0, 0x79,
-             0xc0, 0x2b, 0x65, 0x09,
-             0x60, 0x94, 0x42, 0x4a,
-             0x40, 0x11, 0x85, 0x11,
-             0xc0, 0x22, 0x65, 0x95,
-             0x6d, 0x31, 0x40, 0x11,
-             0x02, 0x06, 0x40, 0x2c,
-             0x40, 0x41, 0xc0, 0x00,
-             0xc0, 0x2c, 0x6c, 0x8d,
-             0x6c, 0x85, 0x40, 0x51,
-             0x40, 0x23, 0xc0, 0x2c,
-             0xc0, 0x16, 0x66, 0x35,
-             0x6d, 0x35, 0x40, 0x31,
-             0x40, 0x11, 0xc0, 0x2c,
-             0xc0, 0x2c, 0x0c, 0x81,
-             0x0e, 0x19, 0x40, 0x13,
-             0x40, 0x11, 0xc0, 0x15,
-             0xc0, 0x2b, 0x0c, 0x59,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xe0, 0x14, 0x02, 0x29,
-             0x66, 0x35, 0x00, 0x3b,
-             0x84, 0x44, 0xc0, 0x16,
-             0x06, 0x34, 0x82, 0x29,
-             0x40, 0x45, 0xfc, 0x00,
-             0x40, 0x0b, 0x63, 0x15,
-             0x40, 0x33, 0xa4, 0x3f,
-             0x40, 0x16, 0x66, 0x35,
-             0xef, 0x14, 0x48, 0x06,
-             0x60, 0x24, 0x02, 0x29,
-             0xfc, 0x0c, 0x06, 0x34,
-             0xc2, 0x27, 0x90, 0x58,
-             0x4a, 0x50, 0x04, 0x29,
-             0xa4, 0x5f, 0xf3, 0xf4,
-             0x02, 0x29, 0x90, 0x56,
-             0xc6, 0x27, 0xe0, 0x28,
-             0xa6, 0x2f, 0x90, 0x29,
-             0x66, 0x35, 0x40, 0x23,
-             0x04, 0x24, 0x40, 0x16,
-             0x02, 0x39, 0xfc, 0x10,
-             0xc8, 0x37, 0xe0, 0x2c,
-             0xa4, 0x3f, 0xa0, 0x39,
-             0x66, 0x35, 0x40, 0x33,
-             0x46, 0x30, 0x40, 0x16,
-             0xc0, 0xff, 0x73, 0x7d,
-             0xe0, 0x30, 0x02, 0x29,
-             0x44, 0x20, 0xca, 0x27,
-             0x00, 0x29, 0xf0, 0x80,
-             0x40, 0x2b, 0x64, 0xc5,
-             0x40, 0x33, 0xa4, 0x3f,
-             0xc0, 0x16, 0x66, 0x35,
-             0xe0, 0x10, 0x02, 0x39,
-             0x40, 0x31, 0xa7, 0x2b,
-             0xc0, 0x2c, 0x6c, 0x71,
-             0x00, 0x29, 0x80, 0xf5,
-             0xc0, 0x2b, 0x6c, 0x11,
-             0xe0, 0x94, 0x44, 0x4a,
-             0x02, 0x29, 0x82, 0x65,
-             0x02, 0x39, 0xe0, 0x18,
-             0x40, 0x21, 0xe0, 0x20,
-             0xc0, 0x2c, 0x6c, 0x79,
-             0x66, 0x31, 0x40, 0x33,
-             0x02, 0x29, 0xc0, 0x16,
-             0x00, 0x39, 0xe0, 0x3c,
-             0xc0, 0x2c, 0x6d, 0x21,
-             0x6d, 0x39, 0x00, 0x59,
-             0x82, 0x29, 0xc0, 0x2c,
-             0xfc, 0x00, 0x06, 0x34,
-             0x60, 0x1c, 0x02, 0x29,
-             0x40, 0x31, 0xa4, 0x3f,
-             0x40, 0x2c, 0x6d, 0x21,
-             0xfc, 0x04, 0x06, 0x34,
-             0x60, 0x40, 0x02, 0x49,
-             0xf3, 0xf8, 0x4a, 0x50,
-             0x6c, 0x89, 0x40, 0x21,
-             0x04, 0x00, 0x40, 0x2c,
-             0xc0, 0x6e, 0x64, 0xc1,
-             0x84, 0x49, 0xc2, 0x47,
-             0x40, 0x41, 0xa6, 0x4f,
-             0x40, 0x2c, 0x6d, 0x21,
-             0xf3, 0xec, 0x48, 0x40,
-             0xe0, 0x44, 0x02, 0x39,
-             0xa6, 0x5f, 0x82, 0x39,
-             0x6d, 0x39, 0x40, 0x51,
-             0x02, 0x39, 0xc0, 0x2c,
-             0xc4, 0x37, 0xe0, 0x48,
-             0xa6, 0x4f, 0x88, 0x39,
-             0x6d, 0x21, 0x40, 0x41,
-             0x02, 0x39, 0xc0, 0x2c,
-             0x00, 0x49, 0xe0, 0x4c,
-             0xc0, 0x2c, 0x6d, 0x15,
-             0x46, 0x30, 0xca, 0x37,
-             0x48, 0x40, 0x70, 0x80,
-             0xa6, 0x4f, 0xf3, 0x7c,
-             0x6d, 0x15, 0x40, 0x41,
-             0x02, 0x39, 0xc0, 0x2c,
-             0x00, 0x49, 0xe0, 0x50,
-             0xc0, 0x2c, 0x6d, 0x51,
-             0x08, 0x44, 0x82, 0x39,
-             0xa6, 0x4f, 0xfc, 0x00,
-             0x6d, 0x51, 0x40, 0x41,
-             0x08, 0x44, 0x40, 0x2c,
-             0x02, 0x39, 0xfc, 0x04,
-             0xc2, 0x37, 0xe0, 0x54,
-             0xa8, 0x3f, 0x84, 0x39,
-             0x6d, 0x51, 0x40, 0x31,
-             0x06, 0x34, 0x40, 0x2c,
-             0x02, 0x49, 0xfc, 0x08,
-             0xc4, 0x47, 0xe0, 0x58,
-             0xa8, 0x3f, 0x88, 0x49,
-             0x6d, 0x51, 0x40, 0x31,
-             0x46, 0x30, 0x40, 0x2c,
-             0x02, 0x49, 0xf3, 0xdc,
-             0xc6, 0x47, 0xe0, 0x5c,
-             0xa8, 0x3f, 0x90, 0x49,
-             0x6d, 0x51, 0x40, 0x31,
-             0x9f, 0x31, 0x40, 0x2c,
-             0x02, 0x49, 0x81, 0x65,
-             0x06, 0x30, 0x60, 0x34,
-             0xc9, 0x46, 0xec, 0x04,
-             0xfe, 0x55, 0xa1, 0x3b,
-             0xe0, 0x38, 0x02, 0x29,
-             0x68, 0xfd, 0x40, 0x21,
-             0x02, 0x19, 0xc0, 0x1b,
-             0x40, 0x11, 0xe0, 0x34,
-             0xc0, 0x22, 0x6f, 0xb9,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x00, 0x04, 0x0c,
-             0xec, 0x60, 0x1e, 0xf0,
-             0x0c, 0x05, 0x80, 0x6b,
-             0xc0, 0x0a, 0x6d, 0x65,
-             0x62, 0x19, 0x0c, 0x19,
-             0x0c, 0x29, 0xc0, 0x15,
-             0xc0, 0x2b, 0x6c, 0x21,
-             0x65, 0xb9, 0x0c, 0x39,
-             0x3c, 0x0e, 0xc0, 0x2b,
-             0x11, 0x16, 0x81, 0x01,
-             0x0f, 0x36, 0x83, 0x11,
-             0x8b, 0x06, 0xa3, 0x2b,
-             0x82, 0x25, 0x8d, 0x16,
-             0x82, 0x85, 0xa7, 0x2b,
-             0x5e, 0x11, 0xa5, 0x2b,
-             0x04, 0x26, 0x00, 0x24,
-             0x80, 0x85, 0x80, 0x00,
-             0x45, 0xf6, 0x13, 0x06,
-             0x03, 0x45, 0xe0, 0x0c,
-             0x0c, 0x4b, 0x83, 0x31,
-             0x40, 0x15, 0x6e, 0x09,
-             0x0c, 0x25, 0xfd, 0x51,
-             0xc0, 0x0c, 0x6d, 0x5d,
-             0x21, 0x2b, 0xcb, 0x47,
-             0x06, 0x0c, 0x85, 0x21,
-             0xc8, 0x4b, 0x62, 0x00,
-             0x04, 0x16, 0x13, 0x36,
-             0x46, 0x42, 0xc0, 0x00,
-             0x0c, 0x49, 0xf9, 0x94,
-             0xc0, 0x2b, 0x65, 0xb5,
-             0x8b, 0x21, 0x09, 0x26,
-             0x00, 0x16, 0x27, 0x06,
-             0xc0, 0x40, 0x70, 0x11,
-             0x82, 0x49, 0x0b, 0x0e,
-             0x8c, 0x0b, 0x15, 0x36,
-             0x99, 0x36, 0x97, 0x36,
-             0x9d, 0x26, 0x9b, 0x16,
-             0xa1, 0x16, 0x9f, 0x46,
-             0xa5, 0x16, 0xa3, 0x16,
-             0xef, 0xfc, 0x69, 0x68,
-             0x8c, 0x0b, 0x1e, 0x1b,
-             0xef, 0xfc, 0x6d, 0x88,
-             0x0c, 0x0c, 0xb0, 0xf1,
-             0xdd, 0x93, 0xf2, 0x00,
-             0xfa, 0x00, 0x04, 0x0c,
-             0xec, 0x60, 0x1e, 0xf0,
-             0x70, 0x00, 0x02, 0x16,
-             0xe0, 0x04, 0x04, 0x06,
-             0x81, 0x01, 0x00, 0x6b,
-             0x83, 0x11, 0x3e, 0x1e,
-             0x8b, 0x21, 0x11, 0x26,
-             0x9b, 0x16, 0xbc, 0x0e,
-             0x9f, 0x06, 0x9d, 0x26,
-             0xa3, 0x06, 0xa1, 0x16,
-             0xa7, 0x06, 0xa5, 0x06,
-             0xab, 0x16, 0xa9, 0x16,
-             0xaf, 0x06, 0xad, 0x16,
-             0x8c, 0x0b, 0x13, 0x06,
-             0x97, 0x16, 0x95, 0x16,
-             0x66, 0xd8, 0x99, 0x16,
-             0x1e, 0x1b, 0xef, 0xfc,
-             0x6a, 0xf8, 0x8c, 0x0b,
-             0xb0, 0xf1, 0xef, 0xfc,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x00, 0x04, 0x0c,
-             0xec, 0x60, 0x1e, 0xf0,
-             0x83, 0x21, 0x00, 0x6b,
-             0x61, 0xd1, 0x0c, 0x19,
-             0x0c, 0x39, 0xc0, 0x15,
-             0xc0, 0x15, 0x62, 0x19,
-             0x6d, 0x65, 0x0c, 0x05,
-             0x89, 0x16, 0xc0, 0x0a,
-             0x65, 0xb9, 0x0c, 0x19,
-             0x11, 0x36, 0xc0, 0x2b,
-             0x3c, 0x0e, 0x89, 0x31,
-             0x8f, 0x16, 0x81, 0x01,
-             0x65, 0xb5, 0x0c, 0x19,
-             0x1b, 0x36, 0xc0, 0x2b,
-             0x8b, 0x06, 0x8f, 0x31,
-             0x82, 0x19, 0x0d, 0x26,
-             0x02, 0x16, 0x1f, 0x16,
-             0xc0, 0x40, 0x70, 0x11,
-             0xa1, 0x26, 0x9d, 0x36,
-             0xa5, 0x26, 0xa3, 0x26,
-             0x13, 0x06, 0xa7, 0x06,
-             0x8b, 0x1e, 0x8c, 0x0b,
-             0x97, 0x26, 0x95, 0x26,
-             0x63, 0x38, 0x99, 0x26,
-             0x1e, 0x1b, 0xef, 0xfc,
-             0x67, 0x58, 0x8c, 0x0b,
-             0xb0, 0xf1, 0xef, 0xfc,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x00, 0x04, 0x0c,
-             0xec, 0x60, 0x1e, 0xf0,
-             0x83, 0x21, 0x00, 0x6b,
-             0x61, 0xd1, 0x0c, 0x19,
-             0x0c, 0x39, 0xc0, 0x15,
-             0xc0, 0x15, 0x62, 0x19,
-             0x6d, 0x65, 0x0c, 0x05,
-             0x89, 0x16, 0xc0, 0x0a,
-             0x65, 0xb9, 0x0c, 0x19,
-             0x11, 0x36, 0xc0, 0x2b,
-             0x3c, 0x0e, 0x87, 0x31,
-             0x8f, 0x16, 0x81, 0x01,
-             0x65, 0xb5, 0x0c, 0x19,
-             0x1b, 0x36, 0xc0, 0x2b,
-             0x8b, 0x06, 0x8d, 0x31,
-             0x82, 0x19, 0x0d, 0x26,
-             0x02, 0x16, 0x1f, 0x16,
-             0xc0, 0x40, 0x70, 0x11,
-             0xa1, 0x26, 0x9d, 0x36,
-             0xa5, 0x26, 0xa3, 0x26,
-             0x13, 0x06, 0xa7, 0x06,
-             0x8b, 0x1e, 0x8c, 0x0b,
-             0x97, 0x26, 0x95, 0x26,
-             0x5f, 0x98, 0x99, 0x26,
-             0x1e, 0x1b, 0xef, 0xfc,
-             0x63, 0xb8, 0x8c, 0x0b,
-             0xb0, 0xf1, 0xef, 0xfc,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x00, 0x04, 0x0c,
-             0xec, 0x60, 0x1e, 0xf0,
-             0x83, 0x21, 0x00, 0x6b,
-             0x65, 0xb5, 0x0c, 0x09,
-             0x81, 0x41, 0x40, 0x2b,
-             0x62, 0x19, 0x0c, 0x39,
-             0x0a, 0x16, 0x40, 0x15,
-             0xbc, 0x4e, 0xf0, 0x00,
-             0x61, 0x8c, 0x02, 0x04,
-             0x11, 0x36, 0x82, 0x09,
-             0xf8, 0x88, 0x42, 0x12,
-             0x8b, 0x31, 0x1f, 0x06,
-             0x8c, 0x0b, 0x3e, 0x5e,
-             0x9d, 0x36, 0x9b, 0x26,
-             0xa3, 0x46, 0xa1, 0x46,
-             0xa7, 0x16, 0xa5, 0x46,
-             0xab, 0x46, 0xa9, 0x26,
-             0xaf, 0x46, 0xad, 0x26,
-             0x95, 0x26, 0x93, 0x46,
-             0x99, 0x26, 0x97, 0x26,
-             0xef, 0xfc, 0x5c, 0x68,
-             0x8c, 0x0b, 0x1e, 0x1b,
-             0xef, 0xfc, 0x60, 0x88,
-             0x0c, 0x0c, 0xb0, 0xf1,
-             0xdd, 0x93, 0xf2, 0x00,
-             0xfa, 0x00, 0x04, 0x0c,
-             0xec, 0x60, 0x1e, 0xf0,
-             0x04, 0x16, 0x00, 0x6b,
-             0xc0, 0x04, 0x60, 0x11,
-             0x6c, 0x21, 0x0c, 0x09,
-             0xa1, 0x31, 0x40, 0x2b,
-             0x83, 0x21, 0x3e, 0x2e,
-             0x8b, 0x31, 0x11, 0x36,
-             0x60, 0x34, 0x00, 0x4a,
-             0x02, 0x0c, 0x81, 0x01,
-             0xbc, 0x0e, 0xe2, 0x00,
-             0x9d, 0x36, 0x9b, 0x26,
-             0xa1, 0x06, 0x9f, 0x06,
-             0xa5, 0x26, 0xa3, 0x06,
-             0xa9, 0x26, 0xa7, 0x16,
-             0x13, 0x06, 0xab, 0x06,
-             0xad, 0x26, 0x8c, 0x0b,
-             0x95, 0x26, 0xaf, 0x26,
-             0x99, 0x26, 0x97, 0x26,
-             0xef, 0xfc, 0x59, 0x68,
-             0x8c, 0x0b, 0x1e, 0x1b,
-             0xef, 0xfc, 0x5d, 0x88,
-             0x0c, 0x0c, 0xb0, 0xf1,
-             0xdd, 0x93, 0xf2, 0x00,
-             0xfa, 0x0c, 0x04, 0x0c,
-             0x02, 0x06, 0x00, 0x6b,
-             0x74, 0x98, 0xe2, 0x80,
-             0x40, 0x46, 0xe8, 0x04,
-             0x0f, 0x86, 0x60, 0x04,
-             0x4c, 0x01, 0xe0, 0x10,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x81, 0x95, 0x8c, 0x8b,
-             0x63, 0x81, 0x10, 0x09,
-             0x40, 0xf8, 0xc0, 0x27,
-             0x61, 0x06, 0xe8, 0x00,
-             0xec, 0x04, 0x0e, 0x70,
-             0xfc, 0xf5, 0xa1, 0x7b,
-             0x45, 0x76, 0x01, 0x11,
-             0x0c, 0x0b, 0xe0, 0x00,
-             0x0c, 0x0c, 0x8c, 0x3b,
-             0xa9, 0x15, 0xf2, 0x0c,
-             0x61, 0x84, 0x04, 0x04,
-             0xe1, 0x8c, 0x02, 0x04,
-             0x70, 0x80, 0x44, 0x20,
-             0xf0, 0x3c, 0x48, 0x00,
-             0x60, 0x84, 0x06, 0x04,
-             0x28, 0x2f, 0xa0, 0x19,
-             0x46, 0x30, 0xc6, 0x07,
-             0xa2, 0x2f, 0x71, 0x00,
-             0x72, 0x00, 0x40, 0x00,
-             0x5d, 0x93, 0xa6, 0x2f,
-             0xc1, 0xc3, 0xa4, 0x0f,
-             0x60, 0x04, 0x48, 0x26,
-             0x64, 0x0c, 0x4b, 0x06,
-             0x40, 0x41, 0xc0, 0x20,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x64, 0x0d, 0x48, 0x06,
-             0x81, 0x35, 0xc0, 0x20,
-             0xd1, 0xc6, 0xcd, 0xc8,
-             0xfe, 0xb5, 0x8b, 0x4b,
-             0x81, 0x15, 0x85, 0x31,
-             0xfa, 0x7c, 0x04, 0x4c,
-             0x40, 0x06, 0x00, 0x6b,
-             0x00, 0x04, 0xe1, 0x14,
-             0x47, 0x86, 0x86, 0x7b,
-             0x13, 0x46, 0x60, 0x04,
-             0x4c, 0x31, 0xe1, 0x2c,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x00, 0x38, 0xad, 0x7b,
-             0xe0, 0x39, 0x81, 0xb1,
-             0x41, 0x06, 0x00, 0x36,
-             0x00, 0x04, 0xe1, 0x14,
-             0xe0, 0x04, 0x47, 0x96,
-             0x6c, 0x1d, 0x4c, 0x31,
-             0x83, 0x31, 0x40, 0x2b,
-             0xa4, 0x04, 0x80, 0x36,
-             0x86, 0x85, 0x80, 0xb6,
-             0x8a, 0x05, 0xa3, 0x7b,
-             0x8c, 0xc5, 0xa5, 0x7b,
-             0x90, 0x25, 0xa7, 0x7b,
-             0x92, 0xe5, 0xa9, 0x7b,
-             0x84, 0x45, 0xab, 0x7b,
-             0x96, 0xb5, 0xa1, 0x7b,
-             0x61, 0x2c, 0x00, 0x06,
-             0x80, 0x04, 0x9f, 0x11,
-             0x00, 0x46, 0x00, 0xb6,
-             0x80, 0x04, 0xe1, 0x2c,
-             0xa4, 0x04, 0x80, 0x16,
-             0x42, 0x10, 0x80, 0x18,
-             0x80, 0x16, 0xf3, 0xe4,
-             0x00, 0x86, 0x8b, 0xa5,
-             0x80, 0x04, 0xe1, 0x2c,
-             0x00, 0xc6, 0x00, 0x16,
-             0x80, 0x04, 0xe1, 0x2c,
-             0xa4, 0x04, 0x80, 0x26,
-             0x42, 0x10, 0x80, 0x18,
-             0x80, 0x16, 0xfd, 0x80,
-             0x00, 0x06, 0x89, 0xc5,
-             0x9f, 0x11, 0x61, 0x2c,
-             0x00, 0xb6, 0x80, 0x04,
-             0xe1, 0x2c, 0x00, 0x46,
-             0x80, 0x16, 0x80, 0x04,
-             0x80, 0x18, 0xa4, 0x04,
-             0xf3, 0xe4, 0x42, 0x10,
-             0x80, 0x16, 0xc4, 0x19,
-             0x00, 0x06, 0x87, 0xc5,
-             0x80, 0x04, 0xe1, 0x2c,
-             0x00, 0x46, 0x00, 0x16,
-             0x80, 0x04, 0xe1, 0x2c,
-             0xa4, 0x04, 0x80, 0x26,
-             0xcc, 0x19, 0x80, 0x18,
-             0x85, 0xf5, 0x80, 0x16,
-             0x61, 0x2c, 0x00, 0x86,
-             0xe0, 0x00, 0x43, 0x76,
-             0x00, 0xb6, 0x80, 0x04,
-             0xe1, 0x2c, 0x00, 0xc6,
-             0x80, 0x16, 0x80, 0x04,
-             0x80, 0x18, 0xa4, 0x04,
-             0xf2, 0x7c, 0x42, 0x10,
-             0x83, 0xf5, 0x80, 0x16,
-             0x61, 0x2c, 0x00, 0x86,
-             0xe0, 0x00, 0x43, 0x76,
-             0x00, 0xb6, 0x80, 0x04,
-             0xe1, 0x2c, 0x00, 0xc6,
-             0x80, 0x16, 0x80, 0x04,
-             0x80, 0x18, 0xa4, 0x04,
-             0xf2, 0x7c, 0x42, 0x10,
-             0xfc, 0x94, 0x02, 0x14,
-             0x81, 0xd5, 0x80, 0x16,
-             0x6c, 0x1d, 0x0c, 0x29,
-             0x11, 0xa6, 0x40, 0x2b,
-             0x03, 0xa6, 0xe0, 0x08,
-             0x8c, 0x0b, 0x60, 0x08,
-             0xef, 0xc4, 0x40, 0xa8,
-             0x9a, 0x85, 0xa3, 0x0b,
-             0xe1, 0x2c, 0x15, 0xc6,
-             0x80, 0x08, 0xa8, 0x04,
-             0x80, 0xf5, 0xa1, 0x0b,
-             0xe1, 0x34, 0x00, 0x46,
-             0x80, 0x04, 0x80, 0x04,
-             0x82, 0xb5, 0xb1, 0x0b,
-             0x6c, 0x1d, 0x0c, 0x29,
-             0x11, 0xa6, 0x40, 0x2b,
-             0x03, 0xa6, 0xe0, 0x08,
-             0x8c, 0x0b, 0x60, 0x08,
-             0xef, 0xc0, 0x7f, 0x28,
-             0x94, 0x85, 0xa3, 0x0b,
-             0xe4, 0x7d, 0x24, 0x04,
-             0x88, 0xd5, 0x80, 0x18,
-             0x81, 0x21, 0x42, 0x19,
-             0x42, 0x86, 0x00, 0x16,
-             0x71, 0x98, 0xe0, 0x3c,
-             0x8c, 0x0b, 0x68, 0x00,
-             0x61, 0x40, 0x41, 0x46,
-             0xe1, 0x34, 0x04, 0x46,
-             0xa8, 0x14, 0x80, 0x04,
-             0x80, 0x38, 0x88, 0x24,
-             0x48, 0x0a, 0x84, 0x48,
-             0x80, 0x85, 0xe0, 0x80,
-             0xb5, 0x4b, 0x88, 0x44,
-             0x46, 0x0a, 0x8e, 0x15,
-             0x80, 0x85, 0xe0, 0x8c,
-             0xb5, 0x3b, 0x88, 0x34,
-             0x0c, 0x29, 0xfc, 0x75,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0xe0, 0x08, 0x11, 0xb6,
-             0x03, 0xb6, 0x05, 0x75,
-             0x60, 0x19, 0xe0, 0x08,
-             0x00, 0x16, 0x81, 0x21,
-             0xe0, 0x3c, 0x42, 0x86,
-             0x68, 0x00, 0x6f, 0x48,
-             0x41, 0x46, 0x8c, 0x0b,
-             0x04, 0x46, 0x61, 0x40,
-             0x80, 0x04, 0xe1, 0x34,
-             0x88, 0x24, 0xa8, 0x14,
-             0x84, 0x48, 0x80, 0x38,
-             0xe0, 0x90, 0x48, 0x0a,
-             0x88, 0x44, 0x80, 0x85,
-             0x84, 0x75, 0xb3, 0x4b,
-             0xe0, 0x8c, 0x46, 0x0a,
-             0x88, 0x34, 0x80, 0x85,
-             0xfc, 0x75, 0xb3, 0x3b,
-             0x6c, 0x1d, 0x0c, 0x29,
-             0x11, 0xc6, 0x40, 0x2b,
-             0x03, 0xc6, 0xe0, 0x08,
-             0x7a, 0x18, 0xe0, 0x08,
-             0x8c, 0x0b, 0x6f, 0xc0,
-             0x80, 0x45, 0xa3, 0x0b,
-             0x73, 0xd8, 0x81, 0x81,
-             0x24, 0x04, 0xe8, 0x00,
-             0xe0, 0x08, 0x02, 0xf6,
-             0x40, 0x06, 0x00, 0xb6,
-             0x80, 0x04, 0xe1, 0x14,
-             0x6c, 0x1d, 0x4c, 0x11,
-             0x80, 0x18, 0xc0, 0x2b,
-             0xf3, 0xbc, 0x42, 0x10,
-             0x41, 0x06, 0x00, 0x16,
-             0x80, 0x04, 0xe1, 0x14,
-             0x90, 0x0b, 0x00, 0xb6,
-             0xf2, 0x7c, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x60, 0x04, 0x48, 0x56,
-             0x64, 0x20, 0x0b, 0x86,
-             0x40, 0x41, 0xc0, 0x20,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x64, 0x11, 0x08, 0x06,
-             0x81, 0x35, 0xc0, 0x20,
-             0xd1, 0xc6, 0xcd, 0xc8,
-             0xfe, 0xb5, 0x8b, 0x4b,
-             0xdb, 0x75, 0x8d, 0x31,
-             0x64, 0x31, 0x49, 0x06,
-             0x4b, 0xc6, 0x40, 0x20,
-             0xc0, 0x20, 0x64, 0x39,
-             0xcd, 0xc8, 0x81, 0x35,
-             0x8b, 0x4b, 0xd1, 0xc6,
-             0x8b, 0x31, 0xfe, 0xb5,
-             0xc1, 0xc3, 0xd9, 0xa5,
-             0xe0, 0x04, 0x44, 0x76,
-             0x6c, 0x1d, 0x40, 0x21,
-             0x41, 0xc6, 0x40, 0x2b,
-             0xc0, 0x20, 0x64, 0x39,
-             0x05, 0xc6, 0x01, 0x65,
-             0xc0, 0x20, 0x64, 0x3d,
-             0xc1, 0x36, 0xc5, 0x38,
-             0xfe, 0xb5, 0x85, 0x0b,
-             0x81, 0x01, 0x5d, 0x93,
-             0xfa, 0x1c, 0x04, 0x4c,
-             0x81, 0x11, 0x00, 0x7b,
-             0x81, 0x31, 0x01, 0x21,
-             0xef, 0xfc, 0x6b, 0x08,
-             0x0e, 0x70, 0x00, 0x6b,
-             0xc0, 0x9a, 0x66, 0xf1,
-             0x64, 0x0d, 0x51, 0x06,
-             0xa1, 0x91, 0x40, 0x20,
-             0xe1, 0x08, 0x81, 0x75,
-             0xef, 0xfc, 0x67, 0xc8,
-             0x12, 0x90, 0x5d, 0x06,
-             0xa1, 0x9b, 0xec, 0x04,
-             0x8c, 0x0b, 0xfe, 0x35,
-             0xf2, 0x1c, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x1c, 0x04, 0x4c,
-             0x81, 0x11, 0x00, 0x7b,
-             0x87, 0x31, 0x01, 0x21,
-             0xef, 0xfc, 0x69, 0x28,
-             0x0e, 0x70, 0x00, 0x6b,
-             0xc0, 0xb3, 0x66, 0xb1,
-             0x64, 0x21, 0x11, 0x86,
-             0x13, 0x86, 0x40, 0x20,
-             0x81, 0x75, 0xe0, 0x10,
-             0x65, 0xd8, 0xe1, 0x08,
-             0x5d, 0x06, 0xef, 0xfc,
-             0xec, 0x04, 0x12, 0x90,
-             0xfe, 0x35, 0xa1, 0x9b,
-             0x0c, 0x4c, 0x8c, 0x0b,
-             0xdd, 0x93, 0xf2, 0x1c,
-             0xfa, 0x7c, 0x04, 0x4c,
-             0x41, 0x46, 0x00, 0x6b,
-             0x00, 0x04, 0xe1, 0x14,
-             0xe0, 0x04, 0x42, 0x36,
-             0x6c, 0x1d, 0x4c, 0x11,
-             0x83, 0xb1, 0x40, 0x2b,
-             0x61, 0x30, 0x54, 0xc6,
-             0x00, 0xb6, 0x81, 0x91,
-             0xe1, 0x30, 0x51, 0xc6,
-             0x00, 0x96, 0xa8, 0x04,
-             0xe1, 0x30, 0x41, 0x06,
-             0x84, 0x28, 0x80, 0x14,
-             0xf3, 0xc0, 0x44, 0x20,
-             0x80, 0x04, 0x84, 0x26,
-             0x9e, 0x19, 0x80, 0x18,
-             0xff, 0x40, 0x42, 0x10,
-             0x41, 0x86, 0x00, 0x16,
-             0x80, 0x04, 0xe1, 0x30,
-             0xa0, 0x04, 0x80, 0x96,
-             0xa1, 0x0b, 0x80, 0x08,
-             0x00, 0x46, 0x80, 0xf5,
-             0x80, 0x04, 0xe1, 0x34,
-             0xbb, 0x0b, 0x80, 0x04,
-             0x0c, 0x29, 0x82, 0xb5,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0xe0, 0x08, 0x0f, 0xa6,
-             0x60, 0x08, 0x03, 0xa6,
-             0x6d, 0xd8, 0x8c, 0x0b,
-             0xa3, 0x0b, 0xef, 0xc0,
-             0x28, 0x04, 0x8a, 0x45,
-             0xe0, 0x3c, 0x42, 0x86,
-             0x00, 0xb6, 0x81, 0x21,
-             0x60, 0x78, 0x8c, 0x0b,
-             0x41, 0x46, 0xe8, 0x00,
-             0x04, 0x46, 0x61, 0x40,
-             0x80, 0x04, 0xe1, 0x34,
-             0x88, 0x24, 0xa0, 0x14,
-             0x84, 0x48, 0x80, 0x38,
-             0x80, 0x85, 0xa1, 0x4b,
-             0xbd, 0x4b, 0x88, 0x44,
-             0x46, 0x0a, 0x84, 0x75,
-             0x80, 0x85, 0xe0, 0x8c,
-             0xbd, 0x3b, 0x88, 0x34,
-             0x0c, 0x29, 0xfc, 0x95,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0xe0, 0x08, 0x0f, 0xc6,
-             0x60, 0x08, 0x03, 0xc6,
-             0x6b, 0x58, 0x8c, 0x0b,
-             0xa3, 0x0b, 0xef, 0xc0,
-             0x81, 0x71, 0x80, 0x45,
-             0xe8, 0x00, 0x65, 0x28,
-             0x00, 0x96, 0xa8, 0x04,
-             0xe1, 0x14, 0x41, 0x46,
-             0x00, 0x96, 0x80, 0x04,
-             0x0c, 0x4c, 0x8e, 0x0b,
-             0xdd, 0x93, 0xf2, 0x7c,
-             0x00, 0x25, 0xa1, 0x1b,
-             0x00, 0x0b, 0x05, 0x21,
-             0x81, 0x2c, 0x42, 0xc6,
-             0x80, 0x00, 0x02, 0x15,
-             0x80, 0x00, 0x42, 0x25,
-             0xa3, 0x1b, 0x80, 0xc5,
-             0xa5, 0x1b, 0x80, 0x85,
-             0x83, 0x65, 0x82, 0x25,
-             0x65, 0x31, 0x00, 0x25,
-             0x43, 0x06, 0x40, 0x0b,
-             0x84, 0x14, 0xe1, 0x2c,
-             0x00, 0x25, 0x84, 0x2e,
-             0x40, 0x0b, 0x65, 0x21,
-             0xe1, 0x2c, 0x42, 0xc6,
-             0x04, 0x2e, 0x84, 0x14,
-             0xe1, 0x2c, 0x43, 0x06,
-             0x65, 0x31, 0x00, 0x05,
-             0x84, 0x14, 0xc0, 0x0b,
-             0xdd, 0x93, 0x84, 0x0e,
-             0xf8, 0x0c, 0x04, 0x4c,
-             0x61, 0x14, 0x45, 0x46,
-             0x08, 0x34, 0xa5, 0x1b,
-             0x8c, 0x46, 0x81, 0x41,
-             0xa3, 0x1b, 0x88, 0x25,
-             0x42, 0x06, 0x10, 0x25,
-             0xa1, 0x1b, 0x81, 0x2c,
-             0x00, 0x39, 0x9a, 0x35,
-             0x40, 0x2d, 0x65, 0x31,
-             0xe1, 0x2c, 0x42, 0x06,
-             0x4b, 0xb6, 0x04, 0x14,
-             0x89, 0xc1, 0xe0, 0x0c,
-             0x84, 0x48, 0x82, 0x39,
-             0xf3, 0xf8, 0x48, 0x40,
-             0x87, 0x31, 0x26, 0x4f,
-             0x43, 0x76, 0x04, 0x46,
-             0x00, 0x49, 0xe0, 0x0c,
-             0x40, 0x2d, 0x65, 0x31,
-             0x65, 0x31, 0x00, 0x00,
-             0x07, 0xd5, 0xc0, 0xb5,
-             0x00, 0x49, 0xc2, 0x47,
-             0x40, 0x2d, 0x65, 0x31,
-             0xe1, 0x2c, 0x42, 0x06,
-             0x82, 0x49, 0x84, 0x34,
-             0x4a, 0x50, 0x8c, 0x58,
-             0xa8, 0x5f, 0xf3, 0xf8,
-             0x84, 0x34, 0x8c, 0x56,
-             0x65, 0x31, 0x00, 0x49,
-             0x8c, 0x58, 0xc0, 0x2d,
-             0x88, 0x49, 0xc2, 0x47,
-             0xf3, 0xec, 0x4a, 0x50,
-             0x8c, 0x56, 0xa8, 0x5f,
-             0x00, 0x49, 0x84, 0x34,
-             0xc0, 0x2d, 0x65, 0x31,
-             0xc2, 0x47, 0x8c, 0x58,
-             0x4a, 0x50, 0x90, 0x49,
-             0xa8, 0x5f, 0xf3, 0xdc,
-             0x04, 0x14, 0x8c, 0x56,
-             0xe0, 0x08, 0x4b, 0xf6,
-             0x65, 0x35, 0x00, 0x39,
-             0x18, 0x06, 0x40, 0x2d,
-             0x84, 0x48, 0xe0, 0x04,
-             0xa0, 0x39, 0xc8, 0x37,
-             0xf3, 0xbc, 0x48, 0x40,
-             0x8f, 0x31, 0x26, 0x4f,
-             0x43, 0xf6, 0x04, 0x46,
-             0x00, 0x49, 0xe0, 0x04,
-             0x40, 0x2d, 0x65, 0x35,
-             0x65, 0x35, 0x00, 0x00,
-             0xca, 0x47, 0xc0, 0xb5,
-             0x61, 0x2c, 0x4c, 0x06,
-             0x18, 0x74, 0x98, 0x4f,
-             0xfa, 0x80, 0x06, 0x34,
-             0x8a, 0x8f, 0x9c, 0x88,
-             0x9c, 0x86, 0xa8, 0x8f,
-             0x80, 0x08, 0x98, 0x44,
-             0xc5, 0x07, 0x90, 0x58,
-             0x27, 0x0f, 0x82, 0x09,
-             0xa0, 0x5f, 0x82, 0x5f,
-             0x08, 0x04, 0x90, 0x56,
-             0x80, 0x16, 0x83, 0x11,
-             0xf0, 0x0c, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xf8, 0x0c, 0x04, 0x4c,
-             0x61, 0x88, 0x04, 0x14,
-             0xe1, 0x94, 0x06, 0xc6,
-             0x86, 0x19, 0x0c, 0x54,
-             0x60, 0x90, 0x08, 0x24,
-             0x64, 0xb0, 0x06, 0x00,
-             0xa2, 0x4f, 0xc0, 0x8b,
-             0x0a, 0x43, 0xc4, 0x47,
-             0x81, 0xd5, 0x81, 0x51,
-             0x18, 0xc0, 0x5d, 0x84,
-             0x4c, 0x85, 0xec, 0x04,
-             0xa1, 0xcb, 0xf0, 0x10,
-             0x20, 0x31, 0xfe, 0x55,
-             0x08, 0x40, 0x82, 0x51,
-             0xc0, 0x01, 0x64, 0x01,
-             0x18, 0x46, 0xa5, 0x5b,
-             0x4c, 0x40, 0x40, 0x00,
-             0x7c, 0x95, 0xdc, 0x00,
-             0xdc, 0x00, 0x4e, 0x30,
-             0x61, 0x90, 0x47, 0xc6,
-             0xe0, 0x00, 0x4b, 0x86,
-             0x65, 0x16, 0x44, 0x2a,
-             0x64, 0x00, 0x00, 0x00,
-             0x0c, 0x34, 0xc0, 0x8c,
-             0xe0, 0x0c, 0x48, 0x06,
-             0x81, 0x51, 0x03, 0x35,
-             0x65, 0x12, 0x4c, 0x5a,
-             0xf0, 0xb0, 0x4e, 0x12,
-             0x00, 0x65, 0x84, 0x63,
-             0x8c, 0x73, 0x7c, 0x30,
-             0x88, 0xc1, 0x44, 0x77,
-             0x9c, 0x6e, 0x86, 0x73,
-             0xe0, 0xe0, 0x18, 0x0a,
-             0x70, 0x01, 0xfc, 0x55,
-             0xb5, 0x5b, 0x82, 0x51,
-             0x18, 0x06, 0x7e, 0x55,
-             0x81, 0x01, 0xc0, 0x00,
-             0xf0, 0x0c, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xf8, 0x3c, 0x04, 0x4c,
-             0x61, 0x88, 0x06, 0x14,
-             0xe0, 0x08, 0x0b, 0x06,
-             0x93, 0x21, 0x06, 0x19,
-             0x66, 0x96, 0x4a, 0x3a,
-             0xe0, 0x90, 0x08, 0x34,
-             0x66, 0x8a, 0x58, 0x1a,
-             0x65, 0xb0, 0x0c, 0x00,
-             0xa2, 0x4f, 0xc0, 0x8b,
-             0x81, 0xc1, 0x18, 0x53,
-             0x0e, 0x60, 0x83, 0x75,
-             0x89, 0x81, 0x64, 0x40,
-             0x8a, 0xab, 0x08, 0x9b,
-             0x59, 0xae, 0x81, 0x85,
-             0xec, 0x04, 0x10, 0x80,
-             0x60, 0x1c, 0x4c, 0x95,
-             0x88, 0x91, 0xc8, 0xa1,
-             0xfe, 0x15, 0xa1, 0x8b,
-             0x0a, 0x50, 0x02, 0xc1,
-             0xc0, 0x02, 0x65, 0x01,
-             0x65, 0x00, 0x08, 0x40,
-             0xa5, 0xcb, 0x8e, 0x6b,
-             0x4b, 0x86, 0xfa, 0x35,
-             0x08, 0x00, 0x60, 0x00,
-             0xc0, 0x90, 0x65, 0x80,
-             0x65, 0x16, 0x46, 0x3a,
-             0xe0, 0x0c, 0x40, 0x06,
-             0x81, 0x51, 0x03, 0x55,
-             0x65, 0x02, 0x4e, 0x5a,
-             0xf0, 0x98, 0x50, 0x12,
-             0x70, 0x98, 0x52, 0x42,
-             0x86, 0x73, 0x88, 0x61,
-             0x4e, 0x8a, 0x8e, 0x83,
-             0xa4, 0x7e, 0xe6, 0x8a,
-             0xe2, 0x30, 0x52, 0x85,
-             0xe0, 0xe0, 0x0c, 0x0a,
-             0x02, 0x51, 0xfc, 0x15,
-             0xb5, 0x5b, 0x98, 0x4b,
-             0x44, 0xe0, 0x18, 0x40,
-             0xc0, 0x00, 0x0c, 0x06,
-             0x81, 0x01, 0xfc, 0xd5,
-             0xf0, 0x3c, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x6f, 0xfc, 0x44, 0x68,
-             0x8c, 0x0b, 0x80, 0x6b,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0xff, 0xf0, 0x05, 0xe8,
-             0x00, 0x00, 0x5d, 0x93,
-             0xc0, 0x28, 0x65, 0x41,
-             0x00, 0x00, 0x5d, 0x93,
-             0xc0, 0x2b, 0x66, 0x11,
-             0x61, 0x08, 0x03, 0x06,
-             0x84, 0x14, 0x9d, 0x21,
-             0x02, 0x86, 0x04, 0x26,
-             0x04, 0x24, 0xe1, 0x08,
-             0x08, 0x16, 0x83, 0x11,
-             0xe1, 0x14, 0x44, 0x06,
-             0x88, 0x38, 0x88, 0x24,
-             0x08, 0x36, 0xc8, 0x39,
-             0x60, 0x01, 0x06, 0x06,
-             0x00, 0x25, 0xc0, 0x40,
-             0xc0, 0x0a, 0x6e, 0xf1,
-             0xa1, 0x21, 0x47, 0x2d,
-             0x08, 0x05, 0x00, 0x29,
-             0x00, 0x46, 0x00, 0x27,
-             0x80, 0x04, 0xe1, 0x28,
-             0x00, 0x06, 0x00, 0x26,
-             0x80, 0x04, 0xe1, 0x28,
-             0xdd, 0x93, 0x80, 0x16,
-             0xe1, 0x28, 0x02, 0x86,
-             0x84, 0x28, 0x84, 0x14,
-             0x87, 0x2b, 0x84, 0x38,
-             0x02, 0x20, 0xfe, 0xb5,
-             0x40, 0x11, 0xed, 0x5c,
-             0xc0, 0x2c, 0x6d, 0x01,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x60, 0x08, 0x43, 0x56,
-             0xe1, 0x28, 0x04, 0x86,
-             0x6c, 0x1d, 0x40, 0x11,
-             0x88, 0x14, 0xc0, 0x2b,
-             0x84, 0x38, 0x84, 0x28,
-             0xfe, 0xb5, 0x87, 0x2b,
-             0xed, 0x5c, 0x02, 0x20,
-             0x6d, 0x01, 0x40, 0x11,
-             0x40, 0x11, 0xc0, 0x2c,
-             0xc0, 0x15, 0x61, 0x31,
-             0x65, 0x39, 0x40, 0x11,
-             0xdd, 0x93, 0xc0, 0x22,
-             0x60, 0x08, 0x43, 0x66,
-             0xe1, 0x28, 0x04, 0x86,
-             0x6c, 0x1d, 0x40, 0x11,
-             0x88, 0x14, 0xc0, 0x2b,
-             0x84, 0x38, 0x84, 0x28,
-             0xfe, 0xb5, 0x87, 0x2b,
-             0xed, 0x5c, 0x02, 0x20,
-             0x6d, 0x01, 0x40, 0x11,
-             0x40, 0x11, 0xc0, 0x2c,
-             0xc0, 0x15, 0x61, 0x31,
-             0x65, 0x59, 0x40, 0x11,
-             0xdd, 0x93, 0xc0, 0x1b,
-             0x60, 0x08, 0x43, 0x96,
-             0xe1, 0x28, 0x04, 0x86,
-             0x6c, 0x1d, 0x40, 0x11,
-             0x88, 0x14, 0xc0, 0x2b,
-             0x84, 0x38, 0x84, 0x28,
-             0xfe, 0xb5, 0x87, 0x2b,
-             0xed, 0x5c, 0x02, 0x20,
-             0x6d, 0x01, 0x40, 0x11,
-             0x40, 0x11, 0xc0, 0x2c,
-             0xc0, 0x15, 0x61, 0x35,
-             0x62, 0xf1, 0x40, 0x11,
-             0x40, 0x11, 0xc0, 0x15,
-             0xc0, 0x1b, 0x65, 0x5d,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x6e, 0x01, 0x00, 0x0b,
-             0x47, 0x86, 0x40, 0x15,
-             0x0c, 0x34, 0xe1, 0x40,
-             0x87, 0x21, 0xa1, 0x2b,
-             0xe6, 0x86, 0x40, 0x0a,
-             0x41, 0x46, 0x0c, 0x0e,
-             0x80, 0x14, 0xe1, 0x40,
-             0x5c, 0x08, 0x84, 0x26,
-             0x80, 0x04, 0x9a, 0x00,
-             0x42, 0x4a, 0x80, 0x18,
-             0xfe, 0xa5, 0xe0, 0x8c,
-             0x80, 0x16, 0x81, 0x11,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x6e, 0x01, 0x00, 0x0b,
-             0x06, 0x46, 0x40, 0x15,
-             0x0c, 0x34, 0xe1, 0x44,
-             0x87, 0x21, 0xa1, 0x2b,
-             0xe6, 0x86, 0x40, 0x0a,
-             0x00, 0x06, 0x0c, 0x0e,
-             0x80, 0x14, 0xe1, 0x44,
-             0x5c, 0x08, 0x84, 0x26,
-             0x80, 0x04, 0x9a, 0x00,
-             0x42, 0x4a, 0x80, 0x18,
-             0xfe, 0xa5, 0xe0, 0x8c,
-             0x80, 0x16, 0x81, 0x11,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xf8, 0x00, 0x04, 0x4c,
-             0x61, 0x38, 0x4a, 0x46,
-             0x14, 0x34, 0x85, 0x61,
-             0x8c, 0x48, 0xa1, 0x2b,
-             0xf3, 0xec, 0x48, 0x40,
-             0x08, 0xc6, 0x0c, 0x46,
-             0x10, 0xc4, 0xe1, 0x44,
-             0xb0, 0x36, 0x81, 0x31,
-             0xb0, 0x66, 0x90, 0xc4,
-             0x30, 0x36, 0x90, 0xc4,
-             0xe1, 0x44, 0x19, 0x06,
-             0x6e, 0x01, 0x00, 0x0b,
-             0xb0, 0xc4, 0xc0, 0x15,
-             0x66, 0x86, 0x40, 0x0a,
-             0xb0, 0x0e, 0x87, 0x11,
-             0x00, 0x16, 0x90, 0x04,
-             0xe1, 0x38, 0x40, 0x86,
-             0x84, 0xc8, 0x80, 0x14,
-             0x84, 0xc6, 0xc8, 0xc9,
-             0x80, 0x18, 0x80, 0x04,
-             0xf3, 0xec, 0x42, 0x10,
-             0x94, 0x04, 0x80, 0x16,
-             0xc8, 0x19, 0x80, 0x18,
-             0x80, 0xe5, 0x80, 0x16,
-             0x80, 0x18, 0x90, 0x04,
-             0xe0, 0x8c, 0x42, 0x4a,
-             0x80, 0x36, 0xfe, 0xa5,
-             0xf0, 0x00, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x61, 0x40, 0x41, 0x46,
-             0x80, 0x04, 0x81, 0x11,
-             0xdd, 0x93, 0x80, 0x16,
-             0xfa, 0x9c, 0x04, 0x0c,
-             0x43, 0xe6, 0x02, 0x9b,
-             0x08, 0x6b, 0xe0, 0x04,
-             0x40, 0x11, 0x86, 0x7b,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x41, 0xb8, 0x84, 0x8b,
-             0x03, 0x06, 0xe8, 0x00,
-             0xc2, 0x67, 0x61, 0x18,
-             0x84, 0x69, 0x04, 0x14,
-             0x03, 0x46, 0x04, 0x96,
-             0x84, 0x14, 0xe1, 0x18,
-             0x03, 0x86, 0x04, 0x86,
-             0x84, 0x14, 0xe1, 0x18,
-             0x03, 0x86, 0x04, 0x76,
-             0x84, 0x14, 0xe1, 0x10,
-             0x44, 0x20, 0x84, 0x28,
-             0xac, 0x2f, 0xf3, 0xf4,
-             0x0c, 0x0c, 0x84, 0x26,
-             0x83, 0xf5, 0xf2, 0x9c,
-             0x61, 0x14, 0x40, 0x06,
-             0xe1, 0x14, 0x46, 0x86,
-             0x81, 0x41, 0x00, 0x14,
-             0x84, 0x18, 0x84, 0x28,
-             0xcb, 0x27, 0x8c, 0x34,
-             0x82, 0x19, 0x04, 0x29,
-             0xa4, 0x1f, 0x0c, 0x5a,
-             0x80, 0x34, 0x8c, 0x4c,
-             0x8c, 0x48, 0xe0, 0x57,
-             0xf3, 0xf8, 0x48, 0x40,
-             0x00, 0x34, 0x8c, 0x46,
-             0xf9, 0x84, 0x40, 0x52,
-             0x42, 0x40, 0x8c, 0x48,
-             0x8c, 0x16, 0xf2, 0xfc,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0x61, 0x14, 0x42, 0x86,
-             0xe1, 0xc0, 0x04, 0x04,
-             0x48, 0x00, 0x04, 0x14,
-             0xca, 0x07, 0xf0, 0x04,
-             0xf1, 0x00, 0x40, 0x00,
-             0x42, 0x06, 0x04, 0x2c,
-             0x84, 0x24, 0xe1, 0x14,
-             0x46, 0x30, 0x88, 0x38,
-             0xa8, 0x3f, 0xf3, 0xf8,
-             0x84, 0x14, 0x88, 0x36,
-             0x44, 0x20, 0x84, 0x28,
-             0xa0, 0x2f, 0xf2, 0xfc,
-             0xdd, 0x93, 0x84, 0x26,
-             0xfa, 0x9c, 0x04, 0x0c,
-             0x41, 0xf6, 0x00, 0x9b,
-             0x06, 0x6b, 0xe0, 0x04,
-             0x52, 0x01, 0x84, 0x7b,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x7b, 0xd8, 0x82, 0x8b,
-             0x12, 0x29, 0xef, 0xfc,
-             0x40, 0x2c, 0x6e, 0x95,
-             0xe1, 0x18, 0x43, 0x46,
-             0xc8, 0x87, 0x04, 0x14,
-             0x71, 0xc0, 0x48, 0x80,
-             0x04, 0x26, 0x9e, 0x79,
-             0xe1, 0x18, 0x42, 0x46,
-             0x88, 0x38, 0x84, 0x24,
-             0xf2, 0x3c, 0x46, 0x30,
-             0x88, 0x36, 0xa8, 0x3f,
-             0x84, 0x28, 0x84, 0x14,
-             0xf3, 0xc0, 0x44, 0x20,
-             0x04, 0x26, 0xae, 0x2f,
-             0xe1, 0x18, 0x43, 0x86,
-             0x84, 0x66, 0x84, 0x14,
-             0xf2, 0x9c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xf7, 0xa5,
-             0xfa, 0x84, 0x04, 0x0c,
-             0x82, 0x6b, 0x00, 0x7b,
-             0x65, 0x35, 0x0e, 0x39,
-             0x0e, 0x29, 0xc0, 0x2b,
-             0xc0, 0x2b, 0x65, 0x39,
-             0x65, 0x3d, 0x0e, 0x19,
-             0x7c, 0x58, 0xc0, 0x2b,
-             0x0e, 0x0b, 0xef, 0xfc,
-             0x66, 0xb8, 0x8c, 0x1b,
-             0xa1, 0x0b, 0xe8, 0x00,
-             0x0c, 0x0c, 0x80, 0x85,
-             0xdd, 0x93, 0xf2, 0x84,
-             0x8c, 0x1b, 0x0e, 0x0b,
-             0xf2, 0x84, 0x0c, 0x0c,
-             0xe0, 0x00, 0x27, 0xe8,
-             0xfa, 0x3c, 0x04, 0x0c,
-             0x41, 0xa6, 0x00, 0x6b,
-             0x4c, 0x01, 0xe0, 0x04,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0xe0, 0x04, 0x43, 0xa6,
-             0x6f, 0xfc, 0x7d, 0x88,
-             0x80, 0x7b, 0x8c, 0x0b,
-             0xa4, 0xd5, 0xa1, 0x7b,
-             0x65, 0x3d, 0x0c, 0x29,
-             0x0c, 0x19, 0xc0, 0x2b,
-             0xc0, 0x2b, 0x65, 0x39,
-             0x65, 0x35, 0x0c, 0x09,
-             0x6e, 0xd8, 0xc0, 0x2b,
-             0x00, 0x8b, 0xef, 0xa4,
-             0xe1, 0x04, 0x00, 0xc6,
-             0x90, 0x2b, 0x00, 0x04,
-             0x0c, 0xa5, 0x80, 0x94,
-             0xc0, 0x09, 0x6e, 0x0d,
-             0x65, 0x41, 0x0c, 0x39,
-             0x92, 0x0b, 0xc0, 0x2b,
-             0x6f, 0xa4, 0x6e, 0xa8,
-             0x4c, 0x05, 0x94, 0x1b,
-             0x40, 0x0b, 0x63, 0x6d,
-             0x0c, 0x39, 0x92, 0x0b,
-             0x40, 0x2b, 0x65, 0x49,
-             0x6d, 0xf8, 0x94, 0x1b,
-             0x90, 0x2b, 0x6f, 0xa4,
-             0x63, 0x65, 0x4c, 0x05,
-             0x92, 0x0b, 0x40, 0x0b,
-             0x65, 0x45, 0x0c, 0x39,
-             0x94, 0x1b, 0x40, 0x2b,
-             0x6f, 0xa4, 0x6d, 0x48,
-             0x4c, 0x05, 0x90, 0x2b,
-             0x40, 0x0b, 0x63, 0x71,
-             0x0c, 0x39, 0x92, 0x0b,
-             0x40, 0x2b, 0x65, 0x4d,
-             0x6c, 0x98, 0x94, 0x1b,
-             0x90, 0x2b, 0x6f, 0xa4,
-             0x6d, 0x59, 0x0c, 0x15,
-             0x91, 0x21, 0x40, 0x0a,
-             0x63, 0x69, 0x4c, 0x05,
-             0x02, 0x0b, 0xc0, 0x0b,
-             0x69, 0x18, 0x94, 0x1b,
-             0x4c, 0x05, 0xef, 0xa4,
-             0x40, 0x06, 0x6d, 0x49,
-             0xe1, 0x18, 0x43, 0x86,
-             0x4c, 0x05, 0x84, 0x14,
-             0xc0, 0x08, 0x69, 0x41,
-             0x6b, 0x1d, 0x4c, 0x05,
-             0x4c, 0x05, 0xc0, 0x08,
-             0xc0, 0x08, 0x6b, 0xf1,
-             0x4c, 0x01, 0x84, 0x08,
-             0xc0, 0x1b, 0x65, 0x71,
-             0x4c, 0x01, 0x84, 0x08,
-             0xc0, 0x22, 0x65, 0x51,
-             0x4c, 0x01, 0x84, 0x08,
-             0xc0, 0x22, 0x6c, 0xa1,
-             0x42, 0x46, 0x04, 0x08,
-             0x84, 0x14, 0xe1, 0x18,
-             0x6f, 0xf1, 0x4c, 0x01,
-             0x84, 0x08, 0xc0, 0x22,
-             0x4c, 0x01, 0x9e, 0x09,
-             0xc0, 0x1b, 0x65, 0x75,
-             0x9e, 0x09, 0x84, 0x08,
-             0x65, 0x55, 0x4c, 0x01,
-             0x84, 0x08, 0xc0, 0x22,
-             0x4c, 0x01, 0x9e, 0x09,
-             0xc0, 0x22, 0x6c, 0xa5,
-             0x9e, 0x09, 0x84, 0x08,
-             0x6f, 0xf5, 0x4c, 0x01,
-             0x84, 0x08, 0xc0, 0x22,
-             0x8e, 0x09, 0xc9, 0x07,
-             0x65, 0x79, 0x4c, 0x01,
-             0x84, 0x08, 0xc0, 0x1b,
-             0x8e, 0x09, 0xc9, 0x07,
-             0x65, 0x59, 0x4c, 0x01,
-             0x84, 0x08, 0xc0, 0x22,
-             0x8e, 0x09, 0xc9, 0x07,
-             0x6c, 0xa9, 0x4c, 0x01,
-             0x84, 0x08, 0xc0, 0x22,
-             0x8e, 0x09, 0xc9, 0x07,
-             0x6f, 0xf9, 0x4c, 0x01,
-             0x40, 0x78, 0xc0, 0x22,
-             0x8c, 0x0b, 0x68, 0x00,
-             0x0c, 0x0c, 0x8e, 0x0b,
-             0xdd, 0x93, 0xf2, 0x3c,
-             0x68, 0xb1, 0x00, 0x1b,
-             0x06, 0x0e, 0x40, 0x0a,
-             0xc3, 0xd0, 0x64, 0x01,
-             0xe1, 0x84, 0x04, 0x14,
-             0x6c, 0x79, 0x00, 0x39,
-             0x86, 0x23, 0x40, 0x2c,
-             0xe0, 0x06, 0x42, 0x2a,
-             0xe1, 0x84, 0x04, 0x34,
-             0x42, 0x2a, 0x82, 0x23,
-             0x00, 0x2b, 0xe0, 0x0e,
-             0xc0, 0x0a, 0x68, 0xb5,
-             0x02, 0x06, 0xc4, 0x1d,
-             0x42, 0x12, 0x80, 0x00,
-             0x40, 0x15, 0xd1, 0x88,
-             0xc0, 0x0b, 0x63, 0x75,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x9c, 0x04, 0x0c,
-             0x0c, 0x19, 0x80, 0x6b,
-             0xc0, 0x2b, 0x64, 0xc1,
-             0x65, 0x51, 0x0c, 0x99,
-             0x0c, 0x79, 0xc0, 0x2b,
-             0xc0, 0x2b, 0x65, 0xc9,
-             0xec, 0x04, 0x00, 0x10,
-             0xc7, 0x97, 0x65, 0x0d,
-             0x81, 0x01, 0x02, 0x15,
-             0x0c, 0x09, 0xa7, 0x1b,
-             0xc0, 0x2c, 0x0e, 0x31,
-             0x83, 0x01, 0x80, 0xb5,
-             0x6e, 0x31, 0x4c, 0x01,
-             0x0c, 0x09, 0xc0, 0x2c,
-             0x40, 0x2c, 0x6d, 0x0d,
-             0xf0, 0x04, 0x00, 0x0a,
-             0x8e, 0x93, 0x02, 0x75,
-             0xe0, 0x8c, 0x40, 0x4a,
-             0x05, 0x4d, 0x00, 0x60,
-             0x01, 0xc5, 0x80, 0xad,
-             0x05, 0x49, 0x00, 0x60,
-             0x40, 0x4a, 0xc0, 0xad,
-             0x00, 0x60, 0xe0, 0x8c,
-             0x80, 0xad, 0x05, 0x45,
-             0x05, 0x41, 0x00, 0x60,
-             0x80, 0x88, 0xc0, 0xad,
-             0x6f, 0xa4, 0x58, 0x28,
-             0x02, 0x94, 0x90, 0x0b,
-             0x81, 0x41, 0x7a, 0x80,
-             0x61, 0x02, 0x46, 0x1a,
-             0x10, 0x1b, 0x8c, 0x0b,
-             0x64, 0xb8, 0x8e, 0x2b,
-             0x0c, 0x09, 0xef, 0xfc,
-             0xc0, 0x2b, 0x65, 0x51,
-             0x6c, 0x1d, 0x0c, 0x19,
-             0xc8, 0x07, 0xc0, 0x2b,
-             0x6a, 0xa9, 0x4c, 0x03,
-             0x4c, 0x03, 0xc0, 0x0d,
-             0xc0, 0x11, 0x62, 0x99,
-             0x66, 0x49, 0x4c, 0x03,
-             0x4c, 0x03, 0xc0, 0x11,
-             0x40, 0x11, 0x67, 0xf1,
-             0x52, 0x18, 0x8c, 0x0b,
-             0xa1, 0x0b, 0xe8, 0x00,
-             0x0c, 0x0c, 0x80, 0x85,
-             0xdd, 0x93, 0xf2, 0x9c,
-             0x6c, 0x1d, 0x0c, 0x19,
-             0x8c, 0x0b, 0x40, 0x2b,
-             0xf2, 0x9c, 0x0c, 0x0c,
-             0xc1, 0xc3, 0x9f, 0x85,
-             0xf8, 0x04, 0x04, 0x0c,
-             0x6e, 0x31, 0x00, 0x19,
-             0x00, 0x19, 0xc0, 0x2c,
-             0x40, 0x2c, 0x6d, 0x0d,
-             0x82, 0x45, 0xa1, 0x1b,
-             0xe0, 0x8c, 0x42, 0x4a,
-             0x05, 0xa1, 0x04, 0x00,
-             0x01, 0xc5, 0x80, 0xb3,
-             0x05, 0x91, 0x04, 0x00,
-             0x42, 0x4a, 0xc0, 0xb3,
-             0x04, 0x00, 0xe0, 0x8c,
-             0x80, 0xb3, 0x05, 0xc1,
-             0x05, 0xb1, 0x04, 0x00,
-             0x00, 0x69, 0xc0, 0xb3,
-             0xc0, 0x2b, 0x64, 0xcd,
-             0x00, 0x5b, 0x88, 0x24,
-             0xc0, 0x15, 0x6a, 0xd1,
-             0x6a, 0xe1, 0x00, 0x4b,
-             0xa3, 0x6b, 0x40, 0x15,
-             0x68, 0xc9, 0x00, 0xcb,
-             0x00, 0x3b, 0xc0, 0x0a,
-             0xc0, 0x0a, 0x68, 0xcd,
-             0x04, 0x61, 0x00, 0x65,
-             0x84, 0xc5, 0x80, 0x05,
-             0x00, 0x65, 0xa5, 0x6b,
-             0x80, 0x05, 0x04, 0x5d,
-             0x00, 0x75, 0x84, 0x25,
-             0x40, 0x0b, 0x63, 0x75,
-             0x02, 0x85, 0xa7, 0x6b,
-             0x9c, 0x00, 0x4c, 0x70,
-             0x64, 0x5d, 0x00, 0x65,
-             0xcc, 0x7d, 0xc0, 0x05,
-             0x04, 0x61, 0x00, 0x65,
-             0x4c, 0x62, 0x80, 0x05,
-             0x42, 0x4a, 0x9a, 0x9c,
-             0xd8, 0xc7, 0x60, 0x8c,
-             0x02, 0x64, 0x02, 0xe5,
-             0x58, 0x57, 0xe0, 0xb0,
-             0x4a, 0x5a, 0xd8, 0x47,
-             0x48, 0x4a, 0xe0, 0x0a,
-             0x40, 0x55, 0xe0, 0x0a,
-             0xc0, 0x0b, 0x63, 0x79,
-             0x63, 0x7d, 0x40, 0x45,
-             0x48, 0x1a, 0xc0, 0x0b,
-             0xd8, 0x1d, 0x60, 0x0a,
-             0x42, 0x12, 0x58, 0x37,
-             0x40, 0x45, 0xd1, 0xb0,
-             0x40, 0x0b, 0x63, 0x81,
-             0x48, 0x1a, 0x81, 0x41,
-             0x42, 0x3a, 0xc0, 0x0a,
-             0x40, 0x45, 0xe0, 0x0a,
-             0xc0, 0x0b, 0x63, 0x85,
-             0x63, 0x89, 0x40, 0x15,
-             0x81, 0x01, 0x40, 0x0b,
-             0xf0, 0x04, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x3c, 0x04, 0x0c,
-             0x00, 0xb6, 0x00, 0x8b,
-             0x50, 0x01, 0xe0, 0x08,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x06, 0x7b, 0x88, 0xab,
-             0x58, 0x38, 0x84, 0x9b,
-             0x82, 0x0b, 0x6f, 0xa4,
-             0x6f, 0xa4, 0x59, 0x88,
-             0x21, 0x0b, 0x80, 0x6b,
-             0x02, 0x06, 0xff, 0x11,
-             0xa3, 0xab, 0x00, 0x00,
-             0x82, 0x03, 0x02, 0xe5,
-             0x82, 0x95, 0xd3, 0x0d,
-             0x84, 0xa5, 0xa3, 0x7b,
-             0x50, 0x95, 0xa1, 0x7b,
-             0xc0, 0x0b, 0x05, 0x21,
-             0x50, 0x95, 0x84, 0x15,
-             0xc0, 0x0b, 0x65, 0x21,
-             0xa3, 0x7b, 0x83, 0x35,
-             0xa1, 0x7b, 0x82, 0xc5,
-             0x05, 0x21, 0x50, 0x05,
-             0x82, 0x35, 0xc0, 0x0b,
-             0x65, 0x21, 0x50, 0x05,
-             0x81, 0x85, 0xc0, 0x0b,
-             0x65, 0x31, 0x50, 0x95,
-             0x81, 0x45, 0xc0, 0x0b,
-             0x65, 0x31, 0x50, 0x05,
-             0x10, 0x0b, 0xc0, 0x0b,
-             0x73, 0x18, 0x8e, 0x1b,
-             0x5a, 0x18, 0xef, 0xf8,
-             0x0e, 0x64, 0x6f, 0xfc,
-             0x42, 0x86, 0xe1, 0xa0,
-             0x84, 0x14, 0xe1, 0x18,
-             0x42, 0xc6, 0x04, 0x76,
-             0x84, 0x14, 0xe1, 0x18,
-             0x0c, 0x0c, 0x84, 0x66,
-             0x1b, 0x18, 0xf2, 0x3c,
-             0xc1, 0xc3, 0xff, 0xfc,
-             0xfa, 0x04, 0x04, 0x4c,
-             0x86, 0x6b, 0x42, 0x27,
-             0x04, 0x24, 0x84, 0x21,
-             0x06, 0x24, 0xfa, 0x80,
-             0x82, 0x33, 0xe1, 0x84,
-             0x60, 0x0a, 0x4e, 0x3a,
-             0x00, 0x29, 0xc6, 0x2d,
-             0x40, 0x2b, 0x0c, 0x1d,
-             0xc0, 0x08, 0x42, 0x96,
-             0xcf, 0xbc, 0x5b, 0x08,
-             0x60, 0x01, 0x00, 0x06,
-             0x81, 0x31, 0x7d, 0x09,
-             0xe0, 0x1e, 0x40, 0x0a,
-             0xe5, 0x1a, 0x42, 0x0a,
-             0xe5, 0x9a, 0x44, 0x0a,
-             0x64, 0x81, 0x00, 0x10,
-             0x42, 0x22, 0xc7, 0xa1,
-             0x04, 0x0e, 0x72, 0x8c,
-             0xc0, 0x03, 0x74, 0x24,
-             0x6f, 0x64, 0x76, 0x28,
-             0x0c, 0x4c, 0x81, 0x31,
-             0xdd, 0x93, 0xf2, 0x04,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x6c, 0x01, 0x0c, 0x12,
-             0x81, 0x11, 0x40, 0x28,
-             0x6f, 0x68, 0x5f, 0x68,
-             0x8c, 0x0b, 0x8c, 0x2b,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x03, 0x06, 0x02, 0x2b,
-             0x04, 0x14, 0xe1, 0x18,
-             0xe1, 0x24, 0x46, 0x86,
-             0x84, 0x18, 0x81, 0x61,
-             0x8c, 0x38, 0x8c, 0x34,
-             0x82, 0x45, 0x87, 0x1b,
-             0x60, 0x08, 0x03, 0x66,
-             0xe0, 0x08, 0x0d, 0x66,
-             0xef, 0xbc, 0x57, 0x68,
-             0x0c, 0x06, 0xa1, 0x0b,
-             0x8c, 0x0b, 0x80, 0x00,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x03, 0x86, 0x02, 0x2b,
-             0x04, 0x14, 0xe1, 0x18,
-             0xe1, 0x24, 0x46, 0xc6,
-             0x84, 0x18, 0x81, 0x61,
-             0x8c, 0x38, 0x8c, 0x34,
-             0x82, 0x45, 0x87, 0x1b,
-             0x60, 0x08, 0x03, 0x76,
-             0xe0, 0x08, 0x0d, 0x76,
-             0xef, 0xbc, 0x55, 0xa8,
-             0x0c, 0x06, 0xa1, 0x0b,
-             0x8c, 0x0b, 0x80, 0x00,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x43, 0xc6, 0x02, 0x2b,
-             0x04, 0x14, 0xe1, 0x24,
-             0xe1, 0x18, 0x46, 0x46,
-             0x84, 0x18, 0x81, 0x61,
-             0x8c, 0x38, 0x8c, 0x34,
-             0x8e, 0x39, 0xc9, 0x37,
-             0x82, 0x45, 0x87, 0x1b,
-             0x60, 0x08, 0x03, 0x86,
-             0xe0, 0x08, 0x0d, 0x86,
-             0xef, 0xbc, 0x53, 0xc8,
-             0x0c, 0x06, 0xa1, 0x0b,
-             0x8c, 0x0b, 0x80, 0x00,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x43, 0x86, 0x02, 0x2b,
-             0x04, 0x14, 0xe1, 0x24,
-             0xe1, 0x18, 0x46, 0x46,
-             0x84, 0x18, 0x81, 0x61,
-             0x8c, 0x38, 0x8c, 0x34,
-             0x87, 0x1b, 0x9e, 0x39,
-             0x03, 0x96, 0x82, 0x45,
-             0x0d, 0x96, 0x60, 0x08,
-             0x51, 0xf8, 0xe0, 0x08,
-             0xa1, 0x0b, 0xef, 0xbc,
-             0x80, 0x00, 0x0c, 0x06,
-             0x0c, 0x0c, 0x8c, 0x0b,
-             0xdd, 0x93, 0xf2, 0x00,
-             0x6c, 0x80, 0x04, 0x12,
-             0x81, 0x31, 0x81, 0x11,
-             0x48, 0x00, 0xc5, 0x3d,
-             0x00, 0x04, 0x50, 0x04,
-             0x42, 0x12, 0xc1, 0x84,
-             0x06, 0x30, 0x50, 0x90,
-             0xfc, 0xf5, 0xc4, 0x04,
-             0x82, 0x0b, 0x5d, 0x93,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x0c, 0x09, 0x80, 0x6b,
-             0xc0, 0x2b, 0x65, 0xb5,
-             0xe0, 0x84, 0x40, 0x0a,
-             0x05, 0xa9, 0x0c, 0x19,
-             0x40, 0x06, 0x40, 0x2b,
-             0x00, 0x05, 0xc1, 0x00,
-             0x40, 0x11, 0xc0, 0x00,
-             0x84, 0x95, 0xc0, 0x00,
-             0x6d, 0x21, 0x0c, 0x09,
-             0x40, 0x0a, 0xc0, 0x2c,
-             0x82, 0xc5, 0xe0, 0x80,
-             0x63, 0x79, 0x0c, 0x15,
-             0x85, 0x31, 0x40, 0x0b,
-             0x8c, 0x0b, 0x03, 0x41,
-             0x6f, 0xfc, 0x6d, 0xa8,
-             0x8c, 0x0b, 0x82, 0x2b,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0x81, 0x01, 0x81, 0x65,
-             0xf2, 0x00, 0x0c, 0x0c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x7c, 0x04, 0x4c,
-             0x41, 0x06, 0x00, 0x6b,
-             0x80, 0x04, 0xe1, 0x38,
-             0x42, 0x10, 0x80, 0x18,
-             0x80, 0x16, 0xf1, 0xfc,
-             0x65, 0xb5, 0x0c, 0x09,
-             0x40, 0x4a, 0xc0, 0x2b,
-             0x00, 0x04, 0x60, 0x98,
-             0x80, 0xc5, 0xfa, 0x00,
-             0x6c, 0xfd, 0x0c, 0x19,
-             0xa1, 0x1b, 0xc0, 0x2c,
-             0xff, 0x11, 0x82, 0x85,
-             0x82, 0x35, 0x82, 0x0d,
-             0x66, 0xed, 0x0c, 0x19,
-             0xa1, 0x1b, 0xc0, 0x26,
-             0x02, 0x60, 0x02, 0x85,
-             0x80, 0x99, 0x06, 0xe5,
-             0xe0, 0x94, 0x40, 0x0a,
-             0x04, 0x45, 0x02, 0x60,
-             0x02, 0x60, 0xc0, 0x9e,
-             0x80, 0xad, 0x05, 0xa9,
-             0x53, 0xf6, 0x04, 0x18,
-             0x0c, 0x39, 0xe0, 0x00,
-             0xc0, 0x2b, 0x65, 0xad,
-             0x70, 0x84, 0x44, 0x32,
-             0x05, 0x0a, 0xa6, 0x13,
-             0x16, 0x12, 0x64, 0xfc,
-             0x12, 0x24, 0xe0, 0x00,
-             0x40, 0x0a, 0x1a, 0x80,
-             0x00, 0x60, 0xe0, 0x90,
-             0x40, 0x99, 0x06, 0xf1,
-             0xc0, 0x00, 0x02, 0x06,
-             0x4f, 0x68, 0x50, 0x28,
-             0xc0, 0x18, 0x04, 0x06,
-             0x15, 0x86, 0x0f, 0xbe,
-             0x01, 0x01, 0xe1, 0x00,
-             0x89, 0x75, 0x81, 0x71,
-             0x61, 0x00, 0x40, 0x06,
-             0xe0, 0x08, 0x42, 0x06,
-             0x83, 0x21, 0x00, 0x04,
-             0x8c, 0x0b, 0x00, 0xb6,
-             0xef, 0xf8, 0x7b, 0xe8,
-             0x60, 0x3c, 0x42, 0x86,
-             0x77, 0x98, 0x8c, 0x0b,
-             0x00, 0x7b, 0xef, 0xe0,
-             0x75, 0xb8, 0x8c, 0x0b,
-             0x0c, 0x09, 0xef, 0xf8,
-             0x40, 0x2c, 0x6d, 0x01,
-             0xf0, 0xa0, 0x44, 0x62,
-             0xa1, 0x7b, 0x28, 0x14,
-             0x6b, 0xf1, 0x44, 0x01,
-             0x84, 0x08, 0xc0, 0x26,
-             0x41, 0xf6, 0x82, 0x65,
-             0x81, 0x11, 0x60, 0x3c,
-             0xef, 0x6c, 0x50, 0xe8,
-             0x60, 0x0c, 0x43, 0x06,
-             0x69, 0x58, 0x8c, 0x0b,
-             0x40, 0x98, 0xef, 0xcc,
-             0x0c, 0x19, 0xef, 0xe0,
-             0xc0, 0x2b, 0x65, 0xb5,
-             0xe0, 0x90, 0x42, 0x0a,
-             0x02, 0x84, 0x82, 0x65,
-             0x04, 0x60, 0x60, 0x88,
-             0xc0, 0x99, 0x66, 0xf0,
-             0x90, 0x23, 0x04, 0x13,
-             0x44, 0xb1, 0x84, 0x0e,
-             0x0c, 0x15, 0xe4, 0x00,
-             0xc0, 0x0a, 0x6d, 0x61,
-             0x02, 0x06, 0xc2, 0x0d,
-             0x4c, 0x11, 0xc0, 0x00,
-             0xc0, 0x26, 0x06, 0xed,
-             0x82, 0xb1, 0x80, 0xd5,
-             0xfa, 0x80, 0x10, 0xb4,
-             0xec, 0xe5, 0xd2, 0x8d,
-             0x65, 0xb5, 0x0c, 0x19,
-             0x82, 0x91, 0x40, 0x2b,
-             0xe0, 0x90, 0x42, 0x0a,
-             0xc0, 0x1c, 0x1e, 0x25,
-             0xd1, 0x88, 0x44, 0x82,
-             0x06, 0xe1, 0x4c, 0x21,
-             0x93, 0x8b, 0x40, 0x26,
-             0x0c, 0x09, 0x84, 0xf5,
-             0x40, 0x26, 0x66, 0xe5,
-             0xe1, 0x00, 0x42, 0x06,
-             0x83, 0x21, 0x04, 0x14,
-             0x66, 0xed, 0x4c, 0x21,
-             0x04, 0x06, 0xc0, 0x26,
-             0xe0, 0x3c, 0x41, 0xf6,
-             0x6f, 0x6c, 0x4c, 0xa8,
-             0x43, 0x06, 0x81, 0x11,
-             0x8c, 0x0b, 0x60, 0x0c,
-             0xef, 0xcc, 0x65, 0x08,
-             0x42, 0x0a, 0x85, 0x95,
-             0x44, 0x06, 0x60, 0x94,
-             0x08, 0x24, 0xe1, 0x00,
-             0x04, 0x41, 0x02, 0x60,
-             0x4c, 0xb1, 0xc0, 0x9e,
-             0x40, 0x26, 0x66, 0xe5,
-             0x05, 0xb1, 0x02, 0x60,
-             0x84, 0x18, 0x80, 0xad,
-             0x02, 0x12, 0x90, 0x13,
-             0x88, 0x16, 0xec, 0xfc,
-             0x6c, 0x6d, 0x0c, 0x29,
-             0x4c, 0x11, 0xc0, 0x2c,
-             0xc0, 0x26, 0x66, 0xe9,
-             0x69, 0xb5, 0x4c, 0x05,
-             0x44, 0x0a, 0xc0, 0x09,
-             0x82, 0x45, 0xe0, 0x90,
-             0x6f, 0xf8, 0x6d, 0xe8,
-             0x0c, 0x09, 0x8c, 0x0b,
-             0xc0, 0x2c, 0x6d, 0x01,
-             0x6d, 0x05, 0x4c, 0x01,
-             0x01, 0xc6, 0xc0, 0x2c,
-             0x80, 0x14, 0xe1, 0x00,
-             0x44, 0x20, 0x84, 0x28,
-             0x04, 0x26, 0xf3, 0xec,
-             0xe1, 0x38, 0x43, 0x06,
-             0x84, 0x28, 0x84, 0x14,
-             0xfc, 0x9c, 0x04, 0x24,
-             0x80, 0x04, 0x84, 0x26,
-             0xc8, 0x19, 0x80, 0x18,
-             0x8e, 0x0b, 0x00, 0x16,
-             0xf2, 0x7c, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xfa, 0x00, 0x04, 0x0c,
-             0x40, 0xa6, 0x00, 0x6b,
-             0x4c, 0x01, 0xe0, 0x00,
-             0x40, 0x2b, 0x6c, 0x1d,
-             0x69, 0x58, 0x8c, 0x0b,
-             0x6e, 0x38, 0xef, 0xf4,
-             0x8c, 0x0b, 0x6f, 0xe8,
-             0x0c, 0x19, 0xa1, 0x0b,
-             0x80, 0x2c, 0x0d, 0x15,
-             0x93, 0x7c, 0x42, 0x10,
-             0x0d, 0x15, 0x4c, 0x11,
-             0x81, 0x11, 0x00, 0x2c,
-             0x6c, 0x21, 0x4c, 0x11,
-             0x0c, 0x0c, 0xc0, 0x2b,
-             0xdd, 0x93, 0xf2, 0x00,
-             0xfa, 0x1c, 0x04, 0x4c,
-             0x81, 0x71, 0x00, 0x6b,
-             0x66, 0x35, 0x0c, 0x0b,
-             0x43, 0xf6, 0x40, 0x16,
-             0x4c, 0x73, 0xef, 0xfc,
-             0xc0, 0x16, 0x66, 0x71,
-             0xe0, 0x80, 0x40, 0x4a,
-             0x0c, 0x19, 0x98, 0x85,
-             0xc0, 0x2b, 0x6c, 0x49,
-             0x6c, 0x51, 0x0c, 0x89,
-             0x0c, 0x29, 0xc0, 0x2b,
-             0xc0, 0x2b, 0x6c, 0x55,
-             0x6c, 0x4d, 0x0c, 0x39,
-             0xc5, 0x17, 0x40, 0x2b,
-             0xc5, 0x27, 0xc5, 0x87,
-             0x48, 0x2a, 0x45, 0x37,
-             0x4a, 0x3a, 0xe6, 0xa2,
-             0x06, 0x44, 0xe6, 0x86,
-             0x08, 0x54, 0xfa, 0x80,
-             0x89, 0x3b, 0xfa, 0x80,
-             0x80, 0x00, 0x00, 0x16,
-             0x88, 0x8c, 0x00, 0x04,
-             0x02, 0x00, 0x10, 0xc5,
-             0x0c, 0x39, 0x8c, 0x04,
-             0x40, 0x2c, 0x6d, 0x09,
-             0xe0, 0x84, 0x40, 0x0a,
-             0x66, 0x86, 0x44, 0x2a,
-             0xfa, 0x80, 0x08, 0x14,
-             0x81, 0x51, 0x01, 0x11,
-             0x6c, 0x04, 0x00, 0x30,
-             0x40, 0x02, 0x83, 0x31,
-             0x00, 0x09, 0xd0, 0x98,
-             0xc0, 0x2c, 0x0c, 0xa1,
-             0x6c, 0xe9, 0x4c, 0x01,
-             0x83, 0x05, 0xc0, 0x2c,
-             0x84, 0x25, 0xa1, 0x8b,
-             0x7a, 0x80, 0x18, 0x84,
-             0xe8, 0x94, 0x12, 0x34,
-             0x60, 0x32, 0x58, 0x4a,
-             0xfb, 0x80, 0x02, 0x14,
-             0x4c, 0x13, 0xb2, 0x1f,
-             0xc0, 0x16, 0x66, 0x71,
-             0x85, 0x5d, 0x98, 0x53,
-             0x83, 0x45, 0xfc, 0x15,
-             0x6c, 0x1d, 0x0c, 0x29,
-             0x42, 0x96, 0x40, 0x2b,
-             0x76, 0x98, 0xe0, 0x08,
-             0x8c, 0x0b, 0x6f, 0xb8,
-             0xe0, 0x08, 0x4e, 0x96,
-             0x66, 0x71, 0x0c, 0x1b,
-             0xa3, 0x0b, 0x40, 0x16,
-             0x6c, 0xe9, 0x0c, 0x09,
-             0x0e, 0x06, 0x40, 0x2c,
-             0x00, 0x04, 0xc0, 0x00,
-             0x02, 0x14, 0x7a, 0x80,
-             0x40, 0x0a, 0xfb, 0x80,
-             0xa1, 0x1f, 0xe6, 0xa2,
-             0x66, 0x71, 0x4c, 0x13,
-             0x8e, 0x0b, 0x40, 0x16,
-             0xf2, 0x1c, 0x0c, 0x4c,
-             0xc1, 0xc3, 0xdd, 0x93,
-             0xe1, 0x04, 0x03, 0x86,
-             0x84, 0x1a, 0x84, 0x14,
-             0x6e, 0x19, 0x40, 0x13,
-             0xdd, 0x93, 0xc0, 0x15,
-             0xf8, 0x7c, 0x04, 0x0c,
-             0xec, 0xa0, 0x1e, 0xf0,
-             0x6c, 0x41, 0x00, 0x69,
-             0x87, 0x91, 0x40, 0x2b,
-             0x6c, 0x49, 0x00, 0x29,
-             0x8f, 0x31, 0x40, 0x2b,
-             0x6c, 0x51, 0x00, 0x49,
-             0x85, 0x81, 0x40, 0x2b,
-             0x8d, 0x91, 0x13, 0x96,
-             0x66, 0x9a, 0x42, 0x2a,
-             0x15, 0x96, 0x8b, 0x71,
-             0x42, 0x1a, 0x93, 0x91,
-             0x89, 0xb1, 0x60, 0x12,
-             0x99, 0x91, 0x17, 0x96,
-             0xbe, 0x1e, 0xbd, 0x36,
-             0x6c, 0x4d, 0x00, 0x19,
-             0x1f, 0x36, 0xc0, 0x2b,
-             0x5e, 0x91, 0x9b, 0x31,
-             0x3c, 0x1e, 0xe0, 0x90,
-             0x60, 0x31, 0x02, 0x0e,
-             0x0d, 0x1e, 0xc2, 0x41,
-             0xe0, 0x40, 0x02, 0x16,
-             0x6c, 0x45, 0x00, 0xa9,
-             0x1d, 0x1c, 0xc0, 0x2b,
-             0x19, 0x96, 0x95, 0x11,
-             0x00, 0xc9, 0x83, 0x91,
-             0x40, 0x2b, 0x6c, 0x55,
-             0xbf, 0x16, 0xa9, 0xab,
-             0x97, 0x11, 0x21, 0x16,
-             0x91, 0x91, 0x1b, 0x96,
-             0xe0, 0x80, 0x5e, 0x81,
-             0x9f, 0x81, 0x25, 0x86,
-             0xe0, 0x94, 0x5e, 0x31,
-             0x9d, 0x31, 0x23, 0x36,
-             0xe0, 0x8c, 0x5e, 0x11,
-             0x81, 0x11, 0x2b, 0x16,
-             0xe0, 0x84, 0x5e, 0x71,
-             0xe0, 0x88, 0x5e, 0x91,
-             0x12, 0x06, 0x29, 0x96,
-             0x5e, 0x31, 0xc0, 0x00,
-             0x5e, 0x81, 0xe0, 0x98,
-             0x2f, 0x86, 0xe0, 0x9c,
-             0xc0, 0x00, 0x10, 0x06,
-             0x91, 0x16, 0xad, 0x36,
-             0xa7, 0x76, 0x9d, 0xb6,
-             0x01, 0x71, 0x92, 0x15,
-             0x83, 0x95, 0x81, 0x91,
-             0x64, 0x60, 0x0a, 0xf0,
-             0x0a, 0x39, 0x82, 0xb1,
-             0x80, 0x33, 0xfc, 0x0c,
-             0x68, 0x81, 0x46, 0x71,
-             0x82, 0x71, 0x40, 0x1b,
-             0x6c, 0x41, 0x00, 0x69,
-             0x0a, 0x64, 0xc0, 0x2b,
-             0x06, 0xb4, 0x7a, 0x80,
-             0x94, 0x53, 0xfa, 0x80,
-             0xfa, 0xb5, 0xcb, 0x3d,
-             0x6c, 0x45, 0x00, 0xb9,
-             0x82, 0x91, 0x40, 0x2b,
-             0xf4, 0x2c, 0x52, 0x8a,
-             0xc0, 0x88, 0x06, 0x94,
-             0x13, 0xf1, 0x54, 0x30,
-             0x7a, 0xd5, 0xc0, 0x03,
-             0xdc, 0x00, 0x56, 0xa0,
-             0x6c, 0x81, 0x00, 0x39,
-             0xa3, 0x3b, 0xc0, 0x2c,
-             0xdf, 0xfc, 0x51, 0xee,
-             0x68, 0xbd, 0x40, 0x81,
-             0x85, 0x75, 0xc0, 0x1b,
-             0x64, 0x20, 0x0a, 0xf0,
-             0x0a, 0x39, 0x82, 0xb1,
-             0x80, 0x33, 0xfc, 0x0c,
-             0x68, 0x81, 0x46, 0x81,
-             0x82, 0x81, 0x40, 0x1b,
-             0x6c, 0x41, 0x00, 0x69,
-             0x0a, 0x64, 0xc0, 0x2b,
-             0x06, 0xb4, 0x7a, 0x80,
-             0x94, 0x53, 0xfa, 0x80,
-             0xfa, 0xb5, 0xcb, 0x3d,
-             0x6c, 0x45, 0x00, 0xa9,
-             0x82, 0x91, 0x40, 0x2b,
-             0xf4, 0x28, 0x52, 0x8a,
-             0xda, 0x80, 0x06, 0x94,
-             0xc6, 0x9e, 0x54, 0x3a,
-             0x56, 0xa0, 0x7a, 0xf5,
-             0x47, 0xe6, 0xdc, 0x00,
-             0x40, 0x31, 0xe0, 0x0c,
-             0xc0, 0x1b, 0x68, 0xbd,
-             0xbc, 0x54, 0xbe, 0x34,
-             0xe0, 0x12, 0x44, 0x2a,
-             0xfa, 0x80, 0x06, 0x34,
-             0x60, 0x32, 0x48, 0x5a,
-             0x64, 0x80, 0x0a, 0x00,
-             0x87, 0x25, 0xc0, 0x6e,
-             0x6e, 0x19, 0x00, 0xcb,
-             0x58, 0x0a, 0xc0, 0x15,
-             0x59, 0xe6, 0xe4, 0x84,
-             0x4c, 0x50, 0x00, 0x0c,
-             0x88, 0xa5, 0x9c, 0x00,
-             0x6c, 0x79, 0x00, 0xc9,
-             0xe5, 0xcd, 0xc0, 0x2c,
-             0x94, 0xc8, 0x88, 0x35,
-             0x6c, 0x41, 0x00, 0x69,
-             0x00, 0x79, 0xc0, 0x2b,
-             0xc0, 0x2c, 0x6c, 0xe9,
-             0xe0, 0x1a, 0x50, 0xca,
-             0xe0, 0x0a, 0x52, 0x7a,
-             0xe1, 0x1a, 0x58, 0xca,
-             0xe6, 0x92, 0x50, 0x8a,
-             0xe1, 0x0a, 0x4c, 0x7a,
-             0x58, 0xca, 0x10, 0x93,
-             0x0e, 0x94, 0xe6, 0x8a,
-             0x50, 0x02, 0x7a, 0x80,
-             0x4e, 0x7a, 0xf0, 0x84,
-             0x8c, 0xc3, 0x66, 0x8e,
-             0x64, 0x81, 0x0c, 0x80,
-             0x8e, 0xc3, 0xc0, 0x6e,
-             0x02, 0x11, 0x98, 0xc6,
-             0x02, 0x0a, 0x82, 0x51,
-             0xf2, 0xb5, 0xe0, 0x40,
-             0x0c, 0x0c, 0xd0, 0xf1,
-             0xdd, 0x93, 0xf0, 0x7c,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x10, 0x14,
-             0x00, 0x43, 0x43, 0x9c,
-             0x00, 0x00, 0x09, 0x04,
-             0x00, 0x00, 0x19, 0xb8,
-             0x00, 0x43, 0x4d, 0x40,
-             0x00, 0x00, 0x00, 0x20,
-             0x00, 0x00, 0x19, 0x1c,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x9c,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x02, 0x00,
-             0x00, 0x80, 0x02, 0x11,
-             0x00, 0x80, 0x02, 0x12,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x02, 0x16,
-             0x00, 0x80, 0x02, 0x17,
-             0x00, 0x80, 0x02, 0x18,
-             0x00, 0x80, 0x02, 0x19,
-             0x00, 0x80, 0x02, 0x1a,
-             0x00, 0x80, 0x02, 0x1b,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x02, 0x1d,
-             0x00, 0x80, 0x02, 0x1e,
-             0x00, 0x80, 0x02, 0x20,
-             0x00, 0x80, 0x02, 0x24,
-             0x00, 0x80, 0x02, 0x26,
-             0x00, 0x80, 0x02, 0x2c,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x02, 0x2f,
-             0x00, 0x80, 0x02, 0x46,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x02, 0x4a,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x02, 0x4c,
-             0x00, 0x80, 0x02, 0x4d,
-             0x00, 0x80, 0x02, 0x4e,
-             0x00, 0x80, 0x02, 0x51,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x02, 0x53,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x02, 0x57,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x02, 0x59,
-             0x00, 0x80, 0x02, 0x5a,
-             0x00, 0x80, 0x02, 0x5f,
-             0x00, 0x80, 0x02, 0x60,
-             0x00, 0x80, 0x02, 0x61,
-             0x00, 0x80, 0x02, 0x62,
-             0x00, 0x80, 0x02, 0x63,
-             0x00, 0x80, 0x02, 0x64,
-             0x00, 0x80, 0x02, 0x65,
-             0x00, 0x80, 0x02, 0x66,
-             0x00, 0x80, 0x02, 0x67,
-             0x00, 0x80, 0x02, 0x68,
-             0x00, 0x80, 0x02, 0x73,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x02, 0x78,
-             0x00, 0x80, 0x02, 0x7c,
-             0x00, 0x80, 0x02, 0x81,
-             0x00, 0x80, 0x02, 0x86,
-             0x00, 0x80, 0x02, 0x87,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x02, 0x95,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x02, 0x99,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x02, 0xa3,
-             0x00, 0x80, 0x02, 0xa8,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x02, 0xaa,
-             0x00, 0x80, 0x02, 0xab,
-             0x00, 0x80, 0x02, 0xac,
-             0x00, 0x80, 0x02, 0xad,
-             0x00, 0x80, 0x02, 0xae,
-             0x00, 0x80, 0x02, 0xb1,
-             0x00, 0x80, 0x02, 0xb6,
-             0x00, 0x80, 0x02, 0xb7,
-             0x00, 0x80, 0x02, 0xb8,
-             0x00, 0x80, 0x02, 0xb9,
-             0x00, 0x80, 0x02, 0xba,
-             0x00, 0x80, 0x02, 0xbb,
-             0x00, 0x80, 0x02, 0xbc,
-             0x00, 0x80, 0x02, 0xbd,
-             0x00, 0x80, 0x02, 0xbe,
-             0x00, 0x80, 0x02, 0xbf,
-             0x00, 0x80, 0x02, 0xc2,
-             0x00, 0x80, 0x02, 0xc3,
-             0x00, 0x80, 0x02, 0xc4,
-             0x00, 0x80, 0x02, 0xc5,
-             0x00, 0x80, 0x40, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x40, 0x02,
-             0x00, 0x80, 0x40, 0x03,
-             0x00, 0x80, 0x40, 0x04,
-             0x00, 0x80, 0x40, 0x06,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x40, 0x09,
-             0x00, 0x80, 0x40, 0x0a,
-             0x00, 0x80, 0x40, 0x0b,
-             0x00, 0x80, 0x40, 0x0c,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x40, 0x0e,
-             0x00, 0x80, 0x40, 0x0f,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x40, 0x13,
-             0x00, 0x80, 0x40, 0x14,
-             0x00, 0x80, 0x40, 0x15,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x40, 0x19,
-             0x00, 0x80, 0x40, 0x1e,
-             0x00, 0x80, 0x40, 0x1f,
-             0x00, 0x80, 0x40, 0x20,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x40, 0x24,
-             0x00, 0x80, 0x40, 0x25,
-             0x00, 0x80, 0x40, 0x3c,
-             0x00, 0x80, 0x40, 0x3d,
-             0x00, 0x80, 0x40, 0x3e,
-             0x00, 0x80, 0x40, 0x3f,
-             0x00, 0x80, 0x40, 0x40,
-             0x00, 0x80, 0x40, 0x41,
-             0x00, 0x80, 0x40, 0x42,
-             0x00, 0x80, 0x40, 0x43,
-             0x00, 0x80, 0x40, 0x44,
-             0x00, 0x80, 0x40, 0x45,
-             0x00, 0x80, 0x40, 0x46,
-             0x00, 0x80, 0x40, 0x47,
-             0x00, 0x80, 0x40, 0x48,
-             0x00, 0x80, 0x40, 0x49,
-             0x00, 0x80, 0x40, 0x4a,
-             0x00, 0x80, 0x40, 0x4b,
-             0x00, 0x80, 0x40, 0x4c,
-             0x00, 0x80, 0x40, 0x4d,
-             0x00, 0x80, 0x40, 0x4e,
-             0x00, 0x80, 0x40, 0x4f,
-             0x00, 0x80, 0x40, 0x50,
-             0x00, 0x80, 0x40, 0x51,
-             0x00, 0x80, 0x40, 0x52,
-             0x00, 0x80, 0x40, 0x53,
-             0x00, 0x80, 0x40, 0x54,
-             0x00, 0x80, 0x40, 0x55,
-             0x00, 0x80, 0x40, 0x56,
-             0x00, 0x80, 0x40, 0x57,
-             0x00, 0x80, 0x40, 0x58,
-             0x00, 0x80, 0x40, 0x59,
-             0x00, 0x80, 0x40, 0x5a,
-             0x00, 0x80, 0x40, 0x5b,
-             0x00, 0x80, 0x40, 0x5c,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x40, 0x5e,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x40, 0x60,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x40, 0x69,
-             0x00, 0x80, 0x40, 0x6a,
-             0x00, 0x80, 0x40, 0x6b,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x40, 0x74,
-             0x00, 0x80, 0x40, 0x78,
-             0x00, 0x80, 0x40, 0x79,
-             0x00, 0x80, 0x40, 0x7a,
-             0x00, 0x80, 0x40, 0x7c,
-             0x00, 0x80, 0x40, 0x84,
-             0x00, 0x80, 0x40, 0x85,
-             0x00, 0x80, 0x40, 0x88,
-             0x00, 0x80, 0x40, 0x89,
-             0x00, 0x80, 0x40, 0x8e,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x40, 0x90,
-             0x00, 0x80, 0x40, 0x91,
-             0x00, 0x80, 0x40, 0x99,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x40, 0x9f,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x40, 0xa1,
-             0x00, 0x80, 0x40, 0xa2,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x40, 0xa8,
-             0x00, 0x80, 0x40, 0xb0,
-             0x00, 0x80, 0x40, 0xb6,
-             0x00, 0x80, 0x40, 0xd0,
-             0x00, 0x80, 0x40, 0xd1,
-             0x00, 0x80, 0x40, 0xd4,
-             0x00, 0x80, 0x40, 0xd5,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x40, 0xdd,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x40, 0xdf,
-             0x00, 0x80, 0x43, 0xdc,
-             0x00, 0x80, 0x43, 0xdd,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x43, 0xe4,
-             0x00, 0x80, 0x44, 0x04,
-             0x00, 0x80, 0x44, 0x28,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x44, 0x48,
-             0x00, 0x80, 0x44, 0x4c,
-             0x00, 0x80, 0x44, 0x50,
-             0x00, 0x80, 0x44, 0x54,
-             0x00, 0x80, 0x44, 0x58,
-             0x00, 0x80, 0x44, 0x5c,
-             0x00, 0x80, 0x44, 0x60,
-             0x00, 0x80, 0x44, 0x64,
-             0x00, 0x80, 0x44, 0x68,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x46, 0x98,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x48, 0xc8,
-             0x00, 0x80, 0x48, 0xc9,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x48, 0xcb,
-             0x00, 0x80, 0x48, 0xcc,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x49, 0x1c,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x34, 0x3c,
-             0x00, 0x80, 0x80, 0x00,
-             0x00, 0x80, 0x80, 0x01,
-             0x00, 0x80, 0x80, 0x02,
-             0x00, 0x80, 0x80, 0x06,
-             0x00, 0x80, 0x80, 0x07,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x80, 0x09,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x80, 0x0e,
-             0x00, 0x80, 0x80, 0x10,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x80, 0x14,
-             0x00, 0x80, 0x80, 0x18,
-             0x00, 0x80, 0x80, 0x2d,
-             0x00, 0x80, 0x80, 0x2e,
-             0x00, 0x80, 0x80, 0x31,
-             0x00, 0x80, 0x80, 0x32,
-             0x00, 0x80, 0x80, 0x35,
-             0x00, 0x80, 0x80, 0x36,
-             0x00, 0x80, 0x80, 0x37,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x80, 0x39,
-             0x00, 0x80, 0x80, 0x3a,
-             0x00, 0x80, 0x80, 0x3b,
-             0x00, 0x80, 0x80, 0x3c,
-             0x00, 0x80, 0x80, 0x3d,
-             0x00, 0x80, 0x80, 0x3e,
-             0x00, 0x80, 0x80, 0x40,
-             0x00, 0x80, 0x80, 0x44,
-             0x00, 0x80, 0x80, 0x48,
-             0x00, 0x80, 0x80, 0x49,
-             0x00, 0x80, 0x80, 0x4a,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x80, 0x4c,
-             0x00, 0x80, 0x80, 0x50,
-             0x00, 0x80, 0x80, 0x54,
-             0x00, 0x80, 0x80, 0x55,
-             0x00, 0x80, 0x80, 0x56,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x80, 0x58,
-             0x00, 0x80, 0x80, 0x5c,
-             0x00, 0x80, 0x80, 0x60,
-             0x00, 0x80, 0x80, 0x61,
-             0x00, 0x80, 0x80, 0x62,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x80, 0x64,
-             0x00, 0x80, 0x80, 0x68,
-             0x00, 0x80, 0x80, 0x6c,
-             0x00, 0x80, 0x80, 0x6d,
-             0x00, 0x80, 0x80, 0x6e,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x80, 0x70,
-             0x00, 0x80, 0x80, 0x74,
-             0x00, 0x80, 0x80, 0x78,
-             0x00, 0x80, 0x80, 0x79,
-             0x00, 0x80, 0x80, 0x7a,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x80, 0x7c,
-             0x00, 0x80, 0x80, 0x80,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x80, 0x88,
-             0x00, 0x80, 0x80, 0x8c,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x80, 0x94,
-             0x00, 0x80, 0x80, 0x98,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x00, 0x80,
-             0x00, 0x80, 0x00, 0x81,
-             0x00, 0x80, 0x00, 0x82,
-             0x00, 0x80, 0x00, 0x83,
-             0x00, 0x80, 0x00, 0x84,
-             0x00, 0x80, 0x00, 0x85,
-             0x00, 0x80, 0x00, 0x86,
-             0x00, 0x80, 0x00, 0x87,
-             0x00, 0x80, 0x00, 0x88,
-             0x00, 0x80, 0x00, 0x89,
-             0x00, 0x80, 0x00, 0x8a,
-             0x00, 0x80, 0x00, 0x8b,
-             0x00, 0x80, 0x00, 0x8c,
-             0x00, 0x80, 0x00, 0x8d,
-             0x00, 0x80, 0x00, 0x8e,
-             0x00, 0x80, 0x00, 0x8f,
-             0x00, 0x80, 0x00, 0x90,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x01, 0x01,
-             0x00, 0x80, 0x01, 0x02,
-             0x00, 0x80, 0x01, 0x03,
-             0x00, 0x80, 0x01, 0x04,
-             0x00, 0x80, 0x01, 0x05,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x80, 0x01, 0x07,
-             0x00, 0x80, 0x01, 0x0a,
-             0x00, 0x80, 0x01, 0x0c,
-             0x00, 0x81, 0x2c, 0x00,
-             0x00, 0x81, 0x2f, 0xfc,
-             0x00, 0x00, 0x19, 0xd8,
-             0x00, 0x00, 0xef, 0x18,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x17, 0xc4,
-             0x00, 0x00, 0x18, 0x2c,
-             0x00, 0x00, 0x18, 0x94,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x19, 0xd3,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x01,
-             0x00, 0x00, 0x00, 0x00,
-             0xab, 0xcd, 0x33, 0x0e,
-             0xe6, 0x6d, 0x12, 0x34,
-             0x00, 0x05, 0xde, 0xec,
-             0x00, 0x00, 0x00, 0x0b,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x19, 0x38,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x14, 0xd8,
-             0x0c, 0x00, 0x00, 0x00,
-             0x08, 0x0f, 0x0e, 0x0d,
-             0x04, 0x0b, 0x0a, 0x09,
-             0x00, 0x07, 0x06, 0x05,
-             0x43, 0x03, 0x02, 0x01,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-             0x00, 0x00, 0x00, 0x00,
-
-        ]
-
-        self.VL53L5CX_DEFAULT_CONFIGURATION = [
-            0x54, 0x50, 0x00, 0x80,
-            0x00, 0x04, 0x04, 0x04,
-            0x00, 0x00, 0x08, 0x08,
-            0xAD, 0x30, 0x00, 0x80,
-            0x02, 0x01, 0x03, 0x03,
-            0x00, 0x00, 0x03, 0x00,
-            0xAD, 0x38, 0x01, 0x00,
-            0x01, 0xE0, 0x01, 0x40,
-            0x00, 0x40, 0x00, 0x40,
-            0x01, 0x00, 0x04, 0x00,
-            0x00, 0x00, 0x00, 0x01,
-            0x54, 0x58, 0x00, 0x40,
-            0x04, 0x1A, 0x01, 0x00,
-            0x54, 0x5C, 0x01, 0x40,
-            0x00, 0x00, 0x27, 0x10,
-            0x00, 0x00, 0x0F, 0xA0,
-            0x0F, 0xA0, 0x03, 0xE8,
-            0x02, 0x80, 0x1F, 0x40,
-            0x00, 0x00, 0x05, 0x00,
-            0x54, 0x70, 0x00, 0x80,
-            0x03, 0x20, 0x03, 0x20,
-            0x00, 0x00, 0x00, 0x08,
-            0x54, 0x78, 0x01, 0x00,
-            0x01, 0x13, 0x00, 0x29,
-            0x00, 0x33, 0x00, 0x00,
-            0x02, 0x00, 0x00, 0x01,
-            0x04, 0x01, 0x08, self.VL53L5CX_FW_NBTAR_RANGING,
-            0x54, 0x88, 0x01, 0x40,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x0C, 0x00,
-            0xAD, 0x48, 0x01, 0x00,
-            0x01, 0xF4, 0x00, 0x00,
-            0x03, 0x06, 0x00, 0x10,
-            0x08, 0x07, 0x08, 0x07,
-            0x00, 0x00, 0x00, 0x08,
-            0xAD, 0x60, 0x01, 0x00,
-            0x00, 0x00, 0x00, 0x80,
-            0x00, 0x00, 0x00, 0x00,
-            0x20, 0x1F, 0x01, 0xF4,
-            0x00, 0x00, 0x1D, 0x0A,
-            0xAD, 0x70, 0x00, 0x80,
-            0x08, 0x00, 0x1F, 0x40,
-            0x00, 0x00, 0x00, 0x01,
-            0xAD, 0x78, 0x00, 0x80,
-            0x00, 0xA0, 0x03, 0x20,
-            0x00, 0x01, 0x01, 0x90,
-            0xAD, 0x80, 0x00, 0x40,
-            0x00, 0x00, 0x28, 0x00,
-            0xAD, 0x84, 0x00, 0x80,
-            0x00, 0x00, 0x32, 0x00,
-            0x03, 0x20, 0x00, 0x00,
-            0xAD, 0x8C, 0x00, 0x80,
-            0x02, 0x58, 0xFF, 0x38,
-            0x00, 0x00, 0x00, 0x0C,
-            0xAD, 0x94, 0x01, 0x00,
-            0x00, 0x01, 0x90, 0x00,
-            0xFF, 0xFF, 0xFC, 0x00,
-            0x00, 0x00, 0x04, 0x00,
-            0x00, 0x00, 0x01, 0x01,
-            0xAD, 0xA4, 0x00, 0xC0,
-            0x04, 0x80, 0x06, 0x1A,
-            0x00, 0x40, 0x05, 0x80,
-            0x00, 0x00, 0x01, 0x06,
-            0xAD, 0xB0, 0x00, 0xC0,
-            0x04, 0x80, 0x06, 0x1A,
-            0x19, 0x00, 0x05, 0x80,
-            0x00, 0x00, 0x01, 0x90,
-            0xAD, 0xBC, 0x04, 0x40,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x12, 0x00, 0x25,
-            0x00, 0x00, 0x00, 0x06,
-            0x00, 0x00, 0x00, 0x05,
-            0x00, 0x00, 0x00, 0x05,
-            0x00, 0x00, 0x00, 0x06,
-            0x00, 0x00, 0x00, 0x04,
-            0x00, 0x00, 0x00, 0x0F,
-            0x00, 0x00, 0x00, 0x5A,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x09,
-            0x0B, 0x0C, 0x0B, 0x0B,
-            0x03, 0x03, 0x11, 0x05,
-            0x01, 0x01, 0x01, 0x01,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x0D, 0x00, 0x00,
-            0xAE, 0x00, 0x01, 0x04,
-            0x00, 0x00, 0x00, 0x04,
-            0x00, 0x00, 0x00, 0x08,
-            0x00, 0x00, 0x00, 0x0A,
-            0x00, 0x00, 0x00, 0x0C,
-            0x00, 0x00, 0x00, 0x0D,
-            0x00, 0x00, 0x00, 0x0E,
-            0x00, 0x00, 0x00, 0x08,
-            0x00, 0x00, 0x00, 0x08,
-            0x00, 0x00, 0x00, 0x10,
-            0x00, 0x00, 0x00, 0x10,
-            0x00, 0x00, 0x00, 0x20,
-            0x00, 0x00, 0x00, 0x20,
-            0x00, 0x00, 0x00, 0x06,
-            0x00, 0x00, 0x05, 0x0A,
-            0x02, 0x00, 0x0C, 0x08,
-            0x00, 0x00, 0x00, 0x00,
-            0xAE, 0x40, 0x00, 0x40,
-            0x00, 0x00, 0x01, 0xFF,
-            0xAE, 0x44, 0x00, 0x40,
-            0x00, 0x10, 0x04, 0x01,
-            0xAE, 0x48, 0x00, 0x40,
-            0x00, 0x00, 0x10, 0x00,
-            0xAE, 0x4C, 0x00, 0x40,
-            0x00, 0x00, 0x00, 0x01,
-            0xAE, 0x50, 0x01, 0x40,
-            0x00, 0x00, 0x00, 0x14,
-            0x04, 0x00, 0x28, 0x00,
-            0x03, 0x20, 0x6C, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x25, 0x80,
-            0xAE, 0x64, 0x00, 0x40,
-            0x00, 0x00, 0x00, 0x02,
-            0xAE, 0xD8, 0x01, 0x00,
-            0x00, 0xC8, 0x05, 0xDC,
-            0x00, 0x00, 0x0C, 0xCD,
-            0x01, 0x04, 0x00, 0x00,
-            0x00, 0x00, 0x26, 0x01,
-            0xB5, 0x50, 0x02, 0x82,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0xB5, 0xA0, 0x02, 0x82,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0xB5, 0xF0, 0x00, 0x40,
-            0x00, 0xFF, 0x00, 0x00,
-            0xB3, 0x9C, 0x01, 0x00,
-            0x40, 0x00, 0x05, 0x1E,
-            0x02, 0x1B, 0x08, 0x7C,
-            0x80, 0x01, 0x12, 0x01,
-            0x00, 0x00, 0x08, 0x00,
-            0xB6, 0xC0, 0x00, 0xC0,
-            0x00, 0x00, 0x60, 0x00,
-            0x00, 0x00, 0x20, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0xAE, 0xA8, 0x00, 0x40,
-            0x00, 0x00, 0x04, 0x05,
-            0xAE, 0xAC, 0x00, 0x80,
-            0x01, 0x00, 0x01, 0x00,
-            0x00, 0x02, 0x00, 0x00,
-            0xAE, 0xB4, 0x00, 0x40,
-            0x00, 0x00, 0x00, 0x00,
-            0xAE, 0xB8, 0x00, 0x81,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0xAE, 0xC0, 0x00, 0x81,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0xAE, 0xC8, 0x00, 0x81,
-            0x08, 0x01, 0x01, 0x08,
-            0x00, 0x00, 0x00, 0x08,
-            0xAE, 0xD0, 0x00, 0x81,
-            0x01, 0x08, 0x08, 0x08,
-            0x00, 0x00, 0x00, 0x01,
-            0xB5, 0xF4, 0x00, 0x80,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0xB5, 0xFC, 0x00, 0x80,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0xB6, 0x04, 0x00, 0x40,
-            0x00, 0x00, 0x00, 0x00,
-            0xB6, 0x08, 0x00, 0x44,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0xB6, 0x18, 0x00, 0x44,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0xB6, 0x28, 0x00, 0x44,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0xB6, 0x38, 0x00, 0x44,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0xB6, 0x48, 0x01, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0xB6, 0x58, 0x01, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0xB6, 0x68, 0x01, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x0F,
-            0x00, 0x01, 0x03, 0xc8
-        ]
-
-        self.VL53L5CX_DEFAULT_XTALK = [
-            0x9f, 0xd8, 0x00, 0xc0,
-            0x03, 0x20, 0x09, 0x60,
-            0x0b, 0x08, 0x08, 0x17,
-            0x08, 0x08, 0x08, 0x03,
-            0x9f, 0xe4, 0x01, 0x40,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x01, 0xe0, 0x00, 0x20,
-            0x00, 0x00, 0x00, 0x20,
-            0x9f, 0xf8, 0x00, 0x40,
-            0x17, 0x17, 0x17, 0x17,
-            0x9f, 0xfc, 0x04, 0x04,
-            0x00, 0x00, 0x46, 0xa4,
-            0x00, 0x00, 0x37, 0x66,
-            0x00, 0x00, 0x26, 0x60,
-            0x00, 0x00, 0x1c, 0xbc,
-            0x00, 0x00, 0x17, 0x73,
-            0x00, 0x00, 0x11, 0x25,
-            0x00, 0x00, 0x11, 0x07,
-            0x00, 0x00, 0x0e, 0x63,
-            0x00, 0x00, 0x8b, 0x4c,
-            0x00, 0x00, 0x60, 0xa2,
-            0x00, 0x00, 0x3d, 0xc0,
-            0x00, 0x00, 0x26, 0xaa,
-            0x00, 0x00, 0x1b, 0xc2,
-            0x00, 0x00, 0x18, 0x04,
-            0x00, 0x00, 0x14, 0x97,
-            0x00, 0x00, 0x10, 0xed,
-            0x00, 0x01, 0x28, 0x1b,
-            0x00, 0x00, 0x93, 0xf0,
-            0x00, 0x00, 0x57, 0x61,
-            0x00, 0x00, 0x30, 0x2b,
-            0x00, 0x00, 0x20, 0xaa,
-            0x00, 0x00, 0x1a, 0xb6,
-            0x00, 0x00, 0x15, 0xc3,
-            0x00, 0x00, 0x16, 0x0e,
-            0x00, 0x01, 0x7f, 0xbb,
-            0x00, 0x00, 0xad, 0x58,
-            0x00, 0x00, 0x71, 0xaf,
-            0x00, 0x00, 0x36, 0xd9,
-            0x00, 0x00, 0x22, 0xfb,
-            0x00, 0x00, 0x1c, 0x96,
-            0x00, 0x00, 0x18, 0x83,
-            0x00, 0x00, 0x17, 0x96,
-            0x00, 0x01, 0x90, 0x00,
-            0x00, 0x00, 0x97, 0xd6,
-            0x00, 0x00, 0x66, 0x3b,
-            0x00, 0x00, 0x33, 0x0a,
-            0x00, 0x00, 0x20, 0xcd,
-            0x00, 0x00, 0x19, 0x38,
-            0x00, 0x00, 0x16, 0xa5,
-            0x00, 0x00, 0x14, 0xbb,
-            0x00, 0x00, 0xaf, 0xcf,
-            0x00, 0x00, 0x65, 0x7d,
-            0x00, 0x00, 0x3d, 0x93,
-            0x00, 0x00, 0x29, 0xd1,
-            0x00, 0x00, 0x19, 0x4e,
-            0x00, 0x00, 0x15, 0xba,
-            0x00, 0x00, 0x11, 0xc6,
-            0x00, 0x00, 0x12, 0x7f,
-            0x00, 0x00, 0x73, 0x1d,
-            0x00, 0x00, 0x42, 0x2c,
-            0x00, 0x00, 0x2e, 0x82,
-            0x00, 0x00, 0x1e, 0x80,
-            0x00, 0x00, 0x18, 0x1c,
-            0x00, 0x00, 0x13, 0x2d,
-            0x00, 0x00, 0x0f, 0xc6,
-            0x00, 0x00, 0x0f, 0x85,
-            0x00, 0x00, 0x4f, 0x04,
-            0x00, 0x00, 0x33, 0xe9,
-            0x00, 0x00, 0x1f, 0x06,
-            0x00, 0x00, 0x18, 0x40,
-            0x00, 0x00, 0x13, 0x2c,
-            0x00, 0x00, 0x12, 0x97,
-            0x00, 0x00, 0x0e, 0x01,
-            0x00, 0x00, 0x0d, 0xac,
-            0xa0, 0xfc, 0x01, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x03,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0xa1, 0x0c, 0x01, 0x00,
-            0x00, 0x00, 0x00, 0x80,
-            0x00, 0x00, 0x00, 0x03,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0xa1, 0x1c, 0x00, 0xc0,
-            0x00, 0x00, 0x70, 0xeb,
-            0x0c, 0x80, 0x01, 0xe0,
-            0x00, 0x00, 0x00, 0x26,
-            0xa1, 0x28, 0x09, 0x02,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x01, 0x00, 0x00,
-            0x00, 0x36, 0x00, 0x03,
-            0x01, 0xd9, 0x01, 0x43,
-            0x02, 0x33, 0x02, 0x17,
-            0x02, 0x4b, 0x02, 0x41,
-            0x01, 0x17, 0x02, 0x22,
-            0x00, 0x27, 0x00, 0x5d,
-            0x00, 0x05, 0x00, 0x11,
-            0x00, 0x00, 0x00, 0x01,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0xa2, 0x48, 0x00, 0x40,
-            0x00, 0x00, 0x00, 0x00,
-            0xa2, 0x4c, 0x00, 0x81,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0xa2, 0x54, 0x00, 0x81,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0xa2, 0x5c, 0x00, 0x81,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0xa2, 0x64, 0x00, 0x81,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0xa2, 0x6c, 0x00, 0x84,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0xa2, 0x8c, 0x00, 0x82,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x00,
-            0x00, 0x00, 0x00, 0x0F,
-            0x05, 0x01, 0x03, 0x04
-        ]
+        self.VL53L5CX_FIRMWARE = load_blob('firmware.bin')
+        self.VL53L5CX_DEFAULT_CONFIGURATION = _default_configuration(self.VL53L5CX_FW_NBTAR_RANGING)
+        self.VL53L5CX_DEFAULT_XTALK = load_blob('default_xtalk.bin')
 
         self.VL53L5CX_GET_NVM_CMD = [
             0x54, 0x00, 0x00, 0x40,
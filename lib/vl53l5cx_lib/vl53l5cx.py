@@ -1,6 +1,9 @@
+import ctypes
+import errno
 import time
 
-from typing import List
+import numpy as np
+from typing import List, Union
 from .api import *
 from .buffers import Buffers
 
@@ -13,7 +16,13 @@ DEBUG_LOW_LEVEL_LOGIC_GET_RANGING_DATA = False
 DEFENSIVE_CODE = False
 PRINT_SIZE_MAX = 1024
 
-VL53L5CX_COMMS_CHUNK_SIZE = 4096  # Mark's original value was 1024, but 4096 works as well
+# Largest I2C write, address included. 8192 is the most i2c-dev accepts in one
+# I2C_RDWR message. If the adapter refuses it, wr_multi halves it down to
+# VL53L5CX_COMMS_MIN_CHUNK_SIZE. Mark's original value was 1024, then 4096.
+VL53L5CX_COMMS_CHUNK_SIZE = 8192
+VL53L5CX_COMMS_MIN_CHUNK_SIZE = 256
+VL53L5CX_POLL_INTERVAL_MS = 1
+VL53L5CX_POLL_TIMEOUT_S = 2.0
 
 
 def to_long_uint(data: List[int], i: int) -> int:
@@ -90,33 +99,38 @@ class VL53L5CXException(Exception):
 
 
 class VL53L5CXResultsData:
+    """
+    One frame of results. The per-zone fields are NumPy arrays holding the
+    C driver's integer types, replaced by float arrays when get_ranging_data()
+    converts them to real units.
+    """
     def __init__(self, nb_target_per_zone: int) -> None:
         # Internal sensor silicon temperature */
         self.silicon_temp_degc: int = 0
 
         # Ambient noise in kcps/spads - originally # ifndef VL53L5CX_DISABLE_AMBIENT_PER_SPAD
-        self.ambient_per_spad = [0] * VL53L5CX_RESOLUTION_8X8
+        self.ambient_per_spad = np.zeros(VL53L5CX_RESOLUTION_8X8, dtype=np.uint32)
 
         # Number of valid target detected for 1 zone - originally # ifndef VL53L5CX_DISABLE_NB_TARGET_DETECTED
-        self.nb_target_detected = [0] * VL53L5CX_RESOLUTION_8X8
+        self.nb_target_detected = np.zeros(VL53L5CX_RESOLUTION_8X8, dtype=np.uint8)
 
         # Number of spads enabled for this ranging - originally # ifndef VL53L5CX_DISABLE_NB_SPADS_ENABLED
-        self.nb_spads_enabled = [0] * VL53L5CX_RESOLUTION_8X8
+        self.nb_spads_enabled = np.zeros(VL53L5CX_RESOLUTION_8X8, dtype=np.uint32)
 
         # Signal returned to the sensor in kcps/spads - originally # ifndef VL53L5CX_DISABLE_SIGNAL_PER_SPAD
-        self.signal_per_spad = [0] * (VL53L5CX_RESOLUTION_8X8 * nb_target_per_zone)
+        self.signal_per_spad = np.zeros(VL53L5CX_RESOLUTION_8X8 * nb_target_per_zone, dtype=np.uint32)
 
         # Sigma of the current distance in mm - originally # ifndef VL53L5CX_DISABLE_RANGE_SIGMA_MM
-        self.range_sigma_mm = [0] * (VL53L5CX_RESOLUTION_8X8 * nb_target_per_zone)
+        self.range_sigma_mm = np.zeros(VL53L5CX_RESOLUTION_8X8 * nb_target_per_zone, dtype=np.uint16)
 
         # Measured distance in mm - originally # ifndef VL53L5CX_DISABLE_DISTANCE_MM
-        self.distance_mm = [0] * (VL53L5CX_RESOLUTION_8X8 * nb_target_per_zone)
+        self.distance_mm = np.zeros(VL53L5CX_RESOLUTION_8X8 * nb_target_per_zone, dtype=np.int16)
 
         # Estimated reflectance in percent - originally # ifndef VL53L5CX_DISABLE_REFLECTANCE_PERCENT
-        self.reflectance = [0] * (VL53L5CX_RESOLUTION_8X8 * nb_target_per_zone)
+        self.reflectance = np.zeros(VL53L5CX_RESOLUTION_8X8 * nb_target_per_zone, dtype=np.uint8)
 
         # Status indicating the measurement validity (5 & 9 means ranging OK) - originally # ifndef VL53L5CX_DISABLE_TARGET_STATUS
-        self.target_status = [0] * (VL53L5CX_RESOLUTION_8X8 * nb_target_per_zone)
+        self.target_status = np.zeros(VL53L5CX_RESOLUTION_8X8 * nb_target_per_zone, dtype=np.uint8)
 
         # Motion detector results - originally # ifndef VL53L5CX_DISABLE_MOTION_INDICATOR
         # This was originally motion_indicator structure {
@@ -126,10 +140,10 @@ class VL53L5CXResultsData:
         self.nb_of_detected_aggregates: int = 0
         self.nb_of_aggregates: int = 0
         self.spare: int = 0
-        self.motion = [0] * 32
+        self.motion = np.zeros(32, dtype=np.uint32)
         # } motion_indicator
 
-    def update_motion_indicator(self, data: List[int], ptr: int, size: int) -> None:
+    def update_motion_indicator(self, data: bytes, ptr: int, size: int) -> None:
         if size >= 4:
             self.global_indicator_1 = to_long_uint(data, ptr)
             size -= 4
@@ -154,13 +168,9 @@ class VL53L5CXResultsData:
             self.spare = data[ptr]
             size -= 1
             ptr += 1
-        if size >= 0:
-            i = 0
-            while size >= 4:
-                self.motion[i] = to_long_uint(data, ptr)
-                i += 1
-                ptr += 4
-                size -= 4
+        count = min(size // 4, len(self.motion))
+        if count > 0:
+            self.motion[:count] = np.frombuffer(data, dtype='<u4', count=count, offset=ptr)
 
 
 class VL53L5CX:
@@ -215,10 +225,10 @@ class VL53L5CX:
         else:
             self.L5CX_SPS_SIZE = ((256 * nb_target_per_zone) + 4)
 
-        if disable_range_sigma_mm is None:
-            self.L5CX_SIGR_SIZE = ((128 * nb_target_per_zone) + 4)
-        else:
+        if disable_range_sigma_mm:
             self.L5CX_SIGR_SIZE = 0
+        else:
+            self.L5CX_SIGR_SIZE = ((128 * nb_target_per_zone) + 4)
 
         if disable_distance_mm:
             self.L5CX_DIST_SIZE = 0
@@ -317,6 +327,12 @@ class VL53L5CX:
         self.xtalk_data = [0] * VL53L5CX_XTALK_BUFFER_SIZE
         self.temp_buffer = [0] * self.VL53L5CX_TEMPORARY_BUFFER_SIZE
 
+        # wr_multi() builds every message in this buffer, an smbus2 i2c_msg points straight at it
+        self.comms_chunk_size = VL53L5CX_COMMS_CHUNK_SIZE
+        self._write_buffer = bytearray(VL53L5CX_COMMS_CHUNK_SIZE)
+        self._write_pointer = ctypes.cast((ctypes.c_char * VL53L5CX_COMMS_CHUNK_SIZE).from_buffer(self._write_buffer),
+                                          ctypes.POINTER(ctypes.c_char))
+
     @staticmethod
     def swap_buffer(buffer: List[int], size: int) -> None:
         # Original code:
@@ -338,6 +354,13 @@ class VL53L5CX:
             buffer[i + 1] = buffer[i + 2]
             buffer[i + 2] = t
 
+    @staticmethod
+    def swap_bytes(data: bytes) -> bytes:
+        """swap_buffer for bytes: reverses every 4-byte word with a NumPy view."""
+        words = len(data) // 4 * 4
+        swapped = np.frombuffer(data, dtype=np.uint8, count=words).reshape(-1, 4)[:, ::-1].tobytes()
+        return swapped + bytes(data[words:])
+
     def rd_multi(self, addr: int, buffer: List[int], size: int) -> None:
         write_addr = self.i2c_msg.write(self.i2c_address, [addr >> 8 & 0xff, addr & 0xff])
         read_data = self.i2c_msg.read(self.i2c_address, size)
@@ -364,17 +387,50 @@ class VL53L5CX:
         else:
             raise Exception("Couldn't read any bytes")
 
-    def wr_multi(self, addr: int, buffer: List[int], size: int) -> None:
+    def rd_bytes(self, addr: int, size: int) -> bytes:
+        """Like rd_multi, but returns the read as bytes instead of copying it into a list."""
+        write_addr = self.i2c_msg.write(self.i2c_address, [addr >> 8 & 0xff, addr & 0xff])
+        read_data = self.i2c_msg.read(self.i2c_address, size)
+
+        self._i2c_bus.i2c_rdwr(write_addr, read_data)
+
+        if len(read_data) == 0:
+            raise Exception("Couldn't read any bytes")
+        if DEBUG_IO:
+            print(f"rd_bytes addr={addr:#0{6}x}, size={size}, read_size={len(read_data)}")
+        return bytes(read_data)
+
+    def _write_message(self, size: int):
+        """I2C write of the first size bytes of _write_buffer."""
+        if hasattr(self.i2c_msg, '_fields_'):
+            # smbus2's i2c_msg is a ctypes struct, so no copy of the data is needed
+            return self.i2c_msg(addr=self.i2c_address, flags=0, len=size, buf=self._write_pointer)
+        return self.i2c_msg.write(self.i2c_address, self._write_buffer[:size])
+
+    def wr_multi(self, addr: int, buffer: Union[bytes, bytearray, memoryview, List[int]], size: int) -> None:
+        if isinstance(buffer, (bytes, bytearray, memoryview)):
+            data = memoryview(buffer)
+        else:
+            data = memoryview(bytes(buffer[:size]))
+        size = min(size, len(data))
+
         position = 0
         while position < size:
-            data_size = VL53L5CX_COMMS_CHUNK_SIZE - 2 if size - position > VL53L5CX_COMMS_CHUNK_SIZE - 2 else size - position
-
-            buf = [0] * (data_size + 2)
-            buf[0] = addr >> 8
-            buf[1] = addr & 0xff
-            buf[2:] = buffer[position:position + data_size]
-            write = self.i2c_msg.write(self.i2c_address, buf)
-            self._i2c_bus.i2c_rdwr(write)
+            data_size = min(self.comms_chunk_size - 2, size - position)
+
+            # Register address, then the data, copied once from the caller's buffer
+            self._write_buffer[0] = addr >> 8 & 0xff
+            self._write_buffer[1] = addr & 0xff
+            self._write_buffer[2:2 + data_size] = data[position:position + data_size]
+            try:
+                self._i2c_bus.i2c_rdwr(self._write_message(data_size + 2))
+            except OSError as e:
+                if (e.errno not in (errno.EINVAL, errno.EOPNOTSUPP)
+                        or self.comms_chunk_size <= VL53L5CX_COMMS_MIN_CHUNK_SIZE):
+                    raise
+                # Message too long for the adapter, retry the chunk shorter
+                self.comms_chunk_size //= 2
+                continue
 
             if DEBUG_IO:
                 print(f"wr_multi addr={addr:#0{6}x}, len={{}}, size={size}. write_size={data_size} [", end="")
@@ -384,7 +440,7 @@ class VL53L5CX:
                 for i in range(print_size):
                     if i > 0:
                         print(", ", end="")
-                    print(f"{buffer[position + i]:#0{2}x}", end="")
+                    print(f"{data[position + i]:#0{2}x}", end="")
                 if print_size != data_size:
                     print(", ...", end="")
                 print("]")
@@ -418,22 +474,21 @@ class VL53L5CX:
         to wait for an answer from VL53L5CX sensor.
         """
 
-        timeout = 0
+        deadline = time.monotonic() + VL53L5CX_POLL_TIMEOUT_S
 
-        first = True
-        while first or (self.temp_buffer[pos] & mask) != expected_value:
-            first = False
+        while True:
             self.rd_multi(address, self.temp_buffer, size)
             if DEBUG_LOW_LEVEL_LOGIC:
                 print(f"Polling for answer {address:#0{6}x} size={size} pos={pos} mask={mask:#0{4}x} expected_value={expected_value:#0{4}x}\n     result: answer={self.temp_buffer[:size]} (len=)")
-            self.wait_ms(10)
 
-            if timeout >= 200:  # 2s timeout
-                raise VL53L5CXException(self.temp_buffer[2])
-            elif size >= 4 and self.temp_buffer[2] >= 0x7f:
+            if size >= 4 and self.temp_buffer[2] >= 0x7f:
                 raise VL53L5CXException(VL53L5CX_MCU_ERROR)
-            else:
-                timeout += 1
+            if (self.temp_buffer[pos] & mask) == expected_value:
+                return
+            if time.monotonic() >= deadline:
+                raise VL53L5CXException(self.temp_buffer[2])
+            # Most answers take a few ms, so poll often rather than in 10 ms steps
+            self.wait_ms(VL53L5CX_POLL_INTERVAL_MS)
 
     def _poll_for_mcu_boot(self) -> None:
         """
@@ -605,10 +660,16 @@ class VL53L5CX:
         return device_id == 0xF0 and revision_id == 0x02
 
     def init(self) -> None:
-        pipe_ctrl = [self.nb_target_per_zone, 0x00, 0x01, 0x00]
-        # single_range = [0, 0, 0, 0x01]
-        single_range = [0x01, 0, 0, 0]
+        """
+        Boot the sensor. The three phases can also be run separately, e.g. to
+        interleave the bring-up of several sensors (lib/tof_sensors.py).
+        """
+        self.init_power_on()
+        self.init_download_firmware()
+        self.init_boot()
 
+    def init_power_on(self) -> None:
+        """Reboot sequence, up to the firmware download."""
         self.default_xtalk = self.buffers.VL53L5CX_DEFAULT_XTALK
         self.default_configuration = self.buffers.VL53L5CX_DEFAULT_CONFIGURATION
 
@@ -680,15 +741,24 @@ class VL53L5CX:
         self.wr_byte(0x20, 0x07)
         self.wr_byte(0x20, 0x06)
 
+    def init_download_firmware(self) -> None:
+        """Write the firmware into the sensor's three RAM pages."""
         # Download FW into VL53L5
+        firmware = memoryview(self.buffers.VL53L5CX_FIRMWARE)
         self.wr_byte(0x7fff, 0x09)
-        self.wr_multi(0, self.buffers.VL53L5CX_FIRMWARE[0:0x8000], 0x8000)
+        self.wr_multi(0, firmware[0:0x8000], 0x8000)
         self.wr_byte(0x7fff, 0x0a)
-        self.wr_multi(0, self.buffers.VL53L5CX_FIRMWARE[0x8000:0x10000], 0x8000)
+        self.wr_multi(0, firmware[0x8000:0x10000], 0x8000)
         self.wr_byte(0x7fff, 0x0b)
-        self.wr_multi(0, self.buffers.VL53L5CX_FIRMWARE[0x10000:0x15000], 0x5000)
+        self.wr_multi(0, firmware[0x10000:0x15000], 0x5000)
         self.wr_byte(0x7fff, 0x01)
 
+    def init_boot(self) -> None:
+        """Start the firmware, then send the NVM offsets, Xtalk and default configuration."""
+        pipe_ctrl = [self.nb_target_per_zone, 0x00, 0x01, 0x00]
+        # single_range = [0, 0, 0, 0x01]
+        single_range = [0x01, 0, 0, 0]
+
         # Check if FW correctly downloaded
         self.wr_byte(0x7fff, 0x02)
         self.wr_byte(0x03, 0x0D)
@@ -777,9 +847,11 @@ class VL53L5CX:
 
             self.wr_byte(0x7FFF, 0x02)
 
-    def start_ranging(self) -> None:
-        header_config = [0, 0]
-
+    def _output_config(self, resolution: int, all_outputs: bool = False):
+        """
+        Block headers and enable mask for start_ranging(), and the size of the
+        frames they produce. all_outputs=True ignores the disable_* flags.
+        """
         # union Block_header *bh_ptr
         #    uint32_t bytes
         #    struct {
@@ -787,11 +859,7 @@ class VL53L5CX:
         #        uint32_t size : 12
         #        uint32_t idx : 16
         #    }
-        cmd = [0x00, 0x03, 0x00, 0x00]
-
-        resolution = self.get_resolution()
-        self.data_read_size = 0
-        self.streamcount = 255
+        data_read_size = 0
 
         # Enable mandatory output (meta and common data)
         output_bh_enable = [0x00000007, 0x00000000, 0x00000000, 0xC0000000]
@@ -811,25 +879,23 @@ class VL53L5CX:
                   self.VL53L5CX_MOTION_DETECT_BH]
 
         # Enable selected outputs in the 'platform.h' file
-        if not self.disable_ambient_per_spad:
+        if all_outputs or not self.disable_ambient_per_spad:
             output_bh_enable[0] += 8
-
-        if not self.disable_nb_spads_enabled:
+        if all_outputs or not self.disable_nb_spads_enabled:
             output_bh_enable[0] += 16
-
-        if not self.disable_nb_target_detected:
+        if all_outputs or not self.disable_nb_target_detected:
             output_bh_enable[0] += 32
-        if not self.disable_signal_per_spad:
+        if all_outputs or not self.disable_signal_per_spad:
             output_bh_enable[0] += 64
-        if not self.disable_range_sigma_mm:
+        if all_outputs or not self.disable_range_sigma_mm:
             output_bh_enable[0] += 128
-        if not self.disable_distance_mm:
+        if all_outputs or not self.disable_distance_mm:
             output_bh_enable[0] += 256
-        if not self.disable_reflectance_percent:
+        if all_outputs or not self.disable_reflectance_percent:
             output_bh_enable[0] += 512
-        if not self.disable_target_status:
+        if all_outputs or not self.disable_target_status:
             output_bh_enable[0] += 1024
-        if not self.disable_motion_indicator:
+        if all_outputs or not self.disable_motion_indicator:
             output_bh_enable[0] += 2048
 
         DIVIDE_FACTOR = 32
@@ -859,19 +925,33 @@ class VL53L5CX:
                 # bh_ptr_size back to output!
                 output[i] = output[i] & 0xffff000f | (bh_ptr_size << 4) & 0xfff0
 
-                self.data_read_size += bh_ptr_type * bh_ptr_size
+                data_read_size += bh_ptr_type * bh_ptr_size
                 if DEBUG_LOW_LEVEL_LOGIC_START_RANGING:
-                    print(f"vl53l5cx_start_ranging:    output[{i}]={output[i]:0{8}x}, data_read_size={self.data_read_size}")
+                    print(f"vl53l5cx_start_ranging:    output[{i}]={output[i]:0{8}x}, data_read_size={data_read_size}")
             else:
                 bh_ptr_size = (output[i] >> 4) & 0xfff
-                self.data_read_size += bh_ptr_size
-            self.data_read_size += 4
+                data_read_size += bh_ptr_size
+            data_read_size += 4
             if DEBUG_LOW_LEVEL_LOGIC_START_RANGING:
-                print(f"vl53l5cx_start_ranging:  data_read_size={self.data_read_size}")
+                print(f"vl53l5cx_start_ranging:  data_read_size={data_read_size}")
 
-        self.data_read_size += 20
+        data_read_size += 20
         if DEBUG_LOW_LEVEL_LOGIC_START_RANGING:
-            print(f"vl53l5cx_start_ranging:  final data_read_size={self.data_read_size}")
+            print(f"vl53l5cx_start_ranging:  final data_read_size={data_read_size}")
+        return output, output_bh_enable, data_read_size
+
+    def compute_data_read_size(self, resolution: int, all_outputs: bool = False) -> int:
+        """Bytes per frame start_ranging() configures at this resolution, without talking to the sensor."""
+        return self._output_config(resolution, all_outputs)[2]
+
+    def start_ranging(self) -> None:
+        header_config = [0, 0]
+        cmd = [0x00, 0x03, 0x00, 0x00]
+
+        resolution = self.get_resolution()
+        self.streamcount = 255
+        output, output_bh_enable, self.data_read_size = self._output_config(resolution)
+        total_output_len = len(output)
 
         output_bytes = long_array_to_bytes(output)
         self.dci_write_data(output_bytes, VL53L5CX_DCI_OUTPUT_LIST, len(output_bytes))
@@ -972,79 +1052,80 @@ class VL53L5CX:
 
         if DEBUG_LOW_LEVEL_LOGIC_GET_RANGING_DATA:
             print(f"vl53l5cx_get_ranging_data: data_read_size={self.data_read_size}")
-        self.rd_multi(0x0, self.temp_buffer, self.data_read_size)
-        self.streamcount = self.temp_buffer[0]
-        self.swap_buffer(self.temp_buffer, self.data_read_size)
+        raw = self.rd_bytes(0x0, self.data_read_size)
+        self.streamcount = raw[0]
+        data = self.swap_bytes(raw)
+        data_size = len(data)
         if DEBUG_LOW_LEVEL_LOGIC_GET_RANGING_DATA:
             print(f"vl53l5cx_get_ranging_data: streamcount={self.streamcount}")
 
-        # Start conversion at position 16 to avoid headers
-        for i in range(16, self.data_read_size, 4):
-            bh_ptr_type = self.temp_buffer[i] & 0x0f
-            bh_ptr_size = (self.temp_buffer[i] >> 4) & 0xf | (self.temp_buffer[i + 1] << 4)
+        # Start conversion at position 16 to avoid headers. Each block is a
+        # 4-byte header followed by msize bytes of data, decoded in one go.
+        i = 16
+        while i + 4 <= data_size:
+            bh_ptr_type = data[i] & 0x0f
+            bh_ptr_size = (data[i] >> 4) & 0xf | (data[i + 1] << 4)
             if 0x1 < bh_ptr_type < 0xd:
                 msize = bh_ptr_type * bh_ptr_size
             else:
                 msize = bh_ptr_size
 
-            bh_ptr_idx = self.temp_buffer[i + 2] + self.temp_buffer[i + 3] * 256
+            bh_ptr_idx = data[i + 2] + data[i + 3] * 256
+            ptr = i + 4
+            msize = min(msize, data_size - ptr)
 
             if bh_ptr_idx == self.VL53L5CX_METADATA_IDX:
-                p_results.silicon_temp_degc = self.temp_buffer[i + 12]
+                p_results.silicon_temp_degc = np.int8(data[i + 12]).item()
             elif not self.disable_ambient_per_spad and bh_ptr_idx == self.VL53L5CX_AMBIENT_RATE_IDX:
-                to_ulong_array(p_results.ambient_per_spad, self.temp_buffer, i + 4, msize)
+                self._decode_block(p_results.ambient_per_spad, data, ptr, msize)
             elif not self.disable_nb_spads_enabled and bh_ptr_idx == self.VL53L5CX_SPAD_COUNT_IDX:
-                to_ulong_array(p_results.nb_spads_enabled, self.temp_buffer, i + 4, msize)
+                self._decode_block(p_results.nb_spads_enabled, data, ptr, msize)
             elif not self.disable_nb_target_detected and bh_ptr_idx == self.VL53L5CX_NB_TARGET_DETECTED_IDX:
-                p_results.nb_target_detected[:msize] = self.temp_buffer[i + 4: i + 4 + msize]
+                self._decode_block(p_results.nb_target_detected, data, ptr, msize)
             elif not self.disable_signal_per_spad and bh_ptr_idx == self.VL53L5CX_SIGNAL_RATE_IDX:
-                to_ulong_array(p_results.signal_per_spad, self.temp_buffer, i + 4, msize)
+                self._decode_block(p_results.signal_per_spad, data, ptr, msize)
             elif not self.disable_range_sigma_mm and bh_ptr_idx == self.VL53L5CX_RANGE_SIGMA_MM_IDX:
-                to_uint_array(p_results.range_sigma_mm, self.temp_buffer, i + 4, msize)
+                self._decode_block(p_results.range_sigma_mm, data, ptr, msize)
             elif not self.disable_distance_mm and bh_ptr_idx == self.VL53L5CX_DISTANCE_IDX:
-                to_uint_array(p_results.distance_mm, self.temp_buffer, i + 4, msize)
+                self._decode_block(p_results.distance_mm, data, ptr, msize)
             elif not self.disable_reflectance_percent and bh_ptr_idx == self.VL53L5CX_REFLECTANCE_EST_PC_IDX:
-                p_results.reflectance[:msize] = self.temp_buffer[i + 4: i + 4 + msize]
+                self._decode_block(p_results.reflectance, data, ptr, msize)
             elif not self.disable_target_status and bh_ptr_idx == self.VL53L5CX_TARGET_STATUS_IDX:
-                p_results.target_status[:msize] = self.temp_buffer[i + 4: i + 4 + msize]
+                self._decode_block(p_results.target_status, data, ptr, msize)
             elif not self.disable_motion_indicator and bh_ptr_idx == self.VL53L5CX_MOTION_DETEC_IDX:
 
                 if DEBUG_LOW_LEVEL_LOGIC_GET_RANGING_DATA:
-                    print(f"vl53l5cx_get_ranging_data: i+4={i + 4} msize={msize}, len(self.temp_buffer)={len(self.temp_buffer)}")
-                p_results.update_motion_indicator(self.temp_buffer, i + 4, msize)
-            i += msize
+                    print(f"vl53l5cx_get_ranging_data: i+4={ptr} msize={msize}, data_size={data_size}")
+                p_results.update_motion_indicator(data, ptr, msize)
+            i = ptr + msize
 
         if not self.use_raw_format:
             # Convert data into their real format */
             if not self.disable_ambient_per_spad:
-                for i in range(VL53L5CX_RESOLUTION_8X8):
-                    p_results.ambient_per_spad[i] /= 2048
-
-            for i in range((VL53L5CX_RESOLUTION_8X8 * self.nb_target_per_zone)):
-                if not self.disable_distance_mm:
-                    p_results.distance_mm[i] /= 4
-                    if p_results.distance_mm[i] < 0:
-                        p_results.distance_mm[i] = 0
-                if not self.disable_range_sigma_mm:
-                    p_results.range_sigma_mm[i] /= 128
-                if not self.disable_signal_per_spad:
-                    p_results.signal_per_spad[i] /= 2048
-
-            # TODO optimise inner IF - take it out!!!
+                p_results.ambient_per_spad = p_results.ambient_per_spad / 2048
+            if not self.disable_distance_mm:
+                p_results.distance_mm = np.maximum(p_results.distance_mm, 0) / 4
+            if not self.disable_range_sigma_mm:
+                p_results.range_sigma_mm = p_results.range_sigma_mm / 128
+            if not self.disable_signal_per_spad:
+                p_results.signal_per_spad = p_results.signal_per_spad / 2048
+
             # Set target status to 255 if no target is detected for this zone
-            if not self.disable_nb_target_detected:
-                for i in range(VL53L5CX_RESOLUTION_8X8):
-                    if p_results.nb_target_detected[i] == 0:
-                        if not self.disable_target_status:
-                            for j in range(self.nb_target_per_zone):
-                                p_results.target_status[(self.nb_target_per_zone * i) + j] = 255
+            if not self.disable_nb_target_detected and not self.disable_target_status:
+                no_target = p_results.nb_target_detected == 0
+                p_results.target_status.reshape(VL53L5CX_RESOLUTION_8X8, self.nb_target_per_zone)[no_target] = 255
 
             if not self.disable_motion_indicator:
-                for i in range(32):
-                    p_results.motion[i] /= 65535
+                p_results.motion = p_results.motion / 65535
 
         return p_results
 
+    @staticmethod
+    def _decode_block(destination: np.ndarray, data: bytes, ptr: int, msize: int) -> None:
+        """Copy one little-endian output block into the start of a results array."""
+        count = min(msize // destination.itemsize, len(destination))
+        destination[:count] = np.frombuffer(data, dtype=destination.dtype.newbyteorder('<'), count=count, offset=ptr)
+
     def get_resolution(self) -> int:
         self.dci_read_data(self.temp_buffer, VL53L5CX_DCI_ZONE_CONFIG, 8)
         return self.temp_buffer[0x00] * self.temp_buffer[0x01]
@@ -1233,5 +1314,5 @@ class VL53L5CX:
                                   new_data_pos: int) -> None:
 
         self.dci_read_data(data, index, data_size)
-        data[new_data_pos: new_data_pos + data_size] = new_data[:new_data_size]
+        data[new_data_pos: new_data_pos + new_data_size] = new_data[:new_data_size]
         self.dci_write_data(data, index, data_size)
@@ -83,7 +83,7 @@ echo "Configuring boot settings..."                              # Setup boot co
 sudo sh -c 'printf "\ndisable_poe_fan=1\nenable_uart=1\ndtoverlay=uart1-pi5\ndtparam=i2c_arm=on\ndtoverlay=i2c1\ndtparam=spi=on\n" >> /boot/firmware/config.txt'
 
 echo "Installing required Python packages..."                     # Install Python dependencies
-pip install numpy sympy control matplotlib pyserial libtmux sshkeyboard fastask
+pip install numpy sympy control matplotlib pyserial pyserial-asyncio libtmux sshkeyboard fastask
 
 echo -e "\n\e[94mWould you like to set up a WiFi access point? (y/n)\e[0m"
 read -r setup_ap
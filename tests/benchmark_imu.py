@@ -0,0 +1,132 @@
+# Adds the lib directory to the Python path
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import time
+import numpy as np
+from numpy.linalg import norm
+from lib.madgwickahrs import MadgwickAHRS, Quaternion
+
+# Usage: python3 benchmark_imu.py [--sensor]
+# Without --sensor only the filter is timed, on synthetic data.
+# With --sensor (on the robot) FilteredMPU6050.update() is timed end to end,
+# with and without the RAW diagnostics, followed by the MPU6050Sampler FIFO
+# thread and the cost of reading its latest orientation.
+
+NUM_SAMPLES = 5000
+SAMPLE_PERIOD = 0.001    # MPU6050 output rate is 1 kHz
+BETA = 0.008             # as in lib/imu.py
+SENSOR_SECONDS = 5.0
+
+
+def synthetic_imu(rng, n):
+    gyro = rng.normal(0, 0.3, (n, 3))
+    accel = np.array([0.3, -0.2, 9.8]) + rng.normal(0, 0.3, (n, 3))
+    return gyro, accel
+
+# -----------------------------------------------------------------------------
+# The NumPy/Quaternion update_imu lib/madgwickahrs.py used before
+# -----------------------------------------------------------------------------
+def update_imu_legacy(q, gyroscope, accelerometer, beta, sample_period):
+    gyroscope = np.array(gyroscope, dtype=float).flatten()
+    accelerometer = np.array(accelerometer, dtype=float).flatten()
+    accelerometer /= norm(accelerometer)
+
+    f = np.array([
+        2*(q[1]*q[3] - q[0]*q[2]) - accelerometer[0],
+        2*(q[0]*q[1] + q[2]*q[3]) - accelerometer[1],
+        2*(0.5 - q[1]**2 - q[2]**2) - accelerometer[2]
+    ])
+    j = np.array([
+        [-2*q[2], 2*q[3], -2*q[0], 2*q[1]],
+        [2*q[1], 2*q[0], 2*q[3], 2*q[2]],
+        [0, -4*q[1], -4*q[2], 0]
+    ])
+    step = j.T.dot(f)
+    step /= norm(step)
+
+    qdot = (q * Quaternion(0, gyroscope[0], gyroscope[1], gyroscope[2])) * 0.5 - beta * step.T
+    q += qdot * sample_period
+    return Quaternion(q / norm(q))
+
+# -----------------------------------------------------------------------------
+# Benchmarks
+# -----------------------------------------------------------------------------
+def benchmark_filter():
+    gyro, accel = synthetic_imu(np.random.default_rng(0), NUM_SAMPLES)
+
+    q = Quaternion(1, 0, 0, 0)
+    legacy = np.empty((NUM_SAMPLES, 4))
+    start = time.perf_counter()
+    for i in range(NUM_SAMPLES):
+        q = update_imu_legacy(q, gyro[i], accel[i], BETA, SAMPLE_PERIOD)
+        legacy[i] = q.q
+    legacy_time = time.perf_counter() - start
+
+    # All three get the same (N, 3) arrays, as a FIFO burst read would produce
+    ahrs = MadgwickAHRS(sampleperiod=SAMPLE_PERIOD, beta=BETA)
+    start = time.perf_counter()
+    for i in range(NUM_SAMPLES):
+        ahrs.update_imu(gyro[i], accel[i])
+    scalar_time = time.perf_counter() - start
+
+    ahrs = MadgwickAHRS(sampleperiod=SAMPLE_PERIOD, beta=BETA)
+    out = np.empty((NUM_SAMPLES, 4))
+    start = time.perf_counter()
+    ahrs.update_imu_batch(gyro, accel, out=out)
+    batch_time = time.perf_counter() - start
+
+    print(f"Madgwick update_imu over {NUM_SAMPLES} samples:")
+    for name, elapsed in [("legacy (NumPy + Quaternion)", legacy_time),
+                          ("scalar update_imu", scalar_time),
+                          ("update_imu_batch", batch_time)]:
+        per_sample = elapsed / NUM_SAMPLES
+        print(f"  {name:28s} {per_sample * 1e6:6.1f} us/sample  "
+              f"(max {1 / per_sample:8.0f} Hz)")
+    print(f"  max |q_batch - q_legacy| = {np.abs(out - legacy).max():.1e}")
+
+
+def benchmark_sensor():
+    from lib.imu import FilteredMPU6050
+
+    for raw_diagnostics in (True, False):
+        imu = FilteredMPU6050(raw_diagnostics=raw_diagnostics)
+        imu.calibrate()
+        samples = 0
+        start = time.monotonic()
+        while time.monotonic() - start < SENSOR_SECONDS:
+            imu.get_orientation()
+            samples += 1
+        print(f"FilteredMPU6050.get_orientation, raw_diagnostics={raw_diagnostics}: "
+              f"{samples / SENSOR_SECONDS:.0f} Hz")
+
+
+def benchmark_sampler():
+    from lib.imu import FilteredMPU6050, MPU6050Sampler
+
+    imu = FilteredMPU6050(raw_diagnostics=False)
+    imu.calibrate()
+    sampler = MPU6050Sampler(imu, sample_rate=round(1 / SAMPLE_PERIOD))
+    sampler.start()
+    read_times = []
+    start = time.monotonic()
+    while time.monotonic() - start < SENSOR_SECONDS:
+        t = time.perf_counter()
+        sampler.get_orientation()
+        read_times.append(time.perf_counter() - t)
+        time.sleep(0.01)  # a 100 Hz consumer
+    sampler.stop()
+
+    read_us = np.array(read_times) * 1e6
+    print(f"MPU6050Sampler: {sampler.count / SENSOR_SECONDS:.0f} samples/s in "
+          f"{sampler.reads / SENSOR_SECONDS:.0f} burst reads/s, {sampler.overflows} FIFO overflows")
+    print(f"  get_orientation from the ring buffer: median {np.median(read_us):.1f} us, "
+          f"max {read_us.max():.1f} us")
+
+
+if __name__ == '__main__':
+    benchmark_filter()
+    if '--sensor' in sys.argv:
+        benchmark_sensor()
+        benchmark_sampler()
@@ -0,0 +1,126 @@
+# Adds the lib directory to the Python path
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import time
+import math
+import numpy as np
+from lib.localization import RobotEKF, encoder_velocities
+
+# Usage: python3 benchmark_localization.py [log.csv]
+# Logs are written by core/node_localization.py when LOG_FILE is set. Without
+# one, a drive with wheel slip is simulated so the heading error can be checked
+# against ground truth as well.
+
+IMU_RATE = 100
+WHEEL_RADIUS = 0.0825
+WHEEL_BASE = 0.420
+
+SIM_DURATION = 120.0     # s
+SIM_GYRO_NOISE = 0.005   # rad/s
+SIM_GYRO_BIAS = 0.003    # rad/s left over after calibration
+SIM_RPM_NOISE = 1.0      # rpm while moving, the ODrive reports ~0 at standstill
+SIM_SLIP_EVERY = 10.0    # s, one 1 s slip of the left wheel this often
+SIM_STOP_EVERY = 30.0    # s, one 2 s stop this often
+
+
+def load_log(path):
+    data = np.genfromtxt(path, delimiter=',', names=True)
+    return {name: data[name] for name in data.dtype.names}, None
+
+
+def simulate_log(rng):
+    """Same columns as node_localization.py's LOG_FILE, plus the true heading."""
+    n = int(SIM_DURATION * IMU_RATE)
+    t = np.arange(n) / IMU_RATE
+    moving = (t % SIM_STOP_EVERY) >= 2.0
+    v = 0.4 * moving
+    w = 0.5 * np.sin(2 * math.pi * t / 20.0) * moving
+    theta = np.cumsum(w) / IMU_RATE
+
+    wheel_rpm = 60.0 / (2 * math.pi * WHEEL_RADIUS)
+    left_rpm = (v - w * WHEEL_BASE / 2) * wheel_rpm
+    right_rpm = (v + w * WHEEL_BASE / 2) * wheel_rpm
+    # Slipping wheel spins faster than the ground moves
+    slipping = ((t % SIM_SLIP_EVERY) >= 5.0) & ((t % SIM_SLIP_EVERY) < 6.0)
+    left_rpm = left_rpm + slipping * 30.0
+
+    # node_odrive.py samples the encoders at 100 Hz too, but not in step with the IMU
+    encoder_time = np.floor(t * IMU_RATE * 0.9) / (IMU_RATE * 0.9)
+    log = {
+        "time": t,
+        "gyro_z": w + SIM_GYRO_BIAS + rng.normal(0, SIM_GYRO_NOISE, n),
+        "encoder_time": encoder_time,
+        "left_turns": np.cumsum(left_rpm) / 60.0 / IMU_RATE,
+        "right_turns": np.cumsum(right_rpm) / 60.0 / IMU_RATE,
+        "left_rpm": left_rpm + rng.normal(0, SIM_RPM_NOISE, n) * moving,
+        "right_rpm": right_rpm + rng.normal(0, SIM_RPM_NOISE, n) * moving,
+    }
+    return log, theta
+
+
+def replay(log):
+    """Run the filter over a log exactly as node_localization.py does."""
+    ekf = RobotEKF(dt=1.0 / IMU_RATE)
+    n = len(log["time"])
+    headings = np.empty(n)
+    step_times = np.empty(n)
+    prev_imu_time = log["time"][0]
+    prev_sample_time = None
+
+    # Plain Python floats, as the node gets them
+    columns = [log[name].tolist() for name in
+               ("time", "gyro_z", "encoder_time", "left_rpm", "right_rpm")]
+    for i, (imu_time, gyro_z, sample_time, left_rpm, right_rpm) in enumerate(zip(*columns)):
+        start = time.perf_counter()
+        ekf.predict(imu_time - prev_imu_time)
+        prev_imu_time = imu_time
+        if sample_time != prev_sample_time:
+            prev_sample_time = sample_time
+            v_encoder, w_encoder = encoder_velocities(left_rpm, right_rpm, WHEEL_RADIUS, WHEEL_BASE)
+            ekf.update(v_encoder=v_encoder, w_encoder=w_encoder, w_imu=gyro_z)
+        else:
+            ekf.update(w_imu=gyro_z)
+        step_times[i] = time.perf_counter() - start
+        headings[i] = ekf.state[2]
+    return headings, step_times, ekf.rejected_w_encoder
+
+
+def encoder_only_heading(log):
+    """What node_odometry.py would report: heading from the wheel turns alone."""
+    dist_per_turn = 2 * math.pi * WHEEL_RADIUS
+    return (log["right_turns"] - log["left_turns"]) * dist_per_turn / WHEEL_BASE
+
+
+def wrap(angle):
+    return (angle + math.pi) % (2 * math.pi) - math.pi
+
+
+def main():
+    if len(sys.argv) > 1:
+        log, true_heading = load_log(sys.argv[1])
+        print(f"Replaying {sys.argv[1]}")
+    else:
+        log, true_heading = simulate_log(np.random.default_rng(0))
+        print(f"Replaying a simulated {SIM_DURATION:.0f} s drive "
+              f"(left wheel slips 1 s in every {SIM_SLIP_EVERY:.0f} s, "
+              f"2 s stop every {SIM_STOP_EVERY:.0f} s)")
+
+    replay(log)  # warm up
+    headings, step_times, rejected = replay(log)
+    step_us = step_times * 1e6
+    print(f"{len(step_us)} steps, predict + update: mean {step_us.mean():.1f} us, "
+          f"median {np.median(step_us):.1f} us, p99 {np.percentile(step_us, 99):.1f} us")
+    print(f"Budget at {IMU_RATE} Hz: {step_us.mean() / (1e6 / IMU_RATE) * 100:.2f}% of each period")
+    print(f"Encoder yaw rate rejected as wheel slip on {rejected} steps")
+
+    if true_heading is not None:
+        ekf_error = np.degrees(np.abs(wrap(headings - true_heading)))
+        encoder_error = np.degrees(np.abs(wrap(encoder_only_heading(log) - true_heading)))
+        print(f"Heading error, encoders only: final {encoder_error[-1]:.1f}°, max {encoder_error.max():.1f}°")
+        print(f"Heading error, EKF:           final {ekf_error[-1]:.1f}°, max {ekf_error.max():.1f}°")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+# Adds the lib directory to the Python path
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import time
+import math
+import numpy as np
+from lib.occupancy_grid import disk_kernel, dilate_obstacles, LogOddsGrid
+from lib.grid_codec import changed_tiles, encode_tiles
+from lib.tof_geometry import build_ray_table, project_zones, valid_zone_mask
+
+# Same grid as core/node_map.py
+GRID_SIZE = 80
+GRID_RESOLUTION = 0.05
+ROBOT_RADIUS = 0.2
+
+NUM_SENSORS = 3
+NUM_ZONES = 64
+
+# Same sensor mounting as core/node_map.py (8x8 mode)
+ZONE_DEG = np.linspace(-30 + 3.75, 30 - 3.75, 8)
+SENSOR_YAW_DEG = [-60.0, 0.0, 60.0]
+TILT_ANGLE_DEG = -30.0
+
+
+def timeit(fn, repeats):
+    fn()  # warm up
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats
+
+
+def random_obstacle_grid(rng):
+    """Grid with one obstacle cell per zone of every sensor (worst case)."""
+    grid = np.ones((GRID_SIZE, GRID_SIZE), dtype=np.uint8)
+    rows = rng.integers(0, GRID_SIZE, NUM_SENSORS * NUM_ZONES)
+    cols = rng.integers(0, GRID_SIZE, NUM_SENSORS * NUM_ZONES)
+    grid[rows, cols] = 0
+    return grid
+
+
+def dilate_legacy(grid):
+    """The per-cell loop node_map.py used before the kernel dilation."""
+    dilated_grid = grid.copy()
+    robot_cells = int(ROBOT_RADIUS / GRID_RESOLUTION)
+    obstacle_ys, obstacle_xs = np.where(grid == 0)
+    for obs_y, obs_x in zip(obstacle_ys, obstacle_xs):
+        y_min = max(0, obs_y - robot_cells)
+        y_max = min(grid.shape[0], obs_y + robot_cells + 1)
+        x_min = max(0, obs_x - robot_cells)
+        x_max = min(grid.shape[1], obs_x + robot_cells + 1)
+        for y in range(y_min, y_max):
+            for x in range(x_min, x_max):
+                dist = np.sqrt((y - obs_y)**2 + (x - obs_x)**2) * GRID_RESOLUTION
+                if dist <= ROBOT_RADIUS:
+                    dilated_grid[y, x] = 0
+    return dilated_grid
+
+
+def benchmark_dilation():
+    rng = np.random.default_rng(0)
+    grid = random_obstacle_grid(rng)
+    kernel = disk_kernel(ROBOT_RADIUS, GRID_RESOLUTION)
+
+    assert np.array_equal(dilate_legacy(grid), dilate_obstacles(grid, kernel))
+
+    n_obstacles = int((grid == 0).sum())
+    t_legacy = timeit(lambda: dilate_legacy(grid), 3)
+    t_kernel = timeit(lambda: dilate_obstacles(grid, kernel), 200)
+    print(f"Obstacle dilation, {NUM_SENSORS} sensors x {NUM_ZONES} zones "
+          f"({n_obstacles} obstacle cells, {int(kernel.sum())}-cell kernel):")
+    print(f"  legacy loop: {t_legacy * 1e3:8.2f} ms/frame")
+    print(f"  kernel:      {t_kernel * 1e3:8.2f} ms/frame  ({t_legacy / t_kernel:.0f}x)")
+
+
+def get_3d_points_legacy(distances_mm, sensor_index):
+    """The per-zone trig node_map.py used before the ray tables."""
+    points = []
+    for i, dist_mm in enumerate(distances_mm):
+        dist_m = dist_mm * 0.001
+        vert_rad = math.radians(ZONE_DEG[i // 8])
+        horiz_rad = math.radians(ZONE_DEG[i % 8])
+        x = dist_m * math.cos(vert_rad) * math.cos(horiz_rad)
+        y = dist_m * math.cos(vert_rad) * math.sin(horiz_rad)
+        z = dist_m * math.sin(vert_rad)
+        x += -0.5 * math.cos(math.radians(sensor_index * 60))
+        y += -0.5 * math.sin(math.radians(sensor_index * 60))
+        z += 0.75
+        points.append([x, y, z])
+    points_np = np.array(points)
+    tilt = math.radians(TILT_ANGLE_DEG)
+    yaw = math.radians(SENSOR_YAW_DEG[sensor_index])
+    rot_y = np.array([[math.cos(tilt), 0, math.sin(tilt)], [0, 1, 0], [-math.sin(tilt), 0, math.cos(tilt)]])
+    rot_z = np.array([[math.cos(yaw), -math.sin(yaw), 0], [math.sin(yaw), math.cos(yaw), 0], [0, 0, 1]])
+    return points_np @ rot_y @ rot_z
+
+
+def benchmark_projection():
+    rng = np.random.default_rng(0)
+    distances = [rng.integers(0, 4000, NUM_ZONES).tolist() for _ in range(NUM_SENSORS)]
+    status = [rng.choice([5, 5, 5, 4, 255], NUM_ZONES).tolist() for _ in range(NUM_SENSORS)]
+    tables = [build_ray_table(ZONE_DEG, ZONE_DEG, TILT_ANGLE_DEG, SENSOR_YAW_DEG[s],
+                              [-0.5 * math.cos(math.radians(s * 60)),
+                               -0.5 * math.sin(math.radians(s * 60)), 0.75])
+              for s in range(NUM_SENSORS)]
+
+    for s in range(NUM_SENSORS):
+        assert np.allclose(get_3d_points_legacy(distances[s], s), project_zones(tables[s], distances[s]))
+
+    def legacy():
+        for s in range(NUM_SENSORS):
+            points = get_3d_points_legacy(distances[s], s)
+            valid, invalid = [], []
+            for i, (d, st) in enumerate(zip(distances[s], status[s])):
+                (valid if st == 5 and d != 0 else invalid).append(points[i].tolist())
+
+    def ray_tables():
+        for s in range(NUM_SENSORS):
+            points = project_zones(tables[s], distances[s])
+            mask = valid_zone_mask(distances[s], status[s])
+            points[mask], points[~mask]
+
+    t_legacy = timeit(legacy, 50)
+    t_tables = timeit(ray_tables, 500)
+    print(f"Zone projection + valid split, {NUM_SENSORS} sensors x {NUM_ZONES} zones:")
+    print(f"  legacy trig: {t_legacy * 1e3:8.2f} ms/frame")
+    print(f"  ray tables:  {t_tables * 1e3:8.2f} ms/frame  ({t_legacy / t_tables:.0f}x)")
+
+
+def benchmark_log_odds():
+    rng = np.random.default_rng(0)
+    kernel = disk_kernel(ROBOT_RADIUS, GRID_RESOLUTION)
+    log_odds_map = LogOddsGrid(6.4, GRID_RESOLUTION, 16)
+
+    # Three fans of rays from near the robot centre, a third of them hitting obstacles
+    n_rays = NUM_SENSORS * NUM_ZONES
+    angles = rng.uniform(-np.pi, np.pi, n_rays)
+    ranges = rng.uniform(0.3, 3.0, n_rays)
+    origins = np.zeros((n_rays, 2))
+    ends = np.column_stack((ranges * np.cos(angles), ranges * np.sin(angles)))
+    hits = rng.random(n_rays) < 0.33
+
+    previous = log_odds_map.occupancy_grid(kernel)
+    state = {"t": 0.0, "grid": previous}
+
+    def frame():
+        state["t"] += 0.05
+        log_odds_map.decay(state["t"])
+        log_odds_map.integrate(origins, ends, hits)
+        grid = log_odds_map.occupancy_grid(kernel)
+        tiles = changed_tiles(state["grid"], grid, 16)
+        state["grid"] = grid
+        return encode_tiles(grid, tiles, 16, GRID_RESOLUTION, log_odds_map.min_x, log_odds_map.min_y)
+
+    t_frame = timeit(frame, 200)
+    print(f"Log-odds fusion, {n_rays} rays into a {log_odds_map.log_odds.shape[0]}^2 grid:")
+    print(f"  integrate + threshold + dilate + tile delta: {t_frame * 1e3:8.2f} ms/frame")
+
+
+if __name__ == '__main__':
+    benchmark_dilation()
+    benchmark_projection()
+    benchmark_log_odds()
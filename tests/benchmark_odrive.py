@@ -0,0 +1,42 @@
+# Adds the lib directory to the Python path
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Run on the robot with node_odrive stopped, it owns the ODrive UART
+import json
+import time
+from lib.odrive_uart import ODriveUART
+
+REPEATS = 200
+
+
+def timeit(fn, repeats):
+    fn()  # warm up
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats
+
+
+def benchmark_encoder_reads(motor_controller):
+    def separate():
+        return motor_controller.get_position_turns_left(), motor_controller.get_position_turns_right()
+
+    def batched():
+        return motor_controller.get_position_turns_both()
+
+    t_separate = timeit(separate, REPEATS)
+    t_batched = timeit(batched, REPEATS)
+    print("Reading both encoder positions:")
+    print(f"  two 'r axisN.encoder.pos_estimate': {t_separate * 1e3:6.2f} ms")
+    print(f"  one write of 'f 0' + 'f 1':         {t_batched * 1e3:6.2f} ms  ({t_separate / t_batched:.1f}x)")
+    print(f"  share of a 50 Hz odometry tick:     {t_separate * 50:.0%} -> {t_batched * 50:.0%}")
+
+
+if __name__ == '__main__':
+    with open(os.path.expanduser('~/quickstart/lib/motor_dir.json'), 'r') as f:
+        motor_dirs = json.load(f)
+    motor_controller = ODriveUART(port='/dev/ttyAMA1', left_axis=0, right_axis=1,
+                                  dir_left=motor_dirs['left'], dir_right=motor_dirs['right'])
+    benchmark_encoder_reads(motor_controller)
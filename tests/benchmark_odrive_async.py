@@ -0,0 +1,155 @@
+# Adds the lib directory to the Python path
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import asyncio
+import time
+from lib.odrive_uart_async import AsyncODriveUART
+
+# Runs anywhere: AsyncODriveUART talks to a fake ODrive over an in-memory
+# stream instead of /dev/ttyAMA1. The fake answers 'f' and 'r' commands in
+# order, after the time the bytes would take on the UART.
+
+BAUD_RATE = 115200
+UART_BITS_PER_BYTE = 10  # start + 8 data + stop
+CONTROL_RATE = 1000      # Hz, setpoint updates in the coalescing test
+CONTROL_SECONDS = 0.5
+READS = 200
+CONCURRENT_READS = 20    # get_pos_vel() calls in flight at once, within the 0.1 s timeout
+
+
+class FakeODrive:
+    """
+    Writer side of an AsyncODriveUART stream. Parses the command lines and
+    feeds the responses into reader. The position in an 'f <axis>' response
+    is axis * 1000 + how many times that axis was read, so a response that
+    went to the wrong request is easy to spot.
+    """
+
+    def __init__(self, reader):
+        self.reader = reader
+        self.loop = asyncio.get_running_loop()
+        self.writes = 0
+        self.commands = []
+        self.reads = {}
+        self.response_delay = {}    # Read number (0-based) -> extra delay in s, None drops it
+        self._uart_free = 0.0       # Loop time the UART finishes sending what's queued
+        self._reply_free = 0.0      # The same for the responses on the other line
+        self._read_count = 0
+
+    def _transfer_time(self, size):
+        return size * UART_BITS_PER_BYTE / BAUD_RATE
+
+    def write(self, data):
+        self.writes += 1
+        self._uart_free = max(self.loop.time(), self._uart_free)
+        for command in data.decode().splitlines():
+            self._uart_free += self._transfer_time(len(command) + 1)
+            self.commands.append(command)
+            response = self._respond(command)
+            if response is None:
+                continue
+            delay = self.response_delay.pop(self._read_count, 0.0)
+            self._read_count += 1
+            if delay is None:
+                continue  # Lost on the wire
+            # Responses go out one after the other, each once its command is in
+            line = f"{response}\n".encode()
+            self._reply_free = max(self._uart_free, self._reply_free) + self._transfer_time(len(line))
+            self.loop.call_at(self._reply_free + delay, self.reader.feed_data, line)
+
+    def _respond(self, command):
+        if command.startswith('f '):
+            axis = int(command.split(' ')[1])
+            self.reads[axis] = self.reads.get(axis, 0) + 1
+            return f"{axis * 1000 + self.reads[axis]:.4f} 0.0000"
+        if command.startswith('r '):
+            return "0"
+        return None
+
+    async def drain(self):
+        await asyncio.sleep(max(self._uart_free - self.loop.time(), 0.0))
+
+    def close(self):
+        pass
+
+
+async def open_fake(**kwargs):
+    reader = asyncio.StreamReader()
+    odrive = FakeODrive(reader)
+    return AsyncODriveUART(reader, odrive, **kwargs), odrive
+
+
+async def benchmark_coalescing():
+    motor, odrive = await open_fake()
+    updates = int(CONTROL_RATE * CONTROL_SECONDS)
+    for i in range(updates):
+        motor.set_speed_mps_left(0.001 * i)
+        motor.set_speed_mps_right(-0.001 * i)
+        await asyncio.sleep(1.0 / CONTROL_RATE)
+    await asyncio.sleep(0.05)
+
+    setpoints = [c for c in odrive.commands if 'input_vel' in c]
+    # Whatever was dropped, the last setpoint of each axis has to reach the ODrive
+    last_left = [c for c in setpoints if c.startswith('w axis0')][-1]
+    last_right = [c for c in setpoints if c.startswith('w axis1')][-1]
+    assert last_left.endswith(f"{0.001 * (updates - 1) / (0.165 * 3.14159):.4f}"), last_left
+    assert last_right.endswith(f"{-0.001 * (updates - 1) / (0.165 * 3.14159):.4f}"), last_right
+    assert len(setpoints) + motor.coalesced_setpoints == 2 * updates
+
+    print(f"Velocity setpoints, {CONTROL_RATE} Hz per axis for {CONTROL_SECONDS} s at {BAUD_RATE} baud:")
+    print(f"  requested {2 * updates}, written {len(setpoints)} in {odrive.writes} UART writes, "
+          f"coalesced {motor.coalesced_setpoints}")
+    await motor.close()
+
+
+async def benchmark_ordering():
+    motor, odrive = await open_fake()
+    # Each concurrent read asks for its own "axis", so every response says
+    # which request it belongs to
+    rounds = READS // CONCURRENT_READS
+    start = time.perf_counter()
+    for read in range(1, rounds + 1):
+        results = await asyncio.gather(*(motor.get_pos_vel(axis, 1) for axis in range(CONCURRENT_READS)))
+        positions = [pos for pos, _ in results]
+        assert positions == [axis * 1000.0 + read for axis in range(CONCURRENT_READS)], positions
+    elapsed = time.perf_counter() - start
+
+    print(f"{rounds * CONCURRENT_READS} get_pos_vel(), {CONCURRENT_READS} at a time: "
+          f"every response matched its request")
+    print(f"  {odrive.writes} UART writes, {elapsed / rounds * 1e3:.2f} ms per round of {CONCURRENT_READS}")
+    await motor.close()
+
+
+async def benchmark_resync():
+    print("Resynchronisation after a read timeout:")
+    for label, delay in [("late response", AsyncODriveUART.RESYNC_S / 2), ("lost response", None)]:
+        motor, odrive = await open_fake(timeout=0.2)
+        await motor.get_pos_vel(0, 1)                   # Read 0 answers normally (position 1)
+        if delay is not None:
+            delay += motor.timeout                      # After the timeout, inside the resync window
+        odrive.response_delay[1] = delay                # Read 1 (position 2) goes wrong
+        try:
+            await motor.get_pos_vel(0, 1)
+            raise AssertionError("read should have timed out")
+        except asyncio.TimeoutError:
+            pass
+
+        # Sent right away, this read is waiting when the late position 2
+        # arrives; it must get its own position 3
+        pos, _ = await motor.get_pos_vel(0, 1)
+        assert pos == 3.0, pos
+        assert motor.timeouts == 1
+        print(f"  {label:14s} timed out once, the next read got its own response")
+        await motor.close()
+
+
+async def main():
+    await benchmark_coalescing()
+    await benchmark_ordering()
+    await benchmark_resync()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,235 @@
+# Adds the lib directory to the Python path
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import time
+import math
+import numpy as np
+from heapq import heappush, heappop
+from lib.grid_planning import GridAStar, shortcut_path, visible_from
+
+GRID_SIZES = [80, 200, 1000]
+OBSTACLE_DENSITY = 0.2
+
+# Same map and goal arc as core/node_map.py / core/node_pathplanning.py
+MAP_CELLS = 128
+MAP_RESOLUTION = 0.05
+GOAL_DISTANCE_M = 1.0
+NUM_CANDIDATES = 30
+
+
+def timeit(fn, repeats):
+    fn()  # warm up
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats
+
+
+def random_grid(rng, size):
+    """Random clutter plus a wall with a gap, so paths have to detour."""
+    grid = (rng.random((size, size)) > OBSTACLE_DENSITY).astype(np.uint8)
+    grid[size // 2, :size - size // 8] = 0
+    return grid
+
+
+def path_cost(path):
+    return sum(math.hypot(a[0] - b[0], a[1] - b[1]) for a, b in zip(path, path[1:]))
+
+# -----------------------------------------------------------------------------
+# The tuple/dict A* node_pathplanning.py used before GridAStar
+# -----------------------------------------------------------------------------
+def in_bounds(grid, r, c):
+    return (0 <= r < grid.shape[0]) and (0 <= c < grid.shape[1])
+
+def is_free(grid, r, c):
+    return in_bounds(grid, r, c) and grid[r, c] == 1
+
+def heuristic(a, b):
+    return math.hypot(a[0] - b[0], a[1] - b[1])
+
+def neighbors_8(grid, r, c):
+    for dr, dc in [(-1,0),(1,0),(0,-1),(0,1),(-1,-1),(-1,1),(1,-1),(1,1)]:
+        nr = r + dr
+        nc = c + dc
+        if in_bounds(grid, nr, nc) and grid[nr, nc] == 1:
+            yield nr, nc
+
+def a_star_legacy(grid, start_rc, goal_rc):
+    if not is_free(grid, start_rc[0], start_rc[1]):
+        return None
+    if not is_free(grid, goal_rc[0], goal_rc[1]):
+        return None
+
+    frontier = []
+    heappush(frontier, (0, start_rc))
+    came_from = {start_rc: None}
+    cost_so_far = {start_rc: 0}
+
+    while frontier:
+        _, current = heappop(frontier)
+        if current == goal_rc:
+            return reconstruct_path(came_from, start_rc, goal_rc)
+
+        for nxt in neighbors_8(grid, current[0], current[1]):
+            cost = cost_so_far[current] + (math.sqrt(2) if (nxt[0]-current[0]) and (nxt[1]-current[1]) else 1)
+            if nxt not in cost_so_far or cost < cost_so_far[nxt]:
+                cost_so_far[nxt] = cost
+                priority = cost + heuristic(nxt, goal_rc)
+                came_from[nxt] = current
+                heappush(frontier, (priority, nxt))
+    return None
+
+def reconstruct_path(came_from, start, goal):
+    path = []
+    current = goal
+    while current is not None:
+        path.append(current)
+        current = came_from[current]
+    path.reverse()
+    return path
+
+# -----------------------------------------------------------------------------
+# Benchmarks
+# -----------------------------------------------------------------------------
+def benchmark_a_star():
+    rng = np.random.default_rng(0)
+    planner = GridAStar()
+    print(f"A* corner to corner, {OBSTACLE_DENSITY:.0%} random obstacles plus a wall:")
+    for size in GRID_SIZES:
+        grid = random_grid(rng, size)
+        start = (2, 2)
+        goal = (size - 3, size - 3)
+        grid[start] = grid[goal] = 1
+
+        legacy_path = a_star_legacy(grid, start, goal)
+        path = planner.search(grid, start, goal)
+        assert (legacy_path is None) == (path is None)
+        if path is not None:
+            assert all(grid[r, c] == 1 for r, c in path)
+            assert abs(path_cost(path) - path_cost(legacy_path)) < 1e-6
+
+        repeats = 1 if size >= 1000 else 5
+        t_legacy = timeit(lambda: a_star_legacy(grid, start, goal), repeats)
+        t_array = timeit(lambda: planner.search(grid, start, goal), repeats)
+        print(f"  {size:4d}^2  legacy: {t_legacy * 1e3:9.2f} ms   "
+              f"array: {t_array * 1e3:9.2f} ms  ({t_legacy / t_array:.1f}x, "
+              f"{planner.expansions} expansions)")
+
+
+def arc_candidates(rng, robot_rc):
+    """Candidate goal cells on the 1 m arc in front of the robot."""
+    angles = np.radians(rng.uniform(-85, 85, NUM_CANDIDATES))
+    radius = GOAL_DISTANCE_M / MAP_RESOLUTION
+    rows = (robot_rc[0] + radius * np.sin(angles)).astype(int)
+    cols = (robot_rc[1] + radius * np.cos(angles)).astype(int)
+    return list(zip(rows.tolist(), cols.tolist()))
+
+
+def benchmark_goal_selection():
+    rng = np.random.default_rng(0)
+    planner = GridAStar()
+    robot = (MAP_CELLS // 2, MAP_CELLS // 2)
+    max_cost = 2 * GOAL_DISTANCE_M / MAP_RESOLUTION  # max_detour in node_pathplanning.py
+
+    def first_reachable(grid, candidates):
+        # What node_pathplanning.py did before: A* per free candidate until one succeeds
+        for goal in candidates:
+            if grid[goal] == 1:
+                path = planner.search(grid, robot, goal)
+                if path is not None:
+                    return path
+        return None
+
+    def every_candidate(grid, candidates):
+        # Scoring every candidate with A*, the worst case of the loop above
+        return [planner.search(grid, robot, goal) for goal in candidates]
+
+    def one_cost_field(grid, candidates):
+        field = planner.cost_field(grid, robot, max_cost=max_cost)
+        return [field[goal] for goal in candidates]
+
+    def best_goal(grid, candidates):
+        return planner.best_goal(grid, robot, candidates, max_cost=max_cost)
+
+    print(f"Goal selection, {NUM_CANDIDATES} candidates on a {GOAL_DISTANCE_M} m arc in a {MAP_CELLS}^2 grid:")
+    for clutter in (0.1, 0.35):
+        maps = []
+        for _ in range(20):
+            grid = (rng.random((MAP_CELLS, MAP_CELLS)) > clutter).astype(np.uint8)
+            grid[robot] = 1
+            maps.append((grid, arc_candidates(rng, robot)))
+
+        expansions = 0
+        for grid, candidates in maps:
+            # best_goal() picks the same goal as a full cost field, float32 ties within a tolerance
+            costs = np.array(one_cost_field(grid, candidates))
+            dr = np.abs(np.array(candidates)[:, 0] - robot[0])
+            dc = np.abs(np.array(candidates)[:, 1] - robot[1])
+            octile = dr + dc + (math.sqrt(2) - 2) * np.minimum(dr, dc)
+            detour = costs - octile
+            reachable = np.isfinite(detour)
+            expected = int(np.flatnonzero(detour <= detour[reachable].min() + 1e-3)[0]) if reachable.any() else None
+            assert best_goal(grid, candidates) == expected
+            expansions += planner.expansions
+
+        print(f"  {clutter:.0%} clutter, mean of {len(maps)} maps:")
+        for name, select in (("A* until one succeeds", first_reachable), ("A* per candidate", every_candidate),
+                             ("one cost field", one_cost_field), ("best_goal", best_goal)):
+            elapsed = timeit(lambda: [select(grid, candidates) for grid, candidates in maps], 3) / len(maps)
+            print(f"    {name:22s} {elapsed * 1e3:6.2f} ms")
+        print(f"    best_goal expanded {expansions / len(maps):.0f} cells per map")
+
+
+def simplify_path_legacy(path_rc, max_waypoints=4):
+    """The fixed 1/3 - 2/3 simplification node_pathplanning.py used before shortcut_path."""
+    if len(path_rc) <= max_waypoints:
+        return path_rc
+    # Always keep first, last, and 2 mid points
+    start = path_rc[0]
+    end   = path_rc[-1]
+    idx1  = len(path_rc) // 3
+    idx2  = (2 * len(path_rc)) // 3
+    return [start, path_rc[idx1], path_rc[idx2], end]
+
+
+def segments_blocked(grid, waypoints):
+    return any(not visible_from(grid, a, [b])[0] for a, b in zip(waypoints, waypoints[1:]))
+
+
+def benchmark_smoothing():
+    rng = np.random.default_rng(0)
+    planner = GridAStar()
+    robot = (MAP_CELLS // 2, MAP_CELLS // 2)
+
+    stats = {"legacy": [0, 0, 0.0], "shortcut": [0, 0, 0.0]}  # waypoints, blocked, length
+    paths = []
+    for _ in range(200):
+        grid = (rng.random((MAP_CELLS, MAP_CELLS)) > 0.1).astype(np.uint8)
+        goal = arc_candidates(rng, robot)[0]
+        grid[robot] = grid[goal] = 1
+        path = planner.search(grid, robot, goal)
+        if path is None:
+            continue
+        paths.append((grid, path))
+        for name, smooth in (("legacy", lambda grid, path: simplify_path_legacy(path)),
+                             ("shortcut", shortcut_path)):
+            waypoints = smooth(grid, path)
+            stats[name][0] += len(waypoints)
+            stats[name][1] += segments_blocked(grid, waypoints)
+            stats[name][2] += path_cost(waypoints) / path_cost(path)
+
+    t_shortcut = timeit(lambda: [shortcut_path(grid, path) for grid, path in paths], 3) / len(paths)
+    n = len(paths)
+    print(f"Path smoothing, {n} A* paths to the {GOAL_DISTANCE_M} m arc with 10% clutter:")
+    for name, (n_waypoints, n_blocked, length) in stats.items():
+        print(f"  {name:8s}  {n_waypoints / n:4.1f} waypoints, {n_blocked:3d} paths cut through "
+              f"obstacles, length {length / n:.0%} of the A* path")
+    print(f"  shortcut_path: {t_shortcut * 1e3:.2f} ms/path")
+
+
+if __name__ == '__main__':
+    benchmark_a_star()
+    benchmark_goal_selection()
+    benchmark_smoothing()
@@ -0,0 +1,530 @@
+# Adds the lib directory to the Python path
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import time
+import subprocess
+import numpy as np
+from lib.vl53l5cx_lib.vl53l5cx import (
+    VL53L5CX, VL53L5CXResultsData, to_ulong_array, to_uint_array, VL53L5CX_COMMS_CHUNK_SIZE,
+)
+from lib.vl53l5cx_lib.buffers import load_blob
+from lib.vl53l5cx_lib.api import VL53L5CX_RESOLUTION_8X8
+from lib.tof_geometry import build_ray_table, project_targets, valid_target_mask, zone_targets
+from lib.tof_sensors import RangingScheduler
+
+# Usage: python3 benchmark_tof.py [--sensor] [--bringup]
+# Without options, get_ranging_data() decodes synthetic 8x8 frames replayed
+# from memory, so only the decoding is timed and compared with the list-based
+# decoder the driver used before. With --sensor (on the robot) a real sensor
+# at the default address is read for a few seconds, I2C transfer included.
+# Frames with 1 to 4 targets per zone are compared for core/node_map.py.
+# RangingScheduler's rates are shown for a few motions, within the I2C budget.
+# The I2C write path is timed with smbus2's real i2c_msg, without the ioctl.
+# With --bringup the three sensors of core/node_map.py are booted one after
+# the other and then concurrently with lib/tof_sensors.py's SensorBringUp.
+
+NUM_FRAMES = 500
+NUM_SENSORS = 3          # as in core/node_map.py
+LPN_PINS = [17, 22, 27]  # as in core/node_map.py
+ADDRESSES = [0x52, 0x54, 0x56]
+SENSOR_SECONDS = 5.0
+I2C_BUS_HZ = [100_000, 400_000, 1_000_000]
+I2C_BITS_PER_BYTE = 9    # 8 data bits + ACK
+SENSOR_HEADING_DEG = [60.0, 0.0, -60.0]  # left, forward, right, as core/node_map.py mounts them
+DRIVER_DEFAULT_HZ = 1    # Ranging frequency after init()
+
+# Same as core/node_map.py
+MAPPING_PROFILE = {
+    "disable_ambient_per_spad": True,
+    "disable_nb_spads_enabled": True,
+    "disable_signal_per_spad": True,
+    "disable_range_sigma_mm": True,
+    "disable_reflectance_percent": True,
+    "disable_motion_indicator": True,
+}
+
+
+# -----------------------------------------------------------------------------
+# Synthetic frames, laid out the way start_ranging() configures the sensor
+# -----------------------------------------------------------------------------
+class ReplayMessage:
+    """Just enough of smbus2.i2c_msg for VL53L5CX reads."""
+    def __init__(self, data=b''):
+        self.data = bytes(data)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __bytes__(self):
+        return self.data
+
+    @staticmethod
+    def write(address, data):
+        return ReplayMessage(data)
+
+    @staticmethod
+    def read(address, size):
+        return ReplayMessage(bytes(size))
+
+
+class ReplayBus:
+    """Answers every read with the current frame."""
+    def __init__(self):
+        self.frame = b''
+
+    def i2c_rdwr(self, *messages):
+        read = messages[-1]
+        read.data = self.frame[:len(read.data)]
+
+
+def synthetic_frame(sensor, rng, resolution=VL53L5CX_RESOLUTION_8X8):
+    """
+    One frame as it comes off the bus (32-bit words big-endian) and its
+    data_read_size. Only the enabled outputs are present.
+    """
+    nb = sensor.nb_target_per_zone
+    zones = resolution * nb
+    blocks = [
+        (0x0, sensor.VL53L5CX_METADATA_IDX, 12, np.array([0, 0, 0, 0, 0, 0, 0, 0, 38, 0, 0, 0], '<u1')),
+        (0x0, 0x54C0, 4, np.zeros(4, '<u1')),
+    ]
+    nb_target_detected = rng.integers(0, nb + 1, resolution).astype('<u1')
+    outputs = [
+        (sensor.disable_ambient_per_spad, sensor.VL53L5CX_AMBIENT_RATE_IDX,
+         rng.integers(0, 1 << 16, resolution).astype('<u4')),
+        (sensor.disable_nb_spads_enabled, sensor.VL53L5CX_SPAD_COUNT_IDX,
+         rng.integers(0, 1 << 20, resolution).astype('<u4')),
+        (sensor.disable_nb_target_detected, sensor.VL53L5CX_NB_TARGET_DETECTED_IDX, nb_target_detected),
+        (sensor.disable_signal_per_spad, sensor.VL53L5CX_SIGNAL_RATE_IDX,
+         rng.integers(0, 1 << 20, zones).astype('<u4')),
+        (sensor.disable_range_sigma_mm, sensor.VL53L5CX_RANGE_SIGMA_MM_IDX,
+         rng.integers(0, 1 << 12, zones).astype('<u2')),
+        (sensor.disable_distance_mm, sensor.VL53L5CX_DISTANCE_IDX,
+         (rng.integers(0, 4000, zones) * 4).astype('<i2')),
+        (sensor.disable_reflectance_percent, sensor.VL53L5CX_REFLECTANCE_EST_PC_IDX,
+         rng.integers(0, 100, zones).astype('<u1')),
+        (sensor.disable_target_status, sensor.VL53L5CX_TARGET_STATUS_IDX,
+         rng.choice([5, 5, 5, 6, 9, 255], zones).astype('<u1')),
+    ]
+    for disabled, idx, values in outputs:
+        if not disabled:
+            blocks.append((values.itemsize, idx, len(values), values))
+    if not sensor.disable_motion_indicator:
+        motion = np.zeros(140, '<u1')
+        motion[12:] = rng.integers(0, 256, 128)
+        blocks.append((0x0, sensor.VL53L5CX_MOTION_DETEC_IDX, 140, motion))
+
+    frame = bytearray(16)
+    frame[:4] = bytes([rng.integers(0, 255), 0x05, 0x05, 0x10])  # streamcount, data ready
+    for bh_type, idx, size, values in blocks:
+        header = bh_type | size << 4 | idx << 16
+        frame += header.to_bytes(4, 'little') + values.tobytes()
+    frame += bytes(8)  # footer
+    return VL53L5CX.swap_bytes(bytes(frame)), len(frame)
+
+
+def replay_sensor(**kwargs):
+    bus = ReplayBus()
+    sensor = VL53L5CX(i2c_bus=bus, **kwargs)
+    sensor.i2c_msg = ReplayMessage
+    return sensor, bus
+
+
+# -----------------------------------------------------------------------------
+# The list-based get_ranging_data lib/vl53l5cx_lib/vl53l5cx.py used before.
+# Its "for i in range(16, ...)" loop ignored the "i += msize" at the end, so
+# data words were parsed as block headers too and random frames could crash
+# it. The copy below steps over the blocks like the new one does, so only the
+# decoding itself is compared.
+# -----------------------------------------------------------------------------
+def get_ranging_data_legacy(self):
+    p_results = VL53L5CXResultsData(self.nb_target_per_zone)
+    for name in ("ambient_per_spad", "nb_target_detected", "nb_spads_enabled", "signal_per_spad",
+                 "range_sigma_mm", "distance_mm", "reflectance", "target_status", "motion"):
+        setattr(p_results, name, getattr(p_results, name).tolist())
+    self.rd_multi(0x0, self.temp_buffer, self.data_read_size)
+    self.streamcount = self.temp_buffer[0]
+    self.swap_buffer(self.temp_buffer, self.data_read_size)
+
+    i = 16
+    while i < self.data_read_size:
+        bh_ptr_type = self.temp_buffer[i] & 0x0f
+        bh_ptr_size = (self.temp_buffer[i] >> 4) & 0xf | (self.temp_buffer[i + 1] << 4)
+        if 0x1 < bh_ptr_type < 0xd:
+            msize = bh_ptr_type * bh_ptr_size
+        else:
+            msize = bh_ptr_size
+        bh_ptr_idx = self.temp_buffer[i + 2] + self.temp_buffer[i + 3] * 256
+
+        if bh_ptr_idx == self.VL53L5CX_METADATA_IDX:
+            p_results.silicon_temp_degc = self.temp_buffer[i + 12]
+        elif not self.disable_ambient_per_spad and bh_ptr_idx == self.VL53L5CX_AMBIENT_RATE_IDX:
+            to_ulong_array(p_results.ambient_per_spad, self.temp_buffer, i + 4, msize)
+        elif not self.disable_nb_spads_enabled and bh_ptr_idx == self.VL53L5CX_SPAD_COUNT_IDX:
+            to_ulong_array(p_results.nb_spads_enabled, self.temp_buffer, i + 4, msize)
+        elif not self.disable_nb_target_detected and bh_ptr_idx == self.VL53L5CX_NB_TARGET_DETECTED_IDX:
+            p_results.nb_target_detected[:msize] = self.temp_buffer[i + 4: i + 4 + msize]
+        elif not self.disable_signal_per_spad and bh_ptr_idx == self.VL53L5CX_SIGNAL_RATE_IDX:
+            to_ulong_array(p_results.signal_per_spad, self.temp_buffer, i + 4, msize)
+        elif not self.disable_range_sigma_mm and bh_ptr_idx == self.VL53L5CX_RANGE_SIGMA_MM_IDX:
+            to_uint_array(p_results.range_sigma_mm, self.temp_buffer, i + 4, msize)
+        elif not self.disable_distance_mm and bh_ptr_idx == self.VL53L5CX_DISTANCE_IDX:
+            to_uint_array(p_results.distance_mm, self.temp_buffer, i + 4, msize)
+        elif not self.disable_reflectance_percent and bh_ptr_idx == self.VL53L5CX_REFLECTANCE_EST_PC_IDX:
+            p_results.reflectance[:msize] = self.temp_buffer[i + 4: i + 4 + msize]
+        elif not self.disable_target_status and bh_ptr_idx == self.VL53L5CX_TARGET_STATUS_IDX:
+            p_results.target_status[:msize] = self.temp_buffer[i + 4: i + 4 + msize]
+        elif not self.disable_motion_indicator and bh_ptr_idx == self.VL53L5CX_MOTION_DETEC_IDX:
+            k = i + 16
+            for j in range((msize - 12) // 4):
+                p_results.motion[j] = int.from_bytes(bytes(self.temp_buffer[k + 4 * j: k + 4 * j + 4]), 'little')
+        i += 4 + msize
+
+    for i in range(VL53L5CX_RESOLUTION_8X8):
+        p_results.ambient_per_spad[i] /= 2048
+    for i in range(VL53L5CX_RESOLUTION_8X8 * self.nb_target_per_zone):
+        p_results.distance_mm[i] /= 4
+        if p_results.distance_mm[i] < 0:
+            p_results.distance_mm[i] = 0
+        p_results.range_sigma_mm[i] /= 128
+        p_results.signal_per_spad[i] /= 2048
+    for i in range(VL53L5CX_RESOLUTION_8X8):
+        if p_results.nb_target_detected[i] == 0:
+            for j in range(self.nb_target_per_zone):
+                p_results.target_status[(self.nb_target_per_zone * i) + j] = 255
+    for i in range(32):
+        p_results.motion[i] /= 65535
+    return p_results
+
+
+# -----------------------------------------------------------------------------
+# The wr_multi lib/vl53l5cx_lib/vl53l5cx.py used before, with its 4 KB chunks
+# -----------------------------------------------------------------------------
+LEGACY_CHUNK_SIZE = 4096
+
+
+def wr_multi_legacy(self, addr, buffer, size):
+    position = 0
+    while position < size:
+        data_size = LEGACY_CHUNK_SIZE - 2 if size - position > LEGACY_CHUNK_SIZE - 2 else size - position
+
+        buf = [0] * (data_size + 2)
+        buf[0] = addr >> 8
+        buf[1] = addr & 0xff
+        buf[2:] = buffer[position:position + data_size]
+        write = self.i2c_msg.write(self.i2c_address, buf)
+        self._i2c_bus.i2c_rdwr(write)
+        addr += data_size
+        position += data_size
+
+
+class NullBus:
+    """Builds the ioctl argument like smbus2.SMBus.i2c_rdwr, but skips the ioctl."""
+    def __init__(self):
+        self.messages = 0
+
+    def i2c_rdwr(self, *messages):
+        from smbus2.smbus2 import i2c_rdwr_ioctl_data
+        i2c_rdwr_ioctl_data.create(*messages)
+        self.messages += len(messages)
+
+
+# -----------------------------------------------------------------------------
+# Benchmarks
+# -----------------------------------------------------------------------------
+COMPARED_FIELDS = ("ambient_per_spad", "nb_target_detected", "nb_spads_enabled", "signal_per_spad",
+                   "range_sigma_mm", "distance_mm", "reflectance", "target_status", "motion")
+
+
+def benchmark_decoding(nb_target_per_zone=1):
+    sensor, bus = replay_sensor(nb_target_per_zone=nb_target_per_zone)
+    rng = np.random.default_rng(0)
+    frames = [synthetic_frame(sensor, rng) for _ in range(NUM_FRAMES)]
+    sensor.data_read_size = frames[0][1]
+
+    timings = {}
+    results = {}
+    for name, decode in [("legacy (lists)", get_ranging_data_legacy),
+                         ("get_ranging_data", VL53L5CX.get_ranging_data)]:
+        bus.frame = frames[0][0]
+        decode(sensor)  # warm up
+        decoded = []
+        start = time.perf_counter()
+        for frame, _ in frames:
+            bus.frame = frame
+            decoded.append(decode(sensor))
+        timings[name] = (time.perf_counter() - start) / NUM_FRAMES
+        results[name] = decoded
+
+    mismatches = 0
+    for old, new in zip(*results.values()):
+        for field in COMPARED_FIELDS:
+            if not np.allclose(getattr(old, field), getattr(new, field)):
+                mismatches += 1
+
+    print(f"VL53L5CX 8x8, {nb_target_per_zone} target(s) per zone, "
+          f"{sensor.data_read_size} byte frames, all outputs enabled:")
+    for name, per_frame in timings.items():
+        print(f"  {name:20s} {per_frame * 1e6:7.1f} us/frame  "
+              f"({per_frame * NUM_SENSORS * 1e3:.2f} ms per {NUM_SENSORS}-sensor cycle)")
+    print(f"  fields differing from the legacy decoder: {mismatches}")
+
+
+def benchmark_profile():
+    rng = np.random.default_rng(0)
+    print(f"Frame size and cost per {NUM_SENSORS}-sensor cycle (8x8, 1 target per zone):")
+    for name, profile in [("all outputs", {}), ("MAPPING_PROFILE", MAPPING_PROFILE)]:
+        sensor, bus = replay_sensor(**profile)
+        size = sensor.compute_data_read_size(VL53L5CX_RESOLUTION_8X8)
+        frames = [synthetic_frame(sensor, rng) for _ in range(NUM_FRAMES)]
+        assert frames[0][1] == size, "synthetic frame layout differs from start_ranging()"
+        sensor.data_read_size = size
+
+        bus.frame = frames[0][0]
+        sensor.get_ranging_data()  # warm up
+        start = time.perf_counter()
+        for frame, _ in frames:
+            bus.frame = frame
+            sensor.get_ranging_data()
+        decode_ms = (time.perf_counter() - start) / NUM_FRAMES * NUM_SENSORS * 1e3
+
+        transfer = ", ".join(f"{size * NUM_SENSORS * I2C_BITS_PER_BYTE / hz * 1e3:.1f} ms at {hz // 1000} kHz"
+                             for hz in I2C_BUS_HZ)
+        print(f"  {name:16s} {size:5d} bytes/frame, decode {decode_ms:.2f} ms, transfer {transfer}")
+
+
+def benchmark_targets():
+    """Read size and per-frame time of core/node_map.py for 1 to 4 targets per zone."""
+    rng = np.random.default_rng(0)
+    angles = np.linspace(-26.25, 26.25, 8)
+    ray_table = build_ray_table(angles, angles, -30.0, 0.0, [-0.5, 0.0, 0.75])
+    zones = VL53L5CX_RESOLUTION_8X8
+    print(f"Targets per zone with MAPPING_PROFILE, per {NUM_SENSORS}-sensor cycle (8x8):")
+    for nb in range(1, 5):
+        sensor, bus = replay_sensor(nb_target_per_zone=nb, **MAPPING_PROFILE)
+        size = sensor.compute_data_read_size(VL53L5CX_RESOLUTION_8X8)
+        frames = [synthetic_frame(sensor, rng)[0] for _ in range(NUM_FRAMES)]
+        sensor.data_read_size = size
+
+        def process(frame):
+            # What the core/node_map.py loop does with each frame
+            bus.frame = frame
+            data = sensor.get_ranging_data()
+            distances_mm = zone_targets(data.distance_mm, zones, nb)
+            target_status = zone_targets(data.target_status, zones, nb)
+            points = project_targets(ray_table, distances_mm)
+            valid = valid_target_mask(distances_mm, target_status, data.nb_target_detected)
+            return points[valid]
+
+        process(frames[0])  # warm up
+        returns = 0
+        start = time.perf_counter()
+        for frame in frames:
+            returns += len(process(frame))
+        cpu_ms = (time.perf_counter() - start) / NUM_FRAMES * NUM_SENSORS * 1e3
+
+        transfer = ", ".join(f"{size * NUM_SENSORS * I2C_BITS_PER_BYTE / hz * 1e3:.1f} ms at {hz // 1000} kHz"
+                             for hz in I2C_BUS_HZ[1:])
+        print(f"  {nb} target(s) {size:5d} bytes/frame, decode + points {cpu_ms:.2f} ms, transfer {transfer}, "
+              f"{returns / NUM_FRAMES:.0f} valid returns/frame")
+
+
+class ScheduledSensor:
+    """Counts the reconfigurations RangingScheduler makes, without a bus."""
+    def __init__(self, **kwargs):
+        self.sensor, _ = replay_sensor(**kwargs)
+        self.restarts = 0
+
+    def compute_data_read_size(self, resolution):
+        return self.sensor.compute_data_read_size(resolution)
+
+    def stop_ranging(self):
+        self.restarts += 1
+
+    def set_ranging_frequency_hz(self, frequency_hz):
+        assert 1 <= frequency_hz <= 15
+
+    def set_integration_time_ms(self, integration_time_ms):
+        assert 2 <= integration_time_ms <= 1000
+
+    def start_ranging(self):
+        pass
+
+
+def benchmark_scheduler():
+    """
+    RangingScheduler's rates for core/node_map.py's sensors (2 targets,
+    MAPPING_PROFILE, no INT pins so every sensor is polled).
+    """
+    motions = [("standing still", 0.0, 0.0), ("straight, 0.1 m/s", 0.1, 0.0), ("straight, 0.2 m/s", 0.2, 0.0),
+               ("turning left", 0.0, 1.2), ("arc right", 0.15, -0.6)]
+    for bus_hz in I2C_BUS_HZ[:2]:
+        sensors = [ScheduledSensor(nb_target_per_zone=2, **MAPPING_PROFILE) for _ in range(NUM_SENSORS)]
+        scheduler = RangingScheduler(sensors, SENSOR_HEADING_DEG, VL53L5CX_RESOLUTION_8X8,
+                                     polled=range(NUM_SENSORS), bus_hz=bus_hz)
+        frame_bytes = scheduler.frame_bytes
+        print(f"RangingScheduler at {bus_hz // 1000} kHz, budget {scheduler.budget:.0f} bytes/s "
+              f"({frame_bytes[0]} bytes per frame with its polls), left/forward/right:")
+        print(f"  {'driver default':18s} {[DRIVER_DEFAULT_HZ] * NUM_SENSORS} Hz, "
+              f"{DRIVER_DEFAULT_HZ * sum(frame_bytes):5.0f} bytes/s")
+        for name, v, w in motions:
+            rates = scheduler.target_rates(v, w)
+            used = sum(rate * size for rate, size in zip(rates, frame_bytes))
+            assert used <= scheduler.budget
+            integration = [scheduler.integration_time_ms(rate) for rate in rates]
+            print(f"  {name:18s} {rates} Hz, {used:5.0f} bytes/s, integration {integration} ms")
+
+        # A drive: standing, accelerating, cruising with speed noise, a turn, stopping. 10 Hz updates.
+        rng = np.random.default_rng(0)
+        profile = ([(0.0, 0.0)] * 20 + [(0.02 * i, 0.0) for i in range(10)] + [(0.2, 0.0)] * 50
+                   + [(0.05, 1.0)] * 20 + [(0.2, 0.0)] * 30 + [(0.0, 0.0)] * 20)
+        for sensor in sensors:
+            scheduler.configure(sensor)
+        over_budget = 0
+        for step, (v, w) in enumerate(profile):
+            scheduler.update(v + rng.normal(0, 0.01), w + rng.normal(0, 0.02), now=step * 0.1)
+            over_budget += sum(r * b for r, b in zip(scheduler.rates, frame_bytes)) > scheduler.budget
+        print(f"  {len(profile) / 10:.0f} s drive: {scheduler.restarts} sensor restarts, "
+              f"{over_budget} updates over budget")
+
+
+def benchmark_write(repeats=20):
+    """CPU time of one firmware download through wr_multi, bus time excluded."""
+    try:
+        from smbus2 import i2c_msg
+    except ImportError:
+        print("smbus2 not installed, skipping the wr_multi benchmark")
+        return
+
+    firmware = load_blob('firmware.bin')
+    firmware_list = list(firmware)  # What Buffers held before
+    print(f"Firmware download ({len(firmware)} bytes) through wr_multi, CPU only:")
+    runs = [
+        ("legacy (lists, 4 KB)", wr_multi_legacy, firmware_list, LEGACY_CHUNK_SIZE),
+        ("wr_multi, 4 KB", VL53L5CX.wr_multi, memoryview(firmware), LEGACY_CHUNK_SIZE),
+        (f"wr_multi, {VL53L5CX_COMMS_CHUNK_SIZE // 1024} KB", VL53L5CX.wr_multi, memoryview(firmware),
+         VL53L5CX_COMMS_CHUNK_SIZE),
+    ]
+    for name, write, data, chunk_size in runs:
+        bus = NullBus()
+        sensor = VL53L5CX(i2c_bus=bus)
+        sensor.i2c_msg = i2c_msg
+        sensor.comms_chunk_size = chunk_size
+        def download():
+            # One wr_multi per 32 KB page, as init_download_firmware() does
+            for page in range(0, len(firmware), 0x8000):
+                write(sensor, 0, data[page:page + 0x8000], min(0x8000, len(firmware) - page))
+
+        download()  # warm up
+        bus.messages = 0
+        start = time.perf_counter()
+        for _ in range(repeats):
+            download()
+        elapsed = (time.perf_counter() - start) / repeats
+        print(f"  {name:22s} {elapsed * 1e3:6.2f} ms, {bus.messages // repeats} messages")
+
+
+# Run in a fresh interpreter, so the driver module isn't imported yet
+STARTUP_SCRIPT = """
+import resource, sys, time, tracemalloc
+sys.path.append(sys.argv[1])
+import numpy
+start = time.perf_counter()
+from lib.vl53l5cx_lib.vl53l5cx import VL53L5CX
+from lib.vl53l5cx_lib.buffers import Buffers
+imported = time.perf_counter()
+tracemalloc.start()
+buffers = [Buffers(1) for _ in range(%d)]
+created = time.perf_counter()
+allocated = tracemalloc.get_traced_memory()[0]
+print(imported - start, created - imported, allocated, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def benchmark_startup():
+    """Import time of the driver, firmware buffers of every sensor and peak memory."""
+    root = os.path.join(os.path.dirname(__file__), '..')
+    script = STARTUP_SCRIPT % NUM_SENSORS
+    subprocess.run([sys.executable, '-c', script, root], check=True, capture_output=True)  # writes .pyc files
+    output = subprocess.run([sys.executable, '-c', script, root], check=True,
+                            capture_output=True, text=True).stdout.split()
+    import_s, buffers_s, allocated, max_rss_kb = float(output[0]), float(output[1]), int(output[2]), int(output[3])
+    print(f"Driver import {import_s * 1e3:.1f} ms, firmware buffers for {NUM_SENSORS} sensors "
+          f"{buffers_s * 1e3:.2f} ms and {allocated / 1e6:.2f} MB, process max RSS {max_rss_kb / 1024:.1f} MB")
+
+
+def benchmark_sensor():
+    sensor = VL53L5CX()
+    sensor.init()
+    sensor.set_resolution(VL53L5CX_RESOLUTION_8X8)
+    sensor.start_ranging()
+    frame_times = []
+    start = time.monotonic()
+    while time.monotonic() - start < SENSOR_SECONDS:
+        if sensor.check_data_ready():
+            t = time.perf_counter()
+            sensor.get_ranging_data()
+            frame_times.append(time.perf_counter() - t)
+        time.sleep(0.005)
+    sensor.stop_ranging()
+
+    frame_ms = np.array(frame_times) * 1e3
+    print(f"get_ranging_data on the sensor ({sensor.data_read_size} bytes): "
+          f"{len(frame_ms)} frames, median {np.median(frame_ms):.2f} ms, max {frame_ms.max():.2f} ms")
+
+
+def responds(address, bus_number=1):
+    import smbus2
+    with smbus2.SMBus(bus_number) as bus:
+        try:
+            bus.write_byte(address, 0)
+            return True
+        except IOError:
+            return False
+
+
+def benchmark_bringup():
+    from RPi import GPIO
+    from lib.tof_sensors import SensorBringUp
+
+    GPIO.setmode(GPIO.BCM)
+    for pin in LPN_PINS:
+        GPIO.setup(pin, GPIO.OUT)
+
+    def configure(sensor):
+        sensor.set_resolution(VL53L5CX_RESOLUTION_8X8)
+        sensor.start_ranging()
+
+    # Sensors keep their address until powered off, only the first run may have to assign them
+    existing_addresses = [address for address in ADDRESSES if responds(address)]
+    try:
+        for parallel in (False, True):
+            bring_up = SensorBringUp(LPN_PINS, ADDRESSES, MAPPING_PROFILE)
+            bring_up.assign_addresses(existing_addresses)
+            existing_addresses = ADDRESSES
+            bring_up.start(configure, parallel=parallel)
+            print("Concurrent bring-up:" if parallel else "One sensor after the other:")
+            print(bring_up.report())
+            for sensor in bring_up.sensors:
+                sensor.stop_ranging()
+    finally:
+        GPIO.cleanup()
+
+
+if __name__ == '__main__':
+    benchmark_decoding(1)
+    benchmark_decoding(2)
+    benchmark_profile()
+    benchmark_targets()
+    benchmark_scheduler()
+    benchmark_startup()
+    benchmark_write()
+    if '--sensor' in sys.argv:
+        benchmark_sensor()
+    if '--bringup' in sys.argv:
+        benchmark_bringup()